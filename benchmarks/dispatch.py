@@ -0,0 +1,97 @@
+"""Events per second through the old isinstance chain and through the per-type subscriber table.
+
+Usage: python -m benchmarks.dispatch [count | recording.jsonl]
+
+A recording is a file with one tdjson event per line.
+"""
+import json
+import os.path
+import sys
+import time
+
+from lib import tg
+from lib.client import TgClient
+from benchmarks import samples
+
+# TelegramManager._handler before the dispatch table, in the same order
+CHAIN = [tg.UpdateChatReadInbox, tg.Chats, tg.UpdateChatFolders, tg.UpdateSupergroupFullInfo, tg.UpdateSupergroup,
+         tg.UpdateChatPosition, tg.UpdateNewMessage, tg.UpdateChatLastMessage, tg.UpdateDeleteMessages, tg.Messages,
+         tg.UpdateMessageInteractionInfo, tg.MessageThreadInfo, tg.UpdateUser, tg.UpdateUserStatus, tg.UpdateFile]
+
+
+class _Client(TgClient):
+    def __init__(self):
+        # Only the subscriber registry, TDLib itself is not needed to dispatch events
+        self._subscribers_all = []
+        self._routers = dict()
+        self._subscribers = dict()
+
+
+def handled(event):
+    pass
+
+
+def isinstance_chain(event):
+    if isinstance(event, tg.UpdateChatReadInbox):
+        handled(event)
+    elif isinstance(event, tg.Chats):
+        handled(event)
+    elif isinstance(event, tg.UpdateChatFolders):
+        handled(event)
+    elif isinstance(event, tg.UpdateSupergroupFullInfo):
+        handled(event)
+    elif isinstance(event, tg.UpdateSupergroup):
+        handled(event)
+    elif isinstance(event, tg.UpdateChatPosition):
+        handled(event)
+    elif isinstance(event, tg.UpdateNewMessage):
+        handled(event)
+    elif isinstance(event, tg.UpdateChatLastMessage):
+        handled(event)
+    elif isinstance(event, tg.UpdateDeleteMessages):
+        handled(event)
+    elif isinstance(event, tg.Messages):
+        handled(event)
+    elif isinstance(event, tg.UpdateMessageInteractionInfo):
+        handled(event)
+    elif isinstance(event, tg.MessageThreadInfo):
+        handled(event)
+    elif isinstance(event, tg.UpdateUser):
+        handled(event)
+    elif isinstance(event, tg.UpdateUserStatus):
+        handled(event)
+    elif isinstance(event, tg.UpdateFile):
+        handled(event)
+
+
+def run(client: TgClient, events: list) -> float:
+    start = time.perf_counter()
+    for event in events:
+        client.dispatch(event)
+    return len(events) / (time.perf_counter() - start)
+
+
+def main():
+    arg = sys.argv[1] if len(sys.argv) > 1 else '200000'
+    if os.path.isfile(arg):
+        with open(arg, encoding='utf-8') as f:
+            stream = [json.loads(line) for line in f if line.strip()]
+    else:
+        stream = samples.update_stream(int(arg))
+    events = list(map(tg.get_object, stream))
+
+    old = _Client()
+    old.subscribe(tg.UpdateOption, handled)
+    old.subscribe(tg.UpdateNewChat, handled)
+    old.subscribe_all(isinstance_chain)
+
+    new = _Client()
+    for el in [tg.UpdateOption, tg.UpdateNewChat, *CHAIN]:
+        new.subscribe(el, handled)
+
+    print(f"isinstance chain: {run(old, events):10.0f} events/s")
+    print(f"dispatch table:   {run(new, events):10.0f} events/s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+"""Bytes per message kept in TgChat._messages for every TL object mode, and for the objects as they were before
+the classes stopped keeping their kwargs (the baseline).
+
+Usage: python -m benchmarks.messages_memory [count]
+"""
+import gc
+import sys
+import tracemalloc
+
+from lib import tg
+from src.telegram_manager import TgChat
+from benchmarks import samples
+
+
+def retain_kwargs(obj, data):
+    # Every generated object used to keep the dict it was decoded from as self._data
+    if isinstance(data, dict):
+        obj._data = data
+        for key, item in data.items():
+            if isinstance(item, (dict, list)):
+                retain_kwargs(getattr(obj, key), item)
+    elif isinstance(data, list):
+        for el, item in zip(obj, data):
+            retain_kwargs(el, item)
+
+
+def measure(mode: str, count: int, touch: bool) -> float:
+    baseline = mode == 'baseline'
+    tg.base.mode = 'eager' if baseline else mode
+    chat = TgChat(id=-1001234567890, title="Benchmark")
+    gc.collect()
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    # Stands for the dicts tdjson.receive() returns; they are counted because objects may keep references to them
+    raw = [samples.message(i, photo=i % 5 == 0) for i in range(count)]
+    for el in raw:
+        message = tg.get_object(el)
+        if baseline:
+            retain_kwargs(message, el)
+        if touch:
+            # What the chat list and a bubble read from every message
+            message.sender_id.user_id, message.content, message.interaction_info
+        chat.append_message(message)
+    # The JSON from tdjson is garbage once decoded, unless the objects keep it
+    del raw, el
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+    return size / count
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    # 'eager' is the compact representation. 'lazy' keeps the JSON of every object and decodes fields on first
+    # access, it saves decoding time for objects that are never read, not memory
+    for mode in ('baseline', 'eager', 'lazy'):
+        for touch in (False, True):
+            print(f"{mode:>8}{' (fields read)' if touch else '':<14}: {measure(mode, count, touch):8.0f} bytes/message")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,133 @@
+"""TDLib-shaped JSON samples used by the benchmarks."""
+
+
+def formatted_text(text: str):
+    return {'@type': 'formattedText', 'text': text, 'entities': [
+        {'@type': 'textEntity', 'offset': 0, 'length': min(5, len(text)), 'type': {'@type': 'textEntityTypeBold'}},
+    ]}
+
+
+def local_file(path='', completed=False, downloaded_size=0):
+    return {'@type': 'localFile', 'path': path, 'can_be_downloaded': True, 'can_be_deleted': completed,
+            'is_downloading_active': not completed and downloaded_size > 0,
+            'is_downloading_completed': completed, 'download_offset': 0,
+            'downloaded_prefix_size': downloaded_size, 'downloaded_size': downloaded_size}
+
+
+def file(file_id: int, size=150_000, downloaded_size=0):
+    completed = downloaded_size >= size
+    return {'@type': 'file', 'id': file_id, 'size': size, 'expected_size': size,
+            'local': local_file(f"/tmp/tdlib/photos/{file_id}.jpg" if completed else '', completed, downloaded_size),
+            'remote': {'@type': 'remoteFile', 'id': f"AgACAgIAAxkBAAI{file_id:012d}", 'unique_id': f"AQAD{file_id:08d}",
+                       'is_uploading_active': False, 'is_uploading_completed': True, 'uploaded_size': size}}
+
+
+def photo_content(file_id: int):
+    return {'@type': 'messagePhoto', 'photo': {
+        '@type': 'photo', 'has_stickers': False,
+        'minithumbnail': {'@type': 'minithumbnail', 'width': 40, 'height': 30, 'data': '/9j/4AAQSkZJRgABAQAAAQABAAD'},
+        'sizes': [{'@type': 'photoSize', 'type': t, 'photo': file(file_id + j, size), 'width': w, 'height': w * 3 // 4,
+                   'progressive_sizes': []}
+                  for j, (t, w, size) in enumerate([('m', 320, 20_000), ('x', 800, 80_000), ('y', 1280, 150_000)])]},
+        'caption': formatted_text(''), 'has_spoiler': False, 'is_secret': False}
+
+
+def message(message_id: int, chat_id=-1001234567890, user_id=123456789, photo=False):
+    if photo:
+        content = photo_content(message_id * 10)
+    else:
+        content = {'@type': 'messageText', 'text': formatted_text(f"Message number {message_id} with some text"),
+                   'web_page': None}
+    return {
+        '@type': 'message', 'id': message_id << 20, 'chat_id': chat_id,
+        'sender_id': {'@type': 'messageSenderUser', 'user_id': user_id},
+        'is_outgoing': False, 'is_pinned': False, 'can_be_edited': False, 'can_be_forwarded': True,
+        'can_be_replied_in_another_chat': True, 'can_be_saved': True, 'can_be_deleted_only_for_self': True,
+        'can_be_deleted_for_all_users': False, 'can_get_added_reactions': False, 'can_get_statistics': False,
+        'can_get_message_thread': True, 'can_get_viewers': False, 'can_get_media_timestamp_links': False,
+        'can_report_reactions': False, 'has_timestamped_media': True, 'is_channel_post': False,
+        'is_topic_message': False, 'contains_unread_mention': False, 'date': 1700000000 + message_id,
+        'edit_date': 0,
+        'interaction_info': {'@type': 'messageInteractionInfo', 'view_count': 0, 'forward_count': 0,
+                             'reactions': [{'@type': 'messageReaction',
+                                            'type': {'@type': 'reactionTypeEmoji', 'emoji': '👍'},
+                                            'total_count': 3, 'is_chosen': False, 'recent_sender_ids': []}]},
+        'unread_reactions': [], 'message_thread_id': 0, 'self_destruct_in': 0.0, 'auto_delete_in': 0.0,
+        'via_bot_user_id': 0, 'author_signature': '', 'media_album_id': '0', 'restriction_reason': '',
+        'content': content, 'reply_markup': None,
+    }
+
+
+def chat(chat_id: int, supergroup_id=1234567890):
+    return {
+        '@type': 'chat', 'id': chat_id, 'type': {'@type': 'chatTypeSupergroup', 'supergroup_id': supergroup_id,
+                                                 'is_channel': chat_id % 3 == 0},
+        'title': f"Chat {chat_id}",
+        'photo': {'@type': 'chatPhotoInfo', 'small': file(abs(chat_id) % 100_000 * 2, 5_000),
+                  'big': file(abs(chat_id) % 100_000 * 2 + 1, 40_000),
+                  'minithumbnail': {'@type': 'minithumbnail', 'width': 40, 'height': 40,
+                                    'data': '/9j/4AAQSkZJRgABAQAAAQABAAD'}, 'has_animation': False, 'is_personal': False},
+        'accent_color_id': 3, 'background_custom_emoji_id': '0', 'profile_accent_color_id': -1,
+        'profile_background_custom_emoji_id': '0',
+        'permissions': {'@type': 'chatPermissions', 'can_send_basic_messages': True, 'can_send_audios': True,
+                        'can_send_documents': True, 'can_send_photos': True, 'can_send_videos': True,
+                        'can_send_video_notes': True, 'can_send_voice_notes': True, 'can_send_polls': True,
+                        'can_send_other_messages': True, 'can_add_web_page_previews': True,
+                        'can_change_info': False, 'can_invite_users': True, 'can_pin_messages': False,
+                        'can_manage_topics': False},
+        'last_message': message(1000, chat_id),
+        'positions': [{'@type': 'chatPosition', 'list': {'@type': 'chatListMain'}, 'order': str(abs(chat_id) << 20),
+                       'is_pinned': False}],
+        'message_sender_id': None, 'block_list': None, 'has_protected_content': False, 'is_translatable': False,
+        'is_marked_as_unread': False, 'view_as_topics': False, 'has_scheduled_messages': False,
+        'can_be_deleted_only_for_self': True, 'can_be_deleted_for_all_users': False, 'can_be_reported': True,
+        'default_disable_notification': False, 'unread_count': chat_id % 17,
+        'last_read_inbox_message_id': 999 << 20, 'last_read_outbox_message_id': 999 << 20,
+        'unread_mention_count': 0, 'unread_reaction_count': 0,
+        'notification_settings': {'@type': 'chatNotificationSettings', 'use_default_mute_for': True, 'mute_for': 0,
+                                  'use_default_sound': True, 'sound_id': '0', 'use_default_show_preview': True,
+                                  'show_preview': False, 'use_default_mute_stories': True, 'mute_stories': False,
+                                  'use_default_story_sound': True, 'story_sound_id': '0',
+                                  'use_default_show_story_sender': True, 'show_story_sender': False,
+                                  'use_default_disable_pinned_message_notifications': True,
+                                  'disable_pinned_message_notifications': False,
+                                  'use_default_disable_mention_notifications': True,
+                                  'disable_mention_notifications': False},
+        'available_reactions': {'@type': 'chatAvailableReactionsAll'}, 'message_auto_delete_time': 0,
+        'emoji_status': None, 'background': None, 'theme_name': '', 'action_bar': None,
+        'video_chat': {'@type': 'videoChat', 'group_call_id': 0, 'has_participants': False,
+                       'default_participant_id': None},
+        'pending_join_requests': None, 'reply_markup_message_id': 0, 'draft_message': None, 'client_data': '',
+    }
+
+
+def update_stream(count: int, chats=200, users=1000, files=50):
+    """A mix of updates in the proportions a busy account receives them."""
+    res = []
+    for i in range(count):
+        chat_id = -1001000000000 - i % chats
+        match i % 20:
+            case 0 | 1 | 2 | 3 | 4 | 5 | 6 | 7:
+                res.append({'@type': 'updateFile', 'file': file(i % files, downloaded_size=(i * 4096) % 150_000)})
+            case 8 | 9 | 10 | 11 | 12:
+                res.append({'@type': 'updateUserStatus', 'user_id': i % users, 'status': {
+                    '@type': 'userStatusOffline', 'was_online': 1700000000 + i}})
+            case 13 | 14:
+                res.append({'@type': 'updateChatLastMessage', 'chat_id': chat_id, 'last_message': message(i, chat_id),
+                            'positions': []})
+            case 15:
+                res.append({'@type': 'updateNewMessage', 'message': message(i, chat_id)})
+            case 16:
+                res.append({'@type': 'updateChatReadInbox', 'chat_id': chat_id, 'last_read_inbox_message_id': i << 20,
+                            'unread_count': i % 7})
+            case 17:
+                res.append({'@type': 'updateMessageInteractionInfo', 'chat_id': chat_id, 'message_id': i << 20,
+                            'interaction_info': message(i)['interaction_info']})
+            case 18:
+                res.append({'@type': 'updateChatPosition', 'chat_id': chat_id, 'position': {
+                    '@type': 'chatPosition', 'list': {'@type': 'chatListMain'}, 'order': str(i << 32),
+                    'is_pinned': False}})
+            case _:
+                res.append({'@type': 'updateOption', 'name': 'unix_time', 'value': {
+                    '@type': 'optionValueInteger', 'value': str(1700000000 + i)}})
+    return res
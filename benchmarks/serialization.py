@@ -0,0 +1,70 @@
+"""Objects per second through tg.to_json before and after the per-class serializers, and chats per second
+through TgChat(**tg.to_json(chat)) and TgChat.from_chat.
+
+Usage: python -m benchmarks.serialization [count | recording.jsonl]
+
+A recording is a file with one tdjson object per line, e.g. chats and messages saved from getChat and getChatHistory.
+"""
+import json
+import os.path
+import sys
+import time
+
+from lib import tg
+from src.telegram_manager import TgChat
+from benchmarks import samples
+
+
+# tg.to_json before the per-class serializers
+def reflective_to_json(obj):
+    if isinstance(obj, list):
+        return list(map(reflective_to_json, obj))
+    if hasattr(obj, '__dict__'):
+        res = {'@type': obj.__class__.__name__[0].lower() + obj.__class__.__name__[1:]}
+        if '_raw' in obj.__dict__:
+            res.update(obj._raw)
+        for key, item in obj.__dict__.items():
+            if not key.startswith('_'):
+                res[key] = reflective_to_json(item)
+        return res
+    return obj
+
+
+def run(func, objects: list) -> float:
+    start = time.perf_counter()
+    for el in objects:
+        func(el)
+    return len(objects) / (time.perf_counter() - start)
+
+
+def main():
+    arg = sys.argv[1] if len(sys.argv) > 1 else '20000'
+    if os.path.isfile(arg):
+        with open(arg, encoding='utf-8') as f:
+            corpus = [json.loads(line) for line in f if line.strip()]
+    else:
+        count = int(arg)
+        corpus = [samples.chat(-1001000000000 - i) for i in range(count // 10)]
+        corpus += [samples.message(i, photo=i % 5 == 0) for i in range(count)]
+
+    for mode in ('eager', 'lazy'):
+        tg.base.mode = mode
+        objects = list(map(tg.get_object, corpus))
+        assert all(reflective_to_json(el) == tg.to_json(el) for el in objects)
+        print(f"{mode}:")
+        print(f"  reflective to_json: {run(reflective_to_json, objects):10.0f} objects/s")
+        print(f"  per-class to_json:  {run(tg.to_json, objects):10.0f} objects/s")
+
+        chats = [el for el in objects if isinstance(el, tg.Chat)]
+        if chats:
+            print(f"  TgChat(**to_json):  {run(lambda el: TgChat(**reflective_to_json(el)), chats):10.0f} chats/s")
+            print(f"  TgChat.from_chat:   {run(TgChat.from_chat, chats):10.0f} chats/s")
+
+    # The arguments of a function wrapper
+    args = [123456789, -1001234567890, 'text', True, None, 50]
+    print(f"scalar arguments, reflective: {run(reflective_to_json, args * 100000):10.0f} values/s")
+    print(f"scalar arguments, per-class:  {run(tg.to_json, args * 100000):10.0f} values/s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+"""Wall time and resident memory of importing lib.tg in a fresh interpreter, alone and after decoding sample events,
+which loads the classes they need, or every class.
+
+Usage: python -m benchmarks.startup [monolithic_tg.py]
+
+The optional argument is a single-module lib/tg.py, as generated before tools/split_tg.py, to compare with.
+"""
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+
+RUNS = 7
+
+CHILD = '''
+import resource, sys, time
+sys.path.append({root!r})
+from benchmarks import samples
+stream = samples.update_stream(2000) + [samples.chat(-100 - i) for i in range(20)]
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+start = time.perf_counter()
+import lib.tg as tg
+if {scenario!r} == 'decode':
+    list(map(tg.get_object, stream))
+elif {scenario!r} == 'all':
+    [getattr(tg, name) for name in dir(tg)]
+print(time.perf_counter() - start, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss)
+'''
+
+
+def measure(lib_dir: str, scenario: str) -> tuple[float, float]:
+    env = {key: value for key, value in os.environ.items() if key != 'PYTHONDONTWRITEBYTECODE'}
+    script = CHILD.format(root=os.path.dirname(os.path.dirname(os.path.abspath(__file__))), scenario=scenario)
+    times, memory = [], []
+    # The first run compiles the bytecode cache
+    for _ in range(RUNS + 1):
+        out = subprocess.run([sys.executable, '-c', script], cwd=os.path.dirname(lib_dir), env=env,
+                             capture_output=True, text=True, check=True).stdout.split()
+        times.append(float(out[0]))
+        memory.append(int(out[1]))
+    return statistics.median(times[1:]), statistics.median(memory[1:]) / 1024
+
+
+def main():
+    variants = {'package': os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'lib', 'tg')}
+    if len(sys.argv) > 1:
+        variants['monolithic'] = os.path.abspath(sys.argv[1])
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, path in variants.items():
+            # lib.tg alone, without lib.client and its dependencies
+            lib_dir = os.path.join(tmp, name, 'lib')
+            os.makedirs(lib_dir)
+            open(os.path.join(lib_dir, '__init__.py'), 'w').close()
+            if os.path.isdir(path):
+                shutil.copytree(path, os.path.join(lib_dir, 'tg'), ignore=shutil.ignore_patterns('__pycache__'))
+            else:
+                shutil.copy(path, os.path.join(lib_dir, 'tg.py'))
+
+            print(f"{name}:")
+            for scenario in ('import', 'decode', 'all'):
+                seconds, megabytes = measure(lib_dir, scenario)
+                print(f"  {scenario:6} {seconds * 1000:8.1f} ms {megabytes:8.1f} MB")
+
+
+if __name__ == '__main__':
+    main()
@@ -1 +1,2 @@
 from lib.client import TgClient
+from lib.async_client import AsyncTgClient
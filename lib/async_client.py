@@ -0,0 +1,17 @@
+import asyncio
+import threading
+
+from lib.client import TgClient
+
+
+class AsyncTgClient(TgClient):
+    # Runs the receive loop on an asyncio event loop: TDLib is polled in the default executor and the events are
+    # dispatched in the loop thread, so subscribers and the coroutines of lib.tg_async run without locks
+    async def run(self):
+        loop = asyncio.get_running_loop()
+        self._receive_thread = threading.current_thread()
+        self.get_authorization_state()
+        while True:
+            event_dict = await loop.run_in_executor(None, self.tdjson.receive)
+            if event_dict:
+                self._process(event_dict)
@@ -1,3 +1,10 @@
+import itertools
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, wait
+from operator import attrgetter
+
 from pywtdlib.client import Client
 from typing import Callable, Optional, Any, Type
 
@@ -18,6 +25,7 @@ class TgClient(Client):
             enable_storage_optimizer: Optional[bool] = True,
             wait_timeout: Optional[int] = 1,
             verbosity: Optional[int] = 1,
+            object_mode: Optional[str] = None,
     ) -> None:
         super().__init__(api_id, api_hash, use_file_database, use_chat_info_database, use_message_database,
                          use_secret_chats, use_test_dc, enable_storage_optimizer, wait_timeout, verbosity)
@@ -31,11 +39,67 @@ class TgClient(Client):
 
         self.chats_is_loaded = False
 
+        # Every request carries an '@extra' id, TDLib returns it with the response
+        self._request_ids = itertools.count(1)
+        self._requests: dict[int: Request] = dict()
+        self._requests_lock = threading.Lock()
+        # method -> latencies of the last requests, in seconds
+        self._latencies: dict[str: deque] = dict()
+        # Thread that receives the responses, it must never wait for them
+        self._receive_thread = None
+
         tg.client = self
+        if object_mode is not None:
+            tg.base.mode = object_mode
+
+    def send(self, data: dict) -> 'Request':
+        # The returned request resolves with the response object, or fails with TgError, in the client thread
+        request = Request(next(self._request_ids), data['@type'])
+        with self._requests_lock:
+            self._requests[request.id] = request
+        self.tdjson.send({**data, '@extra': request.id})
+        return request
+
+    def call(self, data: dict, timeout: float | None = None):
+        # Sends the request and waits for its response. Raises TgError if TDLib returns an error and TimeoutError
+        # if there is no response in time. Must not be called from the thread that receives the responses
+        return self.call_many([data], timeout)[0]
+
+    def call_many(self, requests: list[dict], timeout: float | None = None) -> list:
+        # Sends all requests at once and waits for all responses, they are returned in the order of the requests
+        if threading.current_thread() is self._receive_thread:
+            raise RuntimeError("Waiting for a response in the receive thread would block it, use send() instead")
+        sent = [self.send(el) for el in requests]
+        _, not_done = wait(sent, timeout)
+        if not_done:
+            with self._requests_lock:
+                for el in not_done:
+                    self._requests.pop(el.id, None)
+            raise TimeoutError(f"No response to {len(not_done)} of {len(sent)} requests in {timeout} s")
+        return [el.result() for el in sent]
+
+    def latency(self, method: str) -> float | None:
+        # Mean latency of the last requests of the method, in seconds
+        if not (latencies := self._latencies.get(method)):
+            return None
+        return sum(latencies) / len(latencies)
 
-    def send(self, data: dict):
-        # print(data)
-        self.tdjson.send(data)
+    def pending_requests(self) -> int:
+        return len(self._requests)
+
+    def _resolve(self, extra, event):
+        with self._requests_lock:
+            request = self._requests.pop(extra, None)
+        if request is None:
+            return
+        request.latency = time.perf_counter() - request.sent_at
+        if (latencies := self._latencies.get(request.method)) is None:
+            latencies = self._latencies[request.method] = deque(maxlen=Request.LATENCY_HISTORY)
+        latencies.append(request.latency)
+        if isinstance(event, tg.Error):
+            request.set_exception(TgError(event))
+        else:
+            request.set_result(event)
 
     def func(self, dct):
         return self.tdjson.execute(dct)
@@ -103,53 +167,96 @@ class TgClient(Client):
 
     def execute(self):
         # start the client by sending request to it
+        self._receive_thread = threading.current_thread()
         self.get_authorization_state()
 
         # main events cycle
         while True:
             event_dict = self.tdjson.receive()
             if event_dict:
-                if not self.authorized:
-                    self.authenticate_user(event_dict)
+                self._process(event_dict)
 
-                event = tg.get_object(event_dict)
-                if event.__class__ in self._subscribers:
-                    for el in self._subscribers[event.__class__]:
-                        el(event)
-                for el in self._subscribers_all:
-                    el(event)
+    def _process(self, event_dict: dict):
+        extra = event_dict.pop('@extra', None)
+        if not self.authorized:
+            self.authenticate_user(event_dict)
+
+        event = tg.get_object(event_dict)
+        if extra is not None:
+            self._resolve(extra, event)
+        self.dispatch(event)
+
+    def dispatch(self, event):
+        for el in self._subscribers.get(event.__class__, ()):
+            el(event)
+        if event.__class__ in self._routers:
+            for router in self._routers[event.__class__].values():
+                router(event)
+        for el in self._subscribers_all:
+            el(event)
+
+
+class TgError(Exception):
+    def __init__(self, error: tg.Error):
+        super().__init__(f"{error.code}: {error.message}")
+        self.code = error.code
+        self.message = error.message
+
+
+class Request(Future):
+    # Result of TgClient.send. Done callbacks are called in the client thread
+    LATENCY_HISTORY = 100
+
+    def __init__(self, request_id: int, method: str):
+        super().__init__()
+        self.id = request_id
+        self.method = method
+        self.sent_at = time.perf_counter()
+        self.latency = None
 
 
 class Subscriber:
-    def __init__(self, func: Callable, lst: list):
+    def __init__(self, func: Callable, lst: list, on_empty: Callable = None):
         self.func = func
         self.__lst = lst
+        self.__on_empty = on_empty
 
     def __call__(self, event):
         return self.func(event)
 
     def unsubscribe(self):
         self.__lst.remove(self)
+        if not self.__lst and self.__on_empty is not None:
+            self.__on_empty()
 
 
 class Router:
     def __init__(self, event_class: Type, keys: tuple[str, ...]):
         self.__event = event_class
         self.__keys = keys
+        # Nested attributes are separated with '__': subscribe(tg.UpdateFile, func, file__id=file_id)
+        self.__getters = tuple(attrgetter(key.replace('__', '.')) for key in keys)
 
         self.__subscribers: dict[tuple: list[Subscriber]] = dict()
 
     def subscribe(self, func: Callable, keys: dict[str: Any]):
-        key = [keys[k] for k in self.__keys]
+        key = tuple(keys[k] for k in self.__keys)
         if key not in self.__subscribers:
             self.__subscribers[key] = lst = []
         else:
             lst = self.__subscribers[key]
-        subscriber = Subscriber(func, lst)
+        subscriber = Subscriber(func, lst, lambda: self.__remove(key, lst))
         lst.append(subscriber)
         return subscriber
 
+    def __remove(self, key: tuple, lst: list):
+        if self.__subscribers.get(key) is lst:
+            self.__subscribers.pop(key)
+
     def __call__(self, event):
-        key = (getattr(event, key) for key in self.__keys)
-        for el in self.__subscribers.get(key, []):
+        try:
+            key = tuple(getter(event) for getter in self.__getters)
+        except AttributeError:
+            return
+        for el in self.__subscribers.get(key, ()):
             el(event)
@@ -0,0 +1,8364 @@
+# Generated by tools/split_tg.py, do not edit. Classes are in lib/tg/objects, helpers in lib/tg/base.py
+from __future__ import annotations
+
+import importlib
+
+from lib.tg.base import TlObject, TlStorerToString, Object, Function, types, get_fields, get_object, update_object, to_json
+
+
+# Class name -> module of lib.tg.objects, the module is imported when the class is first referenced
+_class_modules = {
+    'AccentColor': 'accent_color',
+    'AccountTtl': 'account_ttl',
+    'MessageSender': 'message_sender',
+    'ReactionType': 'reaction_type',
+    'AddedReaction': 'added_reaction',
+    'AddedReactions': 'added_reactions',
+    'Address': 'address',
+    'File': 'file',
+    'AnimatedChatPhoto': 'animated_chat_photo',
+    'Sticker': 'sticker',
+    'AnimatedEmoji': 'animated_emoji',
+    'Minithumbnail': 'minithumbnail',
+    'Thumbnail': 'thumbnail',
+    'Animation': 'animation',
+    'Animations': 'animations',
+    'ArchiveChatListSettings': 'archive_chat_list_settings',
+    'AttachmentMenuBotColor': 'attachment_menu_bot_color',
+    'AttachmentMenuBot': 'attachment_menu_bot',
+    'Audio': 'audio',
+    'AuthenticationCodeType': 'authentication_code_type',
+    'AuthenticationCodeInfo': 'authentication_code_info',
+    'AuthenticationCodeTypeTelegramMessage': 'authentication_code_type',
+    'AuthenticationCodeTypeSms': 'authentication_code_type',
+    'AuthenticationCodeTypeCall': 'authentication_code_type',
+    'AuthenticationCodeTypeFlashCall': 'authentication_code_type',
+    'AuthenticationCodeTypeMissedCall': 'authentication_code_type',
+    'AuthenticationCodeTypeFragment': 'authentication_code_type',
+    'AuthenticationCodeTypeFirebaseAndroid': 'authentication_code_type',
+    'AuthenticationCodeTypeFirebaseIos': 'authentication_code_type',
+    'EmailAddressResetState': 'email_address_reset_state',
+    'EmailAddressAuthenticationCodeInfo': 'email_address_authentication_code_info',
+    'TermsOfService': 'terms_of_service',
+    'AuthorizationState': 'authorization_state',
+    'AuthorizationStateWaitTdlibParameters': 'authorization_state',
+    'AuthorizationStateWaitPhoneNumber': 'authorization_state',
+    'AuthorizationStateWaitEmailAddress': 'authorization_state',
+    'AuthorizationStateWaitEmailCode': 'authorization_state',
+    'AuthorizationStateWaitCode': 'authorization_state',
+    'AuthorizationStateWaitOtherDeviceConfirmation': 'authorization_state',
+    'AuthorizationStateWaitRegistration': 'authorization_state',
+    'AuthorizationStateWaitPassword': 'authorization_state',
+    'AuthorizationStateReady': 'authorization_state',
+    'AuthorizationStateLoggingOut': 'authorization_state',
+    'AuthorizationStateClosing': 'authorization_state',
+    'AuthorizationStateClosed': 'authorization_state',
+    'AutoDownloadSettings': 'auto_download_settings',
+    'AutoDownloadSettingsPresets': 'auto_download_settings_presets',
+    'AutosaveSettingsException': 'autosave_settings_exception',
+    'ScopeAutosaveSettings': 'scope_autosave_settings',
+    'AutosaveSettings': 'autosave_settings',
+    'AutosaveSettingsScope': 'autosave_settings_scope',
+    'AutosaveSettingsScopePrivateChats': 'autosave_settings_scope',
+    'AutosaveSettingsScopeGroupChats': 'autosave_settings_scope',
+    'AutosaveSettingsScopeChannelChats': 'autosave_settings_scope',
+    'AutosaveSettingsScopeChat': 'autosave_settings_scope',
+    'AvailableReaction': 'available_reaction',
+    'AvailableReactions': 'available_reactions',
+    'BackgroundType': 'background_type',
+    'Document': 'document',
+    'Background': 'background',
+    'BackgroundFill': 'background_fill',
+    'BackgroundFillSolid': 'background_fill',
+    'BackgroundFillGradient': 'background_fill',
+    'BackgroundFillFreeformGradient': 'background_fill',
+    'BackgroundTypeWallpaper': 'background_type',
+    'BackgroundTypePattern': 'background_type',
+    'BackgroundTypeFill': 'background_type',
+    'BackgroundTypeChatTheme': 'background_type',
+    'Backgrounds': 'backgrounds',
+    'BankCardActionOpenUrl': 'bank_card_action_open_url',
+    'BankCardInfo': 'bank_card_info',
+    'ChatMemberStatus': 'chat_member_status',
+    'BasicGroup': 'basic_group',
+    'BotCommands': 'bot_commands',
+    'ChatInviteLink': 'chat_invite_link',
+    'ChatMember': 'chat_member',
+    'ChatPhoto': 'chat_photo',
+    'BasicGroupFullInfo': 'basic_group_full_info',
+    'BlockList': 'block_list',
+    'BlockListMain': 'block_list',
+    'BlockListStories': 'block_list',
+    'BotCommand': 'bot_command',
+    'BotCommandScope': 'bot_command_scope',
+    'BotCommandScopeDefault': 'bot_command_scope',
+    'BotCommandScopeAllPrivateChats': 'bot_command_scope',
+    'BotCommandScopeAllGroupChats': 'bot_command_scope',
+    'BotCommandScopeAllChatAdministrators': 'bot_command_scope',
+    'BotCommandScopeChat': 'bot_command_scope',
+    'BotCommandScopeChatAdministrators': 'bot_command_scope',
+    'BotCommandScopeChatMember': 'bot_command_scope',
+    'InternalLinkType': 'internal_link_type',
+    'BotMenuButton': 'bot_menu_button',
+    'ChatAdministratorRights': 'chat_administrator_rights',
+    'Photo': 'photo',
+    'BotInfo': 'bot_info',
+    'WebApp': 'web_app',
+    'BotWriteAccessAllowReason': 'bot_write_access_allow_reason',
+    'BotWriteAccessAllowReasonConnectedWebsite': 'bot_write_access_allow_reason',
+    'BotWriteAccessAllowReasonAddedToAttachmentMenu': 'bot_write_access_allow_reason',
+    'BotWriteAccessAllowReasonLaunchedWebApp': 'bot_write_access_allow_reason',
+    'BotWriteAccessAllowReasonAcceptedRequest': 'bot_write_access_allow_reason',
+    'CallState': 'call_state',
+    'Call': 'call',
+    'CallDiscardReason': 'call_discard_reason',
+    'CallDiscardReasonEmpty': 'call_discard_reason',
+    'CallDiscardReasonMissed': 'call_discard_reason',
+    'CallDiscardReasonDeclined': 'call_discard_reason',
+    'CallDiscardReasonDisconnected': 'call_discard_reason',
+    'CallDiscardReasonHungUp': 'call_discard_reason',
+    'CallId': 'call_id',
+    'CallProblem': 'call_problem',
+    'CallProblemEcho': 'call_problem',
+    'CallProblemNoise': 'call_problem',
+    'CallProblemInterruptions': 'call_problem',
+    'CallProblemDistortedSpeech': 'call_problem',
+    'CallProblemSilentLocal': 'call_problem',
+    'CallProblemSilentRemote': 'call_problem',
+    'CallProblemDropped': 'call_problem',
+    'CallProblemDistortedVideo': 'call_problem',
+    'CallProblemPixelatedVideo': 'call_problem',
+    'CallProtocol': 'call_protocol',
+    'CallServerType': 'call_server_type',
+    'CallServer': 'call_server',
+    'CallServerTypeTelegramReflector': 'call_server_type',
+    'CallServerTypeWebrtc': 'call_server_type',
+    'Error': 'error',
+    'CallStatePending': 'call_state',
+    'CallStateExchangingKeys': 'call_state',
+    'CallStateReady': 'call_state',
+    'CallStateHangingUp': 'call_state',
+    'CallStateDiscarded': 'call_state',
+    'CallStateError': 'call_state',
+    'CallbackQueryAnswer': 'callback_query_answer',
+    'CallbackQueryPayload': 'callback_query_payload',
+    'CallbackQueryPayloadData': 'callback_query_payload',
+    'CallbackQueryPayloadDataWithPassword': 'callback_query_payload',
+    'CallbackQueryPayloadGame': 'callback_query_payload',
+    'CanSendStoryResult': 'can_send_story_result',
+    'CanSendStoryResultOk': 'can_send_story_result',
+    'CanSendStoryResultPremiumNeeded': 'can_send_story_result',
+    'CanSendStoryResultBoostNeeded': 'can_send_story_result',
+    'CanSendStoryResultActiveStoryLimitExceeded': 'can_send_story_result',
+    'CanSendStoryResultWeeklyLimitExceeded': 'can_send_story_result',
+    'CanSendStoryResultMonthlyLimitExceeded': 'can_send_story_result',
+    'CanTransferOwnershipResult': 'can_transfer_ownership_result',
+    'CanTransferOwnershipResultOk': 'can_transfer_ownership_result',
+    'CanTransferOwnershipResultPasswordNeeded': 'can_transfer_ownership_result',
+    'CanTransferOwnershipResultPasswordTooFresh': 'can_transfer_ownership_result',
+    'CanTransferOwnershipResultSessionTooFresh': 'can_transfer_ownership_result',
+    'ChatActionBar': 'chat_action_bar',
+    'ChatAvailableReactions': 'chat_available_reactions',
+    'ChatType': 'chat_type',
+    'ChatBackground': 'chat_background',
+    'ChatJoinRequestsInfo': 'chat_join_requests_info',
+    'ChatNotificationSettings': 'chat_notification_settings',
+    'ChatPermissions': 'chat_permissions',
+    'ChatPhotoInfo': 'chat_photo_info',
+    'ChatPosition': 'chat_position',
+    'DraftMessage': 'draft_message',
+    'EmojiStatus': 'emoji_status',
+    'Message': 'message',
+    'VideoChat': 'video_chat',
+    'Chat': 'chat',
+    'ChatAction': 'chat_action',
+    'ChatActionTyping': 'chat_action',
+    'ChatActionRecordingVideo': 'chat_action',
+    'ChatActionUploadingVideo': 'chat_action',
+    'ChatActionRecordingVoiceNote': 'chat_action',
+    'ChatActionUploadingVoiceNote': 'chat_action',
+    'ChatActionUploadingPhoto': 'chat_action',
+    'ChatActionUploadingDocument': 'chat_action',
+    'ChatActionChoosingSticker': 'chat_action',
+    'ChatActionChoosingLocation': 'chat_action',
+    'ChatActionChoosingContact': 'chat_action',
+    'ChatActionStartPlayingGame': 'chat_action',
+    'ChatActionRecordingVideoNote': 'chat_action',
+    'ChatActionUploadingVideoNote': 'chat_action',
+    'ChatActionWatchingAnimations': 'chat_action',
+    'ChatActionCancel': 'chat_action',
+    'ChatActionBarReportSpam': 'chat_action_bar',
+    'ChatActionBarReportUnrelatedLocation': 'chat_action_bar',
+    'ChatActionBarInviteMembers': 'chat_action_bar',
+    'ChatActionBarReportAddBlock': 'chat_action_bar',
+    'ChatActionBarAddContact': 'chat_action_bar',
+    'ChatActionBarSharePhoneNumber': 'chat_action_bar',
+    'ChatActionBarJoinRequest': 'chat_action_bar',
+    'StoryList': 'story_list',
+    'StoryInfo': 'story_info',
+    'ChatActiveStories': 'chat_active_stories',
+    'ChatAdministrator': 'chat_administrator',
+    'ChatAdministrators': 'chat_administrators',
+    'ChatAvailableReactionsAll': 'chat_available_reactions',
+    'ChatAvailableReactionsSome': 'chat_available_reactions',
+    'ChatBoostSource': 'chat_boost_source',
+    'ChatBoost': 'chat_boost',
+    'ChatBoostLevelFeatures': 'chat_boost_level_features',
+    'ChatBoostFeatures': 'chat_boost_features',
+    'ChatBoostLink': 'chat_boost_link',
+    'ChatBoostLinkInfo': 'chat_boost_link_info',
+    'ChatBoostSlot': 'chat_boost_slot',
+    'ChatBoostSlots': 'chat_boost_slots',
+    'ChatBoostSourceGiftCode': 'chat_boost_source',
+    'ChatBoostSourceGiveaway': 'chat_boost_source',
+    'ChatBoostSourcePremium': 'chat_boost_source',
+    'PrepaidPremiumGiveaway': 'prepaid_premium_giveaway',
+    'ChatBoostStatus': 'chat_boost_status',
+    'ChatEventAction': 'chat_event_action',
+    'ChatEvent': 'chat_event',
+    'ChatLocation': 'chat_location',
+    'ForumTopicInfo': 'forum_topic_info',
+    'ChatEventMessageEdited': 'chat_event_action',
+    'ChatEventMessageDeleted': 'chat_event_action',
+    'ChatEventMessagePinned': 'chat_event_action',
+    'ChatEventMessageUnpinned': 'chat_event_action',
+    'ChatEventPollStopped': 'chat_event_action',
+    'ChatEventMemberJoined': 'chat_event_action',
+    'ChatEventMemberJoinedByInviteLink': 'chat_event_action',
+    'ChatEventMemberJoinedByRequest': 'chat_event_action',
+    'ChatEventMemberInvited': 'chat_event_action',
+    'ChatEventMemberLeft': 'chat_event_action',
+    'ChatEventMemberPromoted': 'chat_event_action',
+    'ChatEventMemberRestricted': 'chat_event_action',
+    'ChatEventAvailableReactionsChanged': 'chat_event_action',
+    'ChatEventBackgroundChanged': 'chat_event_action',
+    'ChatEventDescriptionChanged': 'chat_event_action',
+    'ChatEventEmojiStatusChanged': 'chat_event_action',
+    'ChatEventLinkedChatChanged': 'chat_event_action',
+    'ChatEventLocationChanged': 'chat_event_action',
+    'ChatEventMessageAutoDeleteTimeChanged': 'chat_event_action',
+    'ChatEventPermissionsChanged': 'chat_event_action',
+    'ChatEventPhotoChanged': 'chat_event_action',
+    'ChatEventSlowModeDelayChanged': 'chat_event_action',
+    'ChatEventStickerSetChanged': 'chat_event_action',
+    'ChatEventTitleChanged': 'chat_event_action',
+    'ChatEventUsernameChanged': 'chat_event_action',
+    'ChatEventActiveUsernamesChanged': 'chat_event_action',
+    'ChatEventAccentColorChanged': 'chat_event_action',
+    'ChatEventProfileAccentColorChanged': 'chat_event_action',
+    'ChatEventHasProtectedContentToggled': 'chat_event_action',
+    'ChatEventInvitesToggled': 'chat_event_action',
+    'ChatEventIsAllHistoryAvailableToggled': 'chat_event_action',
+    'ChatEventHasAggressiveAntiSpamEnabledToggled': 'chat_event_action',
+    'ChatEventSignMessagesToggled': 'chat_event_action',
+    'ChatEventInviteLinkEdited': 'chat_event_action',
+    'ChatEventInviteLinkRevoked': 'chat_event_action',
+    'ChatEventInviteLinkDeleted': 'chat_event_action',
+    'ChatEventVideoChatCreated': 'chat_event_action',
+    'ChatEventVideoChatEnded': 'chat_event_action',
+    'ChatEventVideoChatMuteNewParticipantsToggled': 'chat_event_action',
+    'ChatEventVideoChatParticipantIsMutedToggled': 'chat_event_action',
+    'ChatEventVideoChatParticipantVolumeLevelChanged': 'chat_event_action',
+    'ChatEventIsForumToggled': 'chat_event_action',
+    'ChatEventForumTopicCreated': 'chat_event_action',
+    'ChatEventForumTopicEdited': 'chat_event_action',
+    'ChatEventForumTopicToggleIsClosed': 'chat_event_action',
+    'ChatEventForumTopicToggleIsHidden': 'chat_event_action',
+    'ChatEventForumTopicDeleted': 'chat_event_action',
+    'ChatEventForumTopicPinned': 'chat_event_action',
+    'ChatEventLogFilters': 'chat_event_log_filters',
+    'ChatEvents': 'chat_events',
+    'ChatFolderIcon': 'chat_folder_icon',
+    'ChatFolder': 'chat_folder',
+    'ChatFolderInfo': 'chat_folder_info',
+    'ChatFolderInviteLink': 'chat_folder_invite_link',
+    'ChatFolderInviteLinkInfo': 'chat_folder_invite_link_info',
+    'ChatFolderInviteLinks': 'chat_folder_invite_links',
+    'ChatInviteLinkCount': 'chat_invite_link_count',
+    'ChatInviteLinkCounts': 'chat_invite_link_counts',
+    'InviteLinkChatType': 'invite_link_chat_type',
+    'ChatInviteLinkInfo': 'chat_invite_link_info',
+    'ChatInviteLinkMember': 'chat_invite_link_member',
+    'ChatInviteLinkMembers': 'chat_invite_link_members',
+    'ChatInviteLinks': 'chat_invite_links',
+    'ChatJoinRequest': 'chat_join_request',
+    'ChatJoinRequests': 'chat_join_requests',
+    'ChatList': 'chat_list',
+    'ChatListMain': 'chat_list',
+    'ChatListArchive': 'chat_list',
+    'ChatListFolder': 'chat_list',
+    'ChatLists': 'chat_lists',
+    'Location': 'location',
+    'ChatMemberStatusCreator': 'chat_member_status',
+    'ChatMemberStatusAdministrator': 'chat_member_status',
+    'ChatMemberStatusMember': 'chat_member_status',
+    'ChatMemberStatusRestricted': 'chat_member_status',
+    'ChatMemberStatusLeft': 'chat_member_status',
+    'ChatMemberStatusBanned': 'chat_member_status',
+    'ChatMembers': 'chat_members',
+    'ChatMembersFilter': 'chat_members_filter',
+    'ChatMembersFilterContacts': 'chat_members_filter',
+    'ChatMembersFilterAdministrators': 'chat_members_filter',
+    'ChatMembersFilterMembers': 'chat_members_filter',
+    'ChatMembersFilterMention': 'chat_members_filter',
+    'ChatMembersFilterRestricted': 'chat_members_filter',
+    'ChatMembersFilterBanned': 'chat_members_filter',
+    'ChatMembersFilterBots': 'chat_members_filter',
+    'ChatMessageSender': 'chat_message_sender',
+    'ChatMessageSenders': 'chat_message_senders',
+    'ChatNearby': 'chat_nearby',
+    'ChatPhotoSticker': 'chat_photo_sticker',
+    'PhotoSize': 'photo_size',
+    'ChatPhotoStickerType': 'chat_photo_sticker_type',
+    'ChatPhotoStickerTypeRegularOrMask': 'chat_photo_sticker_type',
+    'ChatPhotoStickerTypeCustomEmoji': 'chat_photo_sticker_type',
+    'ChatPhotos': 'chat_photos',
+    'ChatSource': 'chat_source',
+    'ChatSourceMtprotoProxy': 'chat_source',
+    'ChatSourcePublicServiceAnnouncement': 'chat_source',
+    'StatisticalGraph': 'statistical_graph',
+    'ChatStatisticsAdministratorActionsInfo': 'chat_statistics_administrator_actions_info',
+    'ChatStatisticsInteractionInfo': 'chat_statistics_interaction_info',
+    'ChatStatisticsInviterInfo': 'chat_statistics_inviter_info',
+    'ChatStatisticsMessageSenderInfo': 'chat_statistics_message_sender_info',
+    'DateRange': 'date_range',
+    'StatisticalValue': 'statistical_value',
+    'ChatStatistics': 'chat_statistics',
+    'ChatStatisticsSupergroup': 'chat_statistics',
+    'ChatStatisticsChannel': 'chat_statistics',
+    'ChatStatisticsObjectType': 'chat_statistics_object_type',
+    'ChatStatisticsObjectTypeMessage': 'chat_statistics_object_type',
+    'ChatStatisticsObjectTypeStory': 'chat_statistics_object_type',
+    'ThemeSettings': 'theme_settings',
+    'ChatTheme': 'chat_theme',
+    'ChatTypePrivate': 'chat_type',
+    'ChatTypeBasicGroup': 'chat_type',
+    'ChatTypeSupergroup': 'chat_type',
+    'ChatTypeSecret': 'chat_type',
+    'Chats': 'chats',
+    'ChatsNearby': 'chats_nearby',
+    'CheckChatUsernameResult': 'check_chat_username_result',
+    'CheckChatUsernameResultOk': 'check_chat_username_result',
+    'CheckChatUsernameResultUsernameInvalid': 'check_chat_username_result',
+    'CheckChatUsernameResultUsernameOccupied': 'check_chat_username_result',
+    'CheckChatUsernameResultUsernamePurchasable': 'check_chat_username_result',
+    'CheckChatUsernameResultPublicChatsTooMany': 'check_chat_username_result',
+    'CheckChatUsernameResultPublicGroupsUnavailable': 'check_chat_username_result',
+    'CheckStickerSetNameResult': 'check_sticker_set_name_result',
+    'CheckStickerSetNameResultOk': 'check_sticker_set_name_result',
+    'CheckStickerSetNameResultNameInvalid': 'check_sticker_set_name_result',
+    'CheckStickerSetNameResultNameOccupied': 'check_sticker_set_name_result',
+    'VectorPathCommand': 'vector_path_command',
+    'ClosedVectorPath': 'closed_vector_path',
+    'ConnectedWebsite': 'connected_website',
+    'ConnectedWebsites': 'connected_websites',
+    'ConnectionState': 'connection_state',
+    'ConnectionStateWaitingForNetwork': 'connection_state',
+    'ConnectionStateConnectingToProxy': 'connection_state',
+    'ConnectionStateConnecting': 'connection_state',
+    'ConnectionStateUpdating': 'connection_state',
+    'ConnectionStateReady': 'connection_state',
+    'Contact': 'contact',
+    'Count': 'count',
+    'CountryInfo': 'country_info',
+    'Countries': 'countries',
+    'CustomRequestResult': 'custom_request_result',
+    'DatabaseStatistics': 'database_statistics',
+    'Date': 'date',
+    'DatedFile': 'dated_file',
+    'FormattedText': 'formatted_text',
+    'DeepLinkInfo': 'deep_link_info',
+    'DeviceToken': 'device_token',
+    'DeviceTokenFirebaseCloudMessaging': 'device_token',
+    'DeviceTokenApplePush': 'device_token',
+    'DeviceTokenApplePushVoIP': 'device_token',
+    'DeviceTokenWindowsPush': 'device_token',
+    'DeviceTokenMicrosoftPush': 'device_token',
+    'DeviceTokenMicrosoftPushVoIP': 'device_token',
+    'DeviceTokenWebPush': 'device_token',
+    'DeviceTokenSimplePush': 'device_token',
+    'DeviceTokenUbuntuPush': 'device_token',
+    'DeviceTokenBlackBerryPush': 'device_token',
+    'DeviceTokenTizenPush': 'device_token',
+    'DeviceTokenHuaweiPush': 'device_token',
+    'DiceStickers': 'dice_stickers',
+    'DiceStickersRegular': 'dice_stickers',
+    'DiceStickersSlotMachine': 'dice_stickers',
+    'DownloadedFileCounts': 'downloaded_file_counts',
+    'InputMessageContent': 'input_message_content',
+    'InputMessageReplyTo': 'input_message_reply_to',
+    'EmailAddressAuthentication': 'email_address_authentication',
+    'EmailAddressAuthenticationCode': 'email_address_authentication',
+    'EmailAddressAuthenticationAppleId': 'email_address_authentication',
+    'EmailAddressAuthenticationGoogleId': 'email_address_authentication',
+    'EmailAddressResetStateAvailable': 'email_address_reset_state',
+    'EmailAddressResetStatePending': 'email_address_reset_state',
+    'EmojiCategory': 'emoji_category',
+    'EmojiCategories': 'emoji_categories',
+    'EmojiCategoryType': 'emoji_category_type',
+    'EmojiCategoryTypeDefault': 'emoji_category_type',
+    'EmojiCategoryTypeEmojiStatus': 'emoji_category_type',
+    'EmojiCategoryTypeChatPhoto': 'emoji_category_type',
+    'EmojiReaction': 'emoji_reaction',
+    'EmojiStatuses': 'emoji_statuses',
+    'Emojis': 'emojis',
+    'EncryptedCredentials': 'encrypted_credentials',
+    'PassportElementType': 'passport_element_type',
+    'EncryptedPassportElement': 'encrypted_passport_element',
+    'LocalFile': 'local_file',
+    'RemoteFile': 'remote_file',
+    'FileDownload': 'file_download',
+    'FileDownloadedPrefixSize': 'file_downloaded_prefix_size',
+    'FilePart': 'file_part',
+    'FileType': 'file_type',
+    'FileTypeNone': 'file_type',
+    'FileTypeAnimation': 'file_type',
+    'FileTypeAudio': 'file_type',
+    'FileTypeDocument': 'file_type',
+    'FileTypeNotificationSound': 'file_type',
+    'FileTypePhoto': 'file_type',
+    'FileTypePhotoStory': 'file_type',
+    'FileTypeProfilePhoto': 'file_type',
+    'FileTypeSecret': 'file_type',
+    'FileTypeSecretThumbnail': 'file_type',
+    'FileTypeSecure': 'file_type',
+    'FileTypeSticker': 'file_type',
+    'FileTypeThumbnail': 'file_type',
+    'FileTypeUnknown': 'file_type',
+    'FileTypeVideo': 'file_type',
+    'FileTypeVideoNote': 'file_type',
+    'FileTypeVideoStory': 'file_type',
+    'FileTypeVoiceNote': 'file_type',
+    'FileTypeWallpaper': 'file_type',
+    'FirebaseAuthenticationSettings': 'firebase_authentication_settings',
+    'FirebaseAuthenticationSettingsAndroid': 'firebase_authentication_settings',
+    'FirebaseAuthenticationSettingsIos': 'firebase_authentication_settings',
+    'TextEntity': 'text_entity',
+    'ForumTopic': 'forum_topic',
+    'ForumTopicIcon': 'forum_topic_icon',
+    'ForumTopics': 'forum_topics',
+    'FoundChatBoosts': 'found_chat_boosts',
+    'FoundChatMessages': 'found_chat_messages',
+    'FoundFileDownloads': 'found_file_downloads',
+    'FoundMessages': 'found_messages',
+    'FoundPosition': 'found_position',
+    'FoundPositions': 'found_positions',
+    'FoundWebApp': 'found_web_app',
+    'Game': 'game',
+    'GameHighScore': 'game_high_score',
+    'GameHighScores': 'game_high_scores',
+    'GroupCallRecentSpeaker': 'group_call_recent_speaker',
+    'GroupCall': 'group_call',
+    'GroupCallId': 'group_call_id',
+    'GroupCallParticipantVideoInfo': 'group_call_participant_video_info',
+    'GroupCallParticipant': 'group_call_participant',
+    'GroupCallVideoSourceGroup': 'group_call_video_source_group',
+    'GroupCallStream': 'group_call_stream',
+    'GroupCallStreams': 'group_call_streams',
+    'GroupCallVideoQuality': 'group_call_video_quality',
+    'GroupCallVideoQualityThumbnail': 'group_call_video_quality',
+    'GroupCallVideoQualityMedium': 'group_call_video_quality',
+    'GroupCallVideoQualityFull': 'group_call_video_quality',
+    'Hashtags': 'hashtags',
+    'HttpUrl': 'http_url',
+    'IdentityDocument': 'identity_document',
+    'ImportedContacts': 'imported_contacts',
+    'InlineKeyboardButtonType': 'inline_keyboard_button_type',
+    'InlineKeyboardButton': 'inline_keyboard_button',
+    'TargetChat': 'target_chat',
+    'InlineKeyboardButtonTypeUrl': 'inline_keyboard_button_type',
+    'InlineKeyboardButtonTypeLoginUrl': 'inline_keyboard_button_type',
+    'InlineKeyboardButtonTypeWebApp': 'inline_keyboard_button_type',
+    'InlineKeyboardButtonTypeCallback': 'inline_keyboard_button_type',
+    'InlineKeyboardButtonTypeCallbackWithPassword': 'inline_keyboard_button_type',
+    'InlineKeyboardButtonTypeCallbackGame': 'inline_keyboard_button_type',
+    'InlineKeyboardButtonTypeSwitchInline': 'inline_keyboard_button_type',
+    'InlineKeyboardButtonTypeBuy': 'inline_keyboard_button_type',
+    'InlineKeyboardButtonTypeUser': 'inline_keyboard_button_type',
+    'Venue': 'venue',
+    'Video': 'video',
+    'VoiceNote': 'voice_note',
+    'InlineQueryResult': 'inline_query_result',
+    'InlineQueryResultArticle': 'inline_query_result',
+    'InlineQueryResultContact': 'inline_query_result',
+    'InlineQueryResultLocation': 'inline_query_result',
+    'InlineQueryResultVenue': 'inline_query_result',
+    'InlineQueryResultGame': 'inline_query_result',
+    'InlineQueryResultAnimation': 'inline_query_result',
+    'InlineQueryResultAudio': 'inline_query_result',
+    'InlineQueryResultDocument': 'inline_query_result',
+    'InlineQueryResultPhoto': 'inline_query_result',
+    'InlineQueryResultSticker': 'inline_query_result',
+    'InlineQueryResultVideo': 'inline_query_result',
+    'InlineQueryResultVoiceNote': 'inline_query_result',
+    'InlineQueryResultsButton': 'inline_query_results_button',
+    'InlineQueryResults': 'inline_query_results',
+    'InlineQueryResultsButtonType': 'inline_query_results_button_type',
+    'InlineQueryResultsButtonTypeStartBot': 'inline_query_results_button_type',
+    'InlineQueryResultsButtonTypeWebApp': 'inline_query_results_button_type',
+    'InputFile': 'input_file',
+    'InputBackground': 'input_background',
+    'InputBackgroundLocal': 'input_background',
+    'InputBackgroundRemote': 'input_background',
+    'InputBackgroundPrevious': 'input_background',
+    'InputChatPhoto': 'input_chat_photo',
+    'InputChatPhotoPrevious': 'input_chat_photo',
+    'InputChatPhotoStatic': 'input_chat_photo',
+    'InputChatPhotoAnimation': 'input_chat_photo',
+    'InputChatPhotoSticker': 'input_chat_photo',
+    'InputCredentials': 'input_credentials',
+    'InputCredentialsSaved': 'input_credentials',
+    'InputCredentialsNew': 'input_credentials',
+    'InputCredentialsApplePay': 'input_credentials',
+    'InputCredentialsGooglePay': 'input_credentials',
+    'InputFileId': 'input_file',
+    'InputFileRemote': 'input_file',
+    'InputFileLocal': 'input_file',
+    'InputFileGenerated': 'input_file',
+    'InputIdentityDocument': 'input_identity_document',
+    'ReplyMarkup': 'reply_markup',
+    'InputInlineQueryResult': 'input_inline_query_result',
+    'InputInlineQueryResultAnimation': 'input_inline_query_result',
+    'InputInlineQueryResultArticle': 'input_inline_query_result',
+    'InputInlineQueryResultAudio': 'input_inline_query_result',
+    'InputInlineQueryResultContact': 'input_inline_query_result',
+    'InputInlineQueryResultDocument': 'input_inline_query_result',
+    'InputInlineQueryResultGame': 'input_inline_query_result',
+    'InputInlineQueryResultLocation': 'input_inline_query_result',
+    'InputInlineQueryResultPhoto': 'input_inline_query_result',
+    'InputInlineQueryResultSticker': 'input_inline_query_result',
+    'InputInlineQueryResultVenue': 'input_inline_query_result',
+    'InputInlineQueryResultVideo': 'input_inline_query_result',
+    'InputInlineQueryResultVoiceNote': 'input_inline_query_result',
+    'TelegramPaymentPurpose': 'telegram_payment_purpose',
+    'InputInvoice': 'input_invoice',
+    'InputInvoiceMessage': 'input_invoice',
+    'InputInvoiceName': 'input_invoice',
+    'InputInvoiceTelegram': 'input_invoice',
+    'MessageSelfDestructType': 'message_self_destruct_type',
+    'PollType': 'poll_type',
+    'InputThumbnail': 'input_thumbnail',
+    'Invoice': 'invoice',
+    'LinkPreviewOptions': 'link_preview_options',
+    'MessageCopyOptions': 'message_copy_options',
+    'InputMessageText': 'input_message_content',
+    'InputMessageAnimation': 'input_message_content',
+    'InputMessageAudio': 'input_message_content',
+    'InputMessageDocument': 'input_message_content',
+    'InputMessagePhoto': 'input_message_content',
+    'InputMessageSticker': 'input_message_content',
+    'InputMessageVideo': 'input_message_content',
+    'InputMessageVideoNote': 'input_message_content',
+    'InputMessageVoiceNote': 'input_message_content',
+    'InputMessageLocation': 'input_message_content',
+    'InputMessageVenue': 'input_message_content',
+    'InputMessageContact': 'input_message_content',
+    'InputMessageDice': 'input_message_content',
+    'InputMessageGame': 'input_message_content',
+    'InputMessageInvoice': 'input_message_content',
+    'InputMessagePoll': 'input_message_content',
+    'InputMessageStory': 'input_message_content',
+    'InputMessageForwarded': 'input_message_content',
+    'InputTextQuote': 'input_text_quote',
+    'InputMessageReplyToMessage': 'input_message_reply_to',
+    'InputMessageReplyToStory': 'input_message_reply_to',
+    'InputPersonalDocument': 'input_personal_document',
+    'PersonalDetails': 'personal_details',
+    'InputPassportElement': 'input_passport_element',
+    'InputPassportElementPersonalDetails': 'input_passport_element',
+    'InputPassportElementPassport': 'input_passport_element',
+    'InputPassportElementDriverLicense': 'input_passport_element',
+    'InputPassportElementIdentityCard': 'input_passport_element',
+    'InputPassportElementInternalPassport': 'input_passport_element',
+    'InputPassportElementAddress': 'input_passport_element',
+    'InputPassportElementUtilityBill': 'input_passport_element',
+    'InputPassportElementBankStatement': 'input_passport_element',
+    'InputPassportElementRentalAgreement': 'input_passport_element',
+    'InputPassportElementPassportRegistration': 'input_passport_element',
+    'InputPassportElementTemporaryRegistration': 'input_passport_element',
+    'InputPassportElementPhoneNumber': 'input_passport_element',
+    'InputPassportElementEmailAddress': 'input_passport_element',
+    'InputPassportElementErrorSource': 'input_passport_element_error_source',
+    'InputPassportElementError': 'input_passport_element_error',
+    'InputPassportElementErrorSourceUnspecified': 'input_passport_element_error_source',
+    'InputPassportElementErrorSourceDataField': 'input_passport_element_error_source',
+    'InputPassportElementErrorSourceFrontSide': 'input_passport_element_error_source',
+    'InputPassportElementErrorSourceReverseSide': 'input_passport_element_error_source',
+    'InputPassportElementErrorSourceSelfie': 'input_passport_element_error_source',
+    'InputPassportElementErrorSourceTranslationFile': 'input_passport_element_error_source',
+    'InputPassportElementErrorSourceTranslationFiles': 'input_passport_element_error_source',
+    'InputPassportElementErrorSourceFile': 'input_passport_element_error_source',
+    'InputPassportElementErrorSourceFiles': 'input_passport_element_error_source',
+    'MaskPosition': 'mask_position',
+    'InputSticker': 'input_sticker',
+    'InputStoryAreaType': 'input_story_area_type',
+    'StoryAreaPosition': 'story_area_position',
+    'InputStoryArea': 'input_story_area',
+    'InputStoryAreaTypeLocation': 'input_story_area_type',
+    'InputStoryAreaTypeFoundVenue': 'input_story_area_type',
+    'InputStoryAreaTypePreviousVenue': 'input_story_area_type',
+    'InputStoryAreaTypeSuggestedReaction': 'input_story_area_type',
+    'InputStoryAreaTypeMessage': 'input_story_area_type',
+    'InputStoryAreas': 'input_story_areas',
+    'InputStoryContent': 'input_story_content',
+    'InputStoryContentPhoto': 'input_story_content',
+    'InputStoryContentVideo': 'input_story_content',
+    'ProxyType': 'proxy_type',
+    'InternalLinkTypeActiveSessions': 'internal_link_type',
+    'InternalLinkTypeAttachmentMenuBot': 'internal_link_type',
+    'InternalLinkTypeAuthenticationCode': 'internal_link_type',
+    'InternalLinkTypeBackground': 'internal_link_type',
+    'InternalLinkTypeBotAddToChannel': 'internal_link_type',
+    'InternalLinkTypeBotStart': 'internal_link_type',
+    'InternalLinkTypeBotStartInGroup': 'internal_link_type',
+    'InternalLinkTypeChangePhoneNumber': 'internal_link_type',
+    'InternalLinkTypeChatBoost': 'internal_link_type',
+    'InternalLinkTypeChatFolderInvite': 'internal_link_type',
+    'InternalLinkTypeChatFolderSettings': 'internal_link_type',
+    'InternalLinkTypeChatInvite': 'internal_link_type',
+    'InternalLinkTypeDefaultMessageAutoDeleteTimerSettings': 'internal_link_type',
+    'InternalLinkTypeEditProfileSettings': 'internal_link_type',
+    'InternalLinkTypeGame': 'internal_link_type',
+    'InternalLinkTypeInstantView': 'internal_link_type',
+    'InternalLinkTypeInvoice': 'internal_link_type',
+    'InternalLinkTypeLanguagePack': 'internal_link_type',
+    'InternalLinkTypeLanguageSettings': 'internal_link_type',
+    'InternalLinkTypeMessage': 'internal_link_type',
+    'InternalLinkTypeMessageDraft': 'internal_link_type',
+    'InternalLinkTypePassportDataRequest': 'internal_link_type',
+    'InternalLinkTypePhoneNumberConfirmation': 'internal_link_type',
+    'InternalLinkTypePremiumFeatures': 'internal_link_type',
+    'InternalLinkTypePremiumGift': 'internal_link_type',
+    'InternalLinkTypePremiumGiftCode': 'internal_link_type',
+    'InternalLinkTypePrivacyAndSecuritySettings': 'internal_link_type',
+    'InternalLinkTypeProxy': 'internal_link_type',
+    'InternalLinkTypePublicChat': 'internal_link_type',
+    'InternalLinkTypeQrCodeAuthentication': 'internal_link_type',
+    'InternalLinkTypeRestorePurchases': 'internal_link_type',
+    'InternalLinkTypeSettings': 'internal_link_type',
+    'InternalLinkTypeSideMenuBot': 'internal_link_type',
+    'InternalLinkTypeStickerSet': 'internal_link_type',
+    'InternalLinkTypeStory': 'internal_link_type',
+    'InternalLinkTypeTheme': 'internal_link_type',
+    'InternalLinkTypeThemeSettings': 'internal_link_type',
+    'InternalLinkTypeUnknownDeepLink': 'internal_link_type',
+    'InternalLinkTypeUnsupportedProxy': 'internal_link_type',
+    'InternalLinkTypeUserPhoneNumber': 'internal_link_type',
+    'InternalLinkTypeUserToken': 'internal_link_type',
+    'InternalLinkTypeVideoChat': 'internal_link_type',
+    'InternalLinkTypeWebApp': 'internal_link_type',
+    'InviteLinkChatTypeBasicGroup': 'invite_link_chat_type',
+    'InviteLinkChatTypeSupergroup': 'invite_link_chat_type',
+    'InviteLinkChatTypeChannel': 'invite_link_chat_type',
+    'LabeledPricePart': 'labeled_price_part',
+    'JsonValue': 'json_value',
+    'JsonObjectMember': 'json_object_member',
+    'JsonValueNull': 'json_value',
+    'JsonValueBoolean': 'json_value',
+    'JsonValueNumber': 'json_value',
+    'JsonValueString': 'json_value',
+    'JsonValueArray': 'json_value',
+    'JsonValueObject': 'json_value',
+    'KeyboardButtonType': 'keyboard_button_type',
+    'KeyboardButton': 'keyboard_button',
+    'KeyboardButtonTypeText': 'keyboard_button_type',
+    'KeyboardButtonTypeRequestPhoneNumber': 'keyboard_button_type',
+    'KeyboardButtonTypeRequestLocation': 'keyboard_button_type',
+    'KeyboardButtonTypeRequestPoll': 'keyboard_button_type',
+    'KeyboardButtonTypeRequestUsers': 'keyboard_button_type',
+    'KeyboardButtonTypeRequestChat': 'keyboard_button_type',
+    'KeyboardButtonTypeWebApp': 'keyboard_button_type',
+    'LanguagePackInfo': 'language_pack_info',
+    'LanguagePackStringValue': 'language_pack_string_value',
+    'LanguagePackString': 'language_pack_string',
+    'LanguagePackStringValueOrdinary': 'language_pack_string_value',
+    'LanguagePackStringValuePluralized': 'language_pack_string_value',
+    'LanguagePackStringValueDeleted': 'language_pack_string_value',
+    'LanguagePackStrings': 'language_pack_strings',
+    'LocalizationTargetInfo': 'localization_target_info',
+    'LogStream': 'log_stream',
+    'LogStreamDefault': 'log_stream',
+    'LogStreamFile': 'log_stream',
+    'LogStreamEmpty': 'log_stream',
+    'LogTags': 'log_tags',
+    'LogVerbosityLevel': 'log_verbosity_level',
+    'LoginUrlInfo': 'login_url_info',
+    'LoginUrlInfoOpen': 'login_url_info',
+    'LoginUrlInfoRequestConfirmation': 'login_url_info',
+    'MaskPoint': 'mask_point',
+    'MaskPointForehead': 'mask_point',
+    'MaskPointEyes': 'mask_point',
+    'MaskPointMouth': 'mask_point',
+    'MaskPointChin': 'mask_point',
+    'MessageContent': 'message_content',
+    'MessageReplyTo': 'message_reply_to',
+    'MessageSchedulingState': 'message_scheduling_state',
+    'MessageSendingState': 'message_sending_state',
+    'MessageForwardInfo': 'message_forward_info',
+    'MessageImportInfo': 'message_import_info',
+    'MessageInteractionInfo': 'message_interaction_info',
+    'UnreadReaction': 'unread_reaction',
+    'MessageAutoDeleteTime': 'message_auto_delete_time',
+    'MessageCalendarDay': 'message_calendar_day',
+    'MessageCalendar': 'message_calendar',
+    'MessageExtendedMedia': 'message_extended_media',
+    'OrderInfo': 'order_info',
+    'Poll': 'poll',
+    'PremiumGiveawayParameters': 'premium_giveaway_parameters',
+    'VideoNote': 'video_note',
+    'WebPage': 'web_page',
+    'MessageText': 'message_content',
+    'MessageAnimation': 'message_content',
+    'MessageAudio': 'message_content',
+    'MessageDocument': 'message_content',
+    'MessagePhoto': 'message_content',
+    'MessageExpiredPhoto': 'message_content',
+    'MessageSticker': 'message_content',
+    'MessageVideo': 'message_content',
+    'MessageExpiredVideo': 'message_content',
+    'MessageVideoNote': 'message_content',
+    'MessageVoiceNote': 'message_content',
+    'MessageLocation': 'message_content',
+    'MessageVenue': 'message_content',
+    'MessageContact': 'message_content',
+    'MessageAnimatedEmoji': 'message_content',
+    'MessageDice': 'message_content',
+    'MessageGame': 'message_content',
+    'MessagePoll': 'message_content',
+    'MessageStory': 'message_content',
+    'MessageInvoice': 'message_content',
+    'MessageCall': 'message_content',
+    'MessageVideoChatScheduled': 'message_content',
+    'MessageVideoChatStarted': 'message_content',
+    'MessageVideoChatEnded': 'message_content',
+    'MessageInviteVideoChatParticipants': 'message_content',
+    'MessageBasicGroupChatCreate': 'message_content',
+    'MessageSupergroupChatCreate': 'message_content',
+    'MessageChatChangeTitle': 'message_content',
+    'MessageChatChangePhoto': 'message_content',
+    'MessageChatDeletePhoto': 'message_content',
+    'MessageChatAddMembers': 'message_content',
+    'MessageChatJoinByLink': 'message_content',
+    'MessageChatJoinByRequest': 'message_content',
+    'MessageChatDeleteMember': 'message_content',
+    'MessageChatUpgradeTo': 'message_content',
+    'MessageChatUpgradeFrom': 'message_content',
+    'MessagePinMessage': 'message_content',
+    'MessageScreenshotTaken': 'message_content',
+    'MessageChatSetBackground': 'message_content',
+    'MessageChatSetTheme': 'message_content',
+    'MessageChatSetMessageAutoDeleteTime': 'message_content',
+    'MessageForumTopicCreated': 'message_content',
+    'MessageForumTopicEdited': 'message_content',
+    'MessageForumTopicIsClosedToggled': 'message_content',
+    'MessageForumTopicIsHiddenToggled': 'message_content',
+    'MessageSuggestProfilePhoto': 'message_content',
+    'MessageCustomServiceAction': 'message_content',
+    'MessageGameScore': 'message_content',
+    'MessagePaymentSuccessful': 'message_content',
+    'MessagePaymentSuccessfulBot': 'message_content',
+    'MessageGiftedPremium': 'message_content',
+    'MessagePremiumGiftCode': 'message_content',
+    'MessagePremiumGiveawayCreated': 'message_content',
+    'MessagePremiumGiveaway': 'message_content',
+    'MessagePremiumGiveawayCompleted': 'message_content',
+    'MessagePremiumGiveawayWinners': 'message_content',
+    'MessageContactRegistered': 'message_content',
+    'MessageUsersShared': 'message_content',
+    'MessageChatShared': 'message_content',
+    'MessageBotWriteAccessAllowed': 'message_content',
+    'MessageWebAppDataSent': 'message_content',
+    'MessageWebAppDataReceived': 'message_content',
+    'MessagePassportDataSent': 'message_content',
+    'MessagePassportDataReceived': 'message_content',
+    'MessageProximityAlertTriggered': 'message_content',
+    'MessageUnsupported': 'message_content',
+    'MessageExtendedMediaPreview': 'message_extended_media',
+    'MessageExtendedMediaPhoto': 'message_extended_media',
+    'MessageExtendedMediaVideo': 'message_extended_media',
+    'MessageExtendedMediaUnsupported': 'message_extended_media',
+    'MessageFileType': 'message_file_type',
+    'MessageFileTypePrivate': 'message_file_type',
+    'MessageFileTypeGroup': 'message_file_type',
+    'MessageFileTypeUnknown': 'message_file_type',
+    'MessageOrigin': 'message_origin',
+    'MessageReaction': 'message_reaction',
+    'MessageReplyInfo': 'message_reply_info',
+    'MessageLink': 'message_link',
+    'MessageLinkInfo': 'message_link_info',
+    'MessageOriginUser': 'message_origin',
+    'MessageOriginHiddenUser': 'message_origin',
+    'MessageOriginChat': 'message_origin',
+    'MessageOriginChannel': 'message_origin',
+    'MessagePosition': 'message_position',
+    'MessagePositions': 'message_positions',
+    'TextQuote': 'text_quote',
+    'MessageReplyToMessage': 'message_reply_to',
+    'MessageReplyToStory': 'message_reply_to',
+    'MessageSchedulingStateSendAtDate': 'message_scheduling_state',
+    'MessageSchedulingStateSendWhenOnline': 'message_scheduling_state',
+    'MessageSelfDestructTypeTimer': 'message_self_destruct_type',
+    'MessageSelfDestructTypeImmediately': 'message_self_destruct_type',
+    'MessageSendOptions': 'message_send_options',
+    'MessageSenderUser': 'message_sender',
+    'MessageSenderChat': 'message_sender',
+    'MessageSenders': 'message_senders',
+    'MessageSendingStatePending': 'message_sending_state',
+    'MessageSendingStateFailed': 'message_sending_state',
+    'MessageSource': 'message_source',
+    'MessageSourceChatHistory': 'message_source',
+    'MessageSourceMessageThreadHistory': 'message_source',
+    'MessageSourceForumTopicHistory': 'message_source',
+    'MessageSourceHistoryPreview': 'message_source',
+    'MessageSourceChatList': 'message_source',
+    'MessageSourceSearch': 'message_source',
+    'MessageSourceChatEventLog': 'message_source',
+    'MessageSourceNotification': 'message_source',
+    'MessageSourceScreenshot': 'message_source',
+    'MessageSourceOther': 'message_source',
+    'MessageSponsorType': 'message_sponsor_type',
+    'MessageSponsor': 'message_sponsor',
+    'MessageSponsorTypeBot': 'message_sponsor_type',
+    'MessageSponsorTypeWebApp': 'message_sponsor_type',
+    'MessageSponsorTypePublicChannel': 'message_sponsor_type',
+    'MessageSponsorTypePrivateChannel': 'message_sponsor_type',
+    'MessageSponsorTypeWebsite': 'message_sponsor_type',
+    'MessageStatistics': 'message_statistics',
+    'MessageThreadInfo': 'message_thread_info',
+    'MessageViewer': 'message_viewer',
+    'MessageViewers': 'message_viewers',
+    'Messages': 'messages',
+    'NetworkStatisticsEntry': 'network_statistics_entry',
+    'NetworkStatistics': 'network_statistics',
+    'NetworkType': 'network_type',
+    'NetworkStatisticsEntryFile': 'network_statistics_entry',
+    'NetworkStatisticsEntryCall': 'network_statistics_entry',
+    'NetworkTypeNone': 'network_type',
+    'NetworkTypeMobile': 'network_type',
+    'NetworkTypeMobileRoaming': 'network_type',
+    'NetworkTypeWiFi': 'network_type',
+    'NetworkTypeOther': 'network_type',
+    'NotificationType': 'notification_type',
+    'Notification': 'notification',
+    'NotificationGroupType': 'notification_group_type',
+    'NotificationGroup': 'notification_group',
+    'NotificationGroupTypeMessages': 'notification_group_type',
+    'NotificationGroupTypeMentions': 'notification_group_type',
+    'NotificationGroupTypeSecretChat': 'notification_group_type',
+    'NotificationGroupTypeCalls': 'notification_group_type',
+    'NotificationSettingsScope': 'notification_settings_scope',
+    'NotificationSettingsScopePrivateChats': 'notification_settings_scope',
+    'NotificationSettingsScopeGroupChats': 'notification_settings_scope',
+    'NotificationSettingsScopeChannelChats': 'notification_settings_scope',
+    'NotificationSound': 'notification_sound',
+    'NotificationSounds': 'notification_sounds',
+    'PushMessageContent': 'push_message_content',
+    'NotificationTypeNewMessage': 'notification_type',
+    'NotificationTypeNewSecretChat': 'notification_type',
+    'NotificationTypeNewCall': 'notification_type',
+    'NotificationTypeNewPushMessage': 'notification_type',
+    'Ok': 'ok',
+    'OptionValue': 'option_value',
+    'OptionValueBoolean': 'option_value',
+    'OptionValueEmpty': 'option_value',
+    'OptionValueInteger': 'option_value',
+    'OptionValueString': 'option_value',
+    'PageBlock': 'page_block',
+    'RichText': 'rich_text',
+    'PageBlockCaption': 'page_block_caption',
+    'PageBlockListItem': 'page_block_list_item',
+    'PageBlockRelatedArticle': 'page_block_related_article',
+    'PageBlockTableCell': 'page_block_table_cell',
+    'PageBlockTitle': 'page_block',
+    'PageBlockSubtitle': 'page_block',
+    'PageBlockAuthorDate': 'page_block',
+    'PageBlockHeader': 'page_block',
+    'PageBlockSubheader': 'page_block',
+    'PageBlockKicker': 'page_block',
+    'PageBlockParagraph': 'page_block',
+    'PageBlockPreformatted': 'page_block',
+    'PageBlockFooter': 'page_block',
+    'PageBlockDivider': 'page_block',
+    'PageBlockAnchor': 'page_block',
+    'PageBlockList': 'page_block',
+    'PageBlockBlockQuote': 'page_block',
+    'PageBlockPullQuote': 'page_block',
+    'PageBlockAnimation': 'page_block',
+    'PageBlockAudio': 'page_block',
+    'PageBlockPhoto': 'page_block',
+    'PageBlockVideo': 'page_block',
+    'PageBlockVoiceNote': 'page_block',
+    'PageBlockCover': 'page_block',
+    'PageBlockEmbedded': 'page_block',
+    'PageBlockEmbeddedPost': 'page_block',
+    'PageBlockCollage': 'page_block',
+    'PageBlockSlideshow': 'page_block',
+    'PageBlockChatLink': 'page_block',
+    'PageBlockTable': 'page_block',
+    'PageBlockDetails': 'page_block',
+    'PageBlockRelatedArticles': 'page_block',
+    'PageBlockMap': 'page_block',
+    'PageBlockHorizontalAlignment': 'page_block_horizontal_alignment',
+    'PageBlockHorizontalAlignmentLeft': 'page_block_horizontal_alignment',
+    'PageBlockHorizontalAlignmentCenter': 'page_block_horizontal_alignment',
+    'PageBlockHorizontalAlignmentRight': 'page_block_horizontal_alignment',
+    'PageBlockVerticalAlignment': 'page_block_vertical_alignment',
+    'PageBlockVerticalAlignmentTop': 'page_block_vertical_alignment',
+    'PageBlockVerticalAlignmentMiddle': 'page_block_vertical_alignment',
+    'PageBlockVerticalAlignmentBottom': 'page_block_vertical_alignment',
+    'PassportRequiredElement': 'passport_required_element',
+    'PassportAuthorizationForm': 'passport_authorization_form',
+    'PersonalDocument': 'personal_document',
+    'PassportElement': 'passport_element',
+    'PassportElementPersonalDetails': 'passport_element',
+    'PassportElementPassport': 'passport_element',
+    'PassportElementDriverLicense': 'passport_element',
+    'PassportElementIdentityCard': 'passport_element',
+    'PassportElementInternalPassport': 'passport_element',
+    'PassportElementAddress': 'passport_element',
+    'PassportElementUtilityBill': 'passport_element',
+    'PassportElementBankStatement': 'passport_element',
+    'PassportElementRentalAgreement': 'passport_element',
+    'PassportElementPassportRegistration': 'passport_element',
+    'PassportElementTemporaryRegistration': 'passport_element',
+    'PassportElementPhoneNumber': 'passport_element',
+    'PassportElementEmailAddress': 'passport_element',
+    'PassportElementErrorSource': 'passport_element_error_source',
+    'PassportElementError': 'passport_element_error',
+    'PassportElementErrorSourceUnspecified': 'passport_element_error_source',
+    'PassportElementErrorSourceDataField': 'passport_element_error_source',
+    'PassportElementErrorSourceFrontSide': 'passport_element_error_source',
+    'PassportElementErrorSourceReverseSide': 'passport_element_error_source',
+    'PassportElementErrorSourceSelfie': 'passport_element_error_source',
+    'PassportElementErrorSourceTranslationFile': 'passport_element_error_source',
+    'PassportElementErrorSourceTranslationFiles': 'passport_element_error_source',
+    'PassportElementErrorSourceFile': 'passport_element_error_source',
+    'PassportElementErrorSourceFiles': 'passport_element_error_source',
+    'PassportElementTypePersonalDetails': 'passport_element_type',
+    'PassportElementTypePassport': 'passport_element_type',
+    'PassportElementTypeDriverLicense': 'passport_element_type',
+    'PassportElementTypeIdentityCard': 'passport_element_type',
+    'PassportElementTypeInternalPassport': 'passport_element_type',
+    'PassportElementTypeAddress': 'passport_element_type',
+    'PassportElementTypeUtilityBill': 'passport_element_type',
+    'PassportElementTypeBankStatement': 'passport_element_type',
+    'PassportElementTypeRentalAgreement': 'passport_element_type',
+    'PassportElementTypePassportRegistration': 'passport_element_type',
+    'PassportElementTypeTemporaryRegistration': 'passport_element_type',
+    'PassportElementTypePhoneNumber': 'passport_element_type',
+    'PassportElementTypeEmailAddress': 'passport_element_type',
+    'PassportElements': 'passport_elements',
+    'PassportElementsWithErrors': 'passport_elements_with_errors',
+    'PassportSuitableElement': 'passport_suitable_element',
+    'PasswordState': 'password_state',
+    'PaymentProvider': 'payment_provider',
+    'PaymentOption': 'payment_option',
+    'SavedCredentials': 'saved_credentials',
+    'PaymentForm': 'payment_form',
+    'PaymentProviderSmartGlocal': 'payment_provider',
+    'PaymentProviderStripe': 'payment_provider',
+    'PaymentProviderOther': 'payment_provider',
+    'ShippingOption': 'shipping_option',
+    'PaymentReceipt': 'payment_receipt',
+    'PaymentResult': 'payment_result',
+    'PhoneNumberAuthenticationSettings': 'phone_number_authentication_settings',
+    'PhoneNumberInfo': 'phone_number_info',
+    'Point': 'point',
+    'PollOption': 'poll_option',
+    'PollTypeRegular': 'poll_type',
+    'PollTypeQuiz': 'poll_type',
+    'PremiumFeature': 'premium_feature',
+    'PremiumFeatureIncreasedLimits': 'premium_feature',
+    'PremiumFeatureIncreasedUploadFileSize': 'premium_feature',
+    'PremiumFeatureImprovedDownloadSpeed': 'premium_feature',
+    'PremiumFeatureVoiceRecognition': 'premium_feature',
+    'PremiumFeatureDisabledAds': 'premium_feature',
+    'PremiumFeatureUniqueReactions': 'premium_feature',
+    'PremiumFeatureUniqueStickers': 'premium_feature',
+    'PremiumFeatureCustomEmoji': 'premium_feature',
+    'PremiumFeatureAdvancedChatManagement': 'premium_feature',
+    'PremiumFeatureProfileBadge': 'premium_feature',
+    'PremiumFeatureEmojiStatus': 'premium_feature',
+    'PremiumFeatureAnimatedProfilePhoto': 'premium_feature',
+    'PremiumFeatureForumTopicIcon': 'premium_feature',
+    'PremiumFeatureAppIcons': 'premium_feature',
+    'PremiumFeatureRealTimeChatTranslation': 'premium_feature',
+    'PremiumFeatureUpgradedStories': 'premium_feature',
+    'PremiumFeatureChatBoost': 'premium_feature',
+    'PremiumFeatureAccentColor': 'premium_feature',
+    'PremiumFeatureBackgroundForBoth': 'premium_feature',
+    'PremiumFeaturePromotionAnimation': 'premium_feature_promotion_animation',
+    'PremiumLimit': 'premium_limit',
+    'PremiumFeatures': 'premium_features',
+    'PremiumGiftCodeInfo': 'premium_gift_code_info',
+    'PremiumGiftCodePaymentOption': 'premium_gift_code_payment_option',
+    'PremiumGiftCodePaymentOptions': 'premium_gift_code_payment_options',
+    'PremiumGiveawayParticipantStatus': 'premium_giveaway_participant_status',
+    'PremiumGiveawayInfo': 'premium_giveaway_info',
+    'PremiumGiveawayInfoOngoing': 'premium_giveaway_info',
+    'PremiumGiveawayInfoCompleted': 'premium_giveaway_info',
+    'PremiumGiveawayParticipantStatusEligible': 'premium_giveaway_participant_status',
+    'PremiumGiveawayParticipantStatusParticipating': 'premium_giveaway_participant_status',
+    'PremiumGiveawayParticipantStatusAlreadyWasMember': 'premium_giveaway_participant_status',
+    'PremiumGiveawayParticipantStatusAdministrator': 'premium_giveaway_participant_status',
+    'PremiumGiveawayParticipantStatusDisallowedCountry': 'premium_giveaway_participant_status',
+    'PremiumLimitType': 'premium_limit_type',
+    'PremiumLimitTypeSupergroupCount': 'premium_limit_type',
+    'PremiumLimitTypePinnedChatCount': 'premium_limit_type',
+    'PremiumLimitTypeCreatedPublicChatCount': 'premium_limit_type',
+    'PremiumLimitTypeSavedAnimationCount': 'premium_limit_type',
+    'PremiumLimitTypeFavoriteStickerCount': 'premium_limit_type',
+    'PremiumLimitTypeChatFolderCount': 'premium_limit_type',
+    'PremiumLimitTypeChatFolderChosenChatCount': 'premium_limit_type',
+    'PremiumLimitTypePinnedArchivedChatCount': 'premium_limit_type',
+    'PremiumLimitTypeCaptionLength': 'premium_limit_type',
+    'PremiumLimitTypeBioLength': 'premium_limit_type',
+    'PremiumLimitTypeChatFolderInviteLinkCount': 'premium_limit_type',
+    'PremiumLimitTypeShareableChatFolderCount': 'premium_limit_type',
+    'PremiumLimitTypeActiveStoryCount': 'premium_limit_type',
+    'PremiumLimitTypeWeeklySentStoryCount': 'premium_limit_type',
+    'PremiumLimitTypeMonthlySentStoryCount': 'premium_limit_type',
+    'PremiumLimitTypeStoryCaptionLength': 'premium_limit_type',
+    'PremiumLimitTypeStorySuggestedReactionAreaCount': 'premium_limit_type',
+    'PremiumLimitTypeSimilarChatCount': 'premium_limit_type',
+    'PremiumPaymentOption': 'premium_payment_option',
+    'PremiumStoryFeature': 'premium_story_feature',
+    'PremiumSource': 'premium_source',
+    'PremiumSourceLimitExceeded': 'premium_source',
+    'PremiumSourceFeature': 'premium_source',
+    'PremiumSourceStoryFeature': 'premium_source',
+    'PremiumSourceLink': 'premium_source',
+    'PremiumSourceSettings': 'premium_source',
+    'PremiumStatePaymentOption': 'premium_state_payment_option',
+    'PremiumState': 'premium_state',
+    'PremiumStoryFeaturePriorityOrder': 'premium_story_feature',
+    'PremiumStoryFeatureStealthMode': 'premium_story_feature',
+    'PremiumStoryFeaturePermanentViewsHistory': 'premium_story_feature',
+    'PremiumStoryFeatureCustomExpirationDuration': 'premium_story_feature',
+    'PremiumStoryFeatureSaveStories': 'premium_story_feature',
+    'PremiumStoryFeatureLinksAndFormatting': 'premium_story_feature',
+    'ProfileAccentColors': 'profile_accent_colors',
+    'ProfileAccentColor': 'profile_accent_color',
+    'ProfilePhoto': 'profile_photo',
+    'Proxy': 'proxy',
+    'Proxies': 'proxies',
+    'ProxyTypeSocks5': 'proxy_type',
+    'ProxyTypeHttp': 'proxy_type',
+    'ProxyTypeMtproto': 'proxy_type',
+    'PublicChatType': 'public_chat_type',
+    'PublicChatTypeHasUsername': 'public_chat_type',
+    'PublicChatTypeIsLocationBased': 'public_chat_type',
+    'Story': 'story',
+    'PublicForward': 'public_forward',
+    'PublicForwardMessage': 'public_forward',
+    'PublicForwardStory': 'public_forward',
+    'PublicForwards': 'public_forwards',
+    'PushMessageContentHidden': 'push_message_content',
+    'PushMessageContentAnimation': 'push_message_content',
+    'PushMessageContentAudio': 'push_message_content',
+    'PushMessageContentContact': 'push_message_content',
+    'PushMessageContentContactRegistered': 'push_message_content',
+    'PushMessageContentDocument': 'push_message_content',
+    'PushMessageContentGame': 'push_message_content',
+    'PushMessageContentGameScore': 'push_message_content',
+    'PushMessageContentInvoice': 'push_message_content',
+    'PushMessageContentLocation': 'push_message_content',
+    'PushMessageContentPhoto': 'push_message_content',
+    'PushMessageContentPoll': 'push_message_content',
+    'PushMessageContentPremiumGiftCode': 'push_message_content',
+    'PushMessageContentPremiumGiveaway': 'push_message_content',
+    'PushMessageContentScreenshotTaken': 'push_message_content',
+    'PushMessageContentSticker': 'push_message_content',
+    'PushMessageContentStory': 'push_message_content',
+    'PushMessageContentText': 'push_message_content',
+    'PushMessageContentVideo': 'push_message_content',
+    'PushMessageContentVideoNote': 'push_message_content',
+    'PushMessageContentVoiceNote': 'push_message_content',
+    'PushMessageContentBasicGroupChatCreate': 'push_message_content',
+    'PushMessageContentChatAddMembers': 'push_message_content',
+    'PushMessageContentChatChangePhoto': 'push_message_content',
+    'PushMessageContentChatChangeTitle': 'push_message_content',
+    'PushMessageContentChatSetBackground': 'push_message_content',
+    'PushMessageContentChatSetTheme': 'push_message_content',
+    'PushMessageContentChatDeleteMember': 'push_message_content',
+    'PushMessageContentChatJoinByLink': 'push_message_content',
+    'PushMessageContentChatJoinByRequest': 'push_message_content',
+    'PushMessageContentRecurringPayment': 'push_message_content',
+    'PushMessageContentSuggestProfilePhoto': 'push_message_content',
+    'PushMessageContentMessageForwards': 'push_message_content',
+    'PushMessageContentMediaAlbum': 'push_message_content',
+    'PushReceiverId': 'push_receiver_id',
+    'ReactionTypeEmoji': 'reaction_type',
+    'ReactionTypeCustomEmoji': 'reaction_type',
+    'RecommendedChatFolder': 'recommended_chat_folder',
+    'RecommendedChatFolders': 'recommended_chat_folders',
+    'RecoveryEmailAddress': 'recovery_email_address',
+    'ReplyMarkupRemoveKeyboard': 'reply_markup',
+    'ReplyMarkupForceReply': 'reply_markup',
+    'ReplyMarkupShowKeyboard': 'reply_markup',
+    'ReplyMarkupInlineKeyboard': 'reply_markup',
+    'ReportReason': 'report_reason',
+    'ReportReasonSpam': 'report_reason',
+    'ReportReasonViolence': 'report_reason',
+    'ReportReasonPornography': 'report_reason',
+    'ReportReasonChildAbuse': 'report_reason',
+    'ReportReasonCopyright': 'report_reason',
+    'ReportReasonUnrelatedLocation': 'report_reason',
+    'ReportReasonFake': 'report_reason',
+    'ReportReasonIllegalDrugs': 'report_reason',
+    'ReportReasonPersonalDetails': 'report_reason',
+    'ReportReasonCustom': 'report_reason',
+    'ResetPasswordResult': 'reset_password_result',
+    'ResetPasswordResultOk': 'reset_password_result',
+    'ResetPasswordResultPending': 'reset_password_result',
+    'ResetPasswordResultDeclined': 'reset_password_result',
+    'RichTextPlain': 'rich_text',
+    'RichTextBold': 'rich_text',
+    'RichTextItalic': 'rich_text',
+    'RichTextUnderline': 'rich_text',
+    'RichTextStrikethrough': 'rich_text',
+    'RichTextFixed': 'rich_text',
+    'RichTextUrl': 'rich_text',
+    'RichTextEmailAddress': 'rich_text',
+    'RichTextSubscript': 'rich_text',
+    'RichTextSuperscript': 'rich_text',
+    'RichTextMarked': 'rich_text',
+    'RichTextPhoneNumber': 'rich_text',
+    'RichTextIcon': 'rich_text',
+    'RichTextReference': 'rich_text',
+    'RichTextAnchor': 'rich_text',
+    'RichTextAnchorLink': 'rich_text',
+    'RichTexts': 'rich_text',
+    'RtmpUrl': 'rtmp_url',
+    'ScopeNotificationSettings': 'scope_notification_settings',
+    'SearchMessagesFilter': 'search_messages_filter',
+    'SearchMessagesFilterEmpty': 'search_messages_filter',
+    'SearchMessagesFilterAnimation': 'search_messages_filter',
+    'SearchMessagesFilterAudio': 'search_messages_filter',
+    'SearchMessagesFilterDocument': 'search_messages_filter',
+    'SearchMessagesFilterPhoto': 'search_messages_filter',
+    'SearchMessagesFilterVideo': 'search_messages_filter',
+    'SearchMessagesFilterVoiceNote': 'search_messages_filter',
+    'SearchMessagesFilterPhotoAndVideo': 'search_messages_filter',
+    'SearchMessagesFilterUrl': 'search_messages_filter',
+    'SearchMessagesFilterChatPhoto': 'search_messages_filter',
+    'SearchMessagesFilterVideoNote': 'search_messages_filter',
+    'SearchMessagesFilterVoiceAndVideoNote': 'search_messages_filter',
+    'SearchMessagesFilterMention': 'search_messages_filter',
+    'SearchMessagesFilterUnreadMention': 'search_messages_filter',
+    'SearchMessagesFilterUnreadReaction': 'search_messages_filter',
+    'SearchMessagesFilterFailedToSend': 'search_messages_filter',
+    'SearchMessagesFilterPinned': 'search_messages_filter',
+    'Seconds': 'seconds',
+    'SecretChatState': 'secret_chat_state',
+    'SecretChat': 'secret_chat',
+    'SecretChatStatePending': 'secret_chat_state',
+    'SecretChatStateReady': 'secret_chat_state',
+    'SecretChatStateClosed': 'secret_chat_state',
+    'SentWebAppMessage': 'sent_web_app_message',
+    'SessionType': 'session_type',
+    'Session': 'session',
+    'SessionTypeAndroid': 'session_type',
+    'SessionTypeApple': 'session_type',
+    'SessionTypeBrave': 'session_type',
+    'SessionTypeChrome': 'session_type',
+    'SessionTypeEdge': 'session_type',
+    'SessionTypeFirefox': 'session_type',
+    'SessionTypeIpad': 'session_type',
+    'SessionTypeIphone': 'session_type',
+    'SessionTypeLinux': 'session_type',
+    'SessionTypeMac': 'session_type',
+    'SessionTypeOpera': 'session_type',
+    'SessionTypeSafari': 'session_type',
+    'SessionTypeUbuntu': 'session_type',
+    'SessionTypeUnknown': 'session_type',
+    'SessionTypeVivaldi': 'session_type',
+    'SessionTypeWindows': 'session_type',
+    'SessionTypeXbox': 'session_type',
+    'Sessions': 'sessions',
+    'SpeechRecognitionResult': 'speech_recognition_result',
+    'SpeechRecognitionResultPending': 'speech_recognition_result',
+    'SpeechRecognitionResultText': 'speech_recognition_result',
+    'SpeechRecognitionResultError': 'speech_recognition_result',
+    'SponsoredMessage': 'sponsored_message',
+    'SponsoredMessages': 'sponsored_messages',
+    'StatisticalGraphData': 'statistical_graph',
+    'StatisticalGraphAsync': 'statistical_graph',
+    'StatisticalGraphError': 'statistical_graph',
+    'StickerFormat': 'sticker_format',
+    'StickerFullType': 'sticker_full_type',
+    'StickerFormatWebp': 'sticker_format',
+    'StickerFormatTgs': 'sticker_format',
+    'StickerFormatWebm': 'sticker_format',
+    'StickerFullTypeRegular': 'sticker_full_type',
+    'StickerFullTypeMask': 'sticker_full_type',
+    'StickerFullTypeCustomEmoji': 'sticker_full_type',
+    'StickerType': 'sticker_type',
+    'StickerSet': 'sticker_set',
+    'StickerSetInfo': 'sticker_set_info',
+    'StickerSets': 'sticker_sets',
+    'StickerTypeRegular': 'sticker_type',
+    'StickerTypeMask': 'sticker_type',
+    'StickerTypeCustomEmoji': 'sticker_type',
+    'Stickers': 'stickers',
+    'StorageStatisticsByChat': 'storage_statistics_by_chat',
+    'StorageStatistics': 'storage_statistics',
+    'StorageStatisticsByFileType': 'storage_statistics_by_file_type',
+    'StorageStatisticsFast': 'storage_statistics_fast',
+    'StorePaymentPurpose': 'store_payment_purpose',
+    'StorePaymentPurposePremiumSubscription': 'store_payment_purpose',
+    'StorePaymentPurposeGiftedPremium': 'store_payment_purpose',
+    'StorePaymentPurposePremiumGiftCodes': 'store_payment_purpose',
+    'StorePaymentPurposePremiumGiveaway': 'store_payment_purpose',
+    'Stories': 'stories',
+    'StoryContent': 'story_content',
+    'StoryPrivacySettings': 'story_privacy_settings',
+    'StoryArea': 'story_area',
+    'StoryInteractionInfo': 'story_interaction_info',
+    'StoryRepostInfo': 'story_repost_info',
+    'StoryAreaType': 'story_area_type',
+    'StoryAreaTypeLocation': 'story_area_type',
+    'StoryAreaTypeVenue': 'story_area_type',
+    'StoryAreaTypeSuggestedReaction': 'story_area_type',
+    'StoryAreaTypeMessage': 'story_area_type',
+    'StoryVideo': 'story_video',
+    'StoryContentPhoto': 'story_content',
+    'StoryContentVideo': 'story_content',
+    'StoryContentUnsupported': 'story_content',
+    'StoryFullId': 'story_full_id',
+    'StoryInteractionType': 'story_interaction_type',
+    'StoryInteraction': 'story_interaction',
+    'StoryInteractionTypeView': 'story_interaction_type',
+    'StoryInteractionTypeForward': 'story_interaction_type',
+    'StoryInteractionTypeRepost': 'story_interaction_type',
+    'StoryInteractions': 'story_interactions',
+    'StoryListMain': 'story_list',
+    'StoryListArchive': 'story_list',
+    'StoryOrigin': 'story_origin',
+    'StoryOriginPublicStory': 'story_origin',
+    'StoryOriginHiddenUser': 'story_origin',
+    'StoryPrivacySettingsEveryone': 'story_privacy_settings',
+    'StoryPrivacySettingsContacts': 'story_privacy_settings',
+    'StoryPrivacySettingsCloseFriends': 'story_privacy_settings',
+    'StoryPrivacySettingsSelectedUsers': 'story_privacy_settings',
+    'StoryStatistics': 'story_statistics',
+    'SuggestedAction': 'suggested_action',
+    'SuggestedActionEnableArchiveAndMuteNewChats': 'suggested_action',
+    'SuggestedActionCheckPassword': 'suggested_action',
+    'SuggestedActionCheckPhoneNumber': 'suggested_action',
+    'SuggestedActionViewChecksHint': 'suggested_action',
+    'SuggestedActionConvertToBroadcastGroup': 'suggested_action',
+    'SuggestedActionSetPassword': 'suggested_action',
+    'SuggestedActionUpgradePremium': 'suggested_action',
+    'SuggestedActionRestorePremium': 'suggested_action',
+    'SuggestedActionSubscribeToAnnualPremium': 'suggested_action',
+    'SuggestedActionGiftPremiumForChristmas': 'suggested_action',
+    'Usernames': 'usernames',
+    'Supergroup': 'supergroup',
+    'SupergroupFullInfo': 'supergroup_full_info',
+    'SupergroupMembersFilter': 'supergroup_members_filter',
+    'SupergroupMembersFilterRecent': 'supergroup_members_filter',
+    'SupergroupMembersFilterContacts': 'supergroup_members_filter',
+    'SupergroupMembersFilterAdministrators': 'supergroup_members_filter',
+    'SupergroupMembersFilterSearch': 'supergroup_members_filter',
+    'SupergroupMembersFilterRestricted': 'supergroup_members_filter',
+    'SupergroupMembersFilterBanned': 'supergroup_members_filter',
+    'SupergroupMembersFilterMention': 'supergroup_members_filter',
+    'SupergroupMembersFilterBots': 'supergroup_members_filter',
+    'TMeUrlType': 't_me_url_type',
+    'TMeUrl': 't_me_url',
+    'TMeUrlTypeUser': 't_me_url_type',
+    'TMeUrlTypeSupergroup': 't_me_url_type',
+    'TMeUrlTypeChatInvite': 't_me_url_type',
+    'TMeUrlTypeStickerSet': 't_me_url_type',
+    'TMeUrls': 't_me_urls',
+    'TargetChatCurrent': 'target_chat',
+    'TargetChatChosen': 'target_chat',
+    'TargetChatInternalLink': 'target_chat',
+    'TelegramPaymentPurposePremiumGiftCodes': 'telegram_payment_purpose',
+    'TelegramPaymentPurposePremiumGiveaway': 'telegram_payment_purpose',
+    'TemporaryPasswordState': 'temporary_password_state',
+    'TestBytes': 'test_bytes',
+    'TestInt': 'test_int',
+    'TestString': 'test_string',
+    'TestVectorInt': 'test_vector_int',
+    'TestVectorIntObject': 'test_vector_int_object',
+    'TestVectorString': 'test_vector_string',
+    'TestVectorStringObject': 'test_vector_string_object',
+    'Text': 'text',
+    'TextEntities': 'text_entities',
+    'TextEntityType': 'text_entity_type',
+    'TextEntityTypeMention': 'text_entity_type',
+    'TextEntityTypeHashtag': 'text_entity_type',
+    'TextEntityTypeCashtag': 'text_entity_type',
+    'TextEntityTypeBotCommand': 'text_entity_type',
+    'TextEntityTypeUrl': 'text_entity_type',
+    'TextEntityTypeEmailAddress': 'text_entity_type',
+    'TextEntityTypePhoneNumber': 'text_entity_type',
+    'TextEntityTypeBankCardNumber': 'text_entity_type',
+    'TextEntityTypeBold': 'text_entity_type',
+    'TextEntityTypeItalic': 'text_entity_type',
+    'TextEntityTypeUnderline': 'text_entity_type',
+    'TextEntityTypeStrikethrough': 'text_entity_type',
+    'TextEntityTypeSpoiler': 'text_entity_type',
+    'TextEntityTypeCode': 'text_entity_type',
+    'TextEntityTypePre': 'text_entity_type',
+    'TextEntityTypePreCode': 'text_entity_type',
+    'TextEntityTypeBlockQuote': 'text_entity_type',
+    'TextEntityTypeTextUrl': 'text_entity_type',
+    'TextEntityTypeMentionName': 'text_entity_type',
+    'TextEntityTypeCustomEmoji': 'text_entity_type',
+    'TextEntityTypeMediaTimestamp': 'text_entity_type',
+    'TextParseMode': 'text_parse_mode',
+    'TextParseModeMarkdown': 'text_parse_mode',
+    'TextParseModeHTML': 'text_parse_mode',
+    'ThemeParameters': 'theme_parameters',
+    'ThumbnailFormat': 'thumbnail_format',
+    'ThumbnailFormatJpeg': 'thumbnail_format',
+    'ThumbnailFormatGif': 'thumbnail_format',
+    'ThumbnailFormatMpeg4': 'thumbnail_format',
+    'ThumbnailFormatPng': 'thumbnail_format',
+    'ThumbnailFormatTgs': 'thumbnail_format',
+    'ThumbnailFormatWebm': 'thumbnail_format',
+    'ThumbnailFormatWebp': 'thumbnail_format',
+    'TopChatCategory': 'top_chat_category',
+    'TopChatCategoryUsers': 'top_chat_category',
+    'TopChatCategoryBots': 'top_chat_category',
+    'TopChatCategoryGroups': 'top_chat_category',
+    'TopChatCategoryChannels': 'top_chat_category',
+    'TopChatCategoryInlineBots': 'top_chat_category',
+    'TopChatCategoryCalls': 'top_chat_category',
+    'TopChatCategoryForwardChats': 'top_chat_category',
+    'TrendingStickerSets': 'trending_sticker_sets',
+    'UnconfirmedSession': 'unconfirmed_session',
+    'UserPrivacySetting': 'user_privacy_setting',
+    'UserStatus': 'user_status',
+    'User': 'user',
+    'UserFullInfo': 'user_full_info',
+    'UserPrivacySettingRules': 'user_privacy_setting_rules',
+    'Update': 'update',
+    'UpdateAuthorizationState': 'update',
+    'UpdateNewMessage': 'update',
+    'UpdateMessageSendAcknowledged': 'update',
+    'UpdateMessageSendSucceeded': 'update',
+    'UpdateMessageSendFailed': 'update',
+    'UpdateMessageContent': 'update',
+    'UpdateMessageEdited': 'update',
+    'UpdateMessageIsPinned': 'update',
+    'UpdateMessageInteractionInfo': 'update',
+    'UpdateMessageContentOpened': 'update',
+    'UpdateMessageMentionRead': 'update',
+    'UpdateMessageUnreadReactions': 'update',
+    'UpdateMessageLiveLocationViewed': 'update',
+    'UpdateNewChat': 'update',
+    'UpdateChatTitle': 'update',
+    'UpdateChatPhoto': 'update',
+    'UpdateChatAccentColors': 'update',
+    'UpdateChatPermissions': 'update',
+    'UpdateChatLastMessage': 'update',
+    'UpdateChatPosition': 'update',
+    'UpdateChatReadInbox': 'update',
+    'UpdateChatReadOutbox': 'update',
+    'UpdateChatActionBar': 'update',
+    'UpdateChatAvailableReactions': 'update',
+    'UpdateChatDraftMessage': 'update',
+    'UpdateChatEmojiStatus': 'update',
+    'UpdateChatMessageSender': 'update',
+    'UpdateChatMessageAutoDeleteTime': 'update',
+    'UpdateChatNotificationSettings': 'update',
+    'UpdateChatPendingJoinRequests': 'update',
+    'UpdateChatReplyMarkup': 'update',
+    'UpdateChatBackground': 'update',
+    'UpdateChatTheme': 'update',
+    'UpdateChatUnreadMentionCount': 'update',
+    'UpdateChatUnreadReactionCount': 'update',
+    'UpdateChatVideoChat': 'update',
+    'UpdateChatDefaultDisableNotification': 'update',
+    'UpdateChatHasProtectedContent': 'update',
+    'UpdateChatIsTranslatable': 'update',
+    'UpdateChatIsMarkedAsUnread': 'update',
+    'UpdateChatViewAsTopics': 'update',
+    'UpdateChatBlockList': 'update',
+    'UpdateChatHasScheduledMessages': 'update',
+    'UpdateChatFolders': 'update',
+    'UpdateChatOnlineMemberCount': 'update',
+    'UpdateForumTopicInfo': 'update',
+    'UpdateScopeNotificationSettings': 'update',
+    'UpdateNotification': 'update',
+    'UpdateNotificationGroup': 'update',
+    'UpdateActiveNotifications': 'update',
+    'UpdateHavePendingNotifications': 'update',
+    'UpdateDeleteMessages': 'update',
+    'UpdateChatAction': 'update',
+    'UpdateUserStatus': 'update',
+    'UpdateUser': 'update',
+    'UpdateBasicGroup': 'update',
+    'UpdateSupergroup': 'update',
+    'UpdateSecretChat': 'update',
+    'UpdateUserFullInfo': 'update',
+    'UpdateBasicGroupFullInfo': 'update',
+    'UpdateSupergroupFullInfo': 'update',
+    'UpdateServiceNotification': 'update',
+    'UpdateFile': 'update',
+    'UpdateFileGenerationStart': 'update',
+    'UpdateFileGenerationStop': 'update',
+    'UpdateFileDownloads': 'update',
+    'UpdateFileAddedToDownloads': 'update',
+    'UpdateFileDownload': 'update',
+    'UpdateFileRemovedFromDownloads': 'update',
+    'UpdateCall': 'update',
+    'UpdateGroupCall': 'update',
+    'UpdateGroupCallParticipant': 'update',
+    'UpdateNewCallSignalingData': 'update',
+    'UpdateUserPrivacySettingRules': 'update',
+    'UpdateUnreadMessageCount': 'update',
+    'UpdateUnreadChatCount': 'update',
+    'UpdateStory': 'update',
+    'UpdateStoryDeleted': 'update',
+    'UpdateStorySendSucceeded': 'update',
+    'UpdateStorySendFailed': 'update',
+    'UpdateChatActiveStories': 'update',
+    'UpdateStoryListChatCount': 'update',
+    'UpdateStoryStealthMode': 'update',
+    'UpdateOption': 'update',
+    'UpdateStickerSet': 'update',
+    'UpdateInstalledStickerSets': 'update',
+    'UpdateTrendingStickerSets': 'update',
+    'UpdateRecentStickers': 'update',
+    'UpdateFavoriteStickers': 'update',
+    'UpdateSavedAnimations': 'update',
+    'UpdateSavedNotificationSounds': 'update',
+    'UpdateDefaultBackground': 'update',
+    'UpdateChatThemes': 'update',
+    'UpdateAccentColors': 'update',
+    'UpdateProfileAccentColors': 'update',
+    'UpdateLanguagePackStrings': 'update',
+    'UpdateConnectionState': 'update',
+    'UpdateTermsOfService': 'update',
+    'UpdateUsersNearby': 'update',
+    'UpdateUnconfirmedSession': 'update',
+    'UpdateAttachmentMenuBots': 'update',
+    'UpdateWebAppMessageSent': 'update',
+    'UpdateActiveEmojiReactions': 'update',
+    'UpdateDefaultReactionType': 'update',
+    'UpdateSpeechRecognitionTrial': 'update',
+    'UpdateDiceEmojis': 'update',
+    'UpdateAnimatedEmojiMessageClicked': 'update',
+    'UpdateAnimationSearchParameters': 'update',
+    'UpdateSuggestedActions': 'update',
+    'UpdateAddChatMembersPrivacyForbidden': 'update',
+    'UpdateAutosaveSettings': 'update',
+    'UpdateNewInlineQuery': 'update',
+    'UpdateNewChosenInlineResult': 'update',
+    'UpdateNewCallbackQuery': 'update',
+    'UpdateNewInlineCallbackQuery': 'update',
+    'UpdateNewShippingQuery': 'update',
+    'UpdateNewPreCheckoutQuery': 'update',
+    'UpdateNewCustomEvent': 'update',
+    'UpdateNewCustomQuery': 'update',
+    'UpdatePoll': 'update',
+    'UpdatePollAnswer': 'update',
+    'UpdateChatMember': 'update',
+    'UpdateNewChatJoinRequest': 'update',
+    'UpdateChatBoost': 'update',
+    'UpdateMessageReaction': 'update',
+    'UpdateMessageReactions': 'update',
+    'Updates': 'updates',
+    'UserType': 'user_type',
+    'UserLink': 'user_link',
+    'UserPrivacySettingShowStatus': 'user_privacy_setting',
+    'UserPrivacySettingShowProfilePhoto': 'user_privacy_setting',
+    'UserPrivacySettingShowLinkInForwardedMessages': 'user_privacy_setting',
+    'UserPrivacySettingShowPhoneNumber': 'user_privacy_setting',
+    'UserPrivacySettingShowBio': 'user_privacy_setting',
+    'UserPrivacySettingAllowChatInvites': 'user_privacy_setting',
+    'UserPrivacySettingAllowCalls': 'user_privacy_setting',
+    'UserPrivacySettingAllowPeerToPeerCalls': 'user_privacy_setting',
+    'UserPrivacySettingAllowFindingByPhoneNumber': 'user_privacy_setting',
+    'UserPrivacySettingAllowPrivateVoiceAndVideoNoteMessages': 'user_privacy_setting',
+    'UserPrivacySettingRule': 'user_privacy_setting_rule',
+    'UserPrivacySettingRuleAllowAll': 'user_privacy_setting_rule',
+    'UserPrivacySettingRuleAllowContacts': 'user_privacy_setting_rule',
+    'UserPrivacySettingRuleAllowUsers': 'user_privacy_setting_rule',
+    'UserPrivacySettingRuleAllowChatMembers': 'user_privacy_setting_rule',
+    'UserPrivacySettingRuleRestrictAll': 'user_privacy_setting_rule',
+    'UserPrivacySettingRuleRestrictContacts': 'user_privacy_setting_rule',
+    'UserPrivacySettingRuleRestrictUsers': 'user_privacy_setting_rule',
+    'UserPrivacySettingRuleRestrictChatMembers': 'user_privacy_setting_rule',
+    'UserStatusEmpty': 'user_status',
+    'UserStatusOnline': 'user_status',
+    'UserStatusOffline': 'user_status',
+    'UserStatusRecently': 'user_status',
+    'UserStatusLastWeek': 'user_status',
+    'UserStatusLastMonth': 'user_status',
+    'UserSupportInfo': 'user_support_info',
+    'UserTypeRegular': 'user_type',
+    'UserTypeDeleted': 'user_type',
+    'UserTypeBot': 'user_type',
+    'UserTypeUnknown': 'user_type',
+    'Users': 'users',
+    'ValidatedOrderInfo': 'validated_order_info',
+    'VectorPathCommandLine': 'vector_path_command',
+    'VectorPathCommandCubicBezierCurve': 'vector_path_command',
+    'WebAppInfo': 'web_app_info',
+    'WebPageInstantView': 'web_page_instant_view',
+}
+# @type -> class name
+_type_names = {
+    'TlObject': 'TlObject',
+    'TlStorerToString': 'TlStorerToString',
+    'Object': 'Object',
+    'Function': 'Function',
+    'accentColor': 'AccentColor',
+    'accountTtl': 'AccountTtl',
+    'MessageSender': 'MessageSender',
+    'ReactionType': 'ReactionType',
+    'addedReaction': 'AddedReaction',
+    'addedReactions': 'AddedReactions',
+    'address': 'Address',
+    'file': 'File',
+    'animatedChatPhoto': 'AnimatedChatPhoto',
+    'sticker': 'Sticker',
+    'animatedEmoji': 'AnimatedEmoji',
+    'minithumbnail': 'Minithumbnail',
+    'thumbnail': 'Thumbnail',
+    'animation': 'Animation',
+    'animations': 'Animations',
+    'archiveChatListSettings': 'ArchiveChatListSettings',
+    'attachmentMenuBotColor': 'AttachmentMenuBotColor',
+    'attachmentMenuBot': 'AttachmentMenuBot',
+    'audio': 'Audio',
+    'AuthenticationCodeType': 'AuthenticationCodeType',
+    'authenticationCodeInfo': 'AuthenticationCodeInfo',
+    'authenticationCodeTypeTelegramMessage': 'AuthenticationCodeTypeTelegramMessage',
+    'authenticationCodeTypeSms': 'AuthenticationCodeTypeSms',
+    'authenticationCodeTypeCall': 'AuthenticationCodeTypeCall',
+    'authenticationCodeTypeFlashCall': 'AuthenticationCodeTypeFlashCall',
+    'authenticationCodeTypeMissedCall': 'AuthenticationCodeTypeMissedCall',
+    'authenticationCodeTypeFragment': 'AuthenticationCodeTypeFragment',
+    'authenticationCodeTypeFirebaseAndroid': 'AuthenticationCodeTypeFirebaseAndroid',
+    'authenticationCodeTypeFirebaseIos': 'AuthenticationCodeTypeFirebaseIos',
+    'EmailAddressResetState': 'EmailAddressResetState',
+    'emailAddressAuthenticationCodeInfo': 'EmailAddressAuthenticationCodeInfo',
+    'termsOfService': 'TermsOfService',
+    'AuthorizationState': 'AuthorizationState',
+    'authorizationStateWaitTdlibParameters': 'AuthorizationStateWaitTdlibParameters',
+    'authorizationStateWaitPhoneNumber': 'AuthorizationStateWaitPhoneNumber',
+    'authorizationStateWaitEmailAddress': 'AuthorizationStateWaitEmailAddress',
+    'authorizationStateWaitEmailCode': 'AuthorizationStateWaitEmailCode',
+    'authorizationStateWaitCode': 'AuthorizationStateWaitCode',
+    'authorizationStateWaitOtherDeviceConfirmation': 'AuthorizationStateWaitOtherDeviceConfirmation',
+    'authorizationStateWaitRegistration': 'AuthorizationStateWaitRegistration',
+    'authorizationStateWaitPassword': 'AuthorizationStateWaitPassword',
+    'authorizationStateReady': 'AuthorizationStateReady',
+    'authorizationStateLoggingOut': 'AuthorizationStateLoggingOut',
+    'authorizationStateClosing': 'AuthorizationStateClosing',
+    'authorizationStateClosed': 'AuthorizationStateClosed',
+    'autoDownloadSettings': 'AutoDownloadSettings',
+    'autoDownloadSettingsPresets': 'AutoDownloadSettingsPresets',
+    'autosaveSettingsException': 'AutosaveSettingsException',
+    'scopeAutosaveSettings': 'ScopeAutosaveSettings',
+    'autosaveSettings': 'AutosaveSettings',
+    'AutosaveSettingsScope': 'AutosaveSettingsScope',
+    'autosaveSettingsScopePrivateChats': 'AutosaveSettingsScopePrivateChats',
+    'autosaveSettingsScopeGroupChats': 'AutosaveSettingsScopeGroupChats',
+    'autosaveSettingsScopeChannelChats': 'AutosaveSettingsScopeChannelChats',
+    'autosaveSettingsScopeChat': 'AutosaveSettingsScopeChat',
+    'availableReaction': 'AvailableReaction',
+    'availableReactions': 'AvailableReactions',
+    'BackgroundType': 'BackgroundType',
+    'document': 'Document',
+    'background': 'Background',
+    'BackgroundFill': 'BackgroundFill',
+    'backgroundFillSolid': 'BackgroundFillSolid',
+    'backgroundFillGradient': 'BackgroundFillGradient',
+    'backgroundFillFreeformGradient': 'BackgroundFillFreeformGradient',
+    'backgroundTypeWallpaper': 'BackgroundTypeWallpaper',
+    'backgroundTypePattern': 'BackgroundTypePattern',
+    'backgroundTypeFill': 'BackgroundTypeFill',
+    'backgroundTypeChatTheme': 'BackgroundTypeChatTheme',
+    'backgrounds': 'Backgrounds',
+    'bankCardActionOpenUrl': 'BankCardActionOpenUrl',
+    'bankCardInfo': 'BankCardInfo',
+    'ChatMemberStatus': 'ChatMemberStatus',
+    'basicGroup': 'BasicGroup',
+    'botCommands': 'BotCommands',
+    'chatInviteLink': 'ChatInviteLink',
+    'chatMember': 'ChatMember',
+    'chatPhoto': 'ChatPhoto',
+    'basicGroupFullInfo': 'BasicGroupFullInfo',
+    'BlockList': 'BlockList',
+    'blockListMain': 'BlockListMain',
+    'blockListStories': 'BlockListStories',
+    'botCommand': 'BotCommand',
+    'BotCommandScope': 'BotCommandScope',
+    'botCommandScopeDefault': 'BotCommandScopeDefault',
+    'botCommandScopeAllPrivateChats': 'BotCommandScopeAllPrivateChats',
+    'botCommandScopeAllGroupChats': 'BotCommandScopeAllGroupChats',
+    'botCommandScopeAllChatAdministrators': 'BotCommandScopeAllChatAdministrators',
+    'botCommandScopeChat': 'BotCommandScopeChat',
+    'botCommandScopeChatAdministrators': 'BotCommandScopeChatAdministrators',
+    'botCommandScopeChatMember': 'BotCommandScopeChatMember',
+    'InternalLinkType': 'InternalLinkType',
+    'botMenuButton': 'BotMenuButton',
+    'chatAdministratorRights': 'ChatAdministratorRights',
+    'photo': 'Photo',
+    'botInfo': 'BotInfo',
+    'webApp': 'WebApp',
+    'BotWriteAccessAllowReason': 'BotWriteAccessAllowReason',
+    'botWriteAccessAllowReasonConnectedWebsite': 'BotWriteAccessAllowReasonConnectedWebsite',
+    'botWriteAccessAllowReasonAddedToAttachmentMenu': 'BotWriteAccessAllowReasonAddedToAttachmentMenu',
+    'botWriteAccessAllowReasonLaunchedWebApp': 'BotWriteAccessAllowReasonLaunchedWebApp',
+    'botWriteAccessAllowReasonAcceptedRequest': 'BotWriteAccessAllowReasonAcceptedRequest',
+    'CallState': 'CallState',
+    'call': 'Call',
+    'CallDiscardReason': 'CallDiscardReason',
+    'callDiscardReasonEmpty': 'CallDiscardReasonEmpty',
+    'callDiscardReasonMissed': 'CallDiscardReasonMissed',
+    'callDiscardReasonDeclined': 'CallDiscardReasonDeclined',
+    'callDiscardReasonDisconnected': 'CallDiscardReasonDisconnected',
+    'callDiscardReasonHungUp': 'CallDiscardReasonHungUp',
+    'callId': 'CallId',
+    'CallProblem': 'CallProblem',
+    'callProblemEcho': 'CallProblemEcho',
+    'callProblemNoise': 'CallProblemNoise',
+    'callProblemInterruptions': 'CallProblemInterruptions',
+    'callProblemDistortedSpeech': 'CallProblemDistortedSpeech',
+    'callProblemSilentLocal': 'CallProblemSilentLocal',
+    'callProblemSilentRemote': 'CallProblemSilentRemote',
+    'callProblemDropped': 'CallProblemDropped',
+    'callProblemDistortedVideo': 'CallProblemDistortedVideo',
+    'callProblemPixelatedVideo': 'CallProblemPixelatedVideo',
+    'callProtocol': 'CallProtocol',
+    'CallServerType': 'CallServerType',
+    'callServer': 'CallServer',
+    'callServerTypeTelegramReflector': 'CallServerTypeTelegramReflector',
+    'callServerTypeWebrtc': 'CallServerTypeWebrtc',
+    'error': 'Error',
+    'callStatePending': 'CallStatePending',
+    'callStateExchangingKeys': 'CallStateExchangingKeys',
+    'callStateReady': 'CallStateReady',
+    'callStateHangingUp': 'CallStateHangingUp',
+    'callStateDiscarded': 'CallStateDiscarded',
+    'callStateError': 'CallStateError',
+    'callbackQueryAnswer': 'CallbackQueryAnswer',
+    'CallbackQueryPayload': 'CallbackQueryPayload',
+    'callbackQueryPayloadData': 'CallbackQueryPayloadData',
+    'callbackQueryPayloadDataWithPassword': 'CallbackQueryPayloadDataWithPassword',
+    'callbackQueryPayloadGame': 'CallbackQueryPayloadGame',
+    'CanSendStoryResult': 'CanSendStoryResult',
+    'canSendStoryResultOk': 'CanSendStoryResultOk',
+    'canSendStoryResultPremiumNeeded': 'CanSendStoryResultPremiumNeeded',
+    'canSendStoryResultBoostNeeded': 'CanSendStoryResultBoostNeeded',
+    'canSendStoryResultActiveStoryLimitExceeded': 'CanSendStoryResultActiveStoryLimitExceeded',
+    'canSendStoryResultWeeklyLimitExceeded': 'CanSendStoryResultWeeklyLimitExceeded',
+    'canSendStoryResultMonthlyLimitExceeded': 'CanSendStoryResultMonthlyLimitExceeded',
+    'CanTransferOwnershipResult': 'CanTransferOwnershipResult',
+    'canTransferOwnershipResultOk': 'CanTransferOwnershipResultOk',
+    'canTransferOwnershipResultPasswordNeeded': 'CanTransferOwnershipResultPasswordNeeded',
+    'canTransferOwnershipResultPasswordTooFresh': 'CanTransferOwnershipResultPasswordTooFresh',
+    'canTransferOwnershipResultSessionTooFresh': 'CanTransferOwnershipResultSessionTooFresh',
+    'ChatActionBar': 'ChatActionBar',
+    'ChatAvailableReactions': 'ChatAvailableReactions',
+    'ChatType': 'ChatType',
+    'chatBackground': 'ChatBackground',
+    'chatJoinRequestsInfo': 'ChatJoinRequestsInfo',
+    'chatNotificationSettings': 'ChatNotificationSettings',
+    'chatPermissions': 'ChatPermissions',
+    'chatPhotoInfo': 'ChatPhotoInfo',
+    'chatPosition': 'ChatPosition',
+    'draftMessage': 'DraftMessage',
+    'emojiStatus': 'EmojiStatus',
+    'message': 'Message',
+    'videoChat': 'VideoChat',
+    'chat': 'Chat',
+    'ChatAction': 'ChatAction',
+    'chatActionTyping': 'ChatActionTyping',
+    'chatActionRecordingVideo': 'ChatActionRecordingVideo',
+    'chatActionUploadingVideo': 'ChatActionUploadingVideo',
+    'chatActionRecordingVoiceNote': 'ChatActionRecordingVoiceNote',
+    'chatActionUploadingVoiceNote': 'ChatActionUploadingVoiceNote',
+    'chatActionUploadingPhoto': 'ChatActionUploadingPhoto',
+    'chatActionUploadingDocument': 'ChatActionUploadingDocument',
+    'chatActionChoosingSticker': 'ChatActionChoosingSticker',
+    'chatActionChoosingLocation': 'ChatActionChoosingLocation',
+    'chatActionChoosingContact': 'ChatActionChoosingContact',
+    'chatActionStartPlayingGame': 'ChatActionStartPlayingGame',
+    'chatActionRecordingVideoNote': 'ChatActionRecordingVideoNote',
+    'chatActionUploadingVideoNote': 'ChatActionUploadingVideoNote',
+    'chatActionWatchingAnimations': 'ChatActionWatchingAnimations',
+    'chatActionCancel': 'ChatActionCancel',
+    'chatActionBarReportSpam': 'ChatActionBarReportSpam',
+    'chatActionBarReportUnrelatedLocation': 'ChatActionBarReportUnrelatedLocation',
+    'chatActionBarInviteMembers': 'ChatActionBarInviteMembers',
+    'chatActionBarReportAddBlock': 'ChatActionBarReportAddBlock',
+    'chatActionBarAddContact': 'ChatActionBarAddContact',
+    'chatActionBarSharePhoneNumber': 'ChatActionBarSharePhoneNumber',
+    'chatActionBarJoinRequest': 'ChatActionBarJoinRequest',
+    'StoryList': 'StoryList',
+    'storyInfo': 'StoryInfo',
+    'chatActiveStories': 'ChatActiveStories',
+    'chatAdministrator': 'ChatAdministrator',
+    'chatAdministrators': 'ChatAdministrators',
+    'chatAvailableReactionsAll': 'ChatAvailableReactionsAll',
+    'chatAvailableReactionsSome': 'ChatAvailableReactionsSome',
+    'ChatBoostSource': 'ChatBoostSource',
+    'chatBoost': 'ChatBoost',
+    'chatBoostLevelFeatures': 'ChatBoostLevelFeatures',
+    'chatBoostFeatures': 'ChatBoostFeatures',
+    'chatBoostLink': 'ChatBoostLink',
+    'chatBoostLinkInfo': 'ChatBoostLinkInfo',
+    'chatBoostSlot': 'ChatBoostSlot',
+    'chatBoostSlots': 'ChatBoostSlots',
+    'chatBoostSourceGiftCode': 'ChatBoostSourceGiftCode',
+    'chatBoostSourceGiveaway': 'ChatBoostSourceGiveaway',
+    'chatBoostSourcePremium': 'ChatBoostSourcePremium',
+    'prepaidPremiumGiveaway': 'PrepaidPremiumGiveaway',
+    'chatBoostStatus': 'ChatBoostStatus',
+    'ChatEventAction': 'ChatEventAction',
+    'chatEvent': 'ChatEvent',
+    'chatLocation': 'ChatLocation',
+    'forumTopicInfo': 'ForumTopicInfo',
+    'chatEventMessageEdited': 'ChatEventMessageEdited',
+    'chatEventMessageDeleted': 'ChatEventMessageDeleted',
+    'chatEventMessagePinned': 'ChatEventMessagePinned',
+    'chatEventMessageUnpinned': 'ChatEventMessageUnpinned',
+    'chatEventPollStopped': 'ChatEventPollStopped',
+    'chatEventMemberJoined': 'ChatEventMemberJoined',
+    'chatEventMemberJoinedByInviteLink': 'ChatEventMemberJoinedByInviteLink',
+    'chatEventMemberJoinedByRequest': 'ChatEventMemberJoinedByRequest',
+    'chatEventMemberInvited': 'ChatEventMemberInvited',
+    'chatEventMemberLeft': 'ChatEventMemberLeft',
+    'chatEventMemberPromoted': 'ChatEventMemberPromoted',
+    'chatEventMemberRestricted': 'ChatEventMemberRestricted',
+    'chatEventAvailableReactionsChanged': 'ChatEventAvailableReactionsChanged',
+    'chatEventBackgroundChanged': 'ChatEventBackgroundChanged',
+    'chatEventDescriptionChanged': 'ChatEventDescriptionChanged',
+    'chatEventEmojiStatusChanged': 'ChatEventEmojiStatusChanged',
+    'chatEventLinkedChatChanged': 'ChatEventLinkedChatChanged',
+    'chatEventLocationChanged': 'ChatEventLocationChanged',
+    'chatEventMessageAutoDeleteTimeChanged': 'ChatEventMessageAutoDeleteTimeChanged',
+    'chatEventPermissionsChanged': 'ChatEventPermissionsChanged',
+    'chatEventPhotoChanged': 'ChatEventPhotoChanged',
+    'chatEventSlowModeDelayChanged': 'ChatEventSlowModeDelayChanged',
+    'chatEventStickerSetChanged': 'ChatEventStickerSetChanged',
+    'chatEventTitleChanged': 'ChatEventTitleChanged',
+    'chatEventUsernameChanged': 'ChatEventUsernameChanged',
+    'chatEventActiveUsernamesChanged': 'ChatEventActiveUsernamesChanged',
+    'chatEventAccentColorChanged': 'ChatEventAccentColorChanged',
+    'chatEventProfileAccentColorChanged': 'ChatEventProfileAccentColorChanged',
+    'chatEventHasProtectedContentToggled': 'ChatEventHasProtectedContentToggled',
+    'chatEventInvitesToggled': 'ChatEventInvitesToggled',
+    'chatEventIsAllHistoryAvailableToggled': 'ChatEventIsAllHistoryAvailableToggled',
+    'chatEventHasAggressiveAntiSpamEnabledToggled': 'ChatEventHasAggressiveAntiSpamEnabledToggled',
+    'chatEventSignMessagesToggled': 'ChatEventSignMessagesToggled',
+    'chatEventInviteLinkEdited': 'ChatEventInviteLinkEdited',
+    'chatEventInviteLinkRevoked': 'ChatEventInviteLinkRevoked',
+    'chatEventInviteLinkDeleted': 'ChatEventInviteLinkDeleted',
+    'chatEventVideoChatCreated': 'ChatEventVideoChatCreated',
+    'chatEventVideoChatEnded': 'ChatEventVideoChatEnded',
+    'chatEventVideoChatMuteNewParticipantsToggled': 'ChatEventVideoChatMuteNewParticipantsToggled',
+    'chatEventVideoChatParticipantIsMutedToggled': 'ChatEventVideoChatParticipantIsMutedToggled',
+    'chatEventVideoChatParticipantVolumeLevelChanged': 'ChatEventVideoChatParticipantVolumeLevelChanged',
+    'chatEventIsForumToggled': 'ChatEventIsForumToggled',
+    'chatEventForumTopicCreated': 'ChatEventForumTopicCreated',
+    'chatEventForumTopicEdited': 'ChatEventForumTopicEdited',
+    'chatEventForumTopicToggleIsClosed': 'ChatEventForumTopicToggleIsClosed',
+    'chatEventForumTopicToggleIsHidden': 'ChatEventForumTopicToggleIsHidden',
+    'chatEventForumTopicDeleted': 'ChatEventForumTopicDeleted',
+    'chatEventForumTopicPinned': 'ChatEventForumTopicPinned',
+    'chatEventLogFilters': 'ChatEventLogFilters',
+    'chatEvents': 'ChatEvents',
+    'chatFolderIcon': 'ChatFolderIcon',
+    'chatFolder': 'ChatFolder',
+    'chatFolderInfo': 'ChatFolderInfo',
+    'chatFolderInviteLink': 'ChatFolderInviteLink',
+    'chatFolderInviteLinkInfo': 'ChatFolderInviteLinkInfo',
+    'chatFolderInviteLinks': 'ChatFolderInviteLinks',
+    'chatInviteLinkCount': 'ChatInviteLinkCount',
+    'chatInviteLinkCounts': 'ChatInviteLinkCounts',
+    'InviteLinkChatType': 'InviteLinkChatType',
+    'chatInviteLinkInfo': 'ChatInviteLinkInfo',
+    'chatInviteLinkMember': 'ChatInviteLinkMember',
+    'chatInviteLinkMembers': 'ChatInviteLinkMembers',
+    'chatInviteLinks': 'ChatInviteLinks',
+    'chatJoinRequest': 'ChatJoinRequest',
+    'chatJoinRequests': 'ChatJoinRequests',
+    'ChatList': 'ChatList',
+    'chatListMain': 'ChatListMain',
+    'chatListArchive': 'ChatListArchive',
+    'chatListFolder': 'ChatListFolder',
+    'chatLists': 'ChatLists',
+    'location': 'Location',
+    'chatMemberStatusCreator': 'ChatMemberStatusCreator',
+    'chatMemberStatusAdministrator': 'ChatMemberStatusAdministrator',
+    'chatMemberStatusMember': 'ChatMemberStatusMember',
+    'chatMemberStatusRestricted': 'ChatMemberStatusRestricted',
+    'chatMemberStatusLeft': 'ChatMemberStatusLeft',
+    'chatMemberStatusBanned': 'ChatMemberStatusBanned',
+    'chatMembers': 'ChatMembers',
+    'ChatMembersFilter': 'ChatMembersFilter',
+    'chatMembersFilterContacts': 'ChatMembersFilterContacts',
+    'chatMembersFilterAdministrators': 'ChatMembersFilterAdministrators',
+    'chatMembersFilterMembers': 'ChatMembersFilterMembers',
+    'chatMembersFilterMention': 'ChatMembersFilterMention',
+    'chatMembersFilterRestricted': 'ChatMembersFilterRestricted',
+    'chatMembersFilterBanned': 'ChatMembersFilterBanned',
+    'chatMembersFilterBots': 'ChatMembersFilterBots',
+    'chatMessageSender': 'ChatMessageSender',
+    'chatMessageSenders': 'ChatMessageSenders',
+    'chatNearby': 'ChatNearby',
+    'chatPhotoSticker': 'ChatPhotoSticker',
+    'photoSize': 'PhotoSize',
+    'ChatPhotoStickerType': 'ChatPhotoStickerType',
+    'chatPhotoStickerTypeRegularOrMask': 'ChatPhotoStickerTypeRegularOrMask',
+    'chatPhotoStickerTypeCustomEmoji': 'ChatPhotoStickerTypeCustomEmoji',
+    'chatPhotos': 'ChatPhotos',
+    'ChatSource': 'ChatSource',
+    'chatSourceMtprotoProxy': 'ChatSourceMtprotoProxy',
+    'chatSourcePublicServiceAnnouncement': 'ChatSourcePublicServiceAnnouncement',
+    'StatisticalGraph': 'StatisticalGraph',
+    'chatStatisticsAdministratorActionsInfo': 'ChatStatisticsAdministratorActionsInfo',
+    'chatStatisticsInteractionInfo': 'ChatStatisticsInteractionInfo',
+    'chatStatisticsInviterInfo': 'ChatStatisticsInviterInfo',
+    'chatStatisticsMessageSenderInfo': 'ChatStatisticsMessageSenderInfo',
+    'dateRange': 'DateRange',
+    'statisticalValue': 'StatisticalValue',
+    'ChatStatistics': 'ChatStatistics',
+    'chatStatisticsSupergroup': 'ChatStatisticsSupergroup',
+    'chatStatisticsChannel': 'ChatStatisticsChannel',
+    'ChatStatisticsObjectType': 'ChatStatisticsObjectType',
+    'chatStatisticsObjectTypeMessage': 'ChatStatisticsObjectTypeMessage',
+    'chatStatisticsObjectTypeStory': 'ChatStatisticsObjectTypeStory',
+    'themeSettings': 'ThemeSettings',
+    'chatTheme': 'ChatTheme',
+    'chatTypePrivate': 'ChatTypePrivate',
+    'chatTypeBasicGroup': 'ChatTypeBasicGroup',
+    'chatTypeSupergroup': 'ChatTypeSupergroup',
+    'chatTypeSecret': 'ChatTypeSecret',
+    'chats': 'Chats',
+    'chatsNearby': 'ChatsNearby',
+    'CheckChatUsernameResult': 'CheckChatUsernameResult',
+    'checkChatUsernameResultOk': 'CheckChatUsernameResultOk',
+    'checkChatUsernameResultUsernameInvalid': 'CheckChatUsernameResultUsernameInvalid',
+    'checkChatUsernameResultUsernameOccupied': 'CheckChatUsernameResultUsernameOccupied',
+    'checkChatUsernameResultUsernamePurchasable': 'CheckChatUsernameResultUsernamePurchasable',
+    'checkChatUsernameResultPublicChatsTooMany': 'CheckChatUsernameResultPublicChatsTooMany',
+    'checkChatUsernameResultPublicGroupsUnavailable': 'CheckChatUsernameResultPublicGroupsUnavailable',
+    'CheckStickerSetNameResult': 'CheckStickerSetNameResult',
+    'checkStickerSetNameResultOk': 'CheckStickerSetNameResultOk',
+    'checkStickerSetNameResultNameInvalid': 'CheckStickerSetNameResultNameInvalid',
+    'checkStickerSetNameResultNameOccupied': 'CheckStickerSetNameResultNameOccupied',
+    'VectorPathCommand': 'VectorPathCommand',
+    'closedVectorPath': 'ClosedVectorPath',
+    'connectedWebsite': 'ConnectedWebsite',
+    'connectedWebsites': 'ConnectedWebsites',
+    'ConnectionState': 'ConnectionState',
+    'connectionStateWaitingForNetwork': 'ConnectionStateWaitingForNetwork',
+    'connectionStateConnectingToProxy': 'ConnectionStateConnectingToProxy',
+    'connectionStateConnecting': 'ConnectionStateConnecting',
+    'connectionStateUpdating': 'ConnectionStateUpdating',
+    'connectionStateReady': 'ConnectionStateReady',
+    'contact': 'Contact',
+    'count': 'Count',
+    'countryInfo': 'CountryInfo',
+    'countries': 'Countries',
+    'customRequestResult': 'CustomRequestResult',
+    'databaseStatistics': 'DatabaseStatistics',
+    'date': 'Date',
+    'datedFile': 'DatedFile',
+    'formattedText': 'FormattedText',
+    'deepLinkInfo': 'DeepLinkInfo',
+    'DeviceToken': 'DeviceToken',
+    'deviceTokenFirebaseCloudMessaging': 'DeviceTokenFirebaseCloudMessaging',
+    'deviceTokenApplePush': 'DeviceTokenApplePush',
+    'deviceTokenApplePushVoIP': 'DeviceTokenApplePushVoIP',
+    'deviceTokenWindowsPush': 'DeviceTokenWindowsPush',
+    'deviceTokenMicrosoftPush': 'DeviceTokenMicrosoftPush',
+    'deviceTokenMicrosoftPushVoIP': 'DeviceTokenMicrosoftPushVoIP',
+    'deviceTokenWebPush': 'DeviceTokenWebPush',
+    'deviceTokenSimplePush': 'DeviceTokenSimplePush',
+    'deviceTokenUbuntuPush': 'DeviceTokenUbuntuPush',
+    'deviceTokenBlackBerryPush': 'DeviceTokenBlackBerryPush',
+    'deviceTokenTizenPush': 'DeviceTokenTizenPush',
+    'deviceTokenHuaweiPush': 'DeviceTokenHuaweiPush',
+    'DiceStickers': 'DiceStickers',
+    'diceStickersRegular': 'DiceStickersRegular',
+    'diceStickersSlotMachine': 'DiceStickersSlotMachine',
+    'downloadedFileCounts': 'DownloadedFileCounts',
+    'InputMessageContent': 'InputMessageContent',
+    'InputMessageReplyTo': 'InputMessageReplyTo',
+    'EmailAddressAuthentication': 'EmailAddressAuthentication',
+    'emailAddressAuthenticationCode': 'EmailAddressAuthenticationCode',
+    'emailAddressAuthenticationAppleId': 'EmailAddressAuthenticationAppleId',
+    'emailAddressAuthenticationGoogleId': 'EmailAddressAuthenticationGoogleId',
+    'emailAddressResetStateAvailable': 'EmailAddressResetStateAvailable',
+    'emailAddressResetStatePending': 'EmailAddressResetStatePending',
+    'emojiCategory': 'EmojiCategory',
+    'emojiCategories': 'EmojiCategories',
+    'EmojiCategoryType': 'EmojiCategoryType',
+    'emojiCategoryTypeDefault': 'EmojiCategoryTypeDefault',
+    'emojiCategoryTypeEmojiStatus': 'EmojiCategoryTypeEmojiStatus',
+    'emojiCategoryTypeChatPhoto': 'EmojiCategoryTypeChatPhoto',
+    'emojiReaction': 'EmojiReaction',
+    'emojiStatuses': 'EmojiStatuses',
+    'emojis': 'Emojis',
+    'encryptedCredentials': 'EncryptedCredentials',
+    'PassportElementType': 'PassportElementType',
+    'encryptedPassportElement': 'EncryptedPassportElement',
+    'localFile': 'LocalFile',
+    'remoteFile': 'RemoteFile',
+    'fileDownload': 'FileDownload',
+    'fileDownloadedPrefixSize': 'FileDownloadedPrefixSize',
+    'filePart': 'FilePart',
+    'FileType': 'FileType',
+    'fileTypeNone': 'FileTypeNone',
+    'fileTypeAnimation': 'FileTypeAnimation',
+    'fileTypeAudio': 'FileTypeAudio',
+    'fileTypeDocument': 'FileTypeDocument',
+    'fileTypeNotificationSound': 'FileTypeNotificationSound',
+    'fileTypePhoto': 'FileTypePhoto',
+    'fileTypePhotoStory': 'FileTypePhotoStory',
+    'fileTypeProfilePhoto': 'FileTypeProfilePhoto',
+    'fileTypeSecret': 'FileTypeSecret',
+    'fileTypeSecretThumbnail': 'FileTypeSecretThumbnail',
+    'fileTypeSecure': 'FileTypeSecure',
+    'fileTypeSticker': 'FileTypeSticker',
+    'fileTypeThumbnail': 'FileTypeThumbnail',
+    'fileTypeUnknown': 'FileTypeUnknown',
+    'fileTypeVideo': 'FileTypeVideo',
+    'fileTypeVideoNote': 'FileTypeVideoNote',
+    'fileTypeVideoStory': 'FileTypeVideoStory',
+    'fileTypeVoiceNote': 'FileTypeVoiceNote',
+    'fileTypeWallpaper': 'FileTypeWallpaper',
+    'FirebaseAuthenticationSettings': 'FirebaseAuthenticationSettings',
+    'firebaseAuthenticationSettingsAndroid': 'FirebaseAuthenticationSettingsAndroid',
+    'firebaseAuthenticationSettingsIos': 'FirebaseAuthenticationSettingsIos',
+    'textEntity': 'TextEntity',
+    'forumTopic': 'ForumTopic',
+    'forumTopicIcon': 'ForumTopicIcon',
+    'forumTopics': 'ForumTopics',
+    'foundChatBoosts': 'FoundChatBoosts',
+    'foundChatMessages': 'FoundChatMessages',
+    'foundFileDownloads': 'FoundFileDownloads',
+    'foundMessages': 'FoundMessages',
+    'foundPosition': 'FoundPosition',
+    'foundPositions': 'FoundPositions',
+    'foundWebApp': 'FoundWebApp',
+    'game': 'Game',
+    'gameHighScore': 'GameHighScore',
+    'gameHighScores': 'GameHighScores',
+    'groupCallRecentSpeaker': 'GroupCallRecentSpeaker',
+    'groupCall': 'GroupCall',
+    'groupCallId': 'GroupCallId',
+    'groupCallParticipantVideoInfo': 'GroupCallParticipantVideoInfo',
+    'groupCallParticipant': 'GroupCallParticipant',
+    'groupCallVideoSourceGroup': 'GroupCallVideoSourceGroup',
+    'groupCallStream': 'GroupCallStream',
+    'groupCallStreams': 'GroupCallStreams',
+    'GroupCallVideoQuality': 'GroupCallVideoQuality',
+    'groupCallVideoQualityThumbnail': 'GroupCallVideoQualityThumbnail',
+    'groupCallVideoQualityMedium': 'GroupCallVideoQualityMedium',
+    'groupCallVideoQualityFull': 'GroupCallVideoQualityFull',
+    'hashtags': 'Hashtags',
+    'httpUrl': 'HttpUrl',
+    'identityDocument': 'IdentityDocument',
+    'importedContacts': 'ImportedContacts',
+    'InlineKeyboardButtonType': 'InlineKeyboardButtonType',
+    'inlineKeyboardButton': 'InlineKeyboardButton',
+    'TargetChat': 'TargetChat',
+    'inlineKeyboardButtonTypeUrl': 'InlineKeyboardButtonTypeUrl',
+    'inlineKeyboardButtonTypeLoginUrl': 'InlineKeyboardButtonTypeLoginUrl',
+    'inlineKeyboardButtonTypeWebApp': 'InlineKeyboardButtonTypeWebApp',
+    'inlineKeyboardButtonTypeCallback': 'InlineKeyboardButtonTypeCallback',
+    'inlineKeyboardButtonTypeCallbackWithPassword': 'InlineKeyboardButtonTypeCallbackWithPassword',
+    'inlineKeyboardButtonTypeCallbackGame': 'InlineKeyboardButtonTypeCallbackGame',
+    'inlineKeyboardButtonTypeSwitchInline': 'InlineKeyboardButtonTypeSwitchInline',
+    'inlineKeyboardButtonTypeBuy': 'InlineKeyboardButtonTypeBuy',
+    'inlineKeyboardButtonTypeUser': 'InlineKeyboardButtonTypeUser',
+    'venue': 'Venue',
+    'video': 'Video',
+    'voiceNote': 'VoiceNote',
+    'InlineQueryResult': 'InlineQueryResult',
+    'inlineQueryResultArticle': 'InlineQueryResultArticle',
+    'inlineQueryResultContact': 'InlineQueryResultContact',
+    'inlineQueryResultLocation': 'InlineQueryResultLocation',
+    'inlineQueryResultVenue': 'InlineQueryResultVenue',
+    'inlineQueryResultGame': 'InlineQueryResultGame',
+    'inlineQueryResultAnimation': 'InlineQueryResultAnimation',
+    'inlineQueryResultAudio': 'InlineQueryResultAudio',
+    'inlineQueryResultDocument': 'InlineQueryResultDocument',
+    'inlineQueryResultPhoto': 'InlineQueryResultPhoto',
+    'inlineQueryResultSticker': 'InlineQueryResultSticker',
+    'inlineQueryResultVideo': 'InlineQueryResultVideo',
+    'inlineQueryResultVoiceNote': 'InlineQueryResultVoiceNote',
+    'inlineQueryResultsButton': 'InlineQueryResultsButton',
+    'inlineQueryResults': 'InlineQueryResults',
+    'InlineQueryResultsButtonType': 'InlineQueryResultsButtonType',
+    'inlineQueryResultsButtonTypeStartBot': 'InlineQueryResultsButtonTypeStartBot',
+    'inlineQueryResultsButtonTypeWebApp': 'InlineQueryResultsButtonTypeWebApp',
+    'InputFile': 'InputFile',
+    'InputBackground': 'InputBackground',
+    'inputBackgroundLocal': 'InputBackgroundLocal',
+    'inputBackgroundRemote': 'InputBackgroundRemote',
+    'inputBackgroundPrevious': 'InputBackgroundPrevious',
+    'InputChatPhoto': 'InputChatPhoto',
+    'inputChatPhotoPrevious': 'InputChatPhotoPrevious',
+    'inputChatPhotoStatic': 'InputChatPhotoStatic',
+    'inputChatPhotoAnimation': 'InputChatPhotoAnimation',
+    'inputChatPhotoSticker': 'InputChatPhotoSticker',
+    'InputCredentials': 'InputCredentials',
+    'inputCredentialsSaved': 'InputCredentialsSaved',
+    'inputCredentialsNew': 'InputCredentialsNew',
+    'inputCredentialsApplePay': 'InputCredentialsApplePay',
+    'inputCredentialsGooglePay': 'InputCredentialsGooglePay',
+    'inputFileId': 'InputFileId',
+    'inputFileRemote': 'InputFileRemote',
+    'inputFileLocal': 'InputFileLocal',
+    'inputFileGenerated': 'InputFileGenerated',
+    'inputIdentityDocument': 'InputIdentityDocument',
+    'ReplyMarkup': 'ReplyMarkup',
+    'InputInlineQueryResult': 'InputInlineQueryResult',
+    'inputInlineQueryResultAnimation': 'InputInlineQueryResultAnimation',
+    'inputInlineQueryResultArticle': 'InputInlineQueryResultArticle',
+    'inputInlineQueryResultAudio': 'InputInlineQueryResultAudio',
+    'inputInlineQueryResultContact': 'InputInlineQueryResultContact',
+    'inputInlineQueryResultDocument': 'InputInlineQueryResultDocument',
+    'inputInlineQueryResultGame': 'InputInlineQueryResultGame',
+    'inputInlineQueryResultLocation': 'InputInlineQueryResultLocation',
+    'inputInlineQueryResultPhoto': 'InputInlineQueryResultPhoto',
+    'inputInlineQueryResultSticker': 'InputInlineQueryResultSticker',
+    'inputInlineQueryResultVenue': 'InputInlineQueryResultVenue',
+    'inputInlineQueryResultVideo': 'InputInlineQueryResultVideo',
+    'inputInlineQueryResultVoiceNote': 'InputInlineQueryResultVoiceNote',
+    'TelegramPaymentPurpose': 'TelegramPaymentPurpose',
+    'InputInvoice': 'InputInvoice',
+    'inputInvoiceMessage': 'InputInvoiceMessage',
+    'inputInvoiceName': 'InputInvoiceName',
+    'inputInvoiceTelegram': 'InputInvoiceTelegram',
+    'MessageSelfDestructType': 'MessageSelfDestructType',
+    'PollType': 'PollType',
+    'inputThumbnail': 'InputThumbnail',
+    'invoice': 'Invoice',
+    'linkPreviewOptions': 'LinkPreviewOptions',
+    'messageCopyOptions': 'MessageCopyOptions',
+    'inputMessageText': 'InputMessageText',
+    'inputMessageAnimation': 'InputMessageAnimation',
+    'inputMessageAudio': 'InputMessageAudio',
+    'inputMessageDocument': 'InputMessageDocument',
+    'inputMessagePhoto': 'InputMessagePhoto',
+    'inputMessageSticker': 'InputMessageSticker',
+    'inputMessageVideo': 'InputMessageVideo',
+    'inputMessageVideoNote': 'InputMessageVideoNote',
+    'inputMessageVoiceNote': 'InputMessageVoiceNote',
+    'inputMessageLocation': 'InputMessageLocation',
+    'inputMessageVenue': 'InputMessageVenue',
+    'inputMessageContact': 'InputMessageContact',
+    'inputMessageDice': 'InputMessageDice',
+    'inputMessageGame': 'InputMessageGame',
+    'inputMessageInvoice': 'InputMessageInvoice',
+    'inputMessagePoll': 'InputMessagePoll',
+    'inputMessageStory': 'InputMessageStory',
+    'inputMessageForwarded': 'InputMessageForwarded',
+    'inputTextQuote': 'InputTextQuote',
+    'inputMessageReplyToMessage': 'InputMessageReplyToMessage',
+    'inputMessageReplyToStory': 'InputMessageReplyToStory',
+    'inputPersonalDocument': 'InputPersonalDocument',
+    'personalDetails': 'PersonalDetails',
+    'InputPassportElement': 'InputPassportElement',
+    'inputPassportElementPersonalDetails': 'InputPassportElementPersonalDetails',
+    'inputPassportElementPassport': 'InputPassportElementPassport',
+    'inputPassportElementDriverLicense': 'InputPassportElementDriverLicense',
+    'inputPassportElementIdentityCard': 'InputPassportElementIdentityCard',
+    'inputPassportElementInternalPassport': 'InputPassportElementInternalPassport',
+    'inputPassportElementAddress': 'InputPassportElementAddress',
+    'inputPassportElementUtilityBill': 'InputPassportElementUtilityBill',
+    'inputPassportElementBankStatement': 'InputPassportElementBankStatement',
+    'inputPassportElementRentalAgreement': 'InputPassportElementRentalAgreement',
+    'inputPassportElementPassportRegistration': 'InputPassportElementPassportRegistration',
+    'inputPassportElementTemporaryRegistration': 'InputPassportElementTemporaryRegistration',
+    'inputPassportElementPhoneNumber': 'InputPassportElementPhoneNumber',
+    'inputPassportElementEmailAddress': 'InputPassportElementEmailAddress',
+    'InputPassportElementErrorSource': 'InputPassportElementErrorSource',
+    'inputPassportElementError': 'InputPassportElementError',
+    'inputPassportElementErrorSourceUnspecified': 'InputPassportElementErrorSourceUnspecified',
+    'inputPassportElementErrorSourceDataField': 'InputPassportElementErrorSourceDataField',
+    'inputPassportElementErrorSourceFrontSide': 'InputPassportElementErrorSourceFrontSide',
+    'inputPassportElementErrorSourceReverseSide': 'InputPassportElementErrorSourceReverseSide',
+    'inputPassportElementErrorSourceSelfie': 'InputPassportElementErrorSourceSelfie',
+    'inputPassportElementErrorSourceTranslationFile': 'InputPassportElementErrorSourceTranslationFile',
+    'inputPassportElementErrorSourceTranslationFiles': 'InputPassportElementErrorSourceTranslationFiles',
+    'inputPassportElementErrorSourceFile': 'InputPassportElementErrorSourceFile',
+    'inputPassportElementErrorSourceFiles': 'InputPassportElementErrorSourceFiles',
+    'maskPosition': 'MaskPosition',
+    'inputSticker': 'InputSticker',
+    'InputStoryAreaType': 'InputStoryAreaType',
+    'storyAreaPosition': 'StoryAreaPosition',
+    'inputStoryArea': 'InputStoryArea',
+    'inputStoryAreaTypeLocation': 'InputStoryAreaTypeLocation',
+    'inputStoryAreaTypeFoundVenue': 'InputStoryAreaTypeFoundVenue',
+    'inputStoryAreaTypePreviousVenue': 'InputStoryAreaTypePreviousVenue',
+    'inputStoryAreaTypeSuggestedReaction': 'InputStoryAreaTypeSuggestedReaction',
+    'inputStoryAreaTypeMessage': 'InputStoryAreaTypeMessage',
+    'inputStoryAreas': 'InputStoryAreas',
+    'InputStoryContent': 'InputStoryContent',
+    'inputStoryContentPhoto': 'InputStoryContentPhoto',
+    'inputStoryContentVideo': 'InputStoryContentVideo',
+    'ProxyType': 'ProxyType',
+    'internalLinkTypeActiveSessions': 'InternalLinkTypeActiveSessions',
+    'internalLinkTypeAttachmentMenuBot': 'InternalLinkTypeAttachmentMenuBot',
+    'internalLinkTypeAuthenticationCode': 'InternalLinkTypeAuthenticationCode',
+    'internalLinkTypeBackground': 'InternalLinkTypeBackground',
+    'internalLinkTypeBotAddToChannel': 'InternalLinkTypeBotAddToChannel',
+    'internalLinkTypeBotStart': 'InternalLinkTypeBotStart',
+    'internalLinkTypeBotStartInGroup': 'InternalLinkTypeBotStartInGroup',
+    'internalLinkTypeChangePhoneNumber': 'InternalLinkTypeChangePhoneNumber',
+    'internalLinkTypeChatBoost': 'InternalLinkTypeChatBoost',
+    'internalLinkTypeChatFolderInvite': 'InternalLinkTypeChatFolderInvite',
+    'internalLinkTypeChatFolderSettings': 'InternalLinkTypeChatFolderSettings',
+    'internalLinkTypeChatInvite': 'InternalLinkTypeChatInvite',
+    'internalLinkTypeDefaultMessageAutoDeleteTimerSettings': 'InternalLinkTypeDefaultMessageAutoDeleteTimerSettings',
+    'internalLinkTypeEditProfileSettings': 'InternalLinkTypeEditProfileSettings',
+    'internalLinkTypeGame': 'InternalLinkTypeGame',
+    'internalLinkTypeInstantView': 'InternalLinkTypeInstantView',
+    'internalLinkTypeInvoice': 'InternalLinkTypeInvoice',
+    'internalLinkTypeLanguagePack': 'InternalLinkTypeLanguagePack',
+    'internalLinkTypeLanguageSettings': 'InternalLinkTypeLanguageSettings',
+    'internalLinkTypeMessage': 'InternalLinkTypeMessage',
+    'internalLinkTypeMessageDraft': 'InternalLinkTypeMessageDraft',
+    'internalLinkTypePassportDataRequest': 'InternalLinkTypePassportDataRequest',
+    'internalLinkTypePhoneNumberConfirmation': 'InternalLinkTypePhoneNumberConfirmation',
+    'internalLinkTypePremiumFeatures': 'InternalLinkTypePremiumFeatures',
+    'internalLinkTypePremiumGift': 'InternalLinkTypePremiumGift',
+    'internalLinkTypePremiumGiftCode': 'InternalLinkTypePremiumGiftCode',
+    'internalLinkTypePrivacyAndSecuritySettings': 'InternalLinkTypePrivacyAndSecuritySettings',
+    'internalLinkTypeProxy': 'InternalLinkTypeProxy',
+    'internalLinkTypePublicChat': 'InternalLinkTypePublicChat',
+    'internalLinkTypeQrCodeAuthentication': 'InternalLinkTypeQrCodeAuthentication',
+    'internalLinkTypeRestorePurchases': 'InternalLinkTypeRestorePurchases',
+    'internalLinkTypeSettings': 'InternalLinkTypeSettings',
+    'internalLinkTypeSideMenuBot': 'InternalLinkTypeSideMenuBot',
+    'internalLinkTypeStickerSet': 'InternalLinkTypeStickerSet',
+    'internalLinkTypeStory': 'InternalLinkTypeStory',
+    'internalLinkTypeTheme': 'InternalLinkTypeTheme',
+    'internalLinkTypeThemeSettings': 'InternalLinkTypeThemeSettings',
+    'internalLinkTypeUnknownDeepLink': 'InternalLinkTypeUnknownDeepLink',
+    'internalLinkTypeUnsupportedProxy': 'InternalLinkTypeUnsupportedProxy',
+    'internalLinkTypeUserPhoneNumber': 'InternalLinkTypeUserPhoneNumber',
+    'internalLinkTypeUserToken': 'InternalLinkTypeUserToken',
+    'internalLinkTypeVideoChat': 'InternalLinkTypeVideoChat',
+    'internalLinkTypeWebApp': 'InternalLinkTypeWebApp',
+    'inviteLinkChatTypeBasicGroup': 'InviteLinkChatTypeBasicGroup',
+    'inviteLinkChatTypeSupergroup': 'InviteLinkChatTypeSupergroup',
+    'inviteLinkChatTypeChannel': 'InviteLinkChatTypeChannel',
+    'labeledPricePart': 'LabeledPricePart',
+    'JsonValue': 'JsonValue',
+    'jsonObjectMember': 'JsonObjectMember',
+    'jsonValueNull': 'JsonValueNull',
+    'jsonValueBoolean': 'JsonValueBoolean',
+    'jsonValueNumber': 'JsonValueNumber',
+    'jsonValueString': 'JsonValueString',
+    'jsonValueArray': 'JsonValueArray',
+    'jsonValueObject': 'JsonValueObject',
+    'KeyboardButtonType': 'KeyboardButtonType',
+    'keyboardButton': 'KeyboardButton',
+    'keyboardButtonTypeText': 'KeyboardButtonTypeText',
+    'keyboardButtonTypeRequestPhoneNumber': 'KeyboardButtonTypeRequestPhoneNumber',
+    'keyboardButtonTypeRequestLocation': 'KeyboardButtonTypeRequestLocation',
+    'keyboardButtonTypeRequestPoll': 'KeyboardButtonTypeRequestPoll',
+    'keyboardButtonTypeRequestUsers': 'KeyboardButtonTypeRequestUsers',
+    'keyboardButtonTypeRequestChat': 'KeyboardButtonTypeRequestChat',
+    'keyboardButtonTypeWebApp': 'KeyboardButtonTypeWebApp',
+    'languagePackInfo': 'LanguagePackInfo',
+    'LanguagePackStringValue': 'LanguagePackStringValue',
+    'languagePackString': 'LanguagePackString',
+    'languagePackStringValueOrdinary': 'LanguagePackStringValueOrdinary',
+    'languagePackStringValuePluralized': 'LanguagePackStringValuePluralized',
+    'languagePackStringValueDeleted': 'LanguagePackStringValueDeleted',
+    'languagePackStrings': 'LanguagePackStrings',
+    'localizationTargetInfo': 'LocalizationTargetInfo',
+    'LogStream': 'LogStream',
+    'logStreamDefault': 'LogStreamDefault',
+    'logStreamFile': 'LogStreamFile',
+    'logStreamEmpty': 'LogStreamEmpty',
+    'logTags': 'LogTags',
+    'logVerbosityLevel': 'LogVerbosityLevel',
+    'LoginUrlInfo': 'LoginUrlInfo',
+    'loginUrlInfoOpen': 'LoginUrlInfoOpen',
+    'loginUrlInfoRequestConfirmation': 'LoginUrlInfoRequestConfirmation',
+    'MaskPoint': 'MaskPoint',
+    'maskPointForehead': 'MaskPointForehead',
+    'maskPointEyes': 'MaskPointEyes',
+    'maskPointMouth': 'MaskPointMouth',
+    'maskPointChin': 'MaskPointChin',
+    'MessageContent': 'MessageContent',
+    'MessageReplyTo': 'MessageReplyTo',
+    'MessageSchedulingState': 'MessageSchedulingState',
+    'MessageSendingState': 'MessageSendingState',
+    'messageForwardInfo': 'MessageForwardInfo',
+    'messageImportInfo': 'MessageImportInfo',
+    'messageInteractionInfo': 'MessageInteractionInfo',
+    'unreadReaction': 'UnreadReaction',
+    'messageAutoDeleteTime': 'MessageAutoDeleteTime',
+    'messageCalendarDay': 'MessageCalendarDay',
+    'messageCalendar': 'MessageCalendar',
+    'MessageExtendedMedia': 'MessageExtendedMedia',
+    'orderInfo': 'OrderInfo',
+    'poll': 'Poll',
+    'premiumGiveawayParameters': 'PremiumGiveawayParameters',
+    'videoNote': 'VideoNote',
+    'webPage': 'WebPage',
+    'messageText': 'MessageText',
+    'messageAnimation': 'MessageAnimation',
+    'messageAudio': 'MessageAudio',
+    'messageDocument': 'MessageDocument',
+    'messagePhoto': 'MessagePhoto',
+    'messageExpiredPhoto': 'MessageExpiredPhoto',
+    'messageSticker': 'MessageSticker',
+    'messageVideo': 'MessageVideo',
+    'messageExpiredVideo': 'MessageExpiredVideo',
+    'messageVideoNote': 'MessageVideoNote',
+    'messageVoiceNote': 'MessageVoiceNote',
+    'messageLocation': 'MessageLocation',
+    'messageVenue': 'MessageVenue',
+    'messageContact': 'MessageContact',
+    'messageAnimatedEmoji': 'MessageAnimatedEmoji',
+    'messageDice': 'MessageDice',
+    'messageGame': 'MessageGame',
+    'messagePoll': 'MessagePoll',
+    'messageStory': 'MessageStory',
+    'messageInvoice': 'MessageInvoice',
+    'messageCall': 'MessageCall',
+    'messageVideoChatScheduled': 'MessageVideoChatScheduled',
+    'messageVideoChatStarted': 'MessageVideoChatStarted',
+    'messageVideoChatEnded': 'MessageVideoChatEnded',
+    'messageInviteVideoChatParticipants': 'MessageInviteVideoChatParticipants',
+    'messageBasicGroupChatCreate': 'MessageBasicGroupChatCreate',
+    'messageSupergroupChatCreate': 'MessageSupergroupChatCreate',
+    'messageChatChangeTitle': 'MessageChatChangeTitle',
+    'messageChatChangePhoto': 'MessageChatChangePhoto',
+    'messageChatDeletePhoto': 'MessageChatDeletePhoto',
+    'messageChatAddMembers': 'MessageChatAddMembers',
+    'messageChatJoinByLink': 'MessageChatJoinByLink',
+    'messageChatJoinByRequest': 'MessageChatJoinByRequest',
+    'messageChatDeleteMember': 'MessageChatDeleteMember',
+    'messageChatUpgradeTo': 'MessageChatUpgradeTo',
+    'messageChatUpgradeFrom': 'MessageChatUpgradeFrom',
+    'messagePinMessage': 'MessagePinMessage',
+    'messageScreenshotTaken': 'MessageScreenshotTaken',
+    'messageChatSetBackground': 'MessageChatSetBackground',
+    'messageChatSetTheme': 'MessageChatSetTheme',
+    'messageChatSetMessageAutoDeleteTime': 'MessageChatSetMessageAutoDeleteTime',
+    'messageForumTopicCreated': 'MessageForumTopicCreated',
+    'messageForumTopicEdited': 'MessageForumTopicEdited',
+    'messageForumTopicIsClosedToggled': 'MessageForumTopicIsClosedToggled',
+    'messageForumTopicIsHiddenToggled': 'MessageForumTopicIsHiddenToggled',
+    'messageSuggestProfilePhoto': 'MessageSuggestProfilePhoto',
+    'messageCustomServiceAction': 'MessageCustomServiceAction',
+    'messageGameScore': 'MessageGameScore',
+    'messagePaymentSuccessful': 'MessagePaymentSuccessful',
+    'messagePaymentSuccessfulBot': 'MessagePaymentSuccessfulBot',
+    'messageGiftedPremium': 'MessageGiftedPremium',
+    'messagePremiumGiftCode': 'MessagePremiumGiftCode',
+    'messagePremiumGiveawayCreated': 'MessagePremiumGiveawayCreated',
+    'messagePremiumGiveaway': 'MessagePremiumGiveaway',
+    'messagePremiumGiveawayCompleted': 'MessagePremiumGiveawayCompleted',
+    'messagePremiumGiveawayWinners': 'MessagePremiumGiveawayWinners',
+    'messageContactRegistered': 'MessageContactRegistered',
+    'messageUsersShared': 'MessageUsersShared',
+    'messageChatShared': 'MessageChatShared',
+    'messageBotWriteAccessAllowed': 'MessageBotWriteAccessAllowed',
+    'messageWebAppDataSent': 'MessageWebAppDataSent',
+    'messageWebAppDataReceived': 'MessageWebAppDataReceived',
+    'messagePassportDataSent': 'MessagePassportDataSent',
+    'messagePassportDataReceived': 'MessagePassportDataReceived',
+    'messageProximityAlertTriggered': 'MessageProximityAlertTriggered',
+    'messageUnsupported': 'MessageUnsupported',
+    'messageExtendedMediaPreview': 'MessageExtendedMediaPreview',
+    'messageExtendedMediaPhoto': 'MessageExtendedMediaPhoto',
+    'messageExtendedMediaVideo': 'MessageExtendedMediaVideo',
+    'messageExtendedMediaUnsupported': 'MessageExtendedMediaUnsupported',
+    'MessageFileType': 'MessageFileType',
+    'messageFileTypePrivate': 'MessageFileTypePrivate',
+    'messageFileTypeGroup': 'MessageFileTypeGroup',
+    'messageFileTypeUnknown': 'MessageFileTypeUnknown',
+    'MessageOrigin': 'MessageOrigin',
+    'messageReaction': 'MessageReaction',
+    'messageReplyInfo': 'MessageReplyInfo',
+    'messageLink': 'MessageLink',
+    'messageLinkInfo': 'MessageLinkInfo',
+    'messageOriginUser': 'MessageOriginUser',
+    'messageOriginHiddenUser': 'MessageOriginHiddenUser',
+    'messageOriginChat': 'MessageOriginChat',
+    'messageOriginChannel': 'MessageOriginChannel',
+    'messagePosition': 'MessagePosition',
+    'messagePositions': 'MessagePositions',
+    'textQuote': 'TextQuote',
+    'messageReplyToMessage': 'MessageReplyToMessage',
+    'messageReplyToStory': 'MessageReplyToStory',
+    'messageSchedulingStateSendAtDate': 'MessageSchedulingStateSendAtDate',
+    'messageSchedulingStateSendWhenOnline': 'MessageSchedulingStateSendWhenOnline',
+    'messageSelfDestructTypeTimer': 'MessageSelfDestructTypeTimer',
+    'messageSelfDestructTypeImmediately': 'MessageSelfDestructTypeImmediately',
+    'messageSendOptions': 'MessageSendOptions',
+    'messageSenderUser': 'MessageSenderUser',
+    'messageSenderChat': 'MessageSenderChat',
+    'messageSenders': 'MessageSenders',
+    'messageSendingStatePending': 'MessageSendingStatePending',
+    'messageSendingStateFailed': 'MessageSendingStateFailed',
+    'MessageSource': 'MessageSource',
+    'messageSourceChatHistory': 'MessageSourceChatHistory',
+    'messageSourceMessageThreadHistory': 'MessageSourceMessageThreadHistory',
+    'messageSourceForumTopicHistory': 'MessageSourceForumTopicHistory',
+    'messageSourceHistoryPreview': 'MessageSourceHistoryPreview',
+    'messageSourceChatList': 'MessageSourceChatList',
+    'messageSourceSearch': 'MessageSourceSearch',
+    'messageSourceChatEventLog': 'MessageSourceChatEventLog',
+    'messageSourceNotification': 'MessageSourceNotification',
+    'messageSourceScreenshot': 'MessageSourceScreenshot',
+    'messageSourceOther': 'MessageSourceOther',
+    'MessageSponsorType': 'MessageSponsorType',
+    'messageSponsor': 'MessageSponsor',
+    'messageSponsorTypeBot': 'MessageSponsorTypeBot',
+    'messageSponsorTypeWebApp': 'MessageSponsorTypeWebApp',
+    'messageSponsorTypePublicChannel': 'MessageSponsorTypePublicChannel',
+    'messageSponsorTypePrivateChannel': 'MessageSponsorTypePrivateChannel',
+    'messageSponsorTypeWebsite': 'MessageSponsorTypeWebsite',
+    'messageStatistics': 'MessageStatistics',
+    'messageThreadInfo': 'MessageThreadInfo',
+    'messageViewer': 'MessageViewer',
+    'messageViewers': 'MessageViewers',
+    'messages': 'Messages',
+    'NetworkStatisticsEntry': 'NetworkStatisticsEntry',
+    'networkStatistics': 'NetworkStatistics',
+    'NetworkType': 'NetworkType',
+    'networkStatisticsEntryFile': 'NetworkStatisticsEntryFile',
+    'networkStatisticsEntryCall': 'NetworkStatisticsEntryCall',
+    'networkTypeNone': 'NetworkTypeNone',
+    'networkTypeMobile': 'NetworkTypeMobile',
+    'networkTypeMobileRoaming': 'NetworkTypeMobileRoaming',
+    'networkTypeWiFi': 'NetworkTypeWiFi',
+    'networkTypeOther': 'NetworkTypeOther',
+    'NotificationType': 'NotificationType',
+    'notification': 'Notification',
+    'NotificationGroupType': 'NotificationGroupType',
+    'notificationGroup': 'NotificationGroup',
+    'notificationGroupTypeMessages': 'NotificationGroupTypeMessages',
+    'notificationGroupTypeMentions': 'NotificationGroupTypeMentions',
+    'notificationGroupTypeSecretChat': 'NotificationGroupTypeSecretChat',
+    'notificationGroupTypeCalls': 'NotificationGroupTypeCalls',
+    'NotificationSettingsScope': 'NotificationSettingsScope',
+    'notificationSettingsScopePrivateChats': 'NotificationSettingsScopePrivateChats',
+    'notificationSettingsScopeGroupChats': 'NotificationSettingsScopeGroupChats',
+    'notificationSettingsScopeChannelChats': 'NotificationSettingsScopeChannelChats',
+    'notificationSound': 'NotificationSound',
+    'notificationSounds': 'NotificationSounds',
+    'PushMessageContent': 'PushMessageContent',
+    'notificationTypeNewMessage': 'NotificationTypeNewMessage',
+    'notificationTypeNewSecretChat': 'NotificationTypeNewSecretChat',
+    'notificationTypeNewCall': 'NotificationTypeNewCall',
+    'notificationTypeNewPushMessage': 'NotificationTypeNewPushMessage',
+    'ok': 'Ok',
+    'OptionValue': 'OptionValue',
+    'optionValueBoolean': 'OptionValueBoolean',
+    'optionValueEmpty': 'OptionValueEmpty',
+    'optionValueInteger': 'OptionValueInteger',
+    'optionValueString': 'OptionValueString',
+    'PageBlock': 'PageBlock',
+    'RichText': 'RichText',
+    'pageBlockCaption': 'PageBlockCaption',
+    'pageBlockListItem': 'PageBlockListItem',
+    'pageBlockRelatedArticle': 'PageBlockRelatedArticle',
+    'pageBlockTableCell': 'PageBlockTableCell',
+    'pageBlockTitle': 'PageBlockTitle',
+    'pageBlockSubtitle': 'PageBlockSubtitle',
+    'pageBlockAuthorDate': 'PageBlockAuthorDate',
+    'pageBlockHeader': 'PageBlockHeader',
+    'pageBlockSubheader': 'PageBlockSubheader',
+    'pageBlockKicker': 'PageBlockKicker',
+    'pageBlockParagraph': 'PageBlockParagraph',
+    'pageBlockPreformatted': 'PageBlockPreformatted',
+    'pageBlockFooter': 'PageBlockFooter',
+    'pageBlockDivider': 'PageBlockDivider',
+    'pageBlockAnchor': 'PageBlockAnchor',
+    'pageBlockList': 'PageBlockList',
+    'pageBlockBlockQuote': 'PageBlockBlockQuote',
+    'pageBlockPullQuote': 'PageBlockPullQuote',
+    'pageBlockAnimation': 'PageBlockAnimation',
+    'pageBlockAudio': 'PageBlockAudio',
+    'pageBlockPhoto': 'PageBlockPhoto',
+    'pageBlockVideo': 'PageBlockVideo',
+    'pageBlockVoiceNote': 'PageBlockVoiceNote',
+    'pageBlockCover': 'PageBlockCover',
+    'pageBlockEmbedded': 'PageBlockEmbedded',
+    'pageBlockEmbeddedPost': 'PageBlockEmbeddedPost',
+    'pageBlockCollage': 'PageBlockCollage',
+    'pageBlockSlideshow': 'PageBlockSlideshow',
+    'pageBlockChatLink': 'PageBlockChatLink',
+    'pageBlockTable': 'PageBlockTable',
+    'pageBlockDetails': 'PageBlockDetails',
+    'pageBlockRelatedArticles': 'PageBlockRelatedArticles',
+    'pageBlockMap': 'PageBlockMap',
+    'PageBlockHorizontalAlignment': 'PageBlockHorizontalAlignment',
+    'pageBlockHorizontalAlignmentLeft': 'PageBlockHorizontalAlignmentLeft',
+    'pageBlockHorizontalAlignmentCenter': 'PageBlockHorizontalAlignmentCenter',
+    'pageBlockHorizontalAlignmentRight': 'PageBlockHorizontalAlignmentRight',
+    'PageBlockVerticalAlignment': 'PageBlockVerticalAlignment',
+    'pageBlockVerticalAlignmentTop': 'PageBlockVerticalAlignmentTop',
+    'pageBlockVerticalAlignmentMiddle': 'PageBlockVerticalAlignmentMiddle',
+    'pageBlockVerticalAlignmentBottom': 'PageBlockVerticalAlignmentBottom',
+    'passportRequiredElement': 'PassportRequiredElement',
+    'passportAuthorizationForm': 'PassportAuthorizationForm',
+    'personalDocument': 'PersonalDocument',
+    'PassportElement': 'PassportElement',
+    'passportElementPersonalDetails': 'PassportElementPersonalDetails',
+    'passportElementPassport': 'PassportElementPassport',
+    'passportElementDriverLicense': 'PassportElementDriverLicense',
+    'passportElementIdentityCard': 'PassportElementIdentityCard',
+    'passportElementInternalPassport': 'PassportElementInternalPassport',
+    'passportElementAddress': 'PassportElementAddress',
+    'passportElementUtilityBill': 'PassportElementUtilityBill',
+    'passportElementBankStatement': 'PassportElementBankStatement',
+    'passportElementRentalAgreement': 'PassportElementRentalAgreement',
+    'passportElementPassportRegistration': 'PassportElementPassportRegistration',
+    'passportElementTemporaryRegistration': 'PassportElementTemporaryRegistration',
+    'passportElementPhoneNumber': 'PassportElementPhoneNumber',
+    'passportElementEmailAddress': 'PassportElementEmailAddress',
+    'PassportElementErrorSource': 'PassportElementErrorSource',
+    'passportElementError': 'PassportElementError',
+    'passportElementErrorSourceUnspecified': 'PassportElementErrorSourceUnspecified',
+    'passportElementErrorSourceDataField': 'PassportElementErrorSourceDataField',
+    'passportElementErrorSourceFrontSide': 'PassportElementErrorSourceFrontSide',
+    'passportElementErrorSourceReverseSide': 'PassportElementErrorSourceReverseSide',
+    'passportElementErrorSourceSelfie': 'PassportElementErrorSourceSelfie',
+    'passportElementErrorSourceTranslationFile': 'PassportElementErrorSourceTranslationFile',
+    'passportElementErrorSourceTranslationFiles': 'PassportElementErrorSourceTranslationFiles',
+    'passportElementErrorSourceFile': 'PassportElementErrorSourceFile',
+    'passportElementErrorSourceFiles': 'PassportElementErrorSourceFiles',
+    'passportElementTypePersonalDetails': 'PassportElementTypePersonalDetails',
+    'passportElementTypePassport': 'PassportElementTypePassport',
+    'passportElementTypeDriverLicense': 'PassportElementTypeDriverLicense',
+    'passportElementTypeIdentityCard': 'PassportElementTypeIdentityCard',
+    'passportElementTypeInternalPassport': 'PassportElementTypeInternalPassport',
+    'passportElementTypeAddress': 'PassportElementTypeAddress',
+    'passportElementTypeUtilityBill': 'PassportElementTypeUtilityBill',
+    'passportElementTypeBankStatement': 'PassportElementTypeBankStatement',
+    'passportElementTypeRentalAgreement': 'PassportElementTypeRentalAgreement',
+    'passportElementTypePassportRegistration': 'PassportElementTypePassportRegistration',
+    'passportElementTypeTemporaryRegistration': 'PassportElementTypeTemporaryRegistration',
+    'passportElementTypePhoneNumber': 'PassportElementTypePhoneNumber',
+    'passportElementTypeEmailAddress': 'PassportElementTypeEmailAddress',
+    'passportElements': 'PassportElements',
+    'passportElementsWithErrors': 'PassportElementsWithErrors',
+    'passportSuitableElement': 'PassportSuitableElement',
+    'passwordState': 'PasswordState',
+    'PaymentProvider': 'PaymentProvider',
+    'paymentOption': 'PaymentOption',
+    'savedCredentials': 'SavedCredentials',
+    'paymentForm': 'PaymentForm',
+    'paymentProviderSmartGlocal': 'PaymentProviderSmartGlocal',
+    'paymentProviderStripe': 'PaymentProviderStripe',
+    'paymentProviderOther': 'PaymentProviderOther',
+    'shippingOption': 'ShippingOption',
+    'paymentReceipt': 'PaymentReceipt',
+    'paymentResult': 'PaymentResult',
+    'phoneNumberAuthenticationSettings': 'PhoneNumberAuthenticationSettings',
+    'phoneNumberInfo': 'PhoneNumberInfo',
+    'point': 'Point',
+    'pollOption': 'PollOption',
+    'pollTypeRegular': 'PollTypeRegular',
+    'pollTypeQuiz': 'PollTypeQuiz',
+    'PremiumFeature': 'PremiumFeature',
+    'premiumFeatureIncreasedLimits': 'PremiumFeatureIncreasedLimits',
+    'premiumFeatureIncreasedUploadFileSize': 'PremiumFeatureIncreasedUploadFileSize',
+    'premiumFeatureImprovedDownloadSpeed': 'PremiumFeatureImprovedDownloadSpeed',
+    'premiumFeatureVoiceRecognition': 'PremiumFeatureVoiceRecognition',
+    'premiumFeatureDisabledAds': 'PremiumFeatureDisabledAds',
+    'premiumFeatureUniqueReactions': 'PremiumFeatureUniqueReactions',
+    'premiumFeatureUniqueStickers': 'PremiumFeatureUniqueStickers',
+    'premiumFeatureCustomEmoji': 'PremiumFeatureCustomEmoji',
+    'premiumFeatureAdvancedChatManagement': 'PremiumFeatureAdvancedChatManagement',
+    'premiumFeatureProfileBadge': 'PremiumFeatureProfileBadge',
+    'premiumFeatureEmojiStatus': 'PremiumFeatureEmojiStatus',
+    'premiumFeatureAnimatedProfilePhoto': 'PremiumFeatureAnimatedProfilePhoto',
+    'premiumFeatureForumTopicIcon': 'PremiumFeatureForumTopicIcon',
+    'premiumFeatureAppIcons': 'PremiumFeatureAppIcons',
+    'premiumFeatureRealTimeChatTranslation': 'PremiumFeatureRealTimeChatTranslation',
+    'premiumFeatureUpgradedStories': 'PremiumFeatureUpgradedStories',
+    'premiumFeatureChatBoost': 'PremiumFeatureChatBoost',
+    'premiumFeatureAccentColor': 'PremiumFeatureAccentColor',
+    'premiumFeatureBackgroundForBoth': 'PremiumFeatureBackgroundForBoth',
+    'premiumFeaturePromotionAnimation': 'PremiumFeaturePromotionAnimation',
+    'premiumLimit': 'PremiumLimit',
+    'premiumFeatures': 'PremiumFeatures',
+    'premiumGiftCodeInfo': 'PremiumGiftCodeInfo',
+    'premiumGiftCodePaymentOption': 'PremiumGiftCodePaymentOption',
+    'premiumGiftCodePaymentOptions': 'PremiumGiftCodePaymentOptions',
+    'PremiumGiveawayParticipantStatus': 'PremiumGiveawayParticipantStatus',
+    'PremiumGiveawayInfo': 'PremiumGiveawayInfo',
+    'premiumGiveawayInfoOngoing': 'PremiumGiveawayInfoOngoing',
+    'premiumGiveawayInfoCompleted': 'PremiumGiveawayInfoCompleted',
+    'premiumGiveawayParticipantStatusEligible': 'PremiumGiveawayParticipantStatusEligible',
+    'premiumGiveawayParticipantStatusParticipating': 'PremiumGiveawayParticipantStatusParticipating',
+    'premiumGiveawayParticipantStatusAlreadyWasMember': 'PremiumGiveawayParticipantStatusAlreadyWasMember',
+    'premiumGiveawayParticipantStatusAdministrator': 'PremiumGiveawayParticipantStatusAdministrator',
+    'premiumGiveawayParticipantStatusDisallowedCountry': 'PremiumGiveawayParticipantStatusDisallowedCountry',
+    'PremiumLimitType': 'PremiumLimitType',
+    'premiumLimitTypeSupergroupCount': 'PremiumLimitTypeSupergroupCount',
+    'premiumLimitTypePinnedChatCount': 'PremiumLimitTypePinnedChatCount',
+    'premiumLimitTypeCreatedPublicChatCount': 'PremiumLimitTypeCreatedPublicChatCount',
+    'premiumLimitTypeSavedAnimationCount': 'PremiumLimitTypeSavedAnimationCount',
+    'premiumLimitTypeFavoriteStickerCount': 'PremiumLimitTypeFavoriteStickerCount',
+    'premiumLimitTypeChatFolderCount': 'PremiumLimitTypeChatFolderCount',
+    'premiumLimitTypeChatFolderChosenChatCount': 'PremiumLimitTypeChatFolderChosenChatCount',
+    'premiumLimitTypePinnedArchivedChatCount': 'PremiumLimitTypePinnedArchivedChatCount',
+    'premiumLimitTypeCaptionLength': 'PremiumLimitTypeCaptionLength',
+    'premiumLimitTypeBioLength': 'PremiumLimitTypeBioLength',
+    'premiumLimitTypeChatFolderInviteLinkCount': 'PremiumLimitTypeChatFolderInviteLinkCount',
+    'premiumLimitTypeShareableChatFolderCount': 'PremiumLimitTypeShareableChatFolderCount',
+    'premiumLimitTypeActiveStoryCount': 'PremiumLimitTypeActiveStoryCount',
+    'premiumLimitTypeWeeklySentStoryCount': 'PremiumLimitTypeWeeklySentStoryCount',
+    'premiumLimitTypeMonthlySentStoryCount': 'PremiumLimitTypeMonthlySentStoryCount',
+    'premiumLimitTypeStoryCaptionLength': 'PremiumLimitTypeStoryCaptionLength',
+    'premiumLimitTypeStorySuggestedReactionAreaCount': 'PremiumLimitTypeStorySuggestedReactionAreaCount',
+    'premiumLimitTypeSimilarChatCount': 'PremiumLimitTypeSimilarChatCount',
+    'premiumPaymentOption': 'PremiumPaymentOption',
+    'PremiumStoryFeature': 'PremiumStoryFeature',
+    'PremiumSource': 'PremiumSource',
+    'premiumSourceLimitExceeded': 'PremiumSourceLimitExceeded',
+    'premiumSourceFeature': 'PremiumSourceFeature',
+    'premiumSourceStoryFeature': 'PremiumSourceStoryFeature',
+    'premiumSourceLink': 'PremiumSourceLink',
+    'premiumSourceSettings': 'PremiumSourceSettings',
+    'premiumStatePaymentOption': 'PremiumStatePaymentOption',
+    'premiumState': 'PremiumState',
+    'premiumStoryFeaturePriorityOrder': 'PremiumStoryFeaturePriorityOrder',
+    'premiumStoryFeatureStealthMode': 'PremiumStoryFeatureStealthMode',
+    'premiumStoryFeaturePermanentViewsHistory': 'PremiumStoryFeaturePermanentViewsHistory',
+    'premiumStoryFeatureCustomExpirationDuration': 'PremiumStoryFeatureCustomExpirationDuration',
+    'premiumStoryFeatureSaveStories': 'PremiumStoryFeatureSaveStories',
+    'premiumStoryFeatureLinksAndFormatting': 'PremiumStoryFeatureLinksAndFormatting',
+    'profileAccentColors': 'ProfileAccentColors',
+    'profileAccentColor': 'ProfileAccentColor',
+    'profilePhoto': 'ProfilePhoto',
+    'proxy': 'Proxy',
+    'proxies': 'Proxies',
+    'proxyTypeSocks5': 'ProxyTypeSocks5',
+    'proxyTypeHttp': 'ProxyTypeHttp',
+    'proxyTypeMtproto': 'ProxyTypeMtproto',
+    'PublicChatType': 'PublicChatType',
+    'publicChatTypeHasUsername': 'PublicChatTypeHasUsername',
+    'publicChatTypeIsLocationBased': 'PublicChatTypeIsLocationBased',
+    'story': 'Story',
+    'PublicForward': 'PublicForward',
+    'publicForwardMessage': 'PublicForwardMessage',
+    'publicForwardStory': 'PublicForwardStory',
+    'publicForwards': 'PublicForwards',
+    'pushMessageContentHidden': 'PushMessageContentHidden',
+    'pushMessageContentAnimation': 'PushMessageContentAnimation',
+    'pushMessageContentAudio': 'PushMessageContentAudio',
+    'pushMessageContentContact': 'PushMessageContentContact',
+    'pushMessageContentContactRegistered': 'PushMessageContentContactRegistered',
+    'pushMessageContentDocument': 'PushMessageContentDocument',
+    'pushMessageContentGame': 'PushMessageContentGame',
+    'pushMessageContentGameScore': 'PushMessageContentGameScore',
+    'pushMessageContentInvoice': 'PushMessageContentInvoice',
+    'pushMessageContentLocation': 'PushMessageContentLocation',
+    'pushMessageContentPhoto': 'PushMessageContentPhoto',
+    'pushMessageContentPoll': 'PushMessageContentPoll',
+    'pushMessageContentPremiumGiftCode': 'PushMessageContentPremiumGiftCode',
+    'pushMessageContentPremiumGiveaway': 'PushMessageContentPremiumGiveaway',
+    'pushMessageContentScreenshotTaken': 'PushMessageContentScreenshotTaken',
+    'pushMessageContentSticker': 'PushMessageContentSticker',
+    'pushMessageContentStory': 'PushMessageContentStory',
+    'pushMessageContentText': 'PushMessageContentText',
+    'pushMessageContentVideo': 'PushMessageContentVideo',
+    'pushMessageContentVideoNote': 'PushMessageContentVideoNote',
+    'pushMessageContentVoiceNote': 'PushMessageContentVoiceNote',
+    'pushMessageContentBasicGroupChatCreate': 'PushMessageContentBasicGroupChatCreate',
+    'pushMessageContentChatAddMembers': 'PushMessageContentChatAddMembers',
+    'pushMessageContentChatChangePhoto': 'PushMessageContentChatChangePhoto',
+    'pushMessageContentChatChangeTitle': 'PushMessageContentChatChangeTitle',
+    'pushMessageContentChatSetBackground': 'PushMessageContentChatSetBackground',
+    'pushMessageContentChatSetTheme': 'PushMessageContentChatSetTheme',
+    'pushMessageContentChatDeleteMember': 'PushMessageContentChatDeleteMember',
+    'pushMessageContentChatJoinByLink': 'PushMessageContentChatJoinByLink',
+    'pushMessageContentChatJoinByRequest': 'PushMessageContentChatJoinByRequest',
+    'pushMessageContentRecurringPayment': 'PushMessageContentRecurringPayment',
+    'pushMessageContentSuggestProfilePhoto': 'PushMessageContentSuggestProfilePhoto',
+    'pushMessageContentMessageForwards': 'PushMessageContentMessageForwards',
+    'pushMessageContentMediaAlbum': 'PushMessageContentMediaAlbum',
+    'pushReceiverId': 'PushReceiverId',
+    'reactionTypeEmoji': 'ReactionTypeEmoji',
+    'reactionTypeCustomEmoji': 'ReactionTypeCustomEmoji',
+    'recommendedChatFolder': 'RecommendedChatFolder',
+    'recommendedChatFolders': 'RecommendedChatFolders',
+    'recoveryEmailAddress': 'RecoveryEmailAddress',
+    'replyMarkupRemoveKeyboard': 'ReplyMarkupRemoveKeyboard',
+    'replyMarkupForceReply': 'ReplyMarkupForceReply',
+    'replyMarkupShowKeyboard': 'ReplyMarkupShowKeyboard',
+    'replyMarkupInlineKeyboard': 'ReplyMarkupInlineKeyboard',
+    'ReportReason': 'ReportReason',
+    'reportReasonSpam': 'ReportReasonSpam',
+    'reportReasonViolence': 'ReportReasonViolence',
+    'reportReasonPornography': 'ReportReasonPornography',
+    'reportReasonChildAbuse': 'ReportReasonChildAbuse',
+    'reportReasonCopyright': 'ReportReasonCopyright',
+    'reportReasonUnrelatedLocation': 'ReportReasonUnrelatedLocation',
+    'reportReasonFake': 'ReportReasonFake',
+    'reportReasonIllegalDrugs': 'ReportReasonIllegalDrugs',
+    'reportReasonPersonalDetails': 'ReportReasonPersonalDetails',
+    'reportReasonCustom': 'ReportReasonCustom',
+    'ResetPasswordResult': 'ResetPasswordResult',
+    'resetPasswordResultOk': 'ResetPasswordResultOk',
+    'resetPasswordResultPending': 'ResetPasswordResultPending',
+    'resetPasswordResultDeclined': 'ResetPasswordResultDeclined',
+    'richTextPlain': 'RichTextPlain',
+    'richTextBold': 'RichTextBold',
+    'richTextItalic': 'RichTextItalic',
+    'richTextUnderline': 'RichTextUnderline',
+    'richTextStrikethrough': 'RichTextStrikethrough',
+    'richTextFixed': 'RichTextFixed',
+    'richTextUrl': 'RichTextUrl',
+    'richTextEmailAddress': 'RichTextEmailAddress',
+    'richTextSubscript': 'RichTextSubscript',
+    'richTextSuperscript': 'RichTextSuperscript',
+    'richTextMarked': 'RichTextMarked',
+    'richTextPhoneNumber': 'RichTextPhoneNumber',
+    'richTextIcon': 'RichTextIcon',
+    'richTextReference': 'RichTextReference',
+    'richTextAnchor': 'RichTextAnchor',
+    'richTextAnchorLink': 'RichTextAnchorLink',
+    'richTexts': 'RichTexts',
+    'rtmpUrl': 'RtmpUrl',
+    'scopeNotificationSettings': 'ScopeNotificationSettings',
+    'SearchMessagesFilter': 'SearchMessagesFilter',
+    'searchMessagesFilterEmpty': 'SearchMessagesFilterEmpty',
+    'searchMessagesFilterAnimation': 'SearchMessagesFilterAnimation',
+    'searchMessagesFilterAudio': 'SearchMessagesFilterAudio',
+    'searchMessagesFilterDocument': 'SearchMessagesFilterDocument',
+    'searchMessagesFilterPhoto': 'SearchMessagesFilterPhoto',
+    'searchMessagesFilterVideo': 'SearchMessagesFilterVideo',
+    'searchMessagesFilterVoiceNote': 'SearchMessagesFilterVoiceNote',
+    'searchMessagesFilterPhotoAndVideo': 'SearchMessagesFilterPhotoAndVideo',
+    'searchMessagesFilterUrl': 'SearchMessagesFilterUrl',
+    'searchMessagesFilterChatPhoto': 'SearchMessagesFilterChatPhoto',
+    'searchMessagesFilterVideoNote': 'SearchMessagesFilterVideoNote',
+    'searchMessagesFilterVoiceAndVideoNote': 'SearchMessagesFilterVoiceAndVideoNote',
+    'searchMessagesFilterMention': 'SearchMessagesFilterMention',
+    'searchMessagesFilterUnreadMention': 'SearchMessagesFilterUnreadMention',
+    'searchMessagesFilterUnreadReaction': 'SearchMessagesFilterUnreadReaction',
+    'searchMessagesFilterFailedToSend': 'SearchMessagesFilterFailedToSend',
+    'searchMessagesFilterPinned': 'SearchMessagesFilterPinned',
+    'seconds': 'Seconds',
+    'SecretChatState': 'SecretChatState',
+    'secretChat': 'SecretChat',
+    'secretChatStatePending': 'SecretChatStatePending',
+    'secretChatStateReady': 'SecretChatStateReady',
+    'secretChatStateClosed': 'SecretChatStateClosed',
+    'sentWebAppMessage': 'SentWebAppMessage',
+    'SessionType': 'SessionType',
+    'session': 'Session',
+    'sessionTypeAndroid': 'SessionTypeAndroid',
+    'sessionTypeApple': 'SessionTypeApple',
+    'sessionTypeBrave': 'SessionTypeBrave',
+    'sessionTypeChrome': 'SessionTypeChrome',
+    'sessionTypeEdge': 'SessionTypeEdge',
+    'sessionTypeFirefox': 'SessionTypeFirefox',
+    'sessionTypeIpad': 'SessionTypeIpad',
+    'sessionTypeIphone': 'SessionTypeIphone',
+    'sessionTypeLinux': 'SessionTypeLinux',
+    'sessionTypeMac': 'SessionTypeMac',
+    'sessionTypeOpera': 'SessionTypeOpera',
+    'sessionTypeSafari': 'SessionTypeSafari',
+    'sessionTypeUbuntu': 'SessionTypeUbuntu',
+    'sessionTypeUnknown': 'SessionTypeUnknown',
+    'sessionTypeVivaldi': 'SessionTypeVivaldi',
+    'sessionTypeWindows': 'SessionTypeWindows',
+    'sessionTypeXbox': 'SessionTypeXbox',
+    'sessions': 'Sessions',
+    'SpeechRecognitionResult': 'SpeechRecognitionResult',
+    'speechRecognitionResultPending': 'SpeechRecognitionResultPending',
+    'speechRecognitionResultText': 'SpeechRecognitionResultText',
+    'speechRecognitionResultError': 'SpeechRecognitionResultError',
+    'sponsoredMessage': 'SponsoredMessage',
+    'sponsoredMessages': 'SponsoredMessages',
+    'statisticalGraphData': 'StatisticalGraphData',
+    'statisticalGraphAsync': 'StatisticalGraphAsync',
+    'statisticalGraphError': 'StatisticalGraphError',
+    'StickerFormat': 'StickerFormat',
+    'StickerFullType': 'StickerFullType',
+    'stickerFormatWebp': 'StickerFormatWebp',
+    'stickerFormatTgs': 'StickerFormatTgs',
+    'stickerFormatWebm': 'StickerFormatWebm',
+    'stickerFullTypeRegular': 'StickerFullTypeRegular',
+    'stickerFullTypeMask': 'StickerFullTypeMask',
+    'stickerFullTypeCustomEmoji': 'StickerFullTypeCustomEmoji',
+    'StickerType': 'StickerType',
+    'stickerSet': 'StickerSet',
+    'stickerSetInfo': 'StickerSetInfo',
+    'stickerSets': 'StickerSets',
+    'stickerTypeRegular': 'StickerTypeRegular',
+    'stickerTypeMask': 'StickerTypeMask',
+    'stickerTypeCustomEmoji': 'StickerTypeCustomEmoji',
+    'stickers': 'Stickers',
+    'storageStatisticsByChat': 'StorageStatisticsByChat',
+    'storageStatistics': 'StorageStatistics',
+    'storageStatisticsByFileType': 'StorageStatisticsByFileType',
+    'storageStatisticsFast': 'StorageStatisticsFast',
+    'StorePaymentPurpose': 'StorePaymentPurpose',
+    'storePaymentPurposePremiumSubscription': 'StorePaymentPurposePremiumSubscription',
+    'storePaymentPurposeGiftedPremium': 'StorePaymentPurposeGiftedPremium',
+    'storePaymentPurposePremiumGiftCodes': 'StorePaymentPurposePremiumGiftCodes',
+    'storePaymentPurposePremiumGiveaway': 'StorePaymentPurposePremiumGiveaway',
+    'stories': 'Stories',
+    'StoryContent': 'StoryContent',
+    'StoryPrivacySettings': 'StoryPrivacySettings',
+    'storyArea': 'StoryArea',
+    'storyInteractionInfo': 'StoryInteractionInfo',
+    'storyRepostInfo': 'StoryRepostInfo',
+    'StoryAreaType': 'StoryAreaType',
+    'storyAreaTypeLocation': 'StoryAreaTypeLocation',
+    'storyAreaTypeVenue': 'StoryAreaTypeVenue',
+    'storyAreaTypeSuggestedReaction': 'StoryAreaTypeSuggestedReaction',
+    'storyAreaTypeMessage': 'StoryAreaTypeMessage',
+    'storyVideo': 'StoryVideo',
+    'storyContentPhoto': 'StoryContentPhoto',
+    'storyContentVideo': 'StoryContentVideo',
+    'storyContentUnsupported': 'StoryContentUnsupported',
+    'storyFullId': 'StoryFullId',
+    'StoryInteractionType': 'StoryInteractionType',
+    'storyInteraction': 'StoryInteraction',
+    'storyInteractionTypeView': 'StoryInteractionTypeView',
+    'storyInteractionTypeForward': 'StoryInteractionTypeForward',
+    'storyInteractionTypeRepost': 'StoryInteractionTypeRepost',
+    'storyInteractions': 'StoryInteractions',
+    'storyListMain': 'StoryListMain',
+    'storyListArchive': 'StoryListArchive',
+    'StoryOrigin': 'StoryOrigin',
+    'storyOriginPublicStory': 'StoryOriginPublicStory',
+    'storyOriginHiddenUser': 'StoryOriginHiddenUser',
+    'storyPrivacySettingsEveryone': 'StoryPrivacySettingsEveryone',
+    'storyPrivacySettingsContacts': 'StoryPrivacySettingsContacts',
+    'storyPrivacySettingsCloseFriends': 'StoryPrivacySettingsCloseFriends',
+    'storyPrivacySettingsSelectedUsers': 'StoryPrivacySettingsSelectedUsers',
+    'storyStatistics': 'StoryStatistics',
+    'SuggestedAction': 'SuggestedAction',
+    'suggestedActionEnableArchiveAndMuteNewChats': 'SuggestedActionEnableArchiveAndMuteNewChats',
+    'suggestedActionCheckPassword': 'SuggestedActionCheckPassword',
+    'suggestedActionCheckPhoneNumber': 'SuggestedActionCheckPhoneNumber',
+    'suggestedActionViewChecksHint': 'SuggestedActionViewChecksHint',
+    'suggestedActionConvertToBroadcastGroup': 'SuggestedActionConvertToBroadcastGroup',
+    'suggestedActionSetPassword': 'SuggestedActionSetPassword',
+    'suggestedActionUpgradePremium': 'SuggestedActionUpgradePremium',
+    'suggestedActionRestorePremium': 'SuggestedActionRestorePremium',
+    'suggestedActionSubscribeToAnnualPremium': 'SuggestedActionSubscribeToAnnualPremium',
+    'suggestedActionGiftPremiumForChristmas': 'SuggestedActionGiftPremiumForChristmas',
+    'usernames': 'Usernames',
+    'supergroup': 'Supergroup',
+    'supergroupFullInfo': 'SupergroupFullInfo',
+    'SupergroupMembersFilter': 'SupergroupMembersFilter',
+    'supergroupMembersFilterRecent': 'SupergroupMembersFilterRecent',
+    'supergroupMembersFilterContacts': 'SupergroupMembersFilterContacts',
+    'supergroupMembersFilterAdministrators': 'SupergroupMembersFilterAdministrators',
+    'supergroupMembersFilterSearch': 'SupergroupMembersFilterSearch',
+    'supergroupMembersFilterRestricted': 'SupergroupMembersFilterRestricted',
+    'supergroupMembersFilterBanned': 'SupergroupMembersFilterBanned',
+    'supergroupMembersFilterMention': 'SupergroupMembersFilterMention',
+    'supergroupMembersFilterBots': 'SupergroupMembersFilterBots',
+    'TMeUrlType': 'TMeUrlType',
+    'tMeUrl': 'TMeUrl',
+    'tMeUrlTypeUser': 'TMeUrlTypeUser',
+    'tMeUrlTypeSupergroup': 'TMeUrlTypeSupergroup',
+    'tMeUrlTypeChatInvite': 'TMeUrlTypeChatInvite',
+    'tMeUrlTypeStickerSet': 'TMeUrlTypeStickerSet',
+    'tMeUrls': 'TMeUrls',
+    'targetChatCurrent': 'TargetChatCurrent',
+    'targetChatChosen': 'TargetChatChosen',
+    'targetChatInternalLink': 'TargetChatInternalLink',
+    'telegramPaymentPurposePremiumGiftCodes': 'TelegramPaymentPurposePremiumGiftCodes',
+    'telegramPaymentPurposePremiumGiveaway': 'TelegramPaymentPurposePremiumGiveaway',
+    'temporaryPasswordState': 'TemporaryPasswordState',
+    'testBytes': 'TestBytes',
+    'testInt': 'TestInt',
+    'testString': 'TestString',
+    'testVectorInt': 'TestVectorInt',
+    'testVectorIntObject': 'TestVectorIntObject',
+    'testVectorString': 'TestVectorString',
+    'testVectorStringObject': 'TestVectorStringObject',
+    'text': 'Text',
+    'textEntities': 'TextEntities',
+    'TextEntityType': 'TextEntityType',
+    'textEntityTypeMention': 'TextEntityTypeMention',
+    'textEntityTypeHashtag': 'TextEntityTypeHashtag',
+    'textEntityTypeCashtag': 'TextEntityTypeCashtag',
+    'textEntityTypeBotCommand': 'TextEntityTypeBotCommand',
+    'textEntityTypeUrl': 'TextEntityTypeUrl',
+    'textEntityTypeEmailAddress': 'TextEntityTypeEmailAddress',
+    'textEntityTypePhoneNumber': 'TextEntityTypePhoneNumber',
+    'textEntityTypeBankCardNumber': 'TextEntityTypeBankCardNumber',
+    'textEntityTypeBold': 'TextEntityTypeBold',
+    'textEntityTypeItalic': 'TextEntityTypeItalic',
+    'textEntityTypeUnderline': 'TextEntityTypeUnderline',
+    'textEntityTypeStrikethrough': 'TextEntityTypeStrikethrough',
+    'textEntityTypeSpoiler': 'TextEntityTypeSpoiler',
+    'textEntityTypeCode': 'TextEntityTypeCode',
+    'textEntityTypePre': 'TextEntityTypePre',
+    'textEntityTypePreCode': 'TextEntityTypePreCode',
+    'textEntityTypeBlockQuote': 'TextEntityTypeBlockQuote',
+    'textEntityTypeTextUrl': 'TextEntityTypeTextUrl',
+    'textEntityTypeMentionName': 'TextEntityTypeMentionName',
+    'textEntityTypeCustomEmoji': 'TextEntityTypeCustomEmoji',
+    'textEntityTypeMediaTimestamp': 'TextEntityTypeMediaTimestamp',
+    'TextParseMode': 'TextParseMode',
+    'textParseModeMarkdown': 'TextParseModeMarkdown',
+    'textParseModeHTML': 'TextParseModeHTML',
+    'themeParameters': 'ThemeParameters',
+    'ThumbnailFormat': 'ThumbnailFormat',
+    'thumbnailFormatJpeg': 'ThumbnailFormatJpeg',
+    'thumbnailFormatGif': 'ThumbnailFormatGif',
+    'thumbnailFormatMpeg4': 'ThumbnailFormatMpeg4',
+    'thumbnailFormatPng': 'ThumbnailFormatPng',
+    'thumbnailFormatTgs': 'ThumbnailFormatTgs',
+    'thumbnailFormatWebm': 'ThumbnailFormatWebm',
+    'thumbnailFormatWebp': 'ThumbnailFormatWebp',
+    'TopChatCategory': 'TopChatCategory',
+    'topChatCategoryUsers': 'TopChatCategoryUsers',
+    'topChatCategoryBots': 'TopChatCategoryBots',
+    'topChatCategoryGroups': 'TopChatCategoryGroups',
+    'topChatCategoryChannels': 'TopChatCategoryChannels',
+    'topChatCategoryInlineBots': 'TopChatCategoryInlineBots',
+    'topChatCategoryCalls': 'TopChatCategoryCalls',
+    'topChatCategoryForwardChats': 'TopChatCategoryForwardChats',
+    'trendingStickerSets': 'TrendingStickerSets',
+    'unconfirmedSession': 'UnconfirmedSession',
+    'UserPrivacySetting': 'UserPrivacySetting',
+    'UserStatus': 'UserStatus',
+    'user': 'User',
+    'userFullInfo': 'UserFullInfo',
+    'userPrivacySettingRules': 'UserPrivacySettingRules',
+    'Update': 'Update',
+    'updateAuthorizationState': 'UpdateAuthorizationState',
+    'updateNewMessage': 'UpdateNewMessage',
+    'updateMessageSendAcknowledged': 'UpdateMessageSendAcknowledged',
+    'updateMessageSendSucceeded': 'UpdateMessageSendSucceeded',
+    'updateMessageSendFailed': 'UpdateMessageSendFailed',
+    'updateMessageContent': 'UpdateMessageContent',
+    'updateMessageEdited': 'UpdateMessageEdited',
+    'updateMessageIsPinned': 'UpdateMessageIsPinned',
+    'updateMessageInteractionInfo': 'UpdateMessageInteractionInfo',
+    'updateMessageContentOpened': 'UpdateMessageContentOpened',
+    'updateMessageMentionRead': 'UpdateMessageMentionRead',
+    'updateMessageUnreadReactions': 'UpdateMessageUnreadReactions',
+    'updateMessageLiveLocationViewed': 'UpdateMessageLiveLocationViewed',
+    'updateNewChat': 'UpdateNewChat',
+    'updateChatTitle': 'UpdateChatTitle',
+    'updateChatPhoto': 'UpdateChatPhoto',
+    'updateChatAccentColors': 'UpdateChatAccentColors',
+    'updateChatPermissions': 'UpdateChatPermissions',
+    'updateChatLastMessage': 'UpdateChatLastMessage',
+    'updateChatPosition': 'UpdateChatPosition',
+    'updateChatReadInbox': 'UpdateChatReadInbox',
+    'updateChatReadOutbox': 'UpdateChatReadOutbox',
+    'updateChatActionBar': 'UpdateChatActionBar',
+    'updateChatAvailableReactions': 'UpdateChatAvailableReactions',
+    'updateChatDraftMessage': 'UpdateChatDraftMessage',
+    'updateChatEmojiStatus': 'UpdateChatEmojiStatus',
+    'updateChatMessageSender': 'UpdateChatMessageSender',
+    'updateChatMessageAutoDeleteTime': 'UpdateChatMessageAutoDeleteTime',
+    'updateChatNotificationSettings': 'UpdateChatNotificationSettings',
+    'updateChatPendingJoinRequests': 'UpdateChatPendingJoinRequests',
+    'updateChatReplyMarkup': 'UpdateChatReplyMarkup',
+    'updateChatBackground': 'UpdateChatBackground',
+    'updateChatTheme': 'UpdateChatTheme',
+    'updateChatUnreadMentionCount': 'UpdateChatUnreadMentionCount',
+    'updateChatUnreadReactionCount': 'UpdateChatUnreadReactionCount',
+    'updateChatVideoChat': 'UpdateChatVideoChat',
+    'updateChatDefaultDisableNotification': 'UpdateChatDefaultDisableNotification',
+    'updateChatHasProtectedContent': 'UpdateChatHasProtectedContent',
+    'updateChatIsTranslatable': 'UpdateChatIsTranslatable',
+    'updateChatIsMarkedAsUnread': 'UpdateChatIsMarkedAsUnread',
+    'updateChatViewAsTopics': 'UpdateChatViewAsTopics',
+    'updateChatBlockList': 'UpdateChatBlockList',
+    'updateChatHasScheduledMessages': 'UpdateChatHasScheduledMessages',
+    'updateChatFolders': 'UpdateChatFolders',
+    'updateChatOnlineMemberCount': 'UpdateChatOnlineMemberCount',
+    'updateForumTopicInfo': 'UpdateForumTopicInfo',
+    'updateScopeNotificationSettings': 'UpdateScopeNotificationSettings',
+    'updateNotification': 'UpdateNotification',
+    'updateNotificationGroup': 'UpdateNotificationGroup',
+    'updateActiveNotifications': 'UpdateActiveNotifications',
+    'updateHavePendingNotifications': 'UpdateHavePendingNotifications',
+    'updateDeleteMessages': 'UpdateDeleteMessages',
+    'updateChatAction': 'UpdateChatAction',
+    'updateUserStatus': 'UpdateUserStatus',
+    'updateUser': 'UpdateUser',
+    'updateBasicGroup': 'UpdateBasicGroup',
+    'updateSupergroup': 'UpdateSupergroup',
+    'updateSecretChat': 'UpdateSecretChat',
+    'updateUserFullInfo': 'UpdateUserFullInfo',
+    'updateBasicGroupFullInfo': 'UpdateBasicGroupFullInfo',
+    'updateSupergroupFullInfo': 'UpdateSupergroupFullInfo',
+    'updateServiceNotification': 'UpdateServiceNotification',
+    'updateFile': 'UpdateFile',
+    'updateFileGenerationStart': 'UpdateFileGenerationStart',
+    'updateFileGenerationStop': 'UpdateFileGenerationStop',
+    'updateFileDownloads': 'UpdateFileDownloads',
+    'updateFileAddedToDownloads': 'UpdateFileAddedToDownloads',
+    'updateFileDownload': 'UpdateFileDownload',
+    'updateFileRemovedFromDownloads': 'UpdateFileRemovedFromDownloads',
+    'updateCall': 'UpdateCall',
+    'updateGroupCall': 'UpdateGroupCall',
+    'updateGroupCallParticipant': 'UpdateGroupCallParticipant',
+    'updateNewCallSignalingData': 'UpdateNewCallSignalingData',
+    'updateUserPrivacySettingRules': 'UpdateUserPrivacySettingRules',
+    'updateUnreadMessageCount': 'UpdateUnreadMessageCount',
+    'updateUnreadChatCount': 'UpdateUnreadChatCount',
+    'updateStory': 'UpdateStory',
+    'updateStoryDeleted': 'UpdateStoryDeleted',
+    'updateStorySendSucceeded': 'UpdateStorySendSucceeded',
+    'updateStorySendFailed': 'UpdateStorySendFailed',
+    'updateChatActiveStories': 'UpdateChatActiveStories',
+    'updateStoryListChatCount': 'UpdateStoryListChatCount',
+    'updateStoryStealthMode': 'UpdateStoryStealthMode',
+    'updateOption': 'UpdateOption',
+    'updateStickerSet': 'UpdateStickerSet',
+    'updateInstalledStickerSets': 'UpdateInstalledStickerSets',
+    'updateTrendingStickerSets': 'UpdateTrendingStickerSets',
+    'updateRecentStickers': 'UpdateRecentStickers',
+    'updateFavoriteStickers': 'UpdateFavoriteStickers',
+    'updateSavedAnimations': 'UpdateSavedAnimations',
+    'updateSavedNotificationSounds': 'UpdateSavedNotificationSounds',
+    'updateDefaultBackground': 'UpdateDefaultBackground',
+    'updateChatThemes': 'UpdateChatThemes',
+    'updateAccentColors': 'UpdateAccentColors',
+    'updateProfileAccentColors': 'UpdateProfileAccentColors',
+    'updateLanguagePackStrings': 'UpdateLanguagePackStrings',
+    'updateConnectionState': 'UpdateConnectionState',
+    'updateTermsOfService': 'UpdateTermsOfService',
+    'updateUsersNearby': 'UpdateUsersNearby',
+    'updateUnconfirmedSession': 'UpdateUnconfirmedSession',
+    'updateAttachmentMenuBots': 'UpdateAttachmentMenuBots',
+    'updateWebAppMessageSent': 'UpdateWebAppMessageSent',
+    'updateActiveEmojiReactions': 'UpdateActiveEmojiReactions',
+    'updateDefaultReactionType': 'UpdateDefaultReactionType',
+    'updateSpeechRecognitionTrial': 'UpdateSpeechRecognitionTrial',
+    'updateDiceEmojis': 'UpdateDiceEmojis',
+    'updateAnimatedEmojiMessageClicked': 'UpdateAnimatedEmojiMessageClicked',
+    'updateAnimationSearchParameters': 'UpdateAnimationSearchParameters',
+    'updateSuggestedActions': 'UpdateSuggestedActions',
+    'updateAddChatMembersPrivacyForbidden': 'UpdateAddChatMembersPrivacyForbidden',
+    'updateAutosaveSettings': 'UpdateAutosaveSettings',
+    'updateNewInlineQuery': 'UpdateNewInlineQuery',
+    'updateNewChosenInlineResult': 'UpdateNewChosenInlineResult',
+    'updateNewCallbackQuery': 'UpdateNewCallbackQuery',
+    'updateNewInlineCallbackQuery': 'UpdateNewInlineCallbackQuery',
+    'updateNewShippingQuery': 'UpdateNewShippingQuery',
+    'updateNewPreCheckoutQuery': 'UpdateNewPreCheckoutQuery',
+    'updateNewCustomEvent': 'UpdateNewCustomEvent',
+    'updateNewCustomQuery': 'UpdateNewCustomQuery',
+    'updatePoll': 'UpdatePoll',
+    'updatePollAnswer': 'UpdatePollAnswer',
+    'updateChatMember': 'UpdateChatMember',
+    'updateNewChatJoinRequest': 'UpdateNewChatJoinRequest',
+    'updateChatBoost': 'UpdateChatBoost',
+    'updateMessageReaction': 'UpdateMessageReaction',
+    'updateMessageReactions': 'UpdateMessageReactions',
+    'updates': 'Updates',
+    'UserType': 'UserType',
+    'userLink': 'UserLink',
+    'userPrivacySettingShowStatus': 'UserPrivacySettingShowStatus',
+    'userPrivacySettingShowProfilePhoto': 'UserPrivacySettingShowProfilePhoto',
+    'userPrivacySettingShowLinkInForwardedMessages': 'UserPrivacySettingShowLinkInForwardedMessages',
+    'userPrivacySettingShowPhoneNumber': 'UserPrivacySettingShowPhoneNumber',
+    'userPrivacySettingShowBio': 'UserPrivacySettingShowBio',
+    'userPrivacySettingAllowChatInvites': 'UserPrivacySettingAllowChatInvites',
+    'userPrivacySettingAllowCalls': 'UserPrivacySettingAllowCalls',
+    'userPrivacySettingAllowPeerToPeerCalls': 'UserPrivacySettingAllowPeerToPeerCalls',
+    'userPrivacySettingAllowFindingByPhoneNumber': 'UserPrivacySettingAllowFindingByPhoneNumber',
+    'userPrivacySettingAllowPrivateVoiceAndVideoNoteMessages': 'UserPrivacySettingAllowPrivateVoiceAndVideoNoteMessages',
+    'UserPrivacySettingRule': 'UserPrivacySettingRule',
+    'userPrivacySettingRuleAllowAll': 'UserPrivacySettingRuleAllowAll',
+    'userPrivacySettingRuleAllowContacts': 'UserPrivacySettingRuleAllowContacts',
+    'userPrivacySettingRuleAllowUsers': 'UserPrivacySettingRuleAllowUsers',
+    'userPrivacySettingRuleAllowChatMembers': 'UserPrivacySettingRuleAllowChatMembers',
+    'userPrivacySettingRuleRestrictAll': 'UserPrivacySettingRuleRestrictAll',
+    'userPrivacySettingRuleRestrictContacts': 'UserPrivacySettingRuleRestrictContacts',
+    'userPrivacySettingRuleRestrictUsers': 'UserPrivacySettingRuleRestrictUsers',
+    'userPrivacySettingRuleRestrictChatMembers': 'UserPrivacySettingRuleRestrictChatMembers',
+    'userStatusEmpty': 'UserStatusEmpty',
+    'userStatusOnline': 'UserStatusOnline',
+    'userStatusOffline': 'UserStatusOffline',
+    'userStatusRecently': 'UserStatusRecently',
+    'userStatusLastWeek': 'UserStatusLastWeek',
+    'userStatusLastMonth': 'UserStatusLastMonth',
+    'userSupportInfo': 'UserSupportInfo',
+    'userTypeRegular': 'UserTypeRegular',
+    'userTypeDeleted': 'UserTypeDeleted',
+    'userTypeBot': 'UserTypeBot',
+    'userTypeUnknown': 'UserTypeUnknown',
+    'users': 'Users',
+    'validatedOrderInfo': 'ValidatedOrderInfo',
+    'vectorPathCommandLine': 'VectorPathCommandLine',
+    'vectorPathCommandCubicBezierCurve': 'VectorPathCommandCubicBezierCurve',
+    'webAppInfo': 'WebAppInfo',
+    'webPageInstantView': 'WebPageInstantView',
+}
+
+
+def __getattr__(name):
+    if (module := _class_modules.get(name)) is None:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+    cls = globals()[name] = getattr(importlib.import_module(f'{__name__}.objects.{module}'), name)
+    return cls
+
+
+def __dir__():
+    return sorted({*globals(), *_class_modules})
+
+
+client = None
+
+
+def acceptCall(call_id: int = None, protocol: CallProtocol = None, ):
+    return client.send({
+        '@type': 'acceptCall',
+        'call_id': to_json(call_id),
+        'protocol': to_json(protocol),
+    })
+
+
+def acceptTermsOfService(terms_of_service_id: str = None, ):
+    return client.send({
+        '@type': 'acceptTermsOfService',
+        'terms_of_service_id': to_json(terms_of_service_id),
+    })
+
+
+def activateStoryStealthMode():
+    return client.send({
+        '@type': 'activateStoryStealthMode',
+    })
+
+
+def addChatFolderByInviteLink(invite_link: str = None, chat_ids: list[int] = None, ):
+    return client.send({
+        '@type': 'addChatFolderByInviteLink',
+        'invite_link': to_json(invite_link),
+        'chat_ids': to_json(chat_ids),
+    })
+
+
+def addChatMember(chat_id: int = None, user_id: int = None, forward_limit: int = None, ):
+    return client.send({
+        '@type': 'addChatMember',
+        'chat_id': to_json(chat_id),
+        'user_id': to_json(user_id),
+        'forward_limit': to_json(forward_limit),
+    })
+
+
+def addChatMembers(chat_id: int = None, user_ids: list[int] = None, ):
+    return client.send({
+        '@type': 'addChatMembers',
+        'chat_id': to_json(chat_id),
+        'user_ids': to_json(user_ids),
+    })
+
+
+def addChatToList(chat_id: int = None, chat_list: ChatList = None, ):
+    return client.send({
+        '@type': 'addChatToList',
+        'chat_id': to_json(chat_id),
+        'chat_list': to_json(chat_list),
+    })
+
+
+def addContact(contact: Contact = None, share_phone_number: bool = None, ):
+    return client.send({
+        '@type': 'addContact',
+        'contact': to_json(contact),
+        'share_phone_number': to_json(share_phone_number),
+    })
+
+
+def addCustomServerLanguagePack(language_pack_id: str = None, ):
+    return client.send({
+        '@type': 'addCustomServerLanguagePack',
+        'language_pack_id': to_json(language_pack_id),
+    })
+
+
+def addFavoriteSticker(sticker: InputFile = None, ):
+    return client.send({
+        '@type': 'addFavoriteSticker',
+        'sticker': to_json(sticker),
+    })
+
+
+def addFileToDownloads(file_id: int = None, chat_id: int = None, message_id: int = None, priority: int = None, ):
+    return client.send({
+        '@type': 'addFileToDownloads',
+        'file_id': to_json(file_id),
+        'chat_id': to_json(chat_id),
+        'message_id': to_json(message_id),
+        'priority': to_json(priority),
+    })
+
+
+def addLocalMessage(chat_id: int = None, sender_id: MessageSender = None, reply_to: InputMessageReplyTo = None, disable_notification: bool = None, input_message_content: InputMessageContent = None, ):
+    return client.send({
+        '@type': 'addLocalMessage',
+        'chat_id': to_json(chat_id),
+        'sender_id': to_json(sender_id),
+        'reply_to': to_json(reply_to),
+        'disable_notification': to_json(disable_notification),
+        'input_message_content': to_json(input_message_content),
+    })
+
+
+def addLogMessage(verbosity_level: int = None, text: str = None, ):
+    return client.send({
+        '@type': 'addLogMessage',
+        'verbosity_level': to_json(verbosity_level),
+        'text': to_json(text),
+    })
+
+
+def addMessageReaction(chat_id: int = None, message_id: int = None, reaction_type: ReactionType = None, is_big: bool = None, update_recent_reactions: bool = None, ):
+    return client.send({
+        '@type': 'addMessageReaction',
+        'chat_id': to_json(chat_id),
+        'message_id': to_json(message_id),
+        'reaction_type': to_json(reaction_type),
+        'is_big': to_json(is_big),
+        'update_recent_reactions': to_json(update_recent_reactions),
+    })
+
+
+def addNetworkStatistics(entry: NetworkStatisticsEntry = None, ):
+    return client.send({
+        '@type': 'addNetworkStatistics',
+        'entry': to_json(entry),
+    })
+
+
+def addProxy(server: str = None, port: int = None, enable: bool = None, type: ProxyType = None, ):
+    return client.send({
+        '@type': 'addProxy',
+        'server': to_json(server),
+        'port': to_json(port),
+        'enable': to_json(enable),
+        'type': to_json(type),
+    })
+
+
+def addRecentSticker(is_attached: bool = None, sticker: InputFile = None, ):
+    return client.send({
+        '@type': 'addRecentSticker',
+        'is_attached': to_json(is_attached),
+        'sticker': to_json(sticker),
+    })
+
+
+def addRecentlyFoundChat(chat_id: int = None, ):
+    return client.send({
+        '@type': 'addRecentlyFoundChat',
+        'chat_id': to_json(chat_id),
+    })
+
+
+def addSavedAnimation(animation: InputFile = None, ):
+    return client.send({
+        '@type': 'addSavedAnimation',
+        'animation': to_json(animation),
+    })
+
+
+def addSavedNotificationSound(sound: InputFile = None, ):
+    return client.send({
+        '@type': 'addSavedNotificationSound',
+        'sound': to_json(sound),
+    })
+
+
+def addStickerToSet(user_id: int = None, name: str = None, sticker: InputSticker = None, ):
+    return client.send({
+        '@type': 'addStickerToSet',
+        'user_id': to_json(user_id),
+        'name': to_json(name),
+        'sticker': to_json(sticker),
+    })
+
+
+def allowBotToSendMessages(bot_user_id: int = None, ):
+    return client.send({
+        '@type': 'allowBotToSendMessages',
+        'bot_user_id': to_json(bot_user_id),
+    })
+
+
+def answerCallbackQuery(callback_query_id: int = None, text: str = None, show_alert: bool = None, url: str = None, cache_time: int = None, ):
+    return client.send({
+        '@type': 'answerCallbackQuery',
+        'callback_query_id': to_json(callback_query_id),
+        'text': to_json(text),
+        'show_alert': to_json(show_alert),
+        'url': to_json(url),
+        'cache_time': to_json(cache_time),
+    })
+
+
+def answerCustomQuery(custom_query_id: int = None, data: str = None, ):
+    return client.send({
+        '@type': 'answerCustomQuery',
+        'custom_query_id': to_json(custom_query_id),
+        'data': to_json(data),
+    })
+
+
+def answerInlineQuery(inline_query_id: int = None, is_personal: bool = None, button: InlineQueryResultsButton = None, results: list[InputInlineQueryResult] = None, cache_time: int = None, next_offset: str = None, ):
+    return client.send({
+        '@type': 'answerInlineQuery',
+        'inline_query_id': to_json(inline_query_id),
+        'is_personal': to_json(is_personal),
+        'button': to_json(button),
+        'results': to_json(results),
+        'cache_time': to_json(cache_time),
+        'next_offset': to_json(next_offset),
+    })
+
+
+def answerPreCheckoutQuery(pre_checkout_query_id: int = None, error_message: str = None, ):
+    return client.send({
+        '@type': 'answerPreCheckoutQuery',
+        'pre_checkout_query_id': to_json(pre_checkout_query_id),
+        'error_message': to_json(error_message),
+    })
+
+
+def answerShippingQuery(shipping_query_id: int = None, shipping_options: list[ShippingOption] = None, error_message: str = None, ):
+    return client.send({
+        '@type': 'answerShippingQuery',
+        'shipping_query_id': to_json(shipping_query_id),
+        'shipping_options': to_json(shipping_options),
+        'error_message': to_json(error_message),
+    })
+
+
+def answerWebAppQuery(web_app_query_id: str = None, result: InputInlineQueryResult = None, ):
+    return client.send({
+        '@type': 'answerWebAppQuery',
+        'web_app_query_id': to_json(web_app_query_id),
+        'result': to_json(result),
+    })
+
+
+def applyPremiumGiftCode(code: str = None, ):
+    return client.send({
+        '@type': 'applyPremiumGiftCode',
+        'code': to_json(code),
+    })
+
+
+def assignAppStoreTransaction(receipt: bytes = None, purpose: StorePaymentPurpose = None, ):
+    return client.send({
+        '@type': 'assignAppStoreTransaction',
+        'receipt': to_json(receipt),
+        'purpose': to_json(purpose),
+    })
+
+
+def assignGooglePlayTransaction(package_name: str = None, store_product_id: str = None, purchase_token: str = None, purpose: StorePaymentPurpose = None, ):
+    return client.send({
+        '@type': 'assignGooglePlayTransaction',
+        'package_name': to_json(package_name),
+        'store_product_id': to_json(store_product_id),
+        'purchase_token': to_json(purchase_token),
+        'purpose': to_json(purpose),
+    })
+
+
+def banChatMember(chat_id: int = None, member_id: MessageSender = None, banned_until_date: int = None, revoke_messages: bool = None, ):
+    return client.send({
+        '@type': 'banChatMember',
+        'chat_id': to_json(chat_id),
+        'member_id': to_json(member_id),
+        'banned_until_date': to_json(banned_until_date),
+        'revoke_messages': to_json(revoke_messages),
+    })
+
+
+def blockMessageSenderFromReplies(message_id: int = None, delete_message: bool = None, delete_all_messages: bool = None, report_spam: bool = None, ):
+    return client.send({
+        '@type': 'blockMessageSenderFromReplies',
+        'message_id': to_json(message_id),
+        'delete_message': to_json(delete_message),
+        'delete_all_messages': to_json(delete_all_messages),
+        'report_spam': to_json(report_spam),
+    })
+
+
+def boostChat(chat_id: int = None, slot_ids: list[int] = None, ):
+    return client.send({
+        '@type': 'boostChat',
+        'chat_id': to_json(chat_id),
+        'slot_ids': to_json(slot_ids),
+    })
+
+
+def canBotSendMessages(bot_user_id: int = None, ):
+    return client.send({
+        '@type': 'canBotSendMessages',
+        'bot_user_id': to_json(bot_user_id),
+    })
+
+
+def canPurchasePremium(purpose: StorePaymentPurpose = None, ):
+    return client.send({
+        '@type': 'canPurchasePremium',
+        'purpose': to_json(purpose),
+    })
+
+
+def canSendStory(chat_id: int = None, ):
+    return client.send({
+        '@type': 'canSendStory',
+        'chat_id': to_json(chat_id),
+    })
+
+
+def canTransferOwnership():
+    return client.send({
+        '@type': 'canTransferOwnership',
+    })
+
+
+def cancelDownloadFile(file_id: int = None, only_if_pending: bool = None, ):
+    return client.send({
+        '@type': 'cancelDownloadFile',
+        'file_id': to_json(file_id),
+        'only_if_pending': to_json(only_if_pending),
+    })
+
+
+def cancelPasswordReset():
+    return client.send({
+        '@type': 'cancelPasswordReset',
+    })
+
+
+def cancelPreliminaryUploadFile(file_id: int = None, ):
+    return client.send({
+        '@type': 'cancelPreliminaryUploadFile',
+        'file_id': to_json(file_id),
+    })
+
+
+def changeImportedContacts(contacts: list[Contact] = None, ):
+    return client.send({
+        '@type': 'changeImportedContacts',
+        'contacts': to_json(contacts),
+    })
+
+
+def changePhoneNumber(phone_number: str = None, settings: PhoneNumberAuthenticationSettings = None, ):
+    return client.send({
+        '@type': 'changePhoneNumber',
+        'phone_number': to_json(phone_number),
+        'settings': to_json(settings),
+    })
+
+
+def changeStickerSet(set_id: int = None, is_installed: bool = None, is_archived: bool = None, ):
+    return client.send({
+        '@type': 'changeStickerSet',
+        'set_id': to_json(set_id),
+        'is_installed': to_json(is_installed),
+        'is_archived': to_json(is_archived),
+    })
+
+
+def checkAuthenticationBotToken(token: str = None, ):
+    return client.send({
+        '@type': 'checkAuthenticationBotToken',
+        'token': to_json(token),
+    })
+
+
+def checkAuthenticationCode(code: str = None, ):
+    return client.send({
+        '@type': 'checkAuthenticationCode',
+        'code': to_json(code),
+    })
+
+
+def checkAuthenticationEmailCode(code: EmailAddressAuthentication = None, ):
+    return client.send({
+        '@type': 'checkAuthenticationEmailCode',
+        'code': to_json(code),
+    })
+
+
+def checkAuthenticationPassword(password: str = None, ):
+    return client.send({
+        '@type': 'checkAuthenticationPassword',
+        'password': to_json(password),
+    })
+
+
+def checkAuthenticationPasswordRecoveryCode(recovery_code: str = None, ):
+    return client.send({
+        '@type': 'checkAuthenticationPasswordRecoveryCode',
+        'recovery_code': to_json(recovery_code),
+    })
+
+
+def checkChangePhoneNumberCode(code: str = None, ):
+    return client.send({
+        '@type': 'checkChangePhoneNumberCode',
+        'code': to_json(code),
+    })
+
+
+def checkChatFolderInviteLink(invite_link: str = None, ):
+    return client.send({
+        '@type': 'checkChatFolderInviteLink',
+        'invite_link': to_json(invite_link),
+    })
+
+
+def checkChatInviteLink(invite_link: str = None, ):
+    return client.send({
+        '@type': 'checkChatInviteLink',
+        'invite_link': to_json(invite_link),
+    })
+
+
+def checkChatUsername(chat_id: int = None, username: str = None, ):
+    return client.send({
+        '@type': 'checkChatUsername',
+        'chat_id': to_json(chat_id),
+        'username': to_json(username),
+    })
+
+
+def checkCreatedPublicChatsLimit(type: PublicChatType = None, ):
+    return client.send({
+        '@type': 'checkCreatedPublicChatsLimit',
+        'type': to_json(type),
+    })
+
+
+def checkEmailAddressVerificationCode(code: str = None, ):
+    return client.send({
+        '@type': 'checkEmailAddressVerificationCode',
+        'code': to_json(code),
+    })
+
+
+def checkLoginEmailAddressCode(code: EmailAddressAuthentication = None, ):
+    return client.send({
+        '@type': 'checkLoginEmailAddressCode',
+        'code': to_json(code),
+    })
+
+
+def checkPasswordRecoveryCode(recovery_code: str = None, ):
+    return client.send({
+        '@type': 'checkPasswordRecoveryCode',
+        'recovery_code': to_json(recovery_code),
+    })
+
+
+def checkPhoneNumberConfirmationCode(code: str = None, ):
+    return client.send({
+        '@type': 'checkPhoneNumberConfirmationCode',
+        'code': to_json(code),
+    })
+
+
+def checkPhoneNumberVerificationCode(code: str = None, ):
+    return client.send({
+        '@type': 'checkPhoneNumberVerificationCode',
+        'code': to_json(code),
+    })
+
+
+def checkPremiumGiftCode(code: str = None, ):
+    return client.send({
+        '@type': 'checkPremiumGiftCode',
+        'code': to_json(code),
+    })
+
+
+def checkRecoveryEmailAddressCode(code: str = None, ):
+    return client.send({
+        '@type': 'checkRecoveryEmailAddressCode',
+        'code': to_json(code),
+    })
+
+
+def checkStickerSetName(name: str = None, ):
+    return client.send({
+        '@type': 'checkStickerSetName',
+        'name': to_json(name),
+    })
+
+
+def cleanFileName(file_name: str = None, ):
+    return client.send({
+        '@type': 'cleanFileName',
+        'file_name': to_json(file_name),
+    })
+
+
+def clearAllDraftMessages(exclude_secret_chats: bool = None, ):
+    return client.send({
+        '@type': 'clearAllDraftMessages',
+        'exclude_secret_chats': to_json(exclude_secret_chats),
+    })
+
+
+def clearAutosaveSettingsExceptions():
+    return client.send({
+        '@type': 'clearAutosaveSettingsExceptions',
+    })
+
+
+def clearImportedContacts():
+    return client.send({
+        '@type': 'clearImportedContacts',
+    })
+
+
+def clearRecentEmojiStatuses():
+    return client.send({
+        '@type': 'clearRecentEmojiStatuses',
+    })
+
+
+def clearRecentReactions():
+    return client.send({
+        '@type': 'clearRecentReactions',
+    })
+
+
+def clearRecentStickers(is_attached: bool = None, ):
+    return client.send({
+        '@type': 'clearRecentStickers',
+        'is_attached': to_json(is_attached),
+    })
+
+
+def clearRecentlyFoundChats():
+    return client.send({
+        '@type': 'clearRecentlyFoundChats',
+    })
+
+
+def clickAnimatedEmojiMessage(chat_id: int = None, message_id: int = None, ):
+    return client.send({
+        '@type': 'clickAnimatedEmojiMessage',
+        'chat_id': to_json(chat_id),
+        'message_id': to_json(message_id),
+    })
+
+
+def clickChatSponsoredMessage(chat_id: int = None, message_id: int = None, ):
+    return client.send({
+        '@type': 'clickChatSponsoredMessage',
+        'chat_id': to_json(chat_id),
+        'message_id': to_json(message_id),
+    })
+
+
+def clickPremiumSubscriptionButton():
+    return client.send({
+        '@type': 'clickPremiumSubscriptionButton',
+    })
+
+
+def close():
+    return client.send({
+        '@type': 'close',
+    })
+
+
+def closeChat(chat_id: int = None, ):
+    return client.send({
+        '@type': 'closeChat',
+        'chat_id': to_json(chat_id),
+    })
+
+
+def closeSecretChat(secret_chat_id: int = None, ):
+    return client.send({
+        '@type': 'closeSecretChat',
+        'secret_chat_id': to_json(secret_chat_id),
+    })
+
+
+def closeStory(story_sender_chat_id: int = None, story_id: int = None, ):
+    return client.send({
+        '@type': 'closeStory',
+        'story_sender_chat_id': to_json(story_sender_chat_id),
+        'story_id': to_json(story_id),
+    })
+
+
+def closeWebApp(web_app_launch_id: int = None, ):
+    return client.send({
+        '@type': 'closeWebApp',
+        'web_app_launch_id': to_json(web_app_launch_id),
+    })
+
+
+def confirmQrCodeAuthentication(link: str = None, ):
+    return client.send({
+        '@type': 'confirmQrCodeAuthentication',
+        'link': to_json(link),
+    })
+
+
+def confirmSession(session_id: int = None, ):
+    return client.send({
+        '@type': 'confirmSession',
+        'session_id': to_json(session_id),
+    })
+
+
+def createBasicGroupChat(basic_group_id: int = None, force: bool = None, ):
+    return client.send({
+        '@type': 'createBasicGroupChat',
+        'basic_group_id': to_json(basic_group_id),
+        'force': to_json(force),
+    })
+
+
+def createCall(user_id: int = None, protocol: CallProtocol = None, is_video: bool = None, ):
+    return client.send({
+        '@type': 'createCall',
+        'user_id': to_json(user_id),
+        'protocol': to_json(protocol),
+        'is_video': to_json(is_video),
+    })
+
+
+def createChatFolder(folder: ChatFolder = None, ):
+    return client.send({
+        '@type': 'createChatFolder',
+        'folder': to_json(folder),
+    })
+
+
+def createChatFolderInviteLink(chat_folder_id: int = None, name: str = None, chat_ids: list[int] = None, ):
+    return client.send({
+        '@type': 'createChatFolderInviteLink',
+        'chat_folder_id': to_json(chat_folder_id),
+        'name': to_json(name),
+        'chat_ids': to_json(chat_ids),
+    })
+
+
+def createChatInviteLink(chat_id: int = None, name: str = None, expiration_date: int = None, member_limit: int = None, creates_join_request: bool = None, ):
+    return client.send({
+        '@type': 'createChatInviteLink',
+        'chat_id': to_json(chat_id),
+        'name': to_json(name),
+        'expiration_date': to_json(expiration_date),
+        'member_limit': to_json(member_limit),
+        'creates_join_request': to_json(creates_join_request),
+    })
+
+
+def createForumTopic(chat_id: int = None, name: str = None, icon: ForumTopicIcon = None, ):
+    return client.send({
+        '@type': 'createForumTopic',
+        'chat_id': to_json(chat_id),
+        'name': to_json(name),
+        'icon': to_json(icon),
+    })
+
+
+def createInvoiceLink(invoice: InputMessageContent = None, ):
+    return client.send({
+        '@type': 'createInvoiceLink',
+        'invoice': to_json(invoice),
+    })
+
+
+def createNewBasicGroupChat(user_ids: list[int] = None, title: str = None, message_auto_delete_time: int = None, ):
+    return client.send({
+        '@type': 'createNewBasicGroupChat',
+        'user_ids': to_json(user_ids),
+        'title': to_json(title),
+        'message_auto_delete_time': to_json(message_auto_delete_time),
+    })
+
+
+def createNewSecretChat(user_id: int = None, ):
+    return client.send({
+        '@type': 'createNewSecretChat',
+        'user_id': to_json(user_id),
+    })
+
+
+def createNewStickerSet(user_id: int = None, title: str = None, name: str = None, sticker_format: StickerFormat = None, sticker_type: StickerType = None, needs_repainting: bool = None, stickers: list[InputSticker] = None, source: str = None, ):
+    return client.send({
+        '@type': 'createNewStickerSet',
+        'user_id': to_json(user_id),
+        'title': to_json(title),
+        'name': to_json(name),
+        'sticker_format': to_json(sticker_format),
+        'sticker_type': to_json(sticker_type),
+        'needs_repainting': to_json(needs_repainting),
+        'stickers': to_json(stickers),
+        'source': to_json(source),
+    })
+
+
+def createNewSupergroupChat(title: str = None, is_forum: bool = None, is_channel: bool = None, description: str = None, location: ChatLocation = None, message_auto_delete_time: int = None, for_import: bool = None, ):
+    return client.send({
+        '@type': 'createNewSupergroupChat',
+        'title': to_json(title),
+        'is_forum': to_json(is_forum),
+        'is_channel': to_json(is_channel),
+        'description': to_json(description),
+        'location': to_json(location),
+        'message_auto_delete_time': to_json(message_auto_delete_time),
+        'for_import': to_json(for_import),
+    })
+
+
+def createPrivateChat(user_id: int = None, force: bool = None, ):
+    return client.send({
+        '@type': 'createPrivateChat',
+        'user_id': to_json(user_id),
+        'force': to_json(force),
+    })
+
+
+def createSecretChat(secret_chat_id: int = None, ):
+    return client.send({
+        '@type': 'createSecretChat',
+        'secret_chat_id': to_json(secret_chat_id),
+    })
+
+
+def createSupergroupChat(supergroup_id: int = None, force: bool = None, ):
+    return client.send({
+        '@type': 'createSupergroupChat',
+        'supergroup_id': to_json(supergroup_id),
+        'force': to_json(force),
+    })
+
+
+def createTemporaryPassword(password: str = None, valid_for: int = None, ):
+    return client.send({
+        '@type': 'createTemporaryPassword',
+        'password': to_json(password),
+        'valid_for': to_json(valid_for),
+    })
+
+
+def createVideoChat(chat_id: int = None, title: str = None, start_date: int = None, is_rtmp_stream: bool = None, ):
+    return client.send({
+        '@type': 'createVideoChat',
+        'chat_id': to_json(chat_id),
+        'title': to_json(title),
+        'start_date': to_json(start_date),
+        'is_rtmp_stream': to_json(is_rtmp_stream),
+    })
+
+
+def deleteAccount(reason: str = None, password: str = None, ):
+    return client.send({
+        '@type': 'deleteAccount',
+        'reason': to_json(reason),
+        'password': to_json(password),
+    })
+
+
+def deleteAllCallMessages(revoke: bool = None, ):
+    return client.send({
+        '@type': 'deleteAllCallMessages',
+        'revoke': to_json(revoke),
+    })
+
+
+def deleteAllRevokedChatInviteLinks(chat_id: int = None, creator_user_id: int = None, ):
+    return client.send({
+        '@type': 'deleteAllRevokedChatInviteLinks',
+        'chat_id': to_json(chat_id),
+        'creator_user_id': to_json(creator_user_id),
+    })
+
+
+def deleteChat(chat_id: int = None, ):
+    return client.send({
+        '@type': 'deleteChat',
+        'chat_id': to_json(chat_id),
+    })
+
+
+def deleteChatBackground(chat_id: int = None, restore_previous: bool = None, ):
+    return client.send({
+        '@type': 'deleteChatBackground',
+        'chat_id': to_json(chat_id),
+        'restore_previous': to_json(restore_previous),
+    })
+
+
+def deleteChatFolder(chat_folder_id: int = None, leave_chat_ids: list[int] = None, ):
+    return client.send({
+        '@type': 'deleteChatFolder',
+        'chat_folder_id': to_json(chat_folder_id),
+        'leave_chat_ids': to_json(leave_chat_ids),
+    })
+
+
+def deleteChatFolderInviteLink(chat_folder_id: int = None, invite_link: str = None, ):
+    return client.send({
+        '@type': 'deleteChatFolderInviteLink',
+        'chat_folder_id': to_json(chat_folder_id),
+        'invite_link': to_json(invite_link),
+    })
+
+
+def deleteChatHistory(chat_id: int = None, remove_from_chat_list: bool = None, revoke: bool = None, ):
+    return client.send({
+        '@type': 'deleteChatHistory',
+        'chat_id': to_json(chat_id),
+        'remove_from_chat_list': to_json(remove_from_chat_list),
+        'revoke': to_json(revoke),
+    })
+
+
+def deleteChatMessagesByDate(chat_id: int = None, min_date: int = None, max_date: int = None, revoke: bool = None, ):
+    return client.send({
+        '@type': 'deleteChatMessagesByDate',
+        'chat_id': to_json(chat_id),
+        'min_date': to_json(min_date),
+        'max_date': to_json(max_date),
+        'revoke': to_json(revoke),
+    })
+
+
+def deleteChatMessagesBySender(chat_id: int = None, sender_id: MessageSender = None, ):
+    return client.send({
+        '@type': 'deleteChatMessagesBySender',
+        'chat_id': to_json(chat_id),
+        'sender_id': to_json(sender_id),
+    })
+
+
+def deleteChatReplyMarkup(chat_id: int = None, message_id: int = None, ):
+    return client.send({
+        '@type': 'deleteChatReplyMarkup',
+        'chat_id': to_json(chat_id),
+        'message_id': to_json(message_id),
+    })
+
+
+def deleteCommands(scope: BotCommandScope = None, language_code: str = None, ):
+    return client.send({
+        '@type': 'deleteCommands',
+        'scope': to_json(scope),
+        'language_code': to_json(language_code),
+    })
+
+
+def deleteDefaultBackground(for_dark_theme: bool = None, ):
+    return client.send({
+        '@type': 'deleteDefaultBackground',
+        'for_dark_theme': to_json(for_dark_theme),
+    })
+
+
+def deleteFile(file_id: int = None, ):
+    return client.send({
+        '@type': 'deleteFile',
+        'file_id': to_json(file_id),
+    })
+
+
+def deleteForumTopic(chat_id: int = None, message_thread_id: int = None, ):
+    return client.send({
+        '@type': 'deleteForumTopic',
+        'chat_id': to_json(chat_id),
+        'message_thread_id': to_json(message_thread_id),
+    })
+
+
+def deleteLanguagePack(language_pack_id: str = None, ):
+    return client.send({
+        '@type': 'deleteLanguagePack',
+        'language_pack_id': to_json(language_pack_id),
+    })
+
+
+def deleteMessages(chat_id: int = None, message_ids: list[int] = None, revoke: bool = None, ):
+    return client.send({
+        '@type': 'deleteMessages',
+        'chat_id': to_json(chat_id),
+        'message_ids': to_json(message_ids),
+        'revoke': to_json(revoke),
+    })
+
+
+def deletePassportElement(type: PassportElementType = None, ):
+    return client.send({
+        '@type': 'deletePassportElement',
+        'type': to_json(type),
+    })
+
+
+def deleteProfilePhoto(profile_photo_id: int = None, ):
+    return client.send({
+        '@type': 'deleteProfilePhoto',
+        'profile_photo_id': to_json(profile_photo_id),
+    })
+
+
+def deleteRevokedChatInviteLink(chat_id: int = None, invite_link: str = None, ):
+    return client.send({
+        '@type': 'deleteRevokedChatInviteLink',
+        'chat_id': to_json(chat_id),
+        'invite_link': to_json(invite_link),
+    })
+
+
+def deleteSavedCredentials():
+    return client.send({
+        '@type': 'deleteSavedCredentials',
+    })
+
+
+def deleteSavedOrderInfo():
+    return client.send({
+        '@type': 'deleteSavedOrderInfo',
+    })
+
+
+def deleteStickerSet(name: str = None, ):
+    return client.send({
+        '@type': 'deleteStickerSet',
+        'name': to_json(name),
+    })
+
+
+def deleteStory(story_sender_chat_id: int = None, story_id: int = None, ):
+    return client.send({
+        '@type': 'deleteStory',
+        'story_sender_chat_id': to_json(story_sender_chat_id),
+        'story_id': to_json(story_id),
+    })
+
+
+def destroy():
+    return client.send({
+        '@type': 'destroy',
+    })
+
+
+def disableAllSupergroupUsernames(supergroup_id: int = None, ):
+    return client.send({
+        '@type': 'disableAllSupergroupUsernames',
+        'supergroup_id': to_json(supergroup_id),
+    })
+
+
+def disableProxy():
+    return client.send({
+        '@type': 'disableProxy',
+    })
+
+
+def discardCall(call_id: int = None, is_disconnected: bool = None, duration: int = None, is_video: bool = None, connection_id: int = None, ):
+    return client.send({
+        '@type': 'discardCall',
+        'call_id': to_json(call_id),
+        'is_disconnected': to_json(is_disconnected),
+        'duration': to_json(duration),
+        'is_video': to_json(is_video),
+        'connection_id': to_json(connection_id),
+    })
+
+
+def disconnectAllWebsites():
+    return client.send({
+        '@type': 'disconnectAllWebsites',
+    })
+
+
+def disconnectWebsite(website_id: int = None, ):
+    return client.send({
+        '@type': 'disconnectWebsite',
+        'website_id': to_json(website_id),
+    })
+
+
+def downloadFile(file_id: int = None, priority: int = None, offset: int = None, limit: int = None, synchronous: bool = None, ):
+    return client.send({
+        '@type': 'downloadFile',
+        'file_id': to_json(file_id),
+        'priority': to_json(priority),
+        'offset': to_json(offset),
+        'limit': to_json(limit),
+        'synchronous': to_json(synchronous),
+    })
+
+
+def editChatFolder(chat_folder_id: int = None, folder: ChatFolder = None, ):
+    return client.send({
+        '@type': 'editChatFolder',
+        'chat_folder_id': to_json(chat_folder_id),
+        'folder': to_json(folder),
+    })
+
+
+def editChatFolderInviteLink(chat_folder_id: int = None, invite_link: str = None, name: str = None, chat_ids: list[int] = None, ):
+    return client.send({
+        '@type': 'editChatFolderInviteLink',
+        'chat_folder_id': to_json(chat_folder_id),
+        'invite_link': to_json(invite_link),
+        'name': to_json(name),
+        'chat_ids': to_json(chat_ids),
+    })
+
+
+def editChatInviteLink(chat_id: int = None, invite_link: str = None, name: str = None, expiration_date: int = None, member_limit: int = None, creates_join_request: bool = None, ):
+    return client.send({
+        '@type': 'editChatInviteLink',
+        'chat_id': to_json(chat_id),
+        'invite_link': to_json(invite_link),
+        'name': to_json(name),
+        'expiration_date': to_json(expiration_date),
+        'member_limit': to_json(member_limit),
+        'creates_join_request': to_json(creates_join_request),
+    })
+
+
+def editCustomLanguagePackInfo(info: LanguagePackInfo = None, ):
+    return client.send({
+        '@type': 'editCustomLanguagePackInfo',
+        'info': to_json(info),
+    })
+
+
+def editForumTopic(chat_id: int = None, message_thread_id: int = None, name: str = None, edit_icon_custom_emoji: bool = None, icon_custom_emoji_id: int = None, ):
+    return client.send({
+        '@type': 'editForumTopic',
+        'chat_id': to_json(chat_id),
+        'message_thread_id': to_json(message_thread_id),
+        'name': to_json(name),
+        'edit_icon_custom_emoji': to_json(edit_icon_custom_emoji),
+        'icon_custom_emoji_id': to_json(icon_custom_emoji_id),
+    })
+
+
+def editInlineMessageCaption(inline_message_id: str = None, reply_markup: ReplyMarkup = None, caption: FormattedText = None, ):
+    return client.send({
+        '@type': 'editInlineMessageCaption',
+        'inline_message_id': to_json(inline_message_id),
+        'reply_markup': to_json(reply_markup),
+        'caption': to_json(caption),
+    })
+
+
+def editInlineMessageLiveLocation(inline_message_id: str = None, reply_markup: ReplyMarkup = None, location: Location = None, heading: int = None, proximity_alert_radius: int = None, ):
+    return client.send({
+        '@type': 'editInlineMessageLiveLocation',
+        'inline_message_id': to_json(inline_message_id),
+        'reply_markup': to_json(reply_markup),
+        'location': to_json(location),
+        'heading': to_json(heading),
+        'proximity_alert_radius': to_json(proximity_alert_radius),
+    })
+
+
+def editInlineMessageMedia(inline_message_id: str = None, reply_markup: ReplyMarkup = None, input_message_content: InputMessageContent = None, ):
+    return client.send({
+        '@type': 'editInlineMessageMedia',
+        'inline_message_id': to_json(inline_message_id),
+        'reply_markup': to_json(reply_markup),
+        'input_message_content': to_json(input_message_content),
+    })
+
+
+def editInlineMessageReplyMarkup(inline_message_id: str = None, reply_markup: ReplyMarkup = None, ):
+    return client.send({
+        '@type': 'editInlineMessageReplyMarkup',
+        'inline_message_id': to_json(inline_message_id),
+        'reply_markup': to_json(reply_markup),
+    })
+
+
+def editInlineMessageText(inline_message_id: str = None, reply_markup: ReplyMarkup = None, input_message_content: InputMessageContent = None, ):
+    return client.send({
+        '@type': 'editInlineMessageText',
+        'inline_message_id': to_json(inline_message_id),
+        'reply_markup': to_json(reply_markup),
+        'input_message_content': to_json(input_message_content),
+    })
+
+
+def editMessageCaption(chat_id: int = None, message_id: int = None, reply_markup: ReplyMarkup = None, caption: FormattedText = None, ):
+    return client.send({
+        '@type': 'editMessageCaption',
+        'chat_id': to_json(chat_id),
+        'message_id': to_json(message_id),
+        'reply_markup': to_json(reply_markup),
+        'caption': to_json(caption),
+    })
+
+
+def editMessageLiveLocation(chat_id: int = None, message_id: int = None, reply_markup: ReplyMarkup = None, location: Location = None, heading: int = None, proximity_alert_radius: int = None, ):
+    return client.send({
+        '@type': 'editMessageLiveLocation',
+        'chat_id': to_json(chat_id),
+        'message_id': to_json(message_id),
+        'reply_markup': to_json(reply_markup),
+        'location': to_json(location),
+        'heading': to_json(heading),
+        'proximity_alert_radius': to_json(proximity_alert_radius),
+    })
+
+
+def editMessageMedia(chat_id: int = None, message_id: int = None, reply_markup: ReplyMarkup = None, input_message_content: InputMessageContent = None, ):
+    return client.send({
+        '@type': 'editMessageMedia',
+        'chat_id': to_json(chat_id),
+        'message_id': to_json(message_id),
+        'reply_markup': to_json(reply_markup),
+        'input_message_content': to_json(input_message_content),
+    })
+
+
+def editMessageReplyMarkup(chat_id: int = None, message_id: int = None, reply_markup: ReplyMarkup = None, ):
+    return client.send({
+        '@type': 'editMessageReplyMarkup',
+        'chat_id': to_json(chat_id),
+        'message_id': to_json(message_id),
+        'reply_markup': to_json(reply_markup),
+    })
+
+
+def editMessageSchedulingState(chat_id: int = None, message_id: int = None, scheduling_state: MessageSchedulingState = None, ):
+    return client.send({
+        '@type': 'editMessageSchedulingState',
+        'chat_id': to_json(chat_id),
+        'message_id': to_json(message_id),
+        'scheduling_state': to_json(scheduling_state),
+    })
+
+
+def editMessageText(chat_id: int = None, message_id: int = None, reply_markup: ReplyMarkup = None, input_message_content: InputMessageContent = None, ):
+    return client.send({
+        '@type': 'editMessageText',
+        'chat_id': to_json(chat_id),
+        'message_id': to_json(message_id),
+        'reply_markup': to_json(reply_markup),
+        'input_message_content': to_json(input_message_content),
+    })
+
+
+def editProxy(proxy_id: int = None, server: str = None, port: int = None, enable: bool = None, type: ProxyType = None, ):
+    return client.send({
+        '@type': 'editProxy',
+        'proxy_id': to_json(proxy_id),
+        'server': to_json(server),
+        'port': to_json(port),
+        'enable': to_json(enable),
+        'type': to_json(type),
+    })
+
+
+def editStory(story_sender_chat_id: int = None, story_id: int = None, content: InputStoryContent = None, areas: InputStoryAreas = None, caption: FormattedText = None, ):
+    return client.send({
+        '@type': 'editStory',
+        'story_sender_chat_id': to_json(story_sender_chat_id),
+        'story_id': to_json(story_id),
+        'content': to_json(content),
+        'areas': to_json(areas),
+        'caption': to_json(caption),
+    })
+
+
+def enableProxy(proxy_id: int = None, ):
+    return client.send({
+        '@type': 'enableProxy',
+        'proxy_id': to_json(proxy_id),
+    })
+
+
+def endGroupCall(group_call_id: int = None, ):
+    return client.send({
+        '@type': 'endGroupCall',
+        'group_call_id': to_json(group_call_id),
+    })
+
+
+def endGroupCallRecording(group_call_id: int = None, ):
+    return client.send({
+        '@type': 'endGroupCallRecording',
+        'group_call_id': to_json(group_call_id),
+    })
+
+
+def endGroupCallScreenSharing(group_call_id: int = None, ):
+    return client.send({
+        '@type': 'endGroupCallScreenSharing',
+        'group_call_id': to_json(group_call_id),
+    })
+
+
+def finishFileGeneration(generation_id: int = None, error: Error = None, ):
+    return client.send({
+        '@type': 'finishFileGeneration',
+        'generation_id': to_json(generation_id),
+        'error': to_json(error),
+    })
+
+
+def forwardMessages(chat_id: int = None, message_thread_id: int = None, from_chat_id: int = None, message_ids: list[int] = None, options: MessageSendOptions = None, send_copy: bool = None, remove_caption: bool = None, ):
+    return client.send({
+        '@type': 'forwardMessages',
+        'chat_id': to_json(chat_id),
+        'message_thread_id': to_json(message_thread_id),
+        'from_chat_id': to_json(from_chat_id),
+        'message_ids': to_json(message_ids),
+        'options': to_json(options),
+        'send_copy': to_json(send_copy),
+        'remove_caption': to_json(remove_caption),
+    })
+
+
+def getAccountTtl():
+    return client.send({
+        '@type': 'getAccountTtl',
+    })
+
+
+def getActiveLiveLocationMessages():
+    return client.send({
+        '@type': 'getActiveLiveLocationMessages',
+    })
+
+
+def getActiveSessions():
+    return client.send({
+        '@type': 'getActiveSessions',
+    })
+
+
+def getAllPassportElements(password: str = None, ):
+    return client.send({
+        '@type': 'getAllPassportElements',
+        'password': to_json(password),
+    })
+
+
+def getAllStickerEmojis(sticker_type: StickerType = None, query: str = None, chat_id: int = None, return_only_main_emoji: bool = None, ):
+    return client.send({
+        '@type': 'getAllStickerEmojis',
+        'sticker_type': to_json(sticker_type),
+        'query': to_json(query),
+        'chat_id': to_json(chat_id),
+        'return_only_main_emoji': to_json(return_only_main_emoji),
+    })
+
+
+def getAnimatedEmoji(emoji: str = None, ):
+    return client.send({
+        '@type': 'getAnimatedEmoji',
+        'emoji': to_json(emoji),
+    })
+
+
+def getApplicationConfig():
+    return client.send({
+        '@type': 'getApplicationConfig',
+    })
+
+
+def getApplicationDownloadLink():
+    return client.send({
+        '@type': 'getApplicationDownloadLink',
+    })
+
+
+def getArchiveChatListSettings():
+    return client.send({
+        '@type': 'getArchiveChatListSettings',
+    })
+
+
+def getArchivedStickerSets(sticker_type: StickerType = None, offset_sticker_set_id: int = None, limit: int = None, ):
+    return client.send({
+        '@type': 'getArchivedStickerSets',
+        'sticker_type': to_json(sticker_type),
+        'offset_sticker_set_id': to_json(offset_sticker_set_id),
+        'limit': to_json(limit),
+    })
+
+
+def getAttachedStickerSets(file_id: int = None, ):
+    return client.send({
+        '@type': 'getAttachedStickerSets',
+        'file_id': to_json(file_id),
+    })
+
+
+def getAttachmentMenuBot(bot_user_id: int = None, ):
+    return client.send({
+        '@type': 'getAttachmentMenuBot',
+        'bot_user_id': to_json(bot_user_id),
+    })
+
+
+def getAuthorizationState():
+    return client.send({
+        '@type': 'getAuthorizationState',
+    })
+
+
+def getAutoDownloadSettingsPresets():
+    return client.send({
+        '@type': 'getAutoDownloadSettingsPresets',
+    })
+
+
+def getAutosaveSettings():
+    return client.send({
+        '@type': 'getAutosaveSettings',
+    })
+
+
+def getAvailableChatBoostSlots():
+    return client.send({
+        '@type': 'getAvailableChatBoostSlots',
+    })
+
+
+def getBackgroundUrl(name: str = None, type: BackgroundType = None, ):
+    return client.send({
+        '@type': 'getBackgroundUrl',
+        'name': to_json(name),
+        'type': to_json(type),
+    })
+
+
+def getBankCardInfo(bank_card_number: str = None, ):
+    return client.send({
+        '@type': 'getBankCardInfo',
+        'bank_card_number': to_json(bank_card_number),
+    })
+
+
+def getBasicGroup(basic_group_id: int = None, ):
+    return client.send({
+        '@type': 'getBasicGroup',
+        'basic_group_id': to_json(basic_group_id),
+    })
+
+
+def getBasicGroupFullInfo(basic_group_id: int = None, ):
+    return client.send({
+        '@type': 'getBasicGroupFullInfo',
+        'basic_group_id': to_json(basic_group_id),
+    })
+
+
+def getBlockedMessageSenders(block_list: BlockList = None, offset: int = None, limit: int = None, ):
+    return client.send({
+        '@type': 'getBlockedMessageSenders',
+        'block_list': to_json(block_list),
+        'offset': to_json(offset),
+        'limit': to_json(limit),
+    })
+
+
+def getBotInfoDescription(bot_user_id: int = None, language_code: str = None, ):
+    return client.send({
+        '@type': 'getBotInfoDescription',
+        'bot_user_id': to_json(bot_user_id),
+        'language_code': to_json(language_code),
+    })
+
+
+def getBotInfoShortDescription(bot_user_id: int = None, language_code: str = None, ):
+    return client.send({
+        '@type': 'getBotInfoShortDescription',
+        'bot_user_id': to_json(bot_user_id),
+        'language_code': to_json(language_code),
+    })
+
+
+def getBotName(bot_user_id: int = None, language_code: str = None, ):
+    return client.send({
+        '@type': 'getBotName',
+        'bot_user_id': to_json(bot_user_id),
+        'language_code': to_json(language_code),
+    })
+
+
+def getCallbackQueryAnswer(chat_id: int = None, message_id: int = None, payload: CallbackQueryPayload = None, ):
+    return client.send({
+        '@type': 'getCallbackQueryAnswer',
+        'chat_id': to_json(chat_id),
+        'message_id': to_json(message_id),
+        'payload': to_json(payload),
+    })
+
+
+def getCallbackQueryMessage(chat_id: int = None, message_id: int = None, callback_query_id: int = None, ):
+    return client.send({
+        '@type': 'getCallbackQueryMessage',
+        'chat_id': to_json(chat_id),
+        'message_id': to_json(message_id),
+        'callback_query_id': to_json(callback_query_id),
+    })
+
+
+def getChat(chat_id: int = None, ):
+    return client.send({
+        '@type': 'getChat',
+        'chat_id': to_json(chat_id),
+    })
+
+
+def getChatActiveStories(chat_id: int = None, ):
+    return client.send({
+        '@type': 'getChatActiveStories',
+        'chat_id': to_json(chat_id),
+    })
+
+
+def getChatAdministrators(chat_id: int = None, ):
+    return client.send({
+        '@type': 'getChatAdministrators',
+        'chat_id': to_json(chat_id),
+    })
+
+
+def getChatArchivedStories(chat_id: int = None, from_story_id: int = None, limit: int = None, ):
+    return client.send({
+        '@type': 'getChatArchivedStories',
+        'chat_id': to_json(chat_id),
+        'from_story_id': to_json(from_story_id),
+        'limit': to_json(limit),
+    })
+
+
+def getChatAvailableMessageSenders(chat_id: int = None, ):
+    return client.send({
+        '@type': 'getChatAvailableMessageSenders',
+        'chat_id': to_json(chat_id),
+    })
+
+
+def getChatBoostFeatures():
+    return client.send({
+        '@type': 'getChatBoostFeatures',
+    })
+
+
+def getChatBoostLevelFeatures(level: int = None, ):
+    return client.send({
+        '@type': 'getChatBoostLevelFeatures',
+        'level': to_json(level),
+    })
+
+
+def getChatBoostLink(chat_id: int = None, ):
+    return client.send({
+        '@type': 'getChatBoostLink',
+        'chat_id': to_json(chat_id),
+    })
+
+
+def getChatBoostLinkInfo(url: str = None, ):
+    return client.send({
+        '@type': 'getChatBoostLinkInfo',
+        'url': to_json(url),
+    })
+
+
+def getChatBoostStatus(chat_id: int = None, ):
+    return client.send({
+        '@type': 'getChatBoostStatus',
+        'chat_id': to_json(chat_id),
+    })
+
+
+def getChatBoosts(chat_id: int = None, only_gift_codes: bool = None, offset: str = None, limit: int = None, ):
+    return client.send({
+        '@type': 'getChatBoosts',
+        'chat_id': to_json(chat_id),
+        'only_gift_codes': to_json(only_gift_codes),
+        'offset': to_json(offset),
+        'limit': to_json(limit),
+    })
+
+
+def getChatEventLog(chat_id: int = None, query: str = None, from_event_id: int = None, limit: int = None, filters: ChatEventLogFilters = None, user_ids: list[int] = None, ):
+    return client.send({
+        '@type': 'getChatEventLog',
+        'chat_id': to_json(chat_id),
+        'query': to_json(query),
+        'from_event_id': to_json(from_event_id),
+        'limit': to_json(limit),
+        'filters': to_json(filters),
+        'user_ids': to_json(user_ids),
+    })
+
+
+def getChatFolder(chat_folder_id: int = None, ):
+    return client.send({
+        '@type': 'getChatFolder',
+        'chat_folder_id': to_json(chat_folder_id),
+    })
+
+
+def getChatFolderChatCount(folder: ChatFolder = None, ):
+    return client.send({
+        '@type': 'getChatFolderChatCount',
+        'folder': to_json(folder),
+    })
+
+
+def getChatFolderChatsToLeave(chat_folder_id: int = None, ):
+    return client.send({
+        '@type': 'getChatFolderChatsToLeave',
+        'chat_folder_id': to_json(chat_folder_id),
+    })
+
+
+def getChatFolderDefaultIconName(folder: ChatFolder = None, ):
+    return client.send({
+        '@type': 'getChatFolderDefaultIconName',
+        'folder': to_json(folder),
+    })
+
+
+def getChatFolderInviteLinks(chat_folder_id: int = None, ):
+    return client.send({
+        '@type': 'getChatFolderInviteLinks',
+        'chat_folder_id': to_json(chat_folder_id),
+    })
+
+
+def getChatFolderNewChats(chat_folder_id: int = None, ):
+    return client.send({
+        '@type': 'getChatFolderNewChats',
+        'chat_folder_id': to_json(chat_folder_id),
+    })
+
+
+def getChatHistory(chat_id: int = None, from_message_id: int = None, offset: int = None, limit: int = None, only_local: bool = None, ):
+    return client.send({
+        '@type': 'getChatHistory',
+        'chat_id': to_json(chat_id),
+        'from_message_id': to_json(from_message_id),
+        'offset': to_json(offset),
+        'limit': to_json(limit),
+        'only_local': to_json(only_local),
+    })
+
+
+def getChatInviteLink(chat_id: int = None, invite_link: str = None, ):
+    return client.send({
+        '@type': 'getChatInviteLink',
+        'chat_id': to_json(chat_id),
+        'invite_link': to_json(invite_link),
+    })
+
+
+def getChatInviteLinkCounts(chat_id: int = None, ):
+    return client.send({
+        '@type': 'getChatInviteLinkCounts',
+        'chat_id': to_json(chat_id),
+    })
+
+
+def getChatInviteLinkMembers(chat_id: int = None, invite_link: str = None, offset_member: ChatInviteLinkMember = None, limit: int = None, ):
+    return client.send({
+        '@type': 'getChatInviteLinkMembers',
+        'chat_id': to_json(chat_id),
+        'invite_link': to_json(invite_link),
+        'offset_member': to_json(offset_member),
+        'limit': to_json(limit),
+    })
+
+
+def getChatInviteLinks(chat_id: int = None, creator_user_id: int = None, is_revoked: bool = None, offset_date: int = None, offset_invite_link: str = None, limit: int = None, ):
+    return client.send({
+        '@type': 'getChatInviteLinks',
+        'chat_id': to_json(chat_id),
+        'creator_user_id': to_json(creator_user_id),
+        'is_revoked': to_json(is_revoked),
+        'offset_date': to_json(offset_date),
+        'offset_invite_link': to_json(offset_invite_link),
+        'limit': to_json(limit),
+    })
+
+
+def getChatJoinRequests(chat_id: int = None, invite_link: str = None, query: str = None, offset_request: ChatJoinRequest = None, limit: int = None, ):
+    return client.send({
+        '@type': 'getChatJoinRequests',
+        'chat_id': to_json(chat_id),
+        'invite_link': to_json(invite_link),
+        'query': to_json(query),
+        'offset_request': to_json(offset_request),
+        'limit': to_json(limit),
+    })
+
+
+def getChatListsToAddChat(chat_id: int = None, ):
+    return client.send({
+        '@type': 'getChatListsToAddChat',
+        'chat_id': to_json(chat_id),
+    })
+
+
+def getChatMember(chat_id: int = None, member_id: MessageSender = None, ):
+    return client.send({
+        '@type': 'getChatMember',
+        'chat_id': to_json(chat_id),
+        'member_id': to_json(member_id),
+    })
+
+
+def getChatMessageByDate(chat_id: int = None, date: int = None, ):
+    return client.send({
+        '@type': 'getChatMessageByDate',
+        'chat_id': to_json(chat_id),
+        'date': to_json(date),
+    })
+
+
+def getChatMessageCalendar(chat_id: int = None, filter: SearchMessagesFilter = None, from_message_id: int = None, ):
+    return client.send({
+        '@type': 'getChatMessageCalendar',
+        'chat_id': to_json(chat_id),
+        'filter': to_json(filter),
+        'from_message_id': to_json(from_message_id),
+    })
+
+
+def getChatMessageCount(chat_id: int = None, filter: SearchMessagesFilter = None, return_local: bool = None, ):
+    return client.send({
+        '@type': 'getChatMessageCount',
+        'chat_id': to_json(chat_id),
+        'filter': to_json(filter),
+        'return_local': to_json(return_local),
+    })
+
+
+def getChatMessagePosition(chat_id: int = None, message_id: int = None, filter: SearchMessagesFilter = None, message_thread_id: int = None, ):
+    return client.send({
+        '@type': 'getChatMessagePosition',
+        'chat_id': to_json(chat_id),
+        'message_id': to_json(message_id),
+        'filter': to_json(filter),
+        'message_thread_id': to_json(message_thread_id),
+    })
+
+
+def getChatNotificationSettingsExceptions(scope: NotificationSettingsScope = None, compare_sound: bool = None, ):
+    return client.send({
+        '@type': 'getChatNotificationSettingsExceptions',
+        'scope': to_json(scope),
+        'compare_sound': to_json(compare_sound),
+    })
+
+
+def getChatPinnedMessage(chat_id: int = None, ):
+    return client.send({
+        '@type': 'getChatPinnedMessage',
+        'chat_id': to_json(chat_id),
+    })
+
+
+def getChatPinnedStories(chat_id: int = None, from_story_id: int = None, limit: int = None, ):
+    return client.send({
+        '@type': 'getChatPinnedStories',
+        'chat_id': to_json(chat_id),
+        'from_story_id': to_json(from_story_id),
+        'limit': to_json(limit),
+    })
+
+
+def getChatScheduledMessages(chat_id: int = None, ):
+    return client.send({
+        '@type': 'getChatScheduledMessages',
+        'chat_id': to_json(chat_id),
+    })
+
+
+def getChatSimilarChatCount(chat_id: int = None, return_local: bool = None, ):
+    return client.send({
+        '@type': 'getChatSimilarChatCount',
+        'chat_id': to_json(chat_id),
+        'return_local': to_json(return_local),
+    })
+
+
+def getChatSimilarChats(chat_id: int = None, ):
+    return client.send({
+        '@type': 'getChatSimilarChats',
+        'chat_id': to_json(chat_id),
+    })
+
+
+def getChatSparseMessagePositions(chat_id: int = None, filter: SearchMessagesFilter = None, from_message_id: int = None, limit: int = None, ):
+    return client.send({
+        '@type': 'getChatSparseMessagePositions',
+        'chat_id': to_json(chat_id),
+        'filter': to_json(filter),
+        'from_message_id': to_json(from_message_id),
+        'limit': to_json(limit),
+    })
+
+
+def getChatSponsoredMessages(chat_id: int = None, ):
+    return client.send({
+        '@type': 'getChatSponsoredMessages',
+        'chat_id': to_json(chat_id),
+    })
+
+
+def getChatStatistics(chat_id: int = None, is_dark: bool = None, ):
+    return client.send({
+        '@type': 'getChatStatistics',
+        'chat_id': to_json(chat_id),
+        'is_dark': to_json(is_dark),
+    })
+
+
+def getChatStoryInteractions(story_sender_chat_id: int = None, story_id: int = None, reaction_type: ReactionType = None, prefer_forwards: bool = None, offset: str = None, limit: int = None, ):
+    return client.send({
+        '@type': 'getChatStoryInteractions',
+        'story_sender_chat_id': to_json(story_sender_chat_id),
+        'story_id': to_json(story_id),
+        'reaction_type': to_json(reaction_type),
+        'prefer_forwards': to_json(prefer_forwards),
+        'offset': to_json(offset),
+        'limit': to_json(limit),
+    })
+
+
+def getChats(chat_list: ChatList = None, limit: int = None, ):
+    return client.send({
+        '@type': 'getChats',
+        'chat_list': to_json(chat_list),
+        'limit': to_json(limit),
+    })
+
+
+def getChatsForChatFolderInviteLink(chat_folder_id: int = None, ):
+    return client.send({
+        '@type': 'getChatsForChatFolderInviteLink',
+        'chat_folder_id': to_json(chat_folder_id),
+    })
+
+
+def getChatsToSendStories():
+    return client.send({
+        '@type': 'getChatsToSendStories',
+    })
+
+
+def getCloseFriends():
+    return client.send({
+        '@type': 'getCloseFriends',
+    })
+
+
+def getCommands(scope: BotCommandScope = None, language_code: str = None, ):
+    return client.send({
+        '@type': 'getCommands',
+        'scope': to_json(scope),
+        'language_code': to_json(language_code),
+    })
+
+
+def getConnectedWebsites():
+    return client.send({
+        '@type': 'getConnectedWebsites',
+    })
+
+
+def getContacts():
+    return client.send({
+        '@type': 'getContacts',
+    })
+
+
+def getCountries():
+    return client.send({
+        '@type': 'getCountries',
+    })
+
+
+def getCountryCode():
+    return client.send({
+        '@type': 'getCountryCode',
+    })
+
+
+def getCreatedPublicChats(type: PublicChatType = None, ):
+    return client.send({
+        '@type': 'getCreatedPublicChats',
+        'type': to_json(type),
+    })
+
+
+def getCurrentState():
+    return client.send({
+        '@type': 'getCurrentState',
+    })
+
+
+def getCustomEmojiReactionAnimations():
+    return client.send({
+        '@type': 'getCustomEmojiReactionAnimations',
+    })
+
+
+def getCustomEmojiStickers(custom_emoji_ids: list[int] = None, ):
+    return client.send({
+        '@type': 'getCustomEmojiStickers',
+        'custom_emoji_ids': to_json(custom_emoji_ids),
+    })
+
+
+def getDatabaseStatistics():
+    return client.send({
+        '@type': 'getDatabaseStatistics',
+    })
+
+
+def getDeepLinkInfo(link: str = None, ):
+    return client.send({
+        '@type': 'getDeepLinkInfo',
+        'link': to_json(link),
+    })
+
+
+def getDefaultBackgroundCustomEmojiStickers():
+    return client.send({
+        '@type': 'getDefaultBackgroundCustomEmojiStickers',
+    })
+
+
+def getDefaultChatEmojiStatuses():
+    return client.send({
+        '@type': 'getDefaultChatEmojiStatuses',
+    })
+
+
+def getDefaultChatPhotoCustomEmojiStickers():
+    return client.send({
+        '@type': 'getDefaultChatPhotoCustomEmojiStickers',
+    })
+
+
+def getDefaultEmojiStatuses():
+    return client.send({
+        '@type': 'getDefaultEmojiStatuses',
+    })
+
+
+def getDefaultMessageAutoDeleteTime():
+    return client.send({
+        '@type': 'getDefaultMessageAutoDeleteTime',
+    })
+
+
+def getDefaultProfilePhotoCustomEmojiStickers():
+    return client.send({
+        '@type': 'getDefaultProfilePhotoCustomEmojiStickers',
+    })
+
+
+def getDisallowedChatEmojiStatuses():
+    return client.send({
+        '@type': 'getDisallowedChatEmojiStatuses',
+    })
+
+
+def getEmojiCategories(type: EmojiCategoryType = None, ):
+    return client.send({
+        '@type': 'getEmojiCategories',
+        'type': to_json(type),
+    })
+
+
+def getEmojiReaction(emoji: str = None, ):
+    return client.send({
+        '@type': 'getEmojiReaction',
+        'emoji': to_json(emoji),
+    })
+
+
+def getEmojiSuggestionsUrl(language_code: str = None, ):
+    return client.send({
+        '@type': 'getEmojiSuggestionsUrl',
+        'language_code': to_json(language_code),
+    })
+
+
+def getExternalLink(link: str = None, allow_write_access: bool = None, ):
+    return client.send({
+        '@type': 'getExternalLink',
+        'link': to_json(link),
+        'allow_write_access': to_json(allow_write_access),
+    })
+
+
+def getExternalLinkInfo(link: str = None, ):
+    return client.send({
+        '@type': 'getExternalLinkInfo',
+        'link': to_json(link),
+    })
+
+
+def getFavoriteStickers():
+    return client.send({
+        '@type': 'getFavoriteStickers',
+    })
+
+
+def getFile(file_id: int = None, ):
+    return client.send({
+        '@type': 'getFile',
+        'file_id': to_json(file_id),
+    })
+
+
+def getFileDownloadedPrefixSize(file_id: int = None, offset: int = None, ):
+    return client.send({
+        '@type': 'getFileDownloadedPrefixSize',
+        'file_id': to_json(file_id),
+        'offset': to_json(offset),
+    })
+
+
+def getFileExtension(mime_type: str = None, ):
+    return client.send({
+        '@type': 'getFileExtension',
+        'mime_type': to_json(mime_type),
+    })
+
+
+def getFileMimeType(file_name: str = None, ):
+    return client.send({
+        '@type': 'getFileMimeType',
+        'file_name': to_json(file_name),
+    })
+
+
+def getForumTopic(chat_id: int = None, message_thread_id: int = None, ):
+    return client.send({
+        '@type': 'getForumTopic',
+        'chat_id': to_json(chat_id),
+        'message_thread_id': to_json(message_thread_id),
+    })
+
+
+def getForumTopicDefaultIcons():
+    return client.send({
+        '@type': 'getForumTopicDefaultIcons',
+    })
+
+
+def getForumTopicLink(chat_id: int = None, message_thread_id: int = None, ):
+    return client.send({
+        '@type': 'getForumTopicLink',
+        'chat_id': to_json(chat_id),
+        'message_thread_id': to_json(message_thread_id),
+    })
+
+
+def getForumTopics(chat_id: int = None, query: str = None, offset_date: int = None, offset_message_id: int = None, offset_message_thread_id: int = None, limit: int = None, ):
+    return client.send({
+        '@type': 'getForumTopics',
+        'chat_id': to_json(chat_id),
+        'query': to_json(query),
+        'offset_date': to_json(offset_date),
+        'offset_message_id': to_json(offset_message_id),
+        'offset_message_thread_id': to_json(offset_message_thread_id),
+        'limit': to_json(limit),
+    })
+
+
+def getGameHighScores(chat_id: int = None, message_id: int = None, user_id: int = None, ):
+    return client.send({
+        '@type': 'getGameHighScores',
+        'chat_id': to_json(chat_id),
+        'message_id': to_json(message_id),
+        'user_id': to_json(user_id),
+    })
+
+
+def getGroupCall(group_call_id: int = None, ):
+    return client.send({
+        '@type': 'getGroupCall',
+        'group_call_id': to_json(group_call_id),
+    })
+
+
+def getGroupCallInviteLink(group_call_id: int = None, can_self_unmute: bool = None, ):
+    return client.send({
+        '@type': 'getGroupCallInviteLink',
+        'group_call_id': to_json(group_call_id),
+        'can_self_unmute': to_json(can_self_unmute),
+    })
+
+
+def getGroupCallStreamSegment(group_call_id: int = None, time_offset: int = None, scale: int = None, channel_id: int = None, video_quality: GroupCallVideoQuality = None, ):
+    return client.send({
+        '@type': 'getGroupCallStreamSegment',
+        'group_call_id': to_json(group_call_id),
+        'time_offset': to_json(time_offset),
+        'scale': to_json(scale),
+        'channel_id': to_json(channel_id),
+        'video_quality': to_json(video_quality),
+    })
+
+
+def getGroupCallStreams(group_call_id: int = None, ):
+    return client.send({
+        '@type': 'getGroupCallStreams',
+        'group_call_id': to_json(group_call_id),
+    })
+
+
+def getGroupsInCommon(user_id: int = None, offset_chat_id: int = None, limit: int = None, ):
+    return client.send({
+        '@type': 'getGroupsInCommon',
+        'user_id': to_json(user_id),
+        'offset_chat_id': to_json(offset_chat_id),
+        'limit': to_json(limit),
+    })
+
+
+def getImportedContactCount():
+    return client.send({
+        '@type': 'getImportedContactCount',
+    })
+
+
+def getInactiveSupergroupChats():
+    return client.send({
+        '@type': 'getInactiveSupergroupChats',
+    })
+
+
+def getInlineGameHighScores(inline_message_id: str = None, user_id: int = None, ):
+    return client.send({
+        '@type': 'getInlineGameHighScores',
+        'inline_message_id': to_json(inline_message_id),
+        'user_id': to_json(user_id),
+    })
+
+
+def getInlineQueryResults(bot_user_id: int = None, chat_id: int = None, user_location: Location = None, query: str = None, offset: str = None, ):
+    return client.send({
+        '@type': 'getInlineQueryResults',
+        'bot_user_id': to_json(bot_user_id),
+        'chat_id': to_json(chat_id),
+        'user_location': to_json(user_location),
+        'query': to_json(query),
+        'offset': to_json(offset),
+    })
+
+
+def getInstalledBackgrounds(for_dark_theme: bool = None, ):
+    return client.send({
+        '@type': 'getInstalledBackgrounds',
+        'for_dark_theme': to_json(for_dark_theme),
+    })
+
+
+def getInstalledStickerSets(sticker_type: StickerType = None, ):
+    return client.send({
+        '@type': 'getInstalledStickerSets',
+        'sticker_type': to_json(sticker_type),
+    })
+
+
+def getInternalLink(type: InternalLinkType = None, is_http: bool = None, ):
+    return client.send({
+        '@type': 'getInternalLink',
+        'type': to_json(type),
+        'is_http': to_json(is_http),
+    })
+
+
+def getInternalLinkType(link: str = None, ):
+    return client.send({
+        '@type': 'getInternalLinkType',
+        'link': to_json(link),
+    })
+
+
+def getJsonString(json_value: JsonValue = None, ):
+    return client.send({
+        '@type': 'getJsonString',
+        'json_value': to_json(json_value),
+    })
+
+
+def getJsonValue(json: str = None, ):
+    return client.send({
+        '@type': 'getJsonValue',
+        'json': to_json(json),
+    })
+
+
+def getLanguagePackInfo(language_pack_id: str = None, ):
+    return client.send({
+        '@type': 'getLanguagePackInfo',
+        'language_pack_id': to_json(language_pack_id),
+    })
+
+
+def getLanguagePackString(language_pack_database_path: str = None, localization_target: str = None, language_pack_id: str = None, key: str = None, ):
+    return client.send({
+        '@type': 'getLanguagePackString',
+        'language_pack_database_path': to_json(language_pack_database_path),
+        'localization_target': to_json(localization_target),
+        'language_pack_id': to_json(language_pack_id),
+        'key': to_json(key),
+    })
+
+
+def getLanguagePackStrings(language_pack_id: str = None, keys: list[str] = None, ):
+    return client.send({
+        '@type': 'getLanguagePackStrings',
+        'language_pack_id': to_json(language_pack_id),
+        'keys': to_json(keys),
+    })
+
+
+def getLocalizationTargetInfo(only_local: bool = None, ):
+    return client.send({
+        '@type': 'getLocalizationTargetInfo',
+        'only_local': to_json(only_local),
+    })
+
+
+def getLogStream():
+    return client.send({
+        '@type': 'getLogStream',
+    })
+
+
+def getLogTagVerbosityLevel(tag: str = None, ):
+    return client.send({
+        '@type': 'getLogTagVerbosityLevel',
+        'tag': to_json(tag),
+    })
+
+
+def getLogTags():
+    return client.send({
+        '@type': 'getLogTags',
+    })
+
+
+def getLogVerbosityLevel():
+    return client.send({
+        '@type': 'getLogVerbosityLevel',
+    })
+
+
+def getLoginUrl(chat_id: int = None, message_id: int = None, button_id: int = None, allow_write_access: bool = None, ):
+    return client.send({
+        '@type': 'getLoginUrl',
+        'chat_id': to_json(chat_id),
+        'message_id': to_json(message_id),
+        'button_id': to_json(button_id),
+        'allow_write_access': to_json(allow_write_access),
+    })
+
+
+def getLoginUrlInfo(chat_id: int = None, message_id: int = None, button_id: int = None, ):
+    return client.send({
+        '@type': 'getLoginUrlInfo',
+        'chat_id': to_json(chat_id),
+        'message_id': to_json(message_id),
+        'button_id': to_json(button_id),
+    })
+
+
+def getMapThumbnailFile(location: Location = None, zoom: int = None, width: int = None, height: int = None, scale: int = None, chat_id: int = None, ):
+    return client.send({
+        '@type': 'getMapThumbnailFile',
+        'location': to_json(location),
+        'zoom': to_json(zoom),
+        'width': to_json(width),
+        'height': to_json(height),
+        'scale': to_json(scale),
+        'chat_id': to_json(chat_id),
+    })
+
+
+def getMarkdownText(text: FormattedText = None, ):
+    return client.send({
+        '@type': 'getMarkdownText',
+        'text': to_json(text),
+    })
+
+
+def getMe():
+    return client.send({
+        '@type': 'getMe',
+    })
+
+
+def getMenuButton(user_id: int = None, ):
+    return client.send({
+        '@type': 'getMenuButton',
+        'user_id': to_json(user_id),
+    })
+
+
+def getMessage(chat_id: int = None, message_id: int = None, ):
+    return client.send({
+        '@type': 'getMessage',
+        'chat_id': to_json(chat_id),
+        'message_id': to_json(message_id),
+    })
+
+
+def getMessageAddedReactions(chat_id: int = None, message_id: int = None, reaction_type: ReactionType = None, offset: str = None, limit: int = None, ):
+    return client.send({
+        '@type': 'getMessageAddedReactions',
+        'chat_id': to_json(chat_id),
+        'message_id': to_json(message_id),
+        'reaction_type': to_json(reaction_type),
+        'offset': to_json(offset),
+        'limit': to_json(limit),
+    })
+
+
+def getMessageAvailableReactions(chat_id: int = None, message_id: int = None, row_size: int = None, ):
+    return client.send({
+        '@type': 'getMessageAvailableReactions',
+        'chat_id': to_json(chat_id),
+        'message_id': to_json(message_id),
+        'row_size': to_json(row_size),
+    })
+
+
+def getMessageEmbeddingCode(chat_id: int = None, message_id: int = None, for_album: bool = None, ):
+    return client.send({
+        '@type': 'getMessageEmbeddingCode',
+        'chat_id': to_json(chat_id),
+        'message_id': to_json(message_id),
+        'for_album': to_json(for_album),
+    })
+
+
+def getMessageFileType(message_file_head: str = None, ):
+    return client.send({
+        '@type': 'getMessageFileType',
+        'message_file_head': to_json(message_file_head),
+    })
+
+
+def getMessageImportConfirmationText(chat_id: int = None, ):
+    return client.send({
+        '@type': 'getMessageImportConfirmationText',
+        'chat_id': to_json(chat_id),
+    })
+
+
+def getMessageLink(chat_id: int = None, message_id: int = None, media_timestamp: int = None, for_album: bool = None, in_message_thread: bool = None, ):
+    return client.send({
+        '@type': 'getMessageLink',
+        'chat_id': to_json(chat_id),
+        'message_id': to_json(message_id),
+        'media_timestamp': to_json(media_timestamp),
+        'for_album': to_json(for_album),
+        'in_message_thread': to_json(in_message_thread),
+    })
+
+
+def getMessageLinkInfo(url: str = None, ):
+    return client.send({
+        '@type': 'getMessageLinkInfo',
+        'url': to_json(url),
+    })
+
+
+def getMessageLocally(chat_id: int = None, message_id: int = None, ):
+    return client.send({
+        '@type': 'getMessageLocally',
+        'chat_id': to_json(chat_id),
+        'message_id': to_json(message_id),
+    })
+
+
+def getMessagePublicForwards(chat_id: int = None, message_id: int = None, offset: str = None, limit: int = None, ):
+    return client.send({
+        '@type': 'getMessagePublicForwards',
+        'chat_id': to_json(chat_id),
+        'message_id': to_json(message_id),
+        'offset': to_json(offset),
+        'limit': to_json(limit),
+    })
+
+
+def getMessageStatistics(chat_id: int = None, message_id: int = None, is_dark: bool = None, ):
+    return client.send({
+        '@type': 'getMessageStatistics',
+        'chat_id': to_json(chat_id),
+        'message_id': to_json(message_id),
+        'is_dark': to_json(is_dark),
+    })
+
+
+def getMessageThread(chat_id: int = None, message_id: int = None, ):
+    return client.send({
+        '@type': 'getMessageThread',
+        'chat_id': to_json(chat_id),
+        'message_id': to_json(message_id),
+    })
+
+
+def getMessageThreadHistory(chat_id: int = None, message_id: int = None, from_message_id: int = None, offset: int = None, limit: int = None, ):
+    return client.send({
+        '@type': 'getMessageThreadHistory',
+        'chat_id': to_json(chat_id),
+        'message_id': to_json(message_id),
+        'from_message_id': to_json(from_message_id),
+        'offset': to_json(offset),
+        'limit': to_json(limit),
+    })
+
+
+def getMessageViewers(chat_id: int = None, message_id: int = None, ):
+    return client.send({
+        '@type': 'getMessageViewers',
+        'chat_id': to_json(chat_id),
+        'message_id': to_json(message_id),
+    })
+
+
+def getMessages(chat_id: int = None, message_ids: list[int] = None, ):
+    return client.send({
+        '@type': 'getMessages',
+        'chat_id': to_json(chat_id),
+        'message_ids': to_json(message_ids),
+    })
+
+
+def getNetworkStatistics(only_current: bool = None, ):
+    return client.send({
+        '@type': 'getNetworkStatistics',
+        'only_current': to_json(only_current),
+    })
+
+
+def getOption(name: str = None, ):
+    return client.send({
+        '@type': 'getOption',
+        'name': to_json(name),
+    })
+
+
+def getPassportAuthorizationForm(bot_user_id: int = None, scope: str = None, public_key: str = None, nonce: str = None, ):
+    return client.send({
+        '@type': 'getPassportAuthorizationForm',
+        'bot_user_id': to_json(bot_user_id),
+        'scope': to_json(scope),
+        'public_key': to_json(public_key),
+        'nonce': to_json(nonce),
+    })
+
+
+def getPassportAuthorizationFormAvailableElements(authorization_form_id: int = None, password: str = None, ):
+    return client.send({
+        '@type': 'getPassportAuthorizationFormAvailableElements',
+        'authorization_form_id': to_json(authorization_form_id),
+        'password': to_json(password),
+    })
+
+
+def getPassportElement(type: PassportElementType = None, password: str = None, ):
+    return client.send({
+        '@type': 'getPassportElement',
+        'type': to_json(type),
+        'password': to_json(password),
+    })
+
+
+def getPasswordState():
+    return client.send({
+        '@type': 'getPasswordState',
+    })
+
+
+def getPaymentForm(input_invoice: InputInvoice = None, theme: ThemeParameters = None, ):
+    return client.send({
+        '@type': 'getPaymentForm',
+        'input_invoice': to_json(input_invoice),
+        'theme': to_json(theme),
+    })
+
+
+def getPaymentReceipt(chat_id: int = None, message_id: int = None, ):
+    return client.send({
+        '@type': 'getPaymentReceipt',
+        'chat_id': to_json(chat_id),
+        'message_id': to_json(message_id),
+    })
+
+
+def getPhoneNumberInfo(phone_number_prefix: str = None, ):
+    return client.send({
+        '@type': 'getPhoneNumberInfo',
+        'phone_number_prefix': to_json(phone_number_prefix),
+    })
+
+
+def getPhoneNumberInfoSync(language_code: str = None, phone_number_prefix: str = None, ):
+    return client.send({
+        '@type': 'getPhoneNumberInfoSync',
+        'language_code': to_json(language_code),
+        'phone_number_prefix': to_json(phone_number_prefix),
+    })
+
+
+def getPollVoters(chat_id: int = None, message_id: int = None, option_id: int = None, offset: int = None, limit: int = None, ):
+    return client.send({
+        '@type': 'getPollVoters',
+        'chat_id': to_json(chat_id),
+        'message_id': to_json(message_id),
+        'option_id': to_json(option_id),
+        'offset': to_json(offset),
+        'limit': to_json(limit),
+    })
+
+
+def getPreferredCountryLanguage(country_code: str = None, ):
+    return client.send({
+        '@type': 'getPreferredCountryLanguage',
+        'country_code': to_json(country_code),
+    })
+
+
+def getPremiumFeatures(source: PremiumSource = None, ):
+    return client.send({
+        '@type': 'getPremiumFeatures',
+        'source': to_json(source),
+    })
+
+
+def getPremiumGiftCodePaymentOptions(boosted_chat_id: int = None, ):
+    return client.send({
+        '@type': 'getPremiumGiftCodePaymentOptions',
+        'boosted_chat_id': to_json(boosted_chat_id),
+    })
+
+
+def getPremiumGiveawayInfo(chat_id: int = None, message_id: int = None, ):
+    return client.send({
+        '@type': 'getPremiumGiveawayInfo',
+        'chat_id': to_json(chat_id),
+        'message_id': to_json(message_id),
+    })
+
+
+def getPremiumLimit(limit_type: PremiumLimitType = None, ):
+    return client.send({
+        '@type': 'getPremiumLimit',
+        'limit_type': to_json(limit_type),
+    })
+
+
+def getPremiumState():
+    return client.send({
+        '@type': 'getPremiumState',
+    })
+
+
+def getPremiumStickerExamples():
+    return client.send({
+        '@type': 'getPremiumStickerExamples',
+    })
+
+
+def getPremiumStickers(limit: int = None, ):
+    return client.send({
+        '@type': 'getPremiumStickers',
+        'limit': to_json(limit),
+    })
+
+
+def getProxies():
+    return client.send({
+        '@type': 'getProxies',
+    })
+
+
+def getProxyLink(proxy_id: int = None, ):
+    return client.send({
+        '@type': 'getProxyLink',
+        'proxy_id': to_json(proxy_id),
+    })
+
+
+def getPushReceiverId(payload: str = None, ):
+    return client.send({
+        '@type': 'getPushReceiverId',
+        'payload': to_json(payload),
+    })
+
+
+def getRecentEmojiStatuses():
+    return client.send({
+        '@type': 'getRecentEmojiStatuses',
+    })
+
+
+def getRecentInlineBots():
+    return client.send({
+        '@type': 'getRecentInlineBots',
+    })
+
+
+def getRecentStickers(is_attached: bool = None, ):
+    return client.send({
+        '@type': 'getRecentStickers',
+        'is_attached': to_json(is_attached),
+    })
+
+
+def getRecentlyOpenedChats(limit: int = None, ):
+    return client.send({
+        '@type': 'getRecentlyOpenedChats',
+        'limit': to_json(limit),
+    })
+
+
+def getRecentlyVisitedTMeUrls(referrer: str = None, ):
+    return client.send({
+        '@type': 'getRecentlyVisitedTMeUrls',
+        'referrer': to_json(referrer),
+    })
+
+
+def getRecommendedChatFolders():
+    return client.send({
+        '@type': 'getRecommendedChatFolders',
+    })
+
+
+def getRecoveryEmailAddress(password: str = None, ):
+    return client.send({
+        '@type': 'getRecoveryEmailAddress',
+        'password': to_json(password),
+    })
+
+
+def getRemoteFile(remote_file_id: str = None, file_type: FileType = None, ):
+    return client.send({
+        '@type': 'getRemoteFile',
+        'remote_file_id': to_json(remote_file_id),
+        'file_type': to_json(file_type),
+    })
+
+
+def getRepliedMessage(chat_id: int = None, message_id: int = None, ):
+    return client.send({
+        '@type': 'getRepliedMessage',
+        'chat_id': to_json(chat_id),
+        'message_id': to_json(message_id),
+    })
+
+
+def getSavedAnimations():
+    return client.send({
+        '@type': 'getSavedAnimations',
+    })
+
+
+def getSavedNotificationSound(notification_sound_id: int = None, ):
+    return client.send({
+        '@type': 'getSavedNotificationSound',
+        'notification_sound_id': to_json(notification_sound_id),
+    })
+
+
+def getSavedNotificationSounds():
+    return client.send({
+        '@type': 'getSavedNotificationSounds',
+    })
+
+
+def getSavedOrderInfo():
+    return client.send({
+        '@type': 'getSavedOrderInfo',
+    })
+
+
+def getScopeNotificationSettings(scope: NotificationSettingsScope = None, ):
+    return client.send({
+        '@type': 'getScopeNotificationSettings',
+        'scope': to_json(scope),
+    })
+
+
+def getSecretChat(secret_chat_id: int = None, ):
+    return client.send({
+        '@type': 'getSecretChat',
+        'secret_chat_id': to_json(secret_chat_id),
+    })
+
+
+def getStatisticalGraph(chat_id: int = None, token: str = None, x: int = None, ):
+    return client.send({
+        '@type': 'getStatisticalGraph',
+        'chat_id': to_json(chat_id),
+        'token': to_json(token),
+        'x': to_json(x),
+    })
+
+
+def getStickerEmojis(sticker: InputFile = None, ):
+    return client.send({
+        '@type': 'getStickerEmojis',
+        'sticker': to_json(sticker),
+    })
+
+
+def getStickerSet(set_id: int = None, ):
+    return client.send({
+        '@type': 'getStickerSet',
+        'set_id': to_json(set_id),
+    })
+
+
+def getStickers(sticker_type: StickerType = None, query: str = None, limit: int = None, chat_id: int = None, ):
+    return client.send({
+        '@type': 'getStickers',
+        'sticker_type': to_json(sticker_type),
+        'query': to_json(query),
+        'limit': to_json(limit),
+        'chat_id': to_json(chat_id),
+    })
+
+
+def getStorageStatistics(chat_limit: int = None, ):
+    return client.send({
+        '@type': 'getStorageStatistics',
+        'chat_limit': to_json(chat_limit),
+    })
+
+
+def getStorageStatisticsFast():
+    return client.send({
+        '@type': 'getStorageStatisticsFast',
+    })
+
+
+def getStory(story_sender_chat_id: int = None, story_id: int = None, only_local: bool = None, ):
+    return client.send({
+        '@type': 'getStory',
+        'story_sender_chat_id': to_json(story_sender_chat_id),
+        'story_id': to_json(story_id),
+        'only_local': to_json(only_local),
+    })
+
+
+def getStoryAvailableReactions(row_size: int = None, ):
+    return client.send({
+        '@type': 'getStoryAvailableReactions',
+        'row_size': to_json(row_size),
+    })
+
+
+def getStoryInteractions(story_id: int = None, query: str = None, only_contacts: bool = None, prefer_forwards: bool = None, prefer_with_reaction: bool = None, offset: str = None, limit: int = None, ):
+    return client.send({
+        '@type': 'getStoryInteractions',
+        'story_id': to_json(story_id),
+        'query': to_json(query),
+        'only_contacts': to_json(only_contacts),
+        'prefer_forwards': to_json(prefer_forwards),
+        'prefer_with_reaction': to_json(prefer_with_reaction),
+        'offset': to_json(offset),
+        'limit': to_json(limit),
+    })
+
+
+def getStoryNotificationSettingsExceptions():
+    return client.send({
+        '@type': 'getStoryNotificationSettingsExceptions',
+    })
+
+
+def getStoryPublicForwards(story_sender_chat_id: int = None, story_id: int = None, offset: str = None, limit: int = None, ):
+    return client.send({
+        '@type': 'getStoryPublicForwards',
+        'story_sender_chat_id': to_json(story_sender_chat_id),
+        'story_id': to_json(story_id),
+        'offset': to_json(offset),
+        'limit': to_json(limit),
+    })
+
+
+def getStoryStatistics(chat_id: int = None, story_id: int = None, is_dark: bool = None, ):
+    return client.send({
+        '@type': 'getStoryStatistics',
+        'chat_id': to_json(chat_id),
+        'story_id': to_json(story_id),
+        'is_dark': to_json(is_dark),
+    })
+
+
+def getSuggestedFileName(file_id: int = None, directory: str = None, ):
+    return client.send({
+        '@type': 'getSuggestedFileName',
+        'file_id': to_json(file_id),
+        'directory': to_json(directory),
+    })
+
+
+def getSuggestedStickerSetName(title: str = None, ):
+    return client.send({
+        '@type': 'getSuggestedStickerSetName',
+        'title': to_json(title),
+    })
+
+
+def getSuitableDiscussionChats():
+    return client.send({
+        '@type': 'getSuitableDiscussionChats',
+    })
+
+
+def getSupergroup(supergroup_id: int = None, ):
+    return client.send({
+        '@type': 'getSupergroup',
+        'supergroup_id': to_json(supergroup_id),
+    })
+
+
+def getSupergroupFullInfo(supergroup_id: int = None, ):
+    return client.send({
+        '@type': 'getSupergroupFullInfo',
+        'supergroup_id': to_json(supergroup_id),
+    })
+
+
+def getSupergroupMembers(supergroup_id: int = None, filter: SupergroupMembersFilter = None, offset: int = None, limit: int = None, ):
+    return client.send({
+        '@type': 'getSupergroupMembers',
+        'supergroup_id': to_json(supergroup_id),
+        'filter': to_json(filter),
+        'offset': to_json(offset),
+        'limit': to_json(limit),
+    })
+
+
+def getSupportName():
+    return client.send({
+        '@type': 'getSupportName',
+    })
+
+
+def getSupportUser():
+    return client.send({
+        '@type': 'getSupportUser',
+    })
+
+
+def getTemporaryPasswordState():
+    return client.send({
+        '@type': 'getTemporaryPasswordState',
+    })
+
+
+def getTextEntities(text: str = None, ):
+    return client.send({
+        '@type': 'getTextEntities',
+        'text': to_json(text),
+    })
+
+
+def getThemeParametersJsonString(theme: ThemeParameters = None, ):
+    return client.send({
+        '@type': 'getThemeParametersJsonString',
+        'theme': to_json(theme),
+    })
+
+
+def getThemedChatEmojiStatuses():
+    return client.send({
+        '@type': 'getThemedChatEmojiStatuses',
+    })
+
+
+def getThemedEmojiStatuses():
+    return client.send({
+        '@type': 'getThemedEmojiStatuses',
+    })
+
+
+def getTopChats(category: TopChatCategory = None, limit: int = None, ):
+    return client.send({
+        '@type': 'getTopChats',
+        'category': to_json(category),
+        'limit': to_json(limit),
+    })
+
+
+def getTrendingStickerSets(sticker_type: StickerType = None, offset: int = None, limit: int = None, ):
+    return client.send({
+        '@type': 'getTrendingStickerSets',
+        'sticker_type': to_json(sticker_type),
+        'offset': to_json(offset),
+        'limit': to_json(limit),
+    })
+
+
+def getUser(user_id: int = None, ):
+    return client.send({
+        '@type': 'getUser',
+        'user_id': to_json(user_id),
+    })
+
+
+def getUserChatBoosts(chat_id: int = None, user_id: int = None, ):
+    return client.send({
+        '@type': 'getUserChatBoosts',
+        'chat_id': to_json(chat_id),
+        'user_id': to_json(user_id),
+    })
+
+
+def getUserFullInfo(user_id: int = None, ):
+    return client.send({
+        '@type': 'getUserFullInfo',
+        'user_id': to_json(user_id),
+    })
+
+
+def getUserLink():
+    return client.send({
+        '@type': 'getUserLink',
+    })
+
+
+def getUserPrivacySettingRules(setting: UserPrivacySetting = None, ):
+    return client.send({
+        '@type': 'getUserPrivacySettingRules',
+        'setting': to_json(setting),
+    })
+
+
+def getUserProfilePhotos(user_id: int = None, offset: int = None, limit: int = None, ):
+    return client.send({
+        '@type': 'getUserProfilePhotos',
+        'user_id': to_json(user_id),
+        'offset': to_json(offset),
+        'limit': to_json(limit),
+    })
+
+
+def getUserSupportInfo(user_id: int = None, ):
+    return client.send({
+        '@type': 'getUserSupportInfo',
+        'user_id': to_json(user_id),
+    })
+
+
+def getVideoChatAvailableParticipants(chat_id: int = None, ):
+    return client.send({
+        '@type': 'getVideoChatAvailableParticipants',
+        'chat_id': to_json(chat_id),
+    })
+
+
+def getVideoChatRtmpUrl(chat_id: int = None, ):
+    return client.send({
+        '@type': 'getVideoChatRtmpUrl',
+        'chat_id': to_json(chat_id),
+    })
+
+
+def getWebAppLinkUrl(chat_id: int = None, bot_user_id: int = None, web_app_short_name: str = None, start_parameter: str = None, theme: ThemeParameters = None, application_name: str = None, allow_write_access: bool = None, ):
+    return client.send({
+        '@type': 'getWebAppLinkUrl',
+        'chat_id': to_json(chat_id),
+        'bot_user_id': to_json(bot_user_id),
+        'web_app_short_name': to_json(web_app_short_name),
+        'start_parameter': to_json(start_parameter),
+        'theme': to_json(theme),
+        'application_name': to_json(application_name),
+        'allow_write_access': to_json(allow_write_access),
+    })
+
+
+def getWebAppUrl(bot_user_id: int = None, url: str = None, theme: ThemeParameters = None, application_name: str = None, ):
+    return client.send({
+        '@type': 'getWebAppUrl',
+        'bot_user_id': to_json(bot_user_id),
+        'url': to_json(url),
+        'theme': to_json(theme),
+        'application_name': to_json(application_name),
+    })
+
+
+def getWebPageInstantView(url: str = None, force_full: bool = None, ):
+    return client.send({
+        '@type': 'getWebPageInstantView',
+        'url': to_json(url),
+        'force_full': to_json(force_full),
+    })
+
+
+def getWebPagePreview(text: FormattedText = None, link_preview_options: LinkPreviewOptions = None, ):
+    return client.send({
+        '@type': 'getWebPagePreview',
+        'text': to_json(text),
+        'link_preview_options': to_json(link_preview_options),
+    })
+
+
+def hideSuggestedAction(action: SuggestedAction = None, ):
+    return client.send({
+        '@type': 'hideSuggestedAction',
+        'action': to_json(action),
+    })
+
+
+def importContacts(contacts: list[Contact] = None, ):
+    return client.send({
+        '@type': 'importContacts',
+        'contacts': to_json(contacts),
+    })
+
+
+def importMessages(chat_id: int = None, message_file: InputFile = None, attached_files: list[InputFile] = None, ):
+    return client.send({
+        '@type': 'importMessages',
+        'chat_id': to_json(chat_id),
+        'message_file': to_json(message_file),
+        'attached_files': to_json(attached_files),
+    })
+
+
+def inviteGroupCallParticipants(group_call_id: int = None, user_ids: list[int] = None, ):
+    return client.send({
+        '@type': 'inviteGroupCallParticipants',
+        'group_call_id': to_json(group_call_id),
+        'user_ids': to_json(user_ids),
+    })
+
+
+def joinChat(chat_id: int = None, ):
+    return client.send({
+        '@type': 'joinChat',
+        'chat_id': to_json(chat_id),
+    })
+
+
+def joinChatByInviteLink(invite_link: str = None, ):
+    return client.send({
+        '@type': 'joinChatByInviteLink',
+        'invite_link': to_json(invite_link),
+    })
+
+
+def joinGroupCall(group_call_id: int = None, participant_id: MessageSender = None, audio_source_id: int = None, payload: str = None, is_muted: bool = None, is_my_video_enabled: bool = None, invite_hash: str = None, ):
+    return client.send({
+        '@type': 'joinGroupCall',
+        'group_call_id': to_json(group_call_id),
+        'participant_id': to_json(participant_id),
+        'audio_source_id': to_json(audio_source_id),
+        'payload': to_json(payload),
+        'is_muted': to_json(is_muted),
+        'is_my_video_enabled': to_json(is_my_video_enabled),
+        'invite_hash': to_json(invite_hash),
+    })
+
+
+def launchPrepaidPremiumGiveaway(giveaway_id: int = None, parameters: PremiumGiveawayParameters = None, ):
+    return client.send({
+        '@type': 'launchPrepaidPremiumGiveaway',
+        'giveaway_id': to_json(giveaway_id),
+        'parameters': to_json(parameters),
+    })
+
+
+def leaveChat(chat_id: int = None, ):
+    return client.send({
+        '@type': 'leaveChat',
+        'chat_id': to_json(chat_id),
+    })
+
+
+def leaveGroupCall(group_call_id: int = None, ):
+    return client.send({
+        '@type': 'leaveGroupCall',
+        'group_call_id': to_json(group_call_id),
+    })
+
+
+def loadActiveStories(story_list: StoryList = None, ):
+    return client.send({
+        '@type': 'loadActiveStories',
+        'story_list': to_json(story_list),
+    })
+
+
+def loadChats(chat_list: ChatList = None, limit: int = None, ):
+    return client.send({
+        '@type': 'loadChats',
+        'chat_list': to_json(chat_list),
+        'limit': to_json(limit),
+    })
+
+
+def loadGroupCallParticipants(group_call_id: int = None, limit: int = None, ):
+    return client.send({
+        '@type': 'loadGroupCallParticipants',
+        'group_call_id': to_json(group_call_id),
+        'limit': to_json(limit),
+    })
+
+
+def logOut():
+    return client.send({
+        '@type': 'logOut',
+    })
+
+
+def openChat(chat_id: int = None, ):
+    return client.send({
+        '@type': 'openChat',
+        'chat_id': to_json(chat_id),
+    })
+
+
+def openChatSimilarChat(chat_id: int = None, opened_chat_id: int = None, ):
+    return client.send({
+        '@type': 'openChatSimilarChat',
+        'chat_id': to_json(chat_id),
+        'opened_chat_id': to_json(opened_chat_id),
+    })
+
+
+def openMessageContent(chat_id: int = None, message_id: int = None, ):
+    return client.send({
+        '@type': 'openMessageContent',
+        'chat_id': to_json(chat_id),
+        'message_id': to_json(message_id),
+    })
+
+
+def openStory(story_sender_chat_id: int = None, story_id: int = None, ):
+    return client.send({
+        '@type': 'openStory',
+        'story_sender_chat_id': to_json(story_sender_chat_id),
+        'story_id': to_json(story_id),
+    })
+
+
+def openWebApp(chat_id: int = None, bot_user_id: int = None, url: str = None, theme: ThemeParameters = None, application_name: str = None, message_thread_id: int = None, reply_to: InputMessageReplyTo = None, ):
+    return client.send({
+        '@type': 'openWebApp',
+        'chat_id': to_json(chat_id),
+        'bot_user_id': to_json(bot_user_id),
+        'url': to_json(url),
+        'theme': to_json(theme),
+        'application_name': to_json(application_name),
+        'message_thread_id': to_json(message_thread_id),
+        'reply_to': to_json(reply_to),
+    })
+
+
+def optimizeStorage(size: int = None, ttl: int = None, count: int = None, immunity_delay: int = None, file_types: list[FileType] = None, chat_ids: list[int] = None, exclude_chat_ids: list[int] = None, return_deleted_file_statistics: bool = None, chat_limit: int = None, ):
+    return client.send({
+        '@type': 'optimizeStorage',
+        'size': to_json(size),
+        'ttl': to_json(ttl),
+        'count': to_json(count),
+        'immunity_delay': to_json(immunity_delay),
+        'file_types': to_json(file_types),
+        'chat_ids': to_json(chat_ids),
+        'exclude_chat_ids': to_json(exclude_chat_ids),
+        'return_deleted_file_statistics': to_json(return_deleted_file_statistics),
+        'chat_limit': to_json(chat_limit),
+    })
+
+
+def parseMarkdown(text: FormattedText = None, ):
+    return client.send({
+        '@type': 'parseMarkdown',
+        'text': to_json(text),
+    })
+
+
+def parseTextEntities(text: str = None, parse_mode: TextParseMode = None, ):
+    return client.send({
+        '@type': 'parseTextEntities',
+        'text': to_json(text),
+        'parse_mode': to_json(parse_mode),
+    })
+
+
+def pinChatMessage(chat_id: int = None, message_id: int = None, disable_notification: bool = None, only_for_self: bool = None, ):
+    return client.send({
+        '@type': 'pinChatMessage',
+        'chat_id': to_json(chat_id),
+        'message_id': to_json(message_id),
+        'disable_notification': to_json(disable_notification),
+        'only_for_self': to_json(only_for_self),
+    })
+
+
+def pingProxy(proxy_id: int = None, ):
+    return client.send({
+        '@type': 'pingProxy',
+        'proxy_id': to_json(proxy_id),
+    })
+
+
+def preliminaryUploadFile(file: InputFile = None, file_type: FileType = None, priority: int = None, ):
+    return client.send({
+        '@type': 'preliminaryUploadFile',
+        'file': to_json(file),
+        'file_type': to_json(file_type),
+        'priority': to_json(priority),
+    })
+
+
+def processChatFolderNewChats(chat_folder_id: int = None, added_chat_ids: list[int] = None, ):
+    return client.send({
+        '@type': 'processChatFolderNewChats',
+        'chat_folder_id': to_json(chat_folder_id),
+        'added_chat_ids': to_json(added_chat_ids),
+    })
+
+
+def processChatJoinRequest(chat_id: int = None, user_id: int = None, approve: bool = None, ):
+    return client.send({
+        '@type': 'processChatJoinRequest',
+        'chat_id': to_json(chat_id),
+        'user_id': to_json(user_id),
+        'approve': to_json(approve),
+    })
+
+
+def processChatJoinRequests(chat_id: int = None, invite_link: str = None, approve: bool = None, ):
+    return client.send({
+        '@type': 'processChatJoinRequests',
+        'chat_id': to_json(chat_id),
+        'invite_link': to_json(invite_link),
+        'approve': to_json(approve),
+    })
+
+
+def processPushNotification(payload: str = None, ):
+    return client.send({
+        '@type': 'processPushNotification',
+        'payload': to_json(payload),
+    })
+
+
+def rateSpeechRecognition(chat_id: int = None, message_id: int = None, is_good: bool = None, ):
+    return client.send({
+        '@type': 'rateSpeechRecognition',
+        'chat_id': to_json(chat_id),
+        'message_id': to_json(message_id),
+        'is_good': to_json(is_good),
+    })
+
+
+def readAllChatMentions(chat_id: int = None, ):
+    return client.send({
+        '@type': 'readAllChatMentions',
+        'chat_id': to_json(chat_id),
+    })
+
+
+def readAllChatReactions(chat_id: int = None, ):
+    return client.send({
+        '@type': 'readAllChatReactions',
+        'chat_id': to_json(chat_id),
+    })
+
+
+def readAllMessageThreadMentions(chat_id: int = None, message_thread_id: int = None, ):
+    return client.send({
+        '@type': 'readAllMessageThreadMentions',
+        'chat_id': to_json(chat_id),
+        'message_thread_id': to_json(message_thread_id),
+    })
+
+
+def readAllMessageThreadReactions(chat_id: int = None, message_thread_id: int = None, ):
+    return client.send({
+        '@type': 'readAllMessageThreadReactions',
+        'chat_id': to_json(chat_id),
+        'message_thread_id': to_json(message_thread_id),
+    })
+
+
+def readChatList(chat_list: ChatList = None, ):
+    return client.send({
+        '@type': 'readChatList',
+        'chat_list': to_json(chat_list),
+    })
+
+
+def readFilePart(file_id: int = None, offset: int = None, count: int = None, ):
+    return client.send({
+        '@type': 'readFilePart',
+        'file_id': to_json(file_id),
+        'offset': to_json(offset),
+        'count': to_json(count),
+    })
+
+
+def recognizeSpeech(chat_id: int = None, message_id: int = None, ):
+    return client.send({
+        '@type': 'recognizeSpeech',
+        'chat_id': to_json(chat_id),
+        'message_id': to_json(message_id),
+    })
+
+
+def recoverAuthenticationPassword(recovery_code: str = None, new_password: str = None, new_hint: str = None, ):
+    return client.send({
+        '@type': 'recoverAuthenticationPassword',
+        'recovery_code': to_json(recovery_code),
+        'new_password': to_json(new_password),
+        'new_hint': to_json(new_hint),
+    })
+
+
+def recoverPassword(recovery_code: str = None, new_password: str = None, new_hint: str = None, ):
+    return client.send({
+        '@type': 'recoverPassword',
+        'recovery_code': to_json(recovery_code),
+        'new_password': to_json(new_password),
+        'new_hint': to_json(new_hint),
+    })
+
+
+def registerDevice(device_token: DeviceToken = None, other_user_ids: list[int] = None, ):
+    return client.send({
+        '@type': 'registerDevice',
+        'device_token': to_json(device_token),
+        'other_user_ids': to_json(other_user_ids),
+    })
+
+
+def registerUser(first_name: str = None, last_name: str = None, ):
+    return client.send({
+        '@type': 'registerUser',
+        'first_name': to_json(first_name),
+        'last_name': to_json(last_name),
+    })
+
+
+def removeAllFilesFromDownloads(only_active: bool = None, only_completed: bool = None, delete_from_cache: bool = None, ):
+    return client.send({
+        '@type': 'removeAllFilesFromDownloads',
+        'only_active': to_json(only_active),
+        'only_completed': to_json(only_completed),
+        'delete_from_cache': to_json(delete_from_cache),
+    })
+
+
+def removeChatActionBar(chat_id: int = None, ):
+    return client.send({
+        '@type': 'removeChatActionBar',
+        'chat_id': to_json(chat_id),
+    })
+
+
+def removeContacts(user_ids: list[int] = None, ):
+    return client.send({
+        '@type': 'removeContacts',
+        'user_ids': to_json(user_ids),
+    })
+
+
+def removeFavoriteSticker(sticker: InputFile = None, ):
+    return client.send({
+        '@type': 'removeFavoriteSticker',
+        'sticker': to_json(sticker),
+    })
+
+
+def removeFileFromDownloads(file_id: int = None, delete_from_cache: bool = None, ):
+    return client.send({
+        '@type': 'removeFileFromDownloads',
+        'file_id': to_json(file_id),
+        'delete_from_cache': to_json(delete_from_cache),
+    })
+
+
+def removeInstalledBackground(background_id: int = None, ):
+    return client.send({
+        '@type': 'removeInstalledBackground',
+        'background_id': to_json(background_id),
+    })
+
+
+def removeMessageReaction(chat_id: int = None, message_id: int = None, reaction_type: ReactionType = None, ):
+    return client.send({
+        '@type': 'removeMessageReaction',
+        'chat_id': to_json(chat_id),
+        'message_id': to_json(message_id),
+        'reaction_type': to_json(reaction_type),
+    })
+
+
+def removeNotification(notification_group_id: int = None, notification_id: int = None, ):
+    return client.send({
+        '@type': 'removeNotification',
+        'notification_group_id': to_json(notification_group_id),
+        'notification_id': to_json(notification_id),
+    })
+
+
+def removeNotificationGroup(notification_group_id: int = None, max_notification_id: int = None, ):
+    return client.send({
+        '@type': 'removeNotificationGroup',
+        'notification_group_id': to_json(notification_group_id),
+        'max_notification_id': to_json(max_notification_id),
+    })
+
+
+def removeProxy(proxy_id: int = None, ):
+    return client.send({
+        '@type': 'removeProxy',
+        'proxy_id': to_json(proxy_id),
+    })
+
+
+def removeRecentHashtag(hashtag: str = None, ):
+    return client.send({
+        '@type': 'removeRecentHashtag',
+        'hashtag': to_json(hashtag),
+    })
+
+
+def removeRecentSticker(is_attached: bool = None, sticker: InputFile = None, ):
+    return client.send({
+        '@type': 'removeRecentSticker',
+        'is_attached': to_json(is_attached),
+        'sticker': to_json(sticker),
+    })
+
+
+def removeRecentlyFoundChat(chat_id: int = None, ):
+    return client.send({
+        '@type': 'removeRecentlyFoundChat',
+        'chat_id': to_json(chat_id),
+    })
+
+
+def removeSavedAnimation(animation: InputFile = None, ):
+    return client.send({
+        '@type': 'removeSavedAnimation',
+        'animation': to_json(animation),
+    })
+
+
+def removeSavedNotificationSound(notification_sound_id: int = None, ):
+    return client.send({
+        '@type': 'removeSavedNotificationSound',
+        'notification_sound_id': to_json(notification_sound_id),
+    })
+
+
+def removeStickerFromSet(sticker: InputFile = None, ):
+    return client.send({
+        '@type': 'removeStickerFromSet',
+        'sticker': to_json(sticker),
+    })
+
+
+def removeTopChat(category: TopChatCategory = None, chat_id: int = None, ):
+    return client.send({
+        '@type': 'removeTopChat',
+        'category': to_json(category),
+        'chat_id': to_json(chat_id),
+    })
+
+
+def reorderActiveUsernames(usernames: list[str] = None, ):
+    return client.send({
+        '@type': 'reorderActiveUsernames',
+        'usernames': to_json(usernames),
+    })
+
+
+def reorderBotActiveUsernames(bot_user_id: int = None, usernames: list[str] = None, ):
+    return client.send({
+        '@type': 'reorderBotActiveUsernames',
+        'bot_user_id': to_json(bot_user_id),
+        'usernames': to_json(usernames),
+    })
+
+
+def reorderChatFolders(chat_folder_ids: list[int] = None, main_chat_list_position: int = None, ):
+    return client.send({
+        '@type': 'reorderChatFolders',
+        'chat_folder_ids': to_json(chat_folder_ids),
+        'main_chat_list_position': to_json(main_chat_list_position),
+    })
+
+
+def reorderInstalledStickerSets(sticker_type: StickerType = None, sticker_set_ids: list[int] = None, ):
+    return client.send({
+        '@type': 'reorderInstalledStickerSets',
+        'sticker_type': to_json(sticker_type),
+        'sticker_set_ids': to_json(sticker_set_ids),
+    })
+
+
+def reorderSupergroupActiveUsernames(supergroup_id: int = None, usernames: list[str] = None, ):
+    return client.send({
+        '@type': 'reorderSupergroupActiveUsernames',
+        'supergroup_id': to_json(supergroup_id),
+        'usernames': to_json(usernames),
+    })
+
+
+def replacePrimaryChatInviteLink(chat_id: int = None, ):
+    return client.send({
+        '@type': 'replacePrimaryChatInviteLink',
+        'chat_id': to_json(chat_id),
+    })
+
+
+def replaceVideoChatRtmpUrl(chat_id: int = None, ):
+    return client.send({
+        '@type': 'replaceVideoChatRtmpUrl',
+        'chat_id': to_json(chat_id),
+    })
+
+
+def reportChat(chat_id: int = None, message_ids: list[int] = None, reason: ReportReason = None, text: str = None, ):
+    return client.send({
+        '@type': 'reportChat',
+        'chat_id': to_json(chat_id),
+        'message_ids': to_json(message_ids),
+        'reason': to_json(reason),
+        'text': to_json(text),
+    })
+
+
+def reportChatPhoto(chat_id: int = None, file_id: int = None, reason: ReportReason = None, text: str = None, ):
+    return client.send({
+        '@type': 'reportChatPhoto',
+        'chat_id': to_json(chat_id),
+        'file_id': to_json(file_id),
+        'reason': to_json(reason),
+        'text': to_json(text),
+    })
+
+
+def reportMessageReactions(chat_id: int = None, message_id: int = None, sender_id: MessageSender = None, ):
+    return client.send({
+        '@type': 'reportMessageReactions',
+        'chat_id': to_json(chat_id),
+        'message_id': to_json(message_id),
+        'sender_id': to_json(sender_id),
+    })
+
+
+def reportStory(story_sender_chat_id: int = None, story_id: int = None, reason: ReportReason = None, text: str = None, ):
+    return client.send({
+        '@type': 'reportStory',
+        'story_sender_chat_id': to_json(story_sender_chat_id),
+        'story_id': to_json(story_id),
+        'reason': to_json(reason),
+        'text': to_json(text),
+    })
+
+
+def reportSupergroupAntiSpamFalsePositive(supergroup_id: int = None, message_id: int = None, ):
+    return client.send({
+        '@type': 'reportSupergroupAntiSpamFalsePositive',
+        'supergroup_id': to_json(supergroup_id),
+        'message_id': to_json(message_id),
+    })
+
+
+def reportSupergroupSpam(supergroup_id: int = None, message_ids: list[int] = None, ):
+    return client.send({
+        '@type': 'reportSupergroupSpam',
+        'supergroup_id': to_json(supergroup_id),
+        'message_ids': to_json(message_ids),
+    })
+
+
+def requestAuthenticationPasswordRecovery():
+    return client.send({
+        '@type': 'requestAuthenticationPasswordRecovery',
+    })
+
+
+def requestPasswordRecovery():
+    return client.send({
+        '@type': 'requestPasswordRecovery',
+    })
+
+
+def requestQrCodeAuthentication(other_user_ids: list[int] = None, ):
+    return client.send({
+        '@type': 'requestQrCodeAuthentication',
+        'other_user_ids': to_json(other_user_ids),
+    })
+
+
+def resendAuthenticationCode():
+    return client.send({
+        '@type': 'resendAuthenticationCode',
+    })
+
+
+def resendChangePhoneNumberCode():
+    return client.send({
+        '@type': 'resendChangePhoneNumberCode',
+    })
+
+
+def resendEmailAddressVerificationCode():
+    return client.send({
+        '@type': 'resendEmailAddressVerificationCode',
+    })
+
+
+def resendLoginEmailAddressCode():
+    return client.send({
+        '@type': 'resendLoginEmailAddressCode',
+    })
+
+
+def resendMessages(chat_id: int = None, message_ids: list[int] = None, quote: InputTextQuote = None, ):
+    return client.send({
+        '@type': 'resendMessages',
+        'chat_id': to_json(chat_id),
+        'message_ids': to_json(message_ids),
+        'quote': to_json(quote),
+    })
+
+
+def resendPhoneNumberConfirmationCode():
+    return client.send({
+        '@type': 'resendPhoneNumberConfirmationCode',
+    })
+
+
+def resendPhoneNumberVerificationCode():
+    return client.send({
+        '@type': 'resendPhoneNumberVerificationCode',
+    })
+
+
+def resendRecoveryEmailAddressCode():
+    return client.send({
+        '@type': 'resendRecoveryEmailAddressCode',
+    })
+
+
+def resetAllNotificationSettings():
+    return client.send({
+        '@type': 'resetAllNotificationSettings',
+    })
+
+
+def resetAuthenticationEmailAddress():
+    return client.send({
+        '@type': 'resetAuthenticationEmailAddress',
+    })
+
+
+def resetInstalledBackgrounds():
+    return client.send({
+        '@type': 'resetInstalledBackgrounds',
+    })
+
+
+def resetNetworkStatistics():
+    return client.send({
+        '@type': 'resetNetworkStatistics',
+    })
+
+
+def resetPassword():
+    return client.send({
+        '@type': 'resetPassword',
+    })
+
+
+def revokeChatInviteLink(chat_id: int = None, invite_link: str = None, ):
+    return client.send({
+        '@type': 'revokeChatInviteLink',
+        'chat_id': to_json(chat_id),
+        'invite_link': to_json(invite_link),
+    })
+
+
+def revokeGroupCallInviteLink(group_call_id: int = None, ):
+    return client.send({
+        '@type': 'revokeGroupCallInviteLink',
+        'group_call_id': to_json(group_call_id),
+    })
+
+
+def saveApplicationLogEvent(type: str = None, chat_id: int = None, data: JsonValue = None, ):
+    return client.send({
+        '@type': 'saveApplicationLogEvent',
+        'type': to_json(type),
+        'chat_id': to_json(chat_id),
+        'data': to_json(data),
+    })
+
+
+def searchBackground(name: str = None, ):
+    return client.send({
+        '@type': 'searchBackground',
+        'name': to_json(name),
+    })
+
+
+def searchCallMessages(offset: str = None, limit: int = None, only_missed: bool = None, ):
+    return client.send({
+        '@type': 'searchCallMessages',
+        'offset': to_json(offset),
+        'limit': to_json(limit),
+        'only_missed': to_json(only_missed),
+    })
+
+
+def searchChatMembers(chat_id: int = None, query: str = None, limit: int = None, filter: ChatMembersFilter = None, ):
+    return client.send({
+        '@type': 'searchChatMembers',
+        'chat_id': to_json(chat_id),
+        'query': to_json(query),
+        'limit': to_json(limit),
+        'filter': to_json(filter),
+    })
+
+
+def searchChatMessages(chat_id: int = None, query: str = None, sender_id: MessageSender = None, from_message_id: int = None, offset: int = None, limit: int = None, filter: SearchMessagesFilter = None, message_thread_id: int = None, ):
+    return client.send({
+        '@type': 'searchChatMessages',
+        'chat_id': to_json(chat_id),
+        'query': to_json(query),
+        'sender_id': to_json(sender_id),
+        'from_message_id': to_json(from_message_id),
+        'offset': to_json(offset),
+        'limit': to_json(limit),
+        'filter': to_json(filter),
+        'message_thread_id': to_json(message_thread_id),
+    })
+
+
+def searchChatRecentLocationMessages(chat_id: int = None, limit: int = None, ):
+    return client.send({
+        '@type': 'searchChatRecentLocationMessages',
+        'chat_id': to_json(chat_id),
+        'limit': to_json(limit),
+    })
+
+
+def searchChats(query: str = None, limit: int = None, ):
+    return client.send({
+        '@type': 'searchChats',
+        'query': to_json(query),
+        'limit': to_json(limit),
+    })
+
+
+def searchChatsNearby(location: Location = None, ):
+    return client.send({
+        '@type': 'searchChatsNearby',
+        'location': to_json(location),
+    })
+
+
+def searchChatsOnServer(query: str = None, limit: int = None, ):
+    return client.send({
+        '@type': 'searchChatsOnServer',
+        'query': to_json(query),
+        'limit': to_json(limit),
+    })
+
+
+def searchContacts(query: str = None, limit: int = None, ):
+    return client.send({
+        '@type': 'searchContacts',
+        'query': to_json(query),
+        'limit': to_json(limit),
+    })
+
+
+def searchEmojis(text: str = None, exact_match: bool = None, input_language_codes: list[str] = None, ):
+    return client.send({
+        '@type': 'searchEmojis',
+        'text': to_json(text),
+        'exact_match': to_json(exact_match),
+        'input_language_codes': to_json(input_language_codes),
+    })
+
+
+def searchFileDownloads(query: str = None, only_active: bool = None, only_completed: bool = None, offset: str = None, limit: int = None, ):
+    return client.send({
+        '@type': 'searchFileDownloads',
+        'query': to_json(query),
+        'only_active': to_json(only_active),
+        'only_completed': to_json(only_completed),
+        'offset': to_json(offset),
+        'limit': to_json(limit),
+    })
+
+
+def searchHashtags(prefix: str = None, limit: int = None, ):
+    return client.send({
+        '@type': 'searchHashtags',
+        'prefix': to_json(prefix),
+        'limit': to_json(limit),
+    })
+
+
+def searchInstalledStickerSets(sticker_type: StickerType = None, query: str = None, limit: int = None, ):
+    return client.send({
+        '@type': 'searchInstalledStickerSets',
+        'sticker_type': to_json(sticker_type),
+        'query': to_json(query),
+        'limit': to_json(limit),
+    })
+
+
+def searchMessages(chat_list: ChatList = None, query: str = None, offset: str = None, limit: int = None, filter: SearchMessagesFilter = None, min_date: int = None, max_date: int = None, ):
+    return client.send({
+        '@type': 'searchMessages',
+        'chat_list': to_json(chat_list),
+        'query': to_json(query),
+        'offset': to_json(offset),
+        'limit': to_json(limit),
+        'filter': to_json(filter),
+        'min_date': to_json(min_date),
+        'max_date': to_json(max_date),
+    })
+
+
+def searchOutgoingDocumentMessages(query: str = None, limit: int = None, ):
+    return client.send({
+        '@type': 'searchOutgoingDocumentMessages',
+        'query': to_json(query),
+        'limit': to_json(limit),
+    })
+
+
+def searchPublicChat(username: str = None, ):
+    return client.send({
+        '@type': 'searchPublicChat',
+        'username': to_json(username),
+    })
+
+
+def searchPublicChats(query: str = None, ):
+    return client.send({
+        '@type': 'searchPublicChats',
+        'query': to_json(query),
+    })
+
+
+def searchQuote(text: FormattedText = None, quote: FormattedText = None, quote_position: int = None, ):
+    return client.send({
+        '@type': 'searchQuote',
+        'text': to_json(text),
+        'quote': to_json(quote),
+        'quote_position': to_json(quote_position),
+    })
+
+
+def searchRecentlyFoundChats(query: str = None, limit: int = None, ):
+    return client.send({
+        '@type': 'searchRecentlyFoundChats',
+        'query': to_json(query),
+        'limit': to_json(limit),
+    })
+
+
+def searchSecretMessages(chat_id: int = None, query: str = None, offset: str = None, limit: int = None, filter: SearchMessagesFilter = None, ):
+    return client.send({
+        '@type': 'searchSecretMessages',
+        'chat_id': to_json(chat_id),
+        'query': to_json(query),
+        'offset': to_json(offset),
+        'limit': to_json(limit),
+        'filter': to_json(filter),
+    })
+
+
+def searchStickerSet(name: str = None, ):
+    return client.send({
+        '@type': 'searchStickerSet',
+        'name': to_json(name),
+    })
+
+
+def searchStickerSets(sticker_type: StickerType = None, query: str = None, ):
+    return client.send({
+        '@type': 'searchStickerSets',
+        'sticker_type': to_json(sticker_type),
+        'query': to_json(query),
+    })
+
+
+def searchStickers(sticker_type: StickerType = None, emojis: str = None, limit: int = None, ):
+    return client.send({
+        '@type': 'searchStickers',
+        'sticker_type': to_json(sticker_type),
+        'emojis': to_json(emojis),
+        'limit': to_json(limit),
+    })
+
+
+def searchStringsByPrefix(strings: list[str] = None, query: str = None, limit: int = None, return_none_for_empty_query: bool = None, ):
+    return client.send({
+        '@type': 'searchStringsByPrefix',
+        'strings': to_json(strings),
+        'query': to_json(query),
+        'limit': to_json(limit),
+        'return_none_for_empty_query': to_json(return_none_for_empty_query),
+    })
+
+
+def searchUserByPhoneNumber(phone_number: str = None, ):
+    return client.send({
+        '@type': 'searchUserByPhoneNumber',
+        'phone_number': to_json(phone_number),
+    })
+
+
+def searchUserByToken(token: str = None, ):
+    return client.send({
+        '@type': 'searchUserByToken',
+        'token': to_json(token),
+    })
+
+
+def searchWebApp(bot_user_id: int = None, web_app_short_name: str = None, ):
+    return client.send({
+        '@type': 'searchWebApp',
+        'bot_user_id': to_json(bot_user_id),
+        'web_app_short_name': to_json(web_app_short_name),
+    })
+
+
+def sendAuthenticationFirebaseSms(token: str = None, ):
+    return client.send({
+        '@type': 'sendAuthenticationFirebaseSms',
+        'token': to_json(token),
+    })
+
+
+def sendBotStartMessage(bot_user_id: int = None, chat_id: int = None, parameter: str = None, ):
+    return client.send({
+        '@type': 'sendBotStartMessage',
+        'bot_user_id': to_json(bot_user_id),
+        'chat_id': to_json(chat_id),
+        'parameter': to_json(parameter),
+    })
+
+
+def sendCallDebugInformation(call_id: int = None, debug_information: str = None, ):
+    return client.send({
+        '@type': 'sendCallDebugInformation',
+        'call_id': to_json(call_id),
+        'debug_information': to_json(debug_information),
+    })
+
+
+def sendCallLog(call_id: int = None, log_file: InputFile = None, ):
+    return client.send({
+        '@type': 'sendCallLog',
+        'call_id': to_json(call_id),
+        'log_file': to_json(log_file),
+    })
+
+
+def sendCallRating(call_id: int = None, rating: int = None, comment: str = None, problems: list[CallProblem] = None, ):
+    return client.send({
+        '@type': 'sendCallRating',
+        'call_id': to_json(call_id),
+        'rating': to_json(rating),
+        'comment': to_json(comment),
+        'problems': to_json(problems),
+    })
+
+
+def sendCallSignalingData(call_id: int = None, data: bytes = None, ):
+    return client.send({
+        '@type': 'sendCallSignalingData',
+        'call_id': to_json(call_id),
+        'data': to_json(data),
+    })
+
+
+def sendChatAction(chat_id: int = None, message_thread_id: int = None, action: ChatAction = None, ):
+    return client.send({
+        '@type': 'sendChatAction',
+        'chat_id': to_json(chat_id),
+        'message_thread_id': to_json(message_thread_id),
+        'action': to_json(action),
+    })
+
+
+def sendCustomRequest(method: str = None, parameters: str = None, ):
+    return client.send({
+        '@type': 'sendCustomRequest',
+        'method': to_json(method),
+        'parameters': to_json(parameters),
+    })
+
+
+def sendEmailAddressVerificationCode(email_address: str = None, ):
+    return client.send({
+        '@type': 'sendEmailAddressVerificationCode',
+        'email_address': to_json(email_address),
+    })
+
+
+def sendInlineQueryResultMessage(chat_id: int = None, message_thread_id: int = None, reply_to: InputMessageReplyTo = None, options: MessageSendOptions = None, query_id: int = None, result_id: str = None, hide_via_bot: bool = None, ):
+    return client.send({
+        '@type': 'sendInlineQueryResultMessage',
+        'chat_id': to_json(chat_id),
+        'message_thread_id': to_json(message_thread_id),
+        'reply_to': to_json(reply_to),
+        'options': to_json(options),
+        'query_id': to_json(query_id),
+        'result_id': to_json(result_id),
+        'hide_via_bot': to_json(hide_via_bot),
+    })
+
+
+def sendMessage(chat_id: int = None, message_thread_id: int = None, reply_to: InputMessageReplyTo = None, options: MessageSendOptions = None, reply_markup: ReplyMarkup = None, input_message_content: InputMessageContent = None, ):
+    return client.send({
+        '@type': 'sendMessage',
+        'chat_id': to_json(chat_id),
+        'message_thread_id': to_json(message_thread_id),
+        'reply_to': to_json(reply_to),
+        'options': to_json(options),
+        'reply_markup': to_json(reply_markup),
+        'input_message_content': to_json(input_message_content),
+    })
+
+
+def sendMessageAlbum(chat_id: int = None, message_thread_id: int = None, reply_to: InputMessageReplyTo = None, options: MessageSendOptions = None, input_message_contents: list[InputMessageContent] = None, ):
+    return client.send({
+        '@type': 'sendMessageAlbum',
+        'chat_id': to_json(chat_id),
+        'message_thread_id': to_json(message_thread_id),
+        'reply_to': to_json(reply_to),
+        'options': to_json(options),
+        'input_message_contents': to_json(input_message_contents),
+    })
+
+
+def sendPassportAuthorizationForm(authorization_form_id: int = None, types: list[PassportElementType] = None, ):
+    return client.send({
+        '@type': 'sendPassportAuthorizationForm',
+        'authorization_form_id': to_json(authorization_form_id),
+        'types': to_json(types),
+    })
+
+
+def sendPaymentForm(input_invoice: InputInvoice = None, payment_form_id: int = None, order_info_id: str = None, shipping_option_id: str = None, credentials: InputCredentials = None, tip_amount: int = None, ):
+    return client.send({
+        '@type': 'sendPaymentForm',
+        'input_invoice': to_json(input_invoice),
+        'payment_form_id': to_json(payment_form_id),
+        'order_info_id': to_json(order_info_id),
+        'shipping_option_id': to_json(shipping_option_id),
+        'credentials': to_json(credentials),
+        'tip_amount': to_json(tip_amount),
+    })
+
+
+def sendPhoneNumberConfirmationCode(hash: str = None, phone_number: str = None, settings: PhoneNumberAuthenticationSettings = None, ):
+    return client.send({
+        '@type': 'sendPhoneNumberConfirmationCode',
+        'hash': to_json(hash),
+        'phone_number': to_json(phone_number),
+        'settings': to_json(settings),
+    })
+
+
+def sendPhoneNumberVerificationCode(phone_number: str = None, settings: PhoneNumberAuthenticationSettings = None, ):
+    return client.send({
+        '@type': 'sendPhoneNumberVerificationCode',
+        'phone_number': to_json(phone_number),
+        'settings': to_json(settings),
+    })
+
+
+def sendStory(chat_id: int = None, content: InputStoryContent = None, areas: InputStoryAreas = None, caption: FormattedText = None, privacy_settings: StoryPrivacySettings = None, active_period: int = None, from_story_full_id: StoryFullId = None, is_pinned: bool = None, protect_content: bool = None, ):
+    return client.send({
+        '@type': 'sendStory',
+        'chat_id': to_json(chat_id),
+        'content': to_json(content),
+        'areas': to_json(areas),
+        'caption': to_json(caption),
+        'privacy_settings': to_json(privacy_settings),
+        'active_period': to_json(active_period),
+        'from_story_full_id': to_json(from_story_full_id),
+        'is_pinned': to_json(is_pinned),
+        'protect_content': to_json(protect_content),
+    })
+
+
+def sendWebAppCustomRequest(bot_user_id: int = None, method: str = None, parameters: str = None, ):
+    return client.send({
+        '@type': 'sendWebAppCustomRequest',
+        'bot_user_id': to_json(bot_user_id),
+        'method': to_json(method),
+        'parameters': to_json(parameters),
+    })
+
+
+def sendWebAppData(bot_user_id: int = None, button_text: str = None, data: str = None, ):
+    return client.send({
+        '@type': 'sendWebAppData',
+        'bot_user_id': to_json(bot_user_id),
+        'button_text': to_json(button_text),
+        'data': to_json(data),
+    })
+
+
+def setAccentColor(accent_color_id: int = None, background_custom_emoji_id: int = None, ):
+    return client.send({
+        '@type': 'setAccentColor',
+        'accent_color_id': to_json(accent_color_id),
+        'background_custom_emoji_id': to_json(background_custom_emoji_id),
+    })
+
+
+def setAccountTtl(ttl: AccountTtl = None, ):
+    return client.send({
+        '@type': 'setAccountTtl',
+        'ttl': to_json(ttl),
+    })
+
+
+def setAlarm(seconds: float = None, ):
+    return client.send({
+        '@type': 'setAlarm',
+        'seconds': to_json(seconds),
+    })
+
+
+def setArchiveChatListSettings(settings: ArchiveChatListSettings = None, ):
+    return client.send({
+        '@type': 'setArchiveChatListSettings',
+        'settings': to_json(settings),
+    })
+
+
+def setAuthenticationEmailAddress(email_address: str = None, ):
+    return client.send({
+        '@type': 'setAuthenticationEmailAddress',
+        'email_address': to_json(email_address),
+    })
+
+
+def setAuthenticationPhoneNumber(phone_number: str = None, settings: PhoneNumberAuthenticationSettings = None, ):
+    return client.send({
+        '@type': 'setAuthenticationPhoneNumber',
+        'phone_number': to_json(phone_number),
+        'settings': to_json(settings),
+    })
+
+
+def setAutoDownloadSettings(settings: AutoDownloadSettings = None, type: NetworkType = None, ):
+    return client.send({
+        '@type': 'setAutoDownloadSettings',
+        'settings': to_json(settings),
+        'type': to_json(type),
+    })
+
+
+def setAutosaveSettings(scope: AutosaveSettingsScope = None, settings: ScopeAutosaveSettings = None, ):
+    return client.send({
+        '@type': 'setAutosaveSettings',
+        'scope': to_json(scope),
+        'settings': to_json(settings),
+    })
+
+
+def setBio(bio: str = None, ):
+    return client.send({
+        '@type': 'setBio',
+        'bio': to_json(bio),
+    })
+
+
+def setBotInfoDescription(bot_user_id: int = None, language_code: str = None, description: str = None, ):
+    return client.send({
+        '@type': 'setBotInfoDescription',
+        'bot_user_id': to_json(bot_user_id),
+        'language_code': to_json(language_code),
+        'description': to_json(description),
+    })
+
+
+def setBotInfoShortDescription(bot_user_id: int = None, language_code: str = None, short_description: str = None, ):
+    return client.send({
+        '@type': 'setBotInfoShortDescription',
+        'bot_user_id': to_json(bot_user_id),
+        'language_code': to_json(language_code),
+        'short_description': to_json(short_description),
+    })
+
+
+def setBotName(bot_user_id: int = None, language_code: str = None, name: str = None, ):
+    return client.send({
+        '@type': 'setBotName',
+        'bot_user_id': to_json(bot_user_id),
+        'language_code': to_json(language_code),
+        'name': to_json(name),
+    })
+
+
+def setBotProfilePhoto(bot_user_id: int = None, photo: InputChatPhoto = None, ):
+    return client.send({
+        '@type': 'setBotProfilePhoto',
+        'bot_user_id': to_json(bot_user_id),
+        'photo': to_json(photo),
+    })
+
+
+def setBotUpdatesStatus(pending_update_count: int = None, error_message: str = None, ):
+    return client.send({
+        '@type': 'setBotUpdatesStatus',
+        'pending_update_count': to_json(pending_update_count),
+        'error_message': to_json(error_message),
+    })
+
+
+def setChatAccentColor(chat_id: int = None, accent_color_id: int = None, background_custom_emoji_id: int = None, ):
+    return client.send({
+        '@type': 'setChatAccentColor',
+        'chat_id': to_json(chat_id),
+        'accent_color_id': to_json(accent_color_id),
+        'background_custom_emoji_id': to_json(background_custom_emoji_id),
+    })
+
+
+def setChatActiveStoriesList(chat_id: int = None, story_list: StoryList = None, ):
+    return client.send({
+        '@type': 'setChatActiveStoriesList',
+        'chat_id': to_json(chat_id),
+        'story_list': to_json(story_list),
+    })
+
+
+def setChatAvailableReactions(chat_id: int = None, available_reactions: ChatAvailableReactions = None, ):
+    return client.send({
+        '@type': 'setChatAvailableReactions',
+        'chat_id': to_json(chat_id),
+        'available_reactions': to_json(available_reactions),
+    })
+
+
+def setChatBackground(chat_id: int = None, background: InputBackground = None, type: BackgroundType = None, dark_theme_dimming: int = None, only_for_self: bool = None, ):
+    return client.send({
+        '@type': 'setChatBackground',
+        'chat_id': to_json(chat_id),
+        'background': to_json(background),
+        'type': to_json(type),
+        'dark_theme_dimming': to_json(dark_theme_dimming),
+        'only_for_self': to_json(only_for_self),
+    })
+
+
+def setChatClientData(chat_id: int = None, client_data: str = None, ):
+    return client.send({
+        '@type': 'setChatClientData',
+        'chat_id': to_json(chat_id),
+        'client_data': to_json(client_data),
+    })
+
+
+def setChatDescription(chat_id: int = None, description: str = None, ):
+    return client.send({
+        '@type': 'setChatDescription',
+        'chat_id': to_json(chat_id),
+        'description': to_json(description),
+    })
+
+
+def setChatDiscussionGroup(chat_id: int = None, discussion_chat_id: int = None, ):
+    return client.send({
+        '@type': 'setChatDiscussionGroup',
+        'chat_id': to_json(chat_id),
+        'discussion_chat_id': to_json(discussion_chat_id),
+    })
+
+
+def setChatDraftMessage(chat_id: int = None, message_thread_id: int = None, draft_message: DraftMessage = None, ):
+    return client.send({
+        '@type': 'setChatDraftMessage',
+        'chat_id': to_json(chat_id),
+        'message_thread_id': to_json(message_thread_id),
+        'draft_message': to_json(draft_message),
+    })
+
+
+def setChatEmojiStatus(chat_id: int = None, emoji_status: EmojiStatus = None, ):
+    return client.send({
+        '@type': 'setChatEmojiStatus',
+        'chat_id': to_json(chat_id),
+        'emoji_status': to_json(emoji_status),
+    })
+
+
+def setChatLocation(chat_id: int = None, location: ChatLocation = None, ):
+    return client.send({
+        '@type': 'setChatLocation',
+        'chat_id': to_json(chat_id),
+        'location': to_json(location),
+    })
+
+
+def setChatMemberStatus(chat_id: int = None, member_id: MessageSender = None, status: ChatMemberStatus = None, ):
+    return client.send({
+        '@type': 'setChatMemberStatus',
+        'chat_id': to_json(chat_id),
+        'member_id': to_json(member_id),
+        'status': to_json(status),
+    })
+
+
+def setChatMessageAutoDeleteTime(chat_id: int = None, message_auto_delete_time: int = None, ):
+    return client.send({
+        '@type': 'setChatMessageAutoDeleteTime',
+        'chat_id': to_json(chat_id),
+        'message_auto_delete_time': to_json(message_auto_delete_time),
+    })
+
+
+def setChatMessageSender(chat_id: int = None, message_sender_id: MessageSender = None, ):
+    return client.send({
+        '@type': 'setChatMessageSender',
+        'chat_id': to_json(chat_id),
+        'message_sender_id': to_json(message_sender_id),
+    })
+
+
+def setChatNotificationSettings(chat_id: int = None, notification_settings: ChatNotificationSettings = None, ):
+    return client.send({
+        '@type': 'setChatNotificationSettings',
+        'chat_id': to_json(chat_id),
+        'notification_settings': to_json(notification_settings),
+    })
+
+
+def setChatPermissions(chat_id: int = None, permissions: ChatPermissions = None, ):
+    return client.send({
+        '@type': 'setChatPermissions',
+        'chat_id': to_json(chat_id),
+        'permissions': to_json(permissions),
+    })
+
+
+def setChatPhoto(chat_id: int = None, photo: InputChatPhoto = None, ):
+    return client.send({
+        '@type': 'setChatPhoto',
+        'chat_id': to_json(chat_id),
+        'photo': to_json(photo),
+    })
+
+
+def setChatProfileAccentColor(chat_id: int = None, profile_accent_color_id: int = None, profile_background_custom_emoji_id: int = None, ):
+    return client.send({
+        '@type': 'setChatProfileAccentColor',
+        'chat_id': to_json(chat_id),
+        'profile_accent_color_id': to_json(profile_accent_color_id),
+        'profile_background_custom_emoji_id': to_json(profile_background_custom_emoji_id),
+    })
+
+
+def setChatSlowModeDelay(chat_id: int = None, slow_mode_delay: int = None, ):
+    return client.send({
+        '@type': 'setChatSlowModeDelay',
+        'chat_id': to_json(chat_id),
+        'slow_mode_delay': to_json(slow_mode_delay),
+    })
+
+
+def setChatTheme(chat_id: int = None, theme_name: str = None, ):
+    return client.send({
+        '@type': 'setChatTheme',
+        'chat_id': to_json(chat_id),
+        'theme_name': to_json(theme_name),
+    })
+
+
+def setChatTitle(chat_id: int = None, title: str = None, ):
+    return client.send({
+        '@type': 'setChatTitle',
+        'chat_id': to_json(chat_id),
+        'title': to_json(title),
+    })
+
+
+def setCloseFriends(user_ids: list[int] = None, ):
+    return client.send({
+        '@type': 'setCloseFriends',
+        'user_ids': to_json(user_ids),
+    })
+
+
+def setCommands(scope: BotCommandScope = None, language_code: str = None, commands: list[BotCommand] = None, ):
+    return client.send({
+        '@type': 'setCommands',
+        'scope': to_json(scope),
+        'language_code': to_json(language_code),
+        'commands': to_json(commands),
+    })
+
+
+def setCustomEmojiStickerSetThumbnail(name: str = None, custom_emoji_id: int = None, ):
+    return client.send({
+        '@type': 'setCustomEmojiStickerSetThumbnail',
+        'name': to_json(name),
+        'custom_emoji_id': to_json(custom_emoji_id),
+    })
+
+
+def setCustomLanguagePack(info: LanguagePackInfo = None, strings: list[LanguagePackString] = None, ):
+    return client.send({
+        '@type': 'setCustomLanguagePack',
+        'info': to_json(info),
+        'strings': to_json(strings),
+    })
+
+
+def setCustomLanguagePackString(language_pack_id: str = None, new_string: LanguagePackString = None, ):
+    return client.send({
+        '@type': 'setCustomLanguagePackString',
+        'language_pack_id': to_json(language_pack_id),
+        'new_string': to_json(new_string),
+    })
+
+
+def setDatabaseEncryptionKey(new_encryption_key: bytes = None, ):
+    return client.send({
+        '@type': 'setDatabaseEncryptionKey',
+        'new_encryption_key': to_json(new_encryption_key),
+    })
+
+
+def setDefaultBackground(background: InputBackground = None, type: BackgroundType = None, for_dark_theme: bool = None, ):
+    return client.send({
+        '@type': 'setDefaultBackground',
+        'background': to_json(background),
+        'type': to_json(type),
+        'for_dark_theme': to_json(for_dark_theme),
+    })
+
+
+def setDefaultChannelAdministratorRights(default_channel_administrator_rights: ChatAdministratorRights = None, ):
+    return client.send({
+        '@type': 'setDefaultChannelAdministratorRights',
+        'default_channel_administrator_rights': to_json(default_channel_administrator_rights),
+    })
+
+
+def setDefaultGroupAdministratorRights(default_group_administrator_rights: ChatAdministratorRights = None, ):
+    return client.send({
+        '@type': 'setDefaultGroupAdministratorRights',
+        'default_group_administrator_rights': to_json(default_group_administrator_rights),
+    })
+
+
+def setDefaultMessageAutoDeleteTime(message_auto_delete_time: MessageAutoDeleteTime = None, ):
+    return client.send({
+        '@type': 'setDefaultMessageAutoDeleteTime',
+        'message_auto_delete_time': to_json(message_auto_delete_time),
+    })
+
+
+def setDefaultReactionType(reaction_type: ReactionType = None, ):
+    return client.send({
+        '@type': 'setDefaultReactionType',
+        'reaction_type': to_json(reaction_type),
+    })
+
+
+def setEmojiStatus(emoji_status: EmojiStatus = None, ):
+    return client.send({
+        '@type': 'setEmojiStatus',
+        'emoji_status': to_json(emoji_status),
+    })
+
+
+def setFileGenerationProgress(generation_id: int = None, expected_size: int = None, local_prefix_size: int = None, ):
+    return client.send({
+        '@type': 'setFileGenerationProgress',
+        'generation_id': to_json(generation_id),
+        'expected_size': to_json(expected_size),
+        'local_prefix_size': to_json(local_prefix_size),
+    })
+
+
+def setForumTopicNotificationSettings(chat_id: int = None, message_thread_id: int = None, notification_settings: ChatNotificationSettings = None, ):
+    return client.send({
+        '@type': 'setForumTopicNotificationSettings',
+        'chat_id': to_json(chat_id),
+        'message_thread_id': to_json(message_thread_id),
+        'notification_settings': to_json(notification_settings),
+    })
+
+
+def setGameScore(chat_id: int = None, message_id: int = None, edit_message: bool = None, user_id: int = None, score: int = None, force: bool = None, ):
+    return client.send({
+        '@type': 'setGameScore',
+        'chat_id': to_json(chat_id),
+        'message_id': to_json(message_id),
+        'edit_message': to_json(edit_message),
+        'user_id': to_json(user_id),
+        'score': to_json(score),
+        'force': to_json(force),
+    })
+
+
+def setGroupCallParticipantIsSpeaking(group_call_id: int = None, audio_source: int = None, is_speaking: bool = None, ):
+    return client.send({
+        '@type': 'setGroupCallParticipantIsSpeaking',
+        'group_call_id': to_json(group_call_id),
+        'audio_source': to_json(audio_source),
+        'is_speaking': to_json(is_speaking),
+    })
+
+
+def setGroupCallParticipantVolumeLevel(group_call_id: int = None, participant_id: MessageSender = None, volume_level: int = None, ):
+    return client.send({
+        '@type': 'setGroupCallParticipantVolumeLevel',
+        'group_call_id': to_json(group_call_id),
+        'participant_id': to_json(participant_id),
+        'volume_level': to_json(volume_level),
+    })
+
+
+def setGroupCallTitle(group_call_id: int = None, title: str = None, ):
+    return client.send({
+        '@type': 'setGroupCallTitle',
+        'group_call_id': to_json(group_call_id),
+        'title': to_json(title),
+    })
+
+
+def setInactiveSessionTtl(inactive_session_ttl_days: int = None, ):
+    return client.send({
+        '@type': 'setInactiveSessionTtl',
+        'inactive_session_ttl_days': to_json(inactive_session_ttl_days),
+    })
+
+
+def setInlineGameScore(inline_message_id: str = None, edit_message: bool = None, user_id: int = None, score: int = None, force: bool = None, ):
+    return client.send({
+        '@type': 'setInlineGameScore',
+        'inline_message_id': to_json(inline_message_id),
+        'edit_message': to_json(edit_message),
+        'user_id': to_json(user_id),
+        'score': to_json(score),
+        'force': to_json(force),
+    })
+
+
+def setLocation(location: Location = None, ):
+    return client.send({
+        '@type': 'setLocation',
+        'location': to_json(location),
+    })
+
+
+def setLogStream(log_stream: LogStream = None, ):
+    return client.send({
+        '@type': 'setLogStream',
+        'log_stream': to_json(log_stream),
+    })
+
+
+def setLogTagVerbosityLevel(tag: str = None, new_verbosity_level: int = None, ):
+    return client.send({
+        '@type': 'setLogTagVerbosityLevel',
+        'tag': to_json(tag),
+        'new_verbosity_level': to_json(new_verbosity_level),
+    })
+
+
+def setLogVerbosityLevel(new_verbosity_level: int = None, ):
+    return client.send({
+        '@type': 'setLogVerbosityLevel',
+        'new_verbosity_level': to_json(new_verbosity_level),
+    })
+
+
+def setLoginEmailAddress(new_login_email_address: str = None, ):
+    return client.send({
+        '@type': 'setLoginEmailAddress',
+        'new_login_email_address': to_json(new_login_email_address),
+    })
+
+
+def setMenuButton(user_id: int = None, menu_button: BotMenuButton = None, ):
+    return client.send({
+        '@type': 'setMenuButton',
+        'user_id': to_json(user_id),
+        'menu_button': to_json(menu_button),
+    })
+
+
+def setMessageReactions(chat_id: int = None, message_id: int = None, reaction_types: list[ReactionType] = None, is_big: bool = None, ):
+    return client.send({
+        '@type': 'setMessageReactions',
+        'chat_id': to_json(chat_id),
+        'message_id': to_json(message_id),
+        'reaction_types': to_json(reaction_types),
+        'is_big': to_json(is_big),
+    })
+
+
+def setMessageSenderBlockList(sender_id: MessageSender = None, block_list: BlockList = None, ):
+    return client.send({
+        '@type': 'setMessageSenderBlockList',
+        'sender_id': to_json(sender_id),
+        'block_list': to_json(block_list),
+    })
+
+
+def setName(first_name: str = None, last_name: str = None, ):
+    return client.send({
+        '@type': 'setName',
+        'first_name': to_json(first_name),
+        'last_name': to_json(last_name),
+    })
+
+
+def setNetworkType(type: NetworkType = None, ):
+    return client.send({
+        '@type': 'setNetworkType',
+        'type': to_json(type),
+    })
+
+
+def setOption(name: str = None, value: OptionValue = None, ):
+    return client.send({
+        '@type': 'setOption',
+        'name': to_json(name),
+        'value': to_json(value),
+    })
+
+
+def setPassportElement(element: InputPassportElement = None, password: str = None, ):
+    return client.send({
+        '@type': 'setPassportElement',
+        'element': to_json(element),
+        'password': to_json(password),
+    })
+
+
+def setPassportElementErrors(user_id: int = None, errors: list[InputPassportElementError] = None, ):
+    return client.send({
+        '@type': 'setPassportElementErrors',
+        'user_id': to_json(user_id),
+        'errors': to_json(errors),
+    })
+
+
+def setPassword(old_password: str = None, new_password: str = None, new_hint: str = None, set_recovery_email_address: bool = None, new_recovery_email_address: str = None, ):
+    return client.send({
+        '@type': 'setPassword',
+        'old_password': to_json(old_password),
+        'new_password': to_json(new_password),
+        'new_hint': to_json(new_hint),
+        'set_recovery_email_address': to_json(set_recovery_email_address),
+        'new_recovery_email_address': to_json(new_recovery_email_address),
+    })
+
+
+def setPinnedChats(chat_list: ChatList = None, chat_ids: list[int] = None, ):
+    return client.send({
+        '@type': 'setPinnedChats',
+        'chat_list': to_json(chat_list),
+        'chat_ids': to_json(chat_ids),
+    })
+
+
+def setPinnedForumTopics(chat_id: int = None, message_thread_ids: list[int] = None, ):
+    return client.send({
+        '@type': 'setPinnedForumTopics',
+        'chat_id': to_json(chat_id),
+        'message_thread_ids': to_json(message_thread_ids),
+    })
+
+
+def setPollAnswer(chat_id: int = None, message_id: int = None, option_ids: list[int] = None, ):
+    return client.send({
+        '@type': 'setPollAnswer',
+        'chat_id': to_json(chat_id),
+        'message_id': to_json(message_id),
+        'option_ids': to_json(option_ids),
+    })
+
+
+def setProfileAccentColor(profile_accent_color_id: int = None, profile_background_custom_emoji_id: int = None, ):
+    return client.send({
+        '@type': 'setProfileAccentColor',
+        'profile_accent_color_id': to_json(profile_accent_color_id),
+        'profile_background_custom_emoji_id': to_json(profile_background_custom_emoji_id),
+    })
+
+
+def setProfilePhoto(photo: InputChatPhoto = None, is_public: bool = None, ):
+    return client.send({
+        '@type': 'setProfilePhoto',
+        'photo': to_json(photo),
+        'is_public': to_json(is_public),
+    })
+
+
+def setRecoveryEmailAddress(password: str = None, new_recovery_email_address: str = None, ):
+    return client.send({
+        '@type': 'setRecoveryEmailAddress',
+        'password': to_json(password),
+        'new_recovery_email_address': to_json(new_recovery_email_address),
+    })
+
+
+def setScopeNotificationSettings(scope: NotificationSettingsScope = None, notification_settings: ScopeNotificationSettings = None, ):
+    return client.send({
+        '@type': 'setScopeNotificationSettings',
+        'scope': to_json(scope),
+        'notification_settings': to_json(notification_settings),
+    })
+
+
+def setStickerEmojis(sticker: InputFile = None, emojis: str = None, ):
+    return client.send({
+        '@type': 'setStickerEmojis',
+        'sticker': to_json(sticker),
+        'emojis': to_json(emojis),
+    })
+
+
+def setStickerKeywords(sticker: InputFile = None, keywords: list[str] = None, ):
+    return client.send({
+        '@type': 'setStickerKeywords',
+        'sticker': to_json(sticker),
+        'keywords': to_json(keywords),
+    })
+
+
+def setStickerMaskPosition(sticker: InputFile = None, mask_position: MaskPosition = None, ):
+    return client.send({
+        '@type': 'setStickerMaskPosition',
+        'sticker': to_json(sticker),
+        'mask_position': to_json(mask_position),
+    })
+
+
+def setStickerPositionInSet(sticker: InputFile = None, position: int = None, ):
+    return client.send({
+        '@type': 'setStickerPositionInSet',
+        'sticker': to_json(sticker),
+        'position': to_json(position),
+    })
+
+
+def setStickerSetThumbnail(user_id: int = None, name: str = None, thumbnail: InputFile = None, ):
+    return client.send({
+        '@type': 'setStickerSetThumbnail',
+        'user_id': to_json(user_id),
+        'name': to_json(name),
+        'thumbnail': to_json(thumbnail),
+    })
+
+
+def setStickerSetTitle(name: str = None, title: str = None, ):
+    return client.send({
+        '@type': 'setStickerSetTitle',
+        'name': to_json(name),
+        'title': to_json(title),
+    })
+
+
+def setStoryPrivacySettings(story_sender_chat_id: int = None, story_id: int = None, privacy_settings: StoryPrivacySettings = None, ):
+    return client.send({
+        '@type': 'setStoryPrivacySettings',
+        'story_sender_chat_id': to_json(story_sender_chat_id),
+        'story_id': to_json(story_id),
+        'privacy_settings': to_json(privacy_settings),
+    })
+
+
+def setStoryReaction(story_sender_chat_id: int = None, story_id: int = None, reaction_type: ReactionType = None, update_recent_reactions: bool = None, ):
+    return client.send({
+        '@type': 'setStoryReaction',
+        'story_sender_chat_id': to_json(story_sender_chat_id),
+        'story_id': to_json(story_id),
+        'reaction_type': to_json(reaction_type),
+        'update_recent_reactions': to_json(update_recent_reactions),
+    })
+
+
+def setSupergroupStickerSet(supergroup_id: int = None, sticker_set_id: int = None, ):
+    return client.send({
+        '@type': 'setSupergroupStickerSet',
+        'supergroup_id': to_json(supergroup_id),
+        'sticker_set_id': to_json(sticker_set_id),
+    })
+
+
+def setSupergroupUsername(supergroup_id: int = None, username: str = None, ):
+    return client.send({
+        '@type': 'setSupergroupUsername',
+        'supergroup_id': to_json(supergroup_id),
+        'username': to_json(username),
+    })
+
+
+def setTdlibParameters(use_test_dc: bool = None, database_directory: str = None, files_directory: str = None, database_encryption_key: bytes = None, use_file_database: bool = None, use_chat_info_database: bool = None, use_message_database: bool = None, use_secret_chats: bool = None, api_id: int = None, api_hash: str = None, system_language_code: str = None, device_model: str = None, system_version: str = None, application_version: str = None, enable_storage_optimizer: bool = None, ignore_file_names: bool = None, ):
+    return client.send({
+        '@type': 'setTdlibParameters',
+        'use_test_dc': to_json(use_test_dc),
+        'database_directory': to_json(database_directory),
+        'files_directory': to_json(files_directory),
+        'database_encryption_key': to_json(database_encryption_key),
+        'use_file_database': to_json(use_file_database),
+        'use_chat_info_database': to_json(use_chat_info_database),
+        'use_message_database': to_json(use_message_database),
+        'use_secret_chats': to_json(use_secret_chats),
+        'api_id': to_json(api_id),
+        'api_hash': to_json(api_hash),
+        'system_language_code': to_json(system_language_code),
+        'device_model': to_json(device_model),
+        'system_version': to_json(system_version),
+        'application_version': to_json(application_version),
+        'enable_storage_optimizer': to_json(enable_storage_optimizer),
+        'ignore_file_names': to_json(ignore_file_names),
+    })
+
+
+def setUserPersonalProfilePhoto(user_id: int = None, photo: InputChatPhoto = None, ):
+    return client.send({
+        '@type': 'setUserPersonalProfilePhoto',
+        'user_id': to_json(user_id),
+        'photo': to_json(photo),
+    })
+
+
+def setUserPrivacySettingRules(setting: UserPrivacySetting = None, rules: UserPrivacySettingRules = None, ):
+    return client.send({
+        '@type': 'setUserPrivacySettingRules',
+        'setting': to_json(setting),
+        'rules': to_json(rules),
+    })
+
+
+def setUserSupportInfo(user_id: int = None, message: FormattedText = None, ):
+    return client.send({
+        '@type': 'setUserSupportInfo',
+        'user_id': to_json(user_id),
+        'message': to_json(message),
+    })
+
+
+def setUsername(username: str = None, ):
+    return client.send({
+        '@type': 'setUsername',
+        'username': to_json(username),
+    })
+
+
+def setVideoChatDefaultParticipant(chat_id: int = None, default_participant_id: MessageSender = None, ):
+    return client.send({
+        '@type': 'setVideoChatDefaultParticipant',
+        'chat_id': to_json(chat_id),
+        'default_participant_id': to_json(default_participant_id),
+    })
+
+
+def shareChatWithBot(chat_id: int = None, message_id: int = None, button_id: int = None, shared_chat_id: int = None, only_check: bool = None, ):
+    return client.send({
+        '@type': 'shareChatWithBot',
+        'chat_id': to_json(chat_id),
+        'message_id': to_json(message_id),
+        'button_id': to_json(button_id),
+        'shared_chat_id': to_json(shared_chat_id),
+        'only_check': to_json(only_check),
+    })
+
+
+def sharePhoneNumber(user_id: int = None, ):
+    return client.send({
+        '@type': 'sharePhoneNumber',
+        'user_id': to_json(user_id),
+    })
+
+
+def shareUsersWithBot(chat_id: int = None, message_id: int = None, button_id: int = None, shared_user_ids: list[int] = None, only_check: bool = None, ):
+    return client.send({
+        '@type': 'shareUsersWithBot',
+        'chat_id': to_json(chat_id),
+        'message_id': to_json(message_id),
+        'button_id': to_json(button_id),
+        'shared_user_ids': to_json(shared_user_ids),
+        'only_check': to_json(only_check),
+    })
+
+
+def startGroupCallRecording(group_call_id: int = None, title: str = None, record_video: bool = None, use_portrait_orientation: bool = None, ):
+    return client.send({
+        '@type': 'startGroupCallRecording',
+        'group_call_id': to_json(group_call_id),
+        'title': to_json(title),
+        'record_video': to_json(record_video),
+        'use_portrait_orientation': to_json(use_portrait_orientation),
+    })
+
+
+def startGroupCallScreenSharing(group_call_id: int = None, audio_source_id: int = None, payload: str = None, ):
+    return client.send({
+        '@type': 'startGroupCallScreenSharing',
+        'group_call_id': to_json(group_call_id),
+        'audio_source_id': to_json(audio_source_id),
+        'payload': to_json(payload),
+    })
+
+
+def startScheduledGroupCall(group_call_id: int = None, ):
+    return client.send({
+        '@type': 'startScheduledGroupCall',
+        'group_call_id': to_json(group_call_id),
+    })
+
+
+def stopPoll(chat_id: int = None, message_id: int = None, reply_markup: ReplyMarkup = None, ):
+    return client.send({
+        '@type': 'stopPoll',
+        'chat_id': to_json(chat_id),
+        'message_id': to_json(message_id),
+        'reply_markup': to_json(reply_markup),
+    })
+
+
+def suggestUserProfilePhoto(user_id: int = None, photo: InputChatPhoto = None, ):
+    return client.send({
+        '@type': 'suggestUserProfilePhoto',
+        'user_id': to_json(user_id),
+        'photo': to_json(photo),
+    })
+
+
+def synchronizeLanguagePack(language_pack_id: str = None, ):
+    return client.send({
+        '@type': 'synchronizeLanguagePack',
+        'language_pack_id': to_json(language_pack_id),
+    })
+
+
+def terminateAllOtherSessions():
+    return client.send({
+        '@type': 'terminateAllOtherSessions',
+    })
+
+
+def terminateSession(session_id: int = None, ):
+    return client.send({
+        '@type': 'terminateSession',
+        'session_id': to_json(session_id),
+    })
+
+
+def testCallBytes(x: bytes = None, ):
+    return client.send({
+        '@type': 'testCallBytes',
+        'x': to_json(x),
+    })
+
+
+def testCallEmpty():
+    return client.send({
+        '@type': 'testCallEmpty',
+    })
+
+
+def testCallString(x: str = None, ):
+    return client.send({
+        '@type': 'testCallString',
+        'x': to_json(x),
+    })
+
+
+def testCallVectorInt(x: list[int] = None, ):
+    return client.send({
+        '@type': 'testCallVectorInt',
+        'x': to_json(x),
+    })
+
+
+def testCallVectorIntObject(x: list[TestInt] = None, ):
+    return client.send({
+        '@type': 'testCallVectorIntObject',
+        'x': to_json(x),
+    })
+
+
+def testCallVectorString(x: list[str] = None, ):
+    return client.send({
+        '@type': 'testCallVectorString',
+        'x': to_json(x),
+    })
+
+
+def testCallVectorStringObject(x: list[TestString] = None, ):
+    return client.send({
+        '@type': 'testCallVectorStringObject',
+        'x': to_json(x),
+    })
+
+
+def testGetDifference():
+    return client.send({
+        '@type': 'testGetDifference',
+    })
+
+
+def testNetwork():
+    return client.send({
+        '@type': 'testNetwork',
+    })
+
+
+def testProxy(server: str = None, port: int = None, type: ProxyType = None, dc_id: int = None, timeout: float = None, ):
+    return client.send({
+        '@type': 'testProxy',
+        'server': to_json(server),
+        'port': to_json(port),
+        'type': to_json(type),
+        'dc_id': to_json(dc_id),
+        'timeout': to_json(timeout),
+    })
+
+
+def testReturnError(error: Error = None, ):
+    return client.send({
+        '@type': 'testReturnError',
+        'error': to_json(error),
+    })
+
+
+def testSquareInt(x: int = None, ):
+    return client.send({
+        '@type': 'testSquareInt',
+        'x': to_json(x),
+    })
+
+
+def testUseUpdate():
+    return client.send({
+        '@type': 'testUseUpdate',
+    })
+
+
+def toggleAllDownloadsArePaused(are_paused: bool = None, ):
+    return client.send({
+        '@type': 'toggleAllDownloadsArePaused',
+        'are_paused': to_json(are_paused),
+    })
+
+
+def toggleBotIsAddedToAttachmentMenu(bot_user_id: int = None, is_added: bool = None, allow_write_access: bool = None, ):
+    return client.send({
+        '@type': 'toggleBotIsAddedToAttachmentMenu',
+        'bot_user_id': to_json(bot_user_id),
+        'is_added': to_json(is_added),
+        'allow_write_access': to_json(allow_write_access),
+    })
+
+
+def toggleBotUsernameIsActive(bot_user_id: int = None, username: str = None, is_active: bool = None, ):
+    return client.send({
+        '@type': 'toggleBotUsernameIsActive',
+        'bot_user_id': to_json(bot_user_id),
+        'username': to_json(username),
+        'is_active': to_json(is_active),
+    })
+
+
+def toggleChatDefaultDisableNotification(chat_id: int = None, default_disable_notification: bool = None, ):
+    return client.send({
+        '@type': 'toggleChatDefaultDisableNotification',
+        'chat_id': to_json(chat_id),
+        'default_disable_notification': to_json(default_disable_notification),
+    })
+
+
+def toggleChatHasProtectedContent(chat_id: int = None, has_protected_content: bool = None, ):
+    return client.send({
+        '@type': 'toggleChatHasProtectedContent',
+        'chat_id': to_json(chat_id),
+        'has_protected_content': to_json(has_protected_content),
+    })
+
+
+def toggleChatIsMarkedAsUnread(chat_id: int = None, is_marked_as_unread: bool = None, ):
+    return client.send({
+        '@type': 'toggleChatIsMarkedAsUnread',
+        'chat_id': to_json(chat_id),
+        'is_marked_as_unread': to_json(is_marked_as_unread),
+    })
+
+
+def toggleChatIsPinned(chat_list: ChatList = None, chat_id: int = None, is_pinned: bool = None, ):
+    return client.send({
+        '@type': 'toggleChatIsPinned',
+        'chat_list': to_json(chat_list),
+        'chat_id': to_json(chat_id),
+        'is_pinned': to_json(is_pinned),
+    })
+
+
+def toggleChatIsTranslatable(chat_id: int = None, is_translatable: bool = None, ):
+    return client.send({
+        '@type': 'toggleChatIsTranslatable',
+        'chat_id': to_json(chat_id),
+        'is_translatable': to_json(is_translatable),
+    })
+
+
+def toggleChatViewAsTopics(chat_id: int = None, view_as_topics: bool = None, ):
+    return client.send({
+        '@type': 'toggleChatViewAsTopics',
+        'chat_id': to_json(chat_id),
+        'view_as_topics': to_json(view_as_topics),
+    })
+
+
+def toggleDownloadIsPaused(file_id: int = None, is_paused: bool = None, ):
+    return client.send({
+        '@type': 'toggleDownloadIsPaused',
+        'file_id': to_json(file_id),
+        'is_paused': to_json(is_paused),
+    })
+
+
+def toggleForumTopicIsClosed(chat_id: int = None, message_thread_id: int = None, is_closed: bool = None, ):
+    return client.send({
+        '@type': 'toggleForumTopicIsClosed',
+        'chat_id': to_json(chat_id),
+        'message_thread_id': to_json(message_thread_id),
+        'is_closed': to_json(is_closed),
+    })
+
+
+def toggleForumTopicIsPinned(chat_id: int = None, message_thread_id: int = None, is_pinned: bool = None, ):
+    return client.send({
+        '@type': 'toggleForumTopicIsPinned',
+        'chat_id': to_json(chat_id),
+        'message_thread_id': to_json(message_thread_id),
+        'is_pinned': to_json(is_pinned),
+    })
+
+
+def toggleGeneralForumTopicIsHidden(chat_id: int = None, is_hidden: bool = None, ):
+    return client.send({
+        '@type': 'toggleGeneralForumTopicIsHidden',
+        'chat_id': to_json(chat_id),
+        'is_hidden': to_json(is_hidden),
+    })
+
+
+def toggleGroupCallEnabledStartNotification(group_call_id: int = None, enabled_start_notification: bool = None, ):
+    return client.send({
+        '@type': 'toggleGroupCallEnabledStartNotification',
+        'group_call_id': to_json(group_call_id),
+        'enabled_start_notification': to_json(enabled_start_notification),
+    })
+
+
+def toggleGroupCallIsMyVideoEnabled(group_call_id: int = None, is_my_video_enabled: bool = None, ):
+    return client.send({
+        '@type': 'toggleGroupCallIsMyVideoEnabled',
+        'group_call_id': to_json(group_call_id),
+        'is_my_video_enabled': to_json(is_my_video_enabled),
+    })
+
+
+def toggleGroupCallIsMyVideoPaused(group_call_id: int = None, is_my_video_paused: bool = None, ):
+    return client.send({
+        '@type': 'toggleGroupCallIsMyVideoPaused',
+        'group_call_id': to_json(group_call_id),
+        'is_my_video_paused': to_json(is_my_video_paused),
+    })
+
+
+def toggleGroupCallMuteNewParticipants(group_call_id: int = None, mute_new_participants: bool = None, ):
+    return client.send({
+        '@type': 'toggleGroupCallMuteNewParticipants',
+        'group_call_id': to_json(group_call_id),
+        'mute_new_participants': to_json(mute_new_participants),
+    })
+
+
+def toggleGroupCallParticipantIsHandRaised(group_call_id: int = None, participant_id: MessageSender = None, is_hand_raised: bool = None, ):
+    return client.send({
+        '@type': 'toggleGroupCallParticipantIsHandRaised',
+        'group_call_id': to_json(group_call_id),
+        'participant_id': to_json(participant_id),
+        'is_hand_raised': to_json(is_hand_raised),
+    })
+
+
+def toggleGroupCallParticipantIsMuted(group_call_id: int = None, participant_id: MessageSender = None, is_muted: bool = None, ):
+    return client.send({
+        '@type': 'toggleGroupCallParticipantIsMuted',
+        'group_call_id': to_json(group_call_id),
+        'participant_id': to_json(participant_id),
+        'is_muted': to_json(is_muted),
+    })
+
+
+def toggleGroupCallScreenSharingIsPaused(group_call_id: int = None, is_paused: bool = None, ):
+    return client.send({
+        '@type': 'toggleGroupCallScreenSharingIsPaused',
+        'group_call_id': to_json(group_call_id),
+        'is_paused': to_json(is_paused),
+    })
+
+
+def toggleSessionCanAcceptCalls(session_id: int = None, can_accept_calls: bool = None, ):
+    return client.send({
+        '@type': 'toggleSessionCanAcceptCalls',
+        'session_id': to_json(session_id),
+        'can_accept_calls': to_json(can_accept_calls),
+    })
+
+
+def toggleSessionCanAcceptSecretChats(session_id: int = None, can_accept_secret_chats: bool = None, ):
+    return client.send({
+        '@type': 'toggleSessionCanAcceptSecretChats',
+        'session_id': to_json(session_id),
+        'can_accept_secret_chats': to_json(can_accept_secret_chats),
+    })
+
+
+def toggleStoryIsPinned(story_sender_chat_id: int = None, story_id: int = None, is_pinned: bool = None, ):
+    return client.send({
+        '@type': 'toggleStoryIsPinned',
+        'story_sender_chat_id': to_json(story_sender_chat_id),
+        'story_id': to_json(story_id),
+        'is_pinned': to_json(is_pinned),
+    })
+
+
+def toggleSupergroupHasAggressiveAntiSpamEnabled(supergroup_id: int = None, has_aggressive_anti_spam_enabled: bool = None, ):
+    return client.send({
+        '@type': 'toggleSupergroupHasAggressiveAntiSpamEnabled',
+        'supergroup_id': to_json(supergroup_id),
+        'has_aggressive_anti_spam_enabled': to_json(has_aggressive_anti_spam_enabled),
+    })
+
+
+def toggleSupergroupHasHiddenMembers(supergroup_id: int = None, has_hidden_members: bool = None, ):
+    return client.send({
+        '@type': 'toggleSupergroupHasHiddenMembers',
+        'supergroup_id': to_json(supergroup_id),
+        'has_hidden_members': to_json(has_hidden_members),
+    })
+
+
+def toggleSupergroupIsAllHistoryAvailable(supergroup_id: int = None, is_all_history_available: bool = None, ):
+    return client.send({
+        '@type': 'toggleSupergroupIsAllHistoryAvailable',
+        'supergroup_id': to_json(supergroup_id),
+        'is_all_history_available': to_json(is_all_history_available),
+    })
+
+
+def toggleSupergroupIsBroadcastGroup(supergroup_id: int = None, ):
+    return client.send({
+        '@type': 'toggleSupergroupIsBroadcastGroup',
+        'supergroup_id': to_json(supergroup_id),
+    })
+
+
+def toggleSupergroupIsForum(supergroup_id: int = None, is_forum: bool = None, ):
+    return client.send({
+        '@type': 'toggleSupergroupIsForum',
+        'supergroup_id': to_json(supergroup_id),
+        'is_forum': to_json(is_forum),
+    })
+
+
+def toggleSupergroupJoinByRequest(supergroup_id: int = None, join_by_request: bool = None, ):
+    return client.send({
+        '@type': 'toggleSupergroupJoinByRequest',
+        'supergroup_id': to_json(supergroup_id),
+        'join_by_request': to_json(join_by_request),
+    })
+
+
+def toggleSupergroupJoinToSendMessages(supergroup_id: int = None, join_to_send_messages: bool = None, ):
+    return client.send({
+        '@type': 'toggleSupergroupJoinToSendMessages',
+        'supergroup_id': to_json(supergroup_id),
+        'join_to_send_messages': to_json(join_to_send_messages),
+    })
+
+
+def toggleSupergroupSignMessages(supergroup_id: int = None, sign_messages: bool = None, ):
+    return client.send({
+        '@type': 'toggleSupergroupSignMessages',
+        'supergroup_id': to_json(supergroup_id),
+        'sign_messages': to_json(sign_messages),
+    })
+
+
+def toggleSupergroupUsernameIsActive(supergroup_id: int = None, username: str = None, is_active: bool = None, ):
+    return client.send({
+        '@type': 'toggleSupergroupUsernameIsActive',
+        'supergroup_id': to_json(supergroup_id),
+        'username': to_json(username),
+        'is_active': to_json(is_active),
+    })
+
+
+def toggleUsernameIsActive(username: str = None, is_active: bool = None, ):
+    return client.send({
+        '@type': 'toggleUsernameIsActive',
+        'username': to_json(username),
+        'is_active': to_json(is_active),
+    })
+
+
+def transferChatOwnership(chat_id: int = None, user_id: int = None, password: str = None, ):
+    return client.send({
+        '@type': 'transferChatOwnership',
+        'chat_id': to_json(chat_id),
+        'user_id': to_json(user_id),
+        'password': to_json(password),
+    })
+
+
+def translateMessageText(chat_id: int = None, message_id: int = None, to_language_code: str = None, ):
+    return client.send({
+        '@type': 'translateMessageText',
+        'chat_id': to_json(chat_id),
+        'message_id': to_json(message_id),
+        'to_language_code': to_json(to_language_code),
+    })
+
+
+def translateText(text: FormattedText = None, to_language_code: str = None, ):
+    return client.send({
+        '@type': 'translateText',
+        'text': to_json(text),
+        'to_language_code': to_json(to_language_code),
+    })
+
+
+def unpinAllChatMessages(chat_id: int = None, ):
+    return client.send({
+        '@type': 'unpinAllChatMessages',
+        'chat_id': to_json(chat_id),
+    })
+
+
+def unpinAllMessageThreadMessages(chat_id: int = None, message_thread_id: int = None, ):
+    return client.send({
+        '@type': 'unpinAllMessageThreadMessages',
+        'chat_id': to_json(chat_id),
+        'message_thread_id': to_json(message_thread_id),
+    })
+
+
+def unpinChatMessage(chat_id: int = None, message_id: int = None, ):
+    return client.send({
+        '@type': 'unpinChatMessage',
+        'chat_id': to_json(chat_id),
+        'message_id': to_json(message_id),
+    })
+
+
+def upgradeBasicGroupChatToSupergroupChat(chat_id: int = None, ):
+    return client.send({
+        '@type': 'upgradeBasicGroupChatToSupergroupChat',
+        'chat_id': to_json(chat_id),
+    })
+
+
+def uploadStickerFile(user_id: int = None, sticker_format: StickerFormat = None, sticker: InputFile = None, ):
+    return client.send({
+        '@type': 'uploadStickerFile',
+        'user_id': to_json(user_id),
+        'sticker_format': to_json(sticker_format),
+        'sticker': to_json(sticker),
+    })
+
+
+def validateOrderInfo(input_invoice: InputInvoice = None, order_info: OrderInfo = None, allow_save: bool = None, ):
+    return client.send({
+        '@type': 'validateOrderInfo',
+        'input_invoice': to_json(input_invoice),
+        'order_info': to_json(order_info),
+        'allow_save': to_json(allow_save),
+    })
+
+
+def viewMessages(chat_id: int = None, message_ids: list[int] = None, source: MessageSource = None, force_read: bool = None, ):
+    return client.send({
+        '@type': 'viewMessages',
+        'chat_id': to_json(chat_id),
+        'message_ids': to_json(message_ids),
+        'source': to_json(source),
+        'force_read': to_json(force_read),
+    })
+
+
+def viewPremiumFeature(feature: PremiumFeature = None, ):
+    return client.send({
+        '@type': 'viewPremiumFeature',
+        'feature': to_json(feature),
+    })
+
+
+def viewTrendingStickerSets(sticker_set_ids: list[int] = None, ):
+    return client.send({
+        '@type': 'viewTrendingStickerSets',
+        'sticker_set_ids': to_json(sticker_set_ids),
+    })
+
+
+def writeGeneratedFilePart(generation_id: int = None, offset: int = None, data: bytes = None, ):
+    return client.send({
+        '@type': 'writeGeneratedFilePart',
+        'generation_id': to_json(generation_id),
+        'offset': to_json(offset),
+        'data': to_json(data),
+    })
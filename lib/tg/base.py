@@ -0,0 +1,219 @@
+# Base classes and helpers of the TL objects, maintained by hand. tools/split_tg.py never writes this file
+import os
+import sys
+import threading
+
+
+class TlObject(object):
+    def __init__(self, **kwargs):
+        super().__init__()
+
+    def __getattr__(self, name):
+        # Called only for attributes that are not set yet, i.e. fields of lazy objects that were never accessed
+        raw = self.__dict__.get('_raw')
+        if raw is None or name not in get_fields(self.__class__):
+            raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{name}'")
+        with _lock:
+            # The field may have been decoded by another thread while this one was waiting
+            if name in self.__dict__:
+                return self.__dict__[name]
+            value = get_object(raw.get(name))
+            setattr(self, name, value)
+        return value
+
+
+class TlStorerToString(object):
+    def __init__(self, **kwargs):
+        super().__init__()
+
+
+class Object(TlObject):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class Function(TlObject):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class _Types(dict):
+    # @type -> class, filled on first lookup through lib.tg, which imports the module of the class
+    def __missing__(self, key):
+        tg = sys.modules['lib.tg']
+        cls = self[key] = getattr(tg, tg._type_names[key])
+        return cls
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+
+types = _Types()
+
+
+# 'eager' decodes the whole object tree at once and is the compact representation. 'lazy' keeps the JSON and decodes
+# fields on first attribute access: less work for objects that are never read, but more memory than 'eager'
+mode = os.environ.get('TG_OBJECT_MODE', 'eager')
+
+# Updates are merged into the JSON of fields that were not decoded yet, and the same objects are read in other
+# threads. Decoding a field and merging into an object happen under this lock, so an update can not go into JSON
+# that has just been decoded
+_lock = threading.RLock()
+
+_fields = dict()
+
+
+def get_fields(cls) -> tuple[str, ...]:
+    try:
+        return _fields[cls]
+    except KeyError:
+        fields = _fields[cls] = tuple(key for key in cls().__dict__ if not key.startswith('_'))
+        return fields
+
+
+def get_object(data):
+    if isinstance(data, dict):
+        if mode == 'lazy':
+            obj = (cls := types[data['@type']]).__new__(cls)
+            obj._raw = data
+            return obj
+        return types[data['@type']](**data)
+    if isinstance(data, list):
+        return list(map(get_object, data))
+    return data
+
+
+def update_object(obj, data) -> list[str]:
+    # Copies the fields of data into obj and returns the names of the changed ones, nested fields as 'local.path'.
+    # Nested objects of the same type are updated in place, the other decoded values are shared, not copied
+    if isinstance(data, dict):
+        with _lock:
+            return _update_from_json(obj, data)
+    attrs = data.__dict__
+    if '_raw' in attrs:
+        with _lock:
+            return _update_from_json(obj, attrs['_raw'])
+    changed = []
+    for key in get_fields(data.__class__):
+        item = attrs[key]
+        current = getattr(obj, key, None)
+        if item.__class__ is current.__class__ and isinstance(item, TlObject):
+            changed.extend(f'{key}.{el}' for el in update_object(current, item))
+        elif item.__class__ is list and current.__class__ is list:
+            # Lists of objects are compared by value
+            if to_json(item) != to_json(current):
+                setattr(obj, key, item)
+                changed.append(key)
+        elif item is not current and item != current:
+            setattr(obj, key, item)
+            changed.append(key)
+    return changed
+
+
+def _update_from_json(obj, data: dict) -> list[str]:
+    # Only the changed values are decoded. Fields of lazy objects that were never accessed stay JSON
+    changed = []
+    attrs = obj.__dict__
+    raw = attrs.get('_raw')
+    for key, item in data.items():
+        if key in attrs:
+            current = attrs[key]
+        elif raw is not None and key in raw:
+            if item == (current := raw[key]):
+                continue
+            if current.__class__ is dict and item.__class__ is dict and current.get('@type') == item.get('@type'):
+                changed += [f'{key}.{el}' for el in _merge_json(current, item)]
+            else:
+                raw[key] = item
+                changed.append(key)
+            continue
+        elif key[0] == '@':
+            continue
+        else:
+            current = getattr(obj, key, None)
+
+        if item.__class__ is dict:
+            if current is not None and types[item['@type']] is current.__class__:
+                changed += [f'{key}.{el}' for el in _update_from_json(current, item)]
+                continue
+            item = get_object(item)
+        elif item.__class__ is list:
+            if current.__class__ is list and to_json(current) == item:
+                continue
+            item = get_object(item)
+        elif item == current:
+            continue
+        setattr(obj, key, item)
+        changed.append(key)
+    return changed
+
+
+def _merge_json(old: dict, new: dict) -> list[str]:
+    changed = []
+    for key, item in new.items():
+        if item == (current := old.get(key)):
+            continue
+        if current.__class__ is dict and item.__class__ is dict and current.get('@type') == item.get('@type'):
+            changed += [f'{key}.{el}' for el in _merge_json(current, item)]
+        else:
+            old[key] = item
+            changed.append(key)
+    return changed
+
+
+# Values that are serialized as they are
+_SCALARS = frozenset((int, str, bool, float, bytes, type(None)))
+_serializers = dict()
+
+
+def _serializer(cls):
+    # Generated classes are serialized by their field list, the @type string is built once per class
+    type_name = cls.__name__[0].lower() + cls.__name__[1:]
+    if types.get(type_name) is not cls:
+        return _to_json_reflective
+    fields = get_fields(cls)
+
+    def serialize(obj):
+        attrs = obj.__dict__
+        if '_raw' in attrs:
+            # Fields of lazy objects that were never accessed are still JSON, only the accessed ones are serialized
+            res = attrs['_raw'].copy()
+            res['@type'] = type_name
+            for key, item in attrs.items():
+                if key[0] != '_':
+                    res[key] = item if item.__class__ in _SCALARS else to_json(item)
+            return res
+        res = {'@type': type_name}
+        for key in fields:
+            item = attrs[key]
+            res[key] = item if item.__class__ in _SCALARS else to_json(item)
+        return res
+    return serialize
+
+
+def _to_json_reflective(obj):
+    res = {'@type': obj.__class__.__name__[0].lower() + obj.__class__.__name__[1:]}
+    if '_raw' in obj.__dict__:
+        res.update(obj._raw)
+    for key, item in obj.__dict__.items():
+        if not key.startswith('_'):
+            res[key] = to_json(item)
+    return res
+
+
+def to_json(obj):
+    cls = obj.__class__
+    if cls in _SCALARS:
+        return obj
+    if cls is list:
+        return [item if item.__class__ in _SCALARS else to_json(item) for item in obj]
+    try:
+        serializer = _serializers[cls]
+    except KeyError:
+        if not hasattr(obj, '__dict__'):
+            return obj
+        serializer = _serializers[cls] = _serializer(cls)
+    return serializer(obj)
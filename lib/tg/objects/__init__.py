@@ -0,0 +1 @@
+# Generated by tools/split_tg.py, do not edit
@@ -0,0 +1,17 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class AccentColor(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Accent color identifier.
+        self.id: int = get_object(kwargs.get('id'))
+        # Identifier of a built-in color to use in places, where only one color is needed; 0-6.
+        self.built_in_accent_color_id: int = get_object(kwargs.get('built_in_accent_color_id'))
+        # The list of 1-3 colors in RGB format, describing the accent color, as expected to be shown in light themes.
+        self.light_theme_colors: list[int] = get_object(kwargs.get('light_theme_colors'))
+        # The list of 1-3 colors in RGB format, describing the accent color, as expected to be shown in dark themes.
+        self.dark_theme_colors: list[int] = get_object(kwargs.get('dark_theme_colors'))
+        # The minimum chat boost level required to use the color.
+        self.min_chat_boost_level: int = get_object(kwargs.get('min_chat_boost_level'))
@@ -0,0 +1,9 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class AccountTtl(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Number of days of inactivity before the account will be flagged for deletion; 30-366 days.
+        self.days: int = get_object(kwargs.get('days'))
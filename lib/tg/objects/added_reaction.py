@@ -0,0 +1,15 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class AddedReaction(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Type of the reaction.
+        self.type: ReactionType = get_object(kwargs.get('type'))
+        # Identifier of the chat member, applied the reaction.
+        self.sender_id: MessageSender = get_object(kwargs.get('sender_id'))
+        # True, if the reaction was added by the current user.
+        self.is_outgoing: bool = get_object(kwargs.get('is_outgoing'))
+        # Point in time (Unix timestamp) when the reaction was added.
+        self.date: int = get_object(kwargs.get('date'))
@@ -0,0 +1,13 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class AddedReactions(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The total number of found reactions.
+        self.total_count: int = get_object(kwargs.get('total_count'))
+        # The list of added reactions.
+        self.reactions: list[AddedReaction] = get_object(kwargs.get('reactions'))
+        # The offset for the next request. If empty, then there are no more results.
+        self.next_offset: str = get_object(kwargs.get('next_offset'))
@@ -0,0 +1,19 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class Address(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # A two-letter ISO 3166-1 alpha-2 country code.
+        self.country_code: str = get_object(kwargs.get('country_code'))
+        # State, if applicable.
+        self.state: str = get_object(kwargs.get('state'))
+        # City.
+        self.city: str = get_object(kwargs.get('city'))
+        # First line of the address.
+        self.street_line1: str = get_object(kwargs.get('street_line1'))
+        # Second line of the address.
+        self.street_line2: str = get_object(kwargs.get('street_line2'))
+        # Address postal code.
+        self.postal_code: str = get_object(kwargs.get('postal_code'))
@@ -0,0 +1,13 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class AnimatedChatPhoto(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Animation width and height.
+        self.length: int = get_object(kwargs.get('length'))
+        # Information about the animation file.
+        self.file: File = get_object(kwargs.get('file'))
+        # Timestamp of the frame, used as a static chat photo.
+        self.main_frame_timestamp: float = get_object(kwargs.get('main_frame_timestamp'))
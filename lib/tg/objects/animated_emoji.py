@@ -0,0 +1,17 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class AnimatedEmoji(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Sticker for the emoji; may be null if yet unknown for a custom emoji. If the sticker is a custom emoji, it can have arbitrary format different from stickerFormatTgs.
+        self.sticker: Sticker = get_object(kwargs.get('sticker'))
+        # Expected width of the sticker, which can be used if the sticker is null.
+        self.sticker_width: int = get_object(kwargs.get('sticker_width'))
+        # Expected height of the sticker, which can be used if the sticker is null.
+        self.sticker_height: int = get_object(kwargs.get('sticker_height'))
+        # Emoji modifier fitzpatrick type; 0-6; 0 if none.
+        self.fitzpatrick_type: int = get_object(kwargs.get('fitzpatrick_type'))
+        # File containing the sound to be played when the sticker is clicked; may be null. The sound is encoded with the Opus codec, and stored inside an OGG container.
+        self.sound: File = get_object(kwargs.get('sound'))
@@ -0,0 +1,25 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class Animation(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Duration of the animation, in seconds; as defined by the sender.
+        self.duration: int = get_object(kwargs.get('duration'))
+        # Width of the animation.
+        self.width: int = get_object(kwargs.get('width'))
+        # Height of the animation.
+        self.height: int = get_object(kwargs.get('height'))
+        # Original name of the file; as defined by the sender.
+        self.file_name: str = get_object(kwargs.get('file_name'))
+        # MIME type of the file, usually &quot;image/gif&quot; or &quot;video/mp4&quot;.
+        self.mime_type: str = get_object(kwargs.get('mime_type'))
+        # True, if stickers were added to the animation. The list of corresponding sticker set can be received using getAttachedStickerSets.
+        self.has_stickers: bool = get_object(kwargs.get('has_stickers'))
+        # Animation minithumbnail; may be null.
+        self.minithumbnail: Minithumbnail = get_object(kwargs.get('minithumbnail'))
+        # Animation thumbnail in JPEG or MPEG4 format; may be null.
+        self.thumbnail: Thumbnail = get_object(kwargs.get('thumbnail'))
+        # File containing the animation.
+        self.animation: File = get_object(kwargs.get('animation'))
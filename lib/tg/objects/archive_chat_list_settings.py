@@ -0,0 +1,13 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class ArchiveChatListSettings(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # True, if new chats from non-contacts will be automatically archived and muted. Can be set to true only if the option &quot;can_archive_and_mute_new_chats_from_unknown_users&quot; is true.
+        self.archive_and_mute_new_chats_from_unknown_users: bool = get_object(kwargs.get('archive_and_mute_new_chats_from_unknown_users'))
+        # True, if unmuted chats will be kept in the Archive chat list when they get a new message.
+        self.keep_unmuted_chats_archived: bool = get_object(kwargs.get('keep_unmuted_chats_archived'))
+        # True, if unmuted chats, that are always included or pinned in a folder, will be kept in the Archive chat list when they get a new message. Ignored if keep_unmuted_chats_archived == true.
+        self.keep_chats_from_folders_archived: bool = get_object(kwargs.get('keep_chats_from_folders_archived'))
@@ -0,0 +1,53 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class AttachmentMenuBot(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # User identifier of the bot.
+        self.bot_user_id: int = get_object(kwargs.get('bot_user_id'))
+        # True, if the bot supports opening from attachment menu in the chat with the bot.
+        self.supports_self_chat: bool = get_object(kwargs.get('supports_self_chat'))
+        # True, if the bot supports opening from attachment menu in private chats with ordinary users.
+        self.supports_user_chats: bool = get_object(kwargs.get('supports_user_chats'))
+        # True, if the bot supports opening from attachment menu in private chats with other bots.
+        self.supports_bot_chats: bool = get_object(kwargs.get('supports_bot_chats'))
+        # True, if the bot supports opening from attachment menu in basic group and supergroup chats.
+        self.supports_group_chats: bool = get_object(kwargs.get('supports_group_chats'))
+        # True, if the bot supports opening from attachment menu in channel chats.
+        self.supports_channel_chats: bool = get_object(kwargs.get('supports_channel_chats'))
+        # True, if the user must be asked for the permission to send messages to the bot.
+        self.request_write_access: bool = get_object(kwargs.get('request_write_access'))
+        # True, if the bot was explicitly added by the user. If the bot isn't added, then on the first bot launch toggleBotIsAddedToAttachmentMenu must be called and the bot must be added or removed.
+        self.is_added: bool = get_object(kwargs.get('is_added'))
+        # True, if the bot must be shown in the attachment menu.
+        self.show_in_attachment_menu: bool = get_object(kwargs.get('show_in_attachment_menu'))
+        # True, if the bot must be shown in the side menu.
+        self.show_in_side_menu: bool = get_object(kwargs.get('show_in_side_menu'))
+        # True, if a disclaimer, why the bot is shown in the side menu, is needed.
+        self.show_disclaimer_in_side_menu: bool = get_object(kwargs.get('show_disclaimer_in_side_menu'))
+        # Name for the bot in attachment menu.
+        self.name: str = get_object(kwargs.get('name'))
+        # Color to highlight selected name of the bot if appropriate; may be null.
+        self.name_color: AttachmentMenuBotColor = get_object(kwargs.get('name_color'))
+        # Default icon for the bot in SVG format; may be null.
+        self.default_icon: File = get_object(kwargs.get('default_icon'))
+        # Icon for the bot in SVG format for the official iOS app; may be null.
+        self.ios_static_icon: File = get_object(kwargs.get('ios_static_icon'))
+        # Icon for the bot in TGS format for the official iOS app; may be null.
+        self.ios_animated_icon: File = get_object(kwargs.get('ios_animated_icon'))
+        # Icon for the bot in PNG format for the official iOS app side menu; may be null.
+        self.ios_side_menu_icon: File = get_object(kwargs.get('ios_side_menu_icon'))
+        # Icon for the bot in TGS format for the official Android app; may be null.
+        self.android_icon: File = get_object(kwargs.get('android_icon'))
+        # Icon for the bot in SVG format for the official Android app side menu; may be null.
+        self.android_side_menu_icon: File = get_object(kwargs.get('android_side_menu_icon'))
+        # Icon for the bot in TGS format for the official native macOS app; may be null.
+        self.macos_icon: File = get_object(kwargs.get('macos_icon'))
+        # Icon for the bot in PNG format for the official macOS app side menu; may be null.
+        self.macos_side_menu_icon: File = get_object(kwargs.get('macos_side_menu_icon'))
+        # Color to highlight selected icon of the bot if appropriate; may be null.
+        self.icon_color: AttachmentMenuBotColor = get_object(kwargs.get('icon_color'))
+        # Default placeholder for opened Web Apps in SVG format; may be null.
+        self.web_app_placeholder: File = get_object(kwargs.get('web_app_placeholder'))
@@ -0,0 +1,11 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class AttachmentMenuBotColor(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Color in the RGB24 format for light themes.
+        self.light_color: int = get_object(kwargs.get('light_color'))
+        # Color in the RGB24 format for dark themes.
+        self.dark_color: int = get_object(kwargs.get('dark_color'))
@@ -0,0 +1,25 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class Audio(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Duration of the audio, in seconds; as defined by the sender.
+        self.duration: int = get_object(kwargs.get('duration'))
+        # Title of the audio; as defined by the sender.
+        self.title: str = get_object(kwargs.get('title'))
+        # Performer of the audio; as defined by the sender.
+        self.performer: str = get_object(kwargs.get('performer'))
+        # Original name of the file; as defined by the sender.
+        self.file_name: str = get_object(kwargs.get('file_name'))
+        # The MIME type of the file; as defined by the sender.
+        self.mime_type: str = get_object(kwargs.get('mime_type'))
+        # The minithumbnail of the album cover; may be null.
+        self.album_cover_minithumbnail: Minithumbnail = get_object(kwargs.get('album_cover_minithumbnail'))
+        # The thumbnail of the album cover in JPEG format; as defined by the sender. The full size thumbnail is supposed to be extracted from the downloaded audio file; may be null.
+        self.album_cover_thumbnail: Thumbnail = get_object(kwargs.get('album_cover_thumbnail'))
+        # Album cover variants to use if the downloaded audio file contains no album cover. Provided thumbnail dimensions are approximate.
+        self.external_album_covers: list[Thumbnail] = get_object(kwargs.get('external_album_covers'))
+        # File containing the audio.
+        self.audio: File = get_object(kwargs.get('audio'))
@@ -0,0 +1,15 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class AuthenticationCodeInfo(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # A phone number that is being authenticated.
+        self.phone_number: str = get_object(kwargs.get('phone_number'))
+        # The way the code was sent to the user.
+        self.type: AuthenticationCodeType = get_object(kwargs.get('type'))
+        # The way the next code will be sent to the user; may be null.
+        self.next_type: AuthenticationCodeType = get_object(kwargs.get('next_type'))
+        # Timeout before the code can be re-sent, in seconds.
+        self.timeout: int = get_object(kwargs.get('timeout'))
@@ -0,0 +1,73 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class AuthenticationCodeType(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class AuthenticationCodeTypeTelegramMessage(AuthenticationCodeType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Length of the code.
+        self.length: int = get_object(kwargs.get('length'))
+
+
+class AuthenticationCodeTypeSms(AuthenticationCodeType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Length of the code.
+        self.length: int = get_object(kwargs.get('length'))
+
+
+class AuthenticationCodeTypeCall(AuthenticationCodeType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Length of the code.
+        self.length: int = get_object(kwargs.get('length'))
+
+
+class AuthenticationCodeTypeFlashCall(AuthenticationCodeType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Pattern of the phone number from which the call will be made.
+        self.pattern: str = get_object(kwargs.get('pattern'))
+
+
+class AuthenticationCodeTypeMissedCall(AuthenticationCodeType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Prefix of the phone number from which the call will be made.
+        self.phone_number_prefix: str = get_object(kwargs.get('phone_number_prefix'))
+        # Number of digits in the code, excluding the prefix.
+        self.length: int = get_object(kwargs.get('length'))
+
+
+class AuthenticationCodeTypeFragment(AuthenticationCodeType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # URL to open to receive the code.
+        self.url: str = get_object(kwargs.get('url'))
+        # Length of the code.
+        self.length: int = get_object(kwargs.get('length'))
+
+
+class AuthenticationCodeTypeFirebaseAndroid(AuthenticationCodeType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Nonce to pass to the SafetyNet Attestation API.
+        self.nonce: bytes = get_object(kwargs.get('nonce'))
+        # Length of the code.
+        self.length: int = get_object(kwargs.get('length'))
+
+
+class AuthenticationCodeTypeFirebaseIos(AuthenticationCodeType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Receipt of successful application token validation to compare with receipt from push notification.
+        self.receipt: str = get_object(kwargs.get('receipt'))
+        # Time after the next authentication method is supposed to be used if verification push notification isn't received, in seconds.
+        self.push_timeout: int = get_object(kwargs.get('push_timeout'))
+        # Length of the code.
+        self.length: int = get_object(kwargs.get('length'))
@@ -0,0 +1,93 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class AuthorizationState(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class AuthorizationStateWaitTdlibParameters(AuthorizationState):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class AuthorizationStateWaitPhoneNumber(AuthorizationState):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class AuthorizationStateWaitEmailAddress(AuthorizationState):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # True, if authorization through Apple ID is allowed.
+        self.allow_apple_id: bool = get_object(kwargs.get('allow_apple_id'))
+        # True, if authorization through Google ID is allowed.
+        self.allow_google_id: bool = get_object(kwargs.get('allow_google_id'))
+
+
+class AuthorizationStateWaitEmailCode(AuthorizationState):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # True, if authorization through Apple ID is allowed.
+        self.allow_apple_id: bool = get_object(kwargs.get('allow_apple_id'))
+        # True, if authorization through Google ID is allowed.
+        self.allow_google_id: bool = get_object(kwargs.get('allow_google_id'))
+        # Information about the sent authentication code.
+        self.code_info: EmailAddressAuthenticationCodeInfo = get_object(kwargs.get('code_info'))
+        # Reset state of the email address; may be null if the email address can't be reset.
+        self.email_address_reset_state: EmailAddressResetState = get_object(kwargs.get('email_address_reset_state'))
+
+
+class AuthorizationStateWaitCode(AuthorizationState):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Information about the authorization code that was sent.
+        self.code_info: AuthenticationCodeInfo = get_object(kwargs.get('code_info'))
+
+
+class AuthorizationStateWaitOtherDeviceConfirmation(AuthorizationState):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # A tg:// URL for the QR code. The link will be updated frequently.
+        self.link: str = get_object(kwargs.get('link'))
+
+
+class AuthorizationStateWaitRegistration(AuthorizationState):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Telegram terms of service.
+        self.terms_of_service: TermsOfService = get_object(kwargs.get('terms_of_service'))
+
+
+class AuthorizationStateWaitPassword(AuthorizationState):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Hint for the password; may be empty.
+        self.password_hint: str = get_object(kwargs.get('password_hint'))
+        # True, if a recovery email address has been set up.
+        self.has_recovery_email_address: bool = get_object(kwargs.get('has_recovery_email_address'))
+        # True, if some Telegram Passport elements were saved.
+        self.has_passport_data: bool = get_object(kwargs.get('has_passport_data'))
+        # Pattern of the email address to which the recovery email was sent; empty until a recovery email has been sent.
+        self.recovery_email_address_pattern: str = get_object(kwargs.get('recovery_email_address_pattern'))
+
+
+class AuthorizationStateReady(AuthorizationState):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class AuthorizationStateLoggingOut(AuthorizationState):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class AuthorizationStateClosing(AuthorizationState):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class AuthorizationStateClosed(AuthorizationState):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
@@ -0,0 +1,25 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class AutoDownloadSettings(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # True, if the auto-download is enabled.
+        self.is_auto_download_enabled: bool = get_object(kwargs.get('is_auto_download_enabled'))
+        # The maximum size of a photo file to be auto-downloaded, in bytes.
+        self.max_photo_file_size: int = get_object(kwargs.get('max_photo_file_size'))
+        # The maximum size of a video file to be auto-downloaded, in bytes.
+        self.max_video_file_size: int = get_object(kwargs.get('max_video_file_size'))
+        # The maximum size of other file types to be auto-downloaded, in bytes.
+        self.max_other_file_size: int = get_object(kwargs.get('max_other_file_size'))
+        # The maximum suggested bitrate for uploaded videos, in kbit/s.
+        self.video_upload_bitrate: int = get_object(kwargs.get('video_upload_bitrate'))
+        # True, if the beginning of video files needs to be preloaded for instant playback.
+        self.preload_large_videos: bool = get_object(kwargs.get('preload_large_videos'))
+        # True, if the next audio track needs to be preloaded while the user is listening to an audio file.
+        self.preload_next_audio: bool = get_object(kwargs.get('preload_next_audio'))
+        # True, if stories needs to be preloaded.
+        self.preload_stories: bool = get_object(kwargs.get('preload_stories'))
+        # True, if &quot;use less data for calls&quot; option needs to be enabled.
+        self.use_less_data_for_calls: bool = get_object(kwargs.get('use_less_data_for_calls'))
@@ -0,0 +1,13 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class AutoDownloadSettingsPresets(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Preset with lowest settings; supposed to be used by default when roaming.
+        self.low: AutoDownloadSettings = get_object(kwargs.get('low'))
+        # Preset with medium settings; supposed to be used by default when using mobile data.
+        self.medium: AutoDownloadSettings = get_object(kwargs.get('medium'))
+        # Preset with highest settings; supposed to be used by default when connected on Wi-Fi.
+        self.high: AutoDownloadSettings = get_object(kwargs.get('high'))
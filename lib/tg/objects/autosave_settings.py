@@ -0,0 +1,15 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class AutosaveSettings(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Default autosave settings for private chats.
+        self.private_chat_settings: ScopeAutosaveSettings = get_object(kwargs.get('private_chat_settings'))
+        # Default autosave settings for basic group and supergroup chats.
+        self.group_settings: ScopeAutosaveSettings = get_object(kwargs.get('group_settings'))
+        # Default autosave settings for channel chats.
+        self.channel_settings: ScopeAutosaveSettings = get_object(kwargs.get('channel_settings'))
+        # Autosave settings for specific chats.
+        self.exceptions: list[AutosaveSettingsException] = get_object(kwargs.get('exceptions'))
@@ -0,0 +1,11 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class AutosaveSettingsException(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Chat identifier.
+        self.chat_id: int = get_object(kwargs.get('chat_id'))
+        # Autosave settings for the chat.
+        self.settings: ScopeAutosaveSettings = get_object(kwargs.get('settings'))
@@ -0,0 +1,29 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class AutosaveSettingsScope(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class AutosaveSettingsScopePrivateChats(AutosaveSettingsScope):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class AutosaveSettingsScopeGroupChats(AutosaveSettingsScope):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class AutosaveSettingsScopeChannelChats(AutosaveSettingsScope):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class AutosaveSettingsScopeChat(AutosaveSettingsScope):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Chat identifier.
+        self.chat_id: int = get_object(kwargs.get('chat_id'))
@@ -0,0 +1,11 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class AvailableReaction(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Type of the reaction.
+        self.type: ReactionType = get_object(kwargs.get('type'))
+        # True, if Telegram Premium is needed to send the reaction.
+        self.needs_premium: bool = get_object(kwargs.get('needs_premium'))
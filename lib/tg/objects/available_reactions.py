@@ -0,0 +1,15 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class AvailableReactions(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # List of reactions to be shown at the top.
+        self.top_reactions: list[AvailableReaction] = get_object(kwargs.get('top_reactions'))
+        # List of recently used reactions.
+        self.recent_reactions: list[AvailableReaction] = get_object(kwargs.get('recent_reactions'))
+        # List of popular reactions.
+        self.popular_reactions: list[AvailableReaction] = get_object(kwargs.get('popular_reactions'))
+        # True, if any custom emoji reaction can be added by Telegram Premium subscribers.
+        self.allow_custom_emoji: bool = get_object(kwargs.get('allow_custom_emoji'))
@@ -0,0 +1,19 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class Background(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Unique background identifier.
+        self.id: int = get_object(kwargs.get('id'))
+        # True, if this is one of default backgrounds.
+        self.is_default: bool = get_object(kwargs.get('is_default'))
+        # True, if the background is dark and is recommended to be used with dark theme.
+        self.is_dark: bool = get_object(kwargs.get('is_dark'))
+        # Unique background name.
+        self.name: str = get_object(kwargs.get('name'))
+        # Document with the background; may be null. Null only for filled and chat theme backgrounds.
+        self.document: Document = get_object(kwargs.get('document'))
+        # Type of the background.
+        self.type: BackgroundType = get_object(kwargs.get('type'))
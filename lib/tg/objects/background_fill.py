@@ -0,0 +1,32 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class BackgroundFill(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class BackgroundFillSolid(BackgroundFill):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # A color of the background in the RGB24 format.
+        self.color: int = get_object(kwargs.get('color'))
+
+
+class BackgroundFillGradient(BackgroundFill):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # A top color of the background in the RGB24 format.
+        self.top_color: int = get_object(kwargs.get('top_color'))
+        # A bottom color of the background in the RGB24 format.
+        self.bottom_color: int = get_object(kwargs.get('bottom_color'))
+        # Clockwise rotation angle of the gradient, in degrees; 0-359. Must always be divisible by 45.
+        self.rotation_angle: int = get_object(kwargs.get('rotation_angle'))
+
+
+class BackgroundFillFreeformGradient(BackgroundFill):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # A list of 3 or 4 colors of the freeform gradients in the RGB24 format.
+        self.colors: list[int] = get_object(kwargs.get('colors'))
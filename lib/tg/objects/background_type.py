@@ -0,0 +1,43 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class BackgroundType(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class BackgroundTypeWallpaper(BackgroundType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # True, if the wallpaper must be downscaled to fit in 450x450 square and then box-blurred with radius 12.
+        self.is_blurred: bool = get_object(kwargs.get('is_blurred'))
+        # True, if the background needs to be slightly moved when device is tilted.
+        self.is_moving: bool = get_object(kwargs.get('is_moving'))
+
+
+class BackgroundTypePattern(BackgroundType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Fill of the background.
+        self.fill: BackgroundFill = get_object(kwargs.get('fill'))
+        # Intensity of the pattern when it is shown above the filled background; 0-100.
+        self.intensity: int = get_object(kwargs.get('intensity'))
+        # True, if the background fill must be applied only to the pattern itself. All other pixels are black in this case. For dark themes only.
+        self.is_inverted: bool = get_object(kwargs.get('is_inverted'))
+        # True, if the background needs to be slightly moved when device is tilted.
+        self.is_moving: bool = get_object(kwargs.get('is_moving'))
+
+
+class BackgroundTypeFill(BackgroundType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The background fill.
+        self.fill: BackgroundFill = get_object(kwargs.get('fill'))
+
+
+class BackgroundTypeChatTheme(BackgroundType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Name of the chat theme.
+        self.theme_name: str = get_object(kwargs.get('theme_name'))
@@ -0,0 +1,11 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class BankCardActionOpenUrl(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Action text.
+        self.text: str = get_object(kwargs.get('text'))
+        # The URL to be opened.
+        self.url: str = get_object(kwargs.get('url'))
@@ -0,0 +1,11 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class BankCardInfo(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Title of the bank card description.
+        self.title: str = get_object(kwargs.get('title'))
+        # Actions that can be done with the bank card number.
+        self.actions: list[BankCardActionOpenUrl] = get_object(kwargs.get('actions'))
@@ -0,0 +1,17 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class BasicGroup(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Group identifier.
+        self.id: int = get_object(kwargs.get('id'))
+        # Number of members in the group.
+        self.member_count: int = get_object(kwargs.get('member_count'))
+        # Status of the current user in the group.
+        self.status: ChatMemberStatus = get_object(kwargs.get('status'))
+        # True, if the group is active.
+        self.is_active: bool = get_object(kwargs.get('is_active'))
+        # Identifier of the supergroup to which this group was upgraded; 0 if none.
+        self.upgraded_to_supergroup_id: int = get_object(kwargs.get('upgraded_to_supergroup_id'))
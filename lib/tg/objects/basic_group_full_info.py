@@ -0,0 +1,23 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class BasicGroupFullInfo(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Chat photo; may be null if empty or unknown. If non-null, then it is the same photo as in chat.photo.
+        self.photo: ChatPhoto = get_object(kwargs.get('photo'))
+        # Group description. Updated only after the basic group is opened.
+        self.description: str = get_object(kwargs.get('description'))
+        # User identifier of the creator of the group; 0 if unknown.
+        self.creator_user_id: int = get_object(kwargs.get('creator_user_id'))
+        # Group members.
+        self.members: list[ChatMember] = get_object(kwargs.get('members'))
+        # True, if non-administrators and non-bots can be hidden in responses to getSupergroupMembers and searchChatMembers for non-administrators after upgrading the basic group to a supergroup.
+        self.can_hide_members: bool = get_object(kwargs.get('can_hide_members'))
+        # True, if aggressive anti-spam checks can be enabled or disabled in the supergroup after upgrading the basic group to a supergroup.
+        self.can_toggle_aggressive_anti_spam: bool = get_object(kwargs.get('can_toggle_aggressive_anti_spam'))
+        # Primary invite link for this group; may be null. For chat administrators with can_invite_users right only. Updated only after the basic group is opened.
+        self.invite_link: ChatInviteLink = get_object(kwargs.get('invite_link'))
+        # List of commands of bots in the group.
+        self.bot_commands: list[BotCommands] = get_object(kwargs.get('bot_commands'))
@@ -0,0 +1,17 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object
+
+
+class BlockList(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class BlockListMain(BlockList):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class BlockListStories(BlockList):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
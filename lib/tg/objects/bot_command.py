@@ -0,0 +1,11 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class BotCommand(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Text of the bot command.
+        self.command: str = get_object(kwargs.get('command'))
+        # Description of the bot command.
+        self.description: str = get_object(kwargs.get('description'))
@@ -0,0 +1,50 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class BotCommandScope(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class BotCommandScopeDefault(BotCommandScope):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class BotCommandScopeAllPrivateChats(BotCommandScope):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class BotCommandScopeAllGroupChats(BotCommandScope):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class BotCommandScopeAllChatAdministrators(BotCommandScope):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class BotCommandScopeChat(BotCommandScope):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Chat identifier.
+        self.chat_id: int = get_object(kwargs.get('chat_id'))
+
+
+class BotCommandScopeChatAdministrators(BotCommandScope):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Chat identifier.
+        self.chat_id: int = get_object(kwargs.get('chat_id'))
+
+
+class BotCommandScopeChatMember(BotCommandScope):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Chat identifier.
+        self.chat_id: int = get_object(kwargs.get('chat_id'))
+        # User identifier.
+        self.user_id: int = get_object(kwargs.get('user_id'))
@@ -0,0 +1,11 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class BotCommands(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Bot's user identifier.
+        self.bot_user_id: int = get_object(kwargs.get('bot_user_id'))
+        # List of bot commands.
+        self.commands: list[BotCommand] = get_object(kwargs.get('commands'))
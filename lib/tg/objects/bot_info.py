@@ -0,0 +1,31 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class BotInfo(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The text that is shown on the bot's profile page and is sent together with the link when users share the bot.
+        self.short_description: str = get_object(kwargs.get('short_description'))
+        # The text shown in the chat with the bot if the chat is empty.
+        self.description: str = get_object(kwargs.get('description'))
+        # Photo shown in the chat with the bot if the chat is empty; may be null.
+        self.photo: Photo = get_object(kwargs.get('photo'))
+        # Animation shown in the chat with the bot if the chat is empty; may be null.
+        self.animation: Animation = get_object(kwargs.get('animation'))
+        # Information about a button to show instead of the bot commands menu button; may be null if ordinary bot commands menu must be shown.
+        self.menu_button: BotMenuButton = get_object(kwargs.get('menu_button'))
+        # List of the bot commands.
+        self.commands: list[BotCommand] = get_object(kwargs.get('commands'))
+        # Default administrator rights for adding the bot to basic group and supergroup chats; may be null.
+        self.default_group_administrator_rights: ChatAdministratorRights = get_object(kwargs.get('default_group_administrator_rights'))
+        # Default administrator rights for adding the bot to channels; may be null.
+        self.default_channel_administrator_rights: ChatAdministratorRights = get_object(kwargs.get('default_channel_administrator_rights'))
+        # The internal link, which can be used to edit bot commands; may be null.
+        self.edit_commands_link: InternalLinkType = get_object(kwargs.get('edit_commands_link'))
+        # The internal link, which can be used to edit bot description; may be null.
+        self.edit_description_link: InternalLinkType = get_object(kwargs.get('edit_description_link'))
+        # The internal link, which can be used to edit the photo or animation shown in the chat with the bot if the chat is empty; may be null.
+        self.edit_description_media_link: InternalLinkType = get_object(kwargs.get('edit_description_media_link'))
+        # The internal link, which can be used to edit bot settings; may be null.
+        self.edit_settings_link: InternalLinkType = get_object(kwargs.get('edit_settings_link'))
@@ -0,0 +1,11 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class BotMenuButton(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Text of the button.
+        self.text: str = get_object(kwargs.get('text'))
+        # URL to be passed to openWebApp.
+        self.url: str = get_object(kwargs.get('url'))
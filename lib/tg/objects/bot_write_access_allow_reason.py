@@ -0,0 +1,31 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class BotWriteAccessAllowReason(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class BotWriteAccessAllowReasonConnectedWebsite(BotWriteAccessAllowReason):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Domain name of the connected website.
+        self.domain_name: str = get_object(kwargs.get('domain_name'))
+
+
+class BotWriteAccessAllowReasonAddedToAttachmentMenu(BotWriteAccessAllowReason):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class BotWriteAccessAllowReasonLaunchedWebApp(BotWriteAccessAllowReason):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Information about the Web App.
+        self.web_app: WebApp = get_object(kwargs.get('web_app'))
+
+
+class BotWriteAccessAllowReasonAcceptedRequest(BotWriteAccessAllowReason):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
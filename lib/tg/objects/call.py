@@ -0,0 +1,17 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class Call(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Call identifier, not persistent.
+        self.id: int = get_object(kwargs.get('id'))
+        # User identifier of the other call participant.
+        self.user_id: int = get_object(kwargs.get('user_id'))
+        # True, if the call is outgoing.
+        self.is_outgoing: bool = get_object(kwargs.get('is_outgoing'))
+        # True, if the call is a video call.
+        self.is_video: bool = get_object(kwargs.get('is_video'))
+        # Call state.
+        self.state: CallState = get_object(kwargs.get('state'))
@@ -0,0 +1,32 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object
+
+
+class CallDiscardReason(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class CallDiscardReasonEmpty(CallDiscardReason):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class CallDiscardReasonMissed(CallDiscardReason):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class CallDiscardReasonDeclined(CallDiscardReason):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class CallDiscardReasonDisconnected(CallDiscardReason):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class CallDiscardReasonHungUp(CallDiscardReason):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
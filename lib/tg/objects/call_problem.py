@@ -0,0 +1,52 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object
+
+
+class CallProblem(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class CallProblemEcho(CallProblem):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class CallProblemNoise(CallProblem):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class CallProblemInterruptions(CallProblem):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class CallProblemDistortedSpeech(CallProblem):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class CallProblemSilentLocal(CallProblem):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class CallProblemSilentRemote(CallProblem):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class CallProblemDropped(CallProblem):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class CallProblemDistortedVideo(CallProblem):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class CallProblemPixelatedVideo(CallProblem):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
@@ -0,0 +1,17 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class CallProtocol(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # True, if UDP peer-to-peer connections are supported.
+        self.udp_p2p: bool = get_object(kwargs.get('udp_p2p'))
+        # True, if connection through UDP reflectors is supported.
+        self.udp_reflector: bool = get_object(kwargs.get('udp_reflector'))
+        # The minimum supported API layer; use 65.
+        self.min_layer: int = get_object(kwargs.get('min_layer'))
+        # The maximum supported API layer; use 92.
+        self.max_layer: int = get_object(kwargs.get('max_layer'))
+        # List of supported tgcalls versions.
+        self.library_versions: list[str] = get_object(kwargs.get('library_versions'))
@@ -0,0 +1,17 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class CallServer(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Server identifier.
+        self.id: int = get_object(kwargs.get('id'))
+        # Server IPv4 address.
+        self.ip_address: str = get_object(kwargs.get('ip_address'))
+        # Server IPv6 address.
+        self.ipv6_address: str = get_object(kwargs.get('ipv6_address'))
+        # Server port number.
+        self.port: int = get_object(kwargs.get('port'))
+        # Server type.
+        self.type: CallServerType = get_object(kwargs.get('type'))
@@ -0,0 +1,29 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class CallServerType(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class CallServerTypeTelegramReflector(CallServerType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # A peer tag to be used with the reflector.
+        self.peer_tag: bytes = get_object(kwargs.get('peer_tag'))
+        # True, if the server uses TCP instead of UDP.
+        self.is_tcp: bool = get_object(kwargs.get('is_tcp'))
+
+
+class CallServerTypeWebrtc(CallServerType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Username to be used for authentication.
+        self.username: str = get_object(kwargs.get('username'))
+        # Authentication password.
+        self.password: str = get_object(kwargs.get('password'))
+        # True, if the server supports TURN.
+        self.supports_turn: bool = get_object(kwargs.get('supports_turn'))
+        # True, if the server supports STUN.
+        self.supports_stun: bool = get_object(kwargs.get('supports_stun'))
@@ -0,0 +1,63 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class CallState(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class CallStatePending(CallState):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # True, if the call has already been created by the server.
+        self.is_created: bool = get_object(kwargs.get('is_created'))
+        # True, if the call has already been received by the other party.
+        self.is_received: bool = get_object(kwargs.get('is_received'))
+
+
+class CallStateExchangingKeys(CallState):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class CallStateReady(CallState):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Call protocols supported by the other call participant.
+        self.protocol: CallProtocol = get_object(kwargs.get('protocol'))
+        # List of available call servers.
+        self.servers: list[CallServer] = get_object(kwargs.get('servers'))
+        # A JSON-encoded call config.
+        self.config: str = get_object(kwargs.get('config'))
+        # Call encryption key.
+        self.encryption_key: bytes = get_object(kwargs.get('encryption_key'))
+        # Encryption key emojis fingerprint.
+        self.emojis: list[str] = get_object(kwargs.get('emojis'))
+        # True, if peer-to-peer connection is allowed by users privacy settings.
+        self.allow_p2p: bool = get_object(kwargs.get('allow_p2p'))
+
+
+class CallStateHangingUp(CallState):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class CallStateDiscarded(CallState):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The reason why the call has ended.
+        self.reason: CallDiscardReason = get_object(kwargs.get('reason'))
+        # True, if the call rating must be sent to the server.
+        self.need_rating: bool = get_object(kwargs.get('need_rating'))
+        # True, if the call debug information must be sent to the server.
+        self.need_debug_information: bool = get_object(kwargs.get('need_debug_information'))
+        # True, if the call log must be sent to the server.
+        self.need_log: bool = get_object(kwargs.get('need_log'))
+
+
+class CallStateError(CallState):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Error. An error with the code 4005000 will be returned if an outgoing call is missed because of an expired timeout.
+        self.error: Error = get_object(kwargs.get('error'))
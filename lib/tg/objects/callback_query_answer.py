@@ -0,0 +1,13 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class CallbackQueryAnswer(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Text of the answer.
+        self.text: str = get_object(kwargs.get('text'))
+        # True, if an alert must be shown to the user instead of a toast notification.
+        self.show_alert: bool = get_object(kwargs.get('show_alert'))
+        # URL to be opened.
+        self.url: str = get_object(kwargs.get('url'))
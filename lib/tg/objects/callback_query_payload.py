@@ -0,0 +1,30 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class CallbackQueryPayload(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class CallbackQueryPayloadData(CallbackQueryPayload):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Data that was attached to the callback button.
+        self.data: bytes = get_object(kwargs.get('data'))
+
+
+class CallbackQueryPayloadDataWithPassword(CallbackQueryPayload):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The 2-step verification password for the current user.
+        self.password: str = get_object(kwargs.get('password'))
+        # Data that was attached to the callback button.
+        self.data: bytes = get_object(kwargs.get('data'))
+
+
+class CallbackQueryPayloadGame(CallbackQueryPayload):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # A short name of the game that was attached to the callback button.
+        self.game_short_name: str = get_object(kwargs.get('game_short_name'))
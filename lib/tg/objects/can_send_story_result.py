@@ -0,0 +1,41 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class CanSendStoryResult(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class CanSendStoryResultOk(CanSendStoryResult):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class CanSendStoryResultPremiumNeeded(CanSendStoryResult):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class CanSendStoryResultBoostNeeded(CanSendStoryResult):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class CanSendStoryResultActiveStoryLimitExceeded(CanSendStoryResult):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class CanSendStoryResultWeeklyLimitExceeded(CanSendStoryResult):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Time left before the user can send the next story.
+        self.retry_after: int = get_object(kwargs.get('retry_after'))
+
+
+class CanSendStoryResultMonthlyLimitExceeded(CanSendStoryResult):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Time left before the user can send the next story.
+        self.retry_after: int = get_object(kwargs.get('retry_after'))
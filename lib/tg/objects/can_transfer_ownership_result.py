@@ -0,0 +1,31 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class CanTransferOwnershipResult(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class CanTransferOwnershipResultOk(CanTransferOwnershipResult):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class CanTransferOwnershipResultPasswordNeeded(CanTransferOwnershipResult):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class CanTransferOwnershipResultPasswordTooFresh(CanTransferOwnershipResult):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Time left before the session can be used to transfer ownership of a chat, in seconds.
+        self.retry_after: int = get_object(kwargs.get('retry_after'))
+
+
+class CanTransferOwnershipResultSessionTooFresh(CanTransferOwnershipResult):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Time left before the session can be used to transfer ownership of a chat, in seconds.
+        self.retry_after: int = get_object(kwargs.get('retry_after'))
@@ -0,0 +1,85 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class Chat(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Chat unique identifier.
+        self.id: int = get_object(kwargs.get('id'))
+        # Type of the chat.
+        self.type: ChatType = get_object(kwargs.get('type'))
+        # Chat title.
+        self.title: str = get_object(kwargs.get('title'))
+        # Chat photo; may be null.
+        self.photo: ChatPhotoInfo = get_object(kwargs.get('photo'))
+        # Identifier of the accent color for message sender name, and backgrounds of chat photo, reply header, and link preview.
+        self.accent_color_id: int = get_object(kwargs.get('accent_color_id'))
+        # Identifier of a custom emoji to be shown on the reply header and link preview background for messages sent by the chat; 0 if none.
+        self.background_custom_emoji_id: int = get_object(kwargs.get('background_custom_emoji_id'))
+        # Identifier of the profile accent color for the chat's profile; -1 if none.
+        self.profile_accent_color_id: int = get_object(kwargs.get('profile_accent_color_id'))
+        # Identifier of a custom emoji to be shown on the background of the chat's profile; 0 if none.
+        self.profile_background_custom_emoji_id: int = get_object(kwargs.get('profile_background_custom_emoji_id'))
+        # Actions that non-administrator chat members are allowed to take in the chat.
+        self.permissions: ChatPermissions = get_object(kwargs.get('permissions'))
+        # Last message in the chat; may be null if none or unknown.
+        self.last_message: Message = get_object(kwargs.get('last_message'))
+        # Positions of the chat in chat lists.
+        self.positions: list[ChatPosition] = get_object(kwargs.get('positions'))
+        # Identifier of a user or chat that is selected to send messages in the chat; may be null if the user can't change message sender.
+        self.message_sender_id: MessageSender = get_object(kwargs.get('message_sender_id'))
+        # Block list to which the chat is added; may be null if none.
+        self.block_list: BlockList = get_object(kwargs.get('block_list'))
+        # True, if chat content can't be saved locally, forwarded, or copied.
+        self.has_protected_content: bool = get_object(kwargs.get('has_protected_content'))
+        # True, if translation of all messages in the chat must be suggested to the user.
+        self.is_translatable: bool = get_object(kwargs.get('is_translatable'))
+        # True, if the chat is marked as unread.
+        self.is_marked_as_unread: bool = get_object(kwargs.get('is_marked_as_unread'))
+        # True, if the chat is a forum supergroup that must be shown in the &quot;View as topics&quot; mode.
+        self.view_as_topics: bool = get_object(kwargs.get('view_as_topics'))
+        # True, if the chat has scheduled messages.
+        self.has_scheduled_messages: bool = get_object(kwargs.get('has_scheduled_messages'))
+        # True, if the chat messages can be deleted only for the current user while other users will continue to see the messages.
+        self.can_be_deleted_only_for_self: bool = get_object(kwargs.get('can_be_deleted_only_for_self'))
+        # True, if the chat messages can be deleted for all users.
+        self.can_be_deleted_for_all_users: bool = get_object(kwargs.get('can_be_deleted_for_all_users'))
+        # True, if the chat can be reported to Telegram moderators through reportChat or reportChatPhoto.
+        self.can_be_reported: bool = get_object(kwargs.get('can_be_reported'))
+        # Default value of the disable_notification parameter, used when a message is sent to the chat.
+        self.default_disable_notification: bool = get_object(kwargs.get('default_disable_notification'))
+        # Number of unread messages in the chat.
+        self.unread_count: int = get_object(kwargs.get('unread_count'))
+        # Identifier of the last read incoming message.
+        self.last_read_inbox_message_id: int = get_object(kwargs.get('last_read_inbox_message_id'))
+        # Identifier of the last read outgoing message.
+        self.last_read_outbox_message_id: int = get_object(kwargs.get('last_read_outbox_message_id'))
+        # Number of unread messages with a mention/reply in the chat.
+        self.unread_mention_count: int = get_object(kwargs.get('unread_mention_count'))
+        # Number of messages with unread reactions in the chat.
+        self.unread_reaction_count: int = get_object(kwargs.get('unread_reaction_count'))
+        # Notification settings for the chat.
+        self.notification_settings: ChatNotificationSettings = get_object(kwargs.get('notification_settings'))
+        # Types of reaction, available in the chat.
+        self.available_reactions: ChatAvailableReactions = get_object(kwargs.get('available_reactions'))
+        # Current message auto-delete or self-destruct timer setting for the chat, in seconds; 0 if disabled. Self-destruct timer in secret chats starts after the message or its content is viewed. Auto-delete timer in other chats starts from the send date.
+        self.message_auto_delete_time: int = get_object(kwargs.get('message_auto_delete_time'))
+        # Emoji status to be shown along with chat title; may be null.
+        self.emoji_status: EmojiStatus = get_object(kwargs.get('emoji_status'))
+        # Background set for the chat; may be null if none.
+        self.background: ChatBackground = get_object(kwargs.get('background'))
+        # If non-empty, name of a theme, set for the chat.
+        self.theme_name: str = get_object(kwargs.get('theme_name'))
+        # Information about actions which must be possible to do through the chat action bar; may be null if none.
+        self.action_bar: ChatActionBar = get_object(kwargs.get('action_bar'))
+        # Information about video chat of the chat.
+        self.video_chat: VideoChat = get_object(kwargs.get('video_chat'))
+        # Information about pending join requests; may be null if none.
+        self.pending_join_requests: ChatJoinRequestsInfo = get_object(kwargs.get('pending_join_requests'))
+        # Identifier of the message from which reply markup needs to be used; 0 if there is no default custom reply markup in the chat.
+        self.reply_markup_message_id: int = get_object(kwargs.get('reply_markup_message_id'))
+        # A draft of a message in the chat; may be null if none.
+        self.draft_message: DraftMessage = get_object(kwargs.get('draft_message'))
+        # Application-specific data associated with the chat. (For example, the chat scroll position or local chat notification settings can be stored here.) Persistent if the message database is used.
+        self.client_data: str = get_object(kwargs.get('client_data'))
@@ -0,0 +1,94 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class ChatAction(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class ChatActionTyping(ChatAction):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class ChatActionRecordingVideo(ChatAction):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class ChatActionUploadingVideo(ChatAction):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Upload progress, as a percentage.
+        self.progress: int = get_object(kwargs.get('progress'))
+
+
+class ChatActionRecordingVoiceNote(ChatAction):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class ChatActionUploadingVoiceNote(ChatAction):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Upload progress, as a percentage.
+        self.progress: int = get_object(kwargs.get('progress'))
+
+
+class ChatActionUploadingPhoto(ChatAction):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Upload progress, as a percentage.
+        self.progress: int = get_object(kwargs.get('progress'))
+
+
+class ChatActionUploadingDocument(ChatAction):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Upload progress, as a percentage.
+        self.progress: int = get_object(kwargs.get('progress'))
+
+
+class ChatActionChoosingSticker(ChatAction):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class ChatActionChoosingLocation(ChatAction):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class ChatActionChoosingContact(ChatAction):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class ChatActionStartPlayingGame(ChatAction):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class ChatActionRecordingVideoNote(ChatAction):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class ChatActionUploadingVideoNote(ChatAction):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Upload progress, as a percentage.
+        self.progress: int = get_object(kwargs.get('progress'))
+
+
+class ChatActionWatchingAnimations(ChatAction):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The animated emoji.
+        self.emoji: str = get_object(kwargs.get('emoji'))
+
+
+class ChatActionCancel(ChatAction):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
@@ -0,0 +1,54 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class ChatActionBar(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class ChatActionBarReportSpam(ChatActionBar):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # If true, the chat was automatically archived and can be moved back to the main chat list using addChatToList simultaneously with setting chat notification settings to default using setChatNotificationSettings.
+        self.can_unarchive: bool = get_object(kwargs.get('can_unarchive'))
+
+
+class ChatActionBarReportUnrelatedLocation(ChatActionBar):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class ChatActionBarInviteMembers(ChatActionBar):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class ChatActionBarReportAddBlock(ChatActionBar):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # If true, the chat was automatically archived and can be moved back to the main chat list using addChatToList simultaneously with setting chat notification settings to default using setChatNotificationSettings.
+        self.can_unarchive: bool = get_object(kwargs.get('can_unarchive'))
+        # If non-negative, the current user was found by the other user through searchChatsNearby and this is the distance between the users.
+        self.distance: int = get_object(kwargs.get('distance'))
+
+
+class ChatActionBarAddContact(ChatActionBar):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class ChatActionBarSharePhoneNumber(ChatActionBar):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class ChatActionBarJoinRequest(ChatActionBar):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Title of the chat to which the join request was sent.
+        self.title: str = get_object(kwargs.get('title'))
+        # True, if the join request was sent to a channel chat.
+        self.is_channel: bool = get_object(kwargs.get('is_channel'))
+        # Point in time (Unix timestamp) when the join request was sent.
+        self.request_date: int = get_object(kwargs.get('request_date'))
@@ -0,0 +1,17 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class ChatActiveStories(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Identifier of the chat that posted the stories.
+        self.chat_id: int = get_object(kwargs.get('chat_id'))
+        # Identifier of the story list in which the stories are shown; may be null if the stories aren't shown in a story list.
+        self.list: StoryList = get_object(kwargs.get('list'))
+        # A parameter used to determine order of the stories in the story list; 0 if the stories doesn't need to be shown in the story list. Stories must be sorted by the pair (order, story_sender_chat_id) in descending order.
+        self.order: int = get_object(kwargs.get('order'))
+        # Identifier of the last read active story.
+        self.max_read_story_id: int = get_object(kwargs.get('max_read_story_id'))
+        # Basic information about the stories; use getStory to get full information about the stories. The stories are in a chronological order (i.e., in order of increasing story identifiers).
+        self.stories: list[StoryInfo] = get_object(kwargs.get('stories'))
@@ -0,0 +1,13 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class ChatAdministrator(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # User identifier of the administrator.
+        self.user_id: int = get_object(kwargs.get('user_id'))
+        # Custom title of the administrator.
+        self.custom_title: str = get_object(kwargs.get('custom_title'))
+        # True, if the user is the owner of the chat.
+        self.is_owner: bool = get_object(kwargs.get('is_owner'))
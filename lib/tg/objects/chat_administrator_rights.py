@@ -0,0 +1,37 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class ChatAdministratorRights(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # True, if the administrator can get chat event log, get chat boosts in channels, get channel members, report supergroup spam messages, see anonymous administrators in supergroups and ignore slow mode. Implied by any other privilege; applicable to supergroups and channels only.
+        self.can_manage_chat: bool = get_object(kwargs.get('can_manage_chat'))
+        # True, if the administrator can change the chat title, photo, and other settings.
+        self.can_change_info: bool = get_object(kwargs.get('can_change_info'))
+        # True, if the administrator can create channel posts or view channel statistics; applicable to channels only.
+        self.can_post_messages: bool = get_object(kwargs.get('can_post_messages'))
+        # True, if the administrator can edit messages of other users and pin messages; applicable to channels only.
+        self.can_edit_messages: bool = get_object(kwargs.get('can_edit_messages'))
+        # True, if the administrator can delete messages of other users.
+        self.can_delete_messages: bool = get_object(kwargs.get('can_delete_messages'))
+        # True, if the administrator can invite new users to the chat.
+        self.can_invite_users: bool = get_object(kwargs.get('can_invite_users'))
+        # True, if the administrator can restrict, ban, or unban chat members or view supergroup statistics; always true for channels.
+        self.can_restrict_members: bool = get_object(kwargs.get('can_restrict_members'))
+        # True, if the administrator can pin messages; applicable to basic groups and supergroups only.
+        self.can_pin_messages: bool = get_object(kwargs.get('can_pin_messages'))
+        # True, if the administrator can manage topics; applicable to forum supergroups only.
+        self.can_manage_topics: bool = get_object(kwargs.get('can_manage_topics'))
+        # True, if the administrator can add new administrators with a subset of their own privileges or demote administrators that were directly or indirectly promoted by them.
+        self.can_promote_members: bool = get_object(kwargs.get('can_promote_members'))
+        # True, if the administrator can manage video chats.
+        self.can_manage_video_chats: bool = get_object(kwargs.get('can_manage_video_chats'))
+        # True, if the administrator can create new channel stories, or edit and delete posted stories; applicable to channels only.
+        self.can_post_stories: bool = get_object(kwargs.get('can_post_stories'))
+        # True, if the administrator can edit stories posted by other users, pin stories and access story archive; applicable to channels only.
+        self.can_edit_stories: bool = get_object(kwargs.get('can_edit_stories'))
+        # True, if the administrator can delete stories posted by other users; applicable to channels only.
+        self.can_delete_stories: bool = get_object(kwargs.get('can_delete_stories'))
+        # True, if the administrator isn't shown in the chat member list and sends messages anonymously; applicable to supergroups only.
+        self.is_anonymous: bool = get_object(kwargs.get('is_anonymous'))
@@ -0,0 +1,9 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class ChatAdministrators(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # A list of chat administrators.
+        self.administrators: list[ChatAdministrator] = get_object(kwargs.get('administrators'))
@@ -0,0 +1,19 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class ChatAvailableReactions(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class ChatAvailableReactionsAll(ChatAvailableReactions):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class ChatAvailableReactionsSome(ChatAvailableReactions):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The list of reactions.
+        self.reactions: list[ReactionType] = get_object(kwargs.get('reactions'))
@@ -0,0 +1,11 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class ChatBackground(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The background.
+        self.background: Background = get_object(kwargs.get('background'))
+        # Dimming of the background in dark themes, as a percentage; 0-100. Applied only to Wallpaper and Fill types of background.
+        self.dark_theme_dimming: int = get_object(kwargs.get('dark_theme_dimming'))
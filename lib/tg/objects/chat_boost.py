@@ -0,0 +1,17 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class ChatBoost(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Unique identifier of the boost.
+        self.id: str = get_object(kwargs.get('id'))
+        # The number of identical boosts applied.
+        self.count: int = get_object(kwargs.get('count'))
+        # Source of the boost.
+        self.source: ChatBoostSource = get_object(kwargs.get('source'))
+        # Point in time (Unix timestamp) when the chat was boosted.
+        self.start_date: int = get_object(kwargs.get('start_date'))
+        # Point in time (Unix timestamp) when the boost will expire.
+        self.expiration_date: int = get_object(kwargs.get('expiration_date'))
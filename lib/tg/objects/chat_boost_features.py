@@ -0,0 +1,9 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class ChatBoostFeatures(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The list of features.
+        self.features: list[ChatBoostLevelFeatures] = get_object(kwargs.get('features'))
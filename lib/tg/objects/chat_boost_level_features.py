@@ -0,0 +1,29 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class ChatBoostLevelFeatures(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Target chat boost level.
+        self.level: int = get_object(kwargs.get('level'))
+        # Number of stories that the chat can publish daily.
+        self.story_per_day_count: int = get_object(kwargs.get('story_per_day_count'))
+        # Number of custom emoji reactions that can be added to the list of available reactions.
+        self.custom_emoji_reaction_count: int = get_object(kwargs.get('custom_emoji_reaction_count'))
+        # Number of custom colors for chat title.
+        self.title_color_count: int = get_object(kwargs.get('title_color_count'))
+        # Number of custom colors for profile photo background.
+        self.profile_accent_color_count: int = get_object(kwargs.get('profile_accent_color_count'))
+        # True, if custom emoji for profile background can be set.
+        self.can_set_profile_background_custom_emoji: bool = get_object(kwargs.get('can_set_profile_background_custom_emoji'))
+        # Number of custom colors for background of empty chat photo, replies to messages and link previews.
+        self.accent_color_count: int = get_object(kwargs.get('accent_color_count'))
+        # True, if custom emoji for reply header and link preview background can be set.
+        self.can_set_background_custom_emoji: bool = get_object(kwargs.get('can_set_background_custom_emoji'))
+        # True, if emoji status can be set.
+        self.can_set_emoji_status: bool = get_object(kwargs.get('can_set_emoji_status'))
+        # Number of chat theme backgrounds that can be set as chat background.
+        self.chat_theme_background_count: int = get_object(kwargs.get('chat_theme_background_count'))
+        # True, if custom background can be set in the chat for all users.
+        self.can_set_custom_background: bool = get_object(kwargs.get('can_set_custom_background'))
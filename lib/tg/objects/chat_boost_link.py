@@ -0,0 +1,11 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class ChatBoostLink(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The link.
+        self.link: str = get_object(kwargs.get('link'))
+        # True, if the link will work for non-members of the chat.
+        self.is_public: bool = get_object(kwargs.get('is_public'))
@@ -0,0 +1,11 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class ChatBoostLinkInfo(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # True, if the link will work for non-members of the chat.
+        self.is_public: bool = get_object(kwargs.get('is_public'))
+        # Identifier of the chat to which the link points; 0 if the chat isn't found.
+        self.chat_id: int = get_object(kwargs.get('chat_id'))
@@ -0,0 +1,17 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class ChatBoostSlot(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Unique identifier of the slot.
+        self.slot_id: int = get_object(kwargs.get('slot_id'))
+        # Identifier of the currently boosted chat; 0 if none.
+        self.currently_boosted_chat_id: int = get_object(kwargs.get('currently_boosted_chat_id'))
+        # Point in time (Unix timestamp) when the chat was boosted; 0 if none.
+        self.start_date: int = get_object(kwargs.get('start_date'))
+        # Point in time (Unix timestamp) when the boost will expire.
+        self.expiration_date: int = get_object(kwargs.get('expiration_date'))
+        # Point in time (Unix timestamp) after which the boost can be used for another chat.
+        self.cooldown_until_date: int = get_object(kwargs.get('cooldown_until_date'))
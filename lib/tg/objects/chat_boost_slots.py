@@ -0,0 +1,9 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class ChatBoostSlots(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # List of boost slots.
+        self.slots: list[ChatBoostSlot] = get_object(kwargs.get('slots'))
@@ -0,0 +1,36 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class ChatBoostSource(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class ChatBoostSourceGiftCode(ChatBoostSource):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Identifier of a user, for which the gift code was created.
+        self.user_id: int = get_object(kwargs.get('user_id'))
+        # The created Telegram Premium gift code, which is known only if this is a gift code for the current user, or it has already been claimed.
+        self.gift_code: str = get_object(kwargs.get('gift_code'))
+
+
+class ChatBoostSourceGiveaway(ChatBoostSource):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Identifier of a user that won in the giveaway; 0 if none.
+        self.user_id: int = get_object(kwargs.get('user_id'))
+        # The created Telegram Premium gift code if it was used by the user or can be claimed by the current user; an empty string otherwise.
+        self.gift_code: str = get_object(kwargs.get('gift_code'))
+        # Identifier of the corresponding giveaway message; can be an identifier of a deleted message.
+        self.giveaway_message_id: int = get_object(kwargs.get('giveaway_message_id'))
+        # True, if the winner for the corresponding Telegram Premium subscription wasn't chosen, because there were not enough participants.
+        self.is_unclaimed: bool = get_object(kwargs.get('is_unclaimed'))
+
+
+class ChatBoostSourcePremium(ChatBoostSource):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Identifier of the user.
+        self.user_id: int = get_object(kwargs.get('user_id'))
@@ -0,0 +1,27 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class ChatBoostStatus(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # An HTTP URL, which can be used to boost the chat.
+        self.boost_url: str = get_object(kwargs.get('boost_url'))
+        # Identifiers of boost slots of the current user applied to the chat.
+        self.applied_slot_ids: list[int] = get_object(kwargs.get('applied_slot_ids'))
+        # Current boost level of the chat.
+        self.level: int = get_object(kwargs.get('level'))
+        # The number of boosts received by the chat from created Telegram Premium gift codes and giveaways; always 0 if the current user isn't an administrator in the chat.
+        self.gift_code_boost_count: int = get_object(kwargs.get('gift_code_boost_count'))
+        # The number of boosts received by the chat.
+        self.boost_count: int = get_object(kwargs.get('boost_count'))
+        # The number of boosts added to reach the current level.
+        self.current_level_boost_count: int = get_object(kwargs.get('current_level_boost_count'))
+        # The number of boosts needed to reach the next level; 0 if the next level isn't available.
+        self.next_level_boost_count: int = get_object(kwargs.get('next_level_boost_count'))
+        # Approximate number of Telegram Premium subscribers joined the chat; always 0 if the current user isn't an administrator in the chat.
+        self.premium_member_count: int = get_object(kwargs.get('premium_member_count'))
+        # A percentage of Telegram Premium subscribers joined the chat; always 0 if the current user isn't an administrator in the chat.
+        self.premium_member_percentage: float = get_object(kwargs.get('premium_member_percentage'))
+        # The list of prepaid giveaways available for the chat; only for chat administrators.
+        self.prepaid_giveaways: list[PrepaidPremiumGiveaway] = get_object(kwargs.get('prepaid_giveaways'))
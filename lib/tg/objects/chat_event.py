@@ -0,0 +1,15 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class ChatEvent(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Chat event identifier.
+        self.id: int = get_object(kwargs.get('id'))
+        # Point in time (Unix timestamp) when the event happened.
+        self.date: int = get_object(kwargs.get('date'))
+        # Identifier of the user or chat who performed the action.
+        self.member_id: MessageSender = get_object(kwargs.get('member_id'))
+        # The action.
+        self.action: ChatEventAction = get_object(kwargs.get('action'))
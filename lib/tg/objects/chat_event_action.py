@@ -0,0 +1,407 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class ChatEventAction(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class ChatEventMessageEdited(ChatEventAction):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The original message before the edit.
+        self.old_message: Message = get_object(kwargs.get('old_message'))
+        # The message after it was edited.
+        self.new_message: Message = get_object(kwargs.get('new_message'))
+
+
+class ChatEventMessageDeleted(ChatEventAction):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Deleted message.
+        self.message: Message = get_object(kwargs.get('message'))
+        # True, if the message deletion can be reported via reportSupergroupAntiSpamFalsePositive.
+        self.can_report_anti_spam_false_positive: bool = get_object(kwargs.get('can_report_anti_spam_false_positive'))
+
+
+class ChatEventMessagePinned(ChatEventAction):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Pinned message.
+        self.message: Message = get_object(kwargs.get('message'))
+
+
+class ChatEventMessageUnpinned(ChatEventAction):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Unpinned message.
+        self.message: Message = get_object(kwargs.get('message'))
+
+
+class ChatEventPollStopped(ChatEventAction):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The message with the poll.
+        self.message: Message = get_object(kwargs.get('message'))
+
+
+class ChatEventMemberJoined(ChatEventAction):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class ChatEventMemberJoinedByInviteLink(ChatEventAction):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Invite link used to join the chat.
+        self.invite_link: ChatInviteLink = get_object(kwargs.get('invite_link'))
+        # True, if the user has joined the chat using an invite link for a chat folder.
+        self.via_chat_folder_invite_link: bool = get_object(kwargs.get('via_chat_folder_invite_link'))
+
+
+class ChatEventMemberJoinedByRequest(ChatEventAction):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # User identifier of the chat administrator, approved user join request.
+        self.approver_user_id: int = get_object(kwargs.get('approver_user_id'))
+        # Invite link used to join the chat; may be null.
+        self.invite_link: ChatInviteLink = get_object(kwargs.get('invite_link'))
+
+
+class ChatEventMemberInvited(ChatEventAction):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # New member user identifier.
+        self.user_id: int = get_object(kwargs.get('user_id'))
+        # New member status.
+        self.status: ChatMemberStatus = get_object(kwargs.get('status'))
+
+
+class ChatEventMemberLeft(ChatEventAction):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class ChatEventMemberPromoted(ChatEventAction):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Affected chat member user identifier.
+        self.user_id: int = get_object(kwargs.get('user_id'))
+        # Previous status of the chat member.
+        self.old_status: ChatMemberStatus = get_object(kwargs.get('old_status'))
+        # New status of the chat member.
+        self.new_status: ChatMemberStatus = get_object(kwargs.get('new_status'))
+
+
+class ChatEventMemberRestricted(ChatEventAction):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Affected chat member identifier.
+        self.member_id: MessageSender = get_object(kwargs.get('member_id'))
+        # Previous status of the chat member.
+        self.old_status: ChatMemberStatus = get_object(kwargs.get('old_status'))
+        # New status of the chat member.
+        self.new_status: ChatMemberStatus = get_object(kwargs.get('new_status'))
+
+
+class ChatEventAvailableReactionsChanged(ChatEventAction):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Previous chat available reactions.
+        self.old_available_reactions: ChatAvailableReactions = get_object(kwargs.get('old_available_reactions'))
+        # New chat available reactions.
+        self.new_available_reactions: ChatAvailableReactions = get_object(kwargs.get('new_available_reactions'))
+
+
+class ChatEventBackgroundChanged(ChatEventAction):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Previous background; may be null if none.
+        self.old_background: ChatBackground = get_object(kwargs.get('old_background'))
+        # New background; may be null if none.
+        self.new_background: ChatBackground = get_object(kwargs.get('new_background'))
+
+
+class ChatEventDescriptionChanged(ChatEventAction):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Previous chat description.
+        self.old_description: str = get_object(kwargs.get('old_description'))
+        # New chat description.
+        self.new_description: str = get_object(kwargs.get('new_description'))
+
+
+class ChatEventEmojiStatusChanged(ChatEventAction):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Previous emoji status; may be null if none.
+        self.old_emoji_status: EmojiStatus = get_object(kwargs.get('old_emoji_status'))
+        # New emoji status; may be null if none.
+        self.new_emoji_status: EmojiStatus = get_object(kwargs.get('new_emoji_status'))
+
+
+class ChatEventLinkedChatChanged(ChatEventAction):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Previous supergroup linked chat identifier.
+        self.old_linked_chat_id: int = get_object(kwargs.get('old_linked_chat_id'))
+        # New supergroup linked chat identifier.
+        self.new_linked_chat_id: int = get_object(kwargs.get('new_linked_chat_id'))
+
+
+class ChatEventLocationChanged(ChatEventAction):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Previous location; may be null.
+        self.old_location: ChatLocation = get_object(kwargs.get('old_location'))
+        # New location; may be null.
+        self.new_location: ChatLocation = get_object(kwargs.get('new_location'))
+
+
+class ChatEventMessageAutoDeleteTimeChanged(ChatEventAction):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Previous value of message_auto_delete_time.
+        self.old_message_auto_delete_time: int = get_object(kwargs.get('old_message_auto_delete_time'))
+        # New value of message_auto_delete_time.
+        self.new_message_auto_delete_time: int = get_object(kwargs.get('new_message_auto_delete_time'))
+
+
+class ChatEventPermissionsChanged(ChatEventAction):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Previous chat permissions.
+        self.old_permissions: ChatPermissions = get_object(kwargs.get('old_permissions'))
+        # New chat permissions.
+        self.new_permissions: ChatPermissions = get_object(kwargs.get('new_permissions'))
+
+
+class ChatEventPhotoChanged(ChatEventAction):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Previous chat photo value; may be null.
+        self.old_photo: ChatPhoto = get_object(kwargs.get('old_photo'))
+        # New chat photo value; may be null.
+        self.new_photo: ChatPhoto = get_object(kwargs.get('new_photo'))
+
+
+class ChatEventSlowModeDelayChanged(ChatEventAction):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Previous value of slow_mode_delay, in seconds.
+        self.old_slow_mode_delay: int = get_object(kwargs.get('old_slow_mode_delay'))
+        # New value of slow_mode_delay, in seconds.
+        self.new_slow_mode_delay: int = get_object(kwargs.get('new_slow_mode_delay'))
+
+
+class ChatEventStickerSetChanged(ChatEventAction):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Previous identifier of the chat sticker set; 0 if none.
+        self.old_sticker_set_id: int = get_object(kwargs.get('old_sticker_set_id'))
+        # New identifier of the chat sticker set; 0 if none.
+        self.new_sticker_set_id: int = get_object(kwargs.get('new_sticker_set_id'))
+
+
+class ChatEventTitleChanged(ChatEventAction):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Previous chat title.
+        self.old_title: str = get_object(kwargs.get('old_title'))
+        # New chat title.
+        self.new_title: str = get_object(kwargs.get('new_title'))
+
+
+class ChatEventUsernameChanged(ChatEventAction):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Previous chat username.
+        self.old_username: str = get_object(kwargs.get('old_username'))
+        # New chat username.
+        self.new_username: str = get_object(kwargs.get('new_username'))
+
+
+class ChatEventActiveUsernamesChanged(ChatEventAction):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Previous list of active usernames.
+        self.old_usernames: list[str] = get_object(kwargs.get('old_usernames'))
+        # New list of active usernames.
+        self.new_usernames: list[str] = get_object(kwargs.get('new_usernames'))
+
+
+class ChatEventAccentColorChanged(ChatEventAction):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Previous identifier of chat accent color.
+        self.old_accent_color_id: int = get_object(kwargs.get('old_accent_color_id'))
+        # Previous identifier of the custom emoji; 0 if none.
+        self.old_background_custom_emoji_id: int = get_object(kwargs.get('old_background_custom_emoji_id'))
+        # New identifier of chat accent color.
+        self.new_accent_color_id: int = get_object(kwargs.get('new_accent_color_id'))
+        # New identifier of the custom emoji; 0 if none.
+        self.new_background_custom_emoji_id: int = get_object(kwargs.get('new_background_custom_emoji_id'))
+
+
+class ChatEventProfileAccentColorChanged(ChatEventAction):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Previous identifier of chat's profile accent color; -1 if none.
+        self.old_profile_accent_color_id: int = get_object(kwargs.get('old_profile_accent_color_id'))
+        # Previous identifier of the custom emoji; 0 if none.
+        self.old_profile_background_custom_emoji_id: int = get_object(kwargs.get('old_profile_background_custom_emoji_id'))
+        # New identifier of chat's profile accent color; -1 if none.
+        self.new_profile_accent_color_id: int = get_object(kwargs.get('new_profile_accent_color_id'))
+        # New identifier of the custom emoji; 0 if none.
+        self.new_profile_background_custom_emoji_id: int = get_object(kwargs.get('new_profile_background_custom_emoji_id'))
+
+
+class ChatEventHasProtectedContentToggled(ChatEventAction):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # New value of has_protected_content.
+        self.has_protected_content: bool = get_object(kwargs.get('has_protected_content'))
+
+
+class ChatEventInvitesToggled(ChatEventAction):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # New value of can_invite_users permission.
+        self.can_invite_users: bool = get_object(kwargs.get('can_invite_users'))
+
+
+class ChatEventIsAllHistoryAvailableToggled(ChatEventAction):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # New value of is_all_history_available.
+        self.is_all_history_available: bool = get_object(kwargs.get('is_all_history_available'))
+
+
+class ChatEventHasAggressiveAntiSpamEnabledToggled(ChatEventAction):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # New value of has_aggressive_anti_spam_enabled.
+        self.has_aggressive_anti_spam_enabled: bool = get_object(kwargs.get('has_aggressive_anti_spam_enabled'))
+
+
+class ChatEventSignMessagesToggled(ChatEventAction):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # New value of sign_messages.
+        self.sign_messages: bool = get_object(kwargs.get('sign_messages'))
+
+
+class ChatEventInviteLinkEdited(ChatEventAction):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Previous information about the invite link.
+        self.old_invite_link: ChatInviteLink = get_object(kwargs.get('old_invite_link'))
+        # New information about the invite link.
+        self.new_invite_link: ChatInviteLink = get_object(kwargs.get('new_invite_link'))
+
+
+class ChatEventInviteLinkRevoked(ChatEventAction):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The invite link.
+        self.invite_link: ChatInviteLink = get_object(kwargs.get('invite_link'))
+
+
+class ChatEventInviteLinkDeleted(ChatEventAction):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The invite link.
+        self.invite_link: ChatInviteLink = get_object(kwargs.get('invite_link'))
+
+
+class ChatEventVideoChatCreated(ChatEventAction):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Identifier of the video chat. The video chat can be received through the method getGroupCall.
+        self.group_call_id: int = get_object(kwargs.get('group_call_id'))
+
+
+class ChatEventVideoChatEnded(ChatEventAction):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Identifier of the video chat. The video chat can be received through the method getGroupCall.
+        self.group_call_id: int = get_object(kwargs.get('group_call_id'))
+
+
+class ChatEventVideoChatMuteNewParticipantsToggled(ChatEventAction):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # New value of the mute_new_participants setting.
+        self.mute_new_participants: bool = get_object(kwargs.get('mute_new_participants'))
+
+
+class ChatEventVideoChatParticipantIsMutedToggled(ChatEventAction):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Identifier of the affected group call participant.
+        self.participant_id: MessageSender = get_object(kwargs.get('participant_id'))
+        # New value of is_muted.
+        self.is_muted: bool = get_object(kwargs.get('is_muted'))
+
+
+class ChatEventVideoChatParticipantVolumeLevelChanged(ChatEventAction):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Identifier of the affected group call participant.
+        self.participant_id: MessageSender = get_object(kwargs.get('participant_id'))
+        # New value of volume_level; 1-20000 in hundreds of percents.
+        self.volume_level: int = get_object(kwargs.get('volume_level'))
+
+
+class ChatEventIsForumToggled(ChatEventAction):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # New value of is_forum.
+        self.is_forum: bool = get_object(kwargs.get('is_forum'))
+
+
+class ChatEventForumTopicCreated(ChatEventAction):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Information about the topic.
+        self.topic_info: ForumTopicInfo = get_object(kwargs.get('topic_info'))
+
+
+class ChatEventForumTopicEdited(ChatEventAction):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Old information about the topic.
+        self.old_topic_info: ForumTopicInfo = get_object(kwargs.get('old_topic_info'))
+        # New information about the topic.
+        self.new_topic_info: ForumTopicInfo = get_object(kwargs.get('new_topic_info'))
+
+
+class ChatEventForumTopicToggleIsClosed(ChatEventAction):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # New information about the topic.
+        self.topic_info: ForumTopicInfo = get_object(kwargs.get('topic_info'))
+
+
+class ChatEventForumTopicToggleIsHidden(ChatEventAction):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # New information about the topic.
+        self.topic_info: ForumTopicInfo = get_object(kwargs.get('topic_info'))
+
+
+class ChatEventForumTopicDeleted(ChatEventAction):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Information about the topic.
+        self.topic_info: ForumTopicInfo = get_object(kwargs.get('topic_info'))
+
+
+class ChatEventForumTopicPinned(ChatEventAction):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Information about the old pinned topic; may be null.
+        self.old_topic_info: ForumTopicInfo = get_object(kwargs.get('old_topic_info'))
+        # Information about the new pinned topic; may be null.
+        self.new_topic_info: ForumTopicInfo = get_object(kwargs.get('new_topic_info'))
@@ -0,0 +1,33 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class ChatEventLogFilters(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # True, if message edits need to be returned.
+        self.message_edits: bool = get_object(kwargs.get('message_edits'))
+        # True, if message deletions need to be returned.
+        self.message_deletions: bool = get_object(kwargs.get('message_deletions'))
+        # True, if pin/unpin events need to be returned.
+        self.message_pins: bool = get_object(kwargs.get('message_pins'))
+        # True, if members joining events need to be returned.
+        self.member_joins: bool = get_object(kwargs.get('member_joins'))
+        # True, if members leaving events need to be returned.
+        self.member_leaves: bool = get_object(kwargs.get('member_leaves'))
+        # True, if invited member events need to be returned.
+        self.member_invites: bool = get_object(kwargs.get('member_invites'))
+        # True, if member promotion/demotion events need to be returned.
+        self.member_promotions: bool = get_object(kwargs.get('member_promotions'))
+        # True, if member restricted/unrestricted/banned/unbanned events need to be returned.
+        self.member_restrictions: bool = get_object(kwargs.get('member_restrictions'))
+        # True, if changes in chat information need to be returned.
+        self.info_changes: bool = get_object(kwargs.get('info_changes'))
+        # True, if changes in chat settings need to be returned.
+        self.setting_changes: bool = get_object(kwargs.get('setting_changes'))
+        # True, if changes to invite links need to be returned.
+        self.invite_link_changes: bool = get_object(kwargs.get('invite_link_changes'))
+        # True, if video chat actions need to be returned.
+        self.video_chat_changes: bool = get_object(kwargs.get('video_chat_changes'))
+        # True, if forum-related actions need to be returned.
+        self.forum_changes: bool = get_object(kwargs.get('forum_changes'))
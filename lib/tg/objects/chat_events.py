@@ -0,0 +1,9 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class ChatEvents(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # List of events.
+        self.events: list[ChatEvent] = get_object(kwargs.get('events'))
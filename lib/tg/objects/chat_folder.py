@@ -0,0 +1,35 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class ChatFolder(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The title of the folder; 1-12 characters without line feeds.
+        self.title: str = get_object(kwargs.get('title'))
+        # The chosen icon for the chat folder; may be null. If null, use getChatFolderDefaultIconName to get default icon name for the folder.
+        self.icon: ChatFolderIcon = get_object(kwargs.get('icon'))
+        # True, if at least one link has been created for the folder.
+        self.is_shareable: bool = get_object(kwargs.get('is_shareable'))
+        # The chat identifiers of pinned chats in the folder. There can be up to getOption(&quot;chat_folder_chosen_chat_count_max&quot;) pinned and always included non-secret chats and the same number of secret chats, but the limit can be increased with Telegram Premium.
+        self.pinned_chat_ids: list[int] = get_object(kwargs.get('pinned_chat_ids'))
+        # The chat identifiers of always included chats in the folder. There can be up to getOption(&quot;chat_folder_chosen_chat_count_max&quot;) pinned and always included non-secret chats and the same number of secret chats, but the limit can be increased with Telegram Premium.
+        self.included_chat_ids: list[int] = get_object(kwargs.get('included_chat_ids'))
+        # The chat identifiers of always excluded chats in the folder. There can be up to getOption(&quot;chat_folder_chosen_chat_count_max&quot;) always excluded non-secret chats and the same number of secret chats, but the limit can be increased with Telegram Premium.
+        self.excluded_chat_ids: list[int] = get_object(kwargs.get('excluded_chat_ids'))
+        # True, if muted chats need to be excluded.
+        self.exclude_muted: bool = get_object(kwargs.get('exclude_muted'))
+        # True, if read chats need to be excluded.
+        self.exclude_read: bool = get_object(kwargs.get('exclude_read'))
+        # True, if archived chats need to be excluded.
+        self.exclude_archived: bool = get_object(kwargs.get('exclude_archived'))
+        # True, if contacts need to be included.
+        self.include_contacts: bool = get_object(kwargs.get('include_contacts'))
+        # True, if non-contact users need to be included.
+        self.include_non_contacts: bool = get_object(kwargs.get('include_non_contacts'))
+        # True, if bots need to be included.
+        self.include_bots: bool = get_object(kwargs.get('include_bots'))
+        # True, if basic groups and supergroups need to be included.
+        self.include_groups: bool = get_object(kwargs.get('include_groups'))
+        # True, if channels need to be included.
+        self.include_channels: bool = get_object(kwargs.get('include_channels'))
@@ -0,0 +1,17 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class ChatFolderInfo(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Unique chat folder identifier.
+        self.id: int = get_object(kwargs.get('id'))
+        # The title of the folder; 1-12 characters without line feeds.
+        self.title: str = get_object(kwargs.get('title'))
+        # The chosen or default icon for the chat folder.
+        self.icon: ChatFolderIcon = get_object(kwargs.get('icon'))
+        # True, if at least one link has been created for the folder.
+        self.is_shareable: bool = get_object(kwargs.get('is_shareable'))
+        # True, if the chat folder has invite links created by the current user.
+        self.has_my_invite_links: bool = get_object(kwargs.get('has_my_invite_links'))
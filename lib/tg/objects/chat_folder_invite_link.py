@@ -0,0 +1,13 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class ChatFolderInviteLink(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The chat folder invite link.
+        self.invite_link: str = get_object(kwargs.get('invite_link'))
+        # Name of the link.
+        self.name: str = get_object(kwargs.get('name'))
+        # Identifiers of chats, included in the link.
+        self.chat_ids: list[int] = get_object(kwargs.get('chat_ids'))
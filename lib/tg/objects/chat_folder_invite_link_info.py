@@ -0,0 +1,13 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class ChatFolderInviteLinkInfo(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Basic information about the chat folder; chat folder identifier will be 0 if the user didn't have the chat folder yet.
+        self.chat_folder_info: ChatFolderInfo = get_object(kwargs.get('chat_folder_info'))
+        # Identifiers of the chats from the link, which aren't added to the folder yet.
+        self.missing_chat_ids: list[int] = get_object(kwargs.get('missing_chat_ids'))
+        # Identifiers of the chats from the link, which are added to the folder already.
+        self.added_chat_ids: list[int] = get_object(kwargs.get('added_chat_ids'))
@@ -0,0 +1,9 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class ChatFolderInviteLinks(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # List of the invite links.
+        self.invite_links: list[ChatFolderInviteLink] = get_object(kwargs.get('invite_links'))
@@ -0,0 +1,31 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class ChatInviteLink(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Chat invite link.
+        self.invite_link: str = get_object(kwargs.get('invite_link'))
+        # Name of the link.
+        self.name: str = get_object(kwargs.get('name'))
+        # User identifier of an administrator created the link.
+        self.creator_user_id: int = get_object(kwargs.get('creator_user_id'))
+        # Point in time (Unix timestamp) when the link was created.
+        self.date: int = get_object(kwargs.get('date'))
+        # Point in time (Unix timestamp) when the link was last edited; 0 if never or unknown.
+        self.edit_date: int = get_object(kwargs.get('edit_date'))
+        # Point in time (Unix timestamp) when the link will expire; 0 if never.
+        self.expiration_date: int = get_object(kwargs.get('expiration_date'))
+        # The maximum number of members, which can join the chat using the link simultaneously; 0 if not limited. Always 0 if the link requires approval.
+        self.member_limit: int = get_object(kwargs.get('member_limit'))
+        # Number of chat members, which joined the chat using the link.
+        self.member_count: int = get_object(kwargs.get('member_count'))
+        # Number of pending join requests created using this link.
+        self.pending_join_request_count: int = get_object(kwargs.get('pending_join_request_count'))
+        # True, if the link only creates join request. If true, total number of joining members will be unlimited.
+        self.creates_join_request: bool = get_object(kwargs.get('creates_join_request'))
+        # True, if the link is primary. Primary invite link can't have name, expiration date, or usage limit. There is exactly one primary invite link for each administrator with can_invite_users right at a given time.
+        self.is_primary: bool = get_object(kwargs.get('is_primary'))
+        # True, if the link was revoked.
+        self.is_revoked: bool = get_object(kwargs.get('is_revoked'))
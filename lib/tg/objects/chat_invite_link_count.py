@@ -0,0 +1,13 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class ChatInviteLinkCount(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Administrator's user identifier.
+        self.user_id: int = get_object(kwargs.get('user_id'))
+        # Number of active invite links.
+        self.invite_link_count: int = get_object(kwargs.get('invite_link_count'))
+        # Number of revoked invite links.
+        self.revoked_invite_link_count: int = get_object(kwargs.get('revoked_invite_link_count'))
@@ -0,0 +1,9 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class ChatInviteLinkCounts(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # List of invite link counts.
+        self.invite_link_counts: list[ChatInviteLinkCount] = get_object(kwargs.get('invite_link_counts'))
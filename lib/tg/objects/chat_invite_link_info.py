@@ -0,0 +1,35 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class ChatInviteLinkInfo(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Chat identifier of the invite link; 0 if the user has no access to the chat before joining.
+        self.chat_id: int = get_object(kwargs.get('chat_id'))
+        # If non-zero, the amount of time for which read access to the chat will remain available, in seconds.
+        self.accessible_for: int = get_object(kwargs.get('accessible_for'))
+        # Type of the chat.
+        self.type: InviteLinkChatType = get_object(kwargs.get('type'))
+        # Title of the chat.
+        self.title: str = get_object(kwargs.get('title'))
+        # Chat photo; may be null.
+        self.photo: ChatPhotoInfo = get_object(kwargs.get('photo'))
+        # Identifier of the accent color for chat title and background of chat photo.
+        self.accent_color_id: int = get_object(kwargs.get('accent_color_id'))
+        # Chat description.
+        self.description: str = get_object(kwargs.get('description'))
+        # Number of members in the chat.
+        self.member_count: int = get_object(kwargs.get('member_count'))
+        # User identifiers of some chat members that may be known to the current user.
+        self.member_user_ids: list[int] = get_object(kwargs.get('member_user_ids'))
+        # True, if the link only creates join request.
+        self.creates_join_request: bool = get_object(kwargs.get('creates_join_request'))
+        # True, if the chat is a public supergroup or channel, i.e. it has a username or it is a location-based supergroup.
+        self.is_public: bool = get_object(kwargs.get('is_public'))
+        # True, if the chat is verified.
+        self.is_verified: bool = get_object(kwargs.get('is_verified'))
+        # True, if many users reported this chat as a scam.
+        self.is_scam: bool = get_object(kwargs.get('is_scam'))
+        # True, if many users reported this chat as a fake account.
+        self.is_fake: bool = get_object(kwargs.get('is_fake'))
@@ -0,0 +1,15 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class ChatInviteLinkMember(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # User identifier.
+        self.user_id: int = get_object(kwargs.get('user_id'))
+        # Point in time (Unix timestamp) when the user joined the chat.
+        self.joined_chat_date: int = get_object(kwargs.get('joined_chat_date'))
+        # True, if the user has joined the chat using an invite link for a chat folder.
+        self.via_chat_folder_invite_link: bool = get_object(kwargs.get('via_chat_folder_invite_link'))
+        # User identifier of the chat administrator, approved user join request.
+        self.approver_user_id: int = get_object(kwargs.get('approver_user_id'))
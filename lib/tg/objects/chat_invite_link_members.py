@@ -0,0 +1,11 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class ChatInviteLinkMembers(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Approximate total number of chat members found.
+        self.total_count: int = get_object(kwargs.get('total_count'))
+        # List of chat members, joined a chat via an invite link.
+        self.members: list[ChatInviteLinkMember] = get_object(kwargs.get('members'))
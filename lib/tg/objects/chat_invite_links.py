@@ -0,0 +1,11 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class ChatInviteLinks(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Approximate total number of chat invite links found.
+        self.total_count: int = get_object(kwargs.get('total_count'))
+        # List of invite links.
+        self.invite_links: list[ChatInviteLink] = get_object(kwargs.get('invite_links'))
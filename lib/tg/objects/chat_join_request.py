@@ -0,0 +1,13 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class ChatJoinRequest(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # User identifier.
+        self.user_id: int = get_object(kwargs.get('user_id'))
+        # Point in time (Unix timestamp) when the user sent the join request.
+        self.date: int = get_object(kwargs.get('date'))
+        # A short bio of the user.
+        self.bio: str = get_object(kwargs.get('bio'))
@@ -0,0 +1,11 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class ChatJoinRequestsInfo(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Total number of pending join requests.
+        self.total_count: int = get_object(kwargs.get('total_count'))
+        # Identifiers of at most 3 users sent the newest pending join requests.
+        self.user_ids: list[int] = get_object(kwargs.get('user_ids'))
@@ -0,0 +1,24 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class ChatList(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class ChatListMain(ChatList):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class ChatListArchive(ChatList):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class ChatListFolder(ChatList):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Chat folder identifier.
+        self.chat_folder_id: int = get_object(kwargs.get('chat_folder_id'))
@@ -0,0 +1,9 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class ChatLists(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # List of chat lists.
+        self.chat_lists: list[ChatList] = get_object(kwargs.get('chat_lists'))
@@ -0,0 +1,11 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class ChatLocation(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The location.
+        self.location: Location = get_object(kwargs.get('location'))
+        # Location address; 1-64 characters, as defined by the chat owner.
+        self.address: str = get_object(kwargs.get('address'))
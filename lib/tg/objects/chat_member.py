@@ -0,0 +1,15 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class ChatMember(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Identifier of the chat member. Currently, other chats can be only Left or Banned. Only supergroups and channels can have other chats as Left or Banned members and these chats must be supergroups or channels.
+        self.member_id: MessageSender = get_object(kwargs.get('member_id'))
+        # Identifier of a user that invited/promoted/banned this member in the chat; 0 if unknown.
+        self.inviter_user_id: int = get_object(kwargs.get('inviter_user_id'))
+        # Point in time (Unix timestamp) when the user joined/was promoted/was banned in the chat.
+        self.joined_chat_date: int = get_object(kwargs.get('joined_chat_date'))
+        # Status of the member in the chat.
+        self.status: ChatMemberStatus = get_object(kwargs.get('status'))
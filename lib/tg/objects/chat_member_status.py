@@ -0,0 +1,57 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class ChatMemberStatus(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class ChatMemberStatusCreator(ChatMemberStatus):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # A custom title of the owner; 0-16 characters without emojis; applicable to supergroups only.
+        self.custom_title: str = get_object(kwargs.get('custom_title'))
+        # True, if the creator isn't shown in the chat member list and sends messages anonymously; applicable to supergroups only.
+        self.is_anonymous: bool = get_object(kwargs.get('is_anonymous'))
+        # True, if the user is a member of the chat.
+        self.is_member: bool = get_object(kwargs.get('is_member'))
+
+
+class ChatMemberStatusAdministrator(ChatMemberStatus):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # A custom title of the administrator; 0-16 characters without emojis; applicable to supergroups only.
+        self.custom_title: str = get_object(kwargs.get('custom_title'))
+        # True, if the current user can edit the administrator privileges for the called user.
+        self.can_be_edited: bool = get_object(kwargs.get('can_be_edited'))
+        # Rights of the administrator.
+        self.rights: ChatAdministratorRights = get_object(kwargs.get('rights'))
+
+
+class ChatMemberStatusMember(ChatMemberStatus):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class ChatMemberStatusRestricted(ChatMemberStatus):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # True, if the user is a member of the chat.
+        self.is_member: bool = get_object(kwargs.get('is_member'))
+        # Point in time (Unix timestamp) when restrictions will be lifted from the user; 0 if never. If the user is restricted for more than 366 days or for less than 30 seconds from the current time, the user is considered to be restricted forever.
+        self.restricted_until_date: int = get_object(kwargs.get('restricted_until_date'))
+        # User permissions in the chat.
+        self.permissions: ChatPermissions = get_object(kwargs.get('permissions'))
+
+
+class ChatMemberStatusLeft(ChatMemberStatus):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class ChatMemberStatusBanned(ChatMemberStatus):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Point in time (Unix timestamp) when the user will be unbanned; 0 if never. If the user is banned for more than 366 days or for less than 30 seconds from the current time, the user is considered to be banned forever. Always 0 in basic groups.
+        self.banned_until_date: int = get_object(kwargs.get('banned_until_date'))
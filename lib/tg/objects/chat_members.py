@@ -0,0 +1,11 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class ChatMembers(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Approximate total number of chat members found.
+        self.total_count: int = get_object(kwargs.get('total_count'))
+        # A list of chat members.
+        self.members: list[ChatMember] = get_object(kwargs.get('members'))
@@ -0,0 +1,44 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class ChatMembersFilter(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class ChatMembersFilterContacts(ChatMembersFilter):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class ChatMembersFilterAdministrators(ChatMembersFilter):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class ChatMembersFilterMembers(ChatMembersFilter):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class ChatMembersFilterMention(ChatMembersFilter):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # If non-zero, the identifier of the current message thread.
+        self.message_thread_id: int = get_object(kwargs.get('message_thread_id'))
+
+
+class ChatMembersFilterRestricted(ChatMembersFilter):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class ChatMembersFilterBanned(ChatMembersFilter):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class ChatMembersFilterBots(ChatMembersFilter):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
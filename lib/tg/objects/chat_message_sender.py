@@ -0,0 +1,11 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class ChatMessageSender(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The message sender.
+        self.sender: MessageSender = get_object(kwargs.get('sender'))
+        # True, if Telegram Premium is needed to use the message sender.
+        self.needs_premium: bool = get_object(kwargs.get('needs_premium'))
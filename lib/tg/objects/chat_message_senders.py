@@ -0,0 +1,9 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class ChatMessageSenders(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # List of available message senders.
+        self.senders: list[ChatMessageSender] = get_object(kwargs.get('senders'))
@@ -0,0 +1,11 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class ChatNearby(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Chat identifier.
+        self.chat_id: int = get_object(kwargs.get('chat_id'))
+        # Distance to the chat location, in meters.
+        self.distance: int = get_object(kwargs.get('distance'))
@@ -0,0 +1,39 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class ChatNotificationSettings(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # If true, the value for the relevant type of chat or the forum chat is used instead of mute_for.
+        self.use_default_mute_for: bool = get_object(kwargs.get('use_default_mute_for'))
+        # Time left before notifications will be unmuted, in seconds.
+        self.mute_for: int = get_object(kwargs.get('mute_for'))
+        # If true, the value for the relevant type of chat or the forum chat is used instead of sound_id.
+        self.use_default_sound: bool = get_object(kwargs.get('use_default_sound'))
+        # Identifier of the notification sound to be played for messages; 0 if sound is disabled.
+        self.sound_id: int = get_object(kwargs.get('sound_id'))
+        # If true, the value for the relevant type of chat or the forum chat is used instead of show_preview.
+        self.use_default_show_preview: bool = get_object(kwargs.get('use_default_show_preview'))
+        # True, if message content must be displayed in notifications.
+        self.show_preview: bool = get_object(kwargs.get('show_preview'))
+        # If true, the value for the relevant type of chat is used instead of mute_stories.
+        self.use_default_mute_stories: bool = get_object(kwargs.get('use_default_mute_stories'))
+        # True, if story notifications are disabled for the chat.
+        self.mute_stories: bool = get_object(kwargs.get('mute_stories'))
+        # If true, the value for the relevant type of chat is used instead of story_sound_id.
+        self.use_default_story_sound: bool = get_object(kwargs.get('use_default_story_sound'))
+        # Identifier of the notification sound to be played for stories; 0 if sound is disabled.
+        self.story_sound_id: int = get_object(kwargs.get('story_sound_id'))
+        # If true, the value for the relevant type of chat is used instead of show_story_sender.
+        self.use_default_show_story_sender: bool = get_object(kwargs.get('use_default_show_story_sender'))
+        # True, if the sender of stories must be displayed in notifications.
+        self.show_story_sender: bool = get_object(kwargs.get('show_story_sender'))
+        # If true, the value for the relevant type of chat or the forum chat is used instead of disable_pinned_message_notifications.
+        self.use_default_disable_pinned_message_notifications: bool = get_object(kwargs.get('use_default_disable_pinned_message_notifications'))
+        # If true, notifications for incoming pinned messages will be created as for an ordinary unread message.
+        self.disable_pinned_message_notifications: bool = get_object(kwargs.get('disable_pinned_message_notifications'))
+        # If true, the value for the relevant type of chat or the forum chat is used instead of disable_mention_notifications.
+        self.use_default_disable_mention_notifications: bool = get_object(kwargs.get('use_default_disable_mention_notifications'))
+        # If true, notifications for messages with mentions will be created as for an ordinary unread message.
+        self.disable_mention_notifications: bool = get_object(kwargs.get('disable_mention_notifications'))
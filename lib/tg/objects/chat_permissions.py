@@ -0,0 +1,35 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class ChatPermissions(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # True, if the user can send text messages, contacts, giveaways, giveaway winners, invoices, locations, and venues.
+        self.can_send_basic_messages: bool = get_object(kwargs.get('can_send_basic_messages'))
+        # True, if the user can send music files.
+        self.can_send_audios: bool = get_object(kwargs.get('can_send_audios'))
+        # True, if the user can send documents.
+        self.can_send_documents: bool = get_object(kwargs.get('can_send_documents'))
+        # True, if the user can send photos.
+        self.can_send_photos: bool = get_object(kwargs.get('can_send_photos'))
+        # True, if the user can send videos.
+        self.can_send_videos: bool = get_object(kwargs.get('can_send_videos'))
+        # True, if the user can send video notes.
+        self.can_send_video_notes: bool = get_object(kwargs.get('can_send_video_notes'))
+        # True, if the user can send voice notes.
+        self.can_send_voice_notes: bool = get_object(kwargs.get('can_send_voice_notes'))
+        # True, if the user can send polls.
+        self.can_send_polls: bool = get_object(kwargs.get('can_send_polls'))
+        # True, if the user can send animations, games, stickers, and dice and use inline bots.
+        self.can_send_other_messages: bool = get_object(kwargs.get('can_send_other_messages'))
+        # True, if the user may add a web page preview to their messages.
+        self.can_add_web_page_previews: bool = get_object(kwargs.get('can_add_web_page_previews'))
+        # True, if the user can change the chat title, photo, and other settings.
+        self.can_change_info: bool = get_object(kwargs.get('can_change_info'))
+        # True, if the user can invite new users to the chat.
+        self.can_invite_users: bool = get_object(kwargs.get('can_invite_users'))
+        # True, if the user can pin messages.
+        self.can_pin_messages: bool = get_object(kwargs.get('can_pin_messages'))
+        # True, if the user can manage topics.
+        self.can_manage_topics: bool = get_object(kwargs.get('can_manage_topics'))
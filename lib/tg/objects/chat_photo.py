@@ -0,0 +1,21 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class ChatPhoto(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Unique photo identifier.
+        self.id: int = get_object(kwargs.get('id'))
+        # Point in time (Unix timestamp) when the photo has been added.
+        self.added_date: int = get_object(kwargs.get('added_date'))
+        # Photo minithumbnail; may be null.
+        self.minithumbnail: Minithumbnail = get_object(kwargs.get('minithumbnail'))
+        # Available variants of the photo in JPEG format, in different size.
+        self.sizes: list[PhotoSize] = get_object(kwargs.get('sizes'))
+        # A big (up to 1280x1280) animated variant of the photo in MPEG4 format; may be null.
+        self.animation: AnimatedChatPhoto = get_object(kwargs.get('animation'))
+        # A small (160x160) animated variant of the photo in MPEG4 format; may be null even the big animation is available.
+        self.small_animation: AnimatedChatPhoto = get_object(kwargs.get('small_animation'))
+        # Sticker-based version of the chat photo; may be null.
+        self.sticker: ChatPhotoSticker = get_object(kwargs.get('sticker'))
@@ -0,0 +1,17 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class ChatPhotoInfo(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # A small (160x160) chat photo variant in JPEG format. The file can be downloaded only before the photo is changed.
+        self.small: File = get_object(kwargs.get('small'))
+        # A big (640x640) chat photo variant in JPEG format. The file can be downloaded only before the photo is changed.
+        self.big: File = get_object(kwargs.get('big'))
+        # Chat photo minithumbnail; may be null.
+        self.minithumbnail: Minithumbnail = get_object(kwargs.get('minithumbnail'))
+        # True, if the photo has animated variant.
+        self.has_animation: bool = get_object(kwargs.get('has_animation'))
+        # True, if the photo is visible only for the current user.
+        self.is_personal: bool = get_object(kwargs.get('is_personal'))
@@ -0,0 +1,11 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class ChatPhotoSticker(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Type of the sticker.
+        self.type: ChatPhotoStickerType = get_object(kwargs.get('type'))
+        # The fill to be used as background for the sticker; rotation angle in backgroundFillGradient isn't supported.
+        self.background_fill: BackgroundFill = get_object(kwargs.get('background_fill'))
@@ -0,0 +1,23 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class ChatPhotoStickerType(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class ChatPhotoStickerTypeRegularOrMask(ChatPhotoStickerType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Sticker set identifier.
+        self.sticker_set_id: int = get_object(kwargs.get('sticker_set_id'))
+        # Identifier of the sticker in the set.
+        self.sticker_id: int = get_object(kwargs.get('sticker_id'))
+
+
+class ChatPhotoStickerTypeCustomEmoji(ChatPhotoStickerType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Identifier of the custom emoji.
+        self.custom_emoji_id: int = get_object(kwargs.get('custom_emoji_id'))
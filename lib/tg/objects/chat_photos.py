@@ -0,0 +1,11 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class ChatPhotos(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Total number of photos.
+        self.total_count: int = get_object(kwargs.get('total_count'))
+        # List of photos.
+        self.photos: list[ChatPhoto] = get_object(kwargs.get('photos'))
@@ -0,0 +1,15 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class ChatPosition(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The chat list.
+        self.list: ChatList = get_object(kwargs.get('list'))
+        # A parameter used to determine order of the chat in the chat list. Chats must be sorted by the pair (order, chat.id) in descending order.
+        self.order: int = get_object(kwargs.get('order'))
+        # True, if the chat is pinned in the chat list.
+        self.is_pinned: bool = get_object(kwargs.get('is_pinned'))
+        # Source of the chat in the chat list; may be null.
+        self.source: ChatSource = get_object(kwargs.get('source'))
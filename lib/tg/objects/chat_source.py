@@ -0,0 +1,21 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class ChatSource(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class ChatSourceMtprotoProxy(ChatSource):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class ChatSourcePublicServiceAnnouncement(ChatSource):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The type of the announcement.
+        self.type: str = get_object(kwargs.get('type'))
+        # The text of the announcement.
+        self.text: str = get_object(kwargs.get('text'))
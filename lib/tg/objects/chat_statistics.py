@@ -0,0 +1,93 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class ChatStatistics(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class ChatStatisticsSupergroup(ChatStatistics):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # A period to which the statistics applies.
+        self.period: DateRange = get_object(kwargs.get('period'))
+        # Number of members in the chat.
+        self.member_count: StatisticalValue = get_object(kwargs.get('member_count'))
+        # Number of messages sent to the chat.
+        self.message_count: StatisticalValue = get_object(kwargs.get('message_count'))
+        # Number of users who viewed messages in the chat.
+        self.viewer_count: StatisticalValue = get_object(kwargs.get('viewer_count'))
+        # Number of users who sent messages to the chat.
+        self.sender_count: StatisticalValue = get_object(kwargs.get('sender_count'))
+        # A graph containing number of members in the chat.
+        self.member_count_graph: StatisticalGraph = get_object(kwargs.get('member_count_graph'))
+        # A graph containing number of members joined and left the chat.
+        self.join_graph: StatisticalGraph = get_object(kwargs.get('join_graph'))
+        # A graph containing number of new member joins per source.
+        self.join_by_source_graph: StatisticalGraph = get_object(kwargs.get('join_by_source_graph'))
+        # A graph containing distribution of active users per language.
+        self.language_graph: StatisticalGraph = get_object(kwargs.get('language_graph'))
+        # A graph containing distribution of sent messages by content type.
+        self.message_content_graph: StatisticalGraph = get_object(kwargs.get('message_content_graph'))
+        # A graph containing number of different actions in the chat.
+        self.action_graph: StatisticalGraph = get_object(kwargs.get('action_graph'))
+        # A graph containing distribution of message views per hour.
+        self.day_graph: StatisticalGraph = get_object(kwargs.get('day_graph'))
+        # A graph containing distribution of message views per day of week.
+        self.week_graph: StatisticalGraph = get_object(kwargs.get('week_graph'))
+        # List of users sent most messages in the last week.
+        self.top_senders: list[ChatStatisticsMessageSenderInfo] = get_object(kwargs.get('top_senders'))
+        # List of most active administrators in the last week.
+        self.top_administrators: list[ChatStatisticsAdministratorActionsInfo] = get_object(kwargs.get('top_administrators'))
+        # List of most active inviters of new members in the last week.
+        self.top_inviters: list[ChatStatisticsInviterInfo] = get_object(kwargs.get('top_inviters'))
+
+
+class ChatStatisticsChannel(ChatStatistics):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # A period to which the statistics applies.
+        self.period: DateRange = get_object(kwargs.get('period'))
+        # Number of members in the chat.
+        self.member_count: StatisticalValue = get_object(kwargs.get('member_count'))
+        # Mean number of times the recently sent messages were viewed.
+        self.mean_message_view_count: StatisticalValue = get_object(kwargs.get('mean_message_view_count'))
+        # Mean number of times the recently sent messages were shared.
+        self.mean_message_share_count: StatisticalValue = get_object(kwargs.get('mean_message_share_count'))
+        # Mean number of times reactions were added to the recently sent messages.
+        self.mean_message_reaction_count: StatisticalValue = get_object(kwargs.get('mean_message_reaction_count'))
+        # Mean number of times the recently sent stories were viewed.
+        self.mean_story_view_count: StatisticalValue = get_object(kwargs.get('mean_story_view_count'))
+        # Mean number of times the recently sent stories were shared.
+        self.mean_story_share_count: StatisticalValue = get_object(kwargs.get('mean_story_share_count'))
+        # Mean number of times reactions were added to the recently sent stories.
+        self.mean_story_reaction_count: StatisticalValue = get_object(kwargs.get('mean_story_reaction_count'))
+        # A percentage of users with enabled notifications for the chat; 0-100.
+        self.enabled_notifications_percentage: float = get_object(kwargs.get('enabled_notifications_percentage'))
+        # A graph containing number of members in the chat.
+        self.member_count_graph: StatisticalGraph = get_object(kwargs.get('member_count_graph'))
+        # A graph containing number of members joined and left the chat.
+        self.join_graph: StatisticalGraph = get_object(kwargs.get('join_graph'))
+        # A graph containing number of members muted and unmuted the chat.
+        self.mute_graph: StatisticalGraph = get_object(kwargs.get('mute_graph'))
+        # A graph containing number of message views in a given hour in the last two weeks.
+        self.view_count_by_hour_graph: StatisticalGraph = get_object(kwargs.get('view_count_by_hour_graph'))
+        # A graph containing number of message views per source.
+        self.view_count_by_source_graph: StatisticalGraph = get_object(kwargs.get('view_count_by_source_graph'))
+        # A graph containing number of new member joins per source.
+        self.join_by_source_graph: StatisticalGraph = get_object(kwargs.get('join_by_source_graph'))
+        # A graph containing number of users viewed chat messages per language.
+        self.language_graph: StatisticalGraph = get_object(kwargs.get('language_graph'))
+        # A graph containing number of chat message views and shares.
+        self.message_interaction_graph: StatisticalGraph = get_object(kwargs.get('message_interaction_graph'))
+        # A graph containing number of reactions on messages.
+        self.message_reaction_graph: StatisticalGraph = get_object(kwargs.get('message_reaction_graph'))
+        # A graph containing number of story views and shares.
+        self.story_interaction_graph: StatisticalGraph = get_object(kwargs.get('story_interaction_graph'))
+        # A graph containing number of reactions on stories.
+        self.story_reaction_graph: StatisticalGraph = get_object(kwargs.get('story_reaction_graph'))
+        # A graph containing number of views of associated with the chat instant views.
+        self.instant_view_interaction_graph: StatisticalGraph = get_object(kwargs.get('instant_view_interaction_graph'))
+        # Detailed statistics about number of views and shares of recently sent messages and stories.
+        self.recent_interactions: list[ChatStatisticsInteractionInfo] = get_object(kwargs.get('recent_interactions'))
@@ -0,0 +1,15 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class ChatStatisticsAdministratorActionsInfo(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Administrator user identifier.
+        self.user_id: int = get_object(kwargs.get('user_id'))
+        # Number of messages deleted by the administrator.
+        self.deleted_message_count: int = get_object(kwargs.get('deleted_message_count'))
+        # Number of users banned by the administrator.
+        self.banned_user_count: int = get_object(kwargs.get('banned_user_count'))
+        # Number of users restricted by the administrator.
+        self.restricted_user_count: int = get_object(kwargs.get('restricted_user_count'))
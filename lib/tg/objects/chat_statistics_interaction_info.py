@@ -0,0 +1,15 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class ChatStatisticsInteractionInfo(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Type of the object.
+        self.object_type: ChatStatisticsObjectType = get_object(kwargs.get('object_type'))
+        # Number of times the object was viewed.
+        self.view_count: int = get_object(kwargs.get('view_count'))
+        # Number of times the object was forwarded.
+        self.forward_count: int = get_object(kwargs.get('forward_count'))
+        # Number of times reactions were added to the object.
+        self.reaction_count: int = get_object(kwargs.get('reaction_count'))
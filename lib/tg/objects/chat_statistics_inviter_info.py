@@ -0,0 +1,11 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class ChatStatisticsInviterInfo(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # User identifier.
+        self.user_id: int = get_object(kwargs.get('user_id'))
+        # Number of new members invited by the user.
+        self.added_member_count: int = get_object(kwargs.get('added_member_count'))
@@ -0,0 +1,13 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class ChatStatisticsMessageSenderInfo(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # User identifier.
+        self.user_id: int = get_object(kwargs.get('user_id'))
+        # Number of sent messages.
+        self.sent_message_count: int = get_object(kwargs.get('sent_message_count'))
+        # Average number of characters in sent messages; 0 if unknown.
+        self.average_character_count: int = get_object(kwargs.get('average_character_count'))
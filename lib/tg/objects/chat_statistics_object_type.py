@@ -0,0 +1,21 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class ChatStatisticsObjectType(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class ChatStatisticsObjectTypeMessage(ChatStatisticsObjectType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Message identifier.
+        self.message_id: int = get_object(kwargs.get('message_id'))
+
+
+class ChatStatisticsObjectTypeStory(ChatStatisticsObjectType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Story identifier.
+        self.story_id: int = get_object(kwargs.get('story_id'))
@@ -0,0 +1,13 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class ChatTheme(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Theme name.
+        self.name: str = get_object(kwargs.get('name'))
+        # Theme settings for a light chat theme.
+        self.light_settings: ThemeSettings = get_object(kwargs.get('light_settings'))
+        # Theme settings for a dark chat theme.
+        self.dark_settings: ThemeSettings = get_object(kwargs.get('dark_settings'))
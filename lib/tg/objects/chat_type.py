@@ -0,0 +1,39 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class ChatType(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class ChatTypePrivate(ChatType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # User identifier.
+        self.user_id: int = get_object(kwargs.get('user_id'))
+
+
+class ChatTypeBasicGroup(ChatType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Basic group identifier.
+        self.basic_group_id: int = get_object(kwargs.get('basic_group_id'))
+
+
+class ChatTypeSupergroup(ChatType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Supergroup or channel identifier.
+        self.supergroup_id: int = get_object(kwargs.get('supergroup_id'))
+        # True, if the supergroup is a channel.
+        self.is_channel: bool = get_object(kwargs.get('is_channel'))
+
+
+class ChatTypeSecret(ChatType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Secret chat identifier.
+        self.secret_chat_id: int = get_object(kwargs.get('secret_chat_id'))
+        # User identifier of the other user in the secret chat.
+        self.user_id: int = get_object(kwargs.get('user_id'))
@@ -0,0 +1,11 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class Chats(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Approximate total number of chats found.
+        self.total_count: int = get_object(kwargs.get('total_count'))
+        # List of chat identifiers.
+        self.chat_ids: list[int] = get_object(kwargs.get('chat_ids'))
@@ -0,0 +1,11 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class ChatsNearby(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # List of users nearby.
+        self.users_nearby: list[ChatNearby] = get_object(kwargs.get('users_nearby'))
+        # List of location-based supergroups nearby.
+        self.supergroups_nearby: list[ChatNearby] = get_object(kwargs.get('supergroups_nearby'))
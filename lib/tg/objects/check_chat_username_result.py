@@ -0,0 +1,37 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object
+
+
+class CheckChatUsernameResult(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class CheckChatUsernameResultOk(CheckChatUsernameResult):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class CheckChatUsernameResultUsernameInvalid(CheckChatUsernameResult):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class CheckChatUsernameResultUsernameOccupied(CheckChatUsernameResult):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class CheckChatUsernameResultUsernamePurchasable(CheckChatUsernameResult):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class CheckChatUsernameResultPublicChatsTooMany(CheckChatUsernameResult):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class CheckChatUsernameResultPublicGroupsUnavailable(CheckChatUsernameResult):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
@@ -0,0 +1,22 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object
+
+
+class CheckStickerSetNameResult(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class CheckStickerSetNameResultOk(CheckStickerSetNameResult):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class CheckStickerSetNameResultNameInvalid(CheckStickerSetNameResult):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class CheckStickerSetNameResultNameOccupied(CheckStickerSetNameResult):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
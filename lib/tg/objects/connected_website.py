@@ -0,0 +1,25 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class ConnectedWebsite(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Website identifier.
+        self.id: int = get_object(kwargs.get('id'))
+        # The domain name of the website.
+        self.domain_name: str = get_object(kwargs.get('domain_name'))
+        # User identifier of a bot linked with the website.
+        self.bot_user_id: int = get_object(kwargs.get('bot_user_id'))
+        # The version of a browser used to log in.
+        self.browser: str = get_object(kwargs.get('browser'))
+        # Operating system the browser is running on.
+        self.platform: str = get_object(kwargs.get('platform'))
+        # Point in time (Unix timestamp) when the user was logged in.
+        self.log_in_date: int = get_object(kwargs.get('log_in_date'))
+        # Point in time (Unix timestamp) when obtained authorization was last used.
+        self.last_active_date: int = get_object(kwargs.get('last_active_date'))
+        # IP address from which the user was logged in, in human-readable format.
+        self.ip_address: str = get_object(kwargs.get('ip_address'))
+        # Human-readable description of a country and a region from which the user was logged in, based on the IP address.
+        self.location: str = get_object(kwargs.get('location'))
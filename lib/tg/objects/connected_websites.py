@@ -0,0 +1,9 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class ConnectedWebsites(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # List of connected websites.
+        self.websites: list[ConnectedWebsite] = get_object(kwargs.get('websites'))
@@ -0,0 +1,32 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object
+
+
+class ConnectionState(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class ConnectionStateWaitingForNetwork(ConnectionState):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class ConnectionStateConnectingToProxy(ConnectionState):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class ConnectionStateConnecting(ConnectionState):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class ConnectionStateUpdating(ConnectionState):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class ConnectionStateReady(ConnectionState):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
@@ -0,0 +1,17 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class Contact(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Phone number of the user.
+        self.phone_number: str = get_object(kwargs.get('phone_number'))
+        # First name of the user; 1-255 characters in length.
+        self.first_name: str = get_object(kwargs.get('first_name'))
+        # Last name of the user.
+        self.last_name: str = get_object(kwargs.get('last_name'))
+        # Additional data about the user in a form of vCard; 0-2048 bytes in length.
+        self.vcard: str = get_object(kwargs.get('vcard'))
+        # Identifier of the user, if known; 0 otherwise.
+        self.user_id: int = get_object(kwargs.get('user_id'))
@@ -0,0 +1,17 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class CountryInfo(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # A two-letter ISO 3166-1 alpha-2 country code.
+        self.country_code: str = get_object(kwargs.get('country_code'))
+        # Native name of the country.
+        self.name: str = get_object(kwargs.get('name'))
+        # English name of the country.
+        self.english_name: str = get_object(kwargs.get('english_name'))
+        # True, if the country must be hidden from the list of all countries.
+        self.is_hidden: bool = get_object(kwargs.get('is_hidden'))
+        # List of country calling codes.
+        self.calling_codes: list[str] = get_object(kwargs.get('calling_codes'))
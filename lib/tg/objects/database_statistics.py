@@ -0,0 +1,9 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class DatabaseStatistics(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Database statistics in an unspecified human-readable format.
+        self.statistics: str = get_object(kwargs.get('statistics'))
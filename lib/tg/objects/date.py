@@ -0,0 +1,13 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class Date(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Day of the month; 1-31.
+        self.day: int = get_object(kwargs.get('day'))
+        # Month; 1-12.
+        self.month: int = get_object(kwargs.get('month'))
+        # Year; 1-9999.
+        self.year: int = get_object(kwargs.get('year'))
@@ -0,0 +1,11 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class DateRange(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Point in time (Unix timestamp) at which the date range begins.
+        self.start_date: int = get_object(kwargs.get('start_date'))
+        # Point in time (Unix timestamp) at which the date range ends.
+        self.end_date: int = get_object(kwargs.get('end_date'))
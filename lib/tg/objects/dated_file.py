@@ -0,0 +1,11 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class DatedFile(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The file.
+        self.file: File = get_object(kwargs.get('file'))
+        # Point in time (Unix timestamp) when the file was uploaded.
+        self.date: int = get_object(kwargs.get('date'))
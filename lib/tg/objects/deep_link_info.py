@@ -0,0 +1,11 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class DeepLinkInfo(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Text to be shown to the user.
+        self.text: FormattedText = get_object(kwargs.get('text'))
+        # True, if the user must be asked to update the application.
+        self.need_update_application: bool = get_object(kwargs.get('need_update_application'))
@@ -0,0 +1,105 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class DeviceToken(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class DeviceTokenFirebaseCloudMessaging(DeviceToken):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Device registration token; may be empty to deregister a device.
+        self.token: str = get_object(kwargs.get('token'))
+        # True, if push notifications must be additionally encrypted.
+        self.encrypt: bool = get_object(kwargs.get('encrypt'))
+
+
+class DeviceTokenApplePush(DeviceToken):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Device token; may be empty to deregister a device.
+        self.device_token: str = get_object(kwargs.get('device_token'))
+        # True, if App Sandbox is enabled.
+        self.is_app_sandbox: bool = get_object(kwargs.get('is_app_sandbox'))
+
+
+class DeviceTokenApplePushVoIP(DeviceToken):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Device token; may be empty to deregister a device.
+        self.device_token: str = get_object(kwargs.get('device_token'))
+        # True, if App Sandbox is enabled.
+        self.is_app_sandbox: bool = get_object(kwargs.get('is_app_sandbox'))
+        # True, if push notifications must be additionally encrypted.
+        self.encrypt: bool = get_object(kwargs.get('encrypt'))
+
+
+class DeviceTokenWindowsPush(DeviceToken):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The access token that will be used to send notifications; may be empty to deregister a device.
+        self.access_token: str = get_object(kwargs.get('access_token'))
+
+
+class DeviceTokenMicrosoftPush(DeviceToken):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Push notification channel URI; may be empty to deregister a device.
+        self.channel_uri: str = get_object(kwargs.get('channel_uri'))
+
+
+class DeviceTokenMicrosoftPushVoIP(DeviceToken):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Push notification channel URI; may be empty to deregister a device.
+        self.channel_uri: str = get_object(kwargs.get('channel_uri'))
+
+
+class DeviceTokenWebPush(DeviceToken):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Absolute URL exposed by the push service where the application server can send push messages; may be empty to deregister a device.
+        self.endpoint: str = get_object(kwargs.get('endpoint'))
+        # Base64url-encoded P-256 elliptic curve Diffie-Hellman public key.
+        self.p256dh_base64url: str = get_object(kwargs.get('p256dh_base64url'))
+        # Base64url-encoded authentication secret.
+        self.auth_base64url: str = get_object(kwargs.get('auth_base64url'))
+
+
+class DeviceTokenSimplePush(DeviceToken):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Absolute URL exposed by the push service where the application server can send push messages; may be empty to deregister a device.
+        self.endpoint: str = get_object(kwargs.get('endpoint'))
+
+
+class DeviceTokenUbuntuPush(DeviceToken):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Token; may be empty to deregister a device.
+        self.token: str = get_object(kwargs.get('token'))
+
+
+class DeviceTokenBlackBerryPush(DeviceToken):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Token; may be empty to deregister a device.
+        self.token: str = get_object(kwargs.get('token'))
+
+
+class DeviceTokenTizenPush(DeviceToken):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Push service registration identifier; may be empty to deregister a device.
+        self.reg_id: str = get_object(kwargs.get('reg_id'))
+
+
+class DeviceTokenHuaweiPush(DeviceToken):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Device registration token; may be empty to deregister a device.
+        self.token: str = get_object(kwargs.get('token'))
+        # True, if push notifications must be additionally encrypted.
+        self.encrypt: bool = get_object(kwargs.get('encrypt'))
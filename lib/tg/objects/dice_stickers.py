@@ -0,0 +1,29 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class DiceStickers(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class DiceStickersRegular(DiceStickers):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The animated sticker with the dice animation.
+        self.sticker: Sticker = get_object(kwargs.get('sticker'))
+
+
+class DiceStickersSlotMachine(DiceStickers):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The animated sticker with the slot machine background. The background animation must start playing after all reel animations finish.
+        self.background: Sticker = get_object(kwargs.get('background'))
+        # The animated sticker with the lever animation. The lever animation must play once in the initial dice state.
+        self.lever: Sticker = get_object(kwargs.get('lever'))
+        # The animated sticker with the left reel.
+        self.left_reel: Sticker = get_object(kwargs.get('left_reel'))
+        # The animated sticker with the center reel.
+        self.center_reel: Sticker = get_object(kwargs.get('center_reel'))
+        # The animated sticker with the right reel.
+        self.right_reel: Sticker = get_object(kwargs.get('right_reel'))
@@ -0,0 +1,17 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class Document(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Original name of the file; as defined by the sender.
+        self.file_name: str = get_object(kwargs.get('file_name'))
+        # MIME type of the file; as defined by the sender.
+        self.mime_type: str = get_object(kwargs.get('mime_type'))
+        # Document minithumbnail; may be null.
+        self.minithumbnail: Minithumbnail = get_object(kwargs.get('minithumbnail'))
+        # Document thumbnail in JPEG or PNG format (PNG will be used only for background patterns); as defined by the sender; may be null.
+        self.thumbnail: Thumbnail = get_object(kwargs.get('thumbnail'))
+        # File containing the document.
+        self.document: File = get_object(kwargs.get('document'))
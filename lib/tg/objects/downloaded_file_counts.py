@@ -0,0 +1,13 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class DownloadedFileCounts(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Number of active file downloads found, including paused.
+        self.active_count: int = get_object(kwargs.get('active_count'))
+        # Number of paused file downloads found.
+        self.paused_count: int = get_object(kwargs.get('paused_count'))
+        # Number of completed file downloads found.
+        self.completed_count: int = get_object(kwargs.get('completed_count'))
@@ -0,0 +1,13 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class DraftMessage(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Information about the message to be replied; must be of the type inputMessageReplyToMessage; may be null if none.
+        self.reply_to: InputMessageReplyTo = get_object(kwargs.get('reply_to'))
+        # Point in time (Unix timestamp) when the draft was created.
+        self.date: int = get_object(kwargs.get('date'))
+        # Content of the message draft; must be of the type inputMessageText.
+        self.input_message_text: InputMessageContent = get_object(kwargs.get('input_message_text'))
@@ -0,0 +1,28 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class EmailAddressAuthentication(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class EmailAddressAuthenticationCode(EmailAddressAuthentication):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The code.
+        self.code: str = get_object(kwargs.get('code'))
+
+
+class EmailAddressAuthenticationAppleId(EmailAddressAuthentication):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The token.
+        self.token: str = get_object(kwargs.get('token'))
+
+
+class EmailAddressAuthenticationGoogleId(EmailAddressAuthentication):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The token.
+        self.token: str = get_object(kwargs.get('token'))
@@ -0,0 +1,11 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class EmailAddressAuthenticationCodeInfo(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Pattern of the email address to which an authentication code was sent.
+        self.email_address_pattern: str = get_object(kwargs.get('email_address_pattern'))
+        # Length of the code; 0 if unknown.
+        self.length: int = get_object(kwargs.get('length'))
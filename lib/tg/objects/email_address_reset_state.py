@@ -0,0 +1,21 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class EmailAddressResetState(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class EmailAddressResetStateAvailable(EmailAddressResetState):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Time required to wait before the email address can be reset; 0 if the user is subscribed to Telegram Premium.
+        self.wait_period: int = get_object(kwargs.get('wait_period'))
+
+
+class EmailAddressResetStatePending(EmailAddressResetState):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Left time before the email address will be reset, in seconds. updateAuthorizationState is not sent when this field changes.
+        self.reset_in: int = get_object(kwargs.get('reset_in'))
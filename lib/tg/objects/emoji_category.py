@@ -0,0 +1,13 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class EmojiCategory(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Name of the category.
+        self.name: str = get_object(kwargs.get('name'))
+        # Custom emoji sticker, which represents icon of the category.
+        self.icon: Sticker = get_object(kwargs.get('icon'))
+        # List of emojis in the category.
+        self.emojis: list[str] = get_object(kwargs.get('emojis'))
@@ -0,0 +1,22 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object
+
+
+class EmojiCategoryType(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class EmojiCategoryTypeDefault(EmojiCategoryType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class EmojiCategoryTypeEmojiStatus(EmojiCategoryType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class EmojiCategoryTypeChatPhoto(EmojiCategoryType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
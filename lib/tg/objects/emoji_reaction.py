@@ -0,0 +1,27 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class EmojiReaction(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Text representation of the reaction.
+        self.emoji: str = get_object(kwargs.get('emoji'))
+        # Reaction title.
+        self.title: str = get_object(kwargs.get('title'))
+        # True, if the reaction can be added to new messages and enabled in chats.
+        self.is_active: bool = get_object(kwargs.get('is_active'))
+        # Static icon for the reaction.
+        self.static_icon: Sticker = get_object(kwargs.get('static_icon'))
+        # Appear animation for the reaction.
+        self.appear_animation: Sticker = get_object(kwargs.get('appear_animation'))
+        # Select animation for the reaction.
+        self.select_animation: Sticker = get_object(kwargs.get('select_animation'))
+        # Activate animation for the reaction.
+        self.activate_animation: Sticker = get_object(kwargs.get('activate_animation'))
+        # Effect animation for the reaction.
+        self.effect_animation: Sticker = get_object(kwargs.get('effect_animation'))
+        # Around animation for the reaction; may be null.
+        self.around_animation: Sticker = get_object(kwargs.get('around_animation'))
+        # Center animation for the reaction; may be null.
+        self.center_animation: Sticker = get_object(kwargs.get('center_animation'))
@@ -0,0 +1,11 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class EmojiStatus(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Identifier of the custom emoji in stickerFormatTgs format.
+        self.custom_emoji_id: int = get_object(kwargs.get('custom_emoji_id'))
+        # Point in time (Unix timestamp) when the status will expire; 0 if never.
+        self.expiration_date: int = get_object(kwargs.get('expiration_date'))
@@ -0,0 +1,9 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class EmojiStatuses(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The list of custom emoji identifiers.
+        self.custom_emoji_ids: list[int] = get_object(kwargs.get('custom_emoji_ids'))
@@ -0,0 +1,13 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class EncryptedCredentials(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The encrypted credentials.
+        self.data: bytes = get_object(kwargs.get('data'))
+        # The decrypted data hash.
+        self.hash: bytes = get_object(kwargs.get('hash'))
+        # Secret for data decryption, encrypted with the service's public key.
+        self.secret: bytes = get_object(kwargs.get('secret'))
@@ -0,0 +1,25 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class EncryptedPassportElement(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Type of Telegram Passport element.
+        self.type: PassportElementType = get_object(kwargs.get('type'))
+        # Encrypted JSON-encoded data about the user.
+        self.data: bytes = get_object(kwargs.get('data'))
+        # The front side of an identity document.
+        self.front_side: DatedFile = get_object(kwargs.get('front_side'))
+        # The reverse side of an identity document; may be null.
+        self.reverse_side: DatedFile = get_object(kwargs.get('reverse_side'))
+        # Selfie with the document; may be null.
+        self.selfie: DatedFile = get_object(kwargs.get('selfie'))
+        # List of files containing a certified English translation of the document.
+        self.translation: list[DatedFile] = get_object(kwargs.get('translation'))
+        # List of attached files.
+        self.files: list[DatedFile] = get_object(kwargs.get('files'))
+        # Unencrypted data, phone number or email address.
+        self.value: str = get_object(kwargs.get('value'))
+        # Hash of the entire element.
+        self.hash: str = get_object(kwargs.get('hash'))
@@ -0,0 +1,11 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class Error(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Error code; subject to future changes. If the error code is 406, the error message must not be processed in any way and must not be displayed to the user.
+        self.code: int = get_object(kwargs.get('code'))
+        # Error message; subject to future changes.
+        self.message: str = get_object(kwargs.get('message'))
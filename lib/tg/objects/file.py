@@ -0,0 +1,17 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class File(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Unique file identifier.
+        self.id: int = get_object(kwargs.get('id'))
+        # File size, in bytes; 0 if unknown.
+        self.size: int = get_object(kwargs.get('size'))
+        # Approximate file size in bytes in case the exact file size is unknown. Can be used to show download/upload progress.
+        self.expected_size: int = get_object(kwargs.get('expected_size'))
+        # Information about the local copy of the file.
+        self.local: LocalFile = get_object(kwargs.get('local'))
+        # Information about the remote copy of the file.
+        self.remote: RemoteFile = get_object(kwargs.get('remote'))
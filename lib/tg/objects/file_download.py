@@ -0,0 +1,17 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class FileDownload(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # File identifier.
+        self.file_id: int = get_object(kwargs.get('file_id'))
+        # The message with the file.
+        self.message: Message = get_object(kwargs.get('message'))
+        # Point in time (Unix timestamp) when the file was added to the download list.
+        self.add_date: int = get_object(kwargs.get('add_date'))
+        # Point in time (Unix timestamp) when the file downloading was completed; 0 if the file downloading isn't completed.
+        self.complete_date: int = get_object(kwargs.get('complete_date'))
+        # True, if downloading of the file is paused.
+        self.is_paused: bool = get_object(kwargs.get('is_paused'))
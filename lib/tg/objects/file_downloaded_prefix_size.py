@@ -0,0 +1,9 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class FileDownloadedPrefixSize(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The prefix size, in bytes.
+        self.size: int = get_object(kwargs.get('size'))
@@ -0,0 +1,102 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object
+
+
+class FileType(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class FileTypeNone(FileType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class FileTypeAnimation(FileType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class FileTypeAudio(FileType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class FileTypeDocument(FileType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class FileTypeNotificationSound(FileType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class FileTypePhoto(FileType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class FileTypePhotoStory(FileType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class FileTypeProfilePhoto(FileType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class FileTypeSecret(FileType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class FileTypeSecretThumbnail(FileType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class FileTypeSecure(FileType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class FileTypeSticker(FileType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class FileTypeThumbnail(FileType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class FileTypeUnknown(FileType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class FileTypeVideo(FileType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class FileTypeVideoNote(FileType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class FileTypeVideoStory(FileType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class FileTypeVoiceNote(FileType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class FileTypeWallpaper(FileType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
@@ -0,0 +1,21 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class FirebaseAuthenticationSettings(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class FirebaseAuthenticationSettingsAndroid(FirebaseAuthenticationSettings):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class FirebaseAuthenticationSettingsIos(FirebaseAuthenticationSettings):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Device token from Apple Push Notification service.
+        self.device_token: str = get_object(kwargs.get('device_token'))
+        # True, if App Sandbox is enabled.
+        self.is_app_sandbox: bool = get_object(kwargs.get('is_app_sandbox'))
@@ -0,0 +1,11 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class FormattedText(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The text.
+        self.text: str = get_object(kwargs.get('text'))
+        # Entities contained in the text. Entities can be nested, but must not mutually intersect with each other. Pre, Code and PreCode entities can't contain other entities. BlockQuote entities can't contain other BlockQuote entities. Bold, Italic, Underline, Strikethrough, and Spoiler entities can contain and can be part of any other entities. All other entities can't contain each other.
+        self.entities: list[TextEntity] = get_object(kwargs.get('entities'))
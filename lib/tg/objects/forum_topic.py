@@ -0,0 +1,27 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class ForumTopic(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Basic information about the topic.
+        self.info: ForumTopicInfo = get_object(kwargs.get('info'))
+        # Last message in the topic; may be null if unknown.
+        self.last_message: Message = get_object(kwargs.get('last_message'))
+        # True, if the topic is pinned in the topic list.
+        self.is_pinned: bool = get_object(kwargs.get('is_pinned'))
+        # Number of unread messages in the topic.
+        self.unread_count: int = get_object(kwargs.get('unread_count'))
+        # Identifier of the last read incoming message.
+        self.last_read_inbox_message_id: int = get_object(kwargs.get('last_read_inbox_message_id'))
+        # Identifier of the last read outgoing message.
+        self.last_read_outbox_message_id: int = get_object(kwargs.get('last_read_outbox_message_id'))
+        # Number of unread messages with a mention/reply in the topic.
+        self.unread_mention_count: int = get_object(kwargs.get('unread_mention_count'))
+        # Number of messages with unread reactions in the topic.
+        self.unread_reaction_count: int = get_object(kwargs.get('unread_reaction_count'))
+        # Notification settings for the topic.
+        self.notification_settings: ChatNotificationSettings = get_object(kwargs.get('notification_settings'))
+        # A draft of a message in the topic; may be null if none.
+        self.draft_message: DraftMessage = get_object(kwargs.get('draft_message'))
@@ -0,0 +1,11 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class ForumTopicIcon(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Color of the topic icon in RGB format.
+        self.color: int = get_object(kwargs.get('color'))
+        # Unique identifier of the custom emoji shown on the topic icon; 0 if none.
+        self.custom_emoji_id: int = get_object(kwargs.get('custom_emoji_id'))
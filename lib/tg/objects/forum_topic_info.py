@@ -0,0 +1,25 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class ForumTopicInfo(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Message thread identifier of the topic.
+        self.message_thread_id: int = get_object(kwargs.get('message_thread_id'))
+        # Name of the topic.
+        self.name: str = get_object(kwargs.get('name'))
+        # Icon of the topic.
+        self.icon: ForumTopicIcon = get_object(kwargs.get('icon'))
+        # Point in time (Unix timestamp) when the topic was created.
+        self.creation_date: int = get_object(kwargs.get('creation_date'))
+        # Identifier of the creator of the topic.
+        self.creator_id: MessageSender = get_object(kwargs.get('creator_id'))
+        # True, if the topic is the General topic list.
+        self.is_general: bool = get_object(kwargs.get('is_general'))
+        # True, if the topic was created by the current user.
+        self.is_outgoing: bool = get_object(kwargs.get('is_outgoing'))
+        # True, if the topic is closed.
+        self.is_closed: bool = get_object(kwargs.get('is_closed'))
+        # True, if the topic is hidden above the topic list and closed; for General topic only.
+        self.is_hidden: bool = get_object(kwargs.get('is_hidden'))
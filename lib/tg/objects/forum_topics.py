@@ -0,0 +1,17 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class ForumTopics(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Approximate total number of forum topics found.
+        self.total_count: int = get_object(kwargs.get('total_count'))
+        # List of forum topics.
+        self.topics: list[ForumTopic] = get_object(kwargs.get('topics'))
+        # Offset date for the next getForumTopics request.
+        self.next_offset_date: int = get_object(kwargs.get('next_offset_date'))
+        # Offset message identifier for the next getForumTopics request.
+        self.next_offset_message_id: int = get_object(kwargs.get('next_offset_message_id'))
+        # Offset message thread identifier for the next getForumTopics request.
+        self.next_offset_message_thread_id: int = get_object(kwargs.get('next_offset_message_thread_id'))
@@ -0,0 +1,13 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class FoundChatBoosts(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Total number of boosts applied to the chat.
+        self.total_count: int = get_object(kwargs.get('total_count'))
+        # List of boosts.
+        self.boosts: list[ChatBoost] = get_object(kwargs.get('boosts'))
+        # The offset for the next request. If empty, then there are no more results.
+        self.next_offset: str = get_object(kwargs.get('next_offset'))
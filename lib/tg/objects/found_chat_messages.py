@@ -0,0 +1,13 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class FoundChatMessages(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Approximate total number of messages found; -1 if unknown.
+        self.total_count: int = get_object(kwargs.get('total_count'))
+        # List of messages.
+        self.messages: list[Message] = get_object(kwargs.get('messages'))
+        # The offset for the next request. If 0, there are no more results.
+        self.next_from_message_id: int = get_object(kwargs.get('next_from_message_id'))
@@ -0,0 +1,13 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class FoundFileDownloads(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Total number of suitable files, ignoring offset.
+        self.total_counts: DownloadedFileCounts = get_object(kwargs.get('total_counts'))
+        # The list of files.
+        self.files: list[FileDownload] = get_object(kwargs.get('files'))
+        # The offset for the next request. If empty, then there are no more results.
+        self.next_offset: str = get_object(kwargs.get('next_offset'))
@@ -0,0 +1,11 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class FoundPositions(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Total number of matched objects.
+        self.total_count: int = get_object(kwargs.get('total_count'))
+        # The positions of the matched objects.
+        self.positions: list[int] = get_object(kwargs.get('positions'))
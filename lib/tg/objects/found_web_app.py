@@ -0,0 +1,13 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class FoundWebApp(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The Web App.
+        self.web_app: WebApp = get_object(kwargs.get('web_app'))
+        # True, if the user must be asked for the permission to the bot to send them messages.
+        self.request_write_access: bool = get_object(kwargs.get('request_write_access'))
+        # True, if there is no need to show an ordinary open URL confirmation before opening the Web App. The field must be ignored and confirmation must be shown anyway if the Web App link was hidden.
+        self.skip_confirmation: bool = get_object(kwargs.get('skip_confirmation'))
@@ -0,0 +1,21 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class Game(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Unique game identifier.
+        self.id: int = get_object(kwargs.get('id'))
+        # Game short name.
+        self.short_name: str = get_object(kwargs.get('short_name'))
+        # Game title.
+        self.title: str = get_object(kwargs.get('title'))
+        # Game text, usually containing scoreboards for a game.
+        self.text: FormattedText = get_object(kwargs.get('text'))
+        # Game description.
+        self.description: str = get_object(kwargs.get('description'))
+        # Game photo.
+        self.photo: Photo = get_object(kwargs.get('photo'))
+        # Game animation; may be null.
+        self.animation: Animation = get_object(kwargs.get('animation'))
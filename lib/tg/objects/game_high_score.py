@@ -0,0 +1,13 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class GameHighScore(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Position in the high score table.
+        self.position: int = get_object(kwargs.get('position'))
+        # User identifier.
+        self.user_id: int = get_object(kwargs.get('user_id'))
+        # User score.
+        self.score: int = get_object(kwargs.get('score'))
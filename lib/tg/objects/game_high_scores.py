@@ -0,0 +1,9 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class GameHighScores(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # A list of game high scores.
+        self.scores: list[GameHighScore] = get_object(kwargs.get('scores'))
@@ -0,0 +1,49 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class GroupCall(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Group call identifier.
+        self.id: int = get_object(kwargs.get('id'))
+        # Group call title.
+        self.title: str = get_object(kwargs.get('title'))
+        # Point in time (Unix timestamp) when the group call is supposed to be started by an administrator; 0 if it is already active or was ended.
+        self.scheduled_start_date: int = get_object(kwargs.get('scheduled_start_date'))
+        # True, if the group call is scheduled and the current user will receive a notification when the group call starts.
+        self.enabled_start_notification: bool = get_object(kwargs.get('enabled_start_notification'))
+        # True, if the call is active.
+        self.is_active: bool = get_object(kwargs.get('is_active'))
+        # True, if the chat is an RTMP stream instead of an ordinary video chat.
+        self.is_rtmp_stream: bool = get_object(kwargs.get('is_rtmp_stream'))
+        # True, if the call is joined.
+        self.is_joined: bool = get_object(kwargs.get('is_joined'))
+        # True, if user was kicked from the call because of network loss and the call needs to be rejoined.
+        self.need_rejoin: bool = get_object(kwargs.get('need_rejoin'))
+        # True, if the current user can manage the group call.
+        self.can_be_managed: bool = get_object(kwargs.get('can_be_managed'))
+        # Number of participants in the group call.
+        self.participant_count: int = get_object(kwargs.get('participant_count'))
+        # True, if group call participants, which are muted, aren't returned in participant list.
+        self.has_hidden_listeners: bool = get_object(kwargs.get('has_hidden_listeners'))
+        # True, if all group call participants are loaded.
+        self.loaded_all_participants: bool = get_object(kwargs.get('loaded_all_participants'))
+        # At most 3 recently speaking users in the group call.
+        self.recent_speakers: list[GroupCallRecentSpeaker] = get_object(kwargs.get('recent_speakers'))
+        # True, if the current user's video is enabled.
+        self.is_my_video_enabled: bool = get_object(kwargs.get('is_my_video_enabled'))
+        # True, if the current user's video is paused.
+        self.is_my_video_paused: bool = get_object(kwargs.get('is_my_video_paused'))
+        # True, if the current user can broadcast video or share screen.
+        self.can_enable_video: bool = get_object(kwargs.get('can_enable_video'))
+        # True, if only group call administrators can unmute new participants.
+        self.mute_new_participants: bool = get_object(kwargs.get('mute_new_participants'))
+        # True, if the current user can enable or disable mute_new_participants setting.
+        self.can_toggle_mute_new_participants: bool = get_object(kwargs.get('can_toggle_mute_new_participants'))
+        # Duration of the ongoing group call recording, in seconds; 0 if none. An updateGroupCall update is not triggered when value of this field changes, but the same recording goes on.
+        self.record_duration: int = get_object(kwargs.get('record_duration'))
+        # True, if a video file is being recorded for the call.
+        self.is_video_recorded: bool = get_object(kwargs.get('is_video_recorded'))
+        # Call duration, in seconds; for ended calls only.
+        self.duration: int = get_object(kwargs.get('duration'))
@@ -0,0 +1,43 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class GroupCallParticipant(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Identifier of the group call participant.
+        self.participant_id: MessageSender = get_object(kwargs.get('participant_id'))
+        # User's audio channel synchronization source identifier.
+        self.audio_source_id: int = get_object(kwargs.get('audio_source_id'))
+        # User's screen sharing audio channel synchronization source identifier.
+        self.screen_sharing_audio_source_id: int = get_object(kwargs.get('screen_sharing_audio_source_id'))
+        # Information about user's video channel; may be null if there is no active video.
+        self.video_info: GroupCallParticipantVideoInfo = get_object(kwargs.get('video_info'))
+        # Information about user's screen sharing video channel; may be null if there is no active screen sharing video.
+        self.screen_sharing_video_info: GroupCallParticipantVideoInfo = get_object(kwargs.get('screen_sharing_video_info'))
+        # The participant user's bio or the participant chat's description.
+        self.bio: str = get_object(kwargs.get('bio'))
+        # True, if the participant is the current user.
+        self.is_current_user: bool = get_object(kwargs.get('is_current_user'))
+        # True, if the participant is speaking as set by setGroupCallParticipantIsSpeaking.
+        self.is_speaking: bool = get_object(kwargs.get('is_speaking'))
+        # True, if the participant hand is raised.
+        self.is_hand_raised: bool = get_object(kwargs.get('is_hand_raised'))
+        # True, if the current user can mute the participant for all other group call participants.
+        self.can_be_muted_for_all_users: bool = get_object(kwargs.get('can_be_muted_for_all_users'))
+        # True, if the current user can allow the participant to unmute themselves or unmute the participant (if the participant is the current user).
+        self.can_be_unmuted_for_all_users: bool = get_object(kwargs.get('can_be_unmuted_for_all_users'))
+        # True, if the current user can mute the participant only for self.
+        self.can_be_muted_for_current_user: bool = get_object(kwargs.get('can_be_muted_for_current_user'))
+        # True, if the current user can unmute the participant for self.
+        self.can_be_unmuted_for_current_user: bool = get_object(kwargs.get('can_be_unmuted_for_current_user'))
+        # True, if the participant is muted for all users.
+        self.is_muted_for_all_users: bool = get_object(kwargs.get('is_muted_for_all_users'))
+        # True, if the participant is muted for the current user.
+        self.is_muted_for_current_user: bool = get_object(kwargs.get('is_muted_for_current_user'))
+        # True, if the participant is muted for all users, but can unmute themselves.
+        self.can_unmute_self: bool = get_object(kwargs.get('can_unmute_self'))
+        # Participant's volume level; 1-20000 in hundreds of percents.
+        self.volume_level: int = get_object(kwargs.get('volume_level'))
+        # User's order in the group call participant list. Orders must be compared lexicographically. The bigger is order, the higher is user in the list. If order is empty, the user must be removed from the participant list.
+        self.order: str = get_object(kwargs.get('order'))
@@ -0,0 +1,13 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class GroupCallParticipantVideoInfo(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # List of synchronization source groups of the video.
+        self.source_groups: list[GroupCallVideoSourceGroup] = get_object(kwargs.get('source_groups'))
+        # Video channel endpoint identifier.
+        self.endpoint_id: str = get_object(kwargs.get('endpoint_id'))
+        # True, if the video is paused. This flag needs to be ignored, if new video frames are received.
+        self.is_paused: bool = get_object(kwargs.get('is_paused'))
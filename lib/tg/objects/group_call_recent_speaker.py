@@ -0,0 +1,11 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class GroupCallRecentSpeaker(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Group call participant identifier.
+        self.participant_id: MessageSender = get_object(kwargs.get('participant_id'))
+        # True, is the user has spoken recently.
+        self.is_speaking: bool = get_object(kwargs.get('is_speaking'))
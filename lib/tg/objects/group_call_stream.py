@@ -0,0 +1,13 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class GroupCallStream(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Identifier of an audio/video channel.
+        self.channel_id: int = get_object(kwargs.get('channel_id'))
+        # Scale of segment durations in the stream. The duration is 1000/(2**scale) milliseconds.
+        self.scale: int = get_object(kwargs.get('scale'))
+        # Point in time when the stream currently ends; Unix timestamp in milliseconds.
+        self.time_offset: int = get_object(kwargs.get('time_offset'))
@@ -0,0 +1,9 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class GroupCallStreams(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # A list of group call streams.
+        self.streams: list[GroupCallStream] = get_object(kwargs.get('streams'))
@@ -0,0 +1,22 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object
+
+
+class GroupCallVideoQuality(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class GroupCallVideoQualityThumbnail(GroupCallVideoQuality):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class GroupCallVideoQualityMedium(GroupCallVideoQuality):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class GroupCallVideoQualityFull(GroupCallVideoQuality):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
@@ -0,0 +1,11 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class GroupCallVideoSourceGroup(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The semantics of sources, one of &quot;SIM&quot; or &quot;FID&quot;.
+        self.semantics: str = get_object(kwargs.get('semantics'))
+        # The list of synchronization source identifiers.
+        self.source_ids: list[int] = get_object(kwargs.get('source_ids'))
@@ -0,0 +1,9 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class HttpUrl(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The URL.
+        self.url: str = get_object(kwargs.get('url'))
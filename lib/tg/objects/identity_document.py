@@ -0,0 +1,19 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class IdentityDocument(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Document number; 1-24 characters.
+        self.number: str = get_object(kwargs.get('number'))
+        # Document expiration date; may be null if not applicable.
+        self.expiration_date: Date = get_object(kwargs.get('expiration_date'))
+        # Front side of the document.
+        self.front_side: DatedFile = get_object(kwargs.get('front_side'))
+        # Reverse side of the document; only for driver license and identity card; may be null.
+        self.reverse_side: DatedFile = get_object(kwargs.get('reverse_side'))
+        # Selfie with the document; may be null.
+        self.selfie: DatedFile = get_object(kwargs.get('selfie'))
+        # List of files containing a certified English translation of the document.
+        self.translation: list[DatedFile] = get_object(kwargs.get('translation'))
@@ -0,0 +1,11 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class ImportedContacts(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # User identifiers of the imported contacts in the same order as they were specified in the request; 0 if the contact is not yet a registered user.
+        self.user_ids: list[int] = get_object(kwargs.get('user_ids'))
+        # The number of users that imported the corresponding contact; 0 for already registered users or if unavailable.
+        self.importer_count: list[int] = get_object(kwargs.get('importer_count'))
@@ -0,0 +1,72 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class InlineKeyboardButtonType(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class InlineKeyboardButtonTypeUrl(InlineKeyboardButtonType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # HTTP or tg:// URL to open.
+        self.url: str = get_object(kwargs.get('url'))
+
+
+class InlineKeyboardButtonTypeLoginUrl(InlineKeyboardButtonType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # An HTTP URL to pass to getLoginUrlInfo.
+        self.url: str = get_object(kwargs.get('url'))
+        # Unique button identifier.
+        self.id: int = get_object(kwargs.get('id'))
+        # If non-empty, new text of the button in forwarded messages.
+        self.forward_text: str = get_object(kwargs.get('forward_text'))
+
+
+class InlineKeyboardButtonTypeWebApp(InlineKeyboardButtonType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # An HTTP URL to pass to openWebApp.
+        self.url: str = get_object(kwargs.get('url'))
+
+
+class InlineKeyboardButtonTypeCallback(InlineKeyboardButtonType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Data to be sent to the bot via a callback query.
+        self.data: bytes = get_object(kwargs.get('data'))
+
+
+class InlineKeyboardButtonTypeCallbackWithPassword(InlineKeyboardButtonType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Data to be sent to the bot via a callback query.
+        self.data: bytes = get_object(kwargs.get('data'))
+
+
+class InlineKeyboardButtonTypeCallbackGame(InlineKeyboardButtonType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class InlineKeyboardButtonTypeSwitchInline(InlineKeyboardButtonType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Inline query to be sent to the bot.
+        self.query: str = get_object(kwargs.get('query'))
+        # Target chat from which to send the inline query.
+        self.target_chat: TargetChat = get_object(kwargs.get('target_chat'))
+
+
+class InlineKeyboardButtonTypeBuy(InlineKeyboardButtonType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class InlineKeyboardButtonTypeUser(InlineKeyboardButtonType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # User identifier.
+        self.user_id: int = get_object(kwargs.get('user_id'))
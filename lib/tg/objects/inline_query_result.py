@@ -0,0 +1,147 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class InlineQueryResult(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class InlineQueryResultArticle(InlineQueryResult):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Unique identifier of the query result.
+        self.id: str = get_object(kwargs.get('id'))
+        # URL of the result, if it exists.
+        self.url: str = get_object(kwargs.get('url'))
+        # True, if the URL must be not shown.
+        self.hide_url: bool = get_object(kwargs.get('hide_url'))
+        # Title of the result.
+        self.title: str = get_object(kwargs.get('title'))
+        # A short description of the result.
+        self.description: str = get_object(kwargs.get('description'))
+        # Result thumbnail in JPEG format; may be null.
+        self.thumbnail: Thumbnail = get_object(kwargs.get('thumbnail'))
+
+
+class InlineQueryResultContact(InlineQueryResult):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Unique identifier of the query result.
+        self.id: str = get_object(kwargs.get('id'))
+        # A user contact.
+        self.contact: Contact = get_object(kwargs.get('contact'))
+        # Result thumbnail in JPEG format; may be null.
+        self.thumbnail: Thumbnail = get_object(kwargs.get('thumbnail'))
+
+
+class InlineQueryResultLocation(InlineQueryResult):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Unique identifier of the query result.
+        self.id: str = get_object(kwargs.get('id'))
+        # Location result.
+        self.location: Location = get_object(kwargs.get('location'))
+        # Title of the result.
+        self.title: str = get_object(kwargs.get('title'))
+        # Result thumbnail in JPEG format; may be null.
+        self.thumbnail: Thumbnail = get_object(kwargs.get('thumbnail'))
+
+
+class InlineQueryResultVenue(InlineQueryResult):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Unique identifier of the query result.
+        self.id: str = get_object(kwargs.get('id'))
+        # Venue result.
+        self.venue: Venue = get_object(kwargs.get('venue'))
+        # Result thumbnail in JPEG format; may be null.
+        self.thumbnail: Thumbnail = get_object(kwargs.get('thumbnail'))
+
+
+class InlineQueryResultGame(InlineQueryResult):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Unique identifier of the query result.
+        self.id: str = get_object(kwargs.get('id'))
+        # Game result.
+        self.game: Game = get_object(kwargs.get('game'))
+
+
+class InlineQueryResultAnimation(InlineQueryResult):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Unique identifier of the query result.
+        self.id: str = get_object(kwargs.get('id'))
+        # Animation file.
+        self.animation: Animation = get_object(kwargs.get('animation'))
+        # Animation title.
+        self.title: str = get_object(kwargs.get('title'))
+
+
+class InlineQueryResultAudio(InlineQueryResult):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Unique identifier of the query result.
+        self.id: str = get_object(kwargs.get('id'))
+        # Audio file.
+        self.audio: Audio = get_object(kwargs.get('audio'))
+
+
+class InlineQueryResultDocument(InlineQueryResult):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Unique identifier of the query result.
+        self.id: str = get_object(kwargs.get('id'))
+        # Document.
+        self.document: Document = get_object(kwargs.get('document'))
+        # Document title.
+        self.title: str = get_object(kwargs.get('title'))
+        # Document description.
+        self.description: str = get_object(kwargs.get('description'))
+
+
+class InlineQueryResultPhoto(InlineQueryResult):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Unique identifier of the query result.
+        self.id: str = get_object(kwargs.get('id'))
+        # Photo.
+        self.photo: Photo = get_object(kwargs.get('photo'))
+        # Title of the result, if known.
+        self.title: str = get_object(kwargs.get('title'))
+        # A short description of the result, if known.
+        self.description: str = get_object(kwargs.get('description'))
+
+
+class InlineQueryResultSticker(InlineQueryResult):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Unique identifier of the query result.
+        self.id: str = get_object(kwargs.get('id'))
+        # Sticker.
+        self.sticker: Sticker = get_object(kwargs.get('sticker'))
+
+
+class InlineQueryResultVideo(InlineQueryResult):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Unique identifier of the query result.
+        self.id: str = get_object(kwargs.get('id'))
+        # Video.
+        self.video: Video = get_object(kwargs.get('video'))
+        # Title of the video.
+        self.title: str = get_object(kwargs.get('title'))
+        # Description of the video.
+        self.description: str = get_object(kwargs.get('description'))
+
+
+class InlineQueryResultVoiceNote(InlineQueryResult):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Unique identifier of the query result.
+        self.id: str = get_object(kwargs.get('id'))
+        # Voice note.
+        self.voice_note: VoiceNote = get_object(kwargs.get('voice_note'))
+        # Title of the voice note.
+        self.title: str = get_object(kwargs.get('title'))
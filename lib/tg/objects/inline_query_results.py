@@ -0,0 +1,15 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class InlineQueryResults(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Unique identifier of the inline query.
+        self.inline_query_id: int = get_object(kwargs.get('inline_query_id'))
+        # Button to be shown above inline query results; may be null.
+        self.button: InlineQueryResultsButton = get_object(kwargs.get('button'))
+        # Results of the query.
+        self.results: list[InlineQueryResult] = get_object(kwargs.get('results'))
+        # The offset for the next request. If empty, then there are no more results.
+        self.next_offset: str = get_object(kwargs.get('next_offset'))
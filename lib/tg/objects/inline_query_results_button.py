@@ -0,0 +1,11 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class InlineQueryResultsButton(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The text of the button.
+        self.text: str = get_object(kwargs.get('text'))
+        # Type of the button.
+        self.type: InlineQueryResultsButtonType = get_object(kwargs.get('type'))
@@ -0,0 +1,21 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class InlineQueryResultsButtonType(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class InlineQueryResultsButtonTypeStartBot(InlineQueryResultsButtonType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The parameter for the bot start message.
+        self.parameter: str = get_object(kwargs.get('parameter'))
+
+
+class InlineQueryResultsButtonTypeWebApp(InlineQueryResultsButtonType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # An HTTP URL to pass to getWebAppUrl.
+        self.url: str = get_object(kwargs.get('url'))
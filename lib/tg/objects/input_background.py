@@ -0,0 +1,28 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class InputBackground(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class InputBackgroundLocal(InputBackground):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Background file to use. Only inputFileLocal and inputFileGenerated are supported. The file must be in JPEG format for wallpapers and in PNG format for patterns.
+        self.background: InputFile = get_object(kwargs.get('background'))
+
+
+class InputBackgroundRemote(InputBackground):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The background identifier.
+        self.background_id: int = get_object(kwargs.get('background_id'))
+
+
+class InputBackgroundPrevious(InputBackground):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Identifier of the message with the background.
+        self.message_id: int = get_object(kwargs.get('message_id'))
@@ -0,0 +1,37 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class InputChatPhoto(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class InputChatPhotoPrevious(InputChatPhoto):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Identifier of the current user's profile photo to reuse.
+        self.chat_photo_id: int = get_object(kwargs.get('chat_photo_id'))
+
+
+class InputChatPhotoStatic(InputChatPhoto):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Photo to be set as profile photo. Only inputFileLocal and inputFileGenerated are allowed.
+        self.photo: InputFile = get_object(kwargs.get('photo'))
+
+
+class InputChatPhotoAnimation(InputChatPhoto):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Animation to be set as profile photo. Only inputFileLocal and inputFileGenerated are allowed.
+        self.animation: InputFile = get_object(kwargs.get('animation'))
+        # Timestamp of the frame, which will be used as static chat photo.
+        self.main_frame_timestamp: float = get_object(kwargs.get('main_frame_timestamp'))
+
+
+class InputChatPhotoSticker(InputChatPhoto):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Information about the sticker.
+        self.sticker: ChatPhotoSticker = get_object(kwargs.get('sticker'))
@@ -0,0 +1,37 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class InputCredentials(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class InputCredentialsSaved(InputCredentials):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Identifier of the saved credentials.
+        self.saved_credentials_id: str = get_object(kwargs.get('saved_credentials_id'))
+
+
+class InputCredentialsNew(InputCredentials):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # JSON-encoded data with the credential identifier from the payment provider.
+        self.data: str = get_object(kwargs.get('data'))
+        # True, if the credential identifier can be saved on the server side.
+        self.allow_save: bool = get_object(kwargs.get('allow_save'))
+
+
+class InputCredentialsApplePay(InputCredentials):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # JSON-encoded data with the credential identifier.
+        self.data: str = get_object(kwargs.get('data'))
+
+
+class InputCredentialsGooglePay(InputCredentials):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # JSON-encoded data with the credential identifier.
+        self.data: str = get_object(kwargs.get('data'))
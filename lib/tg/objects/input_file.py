@@ -0,0 +1,39 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class InputFile(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class InputFileId(InputFile):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Unique file identifier.
+        self.id: int = get_object(kwargs.get('id'))
+
+
+class InputFileRemote(InputFile):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Remote file identifier.
+        self.id: str = get_object(kwargs.get('id'))
+
+
+class InputFileLocal(InputFile):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Local path to the file.
+        self.path: str = get_object(kwargs.get('path'))
+
+
+class InputFileGenerated(InputFile):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Local path to a file from which the file is generated; may be empty if there is no such file.
+        self.original_path: str = get_object(kwargs.get('original_path'))
+        # String specifying the conversion applied to the original file; must be persistent across application restarts. Conversions beginning with '\#' are reserved for internal TDLib usage.
+        self.conversion: str = get_object(kwargs.get('conversion'))
+        # Expected size of the generated file, in bytes; 0 if unknown.
+        self.expected_size: int = get_object(kwargs.get('expected_size'))
@@ -0,0 +1,261 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class InputInlineQueryResult(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class InputInlineQueryResultAnimation(InputInlineQueryResult):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Unique identifier of the query result.
+        self.id: str = get_object(kwargs.get('id'))
+        # Title of the query result.
+        self.title: str = get_object(kwargs.get('title'))
+        # URL of the result thumbnail (JPEG, GIF, or MPEG4), if it exists.
+        self.thumbnail_url: str = get_object(kwargs.get('thumbnail_url'))
+        # MIME type of the video thumbnail. If non-empty, must be one of &quot;image/jpeg&quot;, &quot;image/gif&quot; and &quot;video/mp4&quot;.
+        self.thumbnail_mime_type: str = get_object(kwargs.get('thumbnail_mime_type'))
+        # The URL of the video file (file size must not exceed 1MB).
+        self.video_url: str = get_object(kwargs.get('video_url'))
+        # MIME type of the video file. Must be one of &quot;image/gif&quot; and &quot;video/mp4&quot;.
+        self.video_mime_type: str = get_object(kwargs.get('video_mime_type'))
+        # Duration of the video, in seconds.
+        self.video_duration: int = get_object(kwargs.get('video_duration'))
+        # Width of the video.
+        self.video_width: int = get_object(kwargs.get('video_width'))
+        # Height of the video.
+        self.video_height: int = get_object(kwargs.get('video_height'))
+        # The message reply markup; pass null if none. Must be of type replyMarkupInlineKeyboard or null.
+        self.reply_markup: ReplyMarkup = get_object(kwargs.get('reply_markup'))
+        # The content of the message to be sent. Must be one of the following types: inputMessageText, inputMessageAnimation, inputMessageInvoice, inputMessageLocation, inputMessageVenue or inputMessageContact.
+        self.input_message_content: InputMessageContent = get_object(kwargs.get('input_message_content'))
+
+
+class InputInlineQueryResultArticle(InputInlineQueryResult):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Unique identifier of the query result.
+        self.id: str = get_object(kwargs.get('id'))
+        # URL of the result, if it exists.
+        self.url: str = get_object(kwargs.get('url'))
+        # True, if the URL must be not shown.
+        self.hide_url: bool = get_object(kwargs.get('hide_url'))
+        # Title of the result.
+        self.title: str = get_object(kwargs.get('title'))
+        # A short description of the result.
+        self.description: str = get_object(kwargs.get('description'))
+        # URL of the result thumbnail, if it exists.
+        self.thumbnail_url: str = get_object(kwargs.get('thumbnail_url'))
+        # Thumbnail width, if known.
+        self.thumbnail_width: int = get_object(kwargs.get('thumbnail_width'))
+        # Thumbnail height, if known.
+        self.thumbnail_height: int = get_object(kwargs.get('thumbnail_height'))
+        # The message reply markup; pass null if none. Must be of type replyMarkupInlineKeyboard or null.
+        self.reply_markup: ReplyMarkup = get_object(kwargs.get('reply_markup'))
+        # The content of the message to be sent. Must be one of the following types: inputMessageText, inputMessageInvoice, inputMessageLocation, inputMessageVenue or inputMessageContact.
+        self.input_message_content: InputMessageContent = get_object(kwargs.get('input_message_content'))
+
+
+class InputInlineQueryResultAudio(InputInlineQueryResult):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Unique identifier of the query result.
+        self.id: str = get_object(kwargs.get('id'))
+        # Title of the audio file.
+        self.title: str = get_object(kwargs.get('title'))
+        # Performer of the audio file.
+        self.performer: str = get_object(kwargs.get('performer'))
+        # The URL of the audio file.
+        self.audio_url: str = get_object(kwargs.get('audio_url'))
+        # Audio file duration, in seconds.
+        self.audio_duration: int = get_object(kwargs.get('audio_duration'))
+        # The message reply markup; pass null if none. Must be of type replyMarkupInlineKeyboard or null.
+        self.reply_markup: ReplyMarkup = get_object(kwargs.get('reply_markup'))
+        # The content of the message to be sent. Must be one of the following types: inputMessageText, inputMessageAudio, inputMessageInvoice, inputMessageLocation, inputMessageVenue or inputMessageContact.
+        self.input_message_content: InputMessageContent = get_object(kwargs.get('input_message_content'))
+
+
+class InputInlineQueryResultContact(InputInlineQueryResult):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Unique identifier of the query result.
+        self.id: str = get_object(kwargs.get('id'))
+        # User contact.
+        self.contact: Contact = get_object(kwargs.get('contact'))
+        # URL of the result thumbnail, if it exists.
+        self.thumbnail_url: str = get_object(kwargs.get('thumbnail_url'))
+        # Thumbnail width, if known.
+        self.thumbnail_width: int = get_object(kwargs.get('thumbnail_width'))
+        # Thumbnail height, if known.
+        self.thumbnail_height: int = get_object(kwargs.get('thumbnail_height'))
+        # The message reply markup; pass null if none. Must be of type replyMarkupInlineKeyboard or null.
+        self.reply_markup: ReplyMarkup = get_object(kwargs.get('reply_markup'))
+        # The content of the message to be sent. Must be one of the following types: inputMessageText, inputMessageInvoice, inputMessageLocation, inputMessageVenue or inputMessageContact.
+        self.input_message_content: InputMessageContent = get_object(kwargs.get('input_message_content'))
+
+
+class InputInlineQueryResultDocument(InputInlineQueryResult):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Unique identifier of the query result.
+        self.id: str = get_object(kwargs.get('id'))
+        # Title of the resulting file.
+        self.title: str = get_object(kwargs.get('title'))
+        # Short description of the result, if known.
+        self.description: str = get_object(kwargs.get('description'))
+        # URL of the file.
+        self.document_url: str = get_object(kwargs.get('document_url'))
+        # MIME type of the file content; only &quot;application/pdf&quot; and &quot;application/zip&quot; are currently allowed.
+        self.mime_type: str = get_object(kwargs.get('mime_type'))
+        # The URL of the file thumbnail, if it exists.
+        self.thumbnail_url: str = get_object(kwargs.get('thumbnail_url'))
+        # Width of the thumbnail.
+        self.thumbnail_width: int = get_object(kwargs.get('thumbnail_width'))
+        # Height of the thumbnail.
+        self.thumbnail_height: int = get_object(kwargs.get('thumbnail_height'))
+        # The message reply markup; pass null if none. Must be of type replyMarkupInlineKeyboard or null.
+        self.reply_markup: ReplyMarkup = get_object(kwargs.get('reply_markup'))
+        # The content of the message to be sent. Must be one of the following types: inputMessageText, inputMessageDocument, inputMessageInvoice, inputMessageLocation, inputMessageVenue or inputMessageContact.
+        self.input_message_content: InputMessageContent = get_object(kwargs.get('input_message_content'))
+
+
+class InputInlineQueryResultGame(InputInlineQueryResult):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Unique identifier of the query result.
+        self.id: str = get_object(kwargs.get('id'))
+        # Short name of the game.
+        self.game_short_name: str = get_object(kwargs.get('game_short_name'))
+        # The message reply markup; pass null if none. Must be of type replyMarkupInlineKeyboard or null.
+        self.reply_markup: ReplyMarkup = get_object(kwargs.get('reply_markup'))
+
+
+class InputInlineQueryResultLocation(InputInlineQueryResult):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Unique identifier of the query result.
+        self.id: str = get_object(kwargs.get('id'))
+        # Location result.
+        self.location: Location = get_object(kwargs.get('location'))
+        # Amount of time relative to the message sent time until the location can be updated, in seconds.
+        self.live_period: int = get_object(kwargs.get('live_period'))
+        # Title of the result.
+        self.title: str = get_object(kwargs.get('title'))
+        # URL of the result thumbnail, if it exists.
+        self.thumbnail_url: str = get_object(kwargs.get('thumbnail_url'))
+        # Thumbnail width, if known.
+        self.thumbnail_width: int = get_object(kwargs.get('thumbnail_width'))
+        # Thumbnail height, if known.
+        self.thumbnail_height: int = get_object(kwargs.get('thumbnail_height'))
+        # The message reply markup; pass null if none. Must be of type replyMarkupInlineKeyboard or null.
+        self.reply_markup: ReplyMarkup = get_object(kwargs.get('reply_markup'))
+        # The content of the message to be sent. Must be one of the following types: inputMessageText, inputMessageInvoice, inputMessageLocation, inputMessageVenue or inputMessageContact.
+        self.input_message_content: InputMessageContent = get_object(kwargs.get('input_message_content'))
+
+
+class InputInlineQueryResultPhoto(InputInlineQueryResult):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Unique identifier of the query result.
+        self.id: str = get_object(kwargs.get('id'))
+        # Title of the result, if known.
+        self.title: str = get_object(kwargs.get('title'))
+        # A short description of the result, if known.
+        self.description: str = get_object(kwargs.get('description'))
+        # URL of the photo thumbnail, if it exists.
+        self.thumbnail_url: str = get_object(kwargs.get('thumbnail_url'))
+        # The URL of the JPEG photo (photo size must not exceed 5MB).
+        self.photo_url: str = get_object(kwargs.get('photo_url'))
+        # Width of the photo.
+        self.photo_width: int = get_object(kwargs.get('photo_width'))
+        # Height of the photo.
+        self.photo_height: int = get_object(kwargs.get('photo_height'))
+        # The message reply markup; pass null if none. Must be of type replyMarkupInlineKeyboard or null.
+        self.reply_markup: ReplyMarkup = get_object(kwargs.get('reply_markup'))
+        # The content of the message to be sent. Must be one of the following types: inputMessageText, inputMessagePhoto, inputMessageInvoice, inputMessageLocation, inputMessageVenue or inputMessageContact.
+        self.input_message_content: InputMessageContent = get_object(kwargs.get('input_message_content'))
+
+
+class InputInlineQueryResultSticker(InputInlineQueryResult):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Unique identifier of the query result.
+        self.id: str = get_object(kwargs.get('id'))
+        # URL of the sticker thumbnail, if it exists.
+        self.thumbnail_url: str = get_object(kwargs.get('thumbnail_url'))
+        # The URL of the WEBP, TGS, or WEBM sticker (sticker file size must not exceed 5MB).
+        self.sticker_url: str = get_object(kwargs.get('sticker_url'))
+        # Width of the sticker.
+        self.sticker_width: int = get_object(kwargs.get('sticker_width'))
+        # Height of the sticker.
+        self.sticker_height: int = get_object(kwargs.get('sticker_height'))
+        # The message reply markup; pass null if none. Must be of type replyMarkupInlineKeyboard or null.
+        self.reply_markup: ReplyMarkup = get_object(kwargs.get('reply_markup'))
+        # The content of the message to be sent. Must be one of the following types: inputMessageText, inputMessageSticker, inputMessageInvoice, inputMessageLocation, inputMessageVenue or inputMessageContact.
+        self.input_message_content: InputMessageContent = get_object(kwargs.get('input_message_content'))
+
+
+class InputInlineQueryResultVenue(InputInlineQueryResult):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Unique identifier of the query result.
+        self.id: str = get_object(kwargs.get('id'))
+        # Venue result.
+        self.venue: Venue = get_object(kwargs.get('venue'))
+        # URL of the result thumbnail, if it exists.
+        self.thumbnail_url: str = get_object(kwargs.get('thumbnail_url'))
+        # Thumbnail width, if known.
+        self.thumbnail_width: int = get_object(kwargs.get('thumbnail_width'))
+        # Thumbnail height, if known.
+        self.thumbnail_height: int = get_object(kwargs.get('thumbnail_height'))
+        # The message reply markup; pass null if none. Must be of type replyMarkupInlineKeyboard or null.
+        self.reply_markup: ReplyMarkup = get_object(kwargs.get('reply_markup'))
+        # The content of the message to be sent. Must be one of the following types: inputMessageText, inputMessageInvoice, inputMessageLocation, inputMessageVenue or inputMessageContact.
+        self.input_message_content: InputMessageContent = get_object(kwargs.get('input_message_content'))
+
+
+class InputInlineQueryResultVideo(InputInlineQueryResult):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Unique identifier of the query result.
+        self.id: str = get_object(kwargs.get('id'))
+        # Title of the result.
+        self.title: str = get_object(kwargs.get('title'))
+        # A short description of the result, if known.
+        self.description: str = get_object(kwargs.get('description'))
+        # The URL of the video thumbnail (JPEG), if it exists.
+        self.thumbnail_url: str = get_object(kwargs.get('thumbnail_url'))
+        # URL of the embedded video player or video file.
+        self.video_url: str = get_object(kwargs.get('video_url'))
+        # MIME type of the content of the video URL, only &quot;text/html&quot; or &quot;video/mp4&quot; are currently supported.
+        self.mime_type: str = get_object(kwargs.get('mime_type'))
+        # Width of the video.
+        self.video_width: int = get_object(kwargs.get('video_width'))
+        # Height of the video.
+        self.video_height: int = get_object(kwargs.get('video_height'))
+        # Video duration, in seconds.
+        self.video_duration: int = get_object(kwargs.get('video_duration'))
+        # The message reply markup; pass null if none. Must be of type replyMarkupInlineKeyboard or null.
+        self.reply_markup: ReplyMarkup = get_object(kwargs.get('reply_markup'))
+        # The content of the message to be sent. Must be one of the following types: inputMessageText, inputMessageVideo, inputMessageInvoice, inputMessageLocation, inputMessageVenue or inputMessageContact.
+        self.input_message_content: InputMessageContent = get_object(kwargs.get('input_message_content'))
+
+
+class InputInlineQueryResultVoiceNote(InputInlineQueryResult):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Unique identifier of the query result.
+        self.id: str = get_object(kwargs.get('id'))
+        # Title of the voice note.
+        self.title: str = get_object(kwargs.get('title'))
+        # The URL of the voice note file.
+        self.voice_note_url: str = get_object(kwargs.get('voice_note_url'))
+        # Duration of the voice note, in seconds.
+        self.voice_note_duration: int = get_object(kwargs.get('voice_note_duration'))
+        # The message reply markup; pass null if none. Must be of type replyMarkupInlineKeyboard or null.
+        self.reply_markup: ReplyMarkup = get_object(kwargs.get('reply_markup'))
+        # The content of the message to be sent. Must be one of the following types: inputMessageText, inputMessageVoiceNote, inputMessageInvoice, inputMessageLocation, inputMessageVenue or inputMessageContact.
+        self.input_message_content: InputMessageContent = get_object(kwargs.get('input_message_content'))
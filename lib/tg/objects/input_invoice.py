@@ -0,0 +1,30 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class InputInvoice(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class InputInvoiceMessage(InputInvoice):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Chat identifier of the message.
+        self.chat_id: int = get_object(kwargs.get('chat_id'))
+        # Message identifier.
+        self.message_id: int = get_object(kwargs.get('message_id'))
+
+
+class InputInvoiceName(InputInvoice):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Name of the invoice.
+        self.name: str = get_object(kwargs.get('name'))
+
+
+class InputInvoiceTelegram(InputInvoice):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Transaction purpose.
+        self.purpose: TelegramPaymentPurpose = get_object(kwargs.get('purpose'))
@@ -0,0 +1,271 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class InputMessageContent(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class InputMessageText(InputMessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Formatted text to be sent; 0-getOption(&quot;message_text_length_max&quot;) characters. Only Bold, Italic, Underline, Strikethrough, Spoiler, CustomEmoji, BlockQuote, Code, Pre, PreCode, TextUrl and MentionName entities are allowed to be specified manually.
+        self.text: FormattedText = get_object(kwargs.get('text'))
+        # Options to be used for generation of a link preview; pass null to use default link preview options.
+        self.link_preview_options: LinkPreviewOptions = get_object(kwargs.get('link_preview_options'))
+        # True, if a chat message draft must be deleted.
+        self.clear_draft: bool = get_object(kwargs.get('clear_draft'))
+
+
+class InputMessageAnimation(InputMessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Animation file to be sent.
+        self.animation: InputFile = get_object(kwargs.get('animation'))
+        # Animation thumbnail; pass null to skip thumbnail uploading.
+        self.thumbnail: InputThumbnail = get_object(kwargs.get('thumbnail'))
+        # File identifiers of the stickers added to the animation, if applicable.
+        self.added_sticker_file_ids: list[int] = get_object(kwargs.get('added_sticker_file_ids'))
+        # Duration of the animation, in seconds.
+        self.duration: int = get_object(kwargs.get('duration'))
+        # Width of the animation; may be replaced by the server.
+        self.width: int = get_object(kwargs.get('width'))
+        # Height of the animation; may be replaced by the server.
+        self.height: int = get_object(kwargs.get('height'))
+        # Animation caption; pass null to use an empty caption; 0-getOption(&quot;message_caption_length_max&quot;) characters.
+        self.caption: FormattedText = get_object(kwargs.get('caption'))
+        # True, if the animation preview must be covered by a spoiler animation; not supported in secret chats.
+        self.has_spoiler: bool = get_object(kwargs.get('has_spoiler'))
+
+
+class InputMessageAudio(InputMessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Audio file to be sent.
+        self.audio: InputFile = get_object(kwargs.get('audio'))
+        # Thumbnail of the cover for the album; pass null to skip thumbnail uploading.
+        self.album_cover_thumbnail: InputThumbnail = get_object(kwargs.get('album_cover_thumbnail'))
+        # Duration of the audio, in seconds; may be replaced by the server.
+        self.duration: int = get_object(kwargs.get('duration'))
+        # Title of the audio; 0-64 characters; may be replaced by the server.
+        self.title: str = get_object(kwargs.get('title'))
+        # Performer of the audio; 0-64 characters, may be replaced by the server.
+        self.performer: str = get_object(kwargs.get('performer'))
+        # Audio caption; pass null to use an empty caption; 0-getOption(&quot;message_caption_length_max&quot;) characters.
+        self.caption: FormattedText = get_object(kwargs.get('caption'))
+
+
+class InputMessageDocument(InputMessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Document to be sent.
+        self.document: InputFile = get_object(kwargs.get('document'))
+        # Document thumbnail; pass null to skip thumbnail uploading.
+        self.thumbnail: InputThumbnail = get_object(kwargs.get('thumbnail'))
+        # Pass true to disable automatic file type detection and send the document as a file. Always true for files sent to secret chats.
+        self.disable_content_type_detection: bool = get_object(kwargs.get('disable_content_type_detection'))
+        # Document caption; pass null to use an empty caption; 0-getOption(&quot;message_caption_length_max&quot;) characters.
+        self.caption: FormattedText = get_object(kwargs.get('caption'))
+
+
+class InputMessagePhoto(InputMessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Photo to send. The photo must be at most 10 MB in size. The photo's width and height must not exceed 10000 in total. Width and height ratio must be at most 20.
+        self.photo: InputFile = get_object(kwargs.get('photo'))
+        # Photo thumbnail to be sent; pass null to skip thumbnail uploading. The thumbnail is sent to the other party only in secret chats.
+        self.thumbnail: InputThumbnail = get_object(kwargs.get('thumbnail'))
+        # File identifiers of the stickers added to the photo, if applicable.
+        self.added_sticker_file_ids: list[int] = get_object(kwargs.get('added_sticker_file_ids'))
+        # Photo width.
+        self.width: int = get_object(kwargs.get('width'))
+        # Photo height.
+        self.height: int = get_object(kwargs.get('height'))
+        # Photo caption; pass null to use an empty caption; 0-getOption(&quot;message_caption_length_max&quot;) characters.
+        self.caption: FormattedText = get_object(kwargs.get('caption'))
+        # Photo self-destruct type; pass null if none; private chats only.
+        self.self_destruct_type: MessageSelfDestructType = get_object(kwargs.get('self_destruct_type'))
+        # True, if the photo preview must be covered by a spoiler animation; not supported in secret chats.
+        self.has_spoiler: bool = get_object(kwargs.get('has_spoiler'))
+
+
+class InputMessageSticker(InputMessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Sticker to be sent.
+        self.sticker: InputFile = get_object(kwargs.get('sticker'))
+        # Sticker thumbnail; pass null to skip thumbnail uploading.
+        self.thumbnail: InputThumbnail = get_object(kwargs.get('thumbnail'))
+        # Sticker width.
+        self.width: int = get_object(kwargs.get('width'))
+        # Sticker height.
+        self.height: int = get_object(kwargs.get('height'))
+        # Emoji used to choose the sticker.
+        self.emoji: str = get_object(kwargs.get('emoji'))
+
+
+class InputMessageVideo(InputMessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Video to be sent.
+        self.video: InputFile = get_object(kwargs.get('video'))
+        # Video thumbnail; pass null to skip thumbnail uploading.
+        self.thumbnail: InputThumbnail = get_object(kwargs.get('thumbnail'))
+        # File identifiers of the stickers added to the video, if applicable.
+        self.added_sticker_file_ids: list[int] = get_object(kwargs.get('added_sticker_file_ids'))
+        # Duration of the video, in seconds.
+        self.duration: int = get_object(kwargs.get('duration'))
+        # Video width.
+        self.width: int = get_object(kwargs.get('width'))
+        # Video height.
+        self.height: int = get_object(kwargs.get('height'))
+        # True, if the video is supposed to be streamed.
+        self.supports_streaming: bool = get_object(kwargs.get('supports_streaming'))
+        # Video caption; pass null to use an empty caption; 0-getOption(&quot;message_caption_length_max&quot;) characters.
+        self.caption: FormattedText = get_object(kwargs.get('caption'))
+        # Video self-destruct type; pass null if none; private chats only.
+        self.self_destruct_type: MessageSelfDestructType = get_object(kwargs.get('self_destruct_type'))
+        # True, if the video preview must be covered by a spoiler animation; not supported in secret chats.
+        self.has_spoiler: bool = get_object(kwargs.get('has_spoiler'))
+
+
+class InputMessageVideoNote(InputMessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Video note to be sent.
+        self.video_note: InputFile = get_object(kwargs.get('video_note'))
+        # Video thumbnail; pass null to skip thumbnail uploading.
+        self.thumbnail: InputThumbnail = get_object(kwargs.get('thumbnail'))
+        # Duration of the video, in seconds.
+        self.duration: int = get_object(kwargs.get('duration'))
+        # Video width and height; must be positive and not greater than 640.
+        self.length: int = get_object(kwargs.get('length'))
+
+
+class InputMessageVoiceNote(InputMessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Voice note to be sent.
+        self.voice_note: InputFile = get_object(kwargs.get('voice_note'))
+        # Duration of the voice note, in seconds.
+        self.duration: int = get_object(kwargs.get('duration'))
+        # Waveform representation of the voice note in 5-bit format.
+        self.waveform: bytes = get_object(kwargs.get('waveform'))
+        # Voice note caption; pass null to use an empty caption; 0-getOption(&quot;message_caption_length_max&quot;) characters.
+        self.caption: FormattedText = get_object(kwargs.get('caption'))
+
+
+class InputMessageLocation(InputMessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Location to be sent.
+        self.location: Location = get_object(kwargs.get('location'))
+        # Period for which the location can be updated, in seconds; must be between 60 and 86400 for a live location and 0 otherwise.
+        self.live_period: int = get_object(kwargs.get('live_period'))
+        # For live locations, a direction in which the location moves, in degrees; 1-360. Pass 0 if unknown.
+        self.heading: int = get_object(kwargs.get('heading'))
+        # For live locations, a maximum distance to another chat member for proximity alerts, in meters (0-100000). Pass 0 if the notification is disabled. Can't be enabled in channels and Saved Messages.
+        self.proximity_alert_radius: int = get_object(kwargs.get('proximity_alert_radius'))
+
+
+class InputMessageVenue(InputMessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Venue to send.
+        self.venue: Venue = get_object(kwargs.get('venue'))
+
+
+class InputMessageContact(InputMessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Contact to send.
+        self.contact: Contact = get_object(kwargs.get('contact'))
+
+
+class InputMessageDice(InputMessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Emoji on which the dice throw animation is based.
+        self.emoji: str = get_object(kwargs.get('emoji'))
+        # True, if the chat message draft must be deleted.
+        self.clear_draft: bool = get_object(kwargs.get('clear_draft'))
+
+
+class InputMessageGame(InputMessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # User identifier of the bot that owns the game.
+        self.bot_user_id: int = get_object(kwargs.get('bot_user_id'))
+        # Short name of the game.
+        self.game_short_name: str = get_object(kwargs.get('game_short_name'))
+
+
+class InputMessageInvoice(InputMessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Invoice.
+        self.invoice: Invoice = get_object(kwargs.get('invoice'))
+        # Product title; 1-32 characters.
+        self.title: str = get_object(kwargs.get('title'))
+        # Product description; 0-255 characters.
+        self.description: str = get_object(kwargs.get('description'))
+        # Product photo URL; optional.
+        self.photo_url: str = get_object(kwargs.get('photo_url'))
+        # Product photo size.
+        self.photo_size: int = get_object(kwargs.get('photo_size'))
+        # Product photo width.
+        self.photo_width: int = get_object(kwargs.get('photo_width'))
+        # Product photo height.
+        self.photo_height: int = get_object(kwargs.get('photo_height'))
+        # The invoice payload.
+        self.payload: bytes = get_object(kwargs.get('payload'))
+        # Payment provider token.
+        self.provider_token: str = get_object(kwargs.get('provider_token'))
+        # JSON-encoded data about the invoice, which will be shared with the payment provider.
+        self.provider_data: str = get_object(kwargs.get('provider_data'))
+        # Unique invoice bot deep link parameter for the generation of this invoice. If empty, it would be possible to pay directly from forwards of the invoice message.
+        self.start_parameter: str = get_object(kwargs.get('start_parameter'))
+        # The content of extended media attached to the invoice. The content of the message to be sent. Must be one of the following types: inputMessagePhoto, inputMessageVideo.
+        self.extended_media_content: InputMessageContent = get_object(kwargs.get('extended_media_content'))
+
+
+class InputMessagePoll(InputMessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Poll question; 1-255 characters (up to 300 characters for bots).
+        self.question: str = get_object(kwargs.get('question'))
+        # List of poll answer options, 2-10 strings 1-100 characters each.
+        self.options: list[str] = get_object(kwargs.get('options'))
+        # True, if the poll voters are anonymous. Non-anonymous polls can't be sent or forwarded to channels.
+        self.is_anonymous: bool = get_object(kwargs.get('is_anonymous'))
+        # Type of the poll.
+        self.type: PollType = get_object(kwargs.get('type'))
+        # Amount of time the poll will be active after creation, in seconds; for bots only.
+        self.open_period: int = get_object(kwargs.get('open_period'))
+        # Point in time (Unix timestamp) when the poll will automatically be closed; for bots only.
+        self.close_date: int = get_object(kwargs.get('close_date'))
+        # True, if the poll needs to be sent already closed; for bots only.
+        self.is_closed: bool = get_object(kwargs.get('is_closed'))
+
+
+class InputMessageStory(InputMessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Identifier of the chat that posted the story.
+        self.story_sender_chat_id: int = get_object(kwargs.get('story_sender_chat_id'))
+        # Story identifier.
+        self.story_id: int = get_object(kwargs.get('story_id'))
+
+
+class InputMessageForwarded(InputMessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Identifier for the chat this forwarded message came from.
+        self.from_chat_id: int = get_object(kwargs.get('from_chat_id'))
+        # Identifier of the message to forward. A message can be forwarded only if message.can_be_forwarded.
+        self.message_id: int = get_object(kwargs.get('message_id'))
+        # True, if a game message is being shared from a launched game; applies only to game messages.
+        self.in_game_share: bool = get_object(kwargs.get('in_game_share'))
+        # Options to be used to copy content of the message without reference to the original sender; pass null to forward the message as usual.
+        self.copy_options: MessageCopyOptions = get_object(kwargs.get('copy_options'))
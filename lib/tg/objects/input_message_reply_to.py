@@ -0,0 +1,27 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class InputMessageReplyTo(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class InputMessageReplyToMessage(InputMessageReplyTo):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The identifier of the chat to which the message to be replied belongs; pass 0 if the message to be replied is in the same chat. Must always be 0 for replies in secret chats. A message can be replied in another chat or topic only if message.can_be_replied_in_another_chat.
+        self.chat_id: int = get_object(kwargs.get('chat_id'))
+        # The identifier of the message to be replied in the same or the specified chat.
+        self.message_id: int = get_object(kwargs.get('message_id'))
+        # Quote from the message to be replied; pass null if none. Must always be null for replies in secret chats.
+        self.quote: InputTextQuote = get_object(kwargs.get('quote'))
+
+
+class InputMessageReplyToStory(InputMessageReplyTo):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The identifier of the sender of the story. Currently, stories can be replied only in the sender's chat.
+        self.story_sender_chat_id: int = get_object(kwargs.get('story_sender_chat_id'))
+        # The identifier of the story.
+        self.story_id: int = get_object(kwargs.get('story_id'))
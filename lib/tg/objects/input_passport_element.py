@@ -0,0 +1,98 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class InputPassportElement(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class InputPassportElementPersonalDetails(InputPassportElement):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Personal details of the user.
+        self.personal_details: PersonalDetails = get_object(kwargs.get('personal_details'))
+
+
+class InputPassportElementPassport(InputPassportElement):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The passport to be saved.
+        self.passport: InputIdentityDocument = get_object(kwargs.get('passport'))
+
+
+class InputPassportElementDriverLicense(InputPassportElement):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The driver license to be saved.
+        self.driver_license: InputIdentityDocument = get_object(kwargs.get('driver_license'))
+
+
+class InputPassportElementIdentityCard(InputPassportElement):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The identity card to be saved.
+        self.identity_card: InputIdentityDocument = get_object(kwargs.get('identity_card'))
+
+
+class InputPassportElementInternalPassport(InputPassportElement):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The internal passport to be saved.
+        self.internal_passport: InputIdentityDocument = get_object(kwargs.get('internal_passport'))
+
+
+class InputPassportElementAddress(InputPassportElement):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The address to be saved.
+        self.address: Address = get_object(kwargs.get('address'))
+
+
+class InputPassportElementUtilityBill(InputPassportElement):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The utility bill to be saved.
+        self.utility_bill: InputPersonalDocument = get_object(kwargs.get('utility_bill'))
+
+
+class InputPassportElementBankStatement(InputPassportElement):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The bank statement to be saved.
+        self.bank_statement: InputPersonalDocument = get_object(kwargs.get('bank_statement'))
+
+
+class InputPassportElementRentalAgreement(InputPassportElement):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The rental agreement to be saved.
+        self.rental_agreement: InputPersonalDocument = get_object(kwargs.get('rental_agreement'))
+
+
+class InputPassportElementPassportRegistration(InputPassportElement):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The passport registration page to be saved.
+        self.passport_registration: InputPersonalDocument = get_object(kwargs.get('passport_registration'))
+
+
+class InputPassportElementTemporaryRegistration(InputPassportElement):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The temporary registration document to be saved.
+        self.temporary_registration: InputPersonalDocument = get_object(kwargs.get('temporary_registration'))
+
+
+class InputPassportElementPhoneNumber(InputPassportElement):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The phone number to be saved.
+        self.phone_number: str = get_object(kwargs.get('phone_number'))
+
+
+class InputPassportElementEmailAddress(InputPassportElement):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The email address to be saved.
+        self.email_address: str = get_object(kwargs.get('email_address'))
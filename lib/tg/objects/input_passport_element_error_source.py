@@ -0,0 +1,72 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class InputPassportElementErrorSource(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class InputPassportElementErrorSourceUnspecified(InputPassportElementErrorSource):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Current hash of the entire element.
+        self.element_hash: bytes = get_object(kwargs.get('element_hash'))
+
+
+class InputPassportElementErrorSourceDataField(InputPassportElementErrorSource):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Field name.
+        self.field_name: str = get_object(kwargs.get('field_name'))
+        # Current data hash.
+        self.data_hash: bytes = get_object(kwargs.get('data_hash'))
+
+
+class InputPassportElementErrorSourceFrontSide(InputPassportElementErrorSource):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Current hash of the file containing the front side.
+        self.file_hash: bytes = get_object(kwargs.get('file_hash'))
+
+
+class InputPassportElementErrorSourceReverseSide(InputPassportElementErrorSource):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Current hash of the file containing the reverse side.
+        self.file_hash: bytes = get_object(kwargs.get('file_hash'))
+
+
+class InputPassportElementErrorSourceSelfie(InputPassportElementErrorSource):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Current hash of the file containing the selfie.
+        self.file_hash: bytes = get_object(kwargs.get('file_hash'))
+
+
+class InputPassportElementErrorSourceTranslationFile(InputPassportElementErrorSource):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Current hash of the file containing the translation.
+        self.file_hash: bytes = get_object(kwargs.get('file_hash'))
+
+
+class InputPassportElementErrorSourceTranslationFiles(InputPassportElementErrorSource):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Current hashes of all files with the translation.
+        self.file_hashes: list[bytes] = get_object(kwargs.get('file_hashes'))
+
+
+class InputPassportElementErrorSourceFile(InputPassportElementErrorSource):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Current hash of the file which has the error.
+        self.file_hash: bytes = get_object(kwargs.get('file_hash'))
+
+
+class InputPassportElementErrorSourceFiles(InputPassportElementErrorSource):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Current hashes of all attached files.
+        self.file_hashes: list[bytes] = get_object(kwargs.get('file_hashes'))
@@ -0,0 +1,11 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class InputPersonalDocument(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # List of files containing the pages of the document.
+        self.files: list[InputFile] = get_object(kwargs.get('files'))
+        # List of files containing a certified English translation of the document.
+        self.translation: list[InputFile] = get_object(kwargs.get('translation'))
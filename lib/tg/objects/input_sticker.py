@@ -0,0 +1,15 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class InputSticker(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # File with the sticker; must fit in a 512x512 square. For WEBP stickers the file must be in WEBP or PNG format, which will be converted to WEBP server-side. See https://core.telegram.org/animated_stickers\#technical-requirements for technical requirements.
+        self.sticker: InputFile = get_object(kwargs.get('sticker'))
+        # String with 1-20 emoji corresponding to the sticker.
+        self.emojis: str = get_object(kwargs.get('emojis'))
+        # Position where the mask is placed; pass null if not specified.
+        self.mask_position: MaskPosition = get_object(kwargs.get('mask_position'))
+        # List of up to 20 keywords with total length up to 64 characters, which can be used to find the sticker.
+        self.keywords: list[str] = get_object(kwargs.get('keywords'))
@@ -0,0 +1,11 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class InputStoryArea(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Position of the area.
+        self.position: StoryAreaPosition = get_object(kwargs.get('position'))
+        # Type of the area.
+        self.type: InputStoryAreaType = get_object(kwargs.get('type'))
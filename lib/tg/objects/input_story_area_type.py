@@ -0,0 +1,52 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class InputStoryAreaType(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class InputStoryAreaTypeLocation(InputStoryAreaType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The location.
+        self.location: Location = get_object(kwargs.get('location'))
+
+
+class InputStoryAreaTypeFoundVenue(InputStoryAreaType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Identifier of the inline query, used to found the venue.
+        self.query_id: int = get_object(kwargs.get('query_id'))
+        # Identifier of the inline query result.
+        self.result_id: str = get_object(kwargs.get('result_id'))
+
+
+class InputStoryAreaTypePreviousVenue(InputStoryAreaType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Provider of the venue.
+        self.venue_provider: str = get_object(kwargs.get('venue_provider'))
+        # Identifier of the venue in the provider database.
+        self.venue_id: str = get_object(kwargs.get('venue_id'))
+
+
+class InputStoryAreaTypeSuggestedReaction(InputStoryAreaType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Type of the reaction.
+        self.reaction_type: ReactionType = get_object(kwargs.get('reaction_type'))
+        # True, if reaction has a dark background.
+        self.is_dark: bool = get_object(kwargs.get('is_dark'))
+        # True, if reaction corner is flipped.
+        self.is_flipped: bool = get_object(kwargs.get('is_flipped'))
+
+
+class InputStoryAreaTypeMessage(InputStoryAreaType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Identifier of the chat with the message. Currently, the chat must be a supergroup or a channel chat.
+        self.chat_id: int = get_object(kwargs.get('chat_id'))
+        # Identifier of the message. Only successfully sent non-scheduled messages can be specified.
+        self.message_id: int = get_object(kwargs.get('message_id'))
@@ -0,0 +1,29 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class InputStoryContent(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class InputStoryContentPhoto(InputStoryContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Photo to send. The photo must be at most 10 MB in size. The photo size must be 1080x1920.
+        self.photo: InputFile = get_object(kwargs.get('photo'))
+        # File identifiers of the stickers added to the photo, if applicable.
+        self.added_sticker_file_ids: list[int] = get_object(kwargs.get('added_sticker_file_ids'))
+
+
+class InputStoryContentVideo(InputStoryContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Video to be sent. The video size must be 720x1280. The video must be streamable and stored in MPEG4 format, after encoding with x265 codec and key frames added each second.
+        self.video: InputFile = get_object(kwargs.get('video'))
+        # File identifiers of the stickers added to the video, if applicable.
+        self.added_sticker_file_ids: list[int] = get_object(kwargs.get('added_sticker_file_ids'))
+        # Precise duration of the video, in seconds; 0-60.
+        self.duration: float = get_object(kwargs.get('duration'))
+        # True, if the video has no sound.
+        self.is_animation: bool = get_object(kwargs.get('is_animation'))
@@ -0,0 +1,11 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class InputTextQuote(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Text of the quote; 0-getOption(&quot;message_reply_quote_length_max&quot;) characters. Only Bold, Italic, Underline, Strikethrough, Spoiler, and CustomEmoji entities are allowed to be kept and must be kept in the quote.
+        self.text: FormattedText = get_object(kwargs.get('text'))
+        # Quote position in the original message in UTF-16 code units.
+        self.position: int = get_object(kwargs.get('position'))
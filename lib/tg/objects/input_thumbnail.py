@@ -0,0 +1,13 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class InputThumbnail(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Thumbnail file to send. Sending thumbnails by file_id is currently not supported.
+        self.thumbnail: InputFile = get_object(kwargs.get('thumbnail'))
+        # Thumbnail width, usually shouldn't exceed 320. Use 0 if unknown.
+        self.width: int = get_object(kwargs.get('width'))
+        # Thumbnail height, usually shouldn't exceed 320. Use 0 if unknown.
+        self.height: int = get_object(kwargs.get('height'))
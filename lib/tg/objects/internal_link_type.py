@@ -0,0 +1,332 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class InternalLinkType(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class InternalLinkTypeActiveSessions(InternalLinkType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class InternalLinkTypeAttachmentMenuBot(InternalLinkType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Target chat to be opened.
+        self.target_chat: TargetChat = get_object(kwargs.get('target_chat'))
+        # Username of the bot.
+        self.bot_username: str = get_object(kwargs.get('bot_username'))
+        # URL to be passed to openWebApp.
+        self.url: str = get_object(kwargs.get('url'))
+
+
+class InternalLinkTypeAuthenticationCode(InternalLinkType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The authentication code.
+        self.code: str = get_object(kwargs.get('code'))
+
+
+class InternalLinkTypeBackground(InternalLinkType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Name of the background.
+        self.background_name: str = get_object(kwargs.get('background_name'))
+
+
+class InternalLinkTypeBotAddToChannel(InternalLinkType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Username of the bot.
+        self.bot_username: str = get_object(kwargs.get('bot_username'))
+        # Expected administrator rights for the bot.
+        self.administrator_rights: ChatAdministratorRights = get_object(kwargs.get('administrator_rights'))
+
+
+class InternalLinkTypeBotStart(InternalLinkType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Username of the bot.
+        self.bot_username: str = get_object(kwargs.get('bot_username'))
+        # The parameter to be passed to sendBotStartMessage.
+        self.start_parameter: str = get_object(kwargs.get('start_parameter'))
+        # True, if sendBotStartMessage must be called automatically without showing the START button.
+        self.autostart: bool = get_object(kwargs.get('autostart'))
+
+
+class InternalLinkTypeBotStartInGroup(InternalLinkType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Username of the bot.
+        self.bot_username: str = get_object(kwargs.get('bot_username'))
+        # The parameter to be passed to sendBotStartMessage.
+        self.start_parameter: str = get_object(kwargs.get('start_parameter'))
+        # Expected administrator rights for the bot; may be null.
+        self.administrator_rights: ChatAdministratorRights = get_object(kwargs.get('administrator_rights'))
+
+
+class InternalLinkTypeChangePhoneNumber(InternalLinkType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class InternalLinkTypeChatBoost(InternalLinkType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # URL to be passed to getChatBoostLinkInfo.
+        self.url: str = get_object(kwargs.get('url'))
+
+
+class InternalLinkTypeChatFolderInvite(InternalLinkType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Internal representation of the invite link.
+        self.invite_link: str = get_object(kwargs.get('invite_link'))
+
+
+class InternalLinkTypeChatFolderSettings(InternalLinkType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class InternalLinkTypeChatInvite(InternalLinkType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Internal representation of the invite link.
+        self.invite_link: str = get_object(kwargs.get('invite_link'))
+
+
+class InternalLinkTypeDefaultMessageAutoDeleteTimerSettings(InternalLinkType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class InternalLinkTypeEditProfileSettings(InternalLinkType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class InternalLinkTypeGame(InternalLinkType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Username of the bot that owns the game.
+        self.bot_username: str = get_object(kwargs.get('bot_username'))
+        # Short name of the game.
+        self.game_short_name: str = get_object(kwargs.get('game_short_name'))
+
+
+class InternalLinkTypeInstantView(InternalLinkType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # URL to be passed to getWebPageInstantView.
+        self.url: str = get_object(kwargs.get('url'))
+        # An URL to open if getWebPageInstantView fails.
+        self.fallback_url: str = get_object(kwargs.get('fallback_url'))
+
+
+class InternalLinkTypeInvoice(InternalLinkType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Name of the invoice.
+        self.invoice_name: str = get_object(kwargs.get('invoice_name'))
+
+
+class InternalLinkTypeLanguagePack(InternalLinkType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Language pack identifier.
+        self.language_pack_id: str = get_object(kwargs.get('language_pack_id'))
+
+
+class InternalLinkTypeLanguageSettings(InternalLinkType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class InternalLinkTypeMessage(InternalLinkType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # URL to be passed to getMessageLinkInfo.
+        self.url: str = get_object(kwargs.get('url'))
+
+
+class InternalLinkTypeMessageDraft(InternalLinkType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Message draft text.
+        self.text: FormattedText = get_object(kwargs.get('text'))
+        # True, if the first line of the text contains a link. If true, the input field needs to be focused and the text after the link must be selected.
+        self.contains_link: bool = get_object(kwargs.get('contains_link'))
+
+
+class InternalLinkTypePassportDataRequest(InternalLinkType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # User identifier of the service's bot.
+        self.bot_user_id: int = get_object(kwargs.get('bot_user_id'))
+        # Telegram Passport element types requested by the service.
+        self.scope: str = get_object(kwargs.get('scope'))
+        # Service's public key.
+        self.public_key: str = get_object(kwargs.get('public_key'))
+        # Unique request identifier provided by the service.
+        self.nonce: str = get_object(kwargs.get('nonce'))
+        # An HTTP URL to open once the request is finished, canceled, or failed with the parameters tg_passport=success, tg_passport=cancel, or tg_passport=error&amp;error=... respectively. If empty, then onActivityResult method must be used to return response on Android, or the link tgbot{bot_user_id}://passport/success or tgbot{bot_user_id}://passport/cancel must be opened otherwise.
+        self.callback_url: str = get_object(kwargs.get('callback_url'))
+
+
+class InternalLinkTypePhoneNumberConfirmation(InternalLinkType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Hash value from the link.
+        self.hash: str = get_object(kwargs.get('hash'))
+        # Phone number value from the link.
+        self.phone_number: str = get_object(kwargs.get('phone_number'))
+
+
+class InternalLinkTypePremiumFeatures(InternalLinkType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Referrer specified in the link.
+        self.referrer: str = get_object(kwargs.get('referrer'))
+
+
+class InternalLinkTypePremiumGift(InternalLinkType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Referrer specified in the link.
+        self.referrer: str = get_object(kwargs.get('referrer'))
+
+
+class InternalLinkTypePremiumGiftCode(InternalLinkType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The Telegram Premium gift code.
+        self.code: str = get_object(kwargs.get('code'))
+
+
+class InternalLinkTypePrivacyAndSecuritySettings(InternalLinkType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class InternalLinkTypeProxy(InternalLinkType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Proxy server domain or IP address.
+        self.server: str = get_object(kwargs.get('server'))
+        # Proxy server port.
+        self.port: int = get_object(kwargs.get('port'))
+        # Type of the proxy.
+        self.type: ProxyType = get_object(kwargs.get('type'))
+
+
+class InternalLinkTypePublicChat(InternalLinkType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Username of the chat.
+        self.chat_username: str = get_object(kwargs.get('chat_username'))
+
+
+class InternalLinkTypeQrCodeAuthentication(InternalLinkType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class InternalLinkTypeRestorePurchases(InternalLinkType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class InternalLinkTypeSettings(InternalLinkType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class InternalLinkTypeSideMenuBot(InternalLinkType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Username of the bot.
+        self.bot_username: str = get_object(kwargs.get('bot_username'))
+        # URL to be passed to getWebAppUrl.
+        self.url: str = get_object(kwargs.get('url'))
+
+
+class InternalLinkTypeStickerSet(InternalLinkType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Name of the sticker set.
+        self.sticker_set_name: str = get_object(kwargs.get('sticker_set_name'))
+        # True, if the sticker set is expected to contain custom emoji.
+        self.expect_custom_emoji: bool = get_object(kwargs.get('expect_custom_emoji'))
+
+
+class InternalLinkTypeStory(InternalLinkType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Username of the sender of the story.
+        self.story_sender_username: str = get_object(kwargs.get('story_sender_username'))
+        # Story identifier.
+        self.story_id: int = get_object(kwargs.get('story_id'))
+
+
+class InternalLinkTypeTheme(InternalLinkType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Name of the theme.
+        self.theme_name: str = get_object(kwargs.get('theme_name'))
+
+
+class InternalLinkTypeThemeSettings(InternalLinkType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class InternalLinkTypeUnknownDeepLink(InternalLinkType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Link to be passed to getDeepLinkInfo.
+        self.link: str = get_object(kwargs.get('link'))
+
+
+class InternalLinkTypeUnsupportedProxy(InternalLinkType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class InternalLinkTypeUserPhoneNumber(InternalLinkType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Phone number of the user.
+        self.phone_number: str = get_object(kwargs.get('phone_number'))
+
+
+class InternalLinkTypeUserToken(InternalLinkType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The token.
+        self.token: str = get_object(kwargs.get('token'))
+
+
+class InternalLinkTypeVideoChat(InternalLinkType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Username of the chat with the video chat.
+        self.chat_username: str = get_object(kwargs.get('chat_username'))
+        # If non-empty, invite hash to be used to join the video chat without being muted by administrators.
+        self.invite_hash: str = get_object(kwargs.get('invite_hash'))
+        # True, if the video chat is expected to be a live stream in a channel or a broadcast group.
+        self.is_live_stream: bool = get_object(kwargs.get('is_live_stream'))
+
+
+class InternalLinkTypeWebApp(InternalLinkType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Username of the bot that owns the Web App.
+        self.bot_username: str = get_object(kwargs.get('bot_username'))
+        # Short name of the Web App.
+        self.web_app_short_name: str = get_object(kwargs.get('web_app_short_name'))
+        # Start parameter to be passed to getWebAppLinkUrl.
+        self.start_parameter: str = get_object(kwargs.get('start_parameter'))
@@ -0,0 +1,22 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object
+
+
+class InviteLinkChatType(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class InviteLinkChatTypeBasicGroup(InviteLinkChatType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class InviteLinkChatTypeSupergroup(InviteLinkChatType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class InviteLinkChatTypeChannel(InviteLinkChatType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
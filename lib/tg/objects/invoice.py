@@ -0,0 +1,35 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class Invoice(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # ISO 4217 currency code.
+        self.currency: str = get_object(kwargs.get('currency'))
+        # A list of objects used to calculate the total price of the product.
+        self.price_parts: list[LabeledPricePart] = get_object(kwargs.get('price_parts'))
+        # The maximum allowed amount of tip in the smallest units of the currency.
+        self.max_tip_amount: int = get_object(kwargs.get('max_tip_amount'))
+        # Suggested amounts of tip in the smallest units of the currency.
+        self.suggested_tip_amounts: list[int] = get_object(kwargs.get('suggested_tip_amounts'))
+        # An HTTP URL with terms of service for recurring payments. If non-empty, the invoice payment will result in recurring payments and the user must accept the terms of service before allowed to pay.
+        self.recurring_payment_terms_of_service_url: str = get_object(kwargs.get('recurring_payment_terms_of_service_url'))
+        # An HTTP URL with terms of service for non-recurring payments. If non-empty, then the user must accept the terms of service before allowed to pay.
+        self.terms_of_service_url: str = get_object(kwargs.get('terms_of_service_url'))
+        # True, if the payment is a test payment.
+        self.is_test: bool = get_object(kwargs.get('is_test'))
+        # True, if the user's name is needed for payment.
+        self.need_name: bool = get_object(kwargs.get('need_name'))
+        # True, if the user's phone number is needed for payment.
+        self.need_phone_number: bool = get_object(kwargs.get('need_phone_number'))
+        # True, if the user's email address is needed for payment.
+        self.need_email_address: bool = get_object(kwargs.get('need_email_address'))
+        # True, if the user's shipping address is needed for payment.
+        self.need_shipping_address: bool = get_object(kwargs.get('need_shipping_address'))
+        # True, if the user's phone number will be sent to the provider.
+        self.send_phone_number_to_provider: bool = get_object(kwargs.get('send_phone_number_to_provider'))
+        # True, if the user's email address will be sent to the provider.
+        self.send_email_address_to_provider: bool = get_object(kwargs.get('send_email_address_to_provider'))
+        # True, if the total price depends on the shipping method.
+        self.is_flexible: bool = get_object(kwargs.get('is_flexible'))
@@ -0,0 +1,11 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class JsonObjectMember(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Member's key.
+        self.key: str = get_object(kwargs.get('key'))
+        # Member's value.
+        self.value: JsonValue = get_object(kwargs.get('value'))
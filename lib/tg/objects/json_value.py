@@ -0,0 +1,47 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class JsonValue(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class JsonValueNull(JsonValue):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class JsonValueBoolean(JsonValue):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The value.
+        self.value: bool = get_object(kwargs.get('value'))
+
+
+class JsonValueNumber(JsonValue):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The value.
+        self.value: float = get_object(kwargs.get('value'))
+
+
+class JsonValueString(JsonValue):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The value.
+        self.value: str = get_object(kwargs.get('value'))
+
+
+class JsonValueArray(JsonValue):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The list of array elements.
+        self.values: list[JsonValue] = get_object(kwargs.get('values'))
+
+
+class JsonValueObject(JsonValue):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The list of object members.
+        self.members: list[JsonObjectMember] = get_object(kwargs.get('members'))
@@ -0,0 +1,80 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class KeyboardButtonType(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class KeyboardButtonTypeText(KeyboardButtonType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class KeyboardButtonTypeRequestPhoneNumber(KeyboardButtonType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class KeyboardButtonTypeRequestLocation(KeyboardButtonType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class KeyboardButtonTypeRequestPoll(KeyboardButtonType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # If true, only regular polls must be allowed to create.
+        self.force_regular: bool = get_object(kwargs.get('force_regular'))
+        # If true, only polls in quiz mode must be allowed to create.
+        self.force_quiz: bool = get_object(kwargs.get('force_quiz'))
+
+
+class KeyboardButtonTypeRequestUsers(KeyboardButtonType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Unique button identifier.
+        self.id: int = get_object(kwargs.get('id'))
+        # True, if the shared users must or must not be bots.
+        self.restrict_user_is_bot: bool = get_object(kwargs.get('restrict_user_is_bot'))
+        # True, if the shared users must be bots; otherwise, the shared users must not be bots. Ignored if restrict_user_is_bot is false.
+        self.user_is_bot: bool = get_object(kwargs.get('user_is_bot'))
+        # True, if the shared users must or must not be Telegram Premium users.
+        self.restrict_user_is_premium: bool = get_object(kwargs.get('restrict_user_is_premium'))
+        # True, if the shared users must be Telegram Premium users; otherwise, the shared users must not be Telegram Premium users. Ignored if restrict_user_is_premium is false.
+        self.user_is_premium: bool = get_object(kwargs.get('user_is_premium'))
+        # The maximum number of users to share.
+        self.max_quantity: int = get_object(kwargs.get('max_quantity'))
+
+
+class KeyboardButtonTypeRequestChat(KeyboardButtonType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Unique button identifier.
+        self.id: int = get_object(kwargs.get('id'))
+        # True, if the chat must be a channel; otherwise, a basic group or a supergroup chat is shared.
+        self.chat_is_channel: bool = get_object(kwargs.get('chat_is_channel'))
+        # True, if the chat must or must not be a forum supergroup.
+        self.restrict_chat_is_forum: bool = get_object(kwargs.get('restrict_chat_is_forum'))
+        # True, if the chat must be a forum supergroup; otherwise, the chat must not be a forum supergroup. Ignored if restrict_chat_is_forum is false.
+        self.chat_is_forum: bool = get_object(kwargs.get('chat_is_forum'))
+        # True, if the chat must or must not have a username.
+        self.restrict_chat_has_username: bool = get_object(kwargs.get('restrict_chat_has_username'))
+        # True, if the chat must have a username; otherwise, the chat must not have a username. Ignored if restrict_chat_has_username is false.
+        self.chat_has_username: bool = get_object(kwargs.get('chat_has_username'))
+        # True, if the chat must be created by the current user.
+        self.chat_is_created: bool = get_object(kwargs.get('chat_is_created'))
+        # Expected user administrator rights in the chat; may be null if they aren't restricted.
+        self.user_administrator_rights: ChatAdministratorRights = get_object(kwargs.get('user_administrator_rights'))
+        # Expected bot administrator rights in the chat; may be null if they aren't restricted.
+        self.bot_administrator_rights: ChatAdministratorRights = get_object(kwargs.get('bot_administrator_rights'))
+        # True, if the bot must be a member of the chat; for basic group and supergroup chats only.
+        self.bot_is_member: bool = get_object(kwargs.get('bot_is_member'))
+
+
+class KeyboardButtonTypeWebApp(KeyboardButtonType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # An HTTP URL to pass to getWebAppUrl.
+        self.url: str = get_object(kwargs.get('url'))
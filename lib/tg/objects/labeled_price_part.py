@@ -0,0 +1,11 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class LabeledPricePart(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Label for this portion of the product price.
+        self.label: str = get_object(kwargs.get('label'))
+        # Currency amount in the smallest units of the currency.
+        self.amount: int = get_object(kwargs.get('amount'))
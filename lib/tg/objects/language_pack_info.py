@@ -0,0 +1,33 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class LanguagePackInfo(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Unique language pack identifier.
+        self.id: str = get_object(kwargs.get('id'))
+        # Identifier of a base language pack; may be empty. If a string is missed in the language pack, then it must be fetched from base language pack. Unsupported in custom language packs.
+        self.base_language_pack_id: str = get_object(kwargs.get('base_language_pack_id'))
+        # Language name.
+        self.name: str = get_object(kwargs.get('name'))
+        # Name of the language in that language.
+        self.native_name: str = get_object(kwargs.get('native_name'))
+        # A language code to be used to apply plural forms. See https://www.unicode.org/cldr/charts/latest/supplemental/language_plural_rules.html for more information.
+        self.plural_code: str = get_object(kwargs.get('plural_code'))
+        # True, if the language pack is official.
+        self.is_official: bool = get_object(kwargs.get('is_official'))
+        # True, if the language pack strings are RTL.
+        self.is_rtl: bool = get_object(kwargs.get('is_rtl'))
+        # True, if the language pack is a beta language pack.
+        self.is_beta: bool = get_object(kwargs.get('is_beta'))
+        # True, if the language pack is installed by the current user.
+        self.is_installed: bool = get_object(kwargs.get('is_installed'))
+        # Total number of non-deleted strings from the language pack.
+        self.total_string_count: int = get_object(kwargs.get('total_string_count'))
+        # Total number of translated strings from the language pack.
+        self.translated_string_count: int = get_object(kwargs.get('translated_string_count'))
+        # Total number of non-deleted strings from the language pack available locally.
+        self.local_string_count: int = get_object(kwargs.get('local_string_count'))
+        # Link to language translation interface; empty for custom local language packs.
+        self.translation_url: str = get_object(kwargs.get('translation_url'))
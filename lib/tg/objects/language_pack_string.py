@@ -0,0 +1,11 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class LanguagePackString(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # String key.
+        self.key: str = get_object(kwargs.get('key'))
+        # String value; pass null if the string needs to be taken from the built-in English language pack.
+        self.value: LanguagePackStringValue = get_object(kwargs.get('value'))
@@ -0,0 +1,36 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class LanguagePackStringValue(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class LanguagePackStringValueOrdinary(LanguagePackStringValue):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # String value.
+        self.value: str = get_object(kwargs.get('value'))
+
+
+class LanguagePackStringValuePluralized(LanguagePackStringValue):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Value for zero objects.
+        self.zero_value: str = get_object(kwargs.get('zero_value'))
+        # Value for one object.
+        self.one_value: str = get_object(kwargs.get('one_value'))
+        # Value for two objects.
+        self.two_value: str = get_object(kwargs.get('two_value'))
+        # Value for few objects.
+        self.few_value: str = get_object(kwargs.get('few_value'))
+        # Value for many objects.
+        self.many_value: str = get_object(kwargs.get('many_value'))
+        # Default value.
+        self.other_value: str = get_object(kwargs.get('other_value'))
+
+
+class LanguagePackStringValueDeleted(LanguagePackStringValue):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
@@ -0,0 +1,9 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class LanguagePackStrings(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # A list of language pack strings.
+        self.strings: list[LanguagePackString] = get_object(kwargs.get('strings'))
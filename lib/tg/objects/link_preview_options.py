@@ -0,0 +1,17 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class LinkPreviewOptions(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # True, if link preview must be disabled.
+        self.is_disabled: bool = get_object(kwargs.get('is_disabled'))
+        # URL to use for link preview. If empty, then the first URL found in the message text will be used.
+        self.url: str = get_object(kwargs.get('url'))
+        # True, if shown media preview must be small; ignored in secret chats or if the URL isn't explicitly specified.
+        self.force_small_media: bool = get_object(kwargs.get('force_small_media'))
+        # True, if shown media preview must be large; ignored in secret chats or if the URL isn't explicitly specified.
+        self.force_large_media: bool = get_object(kwargs.get('force_large_media'))
+        # True, if link preview must be shown above message text; otherwise, the link preview will be shown below the message text; ignored in secret chats.
+        self.show_above_text: bool = get_object(kwargs.get('show_above_text'))
@@ -0,0 +1,23 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class LocalFile(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Local path to the locally available file part; may be empty.
+        self.path: str = get_object(kwargs.get('path'))
+        # True, if it is possible to download or generate the file.
+        self.can_be_downloaded: bool = get_object(kwargs.get('can_be_downloaded'))
+        # True, if the file can be deleted.
+        self.can_be_deleted: bool = get_object(kwargs.get('can_be_deleted'))
+        # True, if the file is currently being downloaded (or a local copy is being generated by some other means).
+        self.is_downloading_active: bool = get_object(kwargs.get('is_downloading_active'))
+        # True, if the local copy is fully available.
+        self.is_downloading_completed: bool = get_object(kwargs.get('is_downloading_completed'))
+        # Download will be started from this offset. downloaded_prefix_size is calculated from this offset.
+        self.download_offset: int = get_object(kwargs.get('download_offset'))
+        # If is_downloading_completed is false, then only some prefix of the file starting from download_offset is ready to be read. downloaded_prefix_size is the size of that prefix in bytes.
+        self.downloaded_prefix_size: int = get_object(kwargs.get('downloaded_prefix_size'))
+        # Total downloaded file size, in bytes. Can be used only for calculating download progress. The actual file size may be bigger, and some parts of it may contain garbage.
+        self.downloaded_size: int = get_object(kwargs.get('downloaded_size'))
@@ -0,0 +1,9 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class LocalizationTargetInfo(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # List of available language packs for this application.
+        self.language_packs: list[LanguagePackInfo] = get_object(kwargs.get('language_packs'))
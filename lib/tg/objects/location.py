@@ -0,0 +1,13 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class Location(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Latitude of the location in degrees; as defined by the sender.
+        self.latitude: float = get_object(kwargs.get('latitude'))
+        # Longitude of the location, in degrees; as defined by the sender.
+        self.longitude: float = get_object(kwargs.get('longitude'))
+        # The estimated horizontal accuracy of the location, in meters; as defined by the sender. 0 if unknown.
+        self.horizontal_accuracy: float = get_object(kwargs.get('horizontal_accuracy'))
@@ -0,0 +1,28 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class LogStream(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class LogStreamDefault(LogStream):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class LogStreamFile(LogStream):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Path to the file to where the internal TDLib log will be written.
+        self.path: str = get_object(kwargs.get('path'))
+        # The maximum size of the file to where the internal TDLib log is written before the file will automatically be rotated, in bytes.
+        self.max_file_size: int = get_object(kwargs.get('max_file_size'))
+        # Pass true to additionally redirect stderr to the log file. Ignored on Windows.
+        self.redirect_stderr: bool = get_object(kwargs.get('redirect_stderr'))
+
+
+class LogStreamEmpty(LogStream):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
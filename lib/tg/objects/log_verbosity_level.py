@@ -0,0 +1,9 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class LogVerbosityLevel(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Log verbosity level.
+        self.verbosity_level: int = get_object(kwargs.get('verbosity_level'))
@@ -0,0 +1,29 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class LoginUrlInfo(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class LoginUrlInfoOpen(LoginUrlInfo):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The URL to open.
+        self.url: str = get_object(kwargs.get('url'))
+        # True, if there is no need to show an ordinary open URL confirmation.
+        self.skip_confirmation: bool = get_object(kwargs.get('skip_confirmation'))
+
+
+class LoginUrlInfoRequestConfirmation(LoginUrlInfo):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # An HTTP URL to be opened.
+        self.url: str = get_object(kwargs.get('url'))
+        # A domain of the URL.
+        self.domain: str = get_object(kwargs.get('domain'))
+        # User identifier of a bot linked with the website.
+        self.bot_user_id: int = get_object(kwargs.get('bot_user_id'))
+        # True, if the user must be asked for the permission to the bot to send them messages.
+        self.request_write_access: bool = get_object(kwargs.get('request_write_access'))
@@ -0,0 +1,27 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object
+
+
+class MaskPoint(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class MaskPointForehead(MaskPoint):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class MaskPointEyes(MaskPoint):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class MaskPointMouth(MaskPoint):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class MaskPointChin(MaskPoint):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
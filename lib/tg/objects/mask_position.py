@@ -0,0 +1,15 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class MaskPosition(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Part of the face, relative to which the mask is placed.
+        self.point: MaskPoint = get_object(kwargs.get('point'))
+        # Shift by X-axis measured in widths of the mask scaled to the face size, from left to right. (For example, -1.0 will place the mask just to the left of the default mask position.)
+        self.x_shift: float = get_object(kwargs.get('x_shift'))
+        # Shift by Y-axis measured in heights of the mask scaled to the face size, from top to bottom. (For example, 1.0 will place the mask just below the default mask position.)
+        self.y_shift: float = get_object(kwargs.get('y_shift'))
+        # Mask scaling coefficient. (For example, 2.0 means a doubled size.)
+        self.scale: float = get_object(kwargs.get('scale'))
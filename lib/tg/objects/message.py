@@ -0,0 +1,87 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class Message(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Message identifier; unique for the chat to which the message belongs.
+        self.id: int = get_object(kwargs.get('id'))
+        # Identifier of the sender of the message.
+        self.sender_id: MessageSender = get_object(kwargs.get('sender_id'))
+        # Chat identifier.
+        self.chat_id: int = get_object(kwargs.get('chat_id'))
+        # The sending state of the message; may be null if the message isn't being sent and didn't fail to be sent.
+        self.sending_state: MessageSendingState = get_object(kwargs.get('sending_state'))
+        # The scheduling state of the message; may be null if the message isn't scheduled.
+        self.scheduling_state: MessageSchedulingState = get_object(kwargs.get('scheduling_state'))
+        # True, if the message is outgoing.
+        self.is_outgoing: bool = get_object(kwargs.get('is_outgoing'))
+        # True, if the message is pinned.
+        self.is_pinned: bool = get_object(kwargs.get('is_pinned'))
+        # True, if the message can be edited. For live location and poll messages this fields shows whether editMessageLiveLocation or stopPoll can be used with this message by the application.
+        self.can_be_edited: bool = get_object(kwargs.get('can_be_edited'))
+        # True, if the message can be forwarded.
+        self.can_be_forwarded: bool = get_object(kwargs.get('can_be_forwarded'))
+        # True, if the message can be replied in another chat or topic.
+        self.can_be_replied_in_another_chat: bool = get_object(kwargs.get('can_be_replied_in_another_chat'))
+        # True, if content of the message can be saved locally or copied.
+        self.can_be_saved: bool = get_object(kwargs.get('can_be_saved'))
+        # True, if the message can be deleted only for the current user while other users will continue to see it.
+        self.can_be_deleted_only_for_self: bool = get_object(kwargs.get('can_be_deleted_only_for_self'))
+        # True, if the message can be deleted for all users.
+        self.can_be_deleted_for_all_users: bool = get_object(kwargs.get('can_be_deleted_for_all_users'))
+        # True, if the list of added reactions is available through getMessageAddedReactions.
+        self.can_get_added_reactions: bool = get_object(kwargs.get('can_get_added_reactions'))
+        # True, if the message statistics are available through getMessageStatistics.
+        self.can_get_statistics: bool = get_object(kwargs.get('can_get_statistics'))
+        # True, if information about the message thread is available through getMessageThread and getMessageThreadHistory.
+        self.can_get_message_thread: bool = get_object(kwargs.get('can_get_message_thread'))
+        # True, if chat members already viewed the message can be received through getMessageViewers.
+        self.can_get_viewers: bool = get_object(kwargs.get('can_get_viewers'))
+        # True, if media timestamp links can be generated for media timestamp entities in the message text, caption or web page description through getMessageLink.
+        self.can_get_media_timestamp_links: bool = get_object(kwargs.get('can_get_media_timestamp_links'))
+        # True, if reactions on the message can be reported through reportMessageReactions.
+        self.can_report_reactions: bool = get_object(kwargs.get('can_report_reactions'))
+        # True, if media timestamp entities refers to a media in this message as opposed to a media in the replied message.
+        self.has_timestamped_media: bool = get_object(kwargs.get('has_timestamped_media'))
+        # True, if the message is a channel post. All messages to channels are channel posts, all other messages are not channel posts.
+        self.is_channel_post: bool = get_object(kwargs.get('is_channel_post'))
+        # True, if the message is a forum topic message.
+        self.is_topic_message: bool = get_object(kwargs.get('is_topic_message'))
+        # True, if the message contains an unread mention for the current user.
+        self.contains_unread_mention: bool = get_object(kwargs.get('contains_unread_mention'))
+        # Point in time (Unix timestamp) when the message was sent.
+        self.date: int = get_object(kwargs.get('date'))
+        # Point in time (Unix timestamp) when the message was last edited.
+        self.edit_date: int = get_object(kwargs.get('edit_date'))
+        # Information about the initial message sender; may be null if none or unknown.
+        self.forward_info: MessageForwardInfo = get_object(kwargs.get('forward_info'))
+        # Information about the initial message for messages created with importMessages; may be null if the message isn't imported.
+        self.import_info: MessageImportInfo = get_object(kwargs.get('import_info'))
+        # Information about interactions with the message; may be null if none.
+        self.interaction_info: MessageInteractionInfo = get_object(kwargs.get('interaction_info'))
+        # Information about unread reactions added to the message.
+        self.unread_reactions: list[UnreadReaction] = get_object(kwargs.get('unread_reactions'))
+        # Information about the message or the story this message is replying to; may be null if none.
+        self.reply_to: MessageReplyTo = get_object(kwargs.get('reply_to'))
+        # If non-zero, the identifier of the message thread the message belongs to; unique within the chat to which the message belongs.
+        self.message_thread_id: int = get_object(kwargs.get('message_thread_id'))
+        # The message's self-destruct type; may be null if none.
+        self.self_destruct_type: MessageSelfDestructType = get_object(kwargs.get('self_destruct_type'))
+        # Time left before the message self-destruct timer expires, in seconds; 0 if self-destruction isn't scheduled yet.
+        self.self_destruct_in: float = get_object(kwargs.get('self_destruct_in'))
+        # Time left before the message will be automatically deleted by message_auto_delete_time setting of the chat, in seconds; 0 if never.
+        self.auto_delete_in: float = get_object(kwargs.get('auto_delete_in'))
+        # If non-zero, the user identifier of the bot through which this message was sent.
+        self.via_bot_user_id: int = get_object(kwargs.get('via_bot_user_id'))
+        # For channel posts and anonymous group messages, optional author signature.
+        self.author_signature: str = get_object(kwargs.get('author_signature'))
+        # Unique identifier of an album this message belongs to. Only audios, documents, photos and videos can be grouped together in albums.
+        self.media_album_id: int = get_object(kwargs.get('media_album_id'))
+        # If non-empty, contains a human-readable description of the reason why access to this message must be restricted.
+        self.restriction_reason: str = get_object(kwargs.get('restriction_reason'))
+        # Content of the message.
+        self.content: MessageContent = get_object(kwargs.get('content'))
+        # Reply markup for the message; may be null if none.
+        self.reply_markup: ReplyMarkup = get_object(kwargs.get('reply_markup'))
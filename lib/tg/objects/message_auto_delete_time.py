@@ -0,0 +1,9 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class MessageAutoDeleteTime(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Message auto-delete time, in seconds. If 0, then messages aren't deleted automatically.
+        self.time: int = get_object(kwargs.get('time'))
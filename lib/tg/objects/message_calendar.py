@@ -0,0 +1,11 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class MessageCalendar(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Total number of found messages.
+        self.total_count: int = get_object(kwargs.get('total_count'))
+        # Information about messages sent.
+        self.days: list[MessageCalendarDay] = get_object(kwargs.get('days'))
@@ -0,0 +1,11 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class MessageCalendarDay(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Total number of found messages sent on the day.
+        self.total_count: int = get_object(kwargs.get('total_count'))
+        # First message sent on the day.
+        self.message: Message = get_object(kwargs.get('message'))
@@ -0,0 +1,655 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class MessageContent(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class MessageText(MessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Text of the message.
+        self.text: FormattedText = get_object(kwargs.get('text'))
+        # A link preview attached to the message; may be null.
+        self.web_page: WebPage = get_object(kwargs.get('web_page'))
+        # Options which were used for generation of the link preview; may be null if default options were used.
+        self.link_preview_options: LinkPreviewOptions = get_object(kwargs.get('link_preview_options'))
+
+
+class MessageAnimation(MessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The animation description.
+        self.animation: Animation = get_object(kwargs.get('animation'))
+        # Animation caption.
+        self.caption: FormattedText = get_object(kwargs.get('caption'))
+        # True, if the animation preview must be covered by a spoiler animation.
+        self.has_spoiler: bool = get_object(kwargs.get('has_spoiler'))
+        # True, if the animation thumbnail must be blurred and the animation must be shown only while tapped.
+        self.is_secret: bool = get_object(kwargs.get('is_secret'))
+
+
+class MessageAudio(MessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The audio description.
+        self.audio: Audio = get_object(kwargs.get('audio'))
+        # Audio caption.
+        self.caption: FormattedText = get_object(kwargs.get('caption'))
+
+
+class MessageDocument(MessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The document description.
+        self.document: Document = get_object(kwargs.get('document'))
+        # Document caption.
+        self.caption: FormattedText = get_object(kwargs.get('caption'))
+
+
+class MessagePhoto(MessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The photo.
+        self.photo: Photo = get_object(kwargs.get('photo'))
+        # Photo caption.
+        self.caption: FormattedText = get_object(kwargs.get('caption'))
+        # True, if the photo preview must be covered by a spoiler animation.
+        self.has_spoiler: bool = get_object(kwargs.get('has_spoiler'))
+        # True, if the photo must be blurred and must be shown only while tapped.
+        self.is_secret: bool = get_object(kwargs.get('is_secret'))
+
+
+class MessageExpiredPhoto(MessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class MessageSticker(MessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The sticker description.
+        self.sticker: Sticker = get_object(kwargs.get('sticker'))
+        # True, if premium animation of the sticker must be played.
+        self.is_premium: bool = get_object(kwargs.get('is_premium'))
+
+
+class MessageVideo(MessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The video description.
+        self.video: Video = get_object(kwargs.get('video'))
+        # Video caption.
+        self.caption: FormattedText = get_object(kwargs.get('caption'))
+        # True, if the video preview must be covered by a spoiler animation.
+        self.has_spoiler: bool = get_object(kwargs.get('has_spoiler'))
+        # True, if the video thumbnail must be blurred and the video must be shown only while tapped.
+        self.is_secret: bool = get_object(kwargs.get('is_secret'))
+
+
+class MessageExpiredVideo(MessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class MessageVideoNote(MessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The video note description.
+        self.video_note: VideoNote = get_object(kwargs.get('video_note'))
+        # True, if at least one of the recipients has viewed the video note.
+        self.is_viewed: bool = get_object(kwargs.get('is_viewed'))
+        # True, if the video note thumbnail must be blurred and the video note must be shown only while tapped.
+        self.is_secret: bool = get_object(kwargs.get('is_secret'))
+
+
+class MessageVoiceNote(MessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The voice note description.
+        self.voice_note: VoiceNote = get_object(kwargs.get('voice_note'))
+        # Voice note caption.
+        self.caption: FormattedText = get_object(kwargs.get('caption'))
+        # True, if at least one of the recipients has listened to the voice note.
+        self.is_listened: bool = get_object(kwargs.get('is_listened'))
+
+
+class MessageLocation(MessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The location description.
+        self.location: Location = get_object(kwargs.get('location'))
+        # Time relative to the message send date, for which the location can be updated, in seconds.
+        self.live_period: int = get_object(kwargs.get('live_period'))
+        # Left time for which the location can be updated, in seconds. updateMessageContent is not sent when this field changes.
+        self.expires_in: int = get_object(kwargs.get('expires_in'))
+        # For live locations, a direction in which the location moves, in degrees; 1-360. If 0 the direction is unknown.
+        self.heading: int = get_object(kwargs.get('heading'))
+        # For live locations, a maximum distance to another chat member for proximity alerts, in meters (0-100000). 0 if the notification is disabled. Available only to the message sender.
+        self.proximity_alert_radius: int = get_object(kwargs.get('proximity_alert_radius'))
+
+
+class MessageVenue(MessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The venue description.
+        self.venue: Venue = get_object(kwargs.get('venue'))
+
+
+class MessageContact(MessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The contact description.
+        self.contact: Contact = get_object(kwargs.get('contact'))
+
+
+class MessageAnimatedEmoji(MessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The animated emoji.
+        self.animated_emoji: AnimatedEmoji = get_object(kwargs.get('animated_emoji'))
+        # The corresponding emoji.
+        self.emoji: str = get_object(kwargs.get('emoji'))
+
+
+class MessageDice(MessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The animated stickers with the initial dice animation; may be null if unknown. updateMessageContent will be sent when the sticker became known.
+        self.initial_state: DiceStickers = get_object(kwargs.get('initial_state'))
+        # The animated stickers with the final dice animation; may be null if unknown. updateMessageContent will be sent when the sticker became known.
+        self.final_state: DiceStickers = get_object(kwargs.get('final_state'))
+        # Emoji on which the dice throw animation is based.
+        self.emoji: str = get_object(kwargs.get('emoji'))
+        # The dice value. If the value is 0, the dice don't have final state yet.
+        self.value: int = get_object(kwargs.get('value'))
+        # Number of frame after which a success animation like a shower of confetti needs to be shown on updateMessageSendSucceeded.
+        self.success_animation_frame_number: int = get_object(kwargs.get('success_animation_frame_number'))
+
+
+class MessageGame(MessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The game description.
+        self.game: Game = get_object(kwargs.get('game'))
+
+
+class MessagePoll(MessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The poll description.
+        self.poll: Poll = get_object(kwargs.get('poll'))
+
+
+class MessageStory(MessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Identifier of the chat that posted the story.
+        self.story_sender_chat_id: int = get_object(kwargs.get('story_sender_chat_id'))
+        # Story identifier.
+        self.story_id: int = get_object(kwargs.get('story_id'))
+        # True, if the story was automatically forwarded because of a mention of the user.
+        self.via_mention: bool = get_object(kwargs.get('via_mention'))
+
+
+class MessageInvoice(MessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Product title.
+        self.title: str = get_object(kwargs.get('title'))
+        # Product description.
+        self.description: FormattedText = get_object(kwargs.get('description'))
+        # Product photo; may be null.
+        self.photo: Photo = get_object(kwargs.get('photo'))
+        # Currency for the product price.
+        self.currency: str = get_object(kwargs.get('currency'))
+        # Product total price in the smallest units of the currency.
+        self.total_amount: int = get_object(kwargs.get('total_amount'))
+        # Unique invoice bot start_parameter to be passed to getInternalLink.
+        self.start_parameter: str = get_object(kwargs.get('start_parameter'))
+        # True, if the invoice is a test invoice.
+        self.is_test: bool = get_object(kwargs.get('is_test'))
+        # True, if the shipping address must be specified.
+        self.need_shipping_address: bool = get_object(kwargs.get('need_shipping_address'))
+        # The identifier of the message with the receipt, after the product has been purchased.
+        self.receipt_message_id: int = get_object(kwargs.get('receipt_message_id'))
+        # Extended media attached to the invoice; may be null.
+        self.extended_media: MessageExtendedMedia = get_object(kwargs.get('extended_media'))
+
+
+class MessageCall(MessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # True, if the call was a video call.
+        self.is_video: bool = get_object(kwargs.get('is_video'))
+        # Reason why the call was discarded.
+        self.discard_reason: CallDiscardReason = get_object(kwargs.get('discard_reason'))
+        # Call duration, in seconds.
+        self.duration: int = get_object(kwargs.get('duration'))
+
+
+class MessageVideoChatScheduled(MessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Identifier of the video chat. The video chat can be received through the method getGroupCall.
+        self.group_call_id: int = get_object(kwargs.get('group_call_id'))
+        # Point in time (Unix timestamp) when the group call is supposed to be started by an administrator.
+        self.start_date: int = get_object(kwargs.get('start_date'))
+
+
+class MessageVideoChatStarted(MessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Identifier of the video chat. The video chat can be received through the method getGroupCall.
+        self.group_call_id: int = get_object(kwargs.get('group_call_id'))
+
+
+class MessageVideoChatEnded(MessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Call duration, in seconds.
+        self.duration: int = get_object(kwargs.get('duration'))
+
+
+class MessageInviteVideoChatParticipants(MessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Identifier of the video chat. The video chat can be received through the method getGroupCall.
+        self.group_call_id: int = get_object(kwargs.get('group_call_id'))
+        # Invited user identifiers.
+        self.user_ids: list[int] = get_object(kwargs.get('user_ids'))
+
+
+class MessageBasicGroupChatCreate(MessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Title of the basic group.
+        self.title: str = get_object(kwargs.get('title'))
+        # User identifiers of members in the basic group.
+        self.member_user_ids: list[int] = get_object(kwargs.get('member_user_ids'))
+
+
+class MessageSupergroupChatCreate(MessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Title of the supergroup or channel.
+        self.title: str = get_object(kwargs.get('title'))
+
+
+class MessageChatChangeTitle(MessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # New chat title.
+        self.title: str = get_object(kwargs.get('title'))
+
+
+class MessageChatChangePhoto(MessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # New chat photo.
+        self.photo: ChatPhoto = get_object(kwargs.get('photo'))
+
+
+class MessageChatDeletePhoto(MessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class MessageChatAddMembers(MessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # User identifiers of the new members.
+        self.member_user_ids: list[int] = get_object(kwargs.get('member_user_ids'))
+
+
+class MessageChatJoinByLink(MessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class MessageChatJoinByRequest(MessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class MessageChatDeleteMember(MessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # User identifier of the deleted chat member.
+        self.user_id: int = get_object(kwargs.get('user_id'))
+
+
+class MessageChatUpgradeTo(MessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Identifier of the supergroup to which the basic group was upgraded.
+        self.supergroup_id: int = get_object(kwargs.get('supergroup_id'))
+
+
+class MessageChatUpgradeFrom(MessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Title of the newly created supergroup.
+        self.title: str = get_object(kwargs.get('title'))
+        # The identifier of the original basic group.
+        self.basic_group_id: int = get_object(kwargs.get('basic_group_id'))
+
+
+class MessagePinMessage(MessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Identifier of the pinned message, can be an identifier of a deleted message or 0.
+        self.message_id: int = get_object(kwargs.get('message_id'))
+
+
+class MessageScreenshotTaken(MessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class MessageChatSetBackground(MessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Identifier of the message with a previously set same background; 0 if none. Can be an identifier of a deleted message.
+        self.old_background_message_id: int = get_object(kwargs.get('old_background_message_id'))
+        # The new background.
+        self.background: ChatBackground = get_object(kwargs.get('background'))
+        # True, if the background was set only for self.
+        self.only_for_self: bool = get_object(kwargs.get('only_for_self'))
+
+
+class MessageChatSetTheme(MessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # If non-empty, name of a new theme, set for the chat. Otherwise, chat theme was reset to the default one.
+        self.theme_name: str = get_object(kwargs.get('theme_name'))
+
+
+class MessageChatSetMessageAutoDeleteTime(MessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # New value auto-delete or self-destruct time, in seconds; 0 if disabled.
+        self.message_auto_delete_time: int = get_object(kwargs.get('message_auto_delete_time'))
+        # If not 0, a user identifier, which default setting was automatically applied.
+        self.from_user_id: int = get_object(kwargs.get('from_user_id'))
+
+
+class MessageForumTopicCreated(MessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Name of the topic.
+        self.name: str = get_object(kwargs.get('name'))
+        # Icon of the topic.
+        self.icon: ForumTopicIcon = get_object(kwargs.get('icon'))
+
+
+class MessageForumTopicEdited(MessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # If non-empty, the new name of the topic.
+        self.name: str = get_object(kwargs.get('name'))
+        # True, if icon's custom_emoji_id is changed.
+        self.edit_icon_custom_emoji_id: bool = get_object(kwargs.get('edit_icon_custom_emoji_id'))
+        # New unique identifier of the custom emoji shown on the topic icon; 0 if none. Must be ignored if edit_icon_custom_emoji_id is false.
+        self.icon_custom_emoji_id: int = get_object(kwargs.get('icon_custom_emoji_id'))
+
+
+class MessageForumTopicIsClosedToggled(MessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # True, if the topic was closed; otherwise, the topic was reopened.
+        self.is_closed: bool = get_object(kwargs.get('is_closed'))
+
+
+class MessageForumTopicIsHiddenToggled(MessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # True, if the topic was hidden; otherwise, the topic was unhidden.
+        self.is_hidden: bool = get_object(kwargs.get('is_hidden'))
+
+
+class MessageSuggestProfilePhoto(MessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The suggested chat photo. Use the method setProfilePhoto with inputChatPhotoPrevious to apply the photo.
+        self.photo: ChatPhoto = get_object(kwargs.get('photo'))
+
+
+class MessageCustomServiceAction(MessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Message text to be shown in the chat.
+        self.text: str = get_object(kwargs.get('text'))
+
+
+class MessageGameScore(MessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Identifier of the message with the game, can be an identifier of a deleted message.
+        self.game_message_id: int = get_object(kwargs.get('game_message_id'))
+        # Identifier of the game; may be different from the games presented in the message with the game.
+        self.game_id: int = get_object(kwargs.get('game_id'))
+        # New score.
+        self.score: int = get_object(kwargs.get('score'))
+
+
+class MessagePaymentSuccessful(MessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Identifier of the chat, containing the corresponding invoice message.
+        self.invoice_chat_id: int = get_object(kwargs.get('invoice_chat_id'))
+        # Identifier of the message with the corresponding invoice; can be 0 or an identifier of a deleted message.
+        self.invoice_message_id: int = get_object(kwargs.get('invoice_message_id'))
+        # Currency for the price of the product.
+        self.currency: str = get_object(kwargs.get('currency'))
+        # Total price for the product, in the smallest units of the currency.
+        self.total_amount: int = get_object(kwargs.get('total_amount'))
+        # True, if this is a recurring payment.
+        self.is_recurring: bool = get_object(kwargs.get('is_recurring'))
+        # True, if this is the first recurring payment.
+        self.is_first_recurring: bool = get_object(kwargs.get('is_first_recurring'))
+        # Name of the invoice; may be empty if unknown.
+        self.invoice_name: str = get_object(kwargs.get('invoice_name'))
+
+
+class MessagePaymentSuccessfulBot(MessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Currency for price of the product.
+        self.currency: str = get_object(kwargs.get('currency'))
+        # Total price for the product, in the smallest units of the currency.
+        self.total_amount: int = get_object(kwargs.get('total_amount'))
+        # True, if this is a recurring payment.
+        self.is_recurring: bool = get_object(kwargs.get('is_recurring'))
+        # True, if this is the first recurring payment.
+        self.is_first_recurring: bool = get_object(kwargs.get('is_first_recurring'))
+        # Invoice payload.
+        self.invoice_payload: bytes = get_object(kwargs.get('invoice_payload'))
+        # Identifier of the shipping option chosen by the user; may be empty if not applicable.
+        self.shipping_option_id: str = get_object(kwargs.get('shipping_option_id'))
+        # Information about the order; may be null.
+        self.order_info: OrderInfo = get_object(kwargs.get('order_info'))
+        # Telegram payment identifier.
+        self.telegram_payment_charge_id: str = get_object(kwargs.get('telegram_payment_charge_id'))
+        # Provider payment identifier.
+        self.provider_payment_charge_id: str = get_object(kwargs.get('provider_payment_charge_id'))
+
+
+class MessageGiftedPremium(MessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The identifier of a user that gifted Telegram Premium; 0 if the gift was anonymous.
+        self.gifter_user_id: int = get_object(kwargs.get('gifter_user_id'))
+        # Currency for the paid amount.
+        self.currency: str = get_object(kwargs.get('currency'))
+        # The paid amount, in the smallest units of the currency.
+        self.amount: int = get_object(kwargs.get('amount'))
+        # Cryptocurrency used to pay for the gift; may be empty if none.
+        self.cryptocurrency: str = get_object(kwargs.get('cryptocurrency'))
+        # The paid amount, in the smallest units of the cryptocurrency; 0 if none.
+        self.cryptocurrency_amount: int = get_object(kwargs.get('cryptocurrency_amount'))
+        # Number of months the Telegram Premium subscription will be active.
+        self.month_count: int = get_object(kwargs.get('month_count'))
+        # A sticker to be shown in the message; may be null if unknown.
+        self.sticker: Sticker = get_object(kwargs.get('sticker'))
+
+
+class MessagePremiumGiftCode(MessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Identifier of a chat or a user that created the gift code; may be null if unknown.
+        self.creator_id: MessageSender = get_object(kwargs.get('creator_id'))
+        # True, if the gift code was created for a giveaway.
+        self.is_from_giveaway: bool = get_object(kwargs.get('is_from_giveaway'))
+        # True, if the winner for the corresponding Telegram Premium subscription wasn't chosen.
+        self.is_unclaimed: bool = get_object(kwargs.get('is_unclaimed'))
+        # Currency for the paid amount; empty if unknown.
+        self.currency: str = get_object(kwargs.get('currency'))
+        # The paid amount, in the smallest units of the currency; 0 if unknown.
+        self.amount: int = get_object(kwargs.get('amount'))
+        # Cryptocurrency used to pay for the gift; may be empty if none or unknown.
+        self.cryptocurrency: str = get_object(kwargs.get('cryptocurrency'))
+        # The paid amount, in the smallest units of the cryptocurrency; 0 if unknown.
+        self.cryptocurrency_amount: int = get_object(kwargs.get('cryptocurrency_amount'))
+        # Number of months the Telegram Premium subscription will be active after code activation.
+        self.month_count: int = get_object(kwargs.get('month_count'))
+        # A sticker to be shown in the message; may be null if unknown.
+        self.sticker: Sticker = get_object(kwargs.get('sticker'))
+        # The gift code.
+        self.code: str = get_object(kwargs.get('code'))
+
+
+class MessagePremiumGiveawayCreated(MessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class MessagePremiumGiveaway(MessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Giveaway parameters.
+        self.parameters: PremiumGiveawayParameters = get_object(kwargs.get('parameters'))
+        # Number of users which will receive Telegram Premium subscription gift codes.
+        self.winner_count: int = get_object(kwargs.get('winner_count'))
+        # Number of months the Telegram Premium subscription will be active after code activation.
+        self.month_count: int = get_object(kwargs.get('month_count'))
+        # A sticker to be shown in the message; may be null if unknown.
+        self.sticker: Sticker = get_object(kwargs.get('sticker'))
+
+
+class MessagePremiumGiveawayCompleted(MessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Identifier of the message with the giveaway; can be 0 if the message was deleted.
+        self.giveaway_message_id: int = get_object(kwargs.get('giveaway_message_id'))
+        # Number of winners in the giveaway.
+        self.winner_count: int = get_object(kwargs.get('winner_count'))
+        # Number of undistributed prizes.
+        self.unclaimed_prize_count: int = get_object(kwargs.get('unclaimed_prize_count'))
+
+
+class MessagePremiumGiveawayWinners(MessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Identifier of the channel chat, which was automatically boosted by the winners of the giveaway for duration of the Premium subscription.
+        self.boosted_chat_id: int = get_object(kwargs.get('boosted_chat_id'))
+        # Identifier of the message with the giveaway in the boosted chat.
+        self.giveaway_message_id: int = get_object(kwargs.get('giveaway_message_id'))
+        # Number of other chats that participated in the giveaway.
+        self.additional_chat_count: int = get_object(kwargs.get('additional_chat_count'))
+        # Point in time (Unix timestamp) when the winners were selected. May be bigger than winners selection date specified in parameters of the giveaway.
+        self.actual_winners_selection_date: int = get_object(kwargs.get('actual_winners_selection_date'))
+        # True, if only new members of the chats were eligible for the giveaway.
+        self.only_new_members: bool = get_object(kwargs.get('only_new_members'))
+        # True, if the giveaway was canceled and was fully refunded.
+        self.was_refunded: bool = get_object(kwargs.get('was_refunded'))
+        # Number of months the Telegram Premium subscription will be active after code activation.
+        self.month_count: int = get_object(kwargs.get('month_count'))
+        # Additional description of the giveaway prize.
+        self.prize_description: str = get_object(kwargs.get('prize_description'))
+        # Total number of winners in the giveaway.
+        self.winner_count: int = get_object(kwargs.get('winner_count'))
+        # Up to 100 user identifiers of the winners of the giveaway.
+        self.winner_user_ids: list[int] = get_object(kwargs.get('winner_user_ids'))
+        # Number of undistributed prizes.
+        self.unclaimed_prize_count: int = get_object(kwargs.get('unclaimed_prize_count'))
+
+
+class MessageContactRegistered(MessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class MessageUsersShared(MessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Identifier of the shared users.
+        self.user_ids: list[int] = get_object(kwargs.get('user_ids'))
+        # Identifier of the keyboard button with the request.
+        self.button_id: int = get_object(kwargs.get('button_id'))
+
+
+class MessageChatShared(MessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Identifier of the shared chat.
+        self.chat_id: int = get_object(kwargs.get('chat_id'))
+        # Identifier of the keyboard button with the request.
+        self.button_id: int = get_object(kwargs.get('button_id'))
+
+
+class MessageBotWriteAccessAllowed(MessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The reason why the bot was allowed to write messages.
+        self.reason: BotWriteAccessAllowReason = get_object(kwargs.get('reason'))
+
+
+class MessageWebAppDataSent(MessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Text of the keyboardButtonTypeWebApp button, which opened the Web App.
+        self.button_text: str = get_object(kwargs.get('button_text'))
+
+
+class MessageWebAppDataReceived(MessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Text of the keyboardButtonTypeWebApp button, which opened the Web App.
+        self.button_text: str = get_object(kwargs.get('button_text'))
+        # The data.
+        self.data: str = get_object(kwargs.get('data'))
+
+
+class MessagePassportDataSent(MessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # List of Telegram Passport element types sent.
+        self.types: list[PassportElementType] = get_object(kwargs.get('types'))
+
+
+class MessagePassportDataReceived(MessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # List of received Telegram Passport elements.
+        self.elements: list[EncryptedPassportElement] = get_object(kwargs.get('elements'))
+        # Encrypted data credentials.
+        self.credentials: EncryptedCredentials = get_object(kwargs.get('credentials'))
+
+
+class MessageProximityAlertTriggered(MessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The identifier of a user or chat that triggered the proximity alert.
+        self.traveler_id: MessageSender = get_object(kwargs.get('traveler_id'))
+        # The identifier of a user or chat that subscribed for the proximity alert.
+        self.watcher_id: MessageSender = get_object(kwargs.get('watcher_id'))
+        # The distance between the users.
+        self.distance: int = get_object(kwargs.get('distance'))
+
+
+class MessageUnsupported(MessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
@@ -0,0 +1,13 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class MessageCopyOptions(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # True, if content of the message needs to be copied without reference to the original sender. Always true if the message is forwarded to a secret chat or is local.
+        self.send_copy: bool = get_object(kwargs.get('send_copy'))
+        # True, if media caption of the message copy needs to be replaced. Ignored if send_copy is false.
+        self.replace_caption: bool = get_object(kwargs.get('replace_caption'))
+        # New message caption; pass null to copy message without caption. Ignored if replace_caption is false.
+        self.new_caption: FormattedText = get_object(kwargs.get('new_caption'))
@@ -0,0 +1,47 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class MessageExtendedMedia(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class MessageExtendedMediaPreview(MessageExtendedMedia):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Media width; 0 if unknown.
+        self.width: int = get_object(kwargs.get('width'))
+        # Media height; 0 if unknown.
+        self.height: int = get_object(kwargs.get('height'))
+        # Media duration; 0 if unknown.
+        self.duration: int = get_object(kwargs.get('duration'))
+        # Media minithumbnail; may be null.
+        self.minithumbnail: Minithumbnail = get_object(kwargs.get('minithumbnail'))
+        # Media caption.
+        self.caption: FormattedText = get_object(kwargs.get('caption'))
+
+
+class MessageExtendedMediaPhoto(MessageExtendedMedia):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The photo.
+        self.photo: Photo = get_object(kwargs.get('photo'))
+        # Photo caption.
+        self.caption: FormattedText = get_object(kwargs.get('caption'))
+
+
+class MessageExtendedMediaVideo(MessageExtendedMedia):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The video.
+        self.video: Video = get_object(kwargs.get('video'))
+        # Photo caption.
+        self.caption: FormattedText = get_object(kwargs.get('caption'))
+
+
+class MessageExtendedMediaUnsupported(MessageExtendedMedia):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Media caption.
+        self.caption: FormattedText = get_object(kwargs.get('caption'))
@@ -0,0 +1,26 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class MessageFileType(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class MessageFileTypePrivate(MessageFileType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Name of the other party; may be empty if unrecognized.
+        self.name: str = get_object(kwargs.get('name'))
+
+
+class MessageFileTypeGroup(MessageFileType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Title of the group chat; may be empty if unrecognized.
+        self.title: str = get_object(kwargs.get('title'))
+
+
+class MessageFileTypeUnknown(MessageFileType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
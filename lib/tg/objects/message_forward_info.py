@@ -0,0 +1,17 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class MessageForwardInfo(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Origin of the forwarded message.
+        self.origin: MessageOrigin = get_object(kwargs.get('origin'))
+        # Point in time (Unix timestamp) when the message was originally sent.
+        self.date: int = get_object(kwargs.get('date'))
+        # The type of a public service announcement for the forwarded message.
+        self.public_service_announcement_type: str = get_object(kwargs.get('public_service_announcement_type'))
+        # For messages forwarded to the chat with the current user (Saved Messages), to the Replies bot chat, or to the channel's discussion group, the identifier of the chat from which the message was forwarded last time; 0 if unknown.
+        self.from_chat_id: int = get_object(kwargs.get('from_chat_id'))
+        # For messages forwarded to the chat with the current user (Saved Messages), to the Replies bot chat, or to the channel's discussion group, the identifier of the original message from which the new message was forwarded last time; 0 if unknown.
+        self.from_message_id: int = get_object(kwargs.get('from_message_id'))
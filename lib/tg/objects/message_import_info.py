@@ -0,0 +1,11 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class MessageImportInfo(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Name of the original sender.
+        self.sender_name: str = get_object(kwargs.get('sender_name'))
+        # Point in time (Unix timestamp) when the message was originally sent.
+        self.date: int = get_object(kwargs.get('date'))
@@ -0,0 +1,15 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class MessageInteractionInfo(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Number of times the message was viewed.
+        self.view_count: int = get_object(kwargs.get('view_count'))
+        # Number of times the message was forwarded.
+        self.forward_count: int = get_object(kwargs.get('forward_count'))
+        # Information about direct or indirect replies to the message; may be null. Currently, available only in channels with a discussion supergroup and discussion supergroups for messages, which are not replies itself.
+        self.reply_info: MessageReplyInfo = get_object(kwargs.get('reply_info'))
+        # The list of reactions added to the message.
+        self.reactions: list[MessageReaction] = get_object(kwargs.get('reactions'))
@@ -0,0 +1,19 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class MessageLinkInfo(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # True, if the link is a public link for a message or a forum topic in a chat.
+        self.is_public: bool = get_object(kwargs.get('is_public'))
+        # If found, identifier of the chat to which the link points, 0 otherwise.
+        self.chat_id: int = get_object(kwargs.get('chat_id'))
+        # If found, identifier of the message thread in which to open the message, or a forum topic to open if the message is missing.
+        self.message_thread_id: int = get_object(kwargs.get('message_thread_id'))
+        # If found, the linked message; may be null.
+        self.message: Message = get_object(kwargs.get('message'))
+        # Timestamp from which the video/audio/video note/voice note/story playing must start, in seconds; 0 if not specified. The media can be in the message content or in its web page preview.
+        self.media_timestamp: int = get_object(kwargs.get('media_timestamp'))
+        # True, if the whole media album to which the message belongs is linked.
+        self.for_album: bool = get_object(kwargs.get('for_album'))
@@ -0,0 +1,41 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class MessageOrigin(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class MessageOriginUser(MessageOrigin):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Identifier of the user that originally sent the message.
+        self.sender_user_id: int = get_object(kwargs.get('sender_user_id'))
+
+
+class MessageOriginHiddenUser(MessageOrigin):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Name of the sender.
+        self.sender_name: str = get_object(kwargs.get('sender_name'))
+
+
+class MessageOriginChat(MessageOrigin):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Identifier of the chat that originally sent the message.
+        self.sender_chat_id: int = get_object(kwargs.get('sender_chat_id'))
+        # For messages originally sent by an anonymous chat administrator, original message author signature.
+        self.author_signature: str = get_object(kwargs.get('author_signature'))
+
+
+class MessageOriginChannel(MessageOrigin):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Identifier of the channel chat to which the message was originally sent.
+        self.chat_id: int = get_object(kwargs.get('chat_id'))
+        # Message identifier of the original message.
+        self.message_id: int = get_object(kwargs.get('message_id'))
+        # Original post author signature.
+        self.author_signature: str = get_object(kwargs.get('author_signature'))
@@ -0,0 +1,13 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class MessagePosition(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # 0-based message position in the full list of suitable messages.
+        self.position: int = get_object(kwargs.get('position'))
+        # Message identifier.
+        self.message_id: int = get_object(kwargs.get('message_id'))
+        # Point in time (Unix timestamp) when the message was sent.
+        self.date: int = get_object(kwargs.get('date'))
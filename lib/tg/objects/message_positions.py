@@ -0,0 +1,11 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class MessagePositions(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Total number of messages found.
+        self.total_count: int = get_object(kwargs.get('total_count'))
+        # List of message positions.
+        self.positions: list[MessagePosition] = get_object(kwargs.get('positions'))
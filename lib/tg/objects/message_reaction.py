@@ -0,0 +1,17 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class MessageReaction(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Type of the reaction.
+        self.type: ReactionType = get_object(kwargs.get('type'))
+        # Number of times the reaction was added.
+        self.total_count: int = get_object(kwargs.get('total_count'))
+        # True, if the reaction is chosen by the current user.
+        self.is_chosen: bool = get_object(kwargs.get('is_chosen'))
+        # Identifier of the message sender used by the current user to add the reaction; may be null if unknown or the reaction isn't chosen.
+        self.used_sender_id: MessageSender = get_object(kwargs.get('used_sender_id'))
+        # Identifiers of at most 3 recent message senders, added the reaction; available in private, basic group and supergroup chats.
+        self.recent_sender_ids: list[MessageSender] = get_object(kwargs.get('recent_sender_ids'))
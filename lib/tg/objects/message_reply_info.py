@@ -0,0 +1,17 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class MessageReplyInfo(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Number of times the message was directly or indirectly replied.
+        self.reply_count: int = get_object(kwargs.get('reply_count'))
+        # Identifiers of at most 3 recent repliers to the message; available in channels with a discussion supergroup. The users and chats are expected to be inaccessible: only their photo and name will be available.
+        self.recent_replier_ids: list[MessageSender] = get_object(kwargs.get('recent_replier_ids'))
+        # Identifier of the last read incoming reply to the message.
+        self.last_read_inbox_message_id: int = get_object(kwargs.get('last_read_inbox_message_id'))
+        # Identifier of the last read outgoing reply to the message.
+        self.last_read_outbox_message_id: int = get_object(kwargs.get('last_read_outbox_message_id'))
+        # Identifier of the last reply to the message.
+        self.last_message_id: int = get_object(kwargs.get('last_message_id'))
@@ -0,0 +1,33 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class MessageReplyTo(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class MessageReplyToMessage(MessageReplyTo):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The identifier of the chat to which the message belongs; may be 0 if the replied message is in unknown chat.
+        self.chat_id: int = get_object(kwargs.get('chat_id'))
+        # The identifier of the message; may be 0 if the replied message is in unknown chat.
+        self.message_id: int = get_object(kwargs.get('message_id'))
+        # Chosen quote from the replied message; may be null if none.
+        self.quote: TextQuote = get_object(kwargs.get('quote'))
+        # Information about origin of the message if the message was from another chat or topic; may be null for messages from the same chat.
+        self.origin: MessageOrigin = get_object(kwargs.get('origin'))
+        # Point in time (Unix timestamp) when the message was sent if the message was from another chat or topic; 0 for messages from the same chat.
+        self.origin_send_date: int = get_object(kwargs.get('origin_send_date'))
+        # Media content of the message if the message was from another chat or topic; may be null for messages from the same chat and messages without media. Can be only one of the following types: messageAnimation, messageAudio, messageContact, messageDice, messageDocument, messageGame, messageInvoice, messageLocation, messagePhoto, messagePoll, messagePremiumGiveaway, messagePremiumGiveawayWinners, messageSticker, messageStory, messageText (for link preview), messageVenue, messageVideo, messageVideoNote, or messageVoiceNote.
+        self.content: MessageContent = get_object(kwargs.get('content'))
+
+
+class MessageReplyToStory(MessageReplyTo):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The identifier of the sender of the story.
+        self.story_sender_chat_id: int = get_object(kwargs.get('story_sender_chat_id'))
+        # The identifier of the story.
+        self.story_id: int = get_object(kwargs.get('story_id'))
@@ -0,0 +1,19 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class MessageSchedulingState(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class MessageSchedulingStateSendAtDate(MessageSchedulingState):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Point in time (Unix timestamp) when the message will be sent. The date must be within 367 days in the future.
+        self.send_date: int = get_object(kwargs.get('send_date'))
+
+
+class MessageSchedulingStateSendWhenOnline(MessageSchedulingState):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
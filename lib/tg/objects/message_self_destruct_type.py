@@ -0,0 +1,19 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class MessageSelfDestructType(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class MessageSelfDestructTypeTimer(MessageSelfDestructType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The message's self-destruct time, in seconds; must be between 0 and 60 in private chats.
+        self.self_destruct_time: int = get_object(kwargs.get('self_destruct_time'))
+
+
+class MessageSelfDestructTypeImmediately(MessageSelfDestructType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
@@ -0,0 +1,21 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class MessageSendOptions(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Pass true to disable notification for the message.
+        self.disable_notification: bool = get_object(kwargs.get('disable_notification'))
+        # Pass true if the message is sent from the background.
+        self.from_background: bool = get_object(kwargs.get('from_background'))
+        # Pass true if the content of the message must be protected from forwarding and saving; for bots only.
+        self.protect_content: bool = get_object(kwargs.get('protect_content'))
+        # Pass true if the user explicitly chosen a sticker or a custom emoji from an installed sticker set; applicable only to sendMessage and sendMessageAlbum.
+        self.update_order_of_installed_sticker_sets: bool = get_object(kwargs.get('update_order_of_installed_sticker_sets'))
+        # Message scheduling state; pass null to send message immediately. Messages sent to a secret chat, live location messages and self-destructing messages can't be scheduled.
+        self.scheduling_state: MessageSchedulingState = get_object(kwargs.get('scheduling_state'))
+        # Non-persistent identifier, which will be returned back in messageSendingStatePending object and can be used to match sent messages and corresponding updateNewMessage updates.
+        self.sending_id: int = get_object(kwargs.get('sending_id'))
+        # Pass true to get a fake message instead of actually sending them.
+        self.only_preview: bool = get_object(kwargs.get('only_preview'))
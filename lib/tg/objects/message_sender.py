@@ -0,0 +1,21 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class MessageSender(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class MessageSenderUser(MessageSender):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Identifier of the user that sent the message.
+        self.user_id: int = get_object(kwargs.get('user_id'))
+
+
+class MessageSenderChat(MessageSender):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Identifier of the chat that sent the message.
+        self.chat_id: int = get_object(kwargs.get('chat_id'))
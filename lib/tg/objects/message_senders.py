@@ -0,0 +1,11 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class MessageSenders(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Approximate total number of messages senders found.
+        self.total_count: int = get_object(kwargs.get('total_count'))
+        # List of message senders.
+        self.senders: list[MessageSender] = get_object(kwargs.get('senders'))
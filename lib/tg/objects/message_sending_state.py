@@ -0,0 +1,31 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class MessageSendingState(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class MessageSendingStatePending(MessageSendingState):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Non-persistent message sending identifier, specified by the application.
+        self.sending_id: int = get_object(kwargs.get('sending_id'))
+
+
+class MessageSendingStateFailed(MessageSendingState):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The cause of the message sending failure.
+        self.error: Error = get_object(kwargs.get('error'))
+        # True, if the message can be re-sent.
+        self.can_retry: bool = get_object(kwargs.get('can_retry'))
+        # True, if the message can be re-sent only on behalf of a different sender.
+        self.need_another_sender: bool = get_object(kwargs.get('need_another_sender'))
+        # True, if the message can be re-sent only if another quote is chosen in the message that is replied by the given message.
+        self.need_another_reply_quote: bool = get_object(kwargs.get('need_another_reply_quote'))
+        # True, if the message can be re-sent only if the message to be replied is removed. This will be done automatically by resendMessages.
+        self.need_drop_reply: bool = get_object(kwargs.get('need_drop_reply'))
+        # Time left before the message can be re-sent, in seconds. No update is sent when this field changes.
+        self.retry_after: float = get_object(kwargs.get('retry_after'))
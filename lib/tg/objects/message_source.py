@@ -0,0 +1,57 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object
+
+
+class MessageSource(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class MessageSourceChatHistory(MessageSource):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class MessageSourceMessageThreadHistory(MessageSource):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class MessageSourceForumTopicHistory(MessageSource):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class MessageSourceHistoryPreview(MessageSource):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class MessageSourceChatList(MessageSource):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class MessageSourceSearch(MessageSource):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class MessageSourceChatEventLog(MessageSource):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class MessageSourceNotification(MessageSource):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class MessageSourceScreenshot(MessageSource):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class MessageSourceOther(MessageSource):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
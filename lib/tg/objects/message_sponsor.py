@@ -0,0 +1,13 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class MessageSponsor(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Type of the sponsor.
+        self.type: MessageSponsorType = get_object(kwargs.get('type'))
+        # Photo of the sponsor; may be null if must not be shown.
+        self.photo: ChatPhotoInfo = get_object(kwargs.get('photo'))
+        # Additional optional information about the sponsor to be shown along with the message.
+        self.info: str = get_object(kwargs.get('info'))
@@ -0,0 +1,52 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class MessageSponsorType(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class MessageSponsorTypeBot(MessageSponsorType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # User identifier of the bot.
+        self.bot_user_id: int = get_object(kwargs.get('bot_user_id'))
+        # An internal link to be opened when the sponsored message is clicked.
+        self.link: InternalLinkType = get_object(kwargs.get('link'))
+
+
+class MessageSponsorTypeWebApp(MessageSponsorType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Web App title.
+        self.web_app_title: str = get_object(kwargs.get('web_app_title'))
+        # An internal link to be opened when the sponsored message is clicked.
+        self.link: InternalLinkType = get_object(kwargs.get('link'))
+
+
+class MessageSponsorTypePublicChannel(MessageSponsorType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Sponsor chat identifier.
+        self.chat_id: int = get_object(kwargs.get('chat_id'))
+        # An internal link to be opened when the sponsored message is clicked; may be null if the sponsor chat needs to be opened instead.
+        self.link: InternalLinkType = get_object(kwargs.get('link'))
+
+
+class MessageSponsorTypePrivateChannel(MessageSponsorType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Title of the chat.
+        self.title: str = get_object(kwargs.get('title'))
+        # Invite link for the channel.
+        self.invite_link: str = get_object(kwargs.get('invite_link'))
+
+
+class MessageSponsorTypeWebsite(MessageSponsorType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # URL of the website.
+        self.url: str = get_object(kwargs.get('url'))
+        # Name of the website.
+        self.name: str = get_object(kwargs.get('name'))
@@ -0,0 +1,11 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class MessageStatistics(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # A graph containing number of message views and shares.
+        self.message_interaction_graph: StatisticalGraph = get_object(kwargs.get('message_interaction_graph'))
+        # A graph containing number of message reactions.
+        self.message_reaction_graph: StatisticalGraph = get_object(kwargs.get('message_reaction_graph'))
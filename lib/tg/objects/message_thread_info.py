@@ -0,0 +1,19 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class MessageThreadInfo(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Identifier of the chat to which the message thread belongs.
+        self.chat_id: int = get_object(kwargs.get('chat_id'))
+        # Message thread identifier, unique within the chat.
+        self.message_thread_id: int = get_object(kwargs.get('message_thread_id'))
+        # Information about the message thread; may be null for forum topic threads.
+        self.reply_info: MessageReplyInfo = get_object(kwargs.get('reply_info'))
+        # Approximate number of unread messages in the message thread.
+        self.unread_message_count: int = get_object(kwargs.get('unread_message_count'))
+        # The messages from which the thread starts. The messages are returned in a reverse chronological order (i.e., in order of decreasing message_id).
+        self.messages: list[Message] = get_object(kwargs.get('messages'))
+        # A draft of a message in the message thread; may be null if none.
+        self.draft_message: DraftMessage = get_object(kwargs.get('draft_message'))
@@ -0,0 +1,11 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class MessageViewer(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # User identifier of the viewer.
+        self.user_id: int = get_object(kwargs.get('user_id'))
+        # Approximate point in time (Unix timestamp) when the message was viewed.
+        self.view_date: int = get_object(kwargs.get('view_date'))
@@ -0,0 +1,11 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class Messages(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Approximate total number of messages found.
+        self.total_count: int = get_object(kwargs.get('total_count'))
+        # List of messages; messages may be null.
+        self.messages: list[Message] = get_object(kwargs.get('messages'))
@@ -0,0 +1,13 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class Minithumbnail(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Thumbnail width, usually doesn't exceed 40.
+        self.width: int = get_object(kwargs.get('width'))
+        # Thumbnail height, usually doesn't exceed 40.
+        self.height: int = get_object(kwargs.get('height'))
+        # The thumbnail in JPEG format.
+        self.data: bytes = get_object(kwargs.get('data'))
@@ -0,0 +1,11 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class NetworkStatistics(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Point in time (Unix timestamp) from which the statistics are collected.
+        self.since_date: int = get_object(kwargs.get('since_date'))
+        # Network statistics entries.
+        self.entries: list[NetworkStatisticsEntry] = get_object(kwargs.get('entries'))
@@ -0,0 +1,33 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class NetworkStatisticsEntry(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class NetworkStatisticsEntryFile(NetworkStatisticsEntry):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Type of the file the data is part of; pass null if the data isn't related to files.
+        self.file_type: FileType = get_object(kwargs.get('file_type'))
+        # Type of the network the data was sent through. Call setNetworkType to maintain the actual network type.
+        self.network_type: NetworkType = get_object(kwargs.get('network_type'))
+        # Total number of bytes sent.
+        self.sent_bytes: int = get_object(kwargs.get('sent_bytes'))
+        # Total number of bytes received.
+        self.received_bytes: int = get_object(kwargs.get('received_bytes'))
+
+
+class NetworkStatisticsEntryCall(NetworkStatisticsEntry):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Type of the network the data was sent through. Call setNetworkType to maintain the actual network type.
+        self.network_type: NetworkType = get_object(kwargs.get('network_type'))
+        # Total number of bytes sent.
+        self.sent_bytes: int = get_object(kwargs.get('sent_bytes'))
+        # Total number of bytes received.
+        self.received_bytes: int = get_object(kwargs.get('received_bytes'))
+        # Total call duration, in seconds.
+        self.duration: float = get_object(kwargs.get('duration'))
@@ -0,0 +1,32 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object
+
+
+class NetworkType(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class NetworkTypeNone(NetworkType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class NetworkTypeMobile(NetworkType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class NetworkTypeMobileRoaming(NetworkType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class NetworkTypeWiFi(NetworkType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class NetworkTypeOther(NetworkType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
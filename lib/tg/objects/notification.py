@@ -0,0 +1,15 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class Notification(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Unique persistent identifier of this notification.
+        self.id: int = get_object(kwargs.get('id'))
+        # Notification date.
+        self.date: int = get_object(kwargs.get('date'))
+        # True, if the notification was explicitly sent without sound.
+        self.is_silent: bool = get_object(kwargs.get('is_silent'))
+        # Notification type.
+        self.type: NotificationType = get_object(kwargs.get('type'))
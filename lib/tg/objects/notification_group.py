@@ -0,0 +1,17 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class NotificationGroup(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Unique persistent auto-incremented from 1 identifier of the notification group.
+        self.id: int = get_object(kwargs.get('id'))
+        # Type of the group.
+        self.type: NotificationGroupType = get_object(kwargs.get('type'))
+        # Identifier of a chat to which all notifications in the group belong.
+        self.chat_id: int = get_object(kwargs.get('chat_id'))
+        # Total number of active notifications in the group.
+        self.total_count: int = get_object(kwargs.get('total_count'))
+        # The list of active notifications.
+        self.notifications: list[Notification] = get_object(kwargs.get('notifications'))
@@ -0,0 +1,27 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object
+
+
+class NotificationGroupType(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class NotificationGroupTypeMessages(NotificationGroupType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class NotificationGroupTypeMentions(NotificationGroupType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class NotificationGroupTypeSecretChat(NotificationGroupType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class NotificationGroupTypeCalls(NotificationGroupType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
@@ -0,0 +1,22 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object
+
+
+class NotificationSettingsScope(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class NotificationSettingsScopePrivateChats(NotificationSettingsScope):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class NotificationSettingsScopeGroupChats(NotificationSettingsScope):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class NotificationSettingsScopeChannelChats(NotificationSettingsScope):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
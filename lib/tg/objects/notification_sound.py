@@ -0,0 +1,19 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class NotificationSound(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Unique identifier of the notification sound.
+        self.id: int = get_object(kwargs.get('id'))
+        # Duration of the sound, in seconds.
+        self.duration: int = get_object(kwargs.get('duration'))
+        # Point in time (Unix timestamp) when the sound was created.
+        self.date: int = get_object(kwargs.get('date'))
+        # Title of the notification sound.
+        self.title: str = get_object(kwargs.get('title'))
+        # Arbitrary data, defined while the sound was uploaded.
+        self.data: str = get_object(kwargs.get('data'))
+        # File containing the sound.
+        self.sound: File = get_object(kwargs.get('sound'))
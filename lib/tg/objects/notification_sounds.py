@@ -0,0 +1,9 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class NotificationSounds(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # A list of notification sounds.
+        self.notification_sounds: list[NotificationSound] = get_object(kwargs.get('notification_sounds'))
@@ -0,0 +1,43 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class NotificationType(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class NotificationTypeNewMessage(NotificationType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The message.
+        self.message: Message = get_object(kwargs.get('message'))
+        # True, if message content must be displayed in notifications.
+        self.show_preview: bool = get_object(kwargs.get('show_preview'))
+
+
+class NotificationTypeNewSecretChat(NotificationType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class NotificationTypeNewCall(NotificationType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Call identifier.
+        self.call_id: int = get_object(kwargs.get('call_id'))
+
+
+class NotificationTypeNewPushMessage(NotificationType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The message identifier. The message will not be available in the chat history, but the identifier can be used in viewMessages, or as a message to be replied in the same chat.
+        self.message_id: int = get_object(kwargs.get('message_id'))
+        # Identifier of the sender of the message. Corresponding user or chat may be inaccessible.
+        self.sender_id: MessageSender = get_object(kwargs.get('sender_id'))
+        # Name of the sender.
+        self.sender_name: str = get_object(kwargs.get('sender_name'))
+        # True, if the message is outgoing.
+        self.is_outgoing: bool = get_object(kwargs.get('is_outgoing'))
+        # Push message content.
+        self.content: PushMessageContent = get_object(kwargs.get('content'))
@@ -0,0 +1,7 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object
+
+
+class Ok(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
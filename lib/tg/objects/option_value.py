@@ -0,0 +1,33 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class OptionValue(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class OptionValueBoolean(OptionValue):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The value of the option.
+        self.value: bool = get_object(kwargs.get('value'))
+
+
+class OptionValueEmpty(OptionValue):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class OptionValueInteger(OptionValue):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The value of the option.
+        self.value: int = get_object(kwargs.get('value'))
+
+
+class OptionValueString(OptionValue):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The value of the option.
+        self.value: str = get_object(kwargs.get('value'))
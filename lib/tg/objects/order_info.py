@@ -0,0 +1,15 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class OrderInfo(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Name of the user.
+        self.name: str = get_object(kwargs.get('name'))
+        # Phone number of the user.
+        self.phone_number: str = get_object(kwargs.get('phone_number'))
+        # Email address of the user.
+        self.email_address: str = get_object(kwargs.get('email_address'))
+        # Shipping address for this order; may be null.
+        self.shipping_address: Address = get_object(kwargs.get('shipping_address'))
@@ -0,0 +1,288 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class PageBlock(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class PageBlockTitle(PageBlock):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Title.
+        self.title: RichText = get_object(kwargs.get('title'))
+
+
+class PageBlockSubtitle(PageBlock):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Subtitle.
+        self.subtitle: RichText = get_object(kwargs.get('subtitle'))
+
+
+class PageBlockAuthorDate(PageBlock):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Author.
+        self.author: RichText = get_object(kwargs.get('author'))
+        # Point in time (Unix timestamp) when the article was published; 0 if unknown.
+        self.publish_date: int = get_object(kwargs.get('publish_date'))
+
+
+class PageBlockHeader(PageBlock):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Header.
+        self.header: RichText = get_object(kwargs.get('header'))
+
+
+class PageBlockSubheader(PageBlock):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Subheader.
+        self.subheader: RichText = get_object(kwargs.get('subheader'))
+
+
+class PageBlockKicker(PageBlock):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Kicker.
+        self.kicker: RichText = get_object(kwargs.get('kicker'))
+
+
+class PageBlockParagraph(PageBlock):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Paragraph text.
+        self.text: RichText = get_object(kwargs.get('text'))
+
+
+class PageBlockPreformatted(PageBlock):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Paragraph text.
+        self.text: RichText = get_object(kwargs.get('text'))
+        # Programming language for which the text needs to be formatted.
+        self.language: str = get_object(kwargs.get('language'))
+
+
+class PageBlockFooter(PageBlock):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Footer.
+        self.footer: RichText = get_object(kwargs.get('footer'))
+
+
+class PageBlockDivider(PageBlock):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class PageBlockAnchor(PageBlock):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Name of the anchor.
+        self.name: str = get_object(kwargs.get('name'))
+
+
+class PageBlockList(PageBlock):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The items of the list.
+        self.items: list[PageBlockListItem] = get_object(kwargs.get('items'))
+
+
+class PageBlockBlockQuote(PageBlock):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Quote text.
+        self.text: RichText = get_object(kwargs.get('text'))
+        # Quote credit.
+        self.credit: RichText = get_object(kwargs.get('credit'))
+
+
+class PageBlockPullQuote(PageBlock):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Quote text.
+        self.text: RichText = get_object(kwargs.get('text'))
+        # Quote credit.
+        self.credit: RichText = get_object(kwargs.get('credit'))
+
+
+class PageBlockAnimation(PageBlock):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Animation file; may be null.
+        self.animation: Animation = get_object(kwargs.get('animation'))
+        # Animation caption.
+        self.caption: PageBlockCaption = get_object(kwargs.get('caption'))
+        # True, if the animation must be played automatically.
+        self.need_autoplay: bool = get_object(kwargs.get('need_autoplay'))
+
+
+class PageBlockAudio(PageBlock):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Audio file; may be null.
+        self.audio: Audio = get_object(kwargs.get('audio'))
+        # Audio file caption.
+        self.caption: PageBlockCaption = get_object(kwargs.get('caption'))
+
+
+class PageBlockPhoto(PageBlock):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Photo file; may be null.
+        self.photo: Photo = get_object(kwargs.get('photo'))
+        # Photo caption.
+        self.caption: PageBlockCaption = get_object(kwargs.get('caption'))
+        # URL that needs to be opened when the photo is clicked.
+        self.url: str = get_object(kwargs.get('url'))
+
+
+class PageBlockVideo(PageBlock):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Video file; may be null.
+        self.video: Video = get_object(kwargs.get('video'))
+        # Video caption.
+        self.caption: PageBlockCaption = get_object(kwargs.get('caption'))
+        # True, if the video must be played automatically.
+        self.need_autoplay: bool = get_object(kwargs.get('need_autoplay'))
+        # True, if the video must be looped.
+        self.is_looped: bool = get_object(kwargs.get('is_looped'))
+
+
+class PageBlockVoiceNote(PageBlock):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Voice note; may be null.
+        self.voice_note: VoiceNote = get_object(kwargs.get('voice_note'))
+        # Voice note caption.
+        self.caption: PageBlockCaption = get_object(kwargs.get('caption'))
+
+
+class PageBlockCover(PageBlock):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Cover.
+        self.cover: PageBlock = get_object(kwargs.get('cover'))
+
+
+class PageBlockEmbedded(PageBlock):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Web page URL, if available.
+        self.url: str = get_object(kwargs.get('url'))
+        # HTML-markup of the embedded page.
+        self.html: str = get_object(kwargs.get('html'))
+        # Poster photo, if available; may be null.
+        self.poster_photo: Photo = get_object(kwargs.get('poster_photo'))
+        # Block width; 0 if unknown.
+        self.width: int = get_object(kwargs.get('width'))
+        # Block height; 0 if unknown.
+        self.height: int = get_object(kwargs.get('height'))
+        # Block caption.
+        self.caption: PageBlockCaption = get_object(kwargs.get('caption'))
+        # True, if the block must be full width.
+        self.is_full_width: bool = get_object(kwargs.get('is_full_width'))
+        # True, if scrolling needs to be allowed.
+        self.allow_scrolling: bool = get_object(kwargs.get('allow_scrolling'))
+
+
+class PageBlockEmbeddedPost(PageBlock):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Web page URL.
+        self.url: str = get_object(kwargs.get('url'))
+        # Post author.
+        self.author: str = get_object(kwargs.get('author'))
+        # Post author photo; may be null.
+        self.author_photo: Photo = get_object(kwargs.get('author_photo'))
+        # Point in time (Unix timestamp) when the post was created; 0 if unknown.
+        self.date: int = get_object(kwargs.get('date'))
+        # Post content.
+        self.page_blocks: list[PageBlock] = get_object(kwargs.get('page_blocks'))
+        # Post caption.
+        self.caption: PageBlockCaption = get_object(kwargs.get('caption'))
+
+
+class PageBlockCollage(PageBlock):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Collage item contents.
+        self.page_blocks: list[PageBlock] = get_object(kwargs.get('page_blocks'))
+        # Block caption.
+        self.caption: PageBlockCaption = get_object(kwargs.get('caption'))
+
+
+class PageBlockSlideshow(PageBlock):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Slideshow item contents.
+        self.page_blocks: list[PageBlock] = get_object(kwargs.get('page_blocks'))
+        # Block caption.
+        self.caption: PageBlockCaption = get_object(kwargs.get('caption'))
+
+
+class PageBlockChatLink(PageBlock):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Chat title.
+        self.title: str = get_object(kwargs.get('title'))
+        # Chat photo; may be null.
+        self.photo: ChatPhotoInfo = get_object(kwargs.get('photo'))
+        # Identifier of the accent color for chat title and background of chat photo.
+        self.accent_color_id: int = get_object(kwargs.get('accent_color_id'))
+        # Chat username by which all other information about the chat can be resolved.
+        self.username: str = get_object(kwargs.get('username'))
+
+
+class PageBlockTable(PageBlock):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Table caption.
+        self.caption: RichText = get_object(kwargs.get('caption'))
+        # Table cells.
+        self.cells: list[list[PageBlockTableCell]] = get_object(kwargs.get('cells'))
+        # True, if the table is bordered.
+        self.is_bordered: bool = get_object(kwargs.get('is_bordered'))
+        # True, if the table is striped.
+        self.is_striped: bool = get_object(kwargs.get('is_striped'))
+
+
+class PageBlockDetails(PageBlock):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Always visible heading for the block.
+        self.header: RichText = get_object(kwargs.get('header'))
+        # Block contents.
+        self.page_blocks: list[PageBlock] = get_object(kwargs.get('page_blocks'))
+        # True, if the block is open by default.
+        self.is_open: bool = get_object(kwargs.get('is_open'))
+
+
+class PageBlockRelatedArticles(PageBlock):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Block header.
+        self.header: RichText = get_object(kwargs.get('header'))
+        # List of related articles.
+        self.articles: list[PageBlockRelatedArticle] = get_object(kwargs.get('articles'))
+
+
+class PageBlockMap(PageBlock):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Location of the map center.
+        self.location: Location = get_object(kwargs.get('location'))
+        # Map zoom level.
+        self.zoom: int = get_object(kwargs.get('zoom'))
+        # Map width.
+        self.width: int = get_object(kwargs.get('width'))
+        # Map height.
+        self.height: int = get_object(kwargs.get('height'))
+        # Block caption.
+        self.caption: PageBlockCaption = get_object(kwargs.get('caption'))
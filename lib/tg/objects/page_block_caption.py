@@ -0,0 +1,11 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class PageBlockCaption(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Content of the caption.
+        self.text: RichText = get_object(kwargs.get('text'))
+        # Block credit (like HTML tag &lt;cite&gt;).
+        self.credit: RichText = get_object(kwargs.get('credit'))
@@ -0,0 +1,22 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object
+
+
+class PageBlockHorizontalAlignment(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class PageBlockHorizontalAlignmentLeft(PageBlockHorizontalAlignment):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class PageBlockHorizontalAlignmentCenter(PageBlockHorizontalAlignment):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class PageBlockHorizontalAlignmentRight(PageBlockHorizontalAlignment):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
@@ -0,0 +1,11 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class PageBlockListItem(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Item label.
+        self.label: str = get_object(kwargs.get('label'))
+        # Item blocks.
+        self.page_blocks: list[PageBlock] = get_object(kwargs.get('page_blocks'))
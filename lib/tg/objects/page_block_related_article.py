@@ -0,0 +1,19 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class PageBlockRelatedArticle(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Related article URL.
+        self.url: str = get_object(kwargs.get('url'))
+        # Article title; may be empty.
+        self.title: str = get_object(kwargs.get('title'))
+        # Article description; may be empty.
+        self.description: str = get_object(kwargs.get('description'))
+        # Article photo; may be null.
+        self.photo: Photo = get_object(kwargs.get('photo'))
+        # Article author; may be empty.
+        self.author: str = get_object(kwargs.get('author'))
+        # Point in time (Unix timestamp) when the article was published; 0 if unknown.
+        self.publish_date: int = get_object(kwargs.get('publish_date'))
@@ -0,0 +1,19 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class PageBlockTableCell(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Cell text; may be null. If the text is null, then the cell must be invisible.
+        self.text: RichText = get_object(kwargs.get('text'))
+        # True, if it is a header cell.
+        self.is_header: bool = get_object(kwargs.get('is_header'))
+        # The number of columns the cell spans.
+        self.colspan: int = get_object(kwargs.get('colspan'))
+        # The number of rows the cell spans.
+        self.rowspan: int = get_object(kwargs.get('rowspan'))
+        # Horizontal cell content alignment.
+        self.align: PageBlockHorizontalAlignment = get_object(kwargs.get('align'))
+        # Vertical cell content alignment.
+        self.valign: PageBlockVerticalAlignment = get_object(kwargs.get('valign'))
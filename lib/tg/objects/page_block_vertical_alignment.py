@@ -0,0 +1,22 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object
+
+
+class PageBlockVerticalAlignment(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class PageBlockVerticalAlignmentTop(PageBlockVerticalAlignment):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class PageBlockVerticalAlignmentMiddle(PageBlockVerticalAlignment):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class PageBlockVerticalAlignmentBottom(PageBlockVerticalAlignment):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
@@ -0,0 +1,13 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class PassportAuthorizationForm(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Unique identifier of the authorization form.
+        self.id: int = get_object(kwargs.get('id'))
+        # Telegram Passport elements that must be provided to complete the form.
+        self.required_elements: list[PassportRequiredElement] = get_object(kwargs.get('required_elements'))
+        # URL for the privacy policy of the service; may be empty.
+        self.privacy_policy_url: str = get_object(kwargs.get('privacy_policy_url'))
@@ -0,0 +1,98 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class PassportElement(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class PassportElementPersonalDetails(PassportElement):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Personal details of the user.
+        self.personal_details: PersonalDetails = get_object(kwargs.get('personal_details'))
+
+
+class PassportElementPassport(PassportElement):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Passport.
+        self.passport: IdentityDocument = get_object(kwargs.get('passport'))
+
+
+class PassportElementDriverLicense(PassportElement):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Driver license.
+        self.driver_license: IdentityDocument = get_object(kwargs.get('driver_license'))
+
+
+class PassportElementIdentityCard(PassportElement):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Identity card.
+        self.identity_card: IdentityDocument = get_object(kwargs.get('identity_card'))
+
+
+class PassportElementInternalPassport(PassportElement):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Internal passport.
+        self.internal_passport: IdentityDocument = get_object(kwargs.get('internal_passport'))
+
+
+class PassportElementAddress(PassportElement):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Address.
+        self.address: Address = get_object(kwargs.get('address'))
+
+
+class PassportElementUtilityBill(PassportElement):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Utility bill.
+        self.utility_bill: PersonalDocument = get_object(kwargs.get('utility_bill'))
+
+
+class PassportElementBankStatement(PassportElement):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Bank statement.
+        self.bank_statement: PersonalDocument = get_object(kwargs.get('bank_statement'))
+
+
+class PassportElementRentalAgreement(PassportElement):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Rental agreement.
+        self.rental_agreement: PersonalDocument = get_object(kwargs.get('rental_agreement'))
+
+
+class PassportElementPassportRegistration(PassportElement):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Passport registration pages.
+        self.passport_registration: PersonalDocument = get_object(kwargs.get('passport_registration'))
+
+
+class PassportElementTemporaryRegistration(PassportElement):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Temporary registration.
+        self.temporary_registration: PersonalDocument = get_object(kwargs.get('temporary_registration'))
+
+
+class PassportElementPhoneNumber(PassportElement):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Phone number.
+        self.phone_number: str = get_object(kwargs.get('phone_number'))
+
+
+class PassportElementEmailAddress(PassportElement):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Email address.
+        self.email_address: str = get_object(kwargs.get('email_address'))
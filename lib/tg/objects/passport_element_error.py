@@ -0,0 +1,13 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class PassportElementError(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Type of the Telegram Passport element which has the error.
+        self.type: PassportElementType = get_object(kwargs.get('type'))
+        # Error message.
+        self.message: str = get_object(kwargs.get('message'))
+        # Error source.
+        self.source: PassportElementErrorSource = get_object(kwargs.get('source'))
@@ -0,0 +1,58 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class PassportElementErrorSource(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class PassportElementErrorSourceUnspecified(PassportElementErrorSource):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class PassportElementErrorSourceDataField(PassportElementErrorSource):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Field name.
+        self.field_name: str = get_object(kwargs.get('field_name'))
+
+
+class PassportElementErrorSourceFrontSide(PassportElementErrorSource):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class PassportElementErrorSourceReverseSide(PassportElementErrorSource):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class PassportElementErrorSourceSelfie(PassportElementErrorSource):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class PassportElementErrorSourceTranslationFile(PassportElementErrorSource):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Index of a file with the error.
+        self.file_index: int = get_object(kwargs.get('file_index'))
+
+
+class PassportElementErrorSourceTranslationFiles(PassportElementErrorSource):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class PassportElementErrorSourceFile(PassportElementErrorSource):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Index of a file with the error.
+        self.file_index: int = get_object(kwargs.get('file_index'))
+
+
+class PassportElementErrorSourceFiles(PassportElementErrorSource):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
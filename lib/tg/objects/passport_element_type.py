@@ -0,0 +1,72 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object
+
+
+class PassportElementType(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class PassportElementTypePersonalDetails(PassportElementType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class PassportElementTypePassport(PassportElementType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class PassportElementTypeDriverLicense(PassportElementType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class PassportElementTypeIdentityCard(PassportElementType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class PassportElementTypeInternalPassport(PassportElementType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class PassportElementTypeAddress(PassportElementType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class PassportElementTypeUtilityBill(PassportElementType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class PassportElementTypeBankStatement(PassportElementType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class PassportElementTypeRentalAgreement(PassportElementType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class PassportElementTypePassportRegistration(PassportElementType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class PassportElementTypeTemporaryRegistration(PassportElementType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class PassportElementTypePhoneNumber(PassportElementType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class PassportElementTypeEmailAddress(PassportElementType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
@@ -0,0 +1,11 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class PassportElementsWithErrors(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Telegram Passport elements.
+        self.elements: list[PassportElement] = get_object(kwargs.get('elements'))
+        # Errors in the elements that are already available.
+        self.errors: list[PassportElementError] = get_object(kwargs.get('errors'))
@@ -0,0 +1,9 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class PassportRequiredElement(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # List of Telegram Passport elements any of which is enough to provide.
+        self.suitable_elements: list[PassportSuitableElement] = get_object(kwargs.get('suitable_elements'))
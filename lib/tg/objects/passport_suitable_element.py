@@ -0,0 +1,15 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class PassportSuitableElement(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Type of the element.
+        self.type: PassportElementType = get_object(kwargs.get('type'))
+        # True, if a selfie is required with the identity document.
+        self.is_selfie_required: bool = get_object(kwargs.get('is_selfie_required'))
+        # True, if a certified English translation is required with the document.
+        self.is_translation_required: bool = get_object(kwargs.get('is_translation_required'))
+        # True, if personal details must include the user's name in the language of their country of residence.
+        self.is_native_name_required: bool = get_object(kwargs.get('is_native_name_required'))
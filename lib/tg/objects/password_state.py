@@ -0,0 +1,21 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class PasswordState(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # True, if a 2-step verification password is set.
+        self.has_password: bool = get_object(kwargs.get('has_password'))
+        # Hint for the password; may be empty.
+        self.password_hint: str = get_object(kwargs.get('password_hint'))
+        # True, if a recovery email is set.
+        self.has_recovery_email_address: bool = get_object(kwargs.get('has_recovery_email_address'))
+        # True, if some Telegram Passport elements were saved.
+        self.has_passport_data: bool = get_object(kwargs.get('has_passport_data'))
+        # Information about the recovery email address to which the confirmation email was sent; may be null.
+        self.recovery_email_address_code_info: EmailAddressAuthenticationCodeInfo = get_object(kwargs.get('recovery_email_address_code_info'))
+        # Pattern of the email address set up for logging in.
+        self.login_email_address_pattern: str = get_object(kwargs.get('login_email_address_pattern'))
+        # If not 0, point in time (Unix timestamp) after which the 2-step verification password can be reset immediately using resetPassword.
+        self.pending_reset_date: int = get_object(kwargs.get('pending_reset_date'))
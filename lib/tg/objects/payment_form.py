@@ -0,0 +1,33 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class PaymentForm(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The payment form identifier.
+        self.id: int = get_object(kwargs.get('id'))
+        # Full information about the invoice.
+        self.invoice: Invoice = get_object(kwargs.get('invoice'))
+        # User identifier of the seller bot.
+        self.seller_bot_user_id: int = get_object(kwargs.get('seller_bot_user_id'))
+        # User identifier of the payment provider bot.
+        self.payment_provider_user_id: int = get_object(kwargs.get('payment_provider_user_id'))
+        # Information about the payment provider.
+        self.payment_provider: PaymentProvider = get_object(kwargs.get('payment_provider'))
+        # The list of additional payment options.
+        self.additional_payment_options: list[PaymentOption] = get_object(kwargs.get('additional_payment_options'))
+        # Saved server-side order information; may be null.
+        self.saved_order_info: OrderInfo = get_object(kwargs.get('saved_order_info'))
+        # The list of saved payment credentials.
+        self.saved_credentials: list[SavedCredentials] = get_object(kwargs.get('saved_credentials'))
+        # True, if the user can choose to save credentials.
+        self.can_save_credentials: bool = get_object(kwargs.get('can_save_credentials'))
+        # True, if the user will be able to save credentials, if sets up a 2-step verification password.
+        self.need_password: bool = get_object(kwargs.get('need_password'))
+        # Product title.
+        self.product_title: str = get_object(kwargs.get('product_title'))
+        # Product description.
+        self.product_description: FormattedText = get_object(kwargs.get('product_description'))
+        # Product photo; may be null.
+        self.product_photo: Photo = get_object(kwargs.get('product_photo'))
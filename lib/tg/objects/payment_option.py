@@ -0,0 +1,11 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class PaymentOption(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Title for the payment option.
+        self.title: str = get_object(kwargs.get('title'))
+        # Payment form URL to be opened in a web view.
+        self.url: str = get_object(kwargs.get('url'))
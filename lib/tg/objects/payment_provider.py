@@ -0,0 +1,36 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class PaymentProvider(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class PaymentProviderSmartGlocal(PaymentProvider):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Public payment token.
+        self.public_token: str = get_object(kwargs.get('public_token'))
+        # URL for sending card tokenization requests.
+        self.tokenize_url: str = get_object(kwargs.get('tokenize_url'))
+
+
+class PaymentProviderStripe(PaymentProvider):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Stripe API publishable key.
+        self.publishable_key: str = get_object(kwargs.get('publishable_key'))
+        # True, if the user country must be provided.
+        self.need_country: bool = get_object(kwargs.get('need_country'))
+        # True, if the user ZIP/postal code must be provided.
+        self.need_postal_code: bool = get_object(kwargs.get('need_postal_code'))
+        # True, if the cardholder name must be provided.
+        self.need_cardholder_name: bool = get_object(kwargs.get('need_cardholder_name'))
+
+
+class PaymentProviderOther(PaymentProvider):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Payment form URL.
+        self.url: str = get_object(kwargs.get('url'))
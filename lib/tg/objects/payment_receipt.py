@@ -0,0 +1,29 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class PaymentReceipt(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Product title.
+        self.title: str = get_object(kwargs.get('title'))
+        # Product description.
+        self.description: FormattedText = get_object(kwargs.get('description'))
+        # Product photo; may be null.
+        self.photo: Photo = get_object(kwargs.get('photo'))
+        # Point in time (Unix timestamp) when the payment was made.
+        self.date: int = get_object(kwargs.get('date'))
+        # User identifier of the seller bot.
+        self.seller_bot_user_id: int = get_object(kwargs.get('seller_bot_user_id'))
+        # User identifier of the payment provider bot.
+        self.payment_provider_user_id: int = get_object(kwargs.get('payment_provider_user_id'))
+        # Information about the invoice.
+        self.invoice: Invoice = get_object(kwargs.get('invoice'))
+        # Order information; may be null.
+        self.order_info: OrderInfo = get_object(kwargs.get('order_info'))
+        # Chosen shipping option; may be null.
+        self.shipping_option: ShippingOption = get_object(kwargs.get('shipping_option'))
+        # Title of the saved credentials chosen by the buyer.
+        self.credentials_title: str = get_object(kwargs.get('credentials_title'))
+        # The amount of tip chosen by the buyer in the smallest units of the currency.
+        self.tip_amount: int = get_object(kwargs.get('tip_amount'))
@@ -0,0 +1,11 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class PaymentResult(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # True, if the payment request was successful; otherwise, the verification_url will be non-empty.
+        self.success: bool = get_object(kwargs.get('success'))
+        # URL for additional payment credentials verification.
+        self.verification_url: str = get_object(kwargs.get('verification_url'))
@@ -0,0 +1,27 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class PersonalDetails(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # First name of the user written in English; 1-255 characters.
+        self.first_name: str = get_object(kwargs.get('first_name'))
+        # Middle name of the user written in English; 0-255 characters.
+        self.middle_name: str = get_object(kwargs.get('middle_name'))
+        # Last name of the user written in English; 1-255 characters.
+        self.last_name: str = get_object(kwargs.get('last_name'))
+        # Native first name of the user; 1-255 characters.
+        self.native_first_name: str = get_object(kwargs.get('native_first_name'))
+        # Native middle name of the user; 0-255 characters.
+        self.native_middle_name: str = get_object(kwargs.get('native_middle_name'))
+        # Native last name of the user; 1-255 characters.
+        self.native_last_name: str = get_object(kwargs.get('native_last_name'))
+        # Birthdate of the user.
+        self.birthdate: Date = get_object(kwargs.get('birthdate'))
+        # Gender of the user, &quot;male&quot; or &quot;female&quot;.
+        self.gender: str = get_object(kwargs.get('gender'))
+        # A two-letter ISO 3166-1 alpha-2 country code of the user's country.
+        self.country_code: str = get_object(kwargs.get('country_code'))
+        # A two-letter ISO 3166-1 alpha-2 country code of the user's residence country.
+        self.residence_country_code: str = get_object(kwargs.get('residence_country_code'))
@@ -0,0 +1,19 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class PhoneNumberAuthenticationSettings(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Pass true if the authentication code may be sent via a flash call to the specified phone number.
+        self.allow_flash_call: bool = get_object(kwargs.get('allow_flash_call'))
+        # Pass true if the authentication code may be sent via a missed call to the specified phone number.
+        self.allow_missed_call: bool = get_object(kwargs.get('allow_missed_call'))
+        # Pass true if the authenticated phone number is used on the current device.
+        self.is_current_phone_number: bool = get_object(kwargs.get('is_current_phone_number'))
+        # For official applications only. True, if the application can use Android SMS Retriever API (requires Google Play Services &gt;= 10.2) to automatically receive the authentication code from the SMS. See https://developers.google.com/identity/sms-retriever/ for more details.
+        self.allow_sms_retriever_api: bool = get_object(kwargs.get('allow_sms_retriever_api'))
+        # For official Android and iOS applications only; pass null otherwise. Settings for Firebase Authentication.
+        self.firebase_authentication_settings: FirebaseAuthenticationSettings = get_object(kwargs.get('firebase_authentication_settings'))
+        # List of up to 20 authentication tokens, recently received in updateOption(&quot;authentication_token&quot;) in previously logged out sessions.
+        self.authentication_tokens: list[str] = get_object(kwargs.get('authentication_tokens'))
@@ -0,0 +1,15 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class PhoneNumberInfo(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Information about the country to which the phone number belongs; may be null.
+        self.country: CountryInfo = get_object(kwargs.get('country'))
+        # The part of the phone number denoting country calling code or its part.
+        self.country_calling_code: str = get_object(kwargs.get('country_calling_code'))
+        # The phone number without country calling code formatted accordingly to local rules. Expected digits are returned as '-', but even more digits might be entered by the user.
+        self.formatted_phone_number: str = get_object(kwargs.get('formatted_phone_number'))
+        # True, if the phone number was bought on Fragment and isn't tied to a SIM card.
+        self.is_anonymous: bool = get_object(kwargs.get('is_anonymous'))
@@ -0,0 +1,13 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class Photo(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # True, if stickers were added to the photo. The list of corresponding sticker sets can be received using getAttachedStickerSets.
+        self.has_stickers: bool = get_object(kwargs.get('has_stickers'))
+        # Photo minithumbnail; may be null.
+        self.minithumbnail: Minithumbnail = get_object(kwargs.get('minithumbnail'))
+        # Available variants of the photo, in different sizes.
+        self.sizes: list[PhotoSize] = get_object(kwargs.get('sizes'))
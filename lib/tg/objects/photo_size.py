@@ -0,0 +1,17 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class PhotoSize(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Image type (see https://core.telegram.org/constructor/photoSize).
+        self.type: str = get_object(kwargs.get('type'))
+        # Information about the image file.
+        self.photo: File = get_object(kwargs.get('photo'))
+        # Image width.
+        self.width: int = get_object(kwargs.get('width'))
+        # Image height.
+        self.height: int = get_object(kwargs.get('height'))
+        # Sizes of progressive JPEG file prefixes, which can be used to preliminarily show the image; in bytes.
+        self.progressive_sizes: list[int] = get_object(kwargs.get('progressive_sizes'))
@@ -0,0 +1,11 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class Point(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The point's first coordinate.
+        self.x: float = get_object(kwargs.get('x'))
+        # The point's second coordinate.
+        self.y: float = get_object(kwargs.get('y'))
@@ -0,0 +1,27 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class Poll(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Unique poll identifier.
+        self.id: int = get_object(kwargs.get('id'))
+        # Poll question; 1-300 characters.
+        self.question: str = get_object(kwargs.get('question'))
+        # List of poll answer options.
+        self.options: list[PollOption] = get_object(kwargs.get('options'))
+        # Total number of voters, participating in the poll.
+        self.total_voter_count: int = get_object(kwargs.get('total_voter_count'))
+        # Identifiers of recent voters, if the poll is non-anonymous.
+        self.recent_voter_ids: list[MessageSender] = get_object(kwargs.get('recent_voter_ids'))
+        # True, if the poll is anonymous.
+        self.is_anonymous: bool = get_object(kwargs.get('is_anonymous'))
+        # Type of the poll.
+        self.type: PollType = get_object(kwargs.get('type'))
+        # Amount of time the poll will be active after creation, in seconds.
+        self.open_period: int = get_object(kwargs.get('open_period'))
+        # Point in time (Unix timestamp) when the poll will automatically be closed.
+        self.close_date: int = get_object(kwargs.get('close_date'))
+        # True, if the poll is closed.
+        self.is_closed: bool = get_object(kwargs.get('is_closed'))
@@ -0,0 +1,17 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class PollOption(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Option text; 1-100 characters.
+        self.text: str = get_object(kwargs.get('text'))
+        # Number of voters for this option, available only for closed or voted polls.
+        self.voter_count: int = get_object(kwargs.get('voter_count'))
+        # The percentage of votes for this option; 0-100.
+        self.vote_percentage: int = get_object(kwargs.get('vote_percentage'))
+        # True, if the option was chosen by the user.
+        self.is_chosen: bool = get_object(kwargs.get('is_chosen'))
+        # True, if the option is being chosen by a pending setPollAnswer request.
+        self.is_being_chosen: bool = get_object(kwargs.get('is_being_chosen'))
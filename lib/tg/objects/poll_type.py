@@ -0,0 +1,23 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class PollType(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class PollTypeRegular(PollType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # True, if multiple answer options can be chosen simultaneously.
+        self.allow_multiple_answers: bool = get_object(kwargs.get('allow_multiple_answers'))
+
+
+class PollTypeQuiz(PollType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # 0-based identifier of the correct answer option; -1 for a yet unanswered poll.
+        self.correct_option_id: int = get_object(kwargs.get('correct_option_id'))
+        # Text that is shown when the user chooses an incorrect answer or taps on the lamp icon; 0-200 characters with at most 2 line feeds; empty for a yet unanswered poll.
+        self.explanation: FormattedText = get_object(kwargs.get('explanation'))
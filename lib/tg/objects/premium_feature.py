@@ -0,0 +1,102 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object
+
+
+class PremiumFeature(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class PremiumFeatureIncreasedLimits(PremiumFeature):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class PremiumFeatureIncreasedUploadFileSize(PremiumFeature):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class PremiumFeatureImprovedDownloadSpeed(PremiumFeature):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class PremiumFeatureVoiceRecognition(PremiumFeature):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class PremiumFeatureDisabledAds(PremiumFeature):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class PremiumFeatureUniqueReactions(PremiumFeature):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class PremiumFeatureUniqueStickers(PremiumFeature):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class PremiumFeatureCustomEmoji(PremiumFeature):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class PremiumFeatureAdvancedChatManagement(PremiumFeature):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class PremiumFeatureProfileBadge(PremiumFeature):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class PremiumFeatureEmojiStatus(PremiumFeature):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class PremiumFeatureAnimatedProfilePhoto(PremiumFeature):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class PremiumFeatureForumTopicIcon(PremiumFeature):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class PremiumFeatureAppIcons(PremiumFeature):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class PremiumFeatureRealTimeChatTranslation(PremiumFeature):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class PremiumFeatureUpgradedStories(PremiumFeature):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class PremiumFeatureChatBoost(PremiumFeature):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class PremiumFeatureAccentColor(PremiumFeature):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class PremiumFeatureBackgroundForBoth(PremiumFeature):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
@@ -0,0 +1,11 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class PremiumFeaturePromotionAnimation(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Premium feature.
+        self.feature: PremiumFeature = get_object(kwargs.get('feature'))
+        # Promotion animation for the feature.
+        self.animation: Animation = get_object(kwargs.get('animation'))
@@ -0,0 +1,13 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class PremiumFeatures(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The list of available features.
+        self.features: list[PremiumFeature] = get_object(kwargs.get('features'))
+        # The list of limits, increased for Premium users.
+        self.limits: list[PremiumLimit] = get_object(kwargs.get('limits'))
+        # An internal link to be opened to pay for Telegram Premium if store payment isn't possible; may be null if direct payment isn't available.
+        self.payment_link: InternalLinkType = get_object(kwargs.get('payment_link'))
@@ -0,0 +1,21 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class PremiumGiftCodeInfo(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Identifier of a chat or a user that created the gift code; may be null if unknown. If null and the code is from messagePremiumGiftCode message, then creator_id from the message can be used.
+        self.creator_id: MessageSender = get_object(kwargs.get('creator_id'))
+        # Point in time (Unix timestamp) when the code was created.
+        self.creation_date: int = get_object(kwargs.get('creation_date'))
+        # True, if the gift code was created for a giveaway.
+        self.is_from_giveaway: bool = get_object(kwargs.get('is_from_giveaway'))
+        # Identifier of the corresponding giveaway message in the creator_id chat; can be 0 or an identifier of a deleted message.
+        self.giveaway_message_id: int = get_object(kwargs.get('giveaway_message_id'))
+        # Number of months the Telegram Premium subscription will be active after code activation.
+        self.month_count: int = get_object(kwargs.get('month_count'))
+        # Identifier of a user for which the code was created; 0 if none.
+        self.user_id: int = get_object(kwargs.get('user_id'))
+        # Point in time (Unix timestamp) when the code was activated; 0 if none.
+        self.use_date: int = get_object(kwargs.get('use_date'))
@@ -0,0 +1,19 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class PremiumGiftCodePaymentOption(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # ISO 4217 currency code for Telegram Premium gift code payment.
+        self.currency: str = get_object(kwargs.get('currency'))
+        # The amount to pay, in the smallest units of the currency.
+        self.amount: int = get_object(kwargs.get('amount'))
+        # Number of users which will be able to activate the gift codes.
+        self.user_count: int = get_object(kwargs.get('user_count'))
+        # Number of months the Telegram Premium subscription will be active.
+        self.month_count: int = get_object(kwargs.get('month_count'))
+        # Identifier of the store product associated with the option; may be empty if none.
+        self.store_product_id: str = get_object(kwargs.get('store_product_id'))
+        # Number of times the store product must be paid.
+        self.store_product_quantity: int = get_object(kwargs.get('store_product_quantity'))
@@ -0,0 +1,35 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class PremiumGiveawayInfo(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class PremiumGiveawayInfoOngoing(PremiumGiveawayInfo):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Point in time (Unix timestamp) when the giveaway was created.
+        self.creation_date: int = get_object(kwargs.get('creation_date'))
+        # Status of the current user in the giveaway.
+        self.status: PremiumGiveawayParticipantStatus = get_object(kwargs.get('status'))
+        # True, if the giveaway has ended and results are being prepared.
+        self.is_ended: bool = get_object(kwargs.get('is_ended'))
+
+
+class PremiumGiveawayInfoCompleted(PremiumGiveawayInfo):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Point in time (Unix timestamp) when the giveaway was created.
+        self.creation_date: int = get_object(kwargs.get('creation_date'))
+        # Point in time (Unix timestamp) when the winners were selected. May be bigger than winners selection date specified in parameters of the giveaway.
+        self.actual_winners_selection_date: int = get_object(kwargs.get('actual_winners_selection_date'))
+        # True, if the giveaway was canceled and was fully refunded.
+        self.was_refunded: bool = get_object(kwargs.get('was_refunded'))
+        # Number of winners in the giveaway.
+        self.winner_count: int = get_object(kwargs.get('winner_count'))
+        # Number of winners, which activated their gift codes.
+        self.activation_count: int = get_object(kwargs.get('activation_count'))
+        # Telegram Premium gift code that was received by the current user; empty if the user isn't a winner in the giveaway.
+        self.gift_code: str = get_object(kwargs.get('gift_code'))
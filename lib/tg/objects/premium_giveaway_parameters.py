@@ -0,0 +1,21 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class PremiumGiveawayParameters(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Identifier of the channel chat, which will be automatically boosted by the winners of the giveaway for duration of the Premium subscription.
+        self.boosted_chat_id: int = get_object(kwargs.get('boosted_chat_id'))
+        # Identifiers of other channel chats that must be subscribed by the users to be eligible for the giveaway. There can be up to getOption(&quot;giveaway_additional_chat_count_max&quot;) additional chats.
+        self.additional_chat_ids: list[int] = get_object(kwargs.get('additional_chat_ids'))
+        # Point in time (Unix timestamp) when the giveaway is expected to be performed; must be 60-getOption(&quot;giveaway_duration_max&quot;) seconds in the future in scheduled giveaways.
+        self.winners_selection_date: int = get_object(kwargs.get('winners_selection_date'))
+        # True, if only new members of the chats will be eligible for the giveaway.
+        self.only_new_members: bool = get_object(kwargs.get('only_new_members'))
+        # True, if the list of winners of the giveaway will be available to everyone.
+        self.has_public_winners: bool = get_object(kwargs.get('has_public_winners'))
+        # The list of two-letter ISO 3166-1 alpha-2 codes of countries, users from which will be eligible for the giveaway. If empty, then all users can participate in the giveaway. There can be up to getOption(&quot;giveaway_country_count_max&quot;) chosen countries. Users with phone number that was bought on Fragment can participate in any giveaway and the country code &quot;FT&quot; must not be specified in the list.
+        self.country_codes: list[str] = get_object(kwargs.get('country_codes'))
+        # Additional description of the giveaway prize; 0-128 characters.
+        self.prize_description: str = get_object(kwargs.get('prize_description'))
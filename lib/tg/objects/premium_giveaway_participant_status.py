@@ -0,0 +1,38 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class PremiumGiveawayParticipantStatus(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class PremiumGiveawayParticipantStatusEligible(PremiumGiveawayParticipantStatus):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class PremiumGiveawayParticipantStatusParticipating(PremiumGiveawayParticipantStatus):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class PremiumGiveawayParticipantStatusAlreadyWasMember(PremiumGiveawayParticipantStatus):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Point in time (Unix timestamp) when the user joined the chat.
+        self.joined_chat_date: int = get_object(kwargs.get('joined_chat_date'))
+
+
+class PremiumGiveawayParticipantStatusAdministrator(PremiumGiveawayParticipantStatus):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Identifier of the chat administered by the user.
+        self.chat_id: int = get_object(kwargs.get('chat_id'))
+
+
+class PremiumGiveawayParticipantStatusDisallowedCountry(PremiumGiveawayParticipantStatus):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # A two-letter ISO 3166-1 alpha-2 country code of the user's country.
+        self.user_country_code: str = get_object(kwargs.get('user_country_code'))
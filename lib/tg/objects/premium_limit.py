@@ -0,0 +1,13 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class PremiumLimit(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The type of the limit.
+        self.type: PremiumLimitType = get_object(kwargs.get('type'))
+        # Default value of the limit.
+        self.default_value: int = get_object(kwargs.get('default_value'))
+        # Value of the limit for Premium users.
+        self.premium_value: int = get_object(kwargs.get('premium_value'))
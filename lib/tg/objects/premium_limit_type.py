@@ -0,0 +1,97 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object
+
+
+class PremiumLimitType(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class PremiumLimitTypeSupergroupCount(PremiumLimitType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class PremiumLimitTypePinnedChatCount(PremiumLimitType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class PremiumLimitTypeCreatedPublicChatCount(PremiumLimitType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class PremiumLimitTypeSavedAnimationCount(PremiumLimitType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class PremiumLimitTypeFavoriteStickerCount(PremiumLimitType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class PremiumLimitTypeChatFolderCount(PremiumLimitType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class PremiumLimitTypeChatFolderChosenChatCount(PremiumLimitType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class PremiumLimitTypePinnedArchivedChatCount(PremiumLimitType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class PremiumLimitTypeCaptionLength(PremiumLimitType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class PremiumLimitTypeBioLength(PremiumLimitType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class PremiumLimitTypeChatFolderInviteLinkCount(PremiumLimitType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class PremiumLimitTypeShareableChatFolderCount(PremiumLimitType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class PremiumLimitTypeActiveStoryCount(PremiumLimitType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class PremiumLimitTypeWeeklySentStoryCount(PremiumLimitType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class PremiumLimitTypeMonthlySentStoryCount(PremiumLimitType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class PremiumLimitTypeStoryCaptionLength(PremiumLimitType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class PremiumLimitTypeStorySuggestedReactionAreaCount(PremiumLimitType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class PremiumLimitTypeSimilarChatCount(PremiumLimitType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
@@ -0,0 +1,19 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class PremiumPaymentOption(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # ISO 4217 currency code for Telegram Premium subscription payment.
+        self.currency: str = get_object(kwargs.get('currency'))
+        # The amount to pay, in the smallest units of the currency.
+        self.amount: int = get_object(kwargs.get('amount'))
+        # The discount associated with this option, as a percentage.
+        self.discount_percentage: int = get_object(kwargs.get('discount_percentage'))
+        # Number of months the Telegram Premium subscription will be active.
+        self.month_count: int = get_object(kwargs.get('month_count'))
+        # Identifier of the store product associated with the option.
+        self.store_product_id: str = get_object(kwargs.get('store_product_id'))
+        # An internal link to be opened for buying Telegram Premium to the user if store payment isn't possible; may be null if direct payment isn't available.
+        self.payment_link: InternalLinkType = get_object(kwargs.get('payment_link'))
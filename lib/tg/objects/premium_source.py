@@ -0,0 +1,40 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class PremiumSource(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class PremiumSourceLimitExceeded(PremiumSource):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Type of the exceeded limit.
+        self.limit_type: PremiumLimitType = get_object(kwargs.get('limit_type'))
+
+
+class PremiumSourceFeature(PremiumSource):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The used feature.
+        self.feature: PremiumFeature = get_object(kwargs.get('feature'))
+
+
+class PremiumSourceStoryFeature(PremiumSource):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The used feature.
+        self.feature: PremiumStoryFeature = get_object(kwargs.get('feature'))
+
+
+class PremiumSourceLink(PremiumSource):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The referrer from the link.
+        self.referrer: str = get_object(kwargs.get('referrer'))
+
+
+class PremiumSourceSettings(PremiumSource):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
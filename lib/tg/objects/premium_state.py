@@ -0,0 +1,13 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class PremiumState(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Text description of the state of the current Premium subscription; may be empty if the current user has no Telegram Premium subscription.
+        self.state: FormattedText = get_object(kwargs.get('state'))
+        # The list of available options for buying Telegram Premium.
+        self.payment_options: list[PremiumStatePaymentOption] = get_object(kwargs.get('payment_options'))
+        # The list of available promotion animations for Premium features.
+        self.animations: list[PremiumFeaturePromotionAnimation] = get_object(kwargs.get('animations'))
@@ -0,0 +1,15 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class PremiumStatePaymentOption(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Information about the payment option.
+        self.payment_option: PremiumPaymentOption = get_object(kwargs.get('payment_option'))
+        # True, if this is the currently used Telegram Premium subscription option.
+        self.is_current: bool = get_object(kwargs.get('is_current'))
+        # True, if the payment option can be used to upgrade the existing Telegram Premium subscription.
+        self.is_upgrade: bool = get_object(kwargs.get('is_upgrade'))
+        # Identifier of the last in-store transaction for the currently used option.
+        self.last_transaction_id: str = get_object(kwargs.get('last_transaction_id'))
@@ -0,0 +1,37 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object
+
+
+class PremiumStoryFeature(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class PremiumStoryFeaturePriorityOrder(PremiumStoryFeature):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class PremiumStoryFeatureStealthMode(PremiumStoryFeature):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class PremiumStoryFeaturePermanentViewsHistory(PremiumStoryFeature):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class PremiumStoryFeatureCustomExpirationDuration(PremiumStoryFeature):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class PremiumStoryFeatureSaveStories(PremiumStoryFeature):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class PremiumStoryFeatureLinksAndFormatting(PremiumStoryFeature):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
@@ -0,0 +1,15 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class PrepaidPremiumGiveaway(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Unique identifier of the prepaid giveaway.
+        self.id: int = get_object(kwargs.get('id'))
+        # Number of users which will receive Telegram Premium subscription gift codes.
+        self.winner_count: int = get_object(kwargs.get('winner_count'))
+        # Number of months the Telegram Premium subscription will be active after code activation.
+        self.month_count: int = get_object(kwargs.get('month_count'))
+        # Point in time (Unix timestamp) when the giveaway was paid.
+        self.payment_date: int = get_object(kwargs.get('payment_date'))
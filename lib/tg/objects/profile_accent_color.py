@@ -0,0 +1,15 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class ProfileAccentColor(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Profile accent color identifier.
+        self.id: int = get_object(kwargs.get('id'))
+        # Accent colors expected to be used in light themes.
+        self.light_theme_colors: ProfileAccentColors = get_object(kwargs.get('light_theme_colors'))
+        # Accent colors expected to be used in dark themes.
+        self.dark_theme_colors: ProfileAccentColors = get_object(kwargs.get('dark_theme_colors'))
+        # The minimum chat boost level required to use the color.
+        self.min_chat_boost_level: int = get_object(kwargs.get('min_chat_boost_level'))
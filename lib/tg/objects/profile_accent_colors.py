@@ -0,0 +1,13 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class ProfileAccentColors(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The list of 1-2 colors in RGB format, describing the colors, as expected to be shown in the color palette settings.
+        self.palette_colors: list[int] = get_object(kwargs.get('palette_colors'))
+        # The list of 1-2 colors in RGB format, describing the colors, as expected to be used for the profile photo background.
+        self.background_colors: list[int] = get_object(kwargs.get('background_colors'))
+        # The list of 2 colors in RGB format, describing the colors of the gradient to be used for the unread active story indicator around profile photo.
+        self.story_colors: list[int] = get_object(kwargs.get('story_colors'))
@@ -0,0 +1,19 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class ProfilePhoto(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Photo identifier; 0 for an empty photo. Can be used to find a photo in a list of user profile photos.
+        self.id: int = get_object(kwargs.get('id'))
+        # A small (160x160) user profile photo. The file can be downloaded only before the photo is changed.
+        self.small: File = get_object(kwargs.get('small'))
+        # A big (640x640) user profile photo. The file can be downloaded only before the photo is changed.
+        self.big: File = get_object(kwargs.get('big'))
+        # User profile photo minithumbnail; may be null.
+        self.minithumbnail: Minithumbnail = get_object(kwargs.get('minithumbnail'))
+        # True, if the photo has animated variant.
+        self.has_animation: bool = get_object(kwargs.get('has_animation'))
+        # True, if the photo is visible only for the current user.
+        self.is_personal: bool = get_object(kwargs.get('is_personal'))
@@ -0,0 +1,19 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class Proxy(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Unique identifier of the proxy.
+        self.id: int = get_object(kwargs.get('id'))
+        # Proxy server domain or IP address.
+        self.server: str = get_object(kwargs.get('server'))
+        # Proxy server port.
+        self.port: int = get_object(kwargs.get('port'))
+        # Point in time (Unix timestamp) when the proxy was last used; 0 if never.
+        self.last_used_date: int = get_object(kwargs.get('last_used_date'))
+        # True, if the proxy is enabled now.
+        self.is_enabled: bool = get_object(kwargs.get('is_enabled'))
+        # Type of the proxy.
+        self.type: ProxyType = get_object(kwargs.get('type'))
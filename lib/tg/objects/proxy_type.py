@@ -0,0 +1,34 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class ProxyType(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class ProxyTypeSocks5(ProxyType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Username for logging in; may be empty.
+        self.username: str = get_object(kwargs.get('username'))
+        # Password for logging in; may be empty.
+        self.password: str = get_object(kwargs.get('password'))
+
+
+class ProxyTypeHttp(ProxyType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Username for logging in; may be empty.
+        self.username: str = get_object(kwargs.get('username'))
+        # Password for logging in; may be empty.
+        self.password: str = get_object(kwargs.get('password'))
+        # Pass true if the proxy supports only HTTP requests and doesn't support transparent TCP connections via HTTP CONNECT method.
+        self.http_only: bool = get_object(kwargs.get('http_only'))
+
+
+class ProxyTypeMtproto(ProxyType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The proxy's secret in hexadecimal encoding.
+        self.secret: str = get_object(kwargs.get('secret'))
@@ -0,0 +1,17 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object
+
+
+class PublicChatType(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class PublicChatTypeHasUsername(PublicChatType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class PublicChatTypeIsLocationBased(PublicChatType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
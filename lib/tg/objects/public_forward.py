@@ -0,0 +1,21 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class PublicForward(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class PublicForwardMessage(PublicForward):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Information about the message.
+        self.message: Message = get_object(kwargs.get('message'))
+
+
+class PublicForwardStory(PublicForward):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Information about the story.
+        self.story: Story = get_object(kwargs.get('story'))
@@ -0,0 +1,13 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class PublicForwards(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Approximate total number of messages and stories found.
+        self.total_count: int = get_object(kwargs.get('total_count'))
+        # List of found public forwards and reposts.
+        self.forwards: list[PublicForward] = get_object(kwargs.get('forwards'))
+        # The offset for the next request. If empty, then there are no more results.
+        self.next_offset: str = get_object(kwargs.get('next_offset'))
@@ -0,0 +1,297 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class PushMessageContent(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class PushMessageContentHidden(PushMessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # True, if the message is a pinned message with the specified content.
+        self.is_pinned: bool = get_object(kwargs.get('is_pinned'))
+
+
+class PushMessageContentAnimation(PushMessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Message content; may be null.
+        self.animation: Animation = get_object(kwargs.get('animation'))
+        # Animation caption.
+        self.caption: str = get_object(kwargs.get('caption'))
+        # True, if the message is a pinned message with the specified content.
+        self.is_pinned: bool = get_object(kwargs.get('is_pinned'))
+
+
+class PushMessageContentAudio(PushMessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Message content; may be null.
+        self.audio: Audio = get_object(kwargs.get('audio'))
+        # True, if the message is a pinned message with the specified content.
+        self.is_pinned: bool = get_object(kwargs.get('is_pinned'))
+
+
+class PushMessageContentContact(PushMessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Contact's name.
+        self.name: str = get_object(kwargs.get('name'))
+        # True, if the message is a pinned message with the specified content.
+        self.is_pinned: bool = get_object(kwargs.get('is_pinned'))
+
+
+class PushMessageContentContactRegistered(PushMessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class PushMessageContentDocument(PushMessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Message content; may be null.
+        self.document: Document = get_object(kwargs.get('document'))
+        # True, if the message is a pinned message with the specified content.
+        self.is_pinned: bool = get_object(kwargs.get('is_pinned'))
+
+
+class PushMessageContentGame(PushMessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Game title, empty for pinned game message.
+        self.title: str = get_object(kwargs.get('title'))
+        # True, if the message is a pinned message with the specified content.
+        self.is_pinned: bool = get_object(kwargs.get('is_pinned'))
+
+
+class PushMessageContentGameScore(PushMessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Game title, empty for pinned message.
+        self.title: str = get_object(kwargs.get('title'))
+        # New score, 0 for pinned message.
+        self.score: int = get_object(kwargs.get('score'))
+        # True, if the message is a pinned message with the specified content.
+        self.is_pinned: bool = get_object(kwargs.get('is_pinned'))
+
+
+class PushMessageContentInvoice(PushMessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Product price.
+        self.price: str = get_object(kwargs.get('price'))
+        # True, if the message is a pinned message with the specified content.
+        self.is_pinned: bool = get_object(kwargs.get('is_pinned'))
+
+
+class PushMessageContentLocation(PushMessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # True, if the location is live.
+        self.is_live: bool = get_object(kwargs.get('is_live'))
+        # True, if the message is a pinned message with the specified content.
+        self.is_pinned: bool = get_object(kwargs.get('is_pinned'))
+
+
+class PushMessageContentPhoto(PushMessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Message content; may be null.
+        self.photo: Photo = get_object(kwargs.get('photo'))
+        # Photo caption.
+        self.caption: str = get_object(kwargs.get('caption'))
+        # True, if the photo is secret.
+        self.is_secret: bool = get_object(kwargs.get('is_secret'))
+        # True, if the message is a pinned message with the specified content.
+        self.is_pinned: bool = get_object(kwargs.get('is_pinned'))
+
+
+class PushMessageContentPoll(PushMessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Poll question.
+        self.question: str = get_object(kwargs.get('question'))
+        # True, if the poll is regular and not in quiz mode.
+        self.is_regular: bool = get_object(kwargs.get('is_regular'))
+        # True, if the message is a pinned message with the specified content.
+        self.is_pinned: bool = get_object(kwargs.get('is_pinned'))
+
+
+class PushMessageContentPremiumGiftCode(PushMessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Number of months the Telegram Premium subscription will be active after code activation.
+        self.month_count: int = get_object(kwargs.get('month_count'))
+
+
+class PushMessageContentPremiumGiveaway(PushMessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Number of users which will receive Telegram Premium subscription gift codes; 0 for pinned message.
+        self.winner_count: int = get_object(kwargs.get('winner_count'))
+        # Number of months the Telegram Premium subscription will be active after code activation; 0 for pinned message.
+        self.month_count: int = get_object(kwargs.get('month_count'))
+        # True, if the message is a pinned message with the specified content.
+        self.is_pinned: bool = get_object(kwargs.get('is_pinned'))
+
+
+class PushMessageContentScreenshotTaken(PushMessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class PushMessageContentSticker(PushMessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Message content; may be null.
+        self.sticker: Sticker = get_object(kwargs.get('sticker'))
+        # Emoji corresponding to the sticker; may be empty.
+        self.emoji: str = get_object(kwargs.get('emoji'))
+        # True, if the message is a pinned message with the specified content.
+        self.is_pinned: bool = get_object(kwargs.get('is_pinned'))
+
+
+class PushMessageContentStory(PushMessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # True, if the message is a pinned message with the specified content.
+        self.is_pinned: bool = get_object(kwargs.get('is_pinned'))
+
+
+class PushMessageContentText(PushMessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Message text.
+        self.text: str = get_object(kwargs.get('text'))
+        # True, if the message is a pinned message with the specified content.
+        self.is_pinned: bool = get_object(kwargs.get('is_pinned'))
+
+
+class PushMessageContentVideo(PushMessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Message content; may be null.
+        self.video: Video = get_object(kwargs.get('video'))
+        # Video caption.
+        self.caption: str = get_object(kwargs.get('caption'))
+        # True, if the video is secret.
+        self.is_secret: bool = get_object(kwargs.get('is_secret'))
+        # True, if the message is a pinned message with the specified content.
+        self.is_pinned: bool = get_object(kwargs.get('is_pinned'))
+
+
+class PushMessageContentVideoNote(PushMessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Message content; may be null.
+        self.video_note: VideoNote = get_object(kwargs.get('video_note'))
+        # True, if the message is a pinned message with the specified content.
+        self.is_pinned: bool = get_object(kwargs.get('is_pinned'))
+
+
+class PushMessageContentVoiceNote(PushMessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Message content; may be null.
+        self.voice_note: VoiceNote = get_object(kwargs.get('voice_note'))
+        # True, if the message is a pinned message with the specified content.
+        self.is_pinned: bool = get_object(kwargs.get('is_pinned'))
+
+
+class PushMessageContentBasicGroupChatCreate(PushMessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class PushMessageContentChatAddMembers(PushMessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Name of the added member.
+        self.member_name: str = get_object(kwargs.get('member_name'))
+        # True, if the current user was added to the group.
+        self.is_current_user: bool = get_object(kwargs.get('is_current_user'))
+        # True, if the user has returned to the group themselves.
+        self.is_returned: bool = get_object(kwargs.get('is_returned'))
+
+
+class PushMessageContentChatChangePhoto(PushMessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class PushMessageContentChatChangeTitle(PushMessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # New chat title.
+        self.title: str = get_object(kwargs.get('title'))
+
+
+class PushMessageContentChatSetBackground(PushMessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # True, if the set background is the same as the background of the current user.
+        self.is_same: bool = get_object(kwargs.get('is_same'))
+
+
+class PushMessageContentChatSetTheme(PushMessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # If non-empty, name of a new theme, set for the chat. Otherwise, the chat theme was reset to the default one.
+        self.theme_name: str = get_object(kwargs.get('theme_name'))
+
+
+class PushMessageContentChatDeleteMember(PushMessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Name of the deleted member.
+        self.member_name: str = get_object(kwargs.get('member_name'))
+        # True, if the current user was deleted from the group.
+        self.is_current_user: bool = get_object(kwargs.get('is_current_user'))
+        # True, if the user has left the group themselves.
+        self.is_left: bool = get_object(kwargs.get('is_left'))
+
+
+class PushMessageContentChatJoinByLink(PushMessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class PushMessageContentChatJoinByRequest(PushMessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class PushMessageContentRecurringPayment(PushMessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The paid amount.
+        self.amount: str = get_object(kwargs.get('amount'))
+
+
+class PushMessageContentSuggestProfilePhoto(PushMessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class PushMessageContentMessageForwards(PushMessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Number of forwarded messages.
+        self.total_count: int = get_object(kwargs.get('total_count'))
+
+
+class PushMessageContentMediaAlbum(PushMessageContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Number of messages in the album.
+        self.total_count: int = get_object(kwargs.get('total_count'))
+        # True, if the album has at least one photo.
+        self.has_photos: bool = get_object(kwargs.get('has_photos'))
+        # True, if the album has at least one video file.
+        self.has_videos: bool = get_object(kwargs.get('has_videos'))
+        # True, if the album has at least one audio file.
+        self.has_audios: bool = get_object(kwargs.get('has_audios'))
+        # True, if the album has at least one document.
+        self.has_documents: bool = get_object(kwargs.get('has_documents'))
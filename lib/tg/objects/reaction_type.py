@@ -0,0 +1,21 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class ReactionType(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class ReactionTypeEmoji(ReactionType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Text representation of the reaction.
+        self.emoji: str = get_object(kwargs.get('emoji'))
+
+
+class ReactionTypeCustomEmoji(ReactionType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Unique identifier of the custom emoji.
+        self.custom_emoji_id: int = get_object(kwargs.get('custom_emoji_id'))
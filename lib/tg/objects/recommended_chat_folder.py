@@ -0,0 +1,11 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class RecommendedChatFolder(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The chat folder.
+        self.folder: ChatFolder = get_object(kwargs.get('folder'))
+        # Chat folder description.
+        self.description: str = get_object(kwargs.get('description'))
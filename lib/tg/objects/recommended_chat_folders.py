@@ -0,0 +1,9 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class RecommendedChatFolders(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # List of recommended chat folders.
+        self.chat_folders: list[RecommendedChatFolder] = get_object(kwargs.get('chat_folders'))
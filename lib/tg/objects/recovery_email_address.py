@@ -0,0 +1,9 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class RecoveryEmailAddress(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Recovery email address.
+        self.recovery_email_address: str = get_object(kwargs.get('recovery_email_address'))
@@ -0,0 +1,17 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class RemoteFile(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Remote file identifier; may be empty. Can be used by the current user across application restarts or even from other devices. Uniquely identifies a file, but a file can have a lot of different valid identifiers. If the identifier starts with &quot;<a href="http://">http://</a>&quot; or &quot;<a href="https://">https://</a>&quot;, it represents the HTTP URL of the file. TDLib is currently unable to download files if only their URL is known. If downloadFile/addFileToDownloads is called on such a file or if it is sent to a secret chat, TDLib starts a file generation process by sending updateFileGenerationStart to the application with the HTTP URL in the original_path and &quot;\#url\#&quot; as the conversion string. Application must generate the file by downloading it to the specified location.
+        self.id: str = get_object(kwargs.get('id'))
+        # Unique file identifier; may be empty if unknown. The unique file identifier which is the same for the same file even for different users and is persistent over time.
+        self.unique_id: str = get_object(kwargs.get('unique_id'))
+        # True, if the file is currently being uploaded (or a remote copy is being generated by some other means).
+        self.is_uploading_active: bool = get_object(kwargs.get('is_uploading_active'))
+        # True, if a remote copy is fully available.
+        self.is_uploading_completed: bool = get_object(kwargs.get('is_uploading_completed'))
+        # Size of the remote available part of the file, in bytes; 0 if unknown.
+        self.uploaded_size: int = get_object(kwargs.get('uploaded_size'))
@@ -0,0 +1,47 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class ReplyMarkup(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class ReplyMarkupRemoveKeyboard(ReplyMarkup):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # True, if the keyboard is removed only for the mentioned users or the target user of a reply.
+        self.is_personal: bool = get_object(kwargs.get('is_personal'))
+
+
+class ReplyMarkupForceReply(ReplyMarkup):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # True, if a forced reply must automatically be shown to the current user. For outgoing messages, specify true to show the forced reply only for the mentioned users and for the target user of a reply.
+        self.is_personal: bool = get_object(kwargs.get('is_personal'))
+        # If non-empty, the placeholder to be shown in the input field when the reply is active; 0-64 characters.
+        self.input_field_placeholder: str = get_object(kwargs.get('input_field_placeholder'))
+
+
+class ReplyMarkupShowKeyboard(ReplyMarkup):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # A list of rows of bot keyboard buttons.
+        self.rows: list[list[KeyboardButton]] = get_object(kwargs.get('rows'))
+        # True, if the keyboard is supposed to always be shown when the ordinary keyboard is hidden.
+        self.is_persistent: bool = get_object(kwargs.get('is_persistent'))
+        # True, if the application needs to resize the keyboard vertically.
+        self.resize_keyboard: bool = get_object(kwargs.get('resize_keyboard'))
+        # True, if the application needs to hide the keyboard after use.
+        self.one_time: bool = get_object(kwargs.get('one_time'))
+        # True, if the keyboard must automatically be shown to the current user. For outgoing messages, specify true to show the keyboard only for the mentioned users and for the target user of a reply.
+        self.is_personal: bool = get_object(kwargs.get('is_personal'))
+        # If non-empty, the placeholder to be shown in the input field when the keyboard is active; 0-64 characters.
+        self.input_field_placeholder: str = get_object(kwargs.get('input_field_placeholder'))
+
+
+class ReplyMarkupInlineKeyboard(ReplyMarkup):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # A list of rows of inline keyboard buttons.
+        self.rows: list[list[InlineKeyboardButton]] = get_object(kwargs.get('rows'))
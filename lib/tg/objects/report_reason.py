@@ -0,0 +1,57 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object
+
+
+class ReportReason(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class ReportReasonSpam(ReportReason):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class ReportReasonViolence(ReportReason):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class ReportReasonPornography(ReportReason):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class ReportReasonChildAbuse(ReportReason):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class ReportReasonCopyright(ReportReason):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class ReportReasonUnrelatedLocation(ReportReason):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class ReportReasonFake(ReportReason):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class ReportReasonIllegalDrugs(ReportReason):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class ReportReasonPersonalDetails(ReportReason):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class ReportReasonCustom(ReportReason):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
@@ -0,0 +1,26 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class ResetPasswordResult(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class ResetPasswordResultOk(ResetPasswordResult):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class ResetPasswordResultPending(ResetPasswordResult):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Point in time (Unix timestamp) after which the password can be reset immediately using resetPassword.
+        self.pending_reset_date: int = get_object(kwargs.get('pending_reset_date'))
+
+
+class ResetPasswordResultDeclined(ResetPasswordResult):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Point in time (Unix timestamp) when the password reset can be retried.
+        self.retry_date: int = get_object(kwargs.get('retry_date'))
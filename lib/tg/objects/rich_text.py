@@ -0,0 +1,146 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class RichText(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class RichTextPlain(RichText):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Text.
+        self.text: str = get_object(kwargs.get('text'))
+
+
+class RichTextBold(RichText):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Text.
+        self.text: RichText = get_object(kwargs.get('text'))
+
+
+class RichTextItalic(RichText):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Text.
+        self.text: RichText = get_object(kwargs.get('text'))
+
+
+class RichTextUnderline(RichText):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Text.
+        self.text: RichText = get_object(kwargs.get('text'))
+
+
+class RichTextStrikethrough(RichText):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Text.
+        self.text: RichText = get_object(kwargs.get('text'))
+
+
+class RichTextFixed(RichText):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Text.
+        self.text: RichText = get_object(kwargs.get('text'))
+
+
+class RichTextUrl(RichText):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Text.
+        self.text: RichText = get_object(kwargs.get('text'))
+        # URL.
+        self.url: str = get_object(kwargs.get('url'))
+        # True, if the URL has cached instant view server-side.
+        self.is_cached: bool = get_object(kwargs.get('is_cached'))
+
+
+class RichTextEmailAddress(RichText):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Text.
+        self.text: RichText = get_object(kwargs.get('text'))
+        # Email address.
+        self.email_address: str = get_object(kwargs.get('email_address'))
+
+
+class RichTextSubscript(RichText):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Text.
+        self.text: RichText = get_object(kwargs.get('text'))
+
+
+class RichTextSuperscript(RichText):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Text.
+        self.text: RichText = get_object(kwargs.get('text'))
+
+
+class RichTextMarked(RichText):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Text.
+        self.text: RichText = get_object(kwargs.get('text'))
+
+
+class RichTextPhoneNumber(RichText):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Text.
+        self.text: RichText = get_object(kwargs.get('text'))
+        # Phone number.
+        self.phone_number: str = get_object(kwargs.get('phone_number'))
+
+
+class RichTextIcon(RichText):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The image represented as a document. The image can be in GIF, JPEG or PNG format.
+        self.document: Document = get_object(kwargs.get('document'))
+        # Width of a bounding box in which the image must be shown; 0 if unknown.
+        self.width: int = get_object(kwargs.get('width'))
+        # Height of a bounding box in which the image must be shown; 0 if unknown.
+        self.height: int = get_object(kwargs.get('height'))
+
+
+class RichTextReference(RichText):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The text.
+        self.text: RichText = get_object(kwargs.get('text'))
+        # The name of a richTextAnchor object, which is the first element of the target richTexts object.
+        self.anchor_name: str = get_object(kwargs.get('anchor_name'))
+        # An HTTP URL, opening the reference.
+        self.url: str = get_object(kwargs.get('url'))
+
+
+class RichTextAnchor(RichText):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Anchor name.
+        self.name: str = get_object(kwargs.get('name'))
+
+
+class RichTextAnchorLink(RichText):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The link text.
+        self.text: RichText = get_object(kwargs.get('text'))
+        # The anchor name. If the name is empty, the link must bring back to top.
+        self.anchor_name: str = get_object(kwargs.get('anchor_name'))
+        # An HTTP URL, opening the anchor.
+        self.url: str = get_object(kwargs.get('url'))
+
+
+class RichTexts(RichText):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Texts.
+        self.texts: list[RichText] = get_object(kwargs.get('texts'))
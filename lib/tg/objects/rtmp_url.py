@@ -0,0 +1,11 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class RtmpUrl(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The URL.
+        self.url: str = get_object(kwargs.get('url'))
+        # Stream key.
+        self.stream_key: str = get_object(kwargs.get('stream_key'))
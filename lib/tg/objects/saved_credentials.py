@@ -0,0 +1,11 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class SavedCredentials(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Unique identifier of the saved credentials.
+        self.id: str = get_object(kwargs.get('id'))
+        # Title of the saved credentials.
+        self.title: str = get_object(kwargs.get('title'))
@@ -0,0 +1,13 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class ScopeAutosaveSettings(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # True, if photo autosave is enabled.
+        self.autosave_photos: bool = get_object(kwargs.get('autosave_photos'))
+        # True, if video autosave is enabled.
+        self.autosave_videos: bool = get_object(kwargs.get('autosave_videos'))
+        # The maximum size of a video file to be autosaved, in bytes; 512 KB - 4000 MB.
+        self.max_video_file_size: int = get_object(kwargs.get('max_video_file_size'))
@@ -0,0 +1,25 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class ScopeNotificationSettings(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Time left before notifications will be unmuted, in seconds.
+        self.mute_for: int = get_object(kwargs.get('mute_for'))
+        # Identifier of the notification sound to be played; 0 if sound is disabled.
+        self.sound_id: int = get_object(kwargs.get('sound_id'))
+        # True, if message content must be displayed in notifications.
+        self.show_preview: bool = get_object(kwargs.get('show_preview'))
+        # If true, story notifications are received only for the first 5 chats from topChatCategoryUsers regardless of the value of mute_stories.
+        self.use_default_mute_stories: bool = get_object(kwargs.get('use_default_mute_stories'))
+        # True, if story notifications are disabled.
+        self.mute_stories: bool = get_object(kwargs.get('mute_stories'))
+        # Identifier of the notification sound to be played for stories; 0 if sound is disabled.
+        self.story_sound_id: int = get_object(kwargs.get('story_sound_id'))
+        # True, if the sender of stories must be displayed in notifications.
+        self.show_story_sender: bool = get_object(kwargs.get('show_story_sender'))
+        # True, if notifications for incoming pinned messages will be created as for an ordinary unread message.
+        self.disable_pinned_message_notifications: bool = get_object(kwargs.get('disable_pinned_message_notifications'))
+        # True, if notifications for messages with mentions will be created as for an ordinary unread message.
+        self.disable_mention_notifications: bool = get_object(kwargs.get('disable_mention_notifications'))
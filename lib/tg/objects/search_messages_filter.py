@@ -0,0 +1,92 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object
+
+
+class SearchMessagesFilter(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class SearchMessagesFilterEmpty(SearchMessagesFilter):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class SearchMessagesFilterAnimation(SearchMessagesFilter):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class SearchMessagesFilterAudio(SearchMessagesFilter):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class SearchMessagesFilterDocument(SearchMessagesFilter):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class SearchMessagesFilterPhoto(SearchMessagesFilter):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class SearchMessagesFilterVideo(SearchMessagesFilter):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class SearchMessagesFilterVoiceNote(SearchMessagesFilter):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class SearchMessagesFilterPhotoAndVideo(SearchMessagesFilter):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class SearchMessagesFilterUrl(SearchMessagesFilter):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class SearchMessagesFilterChatPhoto(SearchMessagesFilter):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class SearchMessagesFilterVideoNote(SearchMessagesFilter):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class SearchMessagesFilterVoiceAndVideoNote(SearchMessagesFilter):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class SearchMessagesFilterMention(SearchMessagesFilter):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class SearchMessagesFilterUnreadMention(SearchMessagesFilter):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class SearchMessagesFilterUnreadReaction(SearchMessagesFilter):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class SearchMessagesFilterFailedToSend(SearchMessagesFilter):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class SearchMessagesFilterPinned(SearchMessagesFilter):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
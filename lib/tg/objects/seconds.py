@@ -0,0 +1,9 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class Seconds(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Number of seconds.
+        self.seconds: float = get_object(kwargs.get('seconds'))
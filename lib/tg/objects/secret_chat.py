@@ -0,0 +1,19 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class SecretChat(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Secret chat identifier.
+        self.id: int = get_object(kwargs.get('id'))
+        # Identifier of the chat partner.
+        self.user_id: int = get_object(kwargs.get('user_id'))
+        # State of the secret chat.
+        self.state: SecretChatState = get_object(kwargs.get('state'))
+        # True, if the chat was created by the current user; false otherwise.
+        self.is_outbound: bool = get_object(kwargs.get('is_outbound'))
+        # Hash of the currently used key for comparison with the hash of the chat partner's key. This is a string of 36 little-endian bytes, which must be split into groups of 2 bits, each denoting a pixel of one of 4 colors FFFFFF, D5E6F3, 2D5775, and 2F99C9. The pixels must be used to make a 12x12 square image filled from left to right, top to bottom. Alternatively, the first 32 bytes of the hash can be converted to the hexadecimal format and printed as 32 2-digit hex numbers.
+        self.key_hash: bytes = get_object(kwargs.get('key_hash'))
+        # Secret chat layer; determines features supported by the chat partner's application. Nested text entities and underline and strikethrough entities are supported if the layer &gt;= 101, files bigger than 2000MB are supported if the layer &gt;= 143, spoiler and custom emoji text entities are supported if the layer &gt;= 144.
+        self.layer: int = get_object(kwargs.get('layer'))
@@ -0,0 +1,22 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object
+
+
+class SecretChatState(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class SecretChatStatePending(SecretChatState):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class SecretChatStateReady(SecretChatState):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class SecretChatStateClosed(SecretChatState):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
@@ -0,0 +1,9 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class SentWebAppMessage(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Identifier of the sent inline message, if known.
+        self.inline_message_id: str = get_object(kwargs.get('inline_message_id'))
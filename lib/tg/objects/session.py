@@ -0,0 +1,43 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class Session(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Session identifier.
+        self.id: int = get_object(kwargs.get('id'))
+        # True, if this session is the current session.
+        self.is_current: bool = get_object(kwargs.get('is_current'))
+        # True, if a 2-step verification password is needed to complete authorization of the session.
+        self.is_password_pending: bool = get_object(kwargs.get('is_password_pending'))
+        # True, if the session wasn't confirmed from another session.
+        self.is_unconfirmed: bool = get_object(kwargs.get('is_unconfirmed'))
+        # True, if incoming secret chats can be accepted by the session.
+        self.can_accept_secret_chats: bool = get_object(kwargs.get('can_accept_secret_chats'))
+        # True, if incoming calls can be accepted by the session.
+        self.can_accept_calls: bool = get_object(kwargs.get('can_accept_calls'))
+        # Session type based on the system and application version, which can be used to display a corresponding icon.
+        self.type: SessionType = get_object(kwargs.get('type'))
+        # Telegram API identifier, as provided by the application.
+        self.api_id: int = get_object(kwargs.get('api_id'))
+        # Name of the application, as provided by the application.
+        self.application_name: str = get_object(kwargs.get('application_name'))
+        # The version of the application, as provided by the application.
+        self.application_version: str = get_object(kwargs.get('application_version'))
+        # True, if the application is an official application or uses the api_id of an official application.
+        self.is_official_application: bool = get_object(kwargs.get('is_official_application'))
+        # Model of the device the application has been run or is running on, as provided by the application.
+        self.device_model: str = get_object(kwargs.get('device_model'))
+        # Operating system the application has been run or is running on, as provided by the application.
+        self.platform: str = get_object(kwargs.get('platform'))
+        # Version of the operating system the application has been run or is running on, as provided by the application.
+        self.system_version: str = get_object(kwargs.get('system_version'))
+        # Point in time (Unix timestamp) when the user has logged in.
+        self.log_in_date: int = get_object(kwargs.get('log_in_date'))
+        # Point in time (Unix timestamp) when the session was last used.
+        self.last_active_date: int = get_object(kwargs.get('last_active_date'))
+        # IP address from which the session was created, in human-readable format.
+        self.ip_address: str = get_object(kwargs.get('ip_address'))
+        # A human-readable description of the location from which the session was created, based on the IP address.
+        self.location: str = get_object(kwargs.get('location'))
@@ -0,0 +1,92 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object
+
+
+class SessionType(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class SessionTypeAndroid(SessionType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class SessionTypeApple(SessionType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class SessionTypeBrave(SessionType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class SessionTypeChrome(SessionType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class SessionTypeEdge(SessionType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class SessionTypeFirefox(SessionType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class SessionTypeIpad(SessionType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class SessionTypeIphone(SessionType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class SessionTypeLinux(SessionType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class SessionTypeMac(SessionType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class SessionTypeOpera(SessionType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class SessionTypeSafari(SessionType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class SessionTypeUbuntu(SessionType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class SessionTypeUnknown(SessionType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class SessionTypeVivaldi(SessionType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class SessionTypeWindows(SessionType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class SessionTypeXbox(SessionType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
@@ -0,0 +1,11 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class Sessions(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # List of sessions.
+        self.sessions: list[Session] = get_object(kwargs.get('sessions'))
+        # Number of days of inactivity before sessions will automatically be terminated; 1-366 days.
+        self.inactive_session_ttl_days: int = get_object(kwargs.get('inactive_session_ttl_days'))
@@ -0,0 +1,13 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class ShippingOption(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Shipping option identifier.
+        self.id: str = get_object(kwargs.get('id'))
+        # Option title.
+        self.title: str = get_object(kwargs.get('title'))
+        # A list of objects used to calculate the total shipping costs.
+        self.price_parts: list[LabeledPricePart] = get_object(kwargs.get('price_parts'))
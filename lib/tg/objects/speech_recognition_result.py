@@ -0,0 +1,28 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class SpeechRecognitionResult(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class SpeechRecognitionResultPending(SpeechRecognitionResult):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Partially recognized text.
+        self.partial_text: str = get_object(kwargs.get('partial_text'))
+
+
+class SpeechRecognitionResultText(SpeechRecognitionResult):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Recognized text.
+        self.text: str = get_object(kwargs.get('text'))
+
+
+class SpeechRecognitionResultError(SpeechRecognitionResult):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Recognition error. An error with a message &quot;MSG_VOICE_TOO_LONG&quot; is returned when media duration is too big to be recognized.
+        self.error: Error = get_object(kwargs.get('error'))
@@ -0,0 +1,19 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class SponsoredMessage(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Message identifier; unique for the chat to which the sponsored message belongs among both ordinary and sponsored messages.
+        self.message_id: int = get_object(kwargs.get('message_id'))
+        # True, if the message needs to be labeled as &quot;recommended&quot; instead of &quot;sponsored&quot;.
+        self.is_recommended: bool = get_object(kwargs.get('is_recommended'))
+        # Content of the message. Currently, can be only of the type messageText.
+        self.content: MessageContent = get_object(kwargs.get('content'))
+        # Information about the sponsor of the message.
+        self.sponsor: MessageSponsor = get_object(kwargs.get('sponsor'))
+        # If non-empty, text for the message action button.
+        self.button_text: str = get_object(kwargs.get('button_text'))
+        # If non-empty, additional information about the sponsored message to be shown along with the message.
+        self.additional_info: str = get_object(kwargs.get('additional_info'))
@@ -0,0 +1,11 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class SponsoredMessages(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # List of sponsored messages.
+        self.messages: list[SponsoredMessage] = get_object(kwargs.get('messages'))
+        # The minimum number of messages between shown sponsored messages, or 0 if only one sponsored message must be shown after all ordinary messages.
+        self.messages_between: int = get_object(kwargs.get('messages_between'))
@@ -0,0 +1,30 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class StatisticalGraph(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class StatisticalGraphData(StatisticalGraph):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Graph data in JSON format.
+        self.json_data: str = get_object(kwargs.get('json_data'))
+        # If non-empty, a token which can be used to receive a zoomed in graph.
+        self.zoom_token: str = get_object(kwargs.get('zoom_token'))
+
+
+class StatisticalGraphAsync(StatisticalGraph):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The token to use for data loading.
+        self.token: str = get_object(kwargs.get('token'))
+
+
+class StatisticalGraphError(StatisticalGraph):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The error message.
+        self.error_message: str = get_object(kwargs.get('error_message'))
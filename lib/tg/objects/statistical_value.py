@@ -0,0 +1,13 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class StatisticalValue(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The current value.
+        self.value: float = get_object(kwargs.get('value'))
+        # The value for the previous day.
+        self.previous_value: float = get_object(kwargs.get('previous_value'))
+        # The growth rate of the value, as a percentage.
+        self.growth_rate_percentage: float = get_object(kwargs.get('growth_rate_percentage'))
@@ -0,0 +1,27 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class Sticker(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Unique sticker identifier within the set; 0 if none.
+        self.id: int = get_object(kwargs.get('id'))
+        # Identifier of the sticker set to which the sticker belongs; 0 if none.
+        self.set_id: int = get_object(kwargs.get('set_id'))
+        # Sticker width; as defined by the sender.
+        self.width: int = get_object(kwargs.get('width'))
+        # Sticker height; as defined by the sender.
+        self.height: int = get_object(kwargs.get('height'))
+        # Emoji corresponding to the sticker.
+        self.emoji: str = get_object(kwargs.get('emoji'))
+        # Sticker format.
+        self.format: StickerFormat = get_object(kwargs.get('format'))
+        # Sticker's full type.
+        self.full_type: StickerFullType = get_object(kwargs.get('full_type'))
+        # Sticker's outline represented as a list of closed vector paths; may be empty. The coordinate system origin is in the upper-left corner.
+        self.outline: list[ClosedVectorPath] = get_object(kwargs.get('outline'))
+        # Sticker thumbnail in WEBP or JPEG format; may be null.
+        self.thumbnail: Thumbnail = get_object(kwargs.get('thumbnail'))
+        # File containing the sticker.
+        self.sticker: File = get_object(kwargs.get('sticker'))
@@ -0,0 +1,22 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object
+
+
+class StickerFormat(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class StickerFormatWebp(StickerFormat):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class StickerFormatTgs(StickerFormat):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class StickerFormatWebm(StickerFormat):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
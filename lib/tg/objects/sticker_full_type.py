@@ -0,0 +1,30 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class StickerFullType(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class StickerFullTypeRegular(StickerFullType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Premium animation of the sticker; may be null. If present, only Telegram Premium users can use the sticker.
+        self.premium_animation: File = get_object(kwargs.get('premium_animation'))
+
+
+class StickerFullTypeMask(StickerFullType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Position where the mask is placed; may be null.
+        self.mask_position: MaskPosition = get_object(kwargs.get('mask_position'))
+
+
+class StickerFullTypeCustomEmoji(StickerFullType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Identifier of the custom emoji.
+        self.custom_emoji_id: int = get_object(kwargs.get('custom_emoji_id'))
+        # True, if the sticker must be repainted to a text color in messages, the color of the Telegram Premium badge in emoji status, white color on chat photos, or another appropriate color in other places.
+        self.needs_repainting: bool = get_object(kwargs.get('needs_repainting'))
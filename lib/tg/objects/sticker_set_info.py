@@ -0,0 +1,37 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class StickerSetInfo(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Identifier of the sticker set.
+        self.id: int = get_object(kwargs.get('id'))
+        # Title of the sticker set.
+        self.title: str = get_object(kwargs.get('title'))
+        # Name of the sticker set.
+        self.name: str = get_object(kwargs.get('name'))
+        # Sticker set thumbnail in WEBP, TGS, or WEBM format with width and height 100; may be null. The file can be downloaded only before the thumbnail is changed.
+        self.thumbnail: Thumbnail = get_object(kwargs.get('thumbnail'))
+        # Sticker set thumbnail's outline represented as a list of closed vector paths; may be empty. The coordinate system origin is in the upper-left corner.
+        self.thumbnail_outline: list[ClosedVectorPath] = get_object(kwargs.get('thumbnail_outline'))
+        # True, if the sticker set has been installed by the current user.
+        self.is_installed: bool = get_object(kwargs.get('is_installed'))
+        # True, if the sticker set has been archived. A sticker set can't be installed and archived simultaneously.
+        self.is_archived: bool = get_object(kwargs.get('is_archived'))
+        # True, if the sticker set is official.
+        self.is_official: bool = get_object(kwargs.get('is_official'))
+        # Format of the stickers in the set.
+        self.sticker_format: StickerFormat = get_object(kwargs.get('sticker_format'))
+        # Type of the stickers in the set.
+        self.sticker_type: StickerType = get_object(kwargs.get('sticker_type'))
+        # True, if stickers in the sticker set are custom emoji that must be repainted; for custom emoji sticker sets only.
+        self.needs_repainting: bool = get_object(kwargs.get('needs_repainting'))
+        # True, if stickers in the sticker set are custom emoji that can be used as chat emoji status; for custom emoji sticker sets only.
+        self.is_allowed_as_chat_emoji_status: bool = get_object(kwargs.get('is_allowed_as_chat_emoji_status'))
+        # True for already viewed trending sticker sets.
+        self.is_viewed: bool = get_object(kwargs.get('is_viewed'))
+        # Total number of stickers in the set.
+        self.size: int = get_object(kwargs.get('size'))
+        # Up to the first 5 stickers from the set, depending on the context. If the application needs more stickers the full sticker set needs to be requested.
+        self.covers: list[Sticker] = get_object(kwargs.get('covers'))
@@ -0,0 +1,22 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object
+
+
+class StickerType(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class StickerTypeRegular(StickerType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class StickerTypeMask(StickerType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class StickerTypeCustomEmoji(StickerType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
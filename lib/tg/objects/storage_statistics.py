@@ -0,0 +1,13 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class StorageStatistics(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Total size of files, in bytes.
+        self.size: int = get_object(kwargs.get('size'))
+        # Total number of files.
+        self.count: int = get_object(kwargs.get('count'))
+        # Statistics split by chats.
+        self.by_chat: list[StorageStatisticsByChat] = get_object(kwargs.get('by_chat'))
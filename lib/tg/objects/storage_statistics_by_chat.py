@@ -0,0 +1,15 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class StorageStatisticsByChat(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Chat identifier; 0 if none.
+        self.chat_id: int = get_object(kwargs.get('chat_id'))
+        # Total size of the files in the chat, in bytes.
+        self.size: int = get_object(kwargs.get('size'))
+        # Total number of files in the chat.
+        self.count: int = get_object(kwargs.get('count'))
+        # Statistics split by file types.
+        self.by_file_type: list[StorageStatisticsByFileType] = get_object(kwargs.get('by_file_type'))
@@ -0,0 +1,13 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class StorageStatisticsByFileType(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # File type.
+        self.file_type: FileType = get_object(kwargs.get('file_type'))
+        # Total size of the files, in bytes.
+        self.size: int = get_object(kwargs.get('size'))
+        # Total number of files.
+        self.count: int = get_object(kwargs.get('count'))
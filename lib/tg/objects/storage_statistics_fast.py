@@ -0,0 +1,17 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class StorageStatisticsFast(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Approximate total size of files, in bytes.
+        self.files_size: int = get_object(kwargs.get('files_size'))
+        # Approximate number of files.
+        self.file_count: int = get_object(kwargs.get('file_count'))
+        # Size of the database.
+        self.database_size: int = get_object(kwargs.get('database_size'))
+        # Size of the language pack database.
+        self.language_pack_database_size: int = get_object(kwargs.get('language_pack_database_size'))
+        # Size of the TDLib internal log.
+        self.log_size: int = get_object(kwargs.get('log_size'))
@@ -0,0 +1,51 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class StorePaymentPurpose(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class StorePaymentPurposePremiumSubscription(StorePaymentPurpose):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Pass true if this is a restore of a Telegram Premium purchase; only for App Store.
+        self.is_restore: bool = get_object(kwargs.get('is_restore'))
+        # Pass true if this is an upgrade from a monthly subscription to early subscription; only for App Store.
+        self.is_upgrade: bool = get_object(kwargs.get('is_upgrade'))
+
+
+class StorePaymentPurposeGiftedPremium(StorePaymentPurpose):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Identifier of the user to which Premium was gifted.
+        self.user_id: int = get_object(kwargs.get('user_id'))
+        # ISO 4217 currency code of the payment currency.
+        self.currency: str = get_object(kwargs.get('currency'))
+        # Paid amount, in the smallest units of the currency.
+        self.amount: int = get_object(kwargs.get('amount'))
+
+
+class StorePaymentPurposePremiumGiftCodes(StorePaymentPurpose):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Identifier of the channel chat, which will be automatically boosted by the users for duration of the Premium subscription and which is administered by the user; 0 if none.
+        self.boosted_chat_id: int = get_object(kwargs.get('boosted_chat_id'))
+        # ISO 4217 currency code of the payment currency.
+        self.currency: str = get_object(kwargs.get('currency'))
+        # Paid amount, in the smallest units of the currency.
+        self.amount: int = get_object(kwargs.get('amount'))
+        # Identifiers of the users which can activate the gift codes.
+        self.user_ids: list[int] = get_object(kwargs.get('user_ids'))
+
+
+class StorePaymentPurposePremiumGiveaway(StorePaymentPurpose):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Giveaway parameters.
+        self.parameters: PremiumGiveawayParameters = get_object(kwargs.get('parameters'))
+        # ISO 4217 currency code of the payment currency.
+        self.currency: str = get_object(kwargs.get('currency'))
+        # Paid amount, in the smallest units of the currency.
+        self.amount: int = get_object(kwargs.get('amount'))
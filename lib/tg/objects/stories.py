@@ -0,0 +1,11 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class Stories(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Approximate total number of stories found.
+        self.total_count: int = get_object(kwargs.get('total_count'))
+        # The list of stories.
+        self.stories: list[Story] = get_object(kwargs.get('stories'))
@@ -0,0 +1,53 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class Story(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Unique story identifier among stories of the given sender.
+        self.id: int = get_object(kwargs.get('id'))
+        # Identifier of the chat that posted the story.
+        self.sender_chat_id: int = get_object(kwargs.get('sender_chat_id'))
+        # Point in time (Unix timestamp) when the story was published.
+        self.date: int = get_object(kwargs.get('date'))
+        # True, if the story is being sent by the current user.
+        self.is_being_sent: bool = get_object(kwargs.get('is_being_sent'))
+        # True, if the story is being edited by the current user.
+        self.is_being_edited: bool = get_object(kwargs.get('is_being_edited'))
+        # True, if the story was edited.
+        self.is_edited: bool = get_object(kwargs.get('is_edited'))
+        # True, if the story is saved in the sender's profile and will be available there after expiration.
+        self.is_pinned: bool = get_object(kwargs.get('is_pinned'))
+        # True, if the story is visible only for the current user.
+        self.is_visible_only_for_self: bool = get_object(kwargs.get('is_visible_only_for_self'))
+        # True, if the story can be deleted.
+        self.can_be_deleted: bool = get_object(kwargs.get('can_be_deleted'))
+        # True, if the story can be edited.
+        self.can_be_edited: bool = get_object(kwargs.get('can_be_edited'))
+        # True, if the story can be forwarded as a message. Otherwise, screenshots and saving of the story content must be also forbidden.
+        self.can_be_forwarded: bool = get_object(kwargs.get('can_be_forwarded'))
+        # True, if the story can be replied in the chat with the story sender.
+        self.can_be_replied: bool = get_object(kwargs.get('can_be_replied'))
+        # True, if the story's is_pinned value can be changed.
+        self.can_toggle_is_pinned: bool = get_object(kwargs.get('can_toggle_is_pinned'))
+        # True, if the story statistics are available through getStoryStatistics.
+        self.can_get_statistics: bool = get_object(kwargs.get('can_get_statistics'))
+        # True, if interactions with the story can be received through getStoryInteractions.
+        self.can_get_interactions: bool = get_object(kwargs.get('can_get_interactions'))
+        # True, if users viewed the story can't be received, because the story has expired more than getOption(&quot;story_viewers_expiration_delay&quot;) seconds ago.
+        self.has_expired_viewers: bool = get_object(kwargs.get('has_expired_viewers'))
+        # Information about the original story; may be null if the story wasn't reposted.
+        self.repost_info: StoryRepostInfo = get_object(kwargs.get('repost_info'))
+        # Information about interactions with the story; may be null if the story isn't owned or there were no interactions.
+        self.interaction_info: StoryInteractionInfo = get_object(kwargs.get('interaction_info'))
+        # Type of the chosen reaction; may be null if none.
+        self.chosen_reaction_type: ReactionType = get_object(kwargs.get('chosen_reaction_type'))
+        # Privacy rules affecting story visibility; may be approximate for non-owned stories.
+        self.privacy_settings: StoryPrivacySettings = get_object(kwargs.get('privacy_settings'))
+        # Content of the story.
+        self.content: StoryContent = get_object(kwargs.get('content'))
+        # Clickable areas to be shown on the story content.
+        self.areas: list[StoryArea] = get_object(kwargs.get('areas'))
+        # Caption of the story.
+        self.caption: FormattedText = get_object(kwargs.get('caption'))
@@ -0,0 +1,17 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class StoryAreaPosition(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The abscissa of the rectangle's center, as a percentage of the media width.
+        self.x_percentage: float = get_object(kwargs.get('x_percentage'))
+        # The ordinate of the rectangle's center, as a percentage of the media height.
+        self.y_percentage: float = get_object(kwargs.get('y_percentage'))
+        # The width of the rectangle, as a percentage of the media width.
+        self.width_percentage: float = get_object(kwargs.get('width_percentage'))
+        # The height of the rectangle, as a percentage of the media height.
+        self.height_percentage: float = get_object(kwargs.get('height_percentage'))
+        # Clockwise rotation angle of the rectangle, in degrees; 0-360.
+        self.rotation_angle: float = get_object(kwargs.get('rotation_angle'))
@@ -0,0 +1,43 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class StoryAreaType(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class StoryAreaTypeLocation(StoryAreaType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The location.
+        self.location: Location = get_object(kwargs.get('location'))
+
+
+class StoryAreaTypeVenue(StoryAreaType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Information about the venue.
+        self.venue: Venue = get_object(kwargs.get('venue'))
+
+
+class StoryAreaTypeSuggestedReaction(StoryAreaType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Type of the reaction.
+        self.reaction_type: ReactionType = get_object(kwargs.get('reaction_type'))
+        # Number of times the reaction was added.
+        self.total_count: int = get_object(kwargs.get('total_count'))
+        # True, if reaction has a dark background.
+        self.is_dark: bool = get_object(kwargs.get('is_dark'))
+        # True, if reaction corner is flipped.
+        self.is_flipped: bool = get_object(kwargs.get('is_flipped'))
+
+
+class StoryAreaTypeMessage(StoryAreaType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Identifier of the chat with the message.
+        self.chat_id: int = get_object(kwargs.get('chat_id'))
+        # Identifier of the message.
+        self.message_id: int = get_object(kwargs.get('message_id'))
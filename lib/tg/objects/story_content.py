@@ -0,0 +1,28 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class StoryContent(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class StoryContentPhoto(StoryContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The photo.
+        self.photo: Photo = get_object(kwargs.get('photo'))
+
+
+class StoryContentVideo(StoryContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The video in MPEG4 format.
+        self.video: StoryVideo = get_object(kwargs.get('video'))
+        # Alternative version of the video in MPEG4 format, encoded by x264 codec; may be null.
+        self.alternative_video: StoryVideo = get_object(kwargs.get('alternative_video'))
+
+
+class StoryContentUnsupported(StoryContent):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
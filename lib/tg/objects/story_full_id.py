@@ -0,0 +1,11 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class StoryFullId(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Identifier of the chat that posted the story.
+        self.sender_chat_id: int = get_object(kwargs.get('sender_chat_id'))
+        # Unique story identifier among stories of the given sender.
+        self.story_id: int = get_object(kwargs.get('story_id'))
@@ -0,0 +1,13 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class StoryInfo(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Unique story identifier among stories of the given sender.
+        self.story_id: int = get_object(kwargs.get('story_id'))
+        # Point in time (Unix timestamp) when the story was published.
+        self.date: int = get_object(kwargs.get('date'))
+        # True, if the story is available only to close friends.
+        self.is_for_close_friends: bool = get_object(kwargs.get('is_for_close_friends'))
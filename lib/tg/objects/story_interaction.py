@@ -0,0 +1,15 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class StoryInteraction(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Identifier of the user or chat that made the interaction.
+        self.actor_id: MessageSender = get_object(kwargs.get('actor_id'))
+        # Approximate point in time (Unix timestamp) when the interaction happened.
+        self.interaction_date: int = get_object(kwargs.get('interaction_date'))
+        # Block list to which the actor is added; may be null if none or for chat stories.
+        self.block_list: BlockList = get_object(kwargs.get('block_list'))
+        # Type of the interaction.
+        self.type: StoryInteractionType = get_object(kwargs.get('type'))
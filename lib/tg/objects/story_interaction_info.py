@@ -0,0 +1,15 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class StoryInteractionInfo(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Number of times the story was viewed.
+        self.view_count: int = get_object(kwargs.get('view_count'))
+        # Number of times the story was forwarded; 0 if none or unknown.
+        self.forward_count: int = get_object(kwargs.get('forward_count'))
+        # Number of reactions added to the story; 0 if none or unknown.
+        self.reaction_count: int = get_object(kwargs.get('reaction_count'))
+        # Identifiers of at most 3 recent viewers of the story.
+        self.recent_viewer_user_ids: list[int] = get_object(kwargs.get('recent_viewer_user_ids'))
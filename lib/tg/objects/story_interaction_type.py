@@ -0,0 +1,28 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class StoryInteractionType(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class StoryInteractionTypeView(StoryInteractionType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Type of the reaction that was chosen by the viewer; may be null if none.
+        self.chosen_reaction_type: ReactionType = get_object(kwargs.get('chosen_reaction_type'))
+
+
+class StoryInteractionTypeForward(StoryInteractionType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The message with story forward.
+        self.message: Message = get_object(kwargs.get('message'))
+
+
+class StoryInteractionTypeRepost(StoryInteractionType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The reposted story.
+        self.story: Story = get_object(kwargs.get('story'))
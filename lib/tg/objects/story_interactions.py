@@ -0,0 +1,17 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class StoryInteractions(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Approximate total number of interactions found.
+        self.total_count: int = get_object(kwargs.get('total_count'))
+        # Approximate total number of found forwards and reposts; always 0 for chat stories.
+        self.total_forward_count: int = get_object(kwargs.get('total_forward_count'))
+        # Approximate total number of found reactions; always 0 for chat stories.
+        self.total_reaction_count: int = get_object(kwargs.get('total_reaction_count'))
+        # List of story interactions.
+        self.interactions: list[StoryInteraction] = get_object(kwargs.get('interactions'))
+        # The offset for the next request. If empty, then there are no more results.
+        self.next_offset: str = get_object(kwargs.get('next_offset'))
@@ -0,0 +1,17 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object
+
+
+class StoryList(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class StoryListMain(StoryList):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class StoryListArchive(StoryList):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
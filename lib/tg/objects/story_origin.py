@@ -0,0 +1,23 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class StoryOrigin(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class StoryOriginPublicStory(StoryOrigin):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Identifier of the chat that posted original story.
+        self.chat_id: int = get_object(kwargs.get('chat_id'))
+        # Story identifier of the original story.
+        self.story_id: int = get_object(kwargs.get('story_id'))
+
+
+class StoryOriginHiddenUser(StoryOrigin):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Name of the story sender.
+        self.sender_name: str = get_object(kwargs.get('sender_name'))
@@ -0,0 +1,33 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class StoryPrivacySettings(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class StoryPrivacySettingsEveryone(StoryPrivacySettings):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Identifiers of the users that can't see the story; always unknown and empty for non-owned stories.
+        self.except_user_ids: list[int] = get_object(kwargs.get('except_user_ids'))
+
+
+class StoryPrivacySettingsContacts(StoryPrivacySettings):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # User identifiers of the contacts that can't see the story; always unknown and empty for non-owned stories.
+        self.except_user_ids: list[int] = get_object(kwargs.get('except_user_ids'))
+
+
+class StoryPrivacySettingsCloseFriends(StoryPrivacySettings):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class StoryPrivacySettingsSelectedUsers(StoryPrivacySettings):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Identifiers of the users; always unknown and empty for non-owned stories.
+        self.user_ids: list[int] = get_object(kwargs.get('user_ids'))
@@ -0,0 +1,11 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class StoryRepostInfo(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Origin of the story that was reposted.
+        self.origin: StoryOrigin = get_object(kwargs.get('origin'))
+        # True, if story content was modified during reposting; otherwise, story wasn't modified.
+        self.is_content_modified: bool = get_object(kwargs.get('is_content_modified'))
@@ -0,0 +1,11 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class StoryStatistics(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # A graph containing number of story views and shares.
+        self.story_interaction_graph: StatisticalGraph = get_object(kwargs.get('story_interaction_graph'))
+        # A graph containing number of story reactions.
+        self.story_reaction_graph: StatisticalGraph = get_object(kwargs.get('story_reaction_graph'))
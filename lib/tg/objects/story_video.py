@@ -0,0 +1,25 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class StoryVideo(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Duration of the video, in seconds.
+        self.duration: float = get_object(kwargs.get('duration'))
+        # Video width.
+        self.width: int = get_object(kwargs.get('width'))
+        # Video height.
+        self.height: int = get_object(kwargs.get('height'))
+        # True, if stickers were added to the video. The list of corresponding sticker sets can be received using getAttachedStickerSets.
+        self.has_stickers: bool = get_object(kwargs.get('has_stickers'))
+        # True, if the video has no sound.
+        self.is_animation: bool = get_object(kwargs.get('is_animation'))
+        # Video minithumbnail; may be null.
+        self.minithumbnail: Minithumbnail = get_object(kwargs.get('minithumbnail'))
+        # Video thumbnail in JPEG or MPEG4 format; may be null.
+        self.thumbnail: Thumbnail = get_object(kwargs.get('thumbnail'))
+        # Size of file prefix, which is supposed to be preloaded, in bytes.
+        self.preload_prefix_size: int = get_object(kwargs.get('preload_prefix_size'))
+        # File containing the video.
+        self.video: File = get_object(kwargs.get('video'))
@@ -0,0 +1,61 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class SuggestedAction(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class SuggestedActionEnableArchiveAndMuteNewChats(SuggestedAction):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class SuggestedActionCheckPassword(SuggestedAction):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class SuggestedActionCheckPhoneNumber(SuggestedAction):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class SuggestedActionViewChecksHint(SuggestedAction):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class SuggestedActionConvertToBroadcastGroup(SuggestedAction):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Supergroup identifier.
+        self.supergroup_id: int = get_object(kwargs.get('supergroup_id'))
+
+
+class SuggestedActionSetPassword(SuggestedAction):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The number of days to pass between consecutive authorizations if the user declines to set password; if 0, then the user is advised to set the password for security reasons.
+        self.authorization_delay: int = get_object(kwargs.get('authorization_delay'))
+
+
+class SuggestedActionUpgradePremium(SuggestedAction):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class SuggestedActionRestorePremium(SuggestedAction):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class SuggestedActionSubscribeToAnnualPremium(SuggestedAction):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class SuggestedActionGiftPremiumForChristmas(SuggestedAction):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
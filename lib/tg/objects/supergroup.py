@@ -0,0 +1,49 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class Supergroup(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Supergroup or channel identifier.
+        self.id: int = get_object(kwargs.get('id'))
+        # Usernames of the supergroup or channel; may be null.
+        self.usernames: Usernames = get_object(kwargs.get('usernames'))
+        # Point in time (Unix timestamp) when the current user joined, or the point in time when the supergroup or channel was created, in case the user is not a member.
+        self.date: int = get_object(kwargs.get('date'))
+        # Status of the current user in the supergroup or channel; custom title will always be empty.
+        self.status: ChatMemberStatus = get_object(kwargs.get('status'))
+        # Number of members in the supergroup or channel; 0 if unknown. Currently, it is guaranteed to be known only if the supergroup or channel was received through getChatSimilarChats, getChatsToSendStories, getCreatedPublicChats, getGroupsInCommon, getInactiveSupergroupChats, getSuitableDiscussionChats, getUserPrivacySettingRules, getVideoChatAvailableParticipants, searchChatsNearby, searchPublicChats, or in chatFolderInviteLinkInfo.missing_chat_ids, or for public chats in which where sent messages and posted stories from publicForwards, or for public chats in which where sent messages from getMessagePublicForwards response.
+        self.member_count: int = get_object(kwargs.get('member_count'))
+        # Approximate boost level for the chat.
+        self.boost_level: int = get_object(kwargs.get('boost_level'))
+        # True, if the channel has a discussion group, or the supergroup is the designated discussion group for a channel.
+        self.has_linked_chat: bool = get_object(kwargs.get('has_linked_chat'))
+        # True, if the supergroup is connected to a location, i.e. the supergroup is a location-based supergroup.
+        self.has_location: bool = get_object(kwargs.get('has_location'))
+        # True, if messages sent to the channel need to contain information about the sender. This field is only applicable to channels.
+        self.sign_messages: bool = get_object(kwargs.get('sign_messages'))
+        # True, if users need to join the supergroup before they can send messages. Always true for channels and non-discussion supergroups.
+        self.join_to_send_messages: bool = get_object(kwargs.get('join_to_send_messages'))
+        # True, if all users directly joining the supergroup need to be approved by supergroup administrators. Always false for channels and supergroups without username, location, or a linked chat.
+        self.join_by_request: bool = get_object(kwargs.get('join_by_request'))
+        # True, if the slow mode is enabled in the supergroup.
+        self.is_slow_mode_enabled: bool = get_object(kwargs.get('is_slow_mode_enabled'))
+        # True, if the supergroup is a channel.
+        self.is_channel: bool = get_object(kwargs.get('is_channel'))
+        # True, if the supergroup is a broadcast group, i.e. only administrators can send messages and there is no limit on the number of members.
+        self.is_broadcast_group: bool = get_object(kwargs.get('is_broadcast_group'))
+        # True, if the supergroup is a forum with topics.
+        self.is_forum: bool = get_object(kwargs.get('is_forum'))
+        # True, if the supergroup or channel is verified.
+        self.is_verified: bool = get_object(kwargs.get('is_verified'))
+        # If non-empty, contains a human-readable description of the reason why access to this supergroup or channel must be restricted.
+        self.restriction_reason: str = get_object(kwargs.get('restriction_reason'))
+        # True, if many users reported this supergroup or channel as a scam.
+        self.is_scam: bool = get_object(kwargs.get('is_scam'))
+        # True, if many users reported this supergroup or channel as a fake account.
+        self.is_fake: bool = get_object(kwargs.get('is_fake'))
+        # True, if the channel has non-expired stories available to the current user.
+        self.has_active_stories: bool = get_object(kwargs.get('has_active_stories'))
+        # True, if the channel has unread non-expired stories available to the current user.
+        self.has_unread_active_stories: bool = get_object(kwargs.get('has_unread_active_stories'))
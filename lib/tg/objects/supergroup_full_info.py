@@ -0,0 +1,57 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class SupergroupFullInfo(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Chat photo; may be null if empty or unknown. If non-null, then it is the same photo as in chat.photo.
+        self.photo: ChatPhoto = get_object(kwargs.get('photo'))
+        # Supergroup or channel description.
+        self.description: str = get_object(kwargs.get('description'))
+        # Number of members in the supergroup or channel; 0 if unknown.
+        self.member_count: int = get_object(kwargs.get('member_count'))
+        # Number of privileged users in the supergroup or channel; 0 if unknown.
+        self.administrator_count: int = get_object(kwargs.get('administrator_count'))
+        # Number of restricted users in the supergroup; 0 if unknown.
+        self.restricted_count: int = get_object(kwargs.get('restricted_count'))
+        # Number of users banned from chat; 0 if unknown.
+        self.banned_count: int = get_object(kwargs.get('banned_count'))
+        # Chat identifier of a discussion group for the channel, or a channel, for which the supergroup is the designated discussion group; 0 if none or unknown.
+        self.linked_chat_id: int = get_object(kwargs.get('linked_chat_id'))
+        # Delay between consecutive sent messages for non-administrator supergroup members, in seconds.
+        self.slow_mode_delay: int = get_object(kwargs.get('slow_mode_delay'))
+        # Time left before next message can be sent in the supergroup, in seconds. An updateSupergroupFullInfo update is not triggered when value of this field changes, but both new and old values are non-zero.
+        self.slow_mode_delay_expires_in: float = get_object(kwargs.get('slow_mode_delay_expires_in'))
+        # True, if members of the chat can be retrieved via getSupergroupMembers or searchChatMembers.
+        self.can_get_members: bool = get_object(kwargs.get('can_get_members'))
+        # True, if non-administrators can receive only administrators and bots using getSupergroupMembers or searchChatMembers.
+        self.has_hidden_members: bool = get_object(kwargs.get('has_hidden_members'))
+        # True, if non-administrators and non-bots can be hidden in responses to getSupergroupMembers and searchChatMembers for non-administrators.
+        self.can_hide_members: bool = get_object(kwargs.get('can_hide_members'))
+        # True, if the supergroup sticker set can be changed.
+        self.can_set_sticker_set: bool = get_object(kwargs.get('can_set_sticker_set'))
+        # True, if the supergroup location can be changed.
+        self.can_set_location: bool = get_object(kwargs.get('can_set_location'))
+        # True, if the supergroup or channel statistics are available.
+        self.can_get_statistics: bool = get_object(kwargs.get('can_get_statistics'))
+        # True, if aggressive anti-spam checks can be enabled or disabled in the supergroup.
+        self.can_toggle_aggressive_anti_spam: bool = get_object(kwargs.get('can_toggle_aggressive_anti_spam'))
+        # True, if new chat members will have access to old messages. In public, discussion, of forum groups and all channels, old messages are always available, so this option affects only private non-forum supergroups without a linked chat. The value of this field is only available to chat administrators.
+        self.is_all_history_available: bool = get_object(kwargs.get('is_all_history_available'))
+        # True, if aggressive anti-spam checks are enabled in the supergroup. The value of this field is only available to chat administrators.
+        self.has_aggressive_anti_spam_enabled: bool = get_object(kwargs.get('has_aggressive_anti_spam_enabled'))
+        # True, if the channel has pinned stories.
+        self.has_pinned_stories: bool = get_object(kwargs.get('has_pinned_stories'))
+        # Identifier of the supergroup sticker set; 0 if none.
+        self.sticker_set_id: int = get_object(kwargs.get('sticker_set_id'))
+        # Location to which the supergroup is connected; may be null if none.
+        self.location: ChatLocation = get_object(kwargs.get('location'))
+        # Primary invite link for the chat; may be null. For chat administrators with can_invite_users right only.
+        self.invite_link: ChatInviteLink = get_object(kwargs.get('invite_link'))
+        # List of commands of bots in the group.
+        self.bot_commands: list[BotCommands] = get_object(kwargs.get('bot_commands'))
+        # Identifier of the basic group from which supergroup was upgraded; 0 if none.
+        self.upgraded_from_basic_group_id: int = get_object(kwargs.get('upgraded_from_basic_group_id'))
+        # Identifier of the last message in the basic group from which supergroup was upgraded; 0 if none.
+        self.upgraded_from_max_message_id: int = get_object(kwargs.get('upgraded_from_max_message_id'))
@@ -0,0 +1,59 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class SupergroupMembersFilter(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class SupergroupMembersFilterRecent(SupergroupMembersFilter):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class SupergroupMembersFilterContacts(SupergroupMembersFilter):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Query to search for.
+        self.query: str = get_object(kwargs.get('query'))
+
+
+class SupergroupMembersFilterAdministrators(SupergroupMembersFilter):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class SupergroupMembersFilterSearch(SupergroupMembersFilter):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Query to search for.
+        self.query: str = get_object(kwargs.get('query'))
+
+
+class SupergroupMembersFilterRestricted(SupergroupMembersFilter):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Query to search for.
+        self.query: str = get_object(kwargs.get('query'))
+
+
+class SupergroupMembersFilterBanned(SupergroupMembersFilter):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Query to search for.
+        self.query: str = get_object(kwargs.get('query'))
+
+
+class SupergroupMembersFilterMention(SupergroupMembersFilter):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Query to search for.
+        self.query: str = get_object(kwargs.get('query'))
+        # If non-zero, the identifier of the current message thread.
+        self.message_thread_id: int = get_object(kwargs.get('message_thread_id'))
+
+
+class SupergroupMembersFilterBots(SupergroupMembersFilter):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
@@ -0,0 +1,11 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class TMeUrl(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # URL.
+        self.url: str = get_object(kwargs.get('url'))
+        # Type of the URL.
+        self.type: TMeUrlType = get_object(kwargs.get('type'))
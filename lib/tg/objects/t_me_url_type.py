@@ -0,0 +1,35 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class TMeUrlType(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class TMeUrlTypeUser(TMeUrlType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Identifier of the user.
+        self.user_id: int = get_object(kwargs.get('user_id'))
+
+
+class TMeUrlTypeSupergroup(TMeUrlType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Identifier of the supergroup or channel.
+        self.supergroup_id: int = get_object(kwargs.get('supergroup_id'))
+
+
+class TMeUrlTypeChatInvite(TMeUrlType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Information about the chat invite link.
+        self.info: ChatInviteLinkInfo = get_object(kwargs.get('info'))
+
+
+class TMeUrlTypeStickerSet(TMeUrlType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Identifier of the sticker set.
+        self.sticker_set_id: int = get_object(kwargs.get('sticker_set_id'))
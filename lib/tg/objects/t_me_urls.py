@@ -0,0 +1,9 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class TMeUrls(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # List of URLs.
+        self.urls: list[TMeUrl] = get_object(kwargs.get('urls'))
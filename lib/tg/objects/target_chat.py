@@ -0,0 +1,32 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class TargetChat(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class TargetChatCurrent(TargetChat):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class TargetChatChosen(TargetChat):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # True, if private chats with ordinary users are allowed.
+        self.allow_user_chats: bool = get_object(kwargs.get('allow_user_chats'))
+        # True, if private chats with other bots are allowed.
+        self.allow_bot_chats: bool = get_object(kwargs.get('allow_bot_chats'))
+        # True, if basic group and supergroup chats are allowed.
+        self.allow_group_chats: bool = get_object(kwargs.get('allow_group_chats'))
+        # True, if channel chats are allowed.
+        self.allow_channel_chats: bool = get_object(kwargs.get('allow_channel_chats'))
+
+
+class TargetChatInternalLink(TargetChat):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # An internal link pointing to the chat.
+        self.link: InternalLinkType = get_object(kwargs.get('link'))
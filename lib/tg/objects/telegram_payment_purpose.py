@@ -0,0 +1,37 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class TelegramPaymentPurpose(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class TelegramPaymentPurposePremiumGiftCodes(TelegramPaymentPurpose):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Identifier of the channel chat, which will be automatically boosted by the users for duration of the Premium subscription and which is administered by the user; 0 if none.
+        self.boosted_chat_id: int = get_object(kwargs.get('boosted_chat_id'))
+        # ISO 4217 currency code of the payment currency.
+        self.currency: str = get_object(kwargs.get('currency'))
+        # Paid amount, in the smallest units of the currency.
+        self.amount: int = get_object(kwargs.get('amount'))
+        # Identifiers of the users which can activate the gift codes.
+        self.user_ids: list[int] = get_object(kwargs.get('user_ids'))
+        # Number of months the Telegram Premium subscription will be active for the users.
+        self.month_count: int = get_object(kwargs.get('month_count'))
+
+
+class TelegramPaymentPurposePremiumGiveaway(TelegramPaymentPurpose):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Giveaway parameters.
+        self.parameters: PremiumGiveawayParameters = get_object(kwargs.get('parameters'))
+        # ISO 4217 currency code of the payment currency.
+        self.currency: str = get_object(kwargs.get('currency'))
+        # Paid amount, in the smallest units of the currency.
+        self.amount: int = get_object(kwargs.get('amount'))
+        # Number of users which will be able to activate the gift codes.
+        self.winner_count: int = get_object(kwargs.get('winner_count'))
+        # Number of months the Telegram Premium subscription will be active for the users.
+        self.month_count: int = get_object(kwargs.get('month_count'))
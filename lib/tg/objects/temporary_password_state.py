@@ -0,0 +1,11 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class TemporaryPasswordState(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # True, if a temporary password is available.
+        self.has_password: bool = get_object(kwargs.get('has_password'))
+        # Time left before the temporary password expires, in seconds.
+        self.valid_for: int = get_object(kwargs.get('valid_for'))
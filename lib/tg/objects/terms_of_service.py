@@ -0,0 +1,13 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class TermsOfService(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Text of the terms of service.
+        self.text: FormattedText = get_object(kwargs.get('text'))
+        # The minimum age of a user to be able to accept the terms; 0 if age isn't restricted.
+        self.min_user_age: int = get_object(kwargs.get('min_user_age'))
+        # True, if a blocking popup with terms of service must be shown to the user.
+        self.show_popup: bool = get_object(kwargs.get('show_popup'))
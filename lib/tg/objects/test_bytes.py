@@ -0,0 +1,9 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class TestBytes(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Bytes.
+        self.value: bytes = get_object(kwargs.get('value'))
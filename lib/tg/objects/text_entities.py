@@ -0,0 +1,9 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class TextEntities(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # List of text entities.
+        self.entities: list[TextEntity] = get_object(kwargs.get('entities'))
@@ -0,0 +1,13 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class TextEntity(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Offset of the entity, in UTF-16 code units.
+        self.offset: int = get_object(kwargs.get('offset'))
+        # Length of the entity, in UTF-16 code units.
+        self.length: int = get_object(kwargs.get('length'))
+        # Type of the entity.
+        self.type: TextEntityType = get_object(kwargs.get('type'))
@@ -0,0 +1,122 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class TextEntityType(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class TextEntityTypeMention(TextEntityType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class TextEntityTypeHashtag(TextEntityType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class TextEntityTypeCashtag(TextEntityType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class TextEntityTypeBotCommand(TextEntityType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class TextEntityTypeUrl(TextEntityType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class TextEntityTypeEmailAddress(TextEntityType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class TextEntityTypePhoneNumber(TextEntityType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class TextEntityTypeBankCardNumber(TextEntityType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class TextEntityTypeBold(TextEntityType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class TextEntityTypeItalic(TextEntityType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class TextEntityTypeUnderline(TextEntityType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class TextEntityTypeStrikethrough(TextEntityType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class TextEntityTypeSpoiler(TextEntityType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class TextEntityTypeCode(TextEntityType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class TextEntityTypePre(TextEntityType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class TextEntityTypePreCode(TextEntityType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Programming language of the code; as defined by the sender.
+        self.language: str = get_object(kwargs.get('language'))
+
+
+class TextEntityTypeBlockQuote(TextEntityType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class TextEntityTypeTextUrl(TextEntityType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # HTTP or tg:// URL to be opened when the link is clicked.
+        self.url: str = get_object(kwargs.get('url'))
+
+
+class TextEntityTypeMentionName(TextEntityType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Identifier of the mentioned user.
+        self.user_id: int = get_object(kwargs.get('user_id'))
+
+
+class TextEntityTypeCustomEmoji(TextEntityType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Unique identifier of the custom emoji.
+        self.custom_emoji_id: int = get_object(kwargs.get('custom_emoji_id'))
+
+
+class TextEntityTypeMediaTimestamp(TextEntityType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Timestamp from which a video/audio/video note/voice note/story playing must start, in seconds. The media can be in the content or the web page preview of the current message, or in the same places in the replied message.
+        self.media_timestamp: int = get_object(kwargs.get('media_timestamp'))
@@ -0,0 +1,19 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class TextParseMode(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class TextParseModeMarkdown(TextParseMode):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Version of the parser: 0 or 1 - Telegram Bot API &quot;Markdown&quot; parse mode, 2 - Telegram Bot API &quot;MarkdownV2&quot; parse mode.
+        self.version: int = get_object(kwargs.get('version'))
+
+
+class TextParseModeHTML(TextParseMode):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
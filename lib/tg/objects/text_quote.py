@@ -0,0 +1,13 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class TextQuote(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Text of the quote. Only Bold, Italic, Underline, Strikethrough, Spoiler, and CustomEmoji entities can be present in the text.
+        self.text: FormattedText = get_object(kwargs.get('text'))
+        # Approximate quote position in the original message in UTF-16 code units as specified by the message sender.
+        self.position: int = get_object(kwargs.get('position'))
+        # True, if the quote was manually chosen by the message sender.
+        self.is_manual: bool = get_object(kwargs.get('is_manual'))
@@ -0,0 +1,33 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class ThemeParameters(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # A color of the background in the RGB24 format.
+        self.background_color: int = get_object(kwargs.get('background_color'))
+        # A secondary color for the background in the RGB24 format.
+        self.secondary_background_color: int = get_object(kwargs.get('secondary_background_color'))
+        # A color of the header background in the RGB24 format.
+        self.header_background_color: int = get_object(kwargs.get('header_background_color'))
+        # A color of the section background in the RGB24 format.
+        self.section_background_color: int = get_object(kwargs.get('section_background_color'))
+        # A color of text in the RGB24 format.
+        self.text_color: int = get_object(kwargs.get('text_color'))
+        # An accent color of the text in the RGB24 format.
+        self.accent_text_color: int = get_object(kwargs.get('accent_text_color'))
+        # A color of text on the section headers in the RGB24 format.
+        self.section_header_text_color: int = get_object(kwargs.get('section_header_text_color'))
+        # A color of the subtitle text in the RGB24 format.
+        self.subtitle_text_color: int = get_object(kwargs.get('subtitle_text_color'))
+        # A color of the text for destructive actions in the RGB24 format.
+        self.destructive_text_color: int = get_object(kwargs.get('destructive_text_color'))
+        # A color of hints in the RGB24 format.
+        self.hint_color: int = get_object(kwargs.get('hint_color'))
+        # A color of links in the RGB24 format.
+        self.link_color: int = get_object(kwargs.get('link_color'))
+        # A color of the buttons in the RGB24 format.
+        self.button_color: int = get_object(kwargs.get('button_color'))
+        # A color of text on the buttons in the RGB24 format.
+        self.button_text_color: int = get_object(kwargs.get('button_text_color'))
@@ -0,0 +1,17 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class ThemeSettings(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Theme accent color in ARGB format.
+        self.accent_color: int = get_object(kwargs.get('accent_color'))
+        # The background to be used in chats; may be null.
+        self.background: Background = get_object(kwargs.get('background'))
+        # The fill to be used as a background for outgoing messages.
+        self.outgoing_message_fill: BackgroundFill = get_object(kwargs.get('outgoing_message_fill'))
+        # If true, the freeform gradient fill needs to be animated on every sent message.
+        self.animate_outgoing_message_fill: bool = get_object(kwargs.get('animate_outgoing_message_fill'))
+        # Accent color of outgoing messages in ARGB format.
+        self.outgoing_message_accent_color: int = get_object(kwargs.get('outgoing_message_accent_color'))
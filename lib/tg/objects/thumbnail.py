@@ -0,0 +1,15 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class Thumbnail(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Thumbnail format.
+        self.format: ThumbnailFormat = get_object(kwargs.get('format'))
+        # Thumbnail width.
+        self.width: int = get_object(kwargs.get('width'))
+        # Thumbnail height.
+        self.height: int = get_object(kwargs.get('height'))
+        # The thumbnail.
+        self.file: File = get_object(kwargs.get('file'))
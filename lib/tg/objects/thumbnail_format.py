@@ -0,0 +1,42 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object
+
+
+class ThumbnailFormat(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class ThumbnailFormatJpeg(ThumbnailFormat):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class ThumbnailFormatGif(ThumbnailFormat):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class ThumbnailFormatMpeg4(ThumbnailFormat):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class ThumbnailFormatPng(ThumbnailFormat):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class ThumbnailFormatTgs(ThumbnailFormat):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class ThumbnailFormatWebm(ThumbnailFormat):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class ThumbnailFormatWebp(ThumbnailFormat):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
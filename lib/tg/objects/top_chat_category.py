@@ -0,0 +1,42 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object
+
+
+class TopChatCategory(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class TopChatCategoryUsers(TopChatCategory):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class TopChatCategoryBots(TopChatCategory):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class TopChatCategoryGroups(TopChatCategory):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class TopChatCategoryChannels(TopChatCategory):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class TopChatCategoryInlineBots(TopChatCategory):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class TopChatCategoryCalls(TopChatCategory):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class TopChatCategoryForwardChats(TopChatCategory):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
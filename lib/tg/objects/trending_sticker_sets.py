@@ -0,0 +1,13 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class TrendingStickerSets(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Approximate total number of trending sticker sets.
+        self.total_count: int = get_object(kwargs.get('total_count'))
+        # List of trending sticker sets.
+        self.sets: list[StickerSetInfo] = get_object(kwargs.get('sets'))
+        # True, if the list contains sticker sets with premium stickers.
+        self.is_premium: bool = get_object(kwargs.get('is_premium'))
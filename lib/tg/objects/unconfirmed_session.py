@@ -0,0 +1,15 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class UnconfirmedSession(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Session identifier.
+        self.id: int = get_object(kwargs.get('id'))
+        # Point in time (Unix timestamp) when the user has logged in.
+        self.log_in_date: int = get_object(kwargs.get('log_in_date'))
+        # Model of the device that was used for the session creation, as provided by the application.
+        self.device_model: str = get_object(kwargs.get('device_model'))
+        # A human-readable description of the location from which the session was created, based on the IP address.
+        self.location: str = get_object(kwargs.get('location'))
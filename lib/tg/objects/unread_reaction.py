@@ -0,0 +1,13 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class UnreadReaction(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Type of the reaction.
+        self.type: ReactionType = get_object(kwargs.get('type'))
+        # Identifier of the sender, added the reaction.
+        self.sender_id: MessageSender = get_object(kwargs.get('sender_id'))
+        # True, if the reaction was added with a big animation.
+        self.is_big: bool = get_object(kwargs.get('is_big'))
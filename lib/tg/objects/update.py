@@ -0,0 +1,1235 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class Update(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class UpdateAuthorizationState(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # New authorization state.
+        self.authorization_state: AuthorizationState = get_object(kwargs.get('authorization_state'))
+
+
+class UpdateNewMessage(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The new message.
+        self.message: Message = get_object(kwargs.get('message'))
+
+
+class UpdateMessageSendAcknowledged(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The chat identifier of the sent message.
+        self.chat_id: int = get_object(kwargs.get('chat_id'))
+        # A temporary message identifier.
+        self.message_id: int = get_object(kwargs.get('message_id'))
+
+
+class UpdateMessageSendSucceeded(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The sent message. Usually only the message identifier, date, and content are changed, but almost all other fields can also change.
+        self.message: Message = get_object(kwargs.get('message'))
+        # The previous temporary message identifier.
+        self.old_message_id: int = get_object(kwargs.get('old_message_id'))
+
+
+class UpdateMessageSendFailed(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The failed to send message.
+        self.message: Message = get_object(kwargs.get('message'))
+        # The previous temporary message identifier.
+        self.old_message_id: int = get_object(kwargs.get('old_message_id'))
+        # The cause of the message sending failure.
+        self.error: Error = get_object(kwargs.get('error'))
+
+
+class UpdateMessageContent(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Chat identifier.
+        self.chat_id: int = get_object(kwargs.get('chat_id'))
+        # Message identifier.
+        self.message_id: int = get_object(kwargs.get('message_id'))
+        # New message content.
+        self.new_content: MessageContent = get_object(kwargs.get('new_content'))
+
+
+class UpdateMessageEdited(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Chat identifier.
+        self.chat_id: int = get_object(kwargs.get('chat_id'))
+        # Message identifier.
+        self.message_id: int = get_object(kwargs.get('message_id'))
+        # Point in time (Unix timestamp) when the message was edited.
+        self.edit_date: int = get_object(kwargs.get('edit_date'))
+        # New message reply markup; may be null.
+        self.reply_markup: ReplyMarkup = get_object(kwargs.get('reply_markup'))
+
+
+class UpdateMessageIsPinned(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Chat identifier.
+        self.chat_id: int = get_object(kwargs.get('chat_id'))
+        # The message identifier.
+        self.message_id: int = get_object(kwargs.get('message_id'))
+        # True, if the message is pinned.
+        self.is_pinned: bool = get_object(kwargs.get('is_pinned'))
+
+
+class UpdateMessageInteractionInfo(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Chat identifier.
+        self.chat_id: int = get_object(kwargs.get('chat_id'))
+        # Message identifier.
+        self.message_id: int = get_object(kwargs.get('message_id'))
+        # New information about interactions with the message; may be null.
+        self.interaction_info: MessageInteractionInfo = get_object(kwargs.get('interaction_info'))
+
+
+class UpdateMessageContentOpened(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Chat identifier.
+        self.chat_id: int = get_object(kwargs.get('chat_id'))
+        # Message identifier.
+        self.message_id: int = get_object(kwargs.get('message_id'))
+
+
+class UpdateMessageMentionRead(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Chat identifier.
+        self.chat_id: int = get_object(kwargs.get('chat_id'))
+        # Message identifier.
+        self.message_id: int = get_object(kwargs.get('message_id'))
+        # The new number of unread mention messages left in the chat.
+        self.unread_mention_count: int = get_object(kwargs.get('unread_mention_count'))
+
+
+class UpdateMessageUnreadReactions(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Chat identifier.
+        self.chat_id: int = get_object(kwargs.get('chat_id'))
+        # Message identifier.
+        self.message_id: int = get_object(kwargs.get('message_id'))
+        # The new list of unread reactions.
+        self.unread_reactions: list[UnreadReaction] = get_object(kwargs.get('unread_reactions'))
+        # The new number of messages with unread reactions left in the chat.
+        self.unread_reaction_count: int = get_object(kwargs.get('unread_reaction_count'))
+
+
+class UpdateMessageLiveLocationViewed(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Identifier of the chat with the live location message.
+        self.chat_id: int = get_object(kwargs.get('chat_id'))
+        # Identifier of the message with live location.
+        self.message_id: int = get_object(kwargs.get('message_id'))
+
+
+class UpdateNewChat(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The chat.
+        self.chat: Chat = get_object(kwargs.get('chat'))
+
+
+class UpdateChatTitle(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Chat identifier.
+        self.chat_id: int = get_object(kwargs.get('chat_id'))
+        # The new chat title.
+        self.title: str = get_object(kwargs.get('title'))
+
+
+class UpdateChatPhoto(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Chat identifier.
+        self.chat_id: int = get_object(kwargs.get('chat_id'))
+        # The new chat photo; may be null.
+        self.photo: ChatPhotoInfo = get_object(kwargs.get('photo'))
+
+
+class UpdateChatAccentColors(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Chat identifier.
+        self.chat_id: int = get_object(kwargs.get('chat_id'))
+        # The new chat accent color identifier.
+        self.accent_color_id: int = get_object(kwargs.get('accent_color_id'))
+        # The new identifier of a custom emoji to be shown on the reply header and link preview background; 0 if none.
+        self.background_custom_emoji_id: int = get_object(kwargs.get('background_custom_emoji_id'))
+        # The new chat profile accent color identifier; -1 if none.
+        self.profile_accent_color_id: int = get_object(kwargs.get('profile_accent_color_id'))
+        # The new identifier of a custom emoji to be shown on the profile background; 0 if none.
+        self.profile_background_custom_emoji_id: int = get_object(kwargs.get('profile_background_custom_emoji_id'))
+
+
+class UpdateChatPermissions(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Chat identifier.
+        self.chat_id: int = get_object(kwargs.get('chat_id'))
+        # The new chat permissions.
+        self.permissions: ChatPermissions = get_object(kwargs.get('permissions'))
+
+
+class UpdateChatLastMessage(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Chat identifier.
+        self.chat_id: int = get_object(kwargs.get('chat_id'))
+        # The new last message in the chat; may be null if the last message became unknown. While the last message is unknown, new messages can be added to the chat without corresponding updateNewMessage update.
+        self.last_message: Message = get_object(kwargs.get('last_message'))
+        # The new chat positions in the chat lists.
+        self.positions: list[ChatPosition] = get_object(kwargs.get('positions'))
+
+
+class UpdateChatPosition(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Chat identifier.
+        self.chat_id: int = get_object(kwargs.get('chat_id'))
+        # New chat position. If new order is 0, then the chat needs to be removed from the list.
+        self.position: ChatPosition = get_object(kwargs.get('position'))
+
+
+class UpdateChatReadInbox(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Chat identifier.
+        self.chat_id: int = get_object(kwargs.get('chat_id'))
+        # Identifier of the last read incoming message.
+        self.last_read_inbox_message_id: int = get_object(kwargs.get('last_read_inbox_message_id'))
+        # The number of unread messages left in the chat.
+        self.unread_count: int = get_object(kwargs.get('unread_count'))
+
+
+class UpdateChatReadOutbox(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Chat identifier.
+        self.chat_id: int = get_object(kwargs.get('chat_id'))
+        # Identifier of last read outgoing message.
+        self.last_read_outbox_message_id: int = get_object(kwargs.get('last_read_outbox_message_id'))
+
+
+class UpdateChatActionBar(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Chat identifier.
+        self.chat_id: int = get_object(kwargs.get('chat_id'))
+        # The new value of the action bar; may be null.
+        self.action_bar: ChatActionBar = get_object(kwargs.get('action_bar'))
+
+
+class UpdateChatAvailableReactions(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Chat identifier.
+        self.chat_id: int = get_object(kwargs.get('chat_id'))
+        # The new reactions, available in the chat.
+        self.available_reactions: ChatAvailableReactions = get_object(kwargs.get('available_reactions'))
+
+
+class UpdateChatDraftMessage(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Chat identifier.
+        self.chat_id: int = get_object(kwargs.get('chat_id'))
+        # The new draft message; may be null.
+        self.draft_message: DraftMessage = get_object(kwargs.get('draft_message'))
+        # The new chat positions in the chat lists.
+        self.positions: list[ChatPosition] = get_object(kwargs.get('positions'))
+
+
+class UpdateChatEmojiStatus(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Chat identifier.
+        self.chat_id: int = get_object(kwargs.get('chat_id'))
+        # The new chat emoji status; may be null.
+        self.emoji_status: EmojiStatus = get_object(kwargs.get('emoji_status'))
+
+
+class UpdateChatMessageSender(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Chat identifier.
+        self.chat_id: int = get_object(kwargs.get('chat_id'))
+        # New value of message_sender_id; may be null if the user can't change message sender.
+        self.message_sender_id: MessageSender = get_object(kwargs.get('message_sender_id'))
+
+
+class UpdateChatMessageAutoDeleteTime(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Chat identifier.
+        self.chat_id: int = get_object(kwargs.get('chat_id'))
+        # New value of message_auto_delete_time.
+        self.message_auto_delete_time: int = get_object(kwargs.get('message_auto_delete_time'))
+
+
+class UpdateChatNotificationSettings(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Chat identifier.
+        self.chat_id: int = get_object(kwargs.get('chat_id'))
+        # The new notification settings.
+        self.notification_settings: ChatNotificationSettings = get_object(kwargs.get('notification_settings'))
+
+
+class UpdateChatPendingJoinRequests(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Chat identifier.
+        self.chat_id: int = get_object(kwargs.get('chat_id'))
+        # The new data about pending join requests; may be null.
+        self.pending_join_requests: ChatJoinRequestsInfo = get_object(kwargs.get('pending_join_requests'))
+
+
+class UpdateChatReplyMarkup(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Chat identifier.
+        self.chat_id: int = get_object(kwargs.get('chat_id'))
+        # Identifier of the message from which reply markup needs to be used; 0 if there is no default custom reply markup in the chat.
+        self.reply_markup_message_id: int = get_object(kwargs.get('reply_markup_message_id'))
+
+
+class UpdateChatBackground(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Chat identifier.
+        self.chat_id: int = get_object(kwargs.get('chat_id'))
+        # The new chat background; may be null if background was reset to default.
+        self.background: ChatBackground = get_object(kwargs.get('background'))
+
+
+class UpdateChatTheme(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Chat identifier.
+        self.chat_id: int = get_object(kwargs.get('chat_id'))
+        # The new name of the chat theme; may be empty if theme was reset to default.
+        self.theme_name: str = get_object(kwargs.get('theme_name'))
+
+
+class UpdateChatUnreadMentionCount(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Chat identifier.
+        self.chat_id: int = get_object(kwargs.get('chat_id'))
+        # The number of unread mention messages left in the chat.
+        self.unread_mention_count: int = get_object(kwargs.get('unread_mention_count'))
+
+
+class UpdateChatUnreadReactionCount(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Chat identifier.
+        self.chat_id: int = get_object(kwargs.get('chat_id'))
+        # The number of messages with unread reactions left in the chat.
+        self.unread_reaction_count: int = get_object(kwargs.get('unread_reaction_count'))
+
+
+class UpdateChatVideoChat(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Chat identifier.
+        self.chat_id: int = get_object(kwargs.get('chat_id'))
+        # New value of video_chat.
+        self.video_chat: VideoChat = get_object(kwargs.get('video_chat'))
+
+
+class UpdateChatDefaultDisableNotification(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Chat identifier.
+        self.chat_id: int = get_object(kwargs.get('chat_id'))
+        # The new default_disable_notification value.
+        self.default_disable_notification: bool = get_object(kwargs.get('default_disable_notification'))
+
+
+class UpdateChatHasProtectedContent(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Chat identifier.
+        self.chat_id: int = get_object(kwargs.get('chat_id'))
+        # New value of has_protected_content.
+        self.has_protected_content: bool = get_object(kwargs.get('has_protected_content'))
+
+
+class UpdateChatIsTranslatable(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Chat identifier.
+        self.chat_id: int = get_object(kwargs.get('chat_id'))
+        # New value of is_translatable.
+        self.is_translatable: bool = get_object(kwargs.get('is_translatable'))
+
+
+class UpdateChatIsMarkedAsUnread(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Chat identifier.
+        self.chat_id: int = get_object(kwargs.get('chat_id'))
+        # New value of is_marked_as_unread.
+        self.is_marked_as_unread: bool = get_object(kwargs.get('is_marked_as_unread'))
+
+
+class UpdateChatViewAsTopics(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Chat identifier.
+        self.chat_id: int = get_object(kwargs.get('chat_id'))
+        # New value of view_as_topics.
+        self.view_as_topics: bool = get_object(kwargs.get('view_as_topics'))
+
+
+class UpdateChatBlockList(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Chat identifier.
+        self.chat_id: int = get_object(kwargs.get('chat_id'))
+        # Block list to which the chat is added; may be null if none.
+        self.block_list: BlockList = get_object(kwargs.get('block_list'))
+
+
+class UpdateChatHasScheduledMessages(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Chat identifier.
+        self.chat_id: int = get_object(kwargs.get('chat_id'))
+        # New value of has_scheduled_messages.
+        self.has_scheduled_messages: bool = get_object(kwargs.get('has_scheduled_messages'))
+
+
+class UpdateChatFolders(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The new list of chat folders.
+        self.chat_folders: list[ChatFolderInfo] = get_object(kwargs.get('chat_folders'))
+        # Position of the main chat list among chat folders, 0-based.
+        self.main_chat_list_position: int = get_object(kwargs.get('main_chat_list_position'))
+
+
+class UpdateChatOnlineMemberCount(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Identifier of the chat.
+        self.chat_id: int = get_object(kwargs.get('chat_id'))
+        # New number of online members in the chat, or 0 if unknown.
+        self.online_member_count: int = get_object(kwargs.get('online_member_count'))
+
+
+class UpdateForumTopicInfo(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Chat identifier.
+        self.chat_id: int = get_object(kwargs.get('chat_id'))
+        # New information about the topic.
+        self.info: ForumTopicInfo = get_object(kwargs.get('info'))
+
+
+class UpdateScopeNotificationSettings(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Types of chats for which notification settings were updated.
+        self.scope: NotificationSettingsScope = get_object(kwargs.get('scope'))
+        # The new notification settings.
+        self.notification_settings: ScopeNotificationSettings = get_object(kwargs.get('notification_settings'))
+
+
+class UpdateNotification(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Unique notification group identifier.
+        self.notification_group_id: int = get_object(kwargs.get('notification_group_id'))
+        # Changed notification.
+        self.notification: Notification = get_object(kwargs.get('notification'))
+
+
+class UpdateNotificationGroup(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Unique notification group identifier.
+        self.notification_group_id: int = get_object(kwargs.get('notification_group_id'))
+        # New type of the notification group.
+        self.type: NotificationGroupType = get_object(kwargs.get('type'))
+        # Identifier of a chat to which all notifications in the group belong.
+        self.chat_id: int = get_object(kwargs.get('chat_id'))
+        # Chat identifier, which notification settings must be applied to the added notifications.
+        self.notification_settings_chat_id: int = get_object(kwargs.get('notification_settings_chat_id'))
+        # Identifier of the notification sound to be played; 0 if sound is disabled.
+        self.notification_sound_id: int = get_object(kwargs.get('notification_sound_id'))
+        # Total number of unread notifications in the group, can be bigger than number of active notifications.
+        self.total_count: int = get_object(kwargs.get('total_count'))
+        # List of added group notifications, sorted by notification identifier.
+        self.added_notifications: list[Notification] = get_object(kwargs.get('added_notifications'))
+        # Identifiers of removed group notifications, sorted by notification identifier.
+        self.removed_notification_ids: list[int] = get_object(kwargs.get('removed_notification_ids'))
+
+
+class UpdateActiveNotifications(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Lists of active notification groups.
+        self.groups: list[NotificationGroup] = get_object(kwargs.get('groups'))
+
+
+class UpdateHavePendingNotifications(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # True, if there are some delayed notification updates, which will be sent soon.
+        self.have_delayed_notifications: bool = get_object(kwargs.get('have_delayed_notifications'))
+        # True, if there can be some yet unreceived notifications, which are being fetched from the server.
+        self.have_unreceived_notifications: bool = get_object(kwargs.get('have_unreceived_notifications'))
+
+
+class UpdateDeleteMessages(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Chat identifier.
+        self.chat_id: int = get_object(kwargs.get('chat_id'))
+        # Identifiers of the deleted messages.
+        self.message_ids: list[int] = get_object(kwargs.get('message_ids'))
+        # True, if the messages are permanently deleted by a user (as opposed to just becoming inaccessible).
+        self.is_permanent: bool = get_object(kwargs.get('is_permanent'))
+        # True, if the messages are deleted only from the cache and can possibly be retrieved again in the future.
+        self.from_cache: bool = get_object(kwargs.get('from_cache'))
+
+
+class UpdateChatAction(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Chat identifier.
+        self.chat_id: int = get_object(kwargs.get('chat_id'))
+        # If not 0, a message thread identifier in which the action was performed.
+        self.message_thread_id: int = get_object(kwargs.get('message_thread_id'))
+        # Identifier of a message sender performing the action.
+        self.sender_id: MessageSender = get_object(kwargs.get('sender_id'))
+        # The action.
+        self.action: ChatAction = get_object(kwargs.get('action'))
+
+
+class UpdateUserStatus(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # User identifier.
+        self.user_id: int = get_object(kwargs.get('user_id'))
+        # New status of the user.
+        self.status: UserStatus = get_object(kwargs.get('status'))
+
+
+class UpdateUser(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # New data about the user.
+        self.user: User = get_object(kwargs.get('user'))
+
+
+class UpdateBasicGroup(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # New data about the group.
+        self.basic_group: BasicGroup = get_object(kwargs.get('basic_group'))
+
+
+class UpdateSupergroup(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # New data about the supergroup.
+        self.supergroup: Supergroup = get_object(kwargs.get('supergroup'))
+
+
+class UpdateSecretChat(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # New data about the secret chat.
+        self.secret_chat: SecretChat = get_object(kwargs.get('secret_chat'))
+
+
+class UpdateUserFullInfo(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # User identifier.
+        self.user_id: int = get_object(kwargs.get('user_id'))
+        # New full information about the user.
+        self.user_full_info: UserFullInfo = get_object(kwargs.get('user_full_info'))
+
+
+class UpdateBasicGroupFullInfo(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Identifier of a basic group.
+        self.basic_group_id: int = get_object(kwargs.get('basic_group_id'))
+        # New full information about the group.
+        self.basic_group_full_info: BasicGroupFullInfo = get_object(kwargs.get('basic_group_full_info'))
+
+
+class UpdateSupergroupFullInfo(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Identifier of the supergroup or channel.
+        self.supergroup_id: int = get_object(kwargs.get('supergroup_id'))
+        # New full information about the supergroup.
+        self.supergroup_full_info: SupergroupFullInfo = get_object(kwargs.get('supergroup_full_info'))
+
+
+class UpdateServiceNotification(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Notification type. If type begins with &quot;AUTH_KEY_DROP_&quot;, then two buttons &quot;Cancel&quot; and &quot;Log out&quot; must be shown under notification; if user presses the second, all local data must be destroyed using Destroy method.
+        self.type: str = get_object(kwargs.get('type'))
+        # Notification content.
+        self.content: MessageContent = get_object(kwargs.get('content'))
+
+
+class UpdateFile(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # New data about the file.
+        self.file: File = get_object(kwargs.get('file'))
+
+
+class UpdateFileGenerationStart(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Unique identifier for the generation process.
+        self.generation_id: int = get_object(kwargs.get('generation_id'))
+        # The path to a file from which a new file is generated; may be empty.
+        self.original_path: str = get_object(kwargs.get('original_path'))
+        # The path to a file that must be created and where the new file is generated.
+        self.destination_path: str = get_object(kwargs.get('destination_path'))
+        # String specifying the conversion applied to the original file. If conversion is &quot;\#url\#&quot; than original_path contains an HTTP/HTTPS URL of a file, which must be downloaded by the application.
+        self.conversion: str = get_object(kwargs.get('conversion'))
+
+
+class UpdateFileGenerationStop(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Unique identifier for the generation process.
+        self.generation_id: int = get_object(kwargs.get('generation_id'))
+
+
+class UpdateFileDownloads(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Total size of files in the file download list, in bytes.
+        self.total_size: int = get_object(kwargs.get('total_size'))
+        # Total number of files in the file download list.
+        self.total_count: int = get_object(kwargs.get('total_count'))
+        # Total downloaded size of files in the file download list, in bytes.
+        self.downloaded_size: int = get_object(kwargs.get('downloaded_size'))
+
+
+class UpdateFileAddedToDownloads(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The added file download.
+        self.file_download: FileDownload = get_object(kwargs.get('file_download'))
+        # New number of being downloaded and recently downloaded files found.
+        self.counts: DownloadedFileCounts = get_object(kwargs.get('counts'))
+
+
+class UpdateFileDownload(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # File identifier.
+        self.file_id: int = get_object(kwargs.get('file_id'))
+        # Point in time (Unix timestamp) when the file downloading was completed; 0 if the file downloading isn't completed.
+        self.complete_date: int = get_object(kwargs.get('complete_date'))
+        # True, if downloading of the file is paused.
+        self.is_paused: bool = get_object(kwargs.get('is_paused'))
+        # New number of being downloaded and recently downloaded files found.
+        self.counts: DownloadedFileCounts = get_object(kwargs.get('counts'))
+
+
+class UpdateFileRemovedFromDownloads(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # File identifier.
+        self.file_id: int = get_object(kwargs.get('file_id'))
+        # New number of being downloaded and recently downloaded files found.
+        self.counts: DownloadedFileCounts = get_object(kwargs.get('counts'))
+
+
+class UpdateCall(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # New data about a call.
+        self.call: Call = get_object(kwargs.get('call'))
+
+
+class UpdateGroupCall(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # New data about a group call.
+        self.group_call: GroupCall = get_object(kwargs.get('group_call'))
+
+
+class UpdateGroupCallParticipant(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Identifier of group call.
+        self.group_call_id: int = get_object(kwargs.get('group_call_id'))
+        # New data about a participant.
+        self.participant: GroupCallParticipant = get_object(kwargs.get('participant'))
+
+
+class UpdateNewCallSignalingData(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The call identifier.
+        self.call_id: int = get_object(kwargs.get('call_id'))
+        # The data.
+        self.data: bytes = get_object(kwargs.get('data'))
+
+
+class UpdateUserPrivacySettingRules(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The privacy setting.
+        self.setting: UserPrivacySetting = get_object(kwargs.get('setting'))
+        # New privacy rules.
+        self.rules: UserPrivacySettingRules = get_object(kwargs.get('rules'))
+
+
+class UpdateUnreadMessageCount(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The chat list with changed number of unread messages.
+        self.chat_list: ChatList = get_object(kwargs.get('chat_list'))
+        # Total number of unread messages.
+        self.unread_count: int = get_object(kwargs.get('unread_count'))
+        # Total number of unread messages in unmuted chats.
+        self.unread_unmuted_count: int = get_object(kwargs.get('unread_unmuted_count'))
+
+
+class UpdateUnreadChatCount(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The chat list with changed number of unread messages.
+        self.chat_list: ChatList = get_object(kwargs.get('chat_list'))
+        # Approximate total number of chats in the chat list.
+        self.total_count: int = get_object(kwargs.get('total_count'))
+        # Total number of unread chats.
+        self.unread_count: int = get_object(kwargs.get('unread_count'))
+        # Total number of unread unmuted chats.
+        self.unread_unmuted_count: int = get_object(kwargs.get('unread_unmuted_count'))
+        # Total number of chats marked as unread.
+        self.marked_as_unread_count: int = get_object(kwargs.get('marked_as_unread_count'))
+        # Total number of unmuted chats marked as unread.
+        self.marked_as_unread_unmuted_count: int = get_object(kwargs.get('marked_as_unread_unmuted_count'))
+
+
+class UpdateStory(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The new information about the story.
+        self.story: Story = get_object(kwargs.get('story'))
+
+
+class UpdateStoryDeleted(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Identifier of the chat that posted the story.
+        self.story_sender_chat_id: int = get_object(kwargs.get('story_sender_chat_id'))
+        # Story identifier.
+        self.story_id: int = get_object(kwargs.get('story_id'))
+
+
+class UpdateStorySendSucceeded(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The sent story.
+        self.story: Story = get_object(kwargs.get('story'))
+        # The previous temporary story identifier.
+        self.old_story_id: int = get_object(kwargs.get('old_story_id'))
+
+
+class UpdateStorySendFailed(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The failed to send story.
+        self.story: Story = get_object(kwargs.get('story'))
+        # The cause of the story sending failure.
+        self.error: Error = get_object(kwargs.get('error'))
+        # Type of the error; may be null if unknown.
+        self.error_type: CanSendStoryResult = get_object(kwargs.get('error_type'))
+
+
+class UpdateChatActiveStories(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The new list of active stories.
+        self.active_stories: ChatActiveStories = get_object(kwargs.get('active_stories'))
+
+
+class UpdateStoryListChatCount(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The story list.
+        self.story_list: StoryList = get_object(kwargs.get('story_list'))
+        # Approximate total number of chats with active stories in the list.
+        self.chat_count: int = get_object(kwargs.get('chat_count'))
+
+
+class UpdateStoryStealthMode(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Point in time (Unix timestamp) until stealth mode is active; 0 if it is disabled.
+        self.active_until_date: int = get_object(kwargs.get('active_until_date'))
+        # Point in time (Unix timestamp) when stealth mode can be enabled again; 0 if there is no active cooldown.
+        self.cooldown_until_date: int = get_object(kwargs.get('cooldown_until_date'))
+
+
+class UpdateOption(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The option name.
+        self.name: str = get_object(kwargs.get('name'))
+        # The new option value.
+        self.value: OptionValue = get_object(kwargs.get('value'))
+
+
+class UpdateStickerSet(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The sticker set.
+        self.sticker_set: StickerSet = get_object(kwargs.get('sticker_set'))
+
+
+class UpdateInstalledStickerSets(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Type of the affected stickers.
+        self.sticker_type: StickerType = get_object(kwargs.get('sticker_type'))
+        # The new list of installed ordinary sticker sets.
+        self.sticker_set_ids: list[int] = get_object(kwargs.get('sticker_set_ids'))
+
+
+class UpdateTrendingStickerSets(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Type of the affected stickers.
+        self.sticker_type: StickerType = get_object(kwargs.get('sticker_type'))
+        # The prefix of the list of trending sticker sets with the newest trending sticker sets.
+        self.sticker_sets: TrendingStickerSets = get_object(kwargs.get('sticker_sets'))
+
+
+class UpdateRecentStickers(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # True, if the list of stickers attached to photo or video files was updated; otherwise, the list of sent stickers is updated.
+        self.is_attached: bool = get_object(kwargs.get('is_attached'))
+        # The new list of file identifiers of recently used stickers.
+        self.sticker_ids: list[int] = get_object(kwargs.get('sticker_ids'))
+
+
+class UpdateFavoriteStickers(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The new list of file identifiers of favorite stickers.
+        self.sticker_ids: list[int] = get_object(kwargs.get('sticker_ids'))
+
+
+class UpdateSavedAnimations(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The new list of file identifiers of saved animations.
+        self.animation_ids: list[int] = get_object(kwargs.get('animation_ids'))
+
+
+class UpdateSavedNotificationSounds(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The new list of identifiers of saved notification sounds.
+        self.notification_sound_ids: list[int] = get_object(kwargs.get('notification_sound_ids'))
+
+
+class UpdateDefaultBackground(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # True, if default background for dark theme has changed.
+        self.for_dark_theme: bool = get_object(kwargs.get('for_dark_theme'))
+        # The new default background; may be null.
+        self.background: Background = get_object(kwargs.get('background'))
+
+
+class UpdateChatThemes(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The new list of chat themes.
+        self.chat_themes: list[ChatTheme] = get_object(kwargs.get('chat_themes'))
+
+
+class UpdateAccentColors(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Information about supported colors; colors with identifiers 0 (red), 1 (orange), 2 (purple/violet), 3 (green), 4 (cyan), 5 (blue), 6 (pink) must always be supported and aren't included in the list. The exact colors for the accent colors with identifiers 0-6 must be taken from the app theme.
+        self.colors: list[AccentColor] = get_object(kwargs.get('colors'))
+        # The list of accent color identifiers, which can be set through setAccentColor and setChatAccentColor. The colors must be shown in the specififed order.
+        self.available_accent_color_ids: list[int] = get_object(kwargs.get('available_accent_color_ids'))
+
+
+class UpdateProfileAccentColors(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Information about supported colors.
+        self.colors: list[ProfileAccentColor] = get_object(kwargs.get('colors'))
+        # The list of accent color identifiers, which can be set through setProfileAccentColor and setChatProfileAccentColor. The colors must be shown in the specififed order.
+        self.available_accent_color_ids: list[int] = get_object(kwargs.get('available_accent_color_ids'))
+
+
+class UpdateLanguagePackStrings(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Localization target to which the language pack belongs.
+        self.localization_target: str = get_object(kwargs.get('localization_target'))
+        # Identifier of the updated language pack.
+        self.language_pack_id: str = get_object(kwargs.get('language_pack_id'))
+        # List of changed language pack strings; empty if all strings have changed.
+        self.strings: list[LanguagePackString] = get_object(kwargs.get('strings'))
+
+
+class UpdateConnectionState(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The new connection state.
+        self.state: ConnectionState = get_object(kwargs.get('state'))
+
+
+class UpdateTermsOfService(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Identifier of the terms of service.
+        self.terms_of_service_id: str = get_object(kwargs.get('terms_of_service_id'))
+        # The new terms of service.
+        self.terms_of_service: TermsOfService = get_object(kwargs.get('terms_of_service'))
+
+
+class UpdateUsersNearby(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The new list of users nearby.
+        self.users_nearby: list[ChatNearby] = get_object(kwargs.get('users_nearby'))
+
+
+class UpdateUnconfirmedSession(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The unconfirmed session; may be null if none.
+        self.session: UnconfirmedSession = get_object(kwargs.get('session'))
+
+
+class UpdateAttachmentMenuBots(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The new list of bots. The bots must not be shown on scheduled messages screen.
+        self.bots: list[AttachmentMenuBot] = get_object(kwargs.get('bots'))
+
+
+class UpdateWebAppMessageSent(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Identifier of Web App launch.
+        self.web_app_launch_id: int = get_object(kwargs.get('web_app_launch_id'))
+
+
+class UpdateActiveEmojiReactions(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The new list of active emoji reactions.
+        self.emojis: list[str] = get_object(kwargs.get('emojis'))
+
+
+class UpdateDefaultReactionType(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The new type of the default reaction.
+        self.reaction_type: ReactionType = get_object(kwargs.get('reaction_type'))
+
+
+class UpdateSpeechRecognitionTrial(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The maximum allowed duration of media for speech recognition without Telegram Premium subscription.
+        self.max_media_duration: int = get_object(kwargs.get('max_media_duration'))
+        # The total number of allowed speech recognitions per week; 0 if none.
+        self.weekly_count: int = get_object(kwargs.get('weekly_count'))
+        # Number of left speech recognition attempts this week.
+        self.left_count: int = get_object(kwargs.get('left_count'))
+        # Point in time (Unix timestamp) when the weekly number of tries will reset; 0 if unknown.
+        self.next_reset_date: int = get_object(kwargs.get('next_reset_date'))
+
+
+class UpdateDiceEmojis(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The new list of supported dice emojis.
+        self.emojis: list[str] = get_object(kwargs.get('emojis'))
+
+
+class UpdateAnimatedEmojiMessageClicked(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Chat identifier.
+        self.chat_id: int = get_object(kwargs.get('chat_id'))
+        # Message identifier.
+        self.message_id: int = get_object(kwargs.get('message_id'))
+        # The animated sticker to be played.
+        self.sticker: Sticker = get_object(kwargs.get('sticker'))
+
+
+class UpdateAnimationSearchParameters(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Name of the animation search provider.
+        self.provider: str = get_object(kwargs.get('provider'))
+        # The new list of emojis suggested for searching.
+        self.emojis: list[str] = get_object(kwargs.get('emojis'))
+
+
+class UpdateSuggestedActions(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Added suggested actions.
+        self.added_actions: list[SuggestedAction] = get_object(kwargs.get('added_actions'))
+        # Removed suggested actions.
+        self.removed_actions: list[SuggestedAction] = get_object(kwargs.get('removed_actions'))
+
+
+class UpdateAddChatMembersPrivacyForbidden(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Chat identifier.
+        self.chat_id: int = get_object(kwargs.get('chat_id'))
+        # Identifiers of users, which weren't added because of their privacy settings.
+        self.user_ids: list[int] = get_object(kwargs.get('user_ids'))
+
+
+class UpdateAutosaveSettings(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Type of chats for which autosave settings were updated.
+        self.scope: AutosaveSettingsScope = get_object(kwargs.get('scope'))
+        # The new autosave settings; may be null if the settings are reset to default.
+        self.settings: ScopeAutosaveSettings = get_object(kwargs.get('settings'))
+
+
+class UpdateNewInlineQuery(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Unique query identifier.
+        self.id: int = get_object(kwargs.get('id'))
+        # Identifier of the user who sent the query.
+        self.sender_user_id: int = get_object(kwargs.get('sender_user_id'))
+        # User location; may be null.
+        self.user_location: Location = get_object(kwargs.get('user_location'))
+        # The type of the chat from which the query originated; may be null if unknown.
+        self.chat_type: ChatType = get_object(kwargs.get('chat_type'))
+        # Text of the query.
+        self.query: str = get_object(kwargs.get('query'))
+        # Offset of the first entry to return.
+        self.offset: str = get_object(kwargs.get('offset'))
+
+
+class UpdateNewChosenInlineResult(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Identifier of the user who sent the query.
+        self.sender_user_id: int = get_object(kwargs.get('sender_user_id'))
+        # User location; may be null.
+        self.user_location: Location = get_object(kwargs.get('user_location'))
+        # Text of the query.
+        self.query: str = get_object(kwargs.get('query'))
+        # Identifier of the chosen result.
+        self.result_id: str = get_object(kwargs.get('result_id'))
+        # Identifier of the sent inline message, if known.
+        self.inline_message_id: str = get_object(kwargs.get('inline_message_id'))
+
+
+class UpdateNewCallbackQuery(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Unique query identifier.
+        self.id: int = get_object(kwargs.get('id'))
+        # Identifier of the user who sent the query.
+        self.sender_user_id: int = get_object(kwargs.get('sender_user_id'))
+        # Identifier of the chat where the query was sent.
+        self.chat_id: int = get_object(kwargs.get('chat_id'))
+        # Identifier of the message from which the query originated.
+        self.message_id: int = get_object(kwargs.get('message_id'))
+        # Identifier that uniquely corresponds to the chat to which the message was sent.
+        self.chat_instance: int = get_object(kwargs.get('chat_instance'))
+        # Query payload.
+        self.payload: CallbackQueryPayload = get_object(kwargs.get('payload'))
+
+
+class UpdateNewInlineCallbackQuery(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Unique query identifier.
+        self.id: int = get_object(kwargs.get('id'))
+        # Identifier of the user who sent the query.
+        self.sender_user_id: int = get_object(kwargs.get('sender_user_id'))
+        # Identifier of the inline message from which the query originated.
+        self.inline_message_id: str = get_object(kwargs.get('inline_message_id'))
+        # An identifier uniquely corresponding to the chat a message was sent to.
+        self.chat_instance: int = get_object(kwargs.get('chat_instance'))
+        # Query payload.
+        self.payload: CallbackQueryPayload = get_object(kwargs.get('payload'))
+
+
+class UpdateNewShippingQuery(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Unique query identifier.
+        self.id: int = get_object(kwargs.get('id'))
+        # Identifier of the user who sent the query.
+        self.sender_user_id: int = get_object(kwargs.get('sender_user_id'))
+        # Invoice payload.
+        self.invoice_payload: str = get_object(kwargs.get('invoice_payload'))
+        # User shipping address.
+        self.shipping_address: Address = get_object(kwargs.get('shipping_address'))
+
+
+class UpdateNewPreCheckoutQuery(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Unique query identifier.
+        self.id: int = get_object(kwargs.get('id'))
+        # Identifier of the user who sent the query.
+        self.sender_user_id: int = get_object(kwargs.get('sender_user_id'))
+        # Currency for the product price.
+        self.currency: str = get_object(kwargs.get('currency'))
+        # Total price for the product, in the smallest units of the currency.
+        self.total_amount: int = get_object(kwargs.get('total_amount'))
+        # Invoice payload.
+        self.invoice_payload: bytes = get_object(kwargs.get('invoice_payload'))
+        # Identifier of a shipping option chosen by the user; may be empty if not applicable.
+        self.shipping_option_id: str = get_object(kwargs.get('shipping_option_id'))
+        # Information about the order; may be null.
+        self.order_info: OrderInfo = get_object(kwargs.get('order_info'))
+
+
+class UpdateNewCustomEvent(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # A JSON-serialized event.
+        self.event: str = get_object(kwargs.get('event'))
+
+
+class UpdateNewCustomQuery(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The query identifier.
+        self.id: int = get_object(kwargs.get('id'))
+        # JSON-serialized query data.
+        self.data: str = get_object(kwargs.get('data'))
+        # Query timeout.
+        self.timeout: int = get_object(kwargs.get('timeout'))
+
+
+class UpdatePoll(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # New data about the poll.
+        self.poll: Poll = get_object(kwargs.get('poll'))
+
+
+class UpdatePollAnswer(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Unique poll identifier.
+        self.poll_id: int = get_object(kwargs.get('poll_id'))
+        # Identifier of the message sender that changed the answer to the poll.
+        self.voter_id: MessageSender = get_object(kwargs.get('voter_id'))
+        # 0-based identifiers of answer options, chosen by the user.
+        self.option_ids: list[int] = get_object(kwargs.get('option_ids'))
+
+
+class UpdateChatMember(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Chat identifier.
+        self.chat_id: int = get_object(kwargs.get('chat_id'))
+        # Identifier of the user, changing the rights.
+        self.actor_user_id: int = get_object(kwargs.get('actor_user_id'))
+        # Point in time (Unix timestamp) when the user rights were changed.
+        self.date: int = get_object(kwargs.get('date'))
+        # If user has joined the chat using an invite link, the invite link; may be null.
+        self.invite_link: ChatInviteLink = get_object(kwargs.get('invite_link'))
+        # True, if the user has joined the chat using an invite link for a chat folder.
+        self.via_chat_folder_invite_link: bool = get_object(kwargs.get('via_chat_folder_invite_link'))
+        # Previous chat member.
+        self.old_chat_member: ChatMember = get_object(kwargs.get('old_chat_member'))
+        # New chat member.
+        self.new_chat_member: ChatMember = get_object(kwargs.get('new_chat_member'))
+
+
+class UpdateNewChatJoinRequest(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Chat identifier.
+        self.chat_id: int = get_object(kwargs.get('chat_id'))
+        # Join request.
+        self.request: ChatJoinRequest = get_object(kwargs.get('request'))
+        # Chat identifier of the private chat with the user.
+        self.user_chat_id: int = get_object(kwargs.get('user_chat_id'))
+        # The invite link, which was used to send join request; may be null.
+        self.invite_link: ChatInviteLink = get_object(kwargs.get('invite_link'))
+
+
+class UpdateChatBoost(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Chat identifier.
+        self.chat_id: int = get_object(kwargs.get('chat_id'))
+        # New information about the boost.
+        self.boost: ChatBoost = get_object(kwargs.get('boost'))
+
+
+class UpdateMessageReaction(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Chat identifier.
+        self.chat_id: int = get_object(kwargs.get('chat_id'))
+        # Message identifier.
+        self.message_id: int = get_object(kwargs.get('message_id'))
+        # Identifier of the user or chat that changed reactions.
+        self.actor_id: MessageSender = get_object(kwargs.get('actor_id'))
+        # Point in time (Unix timestamp) when the reactions were changed.
+        self.date: int = get_object(kwargs.get('date'))
+        # Old list of chosen reactions.
+        self.old_reaction_types: list[ReactionType] = get_object(kwargs.get('old_reaction_types'))
+        # New list of chosen reactions.
+        self.new_reaction_types: list[ReactionType] = get_object(kwargs.get('new_reaction_types'))
+
+
+class UpdateMessageReactions(Update):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Chat identifier.
+        self.chat_id: int = get_object(kwargs.get('chat_id'))
+        # Message identifier.
+        self.message_id: int = get_object(kwargs.get('message_id'))
+        # Point in time (Unix timestamp) when the reactions were changed.
+        self.date: int = get_object(kwargs.get('date'))
+        # The list of reactions added to the message.
+        self.reactions: list[MessageReaction] = get_object(kwargs.get('reactions'))
@@ -0,0 +1,61 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class User(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # User identifier.
+        self.id: int = get_object(kwargs.get('id'))
+        # First name of the user.
+        self.first_name: str = get_object(kwargs.get('first_name'))
+        # Last name of the user.
+        self.last_name: str = get_object(kwargs.get('last_name'))
+        # Usernames of the user; may be null.
+        self.usernames: Usernames = get_object(kwargs.get('usernames'))
+        # Phone number of the user.
+        self.phone_number: str = get_object(kwargs.get('phone_number'))
+        # Current online status of the user.
+        self.status: UserStatus = get_object(kwargs.get('status'))
+        # Profile photo of the user; may be null.
+        self.profile_photo: ProfilePhoto = get_object(kwargs.get('profile_photo'))
+        # Identifier of the accent color for name, and backgrounds of profile photo, reply header, and link preview. For Telegram Premium users only.
+        self.accent_color_id: int = get_object(kwargs.get('accent_color_id'))
+        # Identifier of a custom emoji to be shown on the reply header and link preview background; 0 if none. For Telegram Premium users only.
+        self.background_custom_emoji_id: int = get_object(kwargs.get('background_custom_emoji_id'))
+        # Identifier of the accent color for the user's profile; -1 if none. For Telegram Premium users only.
+        self.profile_accent_color_id: int = get_object(kwargs.get('profile_accent_color_id'))
+        # Identifier of a custom emoji to be shown on the background of the user's profile; 0 if none. For Telegram Premium users only.
+        self.profile_background_custom_emoji_id: int = get_object(kwargs.get('profile_background_custom_emoji_id'))
+        # Emoji status to be shown instead of the default Telegram Premium badge; may be null. For Telegram Premium users only.
+        self.emoji_status: EmojiStatus = get_object(kwargs.get('emoji_status'))
+        # The user is a contact of the current user.
+        self.is_contact: bool = get_object(kwargs.get('is_contact'))
+        # The user is a contact of the current user and the current user is a contact of the user.
+        self.is_mutual_contact: bool = get_object(kwargs.get('is_mutual_contact'))
+        # The user is a close friend of the current user; implies that the user is a contact.
+        self.is_close_friend: bool = get_object(kwargs.get('is_close_friend'))
+        # True, if the user is verified.
+        self.is_verified: bool = get_object(kwargs.get('is_verified'))
+        # True, if the user is a Telegram Premium user.
+        self.is_premium: bool = get_object(kwargs.get('is_premium'))
+        # True, if the user is Telegram support account.
+        self.is_support: bool = get_object(kwargs.get('is_support'))
+        # If non-empty, it contains a human-readable description of the reason why access to this user must be restricted.
+        self.restriction_reason: str = get_object(kwargs.get('restriction_reason'))
+        # True, if many users reported this user as a scam.
+        self.is_scam: bool = get_object(kwargs.get('is_scam'))
+        # True, if many users reported this user as a fake account.
+        self.is_fake: bool = get_object(kwargs.get('is_fake'))
+        # True, if the user has non-expired stories available to the current user.
+        self.has_active_stories: bool = get_object(kwargs.get('has_active_stories'))
+        # True, if the user has unread non-expired stories available to the current user.
+        self.has_unread_active_stories: bool = get_object(kwargs.get('has_unread_active_stories'))
+        # If false, the user is inaccessible, and the only information known about the user is inside this class. Identifier of the user can't be passed to any method.
+        self.have_access: bool = get_object(kwargs.get('have_access'))
+        # Type of the user.
+        self.type: UserType = get_object(kwargs.get('type'))
+        # IETF language tag of the user's language; only available to bots.
+        self.language_code: str = get_object(kwargs.get('language_code'))
+        # True, if the user added the current bot to attachment menu; only available to bots.
+        self.added_to_attachment_menu: bool = get_object(kwargs.get('added_to_attachment_menu'))
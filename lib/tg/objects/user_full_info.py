@@ -0,0 +1,39 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class UserFullInfo(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # User profile photo set by the current user for the contact; may be null. If null and user.profile_photo is null, then the photo is empty; otherwise, it is unknown. If non-null, then it is the same photo as in user.profile_photo and chat.photo. This photo isn't returned in the list of user photos.
+        self.personal_photo: ChatPhoto = get_object(kwargs.get('personal_photo'))
+        # User profile photo; may be null. If null and user.profile_photo is null, then the photo is empty; otherwise, it is unknown. If non-null and personal_photo is null, then it is the same photo as in user.profile_photo and chat.photo.
+        self.photo: ChatPhoto = get_object(kwargs.get('photo'))
+        # User profile photo visible if the main photo is hidden by privacy settings; may be null. If null and user.profile_photo is null, then the photo is empty; otherwise, it is unknown. If non-null and both photo and personal_photo are null, then it is the same photo as in user.profile_photo and chat.photo. This photo isn't returned in the list of user photos.
+        self.public_photo: ChatPhoto = get_object(kwargs.get('public_photo'))
+        # Block list to which the user is added; may be null if none.
+        self.block_list: BlockList = get_object(kwargs.get('block_list'))
+        # True, if the user can be called.
+        self.can_be_called: bool = get_object(kwargs.get('can_be_called'))
+        # True, if a video call can be created with the user.
+        self.supports_video_calls: bool = get_object(kwargs.get('supports_video_calls'))
+        # True, if the user can't be called due to their privacy settings.
+        self.has_private_calls: bool = get_object(kwargs.get('has_private_calls'))
+        # True, if the user can't be linked in forwarded messages due to their privacy settings.
+        self.has_private_forwards: bool = get_object(kwargs.get('has_private_forwards'))
+        # True, if voice and video notes can't be sent or forwarded to the user.
+        self.has_restricted_voice_and_video_note_messages: bool = get_object(kwargs.get('has_restricted_voice_and_video_note_messages'))
+        # True, if the user has pinned stories.
+        self.has_pinned_stories: bool = get_object(kwargs.get('has_pinned_stories'))
+        # True, if the current user needs to explicitly allow to share their phone number with the user when the method addContact is used.
+        self.need_phone_number_privacy_exception: bool = get_object(kwargs.get('need_phone_number_privacy_exception'))
+        # True, if the user set chat background for both chat users and it wasn't reverted yet.
+        self.set_chat_background: bool = get_object(kwargs.get('set_chat_background'))
+        # A short user bio; may be null for bots.
+        self.bio: FormattedText = get_object(kwargs.get('bio'))
+        # The list of available options for gifting Telegram Premium to the user.
+        self.premium_gift_options: list[PremiumPaymentOption] = get_object(kwargs.get('premium_gift_options'))
+        # Number of group chats where both the other user and the current user are a member; 0 for the current user.
+        self.group_in_common_count: int = get_object(kwargs.get('group_in_common_count'))
+        # For bots, information about the bot; may be null if the user isn't a bot.
+        self.bot_info: BotInfo = get_object(kwargs.get('bot_info'))
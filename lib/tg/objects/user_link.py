@@ -0,0 +1,11 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class UserLink(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The URL.
+        self.url: str = get_object(kwargs.get('url'))
+        # Left time for which the link is valid, in seconds; 0 if the link is a public username link.
+        self.expires_in: int = get_object(kwargs.get('expires_in'))
@@ -0,0 +1,57 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object
+
+
+class UserPrivacySetting(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class UserPrivacySettingShowStatus(UserPrivacySetting):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class UserPrivacySettingShowProfilePhoto(UserPrivacySetting):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class UserPrivacySettingShowLinkInForwardedMessages(UserPrivacySetting):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class UserPrivacySettingShowPhoneNumber(UserPrivacySetting):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class UserPrivacySettingShowBio(UserPrivacySetting):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class UserPrivacySettingAllowChatInvites(UserPrivacySetting):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class UserPrivacySettingAllowCalls(UserPrivacySetting):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class UserPrivacySettingAllowPeerToPeerCalls(UserPrivacySetting):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class UserPrivacySettingAllowFindingByPhoneNumber(UserPrivacySetting):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class UserPrivacySettingAllowPrivateVoiceAndVideoNoteMessages(UserPrivacySetting):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
@@ -0,0 +1,55 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class UserPrivacySettingRule(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class UserPrivacySettingRuleAllowAll(UserPrivacySettingRule):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class UserPrivacySettingRuleAllowContacts(UserPrivacySettingRule):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class UserPrivacySettingRuleAllowUsers(UserPrivacySettingRule):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The user identifiers, total number of users in all rules must not exceed 1000.
+        self.user_ids: list[int] = get_object(kwargs.get('user_ids'))
+
+
+class UserPrivacySettingRuleAllowChatMembers(UserPrivacySettingRule):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The chat identifiers, total number of chats in all rules must not exceed 20.
+        self.chat_ids: list[int] = get_object(kwargs.get('chat_ids'))
+
+
+class UserPrivacySettingRuleRestrictAll(UserPrivacySettingRule):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class UserPrivacySettingRuleRestrictContacts(UserPrivacySettingRule):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class UserPrivacySettingRuleRestrictUsers(UserPrivacySettingRule):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The user identifiers, total number of users in all rules must not exceed 1000.
+        self.user_ids: list[int] = get_object(kwargs.get('user_ids'))
+
+
+class UserPrivacySettingRuleRestrictChatMembers(UserPrivacySettingRule):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The chat identifiers, total number of chats in all rules must not exceed 20.
+        self.chat_ids: list[int] = get_object(kwargs.get('chat_ids'))
@@ -0,0 +1,9 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class UserPrivacySettingRules(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # A list of rules.
+        self.rules: list[UserPrivacySettingRule] = get_object(kwargs.get('rules'))
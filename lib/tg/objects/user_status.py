@@ -0,0 +1,41 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class UserStatus(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class UserStatusEmpty(UserStatus):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class UserStatusOnline(UserStatus):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Point in time (Unix timestamp) when the user's online status will expire.
+        self.expires: int = get_object(kwargs.get('expires'))
+
+
+class UserStatusOffline(UserStatus):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Point in time (Unix timestamp) when the user was last online.
+        self.was_online: int = get_object(kwargs.get('was_online'))
+
+
+class UserStatusRecently(UserStatus):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class UserStatusLastWeek(UserStatus):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class UserStatusLastMonth(UserStatus):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
@@ -0,0 +1,13 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class UserSupportInfo(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Information message.
+        self.message: FormattedText = get_object(kwargs.get('message'))
+        # Information author.
+        self.author: str = get_object(kwargs.get('author'))
+        # Information change date.
+        self.date: int = get_object(kwargs.get('date'))
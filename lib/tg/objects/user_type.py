@@ -0,0 +1,41 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class UserType(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class UserTypeRegular(UserType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class UserTypeDeleted(UserType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class UserTypeBot(UserType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # True, if the bot is owned by the current user and can be edited using the methods toggleBotUsernameIsActive, reorderBotActiveUsernames, setBotProfilePhoto, setBotName, setBotInfoDescription, and setBotInfoShortDescription.
+        self.can_be_edited: bool = get_object(kwargs.get('can_be_edited'))
+        # True, if the bot can be invited to basic group and supergroup chats.
+        self.can_join_groups: bool = get_object(kwargs.get('can_join_groups'))
+        # True, if the bot can read all messages in basic group or supergroup chats and not just those addressed to the bot. In private and channel chats a bot can always read all messages.
+        self.can_read_all_group_messages: bool = get_object(kwargs.get('can_read_all_group_messages'))
+        # True, if the bot supports inline queries.
+        self.is_inline: bool = get_object(kwargs.get('is_inline'))
+        # Placeholder for inline queries (displayed on the application input field).
+        self.inline_query_placeholder: str = get_object(kwargs.get('inline_query_placeholder'))
+        # True, if the location of the user is expected to be sent with every inline query to this bot.
+        self.need_location: bool = get_object(kwargs.get('need_location'))
+        # True, if the bot can be added to attachment or side menu.
+        self.can_be_added_to_attachment_menu: bool = get_object(kwargs.get('can_be_added_to_attachment_menu'))
+
+
+class UserTypeUnknown(UserType):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
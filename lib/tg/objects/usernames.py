@@ -0,0 +1,13 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class Usernames(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # List of active usernames; the first one must be shown as the primary username. The order of active usernames can be changed with reorderActiveUsernames, reorderBotActiveUsernames or reorderSupergroupActiveUsernames.
+        self.active_usernames: list[str] = get_object(kwargs.get('active_usernames'))
+        # List of currently disabled usernames; the username can be activated with toggleUsernameIsActive, toggleBotUsernameIsActive, or toggleSupergroupUsernameIsActive.
+        self.disabled_usernames: list[str] = get_object(kwargs.get('disabled_usernames'))
+        # The active username, which can be changed with setUsername or setSupergroupUsername.
+        self.editable_username: str = get_object(kwargs.get('editable_username'))
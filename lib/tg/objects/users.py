@@ -0,0 +1,11 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class Users(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Approximate total number of users found.
+        self.total_count: int = get_object(kwargs.get('total_count'))
+        # A list of user identifiers.
+        self.user_ids: list[int] = get_object(kwargs.get('user_ids'))
@@ -0,0 +1,11 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class ValidatedOrderInfo(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Temporary identifier of the order information.
+        self.order_info_id: str = get_object(kwargs.get('order_info_id'))
+        # Available shipping options.
+        self.shipping_options: list[ShippingOption] = get_object(kwargs.get('shipping_options'))
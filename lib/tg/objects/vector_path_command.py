@@ -0,0 +1,25 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class VectorPathCommand(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+
+class VectorPathCommandLine(VectorPathCommand):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The end point of the straight line.
+        self.end_point: Point = get_object(kwargs.get('end_point'))
+
+
+class VectorPathCommandCubicBezierCurve(VectorPathCommand):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # The start control point of the curve.
+        self.start_control_point: Point = get_object(kwargs.get('start_control_point'))
+        # The end control point of the curve.
+        self.end_control_point: Point = get_object(kwargs.get('end_control_point'))
+        # The end point of the curve.
+        self.end_point: Point = get_object(kwargs.get('end_point'))
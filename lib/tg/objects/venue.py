@@ -0,0 +1,19 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class Venue(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Venue location; as defined by the sender.
+        self.location: Location = get_object(kwargs.get('location'))
+        # Venue name; as defined by the sender.
+        self.title: str = get_object(kwargs.get('title'))
+        # Venue address; as defined by the sender.
+        self.address: str = get_object(kwargs.get('address'))
+        # Provider of the venue database; as defined by the sender. Currently, only &quot;foursquare&quot; and &quot;gplaces&quot; (Google Places) need to be supported.
+        self.provider: str = get_object(kwargs.get('provider'))
+        # Identifier of the venue in the provider database; as defined by the sender.
+        self.id: str = get_object(kwargs.get('id'))
+        # Type of the venue in the provider database; as defined by the sender.
+        self.type: str = get_object(kwargs.get('type'))
@@ -0,0 +1,27 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class Video(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Duration of the video, in seconds; as defined by the sender.
+        self.duration: int = get_object(kwargs.get('duration'))
+        # Video width; as defined by the sender.
+        self.width: int = get_object(kwargs.get('width'))
+        # Video height; as defined by the sender.
+        self.height: int = get_object(kwargs.get('height'))
+        # Original name of the file; as defined by the sender.
+        self.file_name: str = get_object(kwargs.get('file_name'))
+        # MIME type of the file; as defined by the sender.
+        self.mime_type: str = get_object(kwargs.get('mime_type'))
+        # True, if stickers were added to the video. The list of corresponding sticker sets can be received using getAttachedStickerSets.
+        self.has_stickers: bool = get_object(kwargs.get('has_stickers'))
+        # True, if the video is supposed to be streamed.
+        self.supports_streaming: bool = get_object(kwargs.get('supports_streaming'))
+        # Video minithumbnail; may be null.
+        self.minithumbnail: Minithumbnail = get_object(kwargs.get('minithumbnail'))
+        # Video thumbnail in JPEG or MPEG4 format; as defined by the sender; may be null.
+        self.thumbnail: Thumbnail = get_object(kwargs.get('thumbnail'))
+        # File containing the video.
+        self.video: File = get_object(kwargs.get('video'))
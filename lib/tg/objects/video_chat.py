@@ -0,0 +1,13 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class VideoChat(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Group call identifier of an active video chat; 0 if none. Full information about the video chat can be received through the method getGroupCall.
+        self.group_call_id: int = get_object(kwargs.get('group_call_id'))
+        # True, if the video chat has participants.
+        self.has_participants: bool = get_object(kwargs.get('has_participants'))
+        # Default group call participant identifier to join the video chat; may be null.
+        self.default_participant_id: MessageSender = get_object(kwargs.get('default_participant_id'))
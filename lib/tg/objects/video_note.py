@@ -0,0 +1,21 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class VideoNote(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Duration of the video, in seconds; as defined by the sender.
+        self.duration: int = get_object(kwargs.get('duration'))
+        # A waveform representation of the video note's audio in 5-bit format; may be empty if unknown.
+        self.waveform: bytes = get_object(kwargs.get('waveform'))
+        # Video width and height; as defined by the sender.
+        self.length: int = get_object(kwargs.get('length'))
+        # Video minithumbnail; may be null.
+        self.minithumbnail: Minithumbnail = get_object(kwargs.get('minithumbnail'))
+        # Video thumbnail in JPEG format; as defined by the sender; may be null.
+        self.thumbnail: Thumbnail = get_object(kwargs.get('thumbnail'))
+        # Result of speech recognition in the video note; may be null.
+        self.speech_recognition_result: SpeechRecognitionResult = get_object(kwargs.get('speech_recognition_result'))
+        # File containing the video.
+        self.video: File = get_object(kwargs.get('video'))
@@ -0,0 +1,17 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class VoiceNote(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Duration of the voice note, in seconds; as defined by the sender.
+        self.duration: int = get_object(kwargs.get('duration'))
+        # A waveform representation of the voice note in 5-bit format.
+        self.waveform: bytes = get_object(kwargs.get('waveform'))
+        # MIME type of the file; as defined by the sender.
+        self.mime_type: str = get_object(kwargs.get('mime_type'))
+        # Result of speech recognition in the voice note; may be null.
+        self.speech_recognition_result: SpeechRecognitionResult = get_object(kwargs.get('speech_recognition_result'))
+        # File containing the voice note.
+        self.voice: File = get_object(kwargs.get('voice'))
@@ -0,0 +1,17 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class WebApp(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Web App short name.
+        self.short_name: str = get_object(kwargs.get('short_name'))
+        # Web App title.
+        self.title: str = get_object(kwargs.get('title'))
+        # Web App description.
+        self.description: str = get_object(kwargs.get('description'))
+        # Web App photo.
+        self.photo: Photo = get_object(kwargs.get('photo'))
+        # Web App animation; may be null.
+        self.animation: Animation = get_object(kwargs.get('animation'))
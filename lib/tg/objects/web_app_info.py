@@ -0,0 +1,11 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class WebAppInfo(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Unique identifier for the Web App launch.
+        self.launch_id: int = get_object(kwargs.get('launch_id'))
+        # A Web App URL to open in a web view.
+        self.url: str = get_object(kwargs.get('url'))
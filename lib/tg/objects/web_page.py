@@ -0,0 +1,61 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class WebPage(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Original URL of the link.
+        self.url: str = get_object(kwargs.get('url'))
+        # URL to display.
+        self.display_url: str = get_object(kwargs.get('display_url'))
+        # Type of the web page. Can be: article, photo, audio, video, document, profile, app, or something else.
+        self.type: str = get_object(kwargs.get('type'))
+        # Short name of the site (e.g., Google Docs, App Store).
+        self.site_name: str = get_object(kwargs.get('site_name'))
+        # Title of the content.
+        self.title: str = get_object(kwargs.get('title'))
+        # Description of the content.
+        self.description: FormattedText = get_object(kwargs.get('description'))
+        # Image representing the content; may be null.
+        self.photo: Photo = get_object(kwargs.get('photo'))
+        # URL to show in the embedded preview.
+        self.embed_url: str = get_object(kwargs.get('embed_url'))
+        # MIME type of the embedded preview, (e.g., text/html or video/mp4).
+        self.embed_type: str = get_object(kwargs.get('embed_type'))
+        # Width of the embedded preview.
+        self.embed_width: int = get_object(kwargs.get('embed_width'))
+        # Height of the embedded preview.
+        self.embed_height: int = get_object(kwargs.get('embed_height'))
+        # Duration of the content, in seconds.
+        self.duration: int = get_object(kwargs.get('duration'))
+        # Author of the content.
+        self.author: str = get_object(kwargs.get('author'))
+        # True, if size of media in the preview can be changed.
+        self.has_large_media: bool = get_object(kwargs.get('has_large_media'))
+        # True, if large media preview must be shown; otherwise, the media preview must be shown small and only the first frame must be shown for videos.
+        self.show_large_media: bool = get_object(kwargs.get('show_large_media'))
+        # True, if there is no need to show an ordinary open URL confirmation, when opening the URL from the preview, because the URL is shown in the message text in clear.
+        self.skip_confirmation: bool = get_object(kwargs.get('skip_confirmation'))
+        # True, if the link preview must be shown above message text; otherwise, the link preview must be shown below the message text.
+        self.show_above_text: bool = get_object(kwargs.get('show_above_text'))
+        # Preview of the content as an animation, if available; may be null.
+        self.animation: Animation = get_object(kwargs.get('animation'))
+        # Preview of the content as an audio file, if available; may be null.
+        self.audio: Audio = get_object(kwargs.get('audio'))
+        # Preview of the content as a document, if available; may be null.
+        self.document: Document = get_object(kwargs.get('document'))
+        # Preview of the content as a sticker for small WEBP files, if available; may be null.
+        self.sticker: Sticker = get_object(kwargs.get('sticker'))
+        # Preview of the content as a video, if available; may be null.
+        self.video: Video = get_object(kwargs.get('video'))
+        # Preview of the content as a video note, if available; may be null.
+        self.video_note: VideoNote = get_object(kwargs.get('video_note'))
+        # Preview of the content as a voice note, if available; may be null.
+        self.voice_note: VoiceNote = get_object(kwargs.get('voice_note'))
+        # The identifier of the sender of the previewed story; 0 if none.
+        self.story_sender_chat_id: int = get_object(kwargs.get('story_sender_chat_id'))
+        # The identifier of the previewed story; 0 if none.
+        self.story_id: int = get_object(kwargs.get('story_id'))
+        # Version of web page instant view (currently, can be 1 or 2); 0 if none.
+        self.instant_view_version: int = get_object(kwargs.get('instant_view_version'))
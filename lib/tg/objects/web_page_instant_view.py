@@ -0,0 +1,19 @@
+# Generated by tools/split_tg.py, do not edit
+from lib.tg import Object, get_object
+
+
+class WebPageInstantView(Object):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Content of the web page.
+        self.page_blocks: list[PageBlock] = get_object(kwargs.get('page_blocks'))
+        # Number of the instant view views; 0 if unknown.
+        self.view_count: int = get_object(kwargs.get('view_count'))
+        # Version of the instant view; currently, can be 1 or 2.
+        self.version: int = get_object(kwargs.get('version'))
+        # True, if the instant view must be shown from right to left.
+        self.is_rtl: bool = get_object(kwargs.get('is_rtl'))
+        # True, if the instant view contains the full page. A network request might be needed to get the full web page instant view.
+        self.is_full: bool = get_object(kwargs.get('is_full'))
+        # An internal link to be opened to leave feedback about the instant view.
+        self.feedback_link: InternalLinkType = get_object(kwargs.get('feedback_link'))
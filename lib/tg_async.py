@@ -0,0 +1,27 @@
+# Coroutine versions of the functions of lib.tg, e.g. `messages = await tg_async.getChatHistory(chat_id, limit=50)`.
+# They are created on first use and must be awaited in the event loop of AsyncTgClient.run
+import asyncio
+import functools
+import inspect
+
+from lib import tg
+
+
+def _coroutine(func):
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        return await asyncio.wrap_future(func(*args, **kwargs))
+    return wrapper
+
+
+def __getattr__(name):
+    func = getattr(tg, name, None)
+    if not inspect.isfunction(func) or func.__module__ != tg.__name__ or name.startswith('_'):
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+    wrapper = globals()[name] = _coroutine(func)
+    return wrapper
+
+
+def __dir__():
+    return sorted(name for name, value in vars(tg).items()
+                  if inspect.isfunction(value) and value.__module__ == tg.__name__ and not name.startswith('_'))
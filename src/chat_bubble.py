@@ -89,18 +89,17 @@ class TelegramChatBubble(KitHBoxLayout):
             pass
 
         elif isinstance(self._message.content, tg.MessagePhoto):
-            self._photo_label = PhotoLabel(self._tm, self._message.content.photo.sizes[-1].photo)
-            self._manager.updateFile.connect(self._photo_label.update_image)
+            self._photo_label = PhotoLabel(self._tm, self._manager, self._message.content.photo)
             self._main_widget.addWidget(self._photo_label)
 
         elif isinstance(self._message.content, tg.MessageVideo):
-            self._video_player = VideoPlayer(self._tm, self._message.content.video)
-            self._manager.updateFile.connect(self._video_player.on_downloaded)
+            self._video_player = VideoPlayer(self._tm, self._manager, self._message.content.video)
+            self._manager.subscribe_file(self._message.content.video.video.id, self._video_player.on_downloaded)
             self._main_widget.addWidget(self._video_player)
 
         elif isinstance(self._message.content, tg.MessageVoiceNote):
-            self._voice_player = VoicePlayer(self._tm, self._message.content.voice_note)
-            self._manager.updateFile.connect(self._voice_player.on_downloaded)
+            self._voice_player = VoicePlayer(self._tm, self._manager, self._message.content.voice_note)
+            self._manager.subscribe_file(self._message.content.voice_note.voice.id, self._voice_player.on_downloaded)
             self._main_widget.addWidget(self._voice_player)
 
         elif isinstance(self._message.content, tg.MessageDocument):
@@ -109,6 +108,7 @@ class TelegramChatBubble(KitHBoxLayout):
 
         elif isinstance(self._message.content, tg.MessageSticker):
             self._sticker_widget = StickerWidget(self._manager, self._message.content.sticker)
+            self._manager.subscribe_file(self._message.content.sticker.sticker.id, self._sticker_widget.on_downloaded)
             self._main_widget.addWidget(self._sticker_widget)
 
         elif isinstance(self._message.content, tg.MessageBasicGroupChatCreate):
@@ -131,7 +131,6 @@ class TelegramChatBubble(KitHBoxLayout):
 
         elif isinstance(self._message.content, tg.MessageAnimatedEmoji):
             self._emoji_widget = EmojiLabel(self._tm, self._message.content.emoji)
-            tg.downloadFile(self._message.content.animated_emoji.sticker.sticker.id, 1)
             self._main_widget.addWidget(self._emoji_widget)
 
         else:
@@ -173,9 +172,7 @@ class TelegramChatBubble(KitHBoxLayout):
         self._on_interaction_info_changed(self._message.chat_id, self._message.id)
 
     def _on_jump(self):
-        chat_id = self._manager.get_supergroup(self._manager.get_chat(
-            self._message.chat_id).type.supergroup_id)[1].linked_chat_id
-        tg.getMessageThread(self._message.chat_id, self._message.id)
+        self._manager.open_thread(self._message.chat_id, self._message.id)
 
     def showEvent(self, a0) -> None:
         super().showEvent(a0)
@@ -195,6 +192,18 @@ class TelegramChatBubble(KitHBoxLayout):
     def set_read(self):
         tg.viewMessages(self._message.chat_id, [self._message.id])
 
+    def set_download_priority(self, priority: int | None):
+        # Set by the chat history from the position of the bubble, None when the bubble is not shown
+        for widget in (getattr(self, '_photo_label', None), getattr(self, '_sticker_widget', None)):
+            if widget is not None:
+                widget.set_download_priority(priority)
+        if isinstance(self._message.content, tg.MessageAnimatedEmoji):
+            file = self._message.content.animated_emoji.sticker.sticker
+            if priority is None:
+                self._manager.downloads.release(file.id, self)
+            else:
+                self._manager.downloads.request(file, self, priority)
+
     def set_max_width(self, width):
         self._main_widget.setMaximumWidth(width)
         if hasattr(self, '_photo_label'):
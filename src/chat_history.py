@@ -0,0 +1,238 @@
+from bisect import bisect_left
+from collections import OrderedDict
+from typing import Callable
+
+from PyQt6.QtCore import Qt, QAbstractListModel, QModelIndex, QSize, QEvent, QTimer, pyqtSignal
+from PyQt6.QtWidgets import QStyledItemDelegate, QWidget
+
+from lib import tg
+from src.download_scheduler import DownloadScheduler
+from src.list_view import KitWidgetListView
+
+
+class ChatHistoryModel(QAbstractListModel):
+    MessageRole = Qt.ItemDataRole.UserRole
+
+    def __init__(self):
+        super().__init__()
+        # Sorted by id, a message is added once even if it is received from several requests
+        self._messages: list[tg.Message] = []
+        self._ids: list[int] = []
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._messages)
+
+    def data(self, index: QModelIndex, role=Qt.ItemDataRole.DisplayRole):
+        if role == ChatHistoryModel.MessageRole and index.isValid():
+            return self._messages[index.row()]
+        return None
+
+    def message(self, row: int) -> tg.Message:
+        return self._messages[row]
+
+    def append_message(self, message: tg.Message):
+        self.insert_message(message)
+
+    def insert_message(self, message: tg.Message):
+        row = bisect_left(self._ids, message.id)
+        if row < len(self._ids) and self._ids[row] == message.id:
+            return
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._messages.insert(row, message)
+        self._ids.insert(row, message.id)
+        self.endInsertRows()
+
+    def remove_messages(self, message_ids):
+        message_ids = set(message_ids)
+        for row in reversed(range(len(self._messages))):
+            if self._messages[row].id in message_ids:
+                self.beginRemoveRows(QModelIndex(), row, row)
+                self._messages.pop(row)
+                self._ids.pop(row)
+                self.endRemoveRows()
+
+
+class _ChatHistoryDelegate(QStyledItemDelegate):
+    ESTIMATED_HEIGHT = 60
+
+    def __init__(self, view: 'ChatHistoryView'):
+        super().__init__(view)
+        self._view = view
+        self._heights: dict[int: int] = dict()
+
+    def sizeHint(self, option, index: QModelIndex) -> QSize:
+        message = index.data(ChatHistoryModel.MessageRole)
+        return QSize(self._view.viewport().width() - 2 * self._view.spacing(),
+                     self._heights.get(message.id, _ChatHistoryDelegate.ESTIMATED_HEIGHT))
+
+    def paint(self, painter, option, index) -> None:
+        # Rows are drawn by the bubbles placed over them
+        pass
+
+    def set_height(self, message_id: int, height: int) -> bool:
+        if self._heights.get(message_id) == height:
+            return False
+        self._heights[message_id] = height
+        return True
+
+    def forget(self, message_id: int):
+        self._heights.pop(message_id, None)
+
+
+class ChatHistoryView(KitWidgetListView):
+    loadRequested = pyqtSignal()
+
+    # Bubbles are kept this far above and below the viewport
+    MARGIN = 300
+    # Hidden bubbles kept for scrolling back
+    CACHE_SIZE = 40
+
+    def __init__(self, bubble_factory: Callable[[tg.Message], QWidget]):
+        super().__init__()
+        self._bubble_factory = bubble_factory
+        self._bubbles: dict[int: QWidget] = dict()
+        self._cache: OrderedDict[int: QWidget] = OrderedDict()
+        self._last_pos = 0
+        self._last_max = 0
+        self._updating = False
+        self._layout_pending = False
+        self._layouting = False
+
+        self._delegate = _ChatHistoryDelegate(self)
+        self.setItemDelegate(self._delegate)
+        self.setSpacing(3)
+        self.verticalScrollBar().valueChanged.connect(self._on_scrolled)
+
+    def setModel(self, model: ChatHistoryModel) -> None:
+        super().setModel(model)
+        model.rowsAboutToBeRemoved.connect(self._on_rows_about_to_be_removed)
+
+    def bubbles(self):
+        yield from self._bubbles.values()
+        yield from self._cache.values()
+
+    def widgets(self):
+        return self.bubbles()
+
+    def rows_per_screen(self) -> int:
+        return self.viewport().height() // _ChatHistoryDelegate.ESTIMATED_HEIGHT + 1
+
+    def visible_rows(self) -> range:
+        if self.model() is None:
+            return range(0)
+        return range(self._first_row_below(0), self._first_row_below(self.viewport().height()))
+
+    def last_visible_bubble(self):
+        row = self._first_row_below(self.viewport().height()) - 1
+        if row < 0:
+            return None
+        return self._bubbles.get(self.model().message(row).id)
+
+    def _first_row_below(self, y: int) -> int:
+        model = self.model()
+        lo, hi = 0, model.rowCount()
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.visualRect(model.index(mid, 0)).bottom() < y:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def _on_scrolled(self, pos):
+        if not self._updating:
+            self._last_pos = pos
+        if pos < 50:
+            self.loadRequested.emit()
+        self._layout_bubbles()
+
+    def _on_rows_about_to_be_removed(self, parent, first, last):
+        for row in range(first, last + 1):
+            message_id = self.model().message(row).id
+            self._delegate.forget(message_id)
+            for dct in (self._bubbles, self._cache):
+                if message_id in dct:
+                    self._delete_bubble(dct.pop(message_id))
+
+    def updateGeometries(self) -> None:
+        # Keeps the view at the bottom, or at the same distance from the bottom when older messages are inserted.
+        # The scroll bar is clamped while the items are laid out, so the position is taken from the last scroll
+        if self.model() is None:
+            super().updateGeometries()
+            return
+        updating, self._updating = self._updating, True
+        super().updateGeometries()
+        self._updating = updating
+        bar = self.verticalScrollBar()
+        if self._last_pos > self._last_max - 30:
+            bar.setValue(bar.maximum())
+        else:
+            bar.setValue(bar.maximum() - self._last_max + self._last_pos)
+        self._last_max = bar.maximum()
+        self._last_pos = bar.value()
+        self._layout_bubbles()
+        # Without a scroll range the user can not scroll up to request older messages
+        if bar.maximum() == 0 and self.isVisible():
+            self.loadRequested.emit()
+
+    def eventFilter(self, a0, a1) -> bool:
+        if a1.type() == QEvent.Type.LayoutRequest and not self._layout_pending:
+            self._layout_pending = True
+            QTimer.singleShot(0, self._layout_bubbles)
+        return super().eventFilter(a0, a1)
+
+    def _layout_bubbles(self):
+        self._layout_pending = False
+        model = self.model()
+        if model is None or self._layouting:
+            return
+        self._layouting = True
+
+        visible = dict()
+        resized = False
+        bottom = self.viewport().height() + ChatHistoryView.MARGIN
+        for row in range(self._first_row_below(-ChatHistoryView.MARGIN), model.rowCount()):
+            index = model.index(row, 0)
+            rect = self.visualRect(index)
+            if rect.top() > bottom:
+                break
+            message = model.message(row)
+            bubble = self._bubbles.pop(message.id, None)
+            if bubble is None:
+                bubble = self._cache.pop(message.id, None)
+            if bubble is None:
+                bubble = self._create_bubble(message)
+            visible[message.id] = bubble
+            bubble.setGeometry(rect)
+            bubble.show()
+            if hasattr(bubble, 'set_download_priority'):
+                bubble.set_download_priority(DownloadScheduler.VISIBLE if rect.intersects(self.viewport().rect())
+                                             else DownloadScheduler.NEAR)
+            resized |= self._delegate.set_height(message.id, max(bubble.sizeHint().height(),
+                                                                 bubble.minimumSizeHint().height()))
+
+        for message_id, bubble in self._bubbles.items():
+            bubble.hide()
+            if hasattr(bubble, 'set_download_priority'):
+                bubble.set_download_priority(None)
+            self._cache[message_id] = bubble
+        while len(self._cache) > ChatHistoryView.CACHE_SIZE:
+            self._delete_bubble(self._cache.popitem(last=False)[1])
+        self._bubbles = visible
+        self._layouting = False
+        if resized:
+            self.scheduleDelayedItemsLayout()
+
+    def _create_bubble(self, message: tg.Message) -> QWidget:
+        bubble = self._bubble_factory(message)
+        bubble.setParent(self.viewport())
+        if hasattr(bubble, '_set_tm'):
+            bubble._set_tm(self._tm)
+        bubble.installEventFilter(self)
+        return bubble
+
+    @staticmethod
+    def _delete_bubble(bubble: QWidget):
+        bubble.hide()
+        bubble.setParent(None)
+        bubble.deleteLater()
@@ -0,0 +1,52 @@
+from bisect import bisect_left
+
+from lib import tg
+
+
+def chat_list_key(chat_list: tg.ChatList):
+    # tg.ChatList objects are not hashable, the key identifies the list they refer to
+    if isinstance(chat_list, tg.ChatListFolder):
+        return 'folder', chat_list.chat_folder_id
+    return chat_list.__class__.__name__
+
+
+class ChatListIndex:
+    # Chats of one chat list sorted by the pair (order, chat id) in descending order
+
+    def __init__(self):
+        self._keys: list[tuple[int, int]] = []
+        self._orders: dict[int: int] = dict()
+        # Incremented on every change of the order
+        self.version = 0
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __contains__(self, chat_id: int):
+        return chat_id in self._orders
+
+    def chat_ids(self) -> list[int]:
+        return [-chat_id for _, chat_id in self._keys]
+
+    def row(self, chat_id: int) -> int | None:
+        if (order := self._orders.get(chat_id)) is None:
+            return None
+        return bisect_left(self._keys, (-order, -chat_id))
+
+    def set_order(self, chat_id: int, order: int) -> tuple[int | None, int | None]:
+        # Returns the old and the new row of the chat, None if the chat was not in the list or has been removed
+        if self._orders.get(chat_id, 0) == order:
+            return (old_row := self.row(chat_id)), old_row
+
+        self.version += 1
+        old_row = None
+        if (old_order := self._orders.pop(chat_id, None)) is not None:
+            old_row = bisect_left(self._keys, (-old_order, -chat_id))
+            self._keys.pop(old_row)
+
+        new_row = None
+        if order:
+            self._orders[chat_id] = order
+            new_row = bisect_left(self._keys, key := (-order, -chat_id))
+            self._keys.insert(new_row, key)
+        return old_row, new_row
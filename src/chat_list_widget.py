@@ -1,81 +1,247 @@
-from PyQt6 import QtGui
-from PyQt6.QtCore import pyqtSignal, Qt
+import time
+from collections import deque
+
+from PyQt6.QtCore import pyqtSignal, Qt, QAbstractListModel, QModelIndex, QSize, QTimer
 from PyQt6.QtGui import QPixmap
+from PyQt6.QtWidgets import QStyledItemDelegate
 from PyQtUIkit.core import KitFont
 from PyQtUIkit.widgets import *
 
 from lib import tg
+from src.chat_list_index import chat_list_key
+from src.list_view import KitWidgetListView
 from src.telegram_manager import TelegramManager, TgChat
 
 
-class TelegramListWidget(KitScrollArea):
+class ChatListModel(QAbstractListModel):
+    ChatRole = Qt.ItemDataRole.UserRole
+
+    def __init__(self, manager: TelegramManager):
+        super().__init__()
+        self._manager = manager
+        self._chat_ids: list[int] = []
+        self._rows: dict[int: int] = dict()
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._chat_ids)
+
+    def data(self, index: QModelIndex, role=Qt.ItemDataRole.DisplayRole):
+        if role == ChatListModel.ChatRole and index.isValid():
+            return self._manager.get_chat(self._chat_ids[index.row()])
+        return None
+
+    def chat_id(self, row: int) -> int:
+        return self._chat_ids[row]
+
+    def row(self, chat_id: int) -> int | None:
+        return self._rows.get(chat_id)
+
+    def set_chats(self, chat_ids):
+        self.beginResetModel()
+        self._chat_ids = list(chat_ids)
+        self._rows = {chat_id: row for row, chat_id in enumerate(self._chat_ids)}
+        self.endResetModel()
+
+    def insert_chat(self, row: int, chat_id: int):
+        if chat_id in self._rows:
+            self.move_chat(chat_id, row)
+            return
+        row = min(row, len(self._chat_ids))
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._chat_ids.insert(row, chat_id)
+        self._update_rows(row, len(self._chat_ids) - 1)
+        self.endInsertRows()
+
+    def move_chat(self, chat_id: int, row: int):
+        if (old_row := self._rows.get(chat_id)) is None:
+            self.insert_chat(row, chat_id)
+            return
+        row = min(row, len(self._chat_ids) - 1)
+        if row == old_row:
+            return
+        # Destination is the row before which the chat is placed, counted before the move
+        self.beginMoveRows(QModelIndex(), old_row, old_row, QModelIndex(), row + 1 if row > old_row else row)
+        self._chat_ids.insert(row, self._chat_ids.pop(old_row))
+        self._update_rows(min(row, old_row), max(row, old_row))
+        self.endMoveRows()
+
+    def remove_chat(self, chat_id: int):
+        if (row := self._rows.pop(chat_id, None)) is None:
+            return
+        self.beginRemoveRows(QModelIndex(), row, row)
+        self._chat_ids.pop(row)
+        self._update_rows(row, len(self._chat_ids) - 1)
+        self.endRemoveRows()
+
+    def _update_rows(self, first: int, last: int):
+        # Only the rows between the changed positions are shifted
+        for row in range(first, last + 1):
+            self._rows[self._chat_ids[row]] = row
+
+    def update_chat(self, chat_id: int):
+        if (row := self._rows.get(chat_id)) is not None:
+            index = self.index(row, 0)
+            self.dataChanged.emit(index, index)
+
+
+class _ChatListDelegate(QStyledItemDelegate):
+    def __init__(self, view: 'TelegramListWidget'):
+        super().__init__(view)
+        self._view = view
+
+    def sizeHint(self, option, index) -> QSize:
+        return QSize(self._view.viewport().width(), TelegramListWidget.ITEM_HEIGHT)
+
+    def paint(self, painter, option, index) -> None:
+        # Rows are drawn by the TelegramListWidgetItem placed over them
+        pass
+
+
+class TelegramListWidget(KitWidgetListView):
     currentItemChanged = pyqtSignal(str)
+    ITEM_HEIGHT = 54
+    # Updates of the same chat within this interval are applied as one
+    UPDATE_INTERVAL = 16
 
     def __init__(self, manager: TelegramManager):
         super().__init__()
         self._manager = manager
+        self._current_id = None
 
-        self._layout = KitVBoxLayout()
-        self._layout.setAlignment(Qt.AlignmentFlag.AlignTop)
-        self.setWidget(self._layout)
+        # Widgets of the visible rows by chat id, the rest wait in the pool for the next scroll
+        self._items: dict[int: TelegramListWidgetItem] = dict()
+        self._pool: list[TelegramListWidgetItem] = []
 
-        self._items = dict()
+        self._model = ChatListModel(manager)
+        self.setItemDelegate(_ChatListDelegate(self))
+        self.setUniformItemSizes(True)
+        self.setModel(self._model)
+        self.verticalScrollBar().valueChanged.connect(self._layout_items)
+        self._model.dataChanged.connect(self._on_data_changed)
+
+        self._updated_chats = set()
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(TelegramListWidget.UPDATE_INTERVAL)
+        self._update_timer.timeout.connect(self._apply_chat_updates)
+        self._manager.updateChat.connect(self._on_chat_updated)
+
+        self._chat_list = None
+        self._chat_list_version = 0
+        self._manager.chatListChanged.connect(self._on_chat_list_changed)
+
+        self._refresh_times = deque()
+
+    def widgets(self):
+        return [*self._items.values(), *self._pool]
 
     def clear(self):
-        for el in self._items.values():
-            el.setParent(None)
-            el.disabled = True
-            el.hide()
-        self._items.clear()
+        self.set_chats([])
+
+    def set_chats(self, chat_ids):
+        self._chat_list = None
+        self._model.set_chats(chat_ids)
+
+    def set_chat_list(self, chat_list: tg.ChatList):
+        # The list is kept in order by the changes of the manager's chat list index
+        self._chat_list = chat_list_key(chat_list)
+        self._chat_list_version, chat_ids = self._manager.chat_list_snapshot(chat_list)
+        self._model.set_chats(chat_ids)
+
+    def _on_chat_list_changed(self, key, chat_id, old_row, new_row, version):
+        if key != self._chat_list or version <= self._chat_list_version:
+            return
+        self._chat_list_version = version
+        if new_row is None:
+            self._model.remove_chat(chat_id)
+        elif old_row is None:
+            self._model.insert_chat(new_row, chat_id)
+        else:
+            self._model.move_chat(chat_id, new_row)
 
     def _on_chat_updated(self, chat_id):
-        for el in self._items.values():
-            el.update_chat(chat_id)
+        self._updated_chats.add(int(chat_id))
+        if not self._update_timer.isActive():
+            self._update_timer.start()
+
+    def _apply_chat_updates(self):
+        updated_chats, self._updated_chats = self._updated_chats, set()
+        for chat_id in updated_chats:
+            self._model.update_chat(chat_id)
+
+    def _on_data_changed(self, top_left: QModelIndex, bottom_right: QModelIndex):
+        for row in range(top_left.row(), bottom_right.row() + 1):
+            if (item := self._items.get(self._model.chat_id(row))) is not None:
+                item.update_chat()
+                self._refresh_times.append(time.monotonic())
+        self._trim_refresh_times()
+
+    def refreshes_per_second(self) -> int:
+        # Number of row widgets refreshed during the last second
+        self._trim_refresh_times()
+        return len(self._refresh_times)
+
+    def _trim_refresh_times(self):
+        # Only the refreshes of the last second are kept
+        while self._refresh_times and self._refresh_times[0] < time.monotonic() - 1:
+            self._refresh_times.popleft()
 
     def _on_item_selected(self, chat_id):
         if isinstance(chat_id, str):
             chat_id = int(chat_id)
-        for key, item in self._items.items():
-            if key != chat_id:
-                item.set_selected(False)
+        self.set_current_id(chat_id)
         self.currentItemChanged.emit(str(chat_id))
 
     def set_current_id(self, chat_id):
-        for key, item in self._items.items():
-            if key != chat_id:
-                item.set_selected(False)
-        if chat_id in self._items:
-            self._items[chat_id].set_selected(True)
-
-    def add_item(self, chat: TgChat):
-        item = TelegramListWidgetItem(self._tm, chat, self._manager)
+        if (item := self._items.get(self._current_id)) is not None:
+            item.set_checked(False)
+        self._current_id = chat_id
+        if (item := self._items.get(chat_id)) is not None:
+            item.set_checked(True)
+
+    def updateGeometries(self) -> None:
+        super().updateGeometries()
+        if self.model() is not None:
+            self._layout_items()
+
+    def _layout_items(self):
+        first = self.verticalScrollBar().value() // TelegramListWidget.ITEM_HEIGHT
+        last = min(self._model.rowCount(), first + self.viewport().height() // TelegramListWidget.ITEM_HEIGHT + 2)
+        chat_ids = [self._model.chat_id(row) for row in range(first, last)]
+
+        for chat_id in set(self._items).difference(chat_ids):
+            item = self._items.pop(chat_id)
+            item.hide()
+            self._pool.append(item)
+
+        for row, chat_id in enumerate(chat_ids, first):
+            if (item := self._items.get(chat_id)) is None:
+                item = self._pool.pop() if self._pool else self._create_item()
+                item.set_chat(self._manager.get_chat(chat_id))
+                item.set_checked(chat_id == self._current_id)
+                self._items[chat_id] = item
+            item.setGeometry(self.visualRect(self._model.index(row, 0)))
+            item.show()
+
+    def _create_item(self):
+        item = TelegramListWidgetItem(self._manager)
+        item.setParent(self.viewport())
+        item._set_tm(self._tm)
         item.selected.connect(self._on_item_selected)
-        chat_id = chat.id
-        self._items[chat_id] = item
-        self._layout.addWidget(item)
-
-    def resizeEvent(self, a0: QtGui.QResizeEvent) -> None:
-        super().resizeEvent(a0)
-        self._set_items_width()
-
-    def _set_items_width(self):
-        width = self.width() - 19
-        for el in self._items.values():
-            el.setFixedWidth(width)
+        return item
 
 
 class TelegramListWidgetItem(KitLayoutButton):
     selected = pyqtSignal(str)
+    AVATAR_SIZE = 48
 
-    def __init__(self, tm, chat: TgChat, manager: TelegramManager):
+    def __init__(self, manager: TelegramManager):
         super().__init__()
-        self._tm = tm
-        self._chat = chat
-        self._chat_id = chat.id
+        self._chat = None
+        self._chat_id = None
         self._selected = False
         self._hover = False
         self._manager = manager
-        self.disabled = False
 
         self.setFixedHeight(54)
 
@@ -88,22 +254,12 @@ class TelegramListWidgetItem(KitLayoutButton):
 
         self._icon_label = KitLabel()
         self._icon_label.setFixedWidth(50)
-
-        self._photo = None
-        if chat.photo is not None:
-            self._photo = chat.photo.small
-            if self._photo.local.can_be_downloaded:
-                tg.downloadFile(self._photo.id, 1)
-            manager.updateFile.connect(self.update_icon)
-            if self._photo.local.is_downloading_completed:
-                self._icon_label.setPixmap(QPixmap(self._photo.local.path).scaled(48, 48))
-        else:
-            self._icon_label.setText(self._chat.title[0])
-            self._icon_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            self._icon_label.font_size = KitFont.Size.BIG
+        self._icon_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self._icon_label.font_size = KitFont.Size.BIG
         self.addWidget(self._icon_label)
+        self._photo = None
 
-        self._name_label = KitLabel(self._chat.title)
+        self._name_label = KitLabel()
         self.addWidget(self._name_label)
 
         last_message_layout = KitHBoxLayout()
@@ -112,15 +268,32 @@ class TelegramListWidgetItem(KitLayoutButton):
         self.addWidget(last_message_layout)
 
         self._last_message_label = LastMessageWidget(self._tm, self._manager)
-        self.update_last_message(self._chat.last_message)
         last_message_layout.addWidget(self._last_message_label, 10)
 
-        self._unread_count_label = KitLabel(str(self._chat.unread_count))
+        self._unread_count_label = KitLabel()
         self._unread_count_label.setMinimumWidth(30)
         self._unread_count_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         last_message_layout.addWidget(self._unread_count_label, 1)
-        if self._chat.unread_count == 0:
-            self._unread_count_label.hide()
+
+    def set_chat(self, chat: TgChat):
+        if self._photo is not None:
+            self._manager.unsubscribe_file(self._photo.id, self.update_icon)
+            self._manager.downloads.release(self._photo.id, self)
+        self._chat = chat
+        self._chat_id = chat.id
+
+        self._photo = None
+        if chat.photo is not None:
+            # The chat keeps the photo file it was received with, downloads are merged into the registry
+            self._photo = self._manager.get_file(chat.photo.small)
+            if self.isVisible():
+                self._manager.downloads.request(self._photo, self)
+            self._manager.subscribe_file(self._photo.id, self.update_icon)
+        self._icon_label.setText(self._chat.title[:1])
+        self._load_avatar()
+
+        self._name_label.setText(self._chat.title)
+        self.update_chat()
 
     def update_last_message(self, message):
         if message is not None and (isinstance(self._chat.type, tg.ChatTypeBasicGroup) or
@@ -131,12 +304,9 @@ class TelegramListWidgetItem(KitLayoutButton):
             sender = None
         self._last_message_label.open_message(message, sender)
 
-    def update_chat(self, chat_id: str):
-        if int(chat_id) != self._chat.id or self.disabled:
-            return
+    def update_chat(self):
         message = self._chat.last_message
-        if isinstance(message, tg.Message):
-            self.update_last_message(message)
+        self.update_last_message(message if isinstance(message, tg.Message) else None)
 
         self._unread_count_label.setText(str(self._chat.unread_count))
         if self._chat.unread_count == 0:
@@ -144,10 +314,36 @@ class TelegramListWidgetItem(KitLayoutButton):
         else:
             self._unread_count_label.show()
 
+    def showEvent(self, a0) -> None:
+        super().showEvent(a0)
+        if self._photo is not None:
+            self._manager.downloads.request(self._photo, self)
+
+    def hideEvent(self, a0) -> None:
+        super().hideEvent(a0)
+        # Hidden items are waiting in the pool of the list
+        if self._photo is not None:
+            self._manager.downloads.release(self._photo.id, self)
+
     def update_icon(self, image: tg.File):
-        if isinstance(self._photo, tg.File) and image.id == self._photo.id and \
-                self._photo.local.is_downloading_completed:
-            self._icon_label.setPixmap(QPixmap(self._photo.local.path).scaled(44, 44))
+        if isinstance(self._photo, tg.File) and image.id == self._photo.id:
+            self._photo = image
+            self._load_avatar()
+
+    def _load_avatar(self):
+        # The first letter of the title stays until the photo is decoded
+        if self._photo is None or not self._photo.local.is_downloading_completed:
+            return
+        dpr = self.devicePixelRatioF()
+        size = TelegramListWidgetItem.AVATAR_SIZE
+        pixmap = self._manager.avatar_cache.load((self._photo.id, size, dpr), self._photo.local.path,
+                                                 QSize(size, size), self._on_avatar_loaded, dpr=dpr)
+        if pixmap is not None:
+            self._icon_label.setPixmap(pixmap)
+
+    def _on_avatar_loaded(self, key, pixmap: QPixmap):
+        if self._photo is not None and key[0] == self._photo.id:
+            self._icon_label.setPixmap(pixmap)
 
     def set_selected(self, status):
         if self._selected == bool(status):
@@ -156,6 +352,10 @@ class TelegramListWidgetItem(KitLayoutButton):
         if status:
             self.selected.emit(str(self._chat_id))
 
+    def set_checked(self, status):
+        self._selected = bool(status)
+        self.setChecked(self._selected)
+
 
 class LastMessageWidget(KitHBoxLayout):
     def __init__(self, tm, manager):
@@ -217,6 +417,6 @@ class LastMessageWidget(KitHBoxLayout):
         self._text_label.setText(text[:80])
         if isinstance(icon, tg.Minithumbnail):
             self._icon_label.show()
-            self._icon_label.setPixmap(QPixmap(self._manager.load_minithumbnail(icon)))
+            self._icon_label.setPixmap(self._manager.load_minithumbnail(icon))
         else:
             self._icon_label.hide()
@@ -1,9 +1,13 @@
+import time
+
 from PyQt6 import QtGui
-from PyQt6.QtCore import Qt, pyqtSignal, QPoint
+from PyQt6.QtCore import Qt, pyqtSignal, QPoint, QTimer
 from PyQt6.QtGui import QKeyEvent
 from PyQtUIkit.widgets import *
 
 from src.chat_bubble import TelegramChatBubble
+from src.chat_history import ChatHistoryModel, ChatHistoryView
+from src.prefetcher import MediaPrefetcher
 from src.send_message_dialog import SendMessageDialog, MessageTypeMenu
 from lib import tg
 from src.telegram_manager import TgChat, TelegramManager
@@ -15,23 +19,23 @@ class TelegramChatWidget(KitVBoxLayout):
     sendMessage = pyqtSignal(str)
     jumpRequested = pyqtSignal(object, object)
 
+    # TDLib returns at most 100 messages per request
+    MAX_PAGE_SIZE = 100
+    # A failed history request is repeated after a delay that doubles up to the maximum, ms
+    RETRY_INTERVAL = 1000
+    MAX_RETRY_INTERVAL = 60000
+
     def __init__(self, sm, manager: TelegramManager, chat: TgChat, thread=None, messages=None):
         super().__init__()
         self._sm = sm
 
-        self._bubbles = []
-
         self.spacing = 6
 
-        self._scroll_area = _ScrollArea()
-        self._scroll_area.loadRequested.connect(self.loadRequested.emit)
-        self.addWidget(self._scroll_area, 1)
-
-        self._scroll_layout = _ScrollWidget()
-        self._scroll_layout.spacing = 6
-        self._scroll_layout.padding = 10
-        self._scroll_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
-        self._scroll_area.setWidget(self._scroll_layout)
+        self._model = ChatHistoryModel()
+        self._history = ChatHistoryView(self._create_bubble)
+        self._history.setModel(self._model)
+        self._history.loadRequested.connect(self.loadRequested.emit)
+        self.addWidget(self._history, 1)
 
         bottom_layout = KitHBoxLayout()
         self.addWidget(bottom_layout)
@@ -59,12 +63,30 @@ class TelegramChatWidget(KitVBoxLayout):
         self._manager = manager
         self.loading = False
 
-        self._scroll_bar = self._scroll_area.verticalScrollBar()
+        self._prefetcher = MediaPrefetcher(self._manager, self._model, self._history)
+
+        self._scroll_bar = self._history.verticalScrollBar()
         self._scroll_bar.valueChanged.connect(self._on_scroll_bar_value_changed)
 
-        self._messages_to_load = 10
+        # History is requested from the local database first and then from the server. The page grows from
+        # a screenful with the speed of scrolling up, in screens per second
+        self._messages_to_load = 0
+        self._history_from = None
+        self._history_end = False
+        self._scroll_velocity = 0.0
+        self._last_scroll = (time.monotonic(), 0)
         self.loadRequested.connect(self.add_messages_to_load)
 
+        self._retry_interval = TelegramChatWidget.RETRY_INTERVAL
+        self._retry_only_local = False
+        self._retry_timer = QTimer(self)
+        self._retry_timer.setSingleShot(True)
+        self._retry_timer.timeout.connect(self._retry_history)
+
+        # Seconds from the first show to the first received messages
+        self._opened_at = None
+        self.time_to_first_messages = None
+
         if not self._chat.permissions.can_send_basic_messages:
             self._text_edit.hide()
             self._button.hide()
@@ -79,68 +101,104 @@ class TelegramChatWidget(KitVBoxLayout):
                 self.add_message(el)
 
     def show(self) -> None:
-        if self.isHidden():
-            # self._scroll_bar.setValue(self._scroll_bar.maximum())
-            self.check_if_need_to_load()
+        if not self.isHidden():
+            return
+        # self._scroll_bar.setValue(self._scroll_bar.maximum())
         super().show()
+        # The view has its real size only once it is shown. Until the messages fill it, the view requests
+        # more with loadRequested after every layout
+        if self._opened_at is None:
+            self._opened_at = time.perf_counter()
+            self._messages_to_load = self._page_size()
+        self.check_if_need_to_load()
 
     def _delete_messages(self, chat_id, message_ids):
         if chat_id == self._chat.id:
-            self._delete_bubbles(message_ids)
+            self._model.remove_messages(message_ids)
 
     def _sending_document(self, doc_type):
         dialog = SendMessageDialog(self, self._sm, self._chat, self._text_edit.toPlainText(), doc_type)
         dialog.exec()
 
     def check_if_need_to_load(self):
-        if self.loading:
+        if self.loading or self._history_end:
             return
-        if len(self._bubbles) < self._messages_to_load:
-            first_message = None if self._chat.first_message is None else self._chat.first_message.id
-            if isinstance(self._chat.type, tg.ChatTypeSupergroup) and self._chat.type.is_channel and self._thread:
-                tg.getMessageThreadHistory(self._chat.id, self._thread, from_message_id=first_message, limit=10)
-            else:
-                tg.getChatHistory(self._chat.id, from_message_id=first_message, limit=10)
-            self.loading = True
+        if self._model.rowCount() < self._messages_to_load:
+            self._history_from = self._model.message(0).id if self._model.rowCount() else None
+            self._request_history(only_local=True)
 
-    def _on_scroll_bar_value_changed(self):
-        el = None
-        for el in self._bubbles:
-            if not (0 < el.y() - self._scroll_bar.value() + el.height() < self.height()):
-                break
-        if el is not None:
-            el.set_read()
+    def _request_history(self, only_local):
+        self._manager.load_history(self._chat, self._thread, self._history_from, self._page_size(), only_local)
+        self.loading = True
+
+    def history_loaded(self, count, only_local):
+        self.loading = False
+        self._retry_interval = TelegramChatWidget.RETRY_INTERVAL
+        if count and self.time_to_first_messages is None and self._opened_at is not None:
+            self.time_to_first_messages = time.perf_counter() - self._opened_at
+        if only_local:
+            # Messages from the local database are already shown, the same page is refreshed from the server
+            self._request_history(only_local=False)
+            return
+        if count == 0:
+            self._history_end = True
+        self.check_if_need_to_load()
+
+    def history_failed(self, only_local):
+        # The end of the history is not known, the same page is requested again later
+        self.loading = False
+        self._retry_only_local = only_local
+        self._retry_timer.start(self._retry_interval)
+        self._retry_interval = min(self._retry_interval * 2, TelegramChatWidget.MAX_RETRY_INTERVAL)
+
+    def _retry_history(self):
+        if self.loading or self._history_end:
+            return
+        self._request_history(self._retry_only_local)
+
+    def _page_size(self):
+        return min(TelegramChatWidget.MAX_PAGE_SIZE,
+                   int(self._history.rows_per_screen() * (1 + self._scroll_velocity)))
+
+    def _on_scroll_bar_value_changed(self, value):
+        if (bubble := self._history.last_visible_bubble()) is not None:
+            bubble.set_read()
+
+        now = time.monotonic()
+        last_time, last_value = self._last_scroll
+        self._last_scroll = (now, value)
+        if now - last_time > 0.5:
+            self._scroll_velocity = 0.0
+        elif now > last_time and value < last_value:
+            velocity = (last_value - value) / (now - last_time) / max(1, self._history.viewport().height())
+            self._scroll_velocity = 0.7 * self._scroll_velocity + 0.3 * velocity
 
     def add_messages_to_load(self):
-        self._messages_to_load = self._chat.message_count() + 10
+        self._messages_to_load = self._model.rowCount() + self._page_size()
         self.check_if_need_to_load()
 
     def add_message(self, message: tg.Message):
-        self.add_bubble(message)
+        self._model.append_message(message)
 
     def insert_message(self, message: tg.Message):
-        self.insert_bubble(message)
+        self._model.insert_message(message)
 
-    def insert_bubble(self, message: tg.Message):
+    def _create_bubble(self, message: tg.Message):
         bubble = TelegramChatBubble(message, self._manager)
         bubble.jumpRequested.connect(self.jumpRequested.emit)
-        bubble.set_max_width(int(self.width() * 0.8))
+        bubble.set_max_width(self._bubble_width())
         if isinstance(self._chat.type, tg.ChatTypePrivate):
             bubble.hide_sender()
-        self._insert_bubble(bubble)
+        return bubble
 
-    def add_bubble(self, message: tg.Message, *args):
-        bubble = TelegramChatBubble(message, self._manager)
-        bubble.jumpRequested.connect(self.jumpRequested.emit)
-        bubble.set_max_width(int(self.width() * 0.8))
-        if isinstance(self._chat.type, tg.ChatTypePrivate):
-            bubble.hide_sender()
-        self._add_buble(bubble)
+    def _bubble_width(self):
+        return min(1000, int(self.width() * 0.8))
 
     def resizeEvent(self, a0: QtGui.QResizeEvent) -> None:
         super().resizeEvent(a0)
-        for el in self._bubbles:
-            el.set_max_width(min(1000, int(self.width() * 0.8)))
+        self._prefetcher.photo_width = self._bubble_width()
+        for el in self._history.bubbles():
+            el.set_max_width(self._bubble_width())
 
     def send_message(self):
         if not (text := self._text_edit.toPlainText()):
@@ -156,24 +214,6 @@ class TelegramChatWidget(KitVBoxLayout):
         if menu.selected_type:
             self.sendMessageRequested.emit(menu.selected_type)
 
-    def _add_buble(self, bubble):
-        self._scroll_layout.addWidget(bubble)
-        self._bubbles.append(bubble)
-
-    def _insert_bubble(self, bubble):
-        self._scroll_layout.insertWidget(0, bubble)
-        self._bubbles.insert(0, bubble)
-
-    def _delete_bubbles(self, message_ids):
-        message_ids = set(message_ids)
-        i = 0
-        while i < len(self._bubbles):
-            if self._bubbles[i]._message.id in message_ids:
-                self._bubbles[i].setParent(None)
-                self._bubbles.pop(i)
-
-            i += 1
-
 
 class ChatInputArea(KitTextEdit):
     returnPressed = pyqtSignal()
@@ -196,40 +236,3 @@ class ChatInputArea(KitTextEdit):
             self.returnPressed.emit()
         else:
             super().keyPressEvent(e)
-
-
-class _ScrollArea(KitScrollArea):
-    loadRequested = pyqtSignal()
-
-    def __init__(self):
-        super().__init__()
-        self._last_pos = 0
-        self._last_max = 0
-        self.verticalScrollBar().valueChanged.connect(self._on_scrolled)
-
-    def setWidget(self, w: '_ScrollWidget') -> None:
-        super().setWidget(w)
-        w.resized.connect(self._on_resized)
-
-    def _on_scrolled(self, pos):
-        if pos < 50:
-            self.loadRequested.emit()
-
-    def _on_resized(self) -> None:
-        self._last_pos = self.verticalScrollBar().value()
-        if self._last_pos > self._last_max - 30:
-            self.verticalScrollBar().setValue(self.verticalScrollBar().maximum())
-        # elif self._last_pos < 50:
-        else:
-            self.verticalScrollBar().setValue(self.verticalScrollBar().maximum() -
-                                              self._last_max + self._last_pos)
-
-        self._last_max = self.verticalScrollBar().maximum()
-
-
-class _ScrollWidget(KitVBoxLayout):
-    resized = pyqtSignal()
-
-    def resizeEvent(self, a0) -> None:
-        super().resizeEvent(a0)
-        self.resized.emit()
@@ -0,0 +1,149 @@
+from PyQt6.QtCore import QObject, QTimer
+
+from lib import tg
+from src.file_change import FileChange
+
+
+class DownloadScheduler(QObject):
+    # Every file is downloaded once with the highest priority of the widgets that need it. Only MAX_ACTIVE files are
+    # downloaded at the same time, the rest wait in the queue. A download is cancelled when no widget needs it anymore,
+    # and paused when a file with a higher priority is waiting. TDLib keeps the downloaded part of paused files
+    USER = 4
+    VISIBLE = 3
+    NEAR = 2
+    PREFETCH = 1
+
+    # TDLib priorities, from 1 to 32
+    TDLIB_PRIORITIES = {USER: 32, VISIBLE: 24, NEAR: 16, PREFETCH: 1}
+    MAX_ACTIVE = 4
+    # Owner of the downloads started by the user, they run until completed or cancelled with cancel(),
+    # also when the widget that started them is hidden or destroyed
+    _USER_OWNER = 0
+
+    def __init__(self, manager):
+        super().__init__()
+        self._manager = manager
+        # file id -> {owner id: priority}
+        self._requests: dict[int: dict[int: int]] = dict()
+        self._active: dict[int: int] = dict()
+        self._started: set[int] = set()
+        self._owners: dict[int: set[int]] = dict()
+        self._start_pending = False
+
+        self.completed = 0
+        self.cancelled = 0
+        self.paused = 0
+
+    def queue_depth(self) -> int:
+        return len(self._requests) - len(self._active)
+
+    def active_count(self) -> int:
+        return len(self._active)
+
+    def request(self, file: tg.File, owner: QObject, priority: int = VISIBLE):
+        # Requests the file with a priority, or changes the priority of the owner's request.
+        # The request is cancelled with release() or when the owner is destroyed, except for USER requests
+        # The widget's file may be older than the latest update
+        file = self._manager.get_file(file)
+        if file.local.is_downloading_completed or not file.local.can_be_downloaded:
+            return
+        if priority == DownloadScheduler.USER:
+            owner_id = DownloadScheduler._USER_OWNER
+        else:
+            owner_id = id(owner)
+            if owner_id not in self._owners:
+                self._owners[owner_id] = set()
+                owner.destroyed.connect(lambda: self._release_owner(owner_id))
+            self._owners[owner_id].add(file.id)
+
+        requests = self._requests.setdefault(file.id, dict())
+        if requests.get(owner_id) == priority:
+            return
+        requests[owner_id] = priority
+        if file.id in self._active and self._active[file.id] != (priority := max(requests.values())):
+            self._active[file.id] = priority
+            self._download(file.id, priority)
+        self._schedule_start()
+
+    def release(self, file_id: int, owner: QObject):
+        if (owner_files := self._owners.get(id(owner))) is not None:
+            owner_files.discard(file_id)
+        self._release(file_id, id(owner))
+
+    def cancel(self, file_id: int):
+        # Cancels the download started by the user, the file is still downloaded while widgets need it
+        self._release(file_id, DownloadScheduler._USER_OWNER)
+
+    def _release(self, file_id: int, owner_id: int):
+        if (requests := self._requests.get(file_id)) is None or requests.pop(owner_id, None) is None:
+            return
+        if requests:
+            return
+        self._requests.pop(file_id)
+        if self._active.pop(file_id, None) is not None:
+            self._started.discard(file_id)
+            self.cancelled += 1
+            tg.cancelDownloadFile(file_id, False)
+            self._schedule_start()
+
+    def _release_owner(self, owner_id: int):
+        for file_id in self._owners.pop(owner_id, ()):
+            self._release(file_id, owner_id)
+
+    def _schedule_start(self):
+        # Downloads are started once the widgets have made all their changes, so a list that is scrolled
+        # does not start and cancel the files of the rows that have just been replaced
+        if not self._start_pending:
+            self._start_pending = True
+            QTimer.singleShot(0, self._start)
+
+    def _start(self):
+        self._start_pending = False
+        while len(self._requests) > len(self._active):
+            file_id, priority = max(((file_id, max(requests.values())) for file_id, requests in self._requests.items()
+                                     if file_id not in self._active), key=lambda el: el[1])
+            if len(self._active) >= DownloadScheduler.MAX_ACTIVE:
+                lowest = min(self._active, key=self._active.get)
+                if self._active[lowest] >= priority:
+                    return
+                self._active.pop(lowest)
+                self._started.discard(lowest)
+                self.paused += 1
+                tg.cancelDownloadFile(lowest, False)
+            self._active[file_id] = priority
+            self._download(file_id, priority)
+
+    def _download(self, file_id: int, priority: int):
+        request = tg.downloadFile(file_id, DownloadScheduler.TDLIB_PRIORITIES[priority])
+        request.add_done_callback(self._on_download_response)
+
+    def _on_download_response(self, request):
+        # Called in the client thread. TDLib answers with the file, and does not send updateFile for a file that is
+        # already downloaded, so the response completes the request through TelegramManager.updateFile
+        if request.exception() is None:
+            self._manager.merge_file(request.result())
+
+    def on_file_updated(self, file: tg.File, mask: int):
+        if mask == FileChange.PROGRESS and file.id in self._started:
+            return
+        if file.id not in self._active:
+            if file.local.is_downloading_completed and file.id in self._requests:
+                self._remove(file.id)
+            return
+        if file.local.is_downloading_active:
+            self._started.add(file.id)
+            return
+        if not file.local.is_downloading_completed and file.id not in self._started:
+            return
+        # Completed, or stopped after it was started
+        self._active.pop(file.id)
+        self._started.discard(file.id)
+        if file.local.is_downloading_completed:
+            self.completed += 1
+        self._remove(file.id)
+        self._schedule_start()
+
+    def _remove(self, file_id: int):
+        for owner_id in self._requests.pop(file_id, dict()):
+            if (owner_files := self._owners.get(owner_id)) is not None:
+                owner_files.discard(file_id)
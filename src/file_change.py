@@ -0,0 +1,30 @@
+class FileChange:
+    # Bits of the change mask of TelegramManager.updateFile, computed from the fields tg.update_object reports
+    PROGRESS = 1
+    # Downloading or uploading started or stopped
+    TRANSFER = 2
+    COMPLETED = 4
+    PATH = 8
+    OTHER = 16
+    ALL = PROGRESS | TRANSFER | COMPLETED | PATH | OTHER
+
+    FIELDS = {
+        'size': PROGRESS,
+        'expected_size': PROGRESS,
+        'local.download_offset': PROGRESS,
+        'local.downloaded_prefix_size': PROGRESS,
+        'local.downloaded_size': PROGRESS,
+        'remote.uploaded_size': PROGRESS,
+        'local.is_downloading_active': TRANSFER,
+        'remote.is_uploading_active': TRANSFER,
+        'local.is_downloading_completed': COMPLETED,
+        'remote.is_uploading_completed': COMPLETED,
+        'local.path': PATH,
+    }
+
+    @staticmethod
+    def mask(changed: list[str]) -> int:
+        mask = 0
+        for el in changed:
+            mask |= FileChange.FIELDS.get(el, FileChange.OTHER)
+        return mask
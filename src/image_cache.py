@@ -0,0 +1,108 @@
+import weakref
+from collections import OrderedDict
+from typing import Callable
+
+from PyQt6 import sip
+from PyQt6.QtCore import QObject, QRunnable, QSize, QThreadPool, Qt, pyqtSignal
+from PyQt6.QtGui import QImage, QImageReader, QPixmap
+
+
+class _DecodeTask(QRunnable):
+    def __init__(self, cache: 'ImageCache', key: tuple, dpr: float, path: str, size: QSize,
+                 mode: Qt.AspectRatioMode):
+        super().__init__()
+        self._cache = cache
+        self._key = key
+        self._dpr = dpr
+        self._path = path
+        self._size = size
+        self._mode = mode
+
+    def run(self) -> None:
+        # QImageReader decodes JPEG directly at the reduced size, so the full image is never held in memory
+        reader = QImageReader(self._path)
+        reader.setAutoTransform(True)
+        if (source := reader.size()).isValid() and self._size.isValid():
+            size = source.scaled(self._size, self._mode)
+            # Images that keep the aspect ratio are never enlarged
+            if self._mode != Qt.AspectRatioMode.KeepAspectRatio or size.width() < source.width():
+                reader.setScaledSize(size)
+        self._cache._decoded.emit(self._key, self._dpr, reader.read())
+
+
+class ImageCache(QObject):
+    # Pre-scaled pixmaps of downloaded files. Images are decoded in a thread pool, converted to pixmaps in the GUI
+    # thread and kept until the cache is larger than the budget, least recently used first.
+    # Keys are tuples starting with the file id, so the other sizes of the same file can be found
+    _decoded = pyqtSignal(object, float, QImage)
+
+    def __init__(self, budget: int, threads: int = 2):
+        super().__init__()
+        self._budget = budget
+        self._bytes = 0
+        self._pixmaps: OrderedDict[tuple: QPixmap] = OrderedDict()
+        self._file_keys: dict[int: set[tuple]] = dict()
+        # Callbacks waiting for a decode, bound methods are kept as weak references
+        self._waiters: dict[tuple: list] = dict()
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(threads)
+        self._decoded.connect(self._on_decoded)
+
+    @property
+    def bytes(self):
+        return self._bytes
+
+    def variants(self, file_id: int) -> list[tuple[tuple, QPixmap]]:
+        return [(key, self._pixmaps[key]) for key in self._file_keys.get(file_id, ())]
+
+    def get(self, key: tuple) -> QPixmap | None:
+        if (pixmap := self._pixmaps.get(key)) is not None:
+            self._pixmaps.move_to_end(key)
+        return pixmap
+
+    def load(self, key: tuple, path: str, size: QSize, func: Callable[[tuple, QPixmap], None] | None,
+             mode=Qt.AspectRatioMode.IgnoreAspectRatio, dpr: float = 1) -> QPixmap | None:
+        # Returns the cached pixmap, otherwise func(key, pixmap), if given, is called when the image is decoded.
+        # size is in logical pixels, the image is decoded for the device pixel ratio
+        if (pixmap := self.get(key)) is not None:
+            return pixmap
+        if key not in self._waiters:
+            self._waiters[key] = []
+            self._pool.start(_DecodeTask(self, key, dpr, path, size * dpr, mode))
+        if func is not None:
+            self._waiters[key].append(weakref.WeakMethod(func) if hasattr(func, '__self__') else func)
+        return None
+
+    def _on_decoded(self, key, dpr: float, image: QImage):
+        if image.isNull():
+            self._waiters.pop(key, None)
+            return
+        pixmap = QPixmap.fromImage(image)
+        pixmap.setDevicePixelRatio(dpr)
+        self._remove(key)
+        self._pixmaps[key] = pixmap
+        self._file_keys.setdefault(key[0], set()).add(key)
+        self._bytes += ImageCache._size(pixmap)
+        while self._bytes > self._budget and len(self._pixmaps) > 1:
+            self._remove(next(iter(self._pixmaps)))
+
+        for ref in self._waiters.pop(key, ()):
+            if isinstance(ref, weakref.WeakMethod):
+                if (func := ref()) is None or isinstance(func.__self__, QObject) and sip.isdeleted(func.__self__):
+                    continue
+            else:
+                func = ref
+            func(key, pixmap)
+
+    def _remove(self, key: tuple):
+        if (pixmap := self._pixmaps.pop(key, None)) is None:
+            return
+        self._bytes -= ImageCache._size(pixmap)
+        keys = self._file_keys[key[0]]
+        keys.discard(key)
+        if not keys:
+            self._file_keys.pop(key[0])
+
+    @staticmethod
+    def _size(pixmap: QPixmap) -> int:
+        return pixmap.width() * pixmap.height() * pixmap.depth() // 8
@@ -0,0 +1,60 @@
+from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import QListView, QAbstractItemView, QFrame
+from PyQtUIkit.core.properties import PaletteProperty
+from PyQtUIkit.widgets._widget import _KitWidget
+
+
+# Rows are covered by widgets that exist only for the visible rows
+class KitWidgetListView(QListView, _KitWidget):
+    main_palette = PaletteProperty('main_palette', 'Main')
+
+    def __init__(self):
+        super().__init__()
+        self.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.setResizeMode(QListView.ResizeMode.Adjust)
+        self.setFrameShape(QFrame.Shape.NoFrame)
+
+    def widgets(self):
+        return []
+
+    def _set_tm(self, tm):
+        super()._set_tm(tm)
+        for el in self.widgets():
+            if hasattr(el, '_set_tm'):
+                el._set_tm(tm)
+
+    def _apply_theme(self):
+        if not self._tm or not self._tm.active:
+            return
+        self.setStyleSheet(f"""
+QListView {{
+    color: {self.main_palette.text};
+    background-color: {self.main_palette.main};
+    border: none;
+}}
+QListView QScrollBar:vertical {{
+    background: {self.main_palette.main};
+    width: 12px;
+    margin: 0px;
+}}
+QListView QScrollBar::handle::vertical {{
+    background-color: {self.border_palette.main};
+    margin: 2px 2px 2px 6px;
+    border-radius: 2px;
+    min-height: 20px;
+}}
+QListView QScrollBar::handle::vertical:hover {{
+    margin: 2px;
+    border-radius: 4px;
+}}
+QListView QScrollBar::sub-page, QScrollBar::add-page {{
+    background: none;
+}}
+QListView QScrollBar::sub-line, QScrollBar::add-line {{
+    background: none;
+    height: 0px;
+}}
+""")
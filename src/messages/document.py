@@ -7,6 +7,7 @@ from PyQt6.QtWidgets import QFileDialog
 from PyQtUIkit.widgets import *
 
 from lib import tg
+from src.download_scheduler import DownloadScheduler
 
 
 class DocumentWidget(KitHBoxLayout):
@@ -18,6 +19,8 @@ class DocumentWidget(KitHBoxLayout):
         self._tm = tm
         self._document = document
         self._manager = manager
+        # Bubbles are rebuilt from stored messages, their files keep the state they were received with
+        self._document.document = manager.get_file(self._document.document)
         self._path = ''
         self._type = DocumentWidget.TYPE_DOCUMENT
         self._importing = False
@@ -62,13 +65,13 @@ class DocumentWidget(KitHBoxLayout):
                 self._button.setFixedSize(32, 32)
                 self._button.clicked.connect(self.save_project)
 
-        self._manager.updateFile.connect(self._on_file_updated)
+        self._manager.subscribe_file(self._document.document.id, self._on_file_updated)
 
     def download(self):
         if not self._document.document.local.is_downloading_completed and \
                 not self._document.document.local.is_downloading_active:
             self._button.icon = 'solid-download'
-            tg.downloadFile(self._document.document.id, 1)
+            self._manager.downloads.request(self._document.document, self, DownloadScheduler.USER)
 
     def save(self, path=None):
         if not self._document.document.local.is_downloading_completed:
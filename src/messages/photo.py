@@ -1,42 +1,142 @@
 from PyQt6 import QtGui
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QPixmap
+from PyQt6.QtCore import Qt, QSize, QUrl
+from PyQt6.QtGui import QPixmap, QDesktopServices
 from PyQt6.QtWidgets import QLabel
 
 from lib import tg
+from src.download_scheduler import DownloadScheduler
 
 
 class PhotoLabel(QLabel):
     MAX_HEIGHT = 600
+    # Photos are decoded for widths rounded up to this step, so resizing the window reuses the decoded images
+    WIDTH_STEP = 100
 
-    def __init__(self, tm, file: tg.File):
+    def __init__(self, tm, manager, photo: tg.Photo):
         super().__init__()
         self._tm = tm
-        self._photo = file
-        self._pixmap = None
-        if self._photo.local.is_downloading_completed:
-            self._pixmap = QPixmap(self._photo.local.path)
-            self.resize_pixmap()
-        else:
-            tg.downloadFile(self._photo.id, 1)
+        self._manager = manager
+        self._photo = photo
+        # The minithumbnail is shown until the size closest to the display width is downloaded.
+        # The original is downloaded only when it is opened
+        self._size = None
+        self._file = None
+        self._shown = None
+        self._original = None
+        self._open_requested = False
+        self._download_priority = None
 
     def update_image(self, image: tg.File):
-        if isinstance(self._photo, tg.File) and image.id == self._photo.id:
-            self._photo = image
-            if self._photo.local.is_downloading_completed:
-                self._pixmap = QPixmap(self._photo.local.path)
+        if isinstance(self._file, tg.File) and image.id == self._file.id:
+            self._file = image
+            if self._file.local.is_downloading_completed:
                 self.resize_pixmap()
+        if isinstance(self._original, tg.File) and image.id == self._original.id:
+            self._original = image
+            if image.local.is_downloading_completed and self._open_requested:
+                self._open_original()
+
+    @staticmethod
+    def display_size(photo: tg.Photo, max_width: int) -> QSize:
+        largest = photo.sizes[-1]
+        size = QSize(largest.width, largest.height)
+        if size.width() > max_width or size.height() > PhotoLabel.MAX_HEIGHT:
+            size = size.scaled(QSize(max_width, PhotoLabel.MAX_HEIGHT), Qt.AspectRatioMode.KeepAspectRatio)
+        return size
+
+    @staticmethod
+    def best_size(photo: tg.Photo, width: int) -> tg.PhotoSize:
+        # The smallest size that is not narrower than the display
+        return next((el for el in photo.sizes if el.width >= width), photo.sizes[-1])
+
+    @staticmethod
+    def load(manager, file: tg.File, max_width: int, dpr: float, func) -> QPixmap | None:
+        width = -(-max_width // PhotoLabel.WIDTH_STEP) * PhotoLabel.WIDTH_STEP
+        return manager.photo_cache.load((file.id, width), file.local.path, QSize(width, PhotoLabel.MAX_HEIGHT), func,
+                                        Qt.AspectRatioMode.KeepAspectRatio, dpr)
+
+    def _select_size(self, width: int):
+        # Only a larger size replaces the selected one
+        size = PhotoLabel.best_size(self._photo, width)
+        if self._size is not None and size.width <= self._size.width:
+            return
+        if self._file is not None:
+            self._manager.unsubscribe_file(self._file.id, self.update_image)
+            self._manager.downloads.release(self._file.id, self)
+        self._size = size
+        # The file in the message keeps the state it was received with
+        self._file = self._manager.get_file(size.photo)
+        self._manager.subscribe_file(self._file.id, self.update_image)
+        self._request_download()
+
+    def set_download_priority(self, priority: int | None):
+        # Set by the chat history from the position of the bubble, None when the bubble is not shown
+        if priority != self._download_priority:
+            self._download_priority = priority
+            self._request_download()
+
+    def _request_download(self):
+        if self._file is None:
+            return
+        if self._download_priority is None:
+            self._manager.downloads.release(self._file.id, self)
+        else:
+            self._manager.downloads.request(self._file, self, self._download_priority)
 
     def resize_pixmap(self):
-        if isinstance(self._pixmap, QPixmap):
-            pixmap = self._pixmap
-            if self._pixmap.width() > self.maximumWidth() or self._pixmap.height() > self.MAX_HEIGHT:
-                pixmap = self._pixmap.scaled(self.maximumWidth(), PhotoLabel.MAX_HEIGHT,
-                                             Qt.AspectRatioMode.KeepAspectRatio,
-                                             Qt.TransformationMode.SmoothTransformation)
-            self.setPixmap(pixmap)
+        if not self._photo.sizes:
+            return
+        max_width = min(self.maximumWidth(), 10000)
+        display_size = PhotoLabel.display_size(self._photo, max_width)
+        self._select_size(int(display_size.width() * self.devicePixelRatioF()))
+
+        if not self._file.local.is_downloading_completed:
+            if self._shown is None and self._photo.minithumbnail is not None:
+                self._set_pixmap(self._manager.load_minithumbnail(self._photo.minithumbnail), display_size)
+            return
+
+        if (pixmap := PhotoLabel.load(self._manager, self._file, max_width, self.devicePixelRatioF(),
+                                      self._on_loaded)) is None:
+            # Until the image is decoded for this width, the nearest decoded size is shown
+            if not (variants := self._manager.photo_cache.variants(self._file.id)):
+                return
+            pixmap = min(variants, key=lambda el: abs(el[0][1] - max_width))[1]
+        self._set_pixmap(pixmap, display_size)
+
+    def _on_loaded(self, key, pixmap: QPixmap):
+        if key[0] == self._file.id:
+            self.resize_pixmap()
+
+    def _set_pixmap(self, pixmap: QPixmap, size: QSize):
+        if self._shown == (pixmap.cacheKey(), size):
+            return
+        self._shown = pixmap.cacheKey(), size
+        dpr = self.devicePixelRatioF()
+        if pixmap.size() != size * dpr:
+            # The pixmap is either a decoded image close to the display size or a tiny minithumbnail,
+            # so scaling it is cheap
+            pixmap = pixmap.scaled(size * dpr, Qt.AspectRatioMode.IgnoreAspectRatio,
+                                   Qt.TransformationMode.SmoothTransformation)
+            pixmap.setDevicePixelRatio(dpr)
+        self.setPixmap(pixmap)
+
+    def mouseDoubleClickEvent(self, a0: QtGui.QMouseEvent) -> None:
+        super().mouseDoubleClickEvent(a0)
+        if not self._photo.sizes:
+            return
+        if self._original is None:
+            self._original = self._manager.get_file(self._photo.sizes[-1].photo)
+            self._manager.subscribe_file(self._original.id, self.update_image)
+        if self._original.local.is_downloading_completed:
+            self._open_original()
+        else:
+            self._open_requested = True
+            self._manager.downloads.request(self._original, self, DownloadScheduler.USER)
+
+    def _open_original(self):
+        self._open_requested = False
+        QDesktopServices.openUrl(QUrl.fromLocalFile(self._original.local.path))
 
     def resizeEvent(self, a0: QtGui.QResizeEvent) -> None:
         super().resizeEvent(a0)
         self.resize_pixmap()
-
@@ -1,11 +1,10 @@
-import os.path
-
-import pylottie
-from PyQt6.QtCore import QSize
-from PyQt6.QtGui import QMovie
+from PyQt6.QtCore import QSize, Qt
+from PyQt6.QtGui import QMovie, QPixmap
 from PyQt6.QtWidgets import QLabel
 
 from lib import tg
+from src.download_scheduler import DownloadScheduler
+from src.sticker_converter import StickerConverter
 
 
 class StickerWidget(QLabel):
@@ -15,39 +14,97 @@ class StickerWidget(QLabel):
         super().__init__()
         self._manager = manager
         self._sticker = sticker
+        # Bubbles are rebuilt from stored messages, their files keep the state they were received with
+        self._sticker.sticker = manager.get_file(self._sticker.sticker)
+        if self._sticker.thumbnail is not None:
+            self._sticker.thumbnail.file = manager.get_file(self._sticker.thumbnail.file)
         self._movie = None
+        self._download_priority = None
+
+        # The thumbnail is shown until the GIF is ready
+        if (thumbnail := self._sticker.thumbnail) is not None:
+            if thumbnail.file.local.is_downloading_completed:
+                self._set_thumbnail(thumbnail.file)
+            else:
+                self._manager.subscribe_file(thumbnail.file.id, self._set_thumbnail)
+
         if self._sticker.sticker.local.is_downloading_completed:
             self._activate()
-        else:
-            tg.downloadFile(self._sticker.sticker.id, 1)
         self.setStyleSheet("border: none;")
 
     def resizeEvent(self, event) -> None:
         super().resizeEvent(event)
         self._resize()
 
+    def showEvent(self, a0) -> None:
+        super().showEvent(a0)
+        size = self._size()
+        self._manager.sticker_cache.set_priority(self._sticker, size.width(), size.height(), StickerConverter.VISIBLE)
+
+    def hideEvent(self, a0) -> None:
+        super().hideEvent(a0)
+        size = self._size()
+        self._manager.sticker_cache.set_priority(self._sticker, size.width(), size.height(), StickerConverter.HIDDEN)
+
+    def _size(self):
+        return StickerWidget.display_size(self._sticker)
+
+    @staticmethod
+    def display_size(sticker: tg.Sticker) -> QSize:
+        width = min(200, sticker.width)
+        height = min(StickerWidget.MAX_HEIGHT, width * sticker.height // sticker.width)
+        return QSize(width, height)
+
     def _resize(self):
-        print(self._movie)
         if not isinstance(self._movie, QMovie):
             return
-        width = min(200, self._sticker.width)
-        height = min(StickerWidget.MAX_HEIGHT, width * self._sticker.height // self._sticker.width)
-        self._movie.setScaledSize(QSize(width, height))
+        self._movie.setScaledSize(self._size())
+
+    def _set_thumbnail(self, file: tg.File):
+        if not file.local.is_downloading_completed or self._movie is not None:
+            return
+        pixmap = QPixmap(file.local.path)
+        if not pixmap.isNull():
+            self.setPixmap(pixmap.scaled(self._size(), Qt.AspectRatioMode.KeepAspectRatio,
+                                         Qt.TransformationMode.SmoothTransformation))
 
     def download(self):
-        if not self._sticker.sticker.local.is_downloading_completed and \
-                not self._sticker.sticker.local.is_downloading_active:
-            tg.downloadFile(self._sticker.sticker.id, 1)
+        self._manager.downloads.request(self._sticker.sticker, self, DownloadScheduler.USER)
+
+    def set_download_priority(self, priority: int | None):
+        # Set by the chat history from the position of the bubble, None when the bubble is not shown
+        if priority == self._download_priority:
+            return
+        self._download_priority = priority
+        files = [self._sticker.sticker]
+        if self._sticker.thumbnail is not None:
+            files.append(self._sticker.thumbnail.file)
+        for file in files:
+            if priority is None:
+                self._manager.downloads.release(file.id, self)
+            else:
+                self._manager.downloads.request(file, self, priority)
 
     def on_downloaded(self, file: tg.File):
         if file.id == self._sticker.sticker.id:
             self._sticker.sticker = file
-            self._activate()
+            if file.local.is_downloading_completed and self._movie is None:
+                self._activate()
 
     def _activate(self):
-        path = f"{self._manager.temp_path}/{os.path.basename(self._sticker.sticker.local.path)[:-4]}.gif"
-        if not os .path.isfile(path):
-            pylottie.convertMultLottie2GIF([self._sticker.sticker.local.path], [path])
+        size = self._size()
+        if (path := self._manager.sticker_cache.get(self._sticker, size.width(), size.height())) is not None:
+            self._set_movie(path)
+        else:
+            self._manager.sticker_cache.subscribe(self._sticker, size.width(), size.height(), self._on_converted)
+            self._manager.sticker_cache.convert(self._sticker, size.width(), size.height(),
+                                                StickerConverter.VISIBLE if self.isVisible() else StickerConverter.HIDDEN)
+
+    def _on_converted(self, path: str):
+        if self._movie is None:
+            self._set_movie(path)
+
+    def _set_movie(self, path: str):
         self._movie = QMovie(path)
         self.setMovie(self._movie)
         self._movie.start()
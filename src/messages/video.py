@@ -3,15 +3,19 @@ from PyQt6.QtMultimedia import QMediaPlayer, QAudioOutput
 from PyQt6.QtMultimediaWidgets import QVideoWidget
 
 from lib import tg
+from src.download_scheduler import DownloadScheduler
 
 
 class VideoPlayer(QVideoWidget):
     MAX_HEIGHT = 600
 
-    def __init__(self, tm, video: tg.Video):
+    def __init__(self, tm, manager, video: tg.Video):
         super().__init__()
         self._tm = tm
+        self._manager = manager
         self._video = video
+        # Bubbles are rebuilt from stored messages, their files keep the state they were received with
+        self._video.video = manager.get_file(self._video.video)
 
         self.media_player = QMediaPlayer()
         self.media_player.setVideoOutput(self)
@@ -32,7 +36,7 @@ class VideoPlayer(QVideoWidget):
 
     def download(self):
         if not self._video.video.local.is_downloading_completed and not self._video.video.local.is_downloading_active:
-            tg.downloadFile(self._video.video.id, 1)
+            self._manager.downloads.request(self._video.video, self, DownloadScheduler.USER)
 
     def play(self):
         if self._video.video.local.is_downloading_completed:
@@ -44,6 +48,8 @@ class VideoPlayer(QVideoWidget):
     def on_downloaded(self, video: tg.File):
         if video.id == self._video.video.id:
             self._video.video = video
+            if not video.local.is_downloading_completed:
+                return
             self.media_player.setSource(QUrl.fromLocalFile(self._video.video.local.path))
             # self.media_player.play()
 
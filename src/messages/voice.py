@@ -3,12 +3,18 @@ from PyQt6.QtMultimedia import QMediaPlayer, QAudioOutput
 from PyQtUIkit.widgets import KitIconButton, KitHBoxLayout, KitLabel
 
 from lib import tg
+from src.download_scheduler import DownloadScheduler
 
 
 class VoicePlayer(KitHBoxLayout):
-    def __init__(self, voice_message: tg.VoiceNote):
+    def __init__(self, tm, manager, voice_message: tg.VoiceNote):
         super().__init__()
+        self._tm = tm
+        self._manager = manager
         self._voice = voice_message
+        self._voice.voice = manager.get_file(self._voice.voice)
+        # Playback starts when the download requested by the play button completes, not after a prefetch
+        self._play_requested = False
 
         self.media_player = QMediaPlayer()
         self._audio = QAudioOutput()
@@ -41,7 +47,8 @@ class VoicePlayer(KitHBoxLayout):
             self._button_pause.show()
             self._button_play.hide()
         else:
-            tg.downloadFile(self._voice.voice.id, 1)
+            self._play_requested = True
+            self._manager.downloads.request(self._voice.voice, self, DownloadScheduler.USER)
 
     def pause(self):
         self.media_player.pause()
@@ -51,10 +58,12 @@ class VoicePlayer(KitHBoxLayout):
     def on_downloaded(self, voice: tg.File):
         if self._voice.voice.id == voice.id:
             self._voice.voice = voice
+            if not voice.local.is_downloading_completed:
+                return
             self.media_player.setSource(QUrl.fromLocalFile(self._voice.voice.local.path))
-            self.media_player.play()
-            self._button_pause.show()
-            self._button_play.hide()
+            if self._play_requested:
+                self._play_requested = False
+                self.play()
 
     def _on_media_status_changed(self, status):
         match status:
@@ -0,0 +1,85 @@
+from PyQt6.QtCore import QObject
+
+from lib import tg
+from src.chat_history import ChatHistoryModel, ChatHistoryView
+from src.download_scheduler import DownloadScheduler
+from src.messages.photo import PhotoLabel
+from src.messages.sticker import StickerWidget
+from src.sticker_converter import StickerConverter
+
+
+class MediaPrefetcher(QObject):
+    # Downloads the media of the messages ahead of the scroll direction with a low priority and decodes it into
+    # the caches, so the bubbles show it as soon as they are created
+    COUNT = 10
+
+    def __init__(self, manager, model: ChatHistoryModel, view: ChatHistoryView):
+        super().__init__(view)
+        self._manager = manager
+        self._model = model
+        self._view = view
+        self.photo_width = 0
+
+        self._last_pos = 0
+        self._rows = range(0)
+        # file id -> message content the file belongs to
+        self._files: dict[int: object] = dict()
+        view.verticalScrollBar().valueChanged.connect(self._on_scrolled)
+
+    def _on_scrolled(self, pos):
+        # Scrolling up loads older messages, they are above the viewport
+        visible = self._view.visible_rows()
+        if pos < self._last_pos:
+            rows = range(max(0, visible.start - MediaPrefetcher.COUNT), visible.start)
+        else:
+            rows = range(visible.stop, min(self._model.rowCount(), visible.stop + MediaPrefetcher.COUNT))
+        self._last_pos = pos
+        if rows != self._rows:
+            self._rows = rows
+            self._prefetch()
+
+    def _prefetch(self):
+        files = dict()
+        for row in self._rows:
+            for file, content in self._media(self._model.message(row).content):
+                files[file.id] = file, content
+
+        for file_id in list(self._files):
+            if file_id not in files:
+                self._files.pop(file_id)
+                self._manager.downloads.release(file_id, self)
+                self._manager.unsubscribe_file(file_id, self._on_file_updated)
+        for file_id, (file, content) in files.items():
+            if file_id in self._files:
+                continue
+            # The bubble created later reads the same object, so it sees the prefetched file as downloaded
+            file = self._manager.get_file(file)
+            self._files[file_id] = content
+            if file.local.is_downloading_completed:
+                self._decode(file, content)
+            else:
+                self._manager.subscribe_file(file_id, self._on_file_updated)
+                self._manager.downloads.request(file, self, DownloadScheduler.PREFETCH)
+
+    def _media(self, content):
+        if isinstance(content, tg.MessagePhoto) and content.photo.sizes and self.photo_width:
+            width = PhotoLabel.display_size(content.photo, self.photo_width).width()
+            yield PhotoLabel.best_size(content.photo, int(width * self._view.devicePixelRatioF())).photo, content
+        elif isinstance(content, tg.MessageSticker):
+            yield content.sticker.sticker, content
+        elif isinstance(content, tg.MessageVoiceNote):
+            yield content.voice_note.voice, content
+
+    def _on_file_updated(self, file: tg.File):
+        if file.local.is_downloading_completed and (content := self._files.get(file.id)) is not None:
+            self._decode(file, content)
+
+    def _decode(self, file: tg.File, content):
+        if isinstance(content, tg.MessagePhoto):
+            PhotoLabel.load(self._manager, file, self.photo_width, self._view.devicePixelRatioF(), None)
+        elif isinstance(content, tg.MessageSticker):
+            sticker = content.sticker
+            sticker.sticker = file
+            size = StickerWidget.display_size(sticker)
+            if self._manager.sticker_cache.get(sticker, size.width(), size.height()) is None:
+                self._manager.sticker_cache.convert(sticker, size.width(), size.height(), StickerConverter.HIDDEN)
@@ -0,0 +1,166 @@
+import json
+import os
+import time
+import weakref
+from collections import OrderedDict
+from typing import Callable
+
+from PyQt6.QtCore import QObject, QTimer
+
+from lib import tg
+from src.sticker_converter import StickerConverter
+
+
+class StickerCache(QObject):
+    # Converted stickers on disk, indexed by file unique id and size. The least recently used GIFs are removed
+    # when the cache is larger than the budget. The index is saved next to the files and reused after restart
+
+    DEFAULT_BUDGET = 200 * 1024 * 1024
+    # The index is written to disk at most once in this interval
+    SAVE_INTERVAL = 5000
+
+    def __init__(self, directory: str, budget: int = DEFAULT_BUDGET):
+        super().__init__()
+        self._directory = directory
+        self._budget = budget
+        os.makedirs(directory, exist_ok=True)
+
+        # key -> {'path', 'unique_id', 'width', 'height', 'frames', 'bytes', 'last_access'}, least recently used first
+        self._index: OrderedDict[str: dict] = OrderedDict()
+        self._bytes = 0
+        # key -> (unique id, width, height) of the requests being converted
+        self._converting: dict[str: tuple[str, int, int]] = dict()
+        # key -> methods waiting for the GIF
+        self._subscribers: dict[str: list[weakref.WeakMethod]] = dict()
+        # Evicted GIFs that could not be removed yet
+        self._removed: set[str] = set()
+        self._load()
+
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(StickerCache.SAVE_INTERVAL)
+        self._save_timer.timeout.connect(self.save)
+
+        self._converter = StickerConverter()
+        self._converter.converted.connect(self._on_converted)
+
+    @property
+    def bytes(self):
+        return self._bytes
+
+    @staticmethod
+    def _key(unique_id: str, width: int, height: int):
+        return f"{unique_id}_{width}x{height}"
+
+    def get(self, sticker: tg.Sticker, width: int, height: int) -> str | None:
+        key = StickerCache._key(sticker.sticker.remote.unique_id, width, height)
+        if (entry := self._index.get(key)) is None:
+            return None
+        entry['last_access'] = time.time()
+        self._index.move_to_end(key)
+        self._schedule_save()
+        return entry['path']
+
+    def convert(self, sticker: tg.Sticker, width: int, height: int, priority: int = StickerConverter.VISIBLE):
+        unique_id = sticker.sticker.remote.unique_id
+        key = StickerCache._key(unique_id, width, height)
+        self._converting[key] = unique_id, width, height
+        self._converter.convert(key, sticker.sticker.local.path, f"{self._directory}/{key}.gif",
+                                (width, height), priority)
+
+    def set_priority(self, sticker: tg.Sticker, width: int, height: int, priority: int):
+        self._converter.set_priority(StickerCache._key(sticker.sticker.remote.unique_id, width, height), priority)
+
+    def subscribe(self, sticker: tg.Sticker, width: int, height: int, func: Callable[[str], None]):
+        # func is called once with the path of the GIF. It must be a method of a QObject,
+        # the subscription is released together with the object
+        key = StickerCache._key(sticker.sticker.remote.unique_id, width, height)
+        ref = weakref.WeakMethod(func)
+        self._subscribers.setdefault(key, []).append(ref)
+        func.__self__.destroyed.connect(lambda: self._unsubscribe(key, ref))
+
+    def _unsubscribe(self, key: str, ref: weakref.WeakMethod):
+        lst = self._subscribers.get(key, [])
+        if ref in lst:
+            lst.remove(ref)
+        if not lst:
+            self._subscribers.pop(key, None)
+
+    def set_budget(self, budget: int):
+        self._budget = budget
+        self._evict()
+        self.save()
+
+    def _on_converted(self, key: str, path: str, frames: int):
+        if (request := self._converting.pop(key, None)) is None:
+            return
+        subscribers = self._subscribers.pop(key, [])
+        if frames < 0:
+            # The sticker stays on the thumbnail, the conversion is requested again when it is shown next time
+            print(f"Sticker conversion failed: {key}")
+            return
+        unique_id, width, height = request
+        self._removed.discard(path)
+        if (old := self._index.pop(key, None)) is not None:
+            self._bytes -= old['bytes']
+        self._index[key] = {'path': path, 'unique_id': unique_id, 'width': width, 'height': height,
+                            'frames': frames, 'bytes': os.path.getsize(path), 'last_access': time.time()}
+        self._bytes += self._index[key]['bytes']
+        self._evict(keep=key)
+        self._schedule_save()
+        for ref in subscribers:
+            if (func := ref()) is not None:
+                func(path)
+
+    def _schedule_save(self):
+        if not self._save_timer.isActive():
+            self._save_timer.start()
+
+    def _evict(self, keep: str = None):
+        while self._bytes > self._budget and self._index:
+            key = next(iter(self._index))
+            if key == keep:
+                break
+            entry = self._index.pop(key)
+            self._bytes -= entry['bytes']
+            self._removed.add(entry['path'])
+        self._remove_files()
+
+    def _remove_files(self):
+        # A GIF that is still open in a QMovie can not be removed on Windows. It is removed by the next eviction,
+        # or as a file missing from the index on the next start
+        for path in list(self._removed):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            except OSError:
+                continue
+            self._removed.discard(path)
+
+    def _load(self):
+        try:
+            with open(f"{self._directory}/index.json", encoding='utf-8') as f:
+                entries = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            entries = []
+        for entry in sorted(entries, key=lambda el: el['last_access']):
+            if os.path.isfile(entry['path']):
+                self._index[StickerCache._key(entry['unique_id'], entry['width'], entry['height'])] = entry
+                self._bytes += entry['bytes']
+        paths = {os.path.normpath(entry['path']) for entry in self._index.values()}
+        for name in os.listdir(self._directory):
+            if name.endswith('.gif') and os.path.normpath(path := f"{self._directory}/{name}") not in paths:
+                self._removed.add(path)
+        self._evict()
+
+    def save(self):
+        self._save_timer.stop()
+        with open(path := f"{self._directory}/index.json.part", 'w', encoding='utf-8') as f:
+            json.dump(list(self._index.values()), f)
+        os.replace(path, f"{self._directory}/index.json")
+
+    def shutdown(self):
+        self.save()
+        self._remove_files()
+        self._converter.shutdown()
@@ -0,0 +1,105 @@
+import itertools
+import multiprocessing
+import multiprocessing.util
+import os
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from PyQt6.QtCore import QObject, pyqtSignal
+
+
+def _init_worker():
+    # pylottie renders frames into ./temp, so every worker gets its own working directory. Workers exit through
+    # os._exit(), which skips atexit, the directory is removed by a multiprocessing finalizer instead
+    directory = tempfile.mkdtemp(prefix='lottie')
+    os.chdir(directory)
+    multiprocessing.util.Finalize(None, _remove_worker_directory, args=(directory,), exitpriority=0)
+
+
+def _remove_worker_directory(directory: str):
+    os.chdir(os.path.dirname(directory))
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+def _convert(src: str, dst: str, width: int, height: int) -> int:
+    # Runs in a worker process, returns the number of frames
+    import pylottie
+    from PIL import Image
+
+    images, duration = pylottie.convertLotties2PIL([src])[0]
+    images = [image.resize((width, height), Image.Resampling.LANCZOS) for image in images]
+    shutil.rmtree('temp', ignore_errors=True)
+
+    temp = f"{dst[:-4]}.part.gif"
+    images[0].save(temp, format='GIF', save_all=True, append_images=images[1:],
+                   duration=duration * 1000 / len(images), loop=0, transparency=0, disposal=2)
+    os.replace(temp, dst)
+    return len(images)
+
+
+class StickerConverter(QObject):
+    # Lottie stickers are converted to GIF in worker processes, the most important requests are converted first.
+    # Requests are identified by a key given by the caller, one file may be converted to several sizes
+    # key, path, frame count or -1 when the conversion failed
+    converted = pyqtSignal(str, str, int)
+    _finished = pyqtSignal(str, str, int)
+
+    VISIBLE = 1
+    HIDDEN = 0
+
+    def __init__(self, workers: int = None):
+        super().__init__()
+        self._workers = workers or max(1, min(2, (os.cpu_count() or 2) - 1))
+        self._pool = None
+        self._counter = itertools.count()
+        # key -> (priority, -sequence number, src, dst, size)
+        self._pending: dict[str: tuple[int, int, str, str, tuple[int, int]]] = dict()
+        self._running: dict[str: str] = dict()
+        self._finished.connect(self._on_finished)
+
+    def convert(self, key: str, src: str, dst: str, size: tuple[int, int], priority: int = VISIBLE):
+        if key in self._running:
+            return
+        if key in self._pending:
+            self.set_priority(key, priority)
+            return
+        self._pending[key] = (priority, -next(self._counter), src, dst, size)
+        self._submit()
+
+    def set_priority(self, key: str, priority: int):
+        if (request := self._pending.get(key)) is not None:
+            self._pending[key] = (priority, *request[1:])
+
+    def _submit(self):
+        while self._pending and len(self._running) < self._workers:
+            key = max(self._pending, key=self._pending.get)
+            _, _, src, dst, size = self._pending.pop(key)
+            self._running[key] = dst
+            try:
+                future = self._get_pool().submit(_convert, src, dst, *size)
+            except BrokenProcessPool:
+                # A worker has crashed, the pool is replaced with a new one
+                self._pool = None
+                future = self._get_pool().submit(_convert, src, dst, *size)
+            future.add_done_callback(lambda f, key=key, dst=dst: self._finished.emit(
+                key, dst, -1 if f.cancelled() or f.exception() is not None else f.result()))
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            # Forking a process with running Qt threads is not safe
+            self._pool = ProcessPoolExecutor(self._workers, mp_context=multiprocessing.get_context('spawn'),
+                                             initializer=_init_worker)
+        return self._pool
+
+    def _on_finished(self, key: str, dst: str, frames: int):
+        self._running.pop(key, None)
+        self.converted.emit(key, dst, frames)
+        self._submit()
+
+    def shutdown(self):
+        self._pending.clear()
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
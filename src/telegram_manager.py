@@ -1,13 +1,22 @@
 import base64
 import os
-from uuid import uuid4
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Callable
 
-from PyQt6.QtCore import QThread, pyqtSignal
+from PyQt6.QtCore import QThread, QTimer, pyqtSignal
+from PyQt6.QtGui import QPixmap
 
 from lib import TgClient
 from lib import tg
 from src import config
+from src.chat_list_index import ChatListIndex, chat_list_key
+from src.download_scheduler import DownloadScheduler
+from src.file_change import FileChange
+from src.image_cache import ImageCache
 from src.settings_manager import SettingsManager
+from src.sticker_cache import StickerCache
 
 
 class TgChat(tg.Chat):
@@ -17,7 +26,16 @@ class TgChat(tg.Chat):
         self._messages = dict()
         self.first_message = None
         self.last_message = None
-        self.last_message_count = 0
+
+    @staticmethod
+    def from_chat(chat: tg.Chat) -> 'TgChat':
+        # Takes over the decoded fields of the chat instead of serializing and decoding them again
+        obj = TgChat.__new__(TgChat)
+        obj.__dict__.update(chat.__dict__)
+        obj._messages = dict()
+        obj.first_message = None
+        obj.last_message = None
+        return obj
 
     def append_message(self, message: tg.Message):
         self._messages[message.id] = message
@@ -27,7 +45,8 @@ class TgChat(tg.Chat):
 
     def insert_message(self, message: tg.Message):
         self._messages[message.id] = message
-        self.set_first_message(message)
+        if self.first_message is None or message.id < self.first_message.id:
+            self.set_first_message(message)
 
     def set_first_message(self, message: tg.Message):
         self.first_message = message
@@ -48,17 +67,30 @@ class TelegramManager(QThread):
     chatsLoaded = pyqtSignal(list)
     updateChat = pyqtSignal(str)
     addMessage = pyqtSignal(tg.Message)
-    insertMessage = pyqtSignal(tg.Message)
-    loadingFinished = pyqtSignal(TgChat, object)
+    # message, thread of the history request
+    insertMessage = pyqtSignal(tg.Message, object)
+    # chat, thread, number of received messages, only_local
+    loadingFinished = pyqtSignal(TgChat, object, int, bool)
+    loadingFailed = pyqtSignal(TgChat, object, bool)
     threadLoaded = pyqtSignal(tg.MessageThreadInfo)
     updateFolders = pyqtSignal(dict)
     messageInterationInfoChanged = pyqtSignal(object, object)
     deleteMessages = pyqtSignal(object, list)
     chatPositionChanged = pyqtSignal(object, object)
+    # chat list key, chat id, old row, new row, version. Rows are None for inserted and removed chats
+    chatListChanged = pyqtSignal(object, object, object, object, int)
 
     updateUserStatus = pyqtSignal(str)
 
-    updateFile = pyqtSignal(tg.File)
+    # file, FileChange mask
+    updateFile = pyqtSignal(tg.File, int)
+    _filesPending = pyqtSignal()
+
+    MINITHUMBNAIL_CACHE_SIZE = 256
+    AVATAR_CACHE_BUDGET = 16 * 1024 * 1024
+    PHOTO_CACHE_BUDGET = 64 * 1024 * 1024
+    # Progress of a file is delivered at most once per frame
+    FILE_PROGRESS_INTERVAL = 16
 
     def __init__(self, sm: SettingsManager):
         super().__init__()
@@ -67,27 +99,77 @@ class TelegramManager(QThread):
                                 api_hash=config.TELEGRAM_API_HASH,
                                 use_chat_info_database=True,
                                 use_file_database=True,
-                                use_message_database=True)
+                                use_message_database=True,
+                                object_mode='lazy')
         self._client.database_directory = f"{self._sm.app_data_dir}/Telegram/tdlib"
-        self._client.subscribe_all(self._handler)
         self._client.console_authentication = False
         self._client.set_authorization_handler(self.authorization.emit)
 
         self.temp_path = f"{self._sm.app_data_dir}/Telegram/files"
         os.makedirs(self.temp_path, exist_ok=True)
+        self.sticker_cache = StickerCache(f"{self._sm.app_data_dir}/Telegram/stickers",
+                                          int(self._sm.get('sticker_cache_budget', StickerCache.DEFAULT_BUDGET)))
 
         self._options = dict()
         self._files = dict()
+        self._file_subscribers: dict[int: list[weakref.WeakMethod]] = dict()
+        self._file_subscriber_owners: dict[int: set[int]] = dict()
         self._chats = dict()
         self._users = dict()
         self._supergroups = dict()
+        # Decoded minithumbnails by their data, least recently used first. Accessed only from the GUI thread
+        self._minithumbnails: OrderedDict[str: QPixmap] = OrderedDict()
+        # Scaled user and chat photos by (file id, size, device pixel ratio), shared by all widgets
+        self.avatar_cache = ImageCache(TelegramManager.AVATAR_CACHE_BUDGET)
+        # Photos of messages by (file id, width)
+        self.photo_cache = ImageCache(TelegramManager.PHOTO_CACHE_BUDGET)
         self._chat_lists = {'All': tg.ChatListMain(), 'Archive': tg.ChatListArchive()}
+        self._chat_indexes: dict[object: ChatListIndex] = dict()
+        self._chat_indexes_lock = threading.Lock()
         self.active_reactions = []
 
+        self.downloads = DownloadScheduler(self)
+
+        # Emitted from the client thread, delivered to file subscribers in the GUI thread
+        self.updateFile.connect(self.downloads.on_file_updated)
+        self.updateFile.connect(self._notify_file_subscribers)
+
+        # Files with progress updates that are not delivered yet. Other changes are delivered at once
+        self._pending_files: dict[int: tg.File] = dict()
+        self._pending_files_lock = threading.Lock()
+        self._files_timer = QTimer(self)
+        self._files_timer.setSingleShot(True)
+        self._files_timer.setInterval(TelegramManager.FILE_PROGRESS_INTERVAL)
+        self._files_timer.timeout.connect(self._flush_pending_files)
+        self._filesPending.connect(self._files_timer.start)
+        self.file_updates_received = 0
+        self.file_updates_delivered = 0
+
         self._client.subscribe(tg.UpdateOption, self._options_handler)
         self._client.subscribe(tg.UpdateActiveEmojiReactions, self._active_emoji_reactions_handler)
         self._client.subscribe(tg.UpdateNewChat, self._new_chat_handler)
 
+        # CHATS
+        self._client.subscribe(tg.UpdateChatReadInbox, self._chat_read_inbox_handler)
+        self._client.subscribe(tg.Chats, self._chats_handler)
+        self._client.subscribe(tg.UpdateChatFolders, self._chat_folders_handler)
+        self._client.subscribe(tg.UpdateSupergroupFullInfo, self._supergroup_full_info_handler)
+        self._client.subscribe(tg.UpdateSupergroup, self._supergroup_handler)
+        self._client.subscribe(tg.UpdateChatPosition, self._chat_position_handler)
+
+        # MESSAGES
+        self._client.subscribe(tg.UpdateNewMessage, self._new_message_handler)
+        self._client.subscribe(tg.UpdateChatLastMessage, self._chat_last_message_handler)
+        self._client.subscribe(tg.UpdateDeleteMessages, self._delete_messages_handler)
+        self._client.subscribe(tg.UpdateMessageInteractionInfo, self._message_interaction_info_handler)
+
+        # USERS
+        self._client.subscribe(tg.UpdateUser, self._user_handler)
+        self._client.subscribe(tg.UpdateUserStatus, self._user_status_handler)
+
+        # FILES
+        self._client.subscribe(tg.UpdateFile, self._file_handler)
+
     def __getitem__(self, item):
         return self._options[item]
 
@@ -110,15 +192,97 @@ class TelegramManager(QThread):
         if chat.id not in self._chats:
             self._chats[chat.id] = chat
 
-    def update_file(self, file: tg.File):
-        if file.id not in self._files:
-            self._files[file.id] = file
-
-    def load_minithumbnail(self, minithumbnail: tg.Minithumbnail):
-        os.makedirs(f"{self._sm.app_data_dir}/Telegram/temp", exist_ok=True)
-        with open(path := f"{self._sm.app_data_dir}/Telegram/temp/{uuid4()}.png", 'bw') as f:
-            f.write(base64.b64decode(minithumbnail.data))
-        return path
+    def chat_list_snapshot(self, chat_list: tg.ChatList) -> tuple[int, list[int]]:
+        # Changes with a version above the returned one are delivered by chatListChanged
+        with self._chat_indexes_lock:
+            if (index := self._chat_indexes.get(chat_list_key(chat_list))) is None:
+                return 0, []
+            return index.version, index.chat_ids()
+
+    def _set_chat_position(self, chat_id: int, position: tg.ChatPosition):
+        key = chat_list_key(position.list)
+        with self._chat_indexes_lock:
+            if (index := self._chat_indexes.get(key)) is None:
+                index = self._chat_indexes[key] = ChatListIndex()
+            old_row, new_row = index.set_order(chat_id, int(position.order))
+            version = index.version
+        if old_row != new_row:
+            self.chatListChanged.emit(key, chat_id, old_row, new_row, version)
+
+        if (chat := self._chats.get(chat_id)) is not None:
+            chat.positions = [el for el in chat.positions or [] if chat_list_key(el.list) != key]
+            if int(position.order):
+                chat.positions.append(position)
+
+    def load_history(self, chat: TgChat, thread, from_message_id: int | None, limit: int, only_local=False):
+        # The result is reported by loadingFinished, also when no messages were received,
+        # or by loadingFailed when the request failed
+        # Comments of a channel post are opened as a thread of the discussion group
+        thread_history = bool(thread) and isinstance(chat.type, tg.ChatTypeSupergroup)
+        if thread_history:
+            request = tg.getMessageThreadHistory(chat.id, thread, from_message_id=from_message_id, limit=limit)
+        else:
+            request = tg.getChatHistory(chat.id, from_message_id=from_message_id, limit=limit, only_local=only_local)
+        only_local = only_local and not thread_history
+        request.add_done_callback(lambda el: self._history_loaded(chat, thread, only_local, el))
+
+    def get_file(self, file: tg.File) -> tg.File:
+        # The latest state of the file. Files inside messages and chats keep the state they were received with,
+        # updates are merged into the object registered first for the id
+        return self._files.setdefault(file.id, file)
+
+    def subscribe_file(self, file_id: int, func: Callable[[tg.File], None]):
+        # func must be a method of a QObject, the subscription is released together with the object
+        ref = weakref.WeakMethod(func)
+        if file_id not in self._file_subscribers:
+            self._file_subscribers[file_id] = []
+        self._file_subscribers[file_id].append(ref)
+
+        owner = id(func.__self__)
+        if owner not in self._file_subscriber_owners:
+            self._file_subscriber_owners[owner] = set()
+            func.__self__.destroyed.connect(lambda: self._release_file_subscriber_owner(owner))
+        self._file_subscriber_owners[owner].add(file_id)
+
+    def unsubscribe_file(self, file_id: int, func: Callable[[tg.File], None]):
+        for ref in self._file_subscribers.get(file_id, []):
+            if ref() == func:
+                self._remove_file_subscriber(file_id, ref)
+                return
+
+    def _remove_file_subscriber(self, file_id: int, ref: weakref.WeakMethod):
+        lst = self._file_subscribers.get(file_id, [])
+        if ref in lst:
+            lst.remove(ref)
+        if not lst:
+            self._file_subscribers.pop(file_id, None)
+
+    def _release_file_subscriber_owner(self, owner: int):
+        for file_id in self._file_subscriber_owners.pop(owner, ()):
+            for ref in list(self._file_subscribers.get(file_id, [])):
+                if (func := ref()) is None or id(func.__self__) == owner:
+                    self._remove_file_subscriber(file_id, ref)
+
+    def _notify_file_subscribers(self, file: tg.File, mask: int):
+        # Subscribers wait for files to be downloaded, the progress is only reported by updateFile
+        if mask == FileChange.PROGRESS:
+            return
+        for ref in list(self._file_subscribers.get(file.id, [])):
+            if (func := ref()) is None:
+                self._remove_file_subscriber(file.id, ref)
+            else:
+                func(file)
+
+    def load_minithumbnail(self, minithumbnail: tg.Minithumbnail) -> QPixmap:
+        if (pixmap := self._minithumbnails.get(minithumbnail.data)) is not None:
+            self._minithumbnails.move_to_end(minithumbnail.data)
+            return pixmap
+        pixmap = QPixmap()
+        pixmap.loadFromData(base64.b64decode(minithumbnail.data))
+        self._minithumbnails[minithumbnail.data] = pixmap
+        if len(self._minithumbnails) > TelegramManager.MINITHUMBNAIL_CACHE_SIZE:
+            self._minithumbnails.popitem(last=False)
+        return pixmap
 
     def authenticate_user(self, str1, str2):
         self._client.send_authentication(str1, str2)
@@ -130,91 +294,128 @@ class TelegramManager(QThread):
         self.active_reactions = event.emojis
 
     def _new_chat_handler(self, event: tg.UpdateNewChat):
-        self._chats[event.chat.id] = TgChat(**tg.to_json(event.chat))
+        self._chats[event.chat.id] = TgChat.from_chat(event.chat)
         self.updateChat.emit(str(event.chat.id))
+        for position in event.chat.positions or []:
+            self._set_chat_position(event.chat.id, position)
         if isinstance(event.chat.type, tg.ChatTypeSupergroup):
             if event.chat.type.supergroup_id not in self._supergroups:
                 self._supergroups[event.chat.type.supergroup_id] = [None, None]
             # tg.getSupergroup(event.chat.type.supergroup_id)
             tg.getSupergroupFullInfo(event.chat.type.supergroup_id)
 
-    def _handler(self, event):
-        # event = events.convert_event(event_dict, self)
-        # OPTIONS
-
-        # CHATS
-
-        if isinstance(event, tg.UpdateChatReadInbox):
-            self._chats[event.chat_id].unread_count = event.unread_count
-            self.updateChat.emit(str(event.chat_id))
-        elif isinstance(event, tg.Chats):
-            for chat_id in event.chat_ids:
-                if chat_id not in self._chats:
-                    tg.getChat(chat_id)
-            self.chatsLoaded.emit(event.chat_ids)
-        elif isinstance(event, tg.UpdateChatFolders):
-            for el in event.chat_folders:
-                self._chat_lists[el.title] = tg.ChatListFolder(chat_folder_id=el.id)
-            self.updateFolders.emit(self._chat_lists)
-        elif isinstance(event, tg.UpdateSupergroupFullInfo):
-            self._supergroups[event.supergroup_id][1] = event.supergroup_full_info
-        elif isinstance(event, tg.UpdateSupergroup):
-            if event.supergroup.id not in self._supergroups:
-                self._supergroups[event.supergroup.id] = [event.supergroup, None]
+    def _chat_read_inbox_handler(self, event: tg.UpdateChatReadInbox):
+        self._chats[event.chat_id].unread_count = event.unread_count
+        self.updateChat.emit(str(event.chat_id))
+
+    def _chats_handler(self, event: tg.Chats):
+        for chat_id in event.chat_ids:
+            if chat_id not in self._chats:
+                tg.getChat(chat_id)
+        self.chatsLoaded.emit(event.chat_ids)
+
+    def _chat_folders_handler(self, event: tg.UpdateChatFolders):
+        for el in event.chat_folders:
+            self._chat_lists[el.title] = tg.ChatListFolder(chat_folder_id=el.id)
+        self.updateFolders.emit(self._chat_lists)
+
+    def _supergroup_full_info_handler(self, event: tg.UpdateSupergroupFullInfo):
+        self._supergroups[event.supergroup_id][1] = event.supergroup_full_info
+
+    def _supergroup_handler(self, event: tg.UpdateSupergroup):
+        if event.supergroup.id not in self._supergroups:
+            self._supergroups[event.supergroup.id] = [event.supergroup, None]
+        else:
+            self._supergroups[event.supergroup.id][0] = event.supergroup
+
+    def _chat_position_handler(self, event: tg.UpdateChatPosition):
+        self._set_chat_position(event.chat_id, event.position)
+        self.chatPositionChanged.emit(event.chat_id, event.position)
+
+    def _new_message_handler(self, event: tg.UpdateNewMessage):
+        chat = self.get_chat(event.message.chat_id)
+        if chat.last_message is None or event.message.id != chat.last_message.id:
+            chat.append_message(event.message)
+            self.addMessage.emit(event.message)
+
+    def _chat_last_message_handler(self, event: tg.UpdateChatLastMessage):
+        if event.last_message is not None:
+            chat = self.get_chat(event.chat_id)
+            chat.set_last_message(event.last_message)
+        for position in event.positions or []:
+            self._set_chat_position(event.chat_id, position)
+
+    def _delete_messages_handler(self, event: tg.UpdateDeleteMessages):
+        self.deleteMessages.emit(event.chat_id, event.message_ids)
+
+    def open_thread(self, chat_id: int, message_id: int):
+        # threadLoaded is emitted with the thread of the message
+        request = tg.getMessageThread(chat_id, message_id)
+        request.add_done_callback(self._thread_loaded)
+
+    def _thread_loaded(self, request):
+        if request.exception() is not None:
+            print(f"{request.method} failed: {request.exception()}")
+            return
+        self.threadLoaded.emit(request.result())
+
+    def _history_loaded(self, chat: TgChat, thread, only_local: bool, request):
+        if request.exception() is not None:
+            print(f"{request.method} failed: {request.exception()}")
+            self.loadingFailed.emit(chat, thread, only_local)
+            return
+        messages = request.result().messages
+        for el in messages:
+            chat.insert_message(el)
+            self.insertMessage.emit(el, thread)
+        self.loadingFinished.emit(chat, thread, len(messages), only_local)
+
+    def _message_interaction_info_handler(self, event: tg.UpdateMessageInteractionInfo):
+        try:
+            self.get_chat(event.chat_id).get_message(event.message_id).interaction_info = event.interaction_info
+            self.messageInterationInfoChanged.emit(event.chat_id, event.message_id)
+        except KeyError:
+            pass
+
+    def _user_handler(self, event: tg.UpdateUser):
+        self._users[event.user.id] = event.user
+
+    def _user_status_handler(self, event: tg.UpdateUserStatus):
+        self.get_user(event.user_id).status = event.status
+        self.updateUserStatus.emit(str(event.user_id))
+
+    def _file_handler(self, event: tg.UpdateFile):
+        self.file_updates_received += 1
+        self.merge_file(event.file)
+
+    def merge_file(self, new_file: tg.File):
+        # Called in the client thread with files from updates and responses
+        if (file := self._files.setdefault(new_file.id, new_file)) is new_file:
+            mask = FileChange.ALL
+        elif not (mask := FileChange.mask(tg.update_object(file, new_file))):
+            return
+
+        with self._pending_files_lock:
+            if mask == FileChange.PROGRESS:
+                start_timer = not self._pending_files
+                self._pending_files[file.id] = file
             else:
-                self._supergroups[event.supergroup.id][0] = event.supergroup
-        elif isinstance(event, tg.UpdateChatPosition):
-            self.chatPositionChanged.emit(event.chat_id, event.position)
-
-        # MESSAGES
-
-        elif isinstance(event, tg.UpdateNewMessage):
-            chat = self.get_chat(event.message.chat_id)
-            if chat.last_message is None or event.message.id != chat.last_message.id:
-                chat.append_message(event.message)
-                self.addMessage.emit(event.message)
-        elif isinstance(event, tg.UpdateChatLastMessage):
-            if event.last_message is not None:
-                chat = self.get_chat(event.chat_id)
-                chat.set_last_message(event.last_message)
-        elif isinstance(event, tg.UpdateDeleteMessages):
-            self.deleteMessages.emit(event.chat_id, event.message_ids)
-        elif isinstance(event, tg.Messages):
-            print(tg.to_json(event.messages))
-            el = None
-            for el in event.messages:
-                self.get_chat(el.chat_id).insert_message(el)
-                self.insertMessage.emit(el)
-            if el is not None and self.get_chat(el.chat_id).last_message_count < self.get_chat(
-                    el.chat_id).message_count():
-                self.get_chat(el.chat_id).last_message_count = self.get_chat(el.chat_id).message_count()
-                self.loadingFinished.emit(self.get_chat(el.chat_id), event.messages[0].message_thread_id)
-        elif isinstance(event, tg.UpdateMessageInteractionInfo):
-            try:
-                self.get_chat(event.chat_id).get_message(event.message_id).interaction_info = event.interaction_info
-                self.messageInterationInfoChanged.emit(event.chat_id, event.message_id)
-            except KeyError:
-                pass
-        elif isinstance(event, tg.MessageThreadInfo):
-            self.threadLoaded.emit(event)
-
-        # USERS
-
-        elif isinstance(event, tg.UpdateUser):
-            self._users[event.user.id] = event.user
-        elif isinstance(event, tg.UpdateUserStatus):
-            self.get_user(event.user_id).status = event.status
-            self.updateUserStatus.emit(str(event.user_id))
-
-        # FILES
-
-        elif isinstance(event, tg.UpdateFile):
-            if event.file.id not in self._files:
-                self._files[event.file.id] = event.file
-            tg.update_object(file := self._files[event.file.id], event.file)
-            self.updateFile.emit(file)
-        # else:
-        #     print(tg.to_json(event))
+                # The file is delivered with its latest progress
+                start_timer = False
+                self._pending_files.pop(file.id, None)
+                self.file_updates_delivered += 1
+        if start_timer:
+            self._filesPending.emit()
+        elif mask != FileChange.PROGRESS:
+            self.updateFile.emit(file, mask)
+
+    def _flush_pending_files(self):
+        with self._pending_files_lock:
+            files = self._pending_files
+            self._pending_files = dict()
+            self.file_updates_delivered += len(files)
+        for file in files.values():
+            self.updateFile.emit(file, FileChange.PROGRESS)
 
     def run(self):
         self._client.execute()
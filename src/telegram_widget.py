@@ -1,6 +1,7 @@
 import datetime
 
 from PyQt6.QtCore import pyqtSignal, Qt
+from PyQt6.QtWidgets import QApplication
 from PyQtUIkit.widgets import *
 
 from src import config
@@ -26,10 +27,11 @@ class TelegramWidget(KitMainWindow):
         self.setCentralWidget(main_layout)
 
         self._manager = TelegramManager(self._sm)
-        self._manager.chatsLoaded.connect(self.update_chats)
+        QApplication.instance().aboutToQuit.connect(self.finish_work)
         self._manager.addMessage.connect(self.add_message)
         self._manager.insertMessage.connect(self.insert_message)
         self._manager.loadingFinished.connect(self.loading_finished)
+        self._manager.loadingFailed.connect(self.loading_failed)
         self._manager.threadLoaded.connect(self._jump)
         self._manager.authorization.connect(self.get_authentication_data)
         self._manager.updateFolders.connect(self.update_folders)
@@ -84,13 +86,10 @@ class TelegramWidget(KitMainWindow):
         for key in folders:
             self._tab_bar.addTab(key)
 
-    def update_chats(self, chat_ids):
-        self._list_widget.clear()
-        for el in chat_ids:
-            self.add_chat(self._manager.get_chat(el))
-
     def _on_folder_selected(self):
-        tg.getChats(self._folders[self._tab_bar.currentIndex()], 100)
+        chat_list = self._folders[self._tab_bar.currentIndex()]
+        self._list_widget.set_chat_list(chat_list)
+        tg.loadChats(chat_list, 100)
 
     def add_message(self, message: tg.Message):
         if (message.chat_id, message.message_thread_id) not in self._chat_widgets:
@@ -102,23 +101,23 @@ class TelegramWidget(KitMainWindow):
             thread = message.message_thread_id
         self._chat_widgets[(message.chat_id, message.message_thread_id)].add_message(message)
 
-    def insert_message(self, message: tg.Message):
-        chat = self._manager.get_chat(message.chat_id)
-        if isinstance(chat.type, tg.ChatTypeSupergroup) and not chat.type.is_channel:
-            thread = 0
-        else:
-            thread = message.message_thread_id
-        self._chat_widgets[(message.chat_id, thread)].insert_message(message)
+    def insert_message(self, message: tg.Message, thread):
+        if (chat_widget := self._history_widget(message.chat_id, thread)) is not None:
+            chat_widget.insert_message(message)
 
-    def loading_finished(self, chat: TgChat, thread=0):
-        if isinstance(chat.type, tg.ChatTypeSupergroup) and not chat.type.is_channel:
-            thread = 0
-        self._chat_widgets[(chat.id, thread)].loading = False
-        self._chat_widgets[(chat.id, thread)].check_if_need_to_load()
+    def loading_finished(self, chat: TgChat, thread, count, only_local):
+        if (chat_widget := self._history_widget(chat.id, thread)) is not None:
+            chat_widget.history_loaded(count, only_local)
+
+    def loading_failed(self, chat: TgChat, thread, only_local):
+        if (chat_widget := self._history_widget(chat.id, thread)) is not None:
+            chat_widget.history_failed(only_local)
+
+    def _history_widget(self, chat_id: int, thread):
+        # History is delivered to the widget that requested it, a thread of a discussion group has its own widget
+        return self._chat_widgets.get((chat_id, thread))
 
     def add_chat(self, chat, thread=0, messages=None):
-        if thread == 0:
-            self._list_widget.add_item(chat)
         if (chat.id, thread) in self._chat_widgets:
             return
 
@@ -140,7 +139,9 @@ class TelegramWidget(KitMainWindow):
             self.hide_chat()
             return
         if (chat_id, thread) not in self._chat_widgets:
-            return
+            if thread != 0:
+                return
+            self.add_chat(self._manager.get_chat(chat_id))
         if self._current_chat in self._chat_widgets:
             if len(self._last_chats) > 1 and (chat_id, thread) == self._last_chats[-1]:
                 self._last_chats.pop(-1)
@@ -174,6 +175,8 @@ class TelegramWidget(KitMainWindow):
             self._manager.authenticate_user(dialog.get_str1(), dialog.get_str2())
 
     def finish_work(self):
+        # Saves the sticker index and stops the conversion workers
+        self._manager.sticker_cache.shutdown()
         self._manager.terminate()
 
 
@@ -321,8 +324,7 @@ class SelectChatDialog(KitDialog):
         self._list_widget.currentItemChanged.connect(self._on_chat_selected)
         layout.addWidget(self._list_widget)
 
-        for el in self._manager._chats.values():
-            self._list_widget.add_item(el)
+        self._list_widget.set_chats(list(self._manager._chats))
 
     def _on_chat_selected(self, chat_id):
         chat_id = int(chat_id)
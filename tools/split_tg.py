@@ -0,0 +1,157 @@
+"""Splits the generated TL schema module into the lazily loaded lib/tg package.
+
+Usage: python -m tools.split_tg tg.py lib/tg
+
+Every abstract TL type is written to lib/tg/objects/ together with its subclasses, and every other class to a module
+of its own. lib/tg/__init__.py gets the functions and an index that imports the module of a class when the class is
+first referenced. The base classes and helpers of the generated module are replaced by the hand-written ones in
+lib/tg/base.py, which is never written.
+"""
+import ast
+import os
+import re
+import shutil
+import sys
+
+HEADER = "# Generated by tools/split_tg.py, do not edit\n"
+INIT_HEADER = "# Generated by tools/split_tg.py, do not edit. Classes are in lib/tg/objects, helpers in lib/tg/base.py\n"
+# Read by the helpers at call time, so it is set as lib.tg.base.mode and not copied
+BASE_SETTINGS = {'mode'}
+
+LAZY_INDEX = '''# Class name -> module of lib.tg.objects, the module is imported when the class is first referenced
+_class_modules = {
+%s}
+# @type -> class name
+_type_names = {
+%s}
+
+
+def __getattr__(name):
+    if (module := _class_modules.get(name)) is None:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+    cls = globals()[name] = getattr(importlib.import_module(f'{__name__}.objects.{module}'), name)
+    return cls
+
+
+def __dir__():
+    return sorted({*globals(), *_class_modules})
+'''
+
+
+def module_name(class_name: str) -> str:
+    return re.sub(r'(?<!^)(?=[A-Z])', '_', class_name).lower()
+
+
+def defined_names(tree: ast.Module) -> list[str]:
+    res = []
+    for node in tree.body:
+        if isinstance(node, (ast.ClassDef, ast.FunctionDef)):
+            res.append(node.name)
+        elif isinstance(node, ast.Assign):
+            res.extend(el.id for el in node.targets if isinstance(el, ast.Name))
+    return res
+
+
+def chunks(source: str, tree: ast.Module):
+    # Source of every top-level statement, together with the comments and blank lines before it
+    lines = source.splitlines(keepends=True)
+    start = 0
+    for node in tree.body:
+        yield node, ''.join(lines[start:node.end_lineno])
+        start = node.end_lineno
+
+
+def strip_data(text: str) -> str:
+    # Older generated classes kept their kwargs, nothing reads them
+    return re.sub(r'^ +self\._data = kwargs\n', '', text, flags=re.M)
+
+
+def used_names(node: ast.ClassDef) -> set[str]:
+    # Names the class statement evaluates. Annotations inside functions are never evaluated
+    res = set()
+    stack = [*node.bases, *node.body]
+    while stack:
+        el = stack.pop()
+        if isinstance(el, ast.Name) and isinstance(el.ctx, ast.Load):
+            res.add(el.id)
+        for field, value in ast.iter_fields(el):
+            if field in ('annotation', 'returns'):
+                continue
+            for child in value if isinstance(value, list) else [value]:
+                if isinstance(child, ast.AST):
+                    stack.append(child)
+    return res
+
+
+def split(source: str, base_source: str):
+    tree = ast.parse(source)
+    base = defined_names(ast.parse(base_source))
+    bases = [el for el in base if el in {node.name for node in tree.body if isinstance(node, ast.ClassDef)}]
+    parents = {node.name: node.bases[0].id if node.bases else None
+               for node in tree.body if isinstance(node, ast.ClassDef)}
+
+    def root(name):
+        while parents.get(name) not in (None, *bases):
+            name = parents[name]
+        return name
+
+    init = []
+    modules: dict[str: list[str]] = dict()
+    imports: dict[str: set[str]] = dict()
+    class_modules = dict()
+    for node, text in chunks(source, tree):
+        if isinstance(node, ast.Import) or node.__class__ in (ast.ClassDef, ast.FunctionDef) and node.name in base:
+            continue
+        if isinstance(node, ast.ClassDef):
+            module = module_name(root(node.name))
+            modules.setdefault(module, []).append(strip_data(text))
+            imports.setdefault(module, set()).update(used_names(node))
+            class_modules[node.name] = module
+        elif isinstance(node, ast.Assign) and node.targets[0].id == 'types':
+            type_names = [(key.value, value.id) for key, value in zip(node.value.keys, node.value.values)]
+            init.append('\n\n' + LAZY_INDEX % (
+                ''.join(f"    '{name}': '{module}',\n" for name, module in class_modules.items()),
+                ''.join(f"    '{key}': '{name}',\n" for key, name in type_names)))
+        elif isinstance(node, ast.Assign) and set(defined_names(ast.Module([node], []))) & set(base):
+            continue
+        else:
+            init.append(text)
+
+    exported = [el for el in base if not el.startswith('_') and el not in BASE_SETTINGS]
+    # Function signatures name the classes, they must not be evaluated at import
+    init.insert(0, INIT_HEADER + "from __future__ import annotations\n\nimport importlib\n\n"
+                f"from lib.tg.base import {', '.join(exported)}\n")
+    objects = dict()
+    for module, texts in modules.items():
+        defined = {name for name, el in class_modules.items() if el == module}
+        names = sorted(imports[module] - defined - set(dir(__builtins__)) - {'kwargs', 'self'},
+                       key=lambda el: (el not in bases, el))
+        objects[module] = HEADER + f"from lib.tg import {', '.join(names)}\n" + ''.join(texts)
+    return ''.join(init).replace('\n\n\n\n', '\n\n\n'), objects
+
+
+def main():
+    if len(sys.argv) != 3:
+        print(__doc__)
+        sys.exit(1)
+    src, dst = sys.argv[1:]
+    with open(src, encoding='utf-8') as f:
+        source = f.read()
+    with open(os.path.join(dst, 'base.py'), encoding='utf-8') as f:
+        init, objects = split(source, f.read())
+
+    objects_dir = os.path.join(dst, 'objects')
+    shutil.rmtree(objects_dir, ignore_errors=True)
+    os.makedirs(objects_dir)
+    with open(os.path.join(dst, '__init__.py'), 'w', encoding='utf-8') as f:
+        f.write(init)
+    with open(os.path.join(objects_dir, '__init__.py'), 'w', encoding='utf-8') as f:
+        f.write(HEADER)
+    for module, text in objects.items():
+        with open(os.path.join(objects_dir, f'{module}.py'), 'w', encoding='utf-8') as f:
+            f.write(text)
+    print(f"{len(objects)} modules written to {objects_dir}")
+
+
+if __name__ == '__main__':
+    main()